@@ -0,0 +1,121 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Cost of reading recorded calls into chunks, for each kind of AudioSource.
+
+`--calls` files of `--minutes` of 8 kHz mulaw audio are chunked by
+`AudioSource.iter_chunks`, read from open files and memory-mapped with
+`AudioSource.from_file`, then streamed with `recognize_stream` to the local
+stand-in server. The peak of the memory allocated is traced with
+tracemalloc.
+
+Usage: python -m benchmarks.audio_sources [--calls N] [--minutes M]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_watson import SpeechToTextV1
+from ibm_watson.websocket import AudioSource
+from ibm_watson.websocket.audio_pacer import FAST_CHUNK_SIZE
+
+from .fake_server import FakeWatsonServer
+
+BYTE_RATE = 8000
+
+SOURCES = {
+    'file read()': lambda path: AudioSource(open(path, 'rb')),
+    'from_file (mmap)': AudioSource.from_file,
+}
+
+
+def measure(run: Callable[[], int]) -> tuple:
+    """Return the seconds, the bytes and the peak of memory of `run`."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def chunk(paths: List[str], source: Callable[[str], AudioSource]) -> int:
+    size = 0
+    for path in paths:
+        for audio in source(path).iter_chunks(FAST_CHUNK_SIZE):
+            size += len(audio)
+    return size
+
+
+def stream(server: FakeWatsonServer, paths: List[str],
+           source: Callable[[str], AudioSource]) -> int:
+    speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    speech_to_text.set_service_url(server.url)
+
+    async def recognize(path):
+        async with speech_to_text.recognize_stream(
+                'audio/mulaw;rate=8000') as stream:
+            await stream.send_audio(source(path))
+            assert [message async for message in stream]
+
+    async def main():
+        await asyncio.gather(*[recognize(path) for path in paths])
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    return sum(os.path.getsize(path) for path in paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--minutes', type=float, default=5.0)
+    args = parser.parse_args()
+
+    print('{0:<10}{1:<20}{2:>14}{3:>10}{4:>14}'.format(
+        'phase', 'source', 'bytes', 'seconds', 'peak bytes'))
+    with tempfile.TemporaryDirectory() as directory, \
+            FakeWatsonServer() as server:
+        paths = []
+        for call in range(args.calls):
+            path = os.path.join(directory, 'call{0}.raw'.format(call))
+            with open(path, 'wb') as audio:
+                audio.write(os.urandom(int(args.minutes * 60 * BYTE_RATE)))
+            paths.append(path)
+        for name, source in SOURCES.items():
+            runs = [
+                ('chunk', lambda: chunk(paths, source)),
+                ('stream', lambda: stream(server, paths, source)),
+            ]
+            for phase, run in runs:
+                elapsed, size, peak = measure(run)
+                print('{0:<10}{1:<20}{2:>14}{3:>10.2f}{4:>14}'.format(
+                    phase, name, size, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Earlier versions of the SDK modules, for before and after comparisons.
+
+A baseline is a module of `ibm_watson` as it was at a git commit, read with
+`git show` at run time and executed inside the `ibm_watson` package, so that
+its relative imports resolve against the current tree.
+"""
+
+import os
+import subprocess
+import sys
+import types
+from typing import Callable
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _git(*args: str) -> str:
+    return subprocess.check_output(('git',) + args,
+                                   cwd=REPO_DIR).decode('utf-8')
+
+
+def find_commit(path: str, predicate: Callable[[str], bool]) -> str:
+    """
+    Return the latest commit whose version of `path` satisfies `predicate`.
+
+    :param str path: The file, relative to the repository, such as
+           `ibm_watson/speech_to_text_v1.py`.
+    :param predicate: Called with the source of the file at each commit that
+           changed it, from the latest.
+    """
+    for commit in _git('log', '--format=%H', '--', path).split():
+        if predicate(_git('show', '{0}:{1}'.format(commit, path))):
+            return commit
+    raise LookupError('No commit of {0} matches'.format(path))
+
+
+def load_module(commit: str, path: str) -> types.ModuleType:
+    """
+    Return the module at `path` as it was at `commit`.
+
+    :param str commit: A git revision.
+    :param str path: A module of `ibm_watson`, relative to the repository.
+    """
+    source = _git('show', '{0}:{1}'.format(commit, path))
+    name = 'ibm_watson._baseline_{0}_{1}'.format(
+        os.path.splitext(os.path.basename(path))[0], commit[:12])
+    module = types.ModuleType(name)
+    module.__package__ = 'ibm_watson'
+    module.__file__ = '{0}:{1}'.format(commit, path)
+    sys.modules[name] = module
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
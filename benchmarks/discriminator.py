@@ -0,0 +1,81 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Decoding time of deeply nested Discovery aggregations.
+
+Every aggregation in the response is a polymorphic `QueryAggregation` whose
+subclass is selected by its `type`. Each aggregation has `--width` results,
+and each result nests one aggregation of the next level, down to `--depth`
+levels, so the response holds about width ** depth aggregations.
+
+Usage: python -m benchmarks.discriminator [--depth D] [--width W]
+"""
+
+import argparse
+import timeit
+
+from ibm_watson.discovery_v1 import QueryResponse
+
+# Aggregation types used in turn by the levels of the tree.
+TYPES = ('term', 'histogram', 'filter', 'nested', 'timeslice', 'max')
+
+
+def aggregation(level: int, depth: int, width: int) -> dict:
+    """Return an aggregation with `depth - level` levels below it."""
+    results = []
+    for index in range(width):
+        result = {'key': 'key{0}'.format(index), 'matching_results': 10}
+        if level + 1 < depth:
+            result['aggregations'] = [aggregation(level + 1, depth, width)]
+        results.append(result)
+    return {
+        'type': TYPES[level % len(TYPES)],
+        'field': 'enriched_text.entities.type',
+        'matching_results': 100,
+        'results': results
+    }
+
+
+def count_aggregations(document: dict) -> int:
+    """Return the number of aggregations in an aggregation tree."""
+    return 1 + sum(
+        count_aggregations(child)
+        for result in document['results']
+        for child in result.get('aggregations', ()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--depth', type=int, default=8)
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    root = aggregation(0, args.depth, args.width)
+    document = {'matching_results': 100, 'aggregations': [root]}
+    count = count_aggregations(root)
+    QueryResponse.from_dict(document)
+    best = min(
+        timeit.repeat(lambda: QueryResponse.from_dict(document),
+                      number=args.number,
+                      repeat=5)) / args.number
+    print('{0} aggregations, depth {1}: {2:.2f} ms, {3:.2f} us per '
+          'aggregation'.format(count, args.depth, best * 1000,
+                               best / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
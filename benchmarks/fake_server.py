@@ -0,0 +1,316 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A local stand-in for the Watson services.
+
+`FakeWatsonServer` answers REST requests with the mock responses of the unit
+tests, over real sockets, and speaks the websocket protocols of Speech to Text
+`/v1/recognize` and Text to Speech `/v1/synthesize`. Any service can be
+pointed at it:
+
+    with FakeWatsonServer() as server:
+        assistant.set_service_url(server.url)
+        speech_to_text.set_service_url(server.url)
+
+Responses are encoded once, when the server starts, so the server adds as
+little as possible to what the SDK costs. Run on its own, the server serves
+until it is interrupted.
+
+Usage: python -m benchmarks.fake_server [--port P]
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Pattern, Tuple
+
+from ibm_watson.websocket import AsyncWebSocket
+
+from .fixtures import load_large_response, load_mock_response
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                             'resources')
+
+# (method, path, fixture): a fixture is a LARGE_RESPONSES name, or a unit test
+# module and function.
+REST_ROUTES = [
+    ('POST', r'/v2/assistants/[^/]+/sessions',
+     ('test_assistant_v2', 'test_create_session_all_params')),
+    ('POST', r'/v2/assistants/[^/]+/sessions/[^/]+/message',
+     'assistant_v2.message'),
+    ('POST', r'/v2/assistants/[^/]+/message',
+     ('test_assistant_v2', 'test_message_stateless_all_params')),
+    ('POST', r'/v1/workspaces/[^/]+/message',
+     ('test_assistant_v1', 'test_message_all_params')),
+    ('GET', r'/v1/logs', 'assistant_v1.list_all_logs'),
+    ('GET', r'/v1/environments/[^/]+/collections/[^/]+/query',
+     'discovery_v1.query'),
+    ('POST', r'/v1/environments/[^/]+/collections/[^/]+/query',
+     'discovery_v1.query'),
+    ('POST', r'/v2/projects/[^/]+/query', 'discovery_v2.query'),
+    ('POST', r'/v1/analyze',
+     ('test_natural_language_understanding_v1', 'test_analyze_all_params')),
+    ('POST', r'/v3/translate',
+     ('test_language_translator_v3', 'test_translate_all_params')),
+    ('POST', r'/v3/identify',
+     ('test_language_translator_v3', 'test_identify_all_params')),
+    ('POST', r'/v3/tone', ('test_tone_analyzer_v3', 'test_tone_all_params')),
+    ('POST', r'/v1/recognize',
+     ('test_speech_to_text_v1', 'test_recognize_all_params')),
+    ('GET', r'/v1/models',
+     ('test_speech_to_text_v1', 'test_list_models_all_params')),
+]
+
+# The audio of synthesize, over HTTP and websockets.
+AUDIO_FILE = os.path.join(RESOURCES_DIR, 'tts_audio.wav')
+
+_WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+# The results of each recognition.
+RESULTS = json.dumps({
+    'results': [{
+        'final': True,
+        'alternatives': [{
+            'transcript': 'thunderstorms could produce large hail isolated '
+                          'tornadoes and heavy rain ',
+            'confidence': 0.96
+        }]
+    }],
+    'result_index': 0
+})
+
+
+def load_routes() -> List[Tuple[str, Pattern, bytes]]:
+    """Return the REST routes, with their encoded responses."""
+    routes = []
+    for method, path, fixture in REST_ROUTES:
+        if isinstance(fixture, str):
+            document = load_large_response(fixture)
+        else:
+            document = load_mock_response(*fixture)
+        routes.append((method, re.compile('^{0}$'.format(path)),
+                       json.dumps(document).encode('utf-8')))
+    return routes
+
+
+class FakeWatsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # Messages written one after the other, such as the results and the
+        # state of a recognition, are sent without waiting for an ACK.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        if self.headers.get('Upgrade', '').lower() == 'websocket':
+            self.handle_websocket()
+        else:
+            self.handle_rest()
+
+    def do_POST(self):
+        self.handle_rest()
+
+    def do_PUT(self):
+        self.handle_rest()
+
+    def do_DELETE(self):
+        self.handle_rest()
+
+    def handle_rest(self):
+        self.read_body()
+        path = self.path.split('?', 1)[0]
+        if self.command == 'POST' and path == '/v1/synthesize':
+            self.send_body(200, 'audio/wav', self.server.audio)
+            return
+        for method, pattern, body in self.server.routes:
+            if method == self.command and pattern.match(path):
+                self.send_body(200, 'application/json', body)
+                return
+        self.send_body(404, 'application/json',
+                       b'{"error": "Not Found", "code": 404}')
+
+    def read_body(self) -> int:
+        """Read and discard the request body; return its size."""
+        size = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                length = int(self.rfile.readline().split(b';')[0], 16)
+                size += len(self.rfile.read(length))
+                self.rfile.readline()
+                if not length:
+                    return size
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            size += len(chunk)
+        return size
+
+    def send_body(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_websocket(self):
+        path = self.path.split('?', 1)[0]
+        if path not in ('/v1/recognize', '/v1/synthesize'):
+            self.send_body(404, 'application/json',
+                           b'{"error": "Not Found", "code": 404}')
+            return
+        key = self.headers['Sec-WebSocket-Key'] + _WEBSOCKET_GUID
+        self.send_response(101)
+        self.send_header('Upgrade', 'websocket')
+        self.send_header('Connection', 'Upgrade')
+        self.send_header(
+            'Sec-WebSocket-Accept',
+            base64.b64encode(hashlib.sha1(
+                key.encode('ascii')).digest()).decode('ascii'))
+        self.end_headers()
+        self.close_connection = True
+        # The frames are read and written by the AsyncWebSocket of the SDK,
+        # on an event loop of the thread of the connection.
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.serve_websocket(path))
+        finally:
+            loop.close()
+
+    async def serve_websocket(self, path: str) -> None:
+        reader, writer = await asyncio.open_connection(sock=self.connection)
+        websocket = AsyncWebSocket(reader, writer, client=False)
+        try:
+            if path == '/v1/recognize':
+                await self.recognize(websocket)
+            else:
+                await self.synthesize(websocket)
+        finally:
+            writer.close()
+
+    async def recognize(self, websocket: AsyncWebSocket) -> None:
+        """Answer a Speech to Text recognition session."""
+        audio_bytes = 0
+        while True:
+            message = await websocket.receive()
+            if message is None:
+                return
+            if isinstance(message, bytes):
+                audio_bytes += len(message)
+                continue
+            action = json.loads(message).get('action')
+            if action == 'start':
+                await websocket.send(json.dumps({'state': 'listening'}))
+            elif action == 'stop':
+                self.server.audio_received.append(audio_bytes)
+                await websocket.send(RESULTS)
+                await websocket.send(json.dumps({'state': 'listening'}))
+                audio_bytes = 0
+
+    async def synthesize(self, websocket: AsyncWebSocket) -> None:
+        """Answer a Text to Speech synthesis, then close the connection."""
+        message = await websocket.receive()
+        if message is None:
+            return
+        options = json.loads(message)
+        await websocket.send(
+            json.dumps({
+                'binary_streams': [{
+                    'content_type': options.get('accept') or 'audio/wav'
+                }]
+            }))
+        audio = self.server.audio
+        for start in range(0, len(audio), 8192):
+            await websocket.send(audio[start:start + 8192])
+        await websocket.close()
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeWatsonServer():
+    """
+    A local server that stands in for the Watson services.
+
+    :param str host: (optional) The address to listen on.
+    :param int port: (optional) The port to listen on. By default, a free
+           port.
+
+    :attr str url: The service URL of the server.
+    :attr list audio_received: The number of audio bytes of each recognition
+          session, in the order they ended.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.httpd = ThreadingHTTPServer((host, port), FakeWatsonHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.routes = load_routes()
+        with open(AUDIO_FILE, 'rb') as audio:
+            self.httpd.audio = audio.read()
+        self.httpd.audio_received = self.audio_received = []
+        self.url = 'http://{0}:{1}'.format(*self.httpd.server_address[:2])
+        self._thread = None
+
+    def start(self) -> 'FakeWatsonServer':
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever,
+                                        args=(0.05,),
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'FakeWatsonServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = FakeWatsonServer(port=args.port)
+    print('Serving on {0}'.format(server.url))
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Response fixtures for the benchmarks.
+
+The fixtures are the mock responses of the generated unit tests in
+`test/unit`, optionally inflated to realistic page sizes by repeating the
+items of their collections.
+"""
+
+import copy
+import json
+import os
+import re
+
+UNIT_TEST_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                             'test', 'unit')
+
+_MOCK_RESPONSE = re.compile(r"^\s*mock_response = '(.*)'$", re.MULTILINE)
+
+
+def load_mock_response(test_module: str, test_name: str) -> dict:
+    """
+    Return the mock response used by a unit test.
+
+    :param str test_module: The unit test file, such as `test_discovery_v1`.
+    :param str test_name: The test function, such as `test_query_all_params`.
+    """
+    path = os.path.join(UNIT_TEST_DIR, test_module + '.py')
+    with open(path, encoding='utf-8') as test_file:
+        source = test_file.read()
+    start = source.index('def {0}('.format(test_name))
+    return json.loads(_MOCK_RESPONSE.search(source, start).group(1))
+
+
+def inflate(document: dict, path: str, count: int) -> dict:
+    """
+    Return a copy of `document` whose list at `path` holds `count` items.
+
+    :param str path: Dot separated keys of the list, such as `results` or
+           `output.generic`. The first item of the list is repeated.
+    """
+    document = copy.deepcopy(document)
+    *parents, key = path.split('.')
+    target = document
+    for parent in parents:
+        target = target[parent]
+    target[key] = [copy.deepcopy(target[key][0]) for _ in range(count)]
+    return document
+
+
+# Name -> (test module, test function, list path, item count)
+LARGE_RESPONSES = {
+    'discovery_v1.query': ('test_discovery_v1', 'test_query_all_params',
+                           'results', 1000),
+    'discovery_v2.query': ('test_discovery_v2', 'test_query_all_params',
+                           'results', 1000),
+    'assistant_v1.list_all_logs': ('test_assistant_v1',
+                                   'test_list_all_logs_all_params', 'logs',
+                                   1000),
+    'assistant_v2.message': ('test_assistant_v2', 'test_message_all_params',
+                             'output.generic', 100),
+}
+
+
+def load_large_response(name: str) -> dict:
+    """Return one of the inflated `LARGE_RESPONSES`."""
+    test_module, test_name, path, count = LARGE_RESPONSES[name]
+    return inflate(load_mock_response(test_module, test_name), path, count)
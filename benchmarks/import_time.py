@@ -0,0 +1,89 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Cold-start import time of `ibm_watson`.
+
+Every measurement runs in a fresh interpreter so nothing is served from
+`sys.modules`. The "all services" row forces every lazy service to load, which
+is what `import ibm_watson` used to cost before the services were loaded on
+first access.
+
+Usage: python -m benchmarks.import_time [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SERVICES = [
+    'AssistantV1', 'AssistantV2', 'CompareComplyV1', 'DiscoveryV1',
+    'DiscoveryV2', 'LanguageTranslatorV3', 'NaturalLanguageClassifierV1',
+    'NaturalLanguageUnderstandingV1', 'PersonalityInsightsV3',
+    'SpeechToTextV1', 'TextToSpeechV1', 'ToneAnalyzerV3',
+    'VisualRecognitionV3', 'VisualRecognitionV4'
+]
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def time_statement(statement, repeat):
+    """Return the median wall time of `statement` over fresh interpreters."""
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c',
+             TIMER.format(statement=statement)])
+        samples.append(float(output))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first sample does not pay for compilation.
+    subprocess.check_call([
+        sys.executable, '-c',
+        'import ibm_watson; [getattr(ibm_watson, s) for s in {0!r}]'.format(
+            SERVICES)
+    ])
+
+    eager = time_statement(
+        'import ibm_watson\nfor name in {0!r}: getattr(ibm_watson, name)'.
+        format(SERVICES), args.repeat)
+    bare = time_statement('import ibm_watson', args.repeat)
+
+    print('{0:<34}{1:>12}{2:>12}'.format('import', 'ms', 'saved ms'))
+    print('{0:<34}{1:>12.1f}{2:>12}'.format('all services (eager)',
+                                            eager * 1000, '-'))
+    print('{0:<34}{1:>12.1f}{2:>12.1f}'.format('ibm_watson', bare * 1000,
+                                               (eager - bare) * 1000))
+    for service in SERVICES:
+        elapsed = time_statement(
+            'from ibm_watson import {0}'.format(service), args.repeat)
+        print('{0:<34}{1:>12.1f}{2:>12.1f}'.format(service, elapsed * 1000,
+                                                   (eager - elapsed) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Encode and decode time of the installed JSON codecs.
+
+The documents are the Discovery and Assistant mock responses of the unit
+tests, inflated to realistic page sizes (see `benchmarks.fixtures`). The
+"baseline" rows are what the SDK did before the codecs were pluggable:
+`json.dumps(...)` followed by `.encode('utf-8')` for request bodies, and
+requests' `Response.json()` (stdlib) for response bodies.
+
+Usage: python -m benchmarks.json_codec [--number N]
+"""
+
+import argparse
+import json
+import timeit
+
+from ibm_watson.json_codec import AUTO_CODECS, get_json_codec
+
+from .fixtures import LARGE_RESPONSES, load_large_response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = []
+    for name in AUTO_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print('{0} is not installed'.format(name))
+
+    print('{0:<30}{1:<10}{2:>10}{3:>12}{4:>12}'.format(
+        'document', 'codec', 'KB', 'dumps ms', 'loads ms'))
+    for document_name in LARGE_RESPONSES:
+        document = load_large_response(document_name)
+        encoded = json.dumps(document).encode('utf-8')
+        cases = [('baseline', lambda: json.dumps(document).encode('utf-8'),
+                  lambda: json.loads(encoded.decode('utf-8')))]
+        cases += [(codec.name, lambda codec=codec: codec.dumps(document),
+                   lambda codec=codec: codec.loads(encoded))
+                  for codec in codecs]
+        for codec_name, dumps, loads in cases:
+            dumps_time = min(timeit.repeat(dumps, number=args.number,
+                                           repeat=3)) / args.number
+            loads_time = min(timeit.repeat(loads, number=args.number,
+                                           repeat=3)) / args.number
+            print('{0:<30}{1:<10}{2:>10.0f}{3:>12.2f}{4:>12.2f}'.format(
+                document_name, codec_name,
+                len(encoded) / 1024, dumps_time * 1000, loads_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Decoding time of large responses with `from_dict` and `from_dict_lazy`.
+
+For each response three cases are timed: decoding the whole response with
+`from_dict`, creating the lazy view alone, and creating the lazy view and
+reading one property of the first item of its collection. The last case is
+the typical "show the top result" use of a large query response.
+
+Usage: python -m benchmarks.lazy_models [--number N]
+"""
+
+import argparse
+import timeit
+
+from ibm_watson import assistant_v1, discovery_v1, speech_to_text_v1
+
+from .fixtures import inflate, load_mock_response
+
+# Name -> (model class, test module, test function, list path, item count,
+#          read function)
+RESPONSES = {
+    'discovery_v1.QueryResponse':
+        (discovery_v1.QueryResponse, 'test_discovery_v1',
+         'test_query_all_params', 'results', 1000,
+         lambda response: response.results[0].id),
+    'assistant_v1.LogCollection':
+        (assistant_v1.LogCollection, 'test_assistant_v1',
+         'test_list_all_logs_all_params', 'logs', 1000,
+         lambda response: response.logs[0].log_id),
+    'speech_to_text_v1.RecognitionJobs':
+        (speech_to_text_v1.RecognitionJobs, 'test_speech_to_text_v1',
+         'test_check_jobs_all_params', 'recognitions', 1000,
+         lambda response: response.recognitions[0].status),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    print('{0:<38}{1:>14}{2:>12}{3:>16}'.format('response', 'from_dict ms',
+                                                'lazy ms', 'lazy+read ms'))
+    for name, (model_class, test_module, test_name, path, count,
+               read) in RESPONSES.items():
+        document = inflate(load_mock_response(test_module, test_name), path,
+                           count)
+        cases = (
+            lambda: model_class.from_dict(document),
+            lambda: model_class.from_dict_lazy(document),
+            lambda: read(model_class.from_dict_lazy(document)),
+        )
+        times = [
+            min(timeit.repeat(case, number=args.number, repeat=5)) /
+            args.number * 1000 for case in cases
+        ]
+        print('{0:<38}{1:>14.3f}{2:>12.4f}{3:>16.3f}'.format(name, *times))
+
+
+if __name__ == '__main__':
+    main()
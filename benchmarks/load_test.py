@@ -0,0 +1,332 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Throughput and latency of the SDK against the local stand-in server.
+
+The requests go over real sockets to a `FakeWatsonServer`, which answers with
+canned responses, so the numbers are what the SDK costs without a network
+between it and the services. The scenarios are:
+
+    message     AssistantV2.message from --threads threads: requests per
+                second and latency percentiles
+    query       DiscoveryV1.query of 1000 results: time spent in each phase
+                of the request
+    recognize   SpeechToTextV1.recognize_using_websocket of --audio: audio
+                bytes streamed per second
+    streams     SpeechToTextV1.recognize_stream of --audio, --streams at a
+                time on one event loop: audio bytes streamed per second
+    turns       --requests short recognitions, each on a new connection, all
+                on one RecognitionSession and on a warm WebSocketPool: latency
+                of a recognition
+    synthesize  TextToSpeechV1.synthesize_using_websocket: time to the last
+                audio byte
+    first_audio TextToSpeechV1.synthesize_stream on a new connection and on a
+                warm WebSocketPool: time to the first audio byte
+
+Usage: python -m benchmarks.load_test [SCENARIO ...] [--threads N]
+       [--requests N] [--audio FILE] [--streams N]
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Callable, List
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_watson import (AssistantV2, DiscoveryV1, MetricsCollector,
+                        SpeechToTextV1, TextToSpeechV1)
+from ibm_watson.websocket import (AudioSource, RecognizeCallback,
+                                  SynthesizeCallback)
+
+from .fake_server import RESOURCES_DIR, FakeWatsonServer
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run_threads(threads: int, target: Callable[[], None]) -> float:
+    """Run `target` on each of `threads` threads; return the elapsed time."""
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def message(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    assistant = AssistantV2(version='2021-06-14',
+                            authenticator=NoAuthAuthenticator())
+    assistant.set_service_url(server.url)
+    latencies = []
+
+    def send_messages():
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            assistant.message('assistant_id',
+                              'session_id',
+                              input={'text': 'What are your opening hours?'})
+            latencies.append(time.perf_counter() - started)
+
+    elapsed = run_threads(args.threads, send_messages)
+    print('message: {0} requests from {1} threads'.format(
+        len(latencies), args.threads))
+    print('  {0:.0f} requests/s, latency p50 {1:.2f} ms, p99 {2:.2f} ms'.format(
+        len(latencies) / elapsed,
+        percentile(latencies, 0.5) * 1e3,
+        percentile(latencies, 0.99) * 1e3))
+
+
+def query(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    discovery = DiscoveryV1(version='2019-04-30',
+                            authenticator=NoAuthAuthenticator())
+    discovery.set_service_url(server.url)
+    metrics = MetricsCollector()
+    discovery.add_instrumentation(metrics)
+    for _ in range(args.requests):
+        discovery.query('environment_id', 'collection_id',
+                        natural_language_query='opening hours')
+
+    operation = metrics.get_metrics()[('discovery', 'query')]
+    print('query: {0} requests of {1} bytes'.format(
+        operation.count, operation.bytes_received // operation.count))
+    print('  {0:.2f} ms/request; {1}'.format(
+        operation.latency.sum / operation.count * 1e3, ', '.join(
+            '{0} {1:.2f} ms'.format(phase, seconds / operation.count * 1e3)
+            for phase, seconds in operation.phases.items())))
+
+
+class _Transcript(RecognizeCallback):
+
+    def __init__(self):
+        RecognizeCallback.__init__(self)
+        self.transcripts = []
+
+    def on_transcription(self, transcript):
+        self.transcripts.append(transcript)
+
+
+def recognize(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    speech_to_text.set_service_url(server.url)
+    size = os.path.getsize(args.audio)
+    with open(args.audio, 'rb') as audio:
+        callback = _Transcript()
+        started = time.perf_counter()
+        speech_to_text.recognize_using_websocket(AudioSource(audio),
+                                                 'audio/wav', callback)
+        elapsed = time.perf_counter() - started
+    assert server.audio_received[-1] == size, 'the audio was not all sent'
+    assert callback.transcripts, 'no transcript was received'
+    print('recognize: {0} bytes of audio in {1:.2f} s'.format(size, elapsed))
+    print('  {0:.0f} KB/s'.format(size / elapsed / 1024))
+
+
+def streams(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    speech_to_text.set_service_url(server.url)
+    with open(args.audio, 'rb') as audio:
+        data = audio.read()
+
+    async def recognize():
+        async with speech_to_text.recognize_stream('audio/wav') as stream:
+            for start in range(0, len(data), 8192):
+                await stream.send(data[start:start + 8192])
+            await stream.stop()
+            return [message async for message in stream]
+
+    async def main():
+        return await asyncio.gather(
+            *[recognize() for _ in range(args.streams)])
+
+    loop = asyncio.new_event_loop()
+    try:
+        started = time.perf_counter()
+        results = loop.run_until_complete(main())
+        elapsed = time.perf_counter() - started
+    finally:
+        loop.close()
+    assert all(results), 'no transcript was received'
+    assert server.audio_received[-args.streams:] == [len(data)] * args.streams
+    print('streams: {0} streams of {1} bytes of audio in {2:.2f} s'.format(
+        args.streams, len(data), elapsed))
+    print('  {0:.0f} KB/s'.format(args.streams * len(data) / elapsed / 1024))
+
+
+def turns(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    speech_to_text.set_service_url(server.url)
+    # A second of 16 kHz audio, the length of an answer to an IVR prompt.
+    utterance = bytes(32000)
+
+    async def recognize(start):
+        started = time.perf_counter()
+        async with start('audio/l16;rate=16000') as stream:
+            await stream.send(utterance)
+            await stream.stop()
+            assert [message async for message in stream]
+        return time.perf_counter() - started
+
+    async def main():
+        latencies = {}
+        latencies['new connection'] = [
+            await recognize(speech_to_text.recognize_stream)
+            for _ in range(args.requests)
+        ]
+        async with speech_to_text.recognition_session() as session:
+            latencies['session'] = [
+                await recognize(session.recognize)
+                for _ in range(args.requests)
+            ]
+        async with speech_to_text.websocket_pool(size=1) as pool:
+            await pool.warm()
+            start = functools.partial(speech_to_text.recognize_stream,
+                                      pool=pool)
+            latencies['pool'] = [
+                await recognize(start) for _ in range(args.requests)
+            ]
+        return latencies
+
+    loop = asyncio.new_event_loop()
+    try:
+        latencies = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    print('turns: {0} recognitions of {1} bytes of audio'.format(
+        args.requests, len(utterance)))
+    for name, values in latencies.items():
+        print('  {0}: latency p50 {1:.2f} ms, p99 {2:.2f} ms'.format(
+            name,
+            percentile(values, 0.5) * 1e3,
+            percentile(values, 0.99) * 1e3))
+
+
+class _Audio(SynthesizeCallback):
+
+    def __init__(self):
+        SynthesizeCallback.__init__(self)
+        self.size = 0
+        self.finished = None
+
+    def on_audio_stream(self, audio_stream):
+        self.size += len(audio_stream)
+        self.finished = time.perf_counter()
+
+
+def synthesize(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    text_to_speech = TextToSpeechV1(authenticator=NoAuthAuthenticator())
+    text_to_speech.set_service_url(server.url)
+    durations = []
+    for _ in range(min(args.requests, 20)):
+        callback = _Audio()
+        started = time.perf_counter()
+        text_to_speech.synthesize_using_websocket('Hello world', callback,
+                                                  accept='audio/wav')
+        durations.append(callback.finished - started)
+    print('synthesize: {0} requests of {1} bytes of audio'.format(
+        len(durations), callback.size))
+    print('  last byte after p50 {0:.2f} ms, p99 {1:.2f} ms'.format(
+        percentile(durations, 0.5) * 1e3,
+        percentile(durations, 0.99) * 1e3))
+
+
+def first_audio(server: FakeWatsonServer, args: argparse.Namespace) -> None:
+    text_to_speech = TextToSpeechV1(authenticator=NoAuthAuthenticator())
+    text_to_speech.set_service_url(server.url)
+
+    async def synthesize(pool):
+        started = time.perf_counter()
+        async with text_to_speech.synthesize_stream('Hello world',
+                                                    accept='audio/wav',
+                                                    pool=pool) as stream:
+            async for _ in stream:
+                first_audio = time.perf_counter() - started
+                break
+            await stream.read()
+        return first_audio
+
+    async def main():
+        latencies = {}
+        latencies['new connection'] = [
+            await synthesize(None) for _ in range(min(args.requests, 20))
+        ]
+        async with text_to_speech.websocket_pool(size=2) as pool:
+            await pool.warm()
+            latencies['pool'] = []
+            for _ in range(min(args.requests, 20)):
+                latencies['pool'].append(await synthesize(pool))
+                # The replacement of the used connection, as between the
+                # requests of a server.
+                while pool.idle() < pool.size:
+                    await asyncio.sleep(0.001)
+        return latencies
+
+    loop = asyncio.new_event_loop()
+    try:
+        latencies = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    print('first_audio: {0} syntheses'.format(min(args.requests, 20)))
+    for name, values in latencies.items():
+        print('  {0}: first byte after p50 {1:.2f} ms, p99 {2:.2f} ms'.format(
+            name,
+            percentile(values, 0.5) * 1e3,
+            percentile(values, 0.99) * 1e3))
+
+
+SCENARIOS = {
+    'message': message,
+    'query': query,
+    'recognize': recognize,
+    'streams': streams,
+    'turns': turns,
+    'synthesize': synthesize,
+    'first_audio': first_audio,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--audio',
+                        default=os.path.join(RESOURCES_DIR, 'speech.wav'))
+    parser.add_argument('--streams', type=int, default=100)
+    args = parser.parse_args()
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error('unknown scenario {0!r}, choose from {1}'.format(
+                scenario, ', '.join(SCENARIOS)))
+
+    # The websocket listeners turn on the frame trace of websocket-client.
+    logging.getLogger('websocket').addFilter(
+        lambda record: record.levelno > logging.DEBUG)
+    with FakeWatsonServer() as server:
+        for scenario in args.scenarios or list(SCENARIOS):
+            SCENARIOS[scenario](server, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time of `from_dict` and `to_dict` on the unit test fixtures.
+
+Each mock response is converted as it appears in the unit tests and again
+inflated to 1000 items (see `benchmarks.fixtures`). The first conversion of a
+model class, which generates its `from_dict` and `to_dict`, is not timed.
+
+The Speech to Text results are also converted with the models with
+hand-written `from_dict` and `to_dict`, loaded from the latest git commit
+that has them or from `--baseline` (see `benchmarks.baseline`), for a
+comparison of both.
+
+Usage: python -m benchmarks.model_codec [--number N] [--baseline COMMIT]
+"""
+
+import argparse
+import timeit
+
+from ibm_watson import (assistant_v1, assistant_v2, discovery_v1, discovery_v2,
+                        natural_language_understanding_v1, speech_to_text_v1)
+
+from .baseline import find_commit, load_module
+from .fixtures import inflate, load_mock_response
+
+# Name -> (model class, test module, test function, list path)
+RESPONSES = {
+    'assistant_v1.MessageResponse':
+        (assistant_v1.MessageResponse, 'test_assistant_v1',
+         'test_message_all_params', 'output.generic'),
+    'assistant_v1.LogCollection':
+        (assistant_v1.LogCollection, 'test_assistant_v1',
+         'test_list_all_logs_all_params', 'logs'),
+    'assistant_v2.MessageResponse':
+        (assistant_v2.MessageResponse, 'test_assistant_v2',
+         'test_message_all_params', 'output.generic'),
+    'discovery_v1.QueryResponse':
+        (discovery_v1.QueryResponse, 'test_discovery_v1',
+         'test_query_all_params', 'results'),
+    'discovery_v2.QueryResponse':
+        (discovery_v2.QueryResponse, 'test_discovery_v2',
+         'test_query_all_params', 'results'),
+    'natural_language_understanding_v1.AnalysisResults':
+        (natural_language_understanding_v1.AnalysisResults,
+         'test_natural_language_understanding_v1', 'test_analyze_all_params',
+         'entities'),
+    'speech_to_text_v1.SpeechRecognitionResults':
+        (speech_to_text_v1.SpeechRecognitionResults, 'test_speech_to_text_v1',
+         'test_recognize_all_params', 'results'),
+}
+
+# Name -> (module path, class name) of the same response, with hand-written
+# methods
+BASELINES = {
+    'speech_to_text_v1.SpeechRecognitionResults':
+        ('ibm_watson/speech_to_text_v1.py', 'SpeechRecognitionResults'),
+}
+
+
+def time_call(function, number):
+    """Return the best time of one call of `function`, in microseconds."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=1000)
+    parser.add_argument('--baseline',
+                        help='the commit of the hand-written methods, by '
+                        'default the latest one that has them')
+    args = parser.parse_args()
+
+    print('{0:<52}{1:<14}{2:>7}{3:>16}{4:>14}'.format(
+        'response', 'methods', 'items', 'from_dict us', 'to_dict us'))
+    for name, (model_class, test_module, test_name,
+               path) in RESPONSES.items():
+        variants = [('generated', model_class)]
+        if name in BASELINES:
+            module_path, class_name = BASELINES[name]
+            commit = args.baseline or find_commit(
+                module_path, lambda source: 'def from_dict' in source)
+            variants.insert(0, ('hand-written',
+                                getattr(load_module(commit, module_path),
+                                        class_name)))
+        document = load_mock_response(test_module, test_name)
+        for count, number in ((1, args.number), (1000, 5)):
+            if count > 1:
+                document = inflate(document, path, count)
+            for variant, variant_class in variants:
+                model = variant_class.from_dict(document)
+                model.to_dict()
+                from_dict_time = time_call(
+                    lambda: variant_class.from_dict(document), number)
+                to_dict_time = time_call(model.to_dict, number)
+                print('{0:<52}{1:<14}{2:>7}{3:>16.1f}{4:>14.1f}'.format(
+                    name, variant, count, from_dict_time, to_dict_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Memory held by model objects decoded from large responses.
+
+Each response is decoded with `from_dict` while `tracemalloc` is tracing, and
+the memory still allocated afterwards is divided by the number of model
+objects in the result. Strings are shared with the source dictionary, so the
+figure is the cost of the model objects and their lists.
+
+The Speech to Text results are also decoded with the models from before they
+stored their properties in `__slots__`, loaded from the latest git commit
+without them or from `--baseline` (see `benchmarks.baseline`), for a before
+and after comparison.
+
+Usage: python -m benchmarks.model_memory [--baseline COMMIT]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ibm_watson import assistant_v1, discovery_v1, natural_language_understanding_v1, speech_to_text_v1
+
+from .baseline import find_commit, load_module
+from .fixtures import inflate, load_mock_response
+
+# Name -> (model class, test module, test function, list path, item count)
+COLLECTIONS = {
+    'assistant_v1.LogCollection':
+        (assistant_v1.LogCollection, 'test_assistant_v1',
+         'test_list_all_logs_all_params', 'logs', 10000),
+    'discovery_v1.QueryResponse':
+        (discovery_v1.QueryResponse, 'test_discovery_v1',
+         'test_query_all_params', 'results', 10000),
+    'speech_to_text_v1.SpeechRecognitionResults':
+        (speech_to_text_v1.SpeechRecognitionResults, 'test_speech_to_text_v1',
+         'test_recognize_all_params', 'results', 10000),
+    'natural_language_understanding_v1.AnalysisResults':
+        (natural_language_understanding_v1.AnalysisResults,
+         'test_natural_language_understanding_v1', 'test_analyze_all_params',
+         'entities', 10000),
+}
+
+# Name -> (module path, class name) of the same collection, with a __dict__
+BASELINES = {
+    'speech_to_text_v1.SpeechRecognitionResults':
+        ('ibm_watson/speech_to_text_v1.py', 'SpeechRecognitionResults'),
+}
+
+
+def count_models(value):
+    """Return the number of model objects reachable from `value`."""
+    if isinstance(value, list):
+        return sum(count_models(x) for x in value)
+    if hasattr(value, 'to_dict'):
+        return 1 + sum(count_models(x) for x in vars(value).values())
+    return 0
+
+
+def measure(model_class, document):
+    """Return (bytes, model count) of decoding `document`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    model = model_class.from_dict(document)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, count_models(model)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--baseline',
+                        help='the commit of the __dict__ models, by default '
+                        'the latest one without __slots__')
+    args = parser.parse_args()
+
+    print('{0:<52}{1:<10}{2:>10}{3:>10}{4:>12}'.format(
+        'collection', 'models', 'objects', 'MB', 'bytes/obj'))
+    for name, (model_class, test_module, test_name, path,
+               count) in COLLECTIONS.items():
+        document = inflate(load_mock_response(test_module, test_name), path,
+                           count)
+        variants = [('__slots__', model_class)]
+        if name in BASELINES:
+            module_path, class_name = BASELINES[name]
+            commit = args.baseline or find_commit(
+                module_path, lambda source: '__slots__' not in source)
+            variants.insert(0, ('__dict__',
+                                getattr(load_module(commit, module_path),
+                                        class_name)))
+        for variant, variant_class in variants:
+            size, models = measure(variant_class, document)
+            print('{0:<52}{1:<10}{2:>10}{3:>10.1f}{4:>12.0f}'.format(
+                name, variant, models, size / 2**20, size / models))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Request building cost of `AssistantV2.message`, called directly and through
+`prepare_operation`.
+
+The network is taken out of the measurement by replacing `send` on the
+service instance, so the numbers are the per-message cost of building the
+request (headers, path parameters, URL, body and authentication).
+
+Usage: python -m benchmarks.prepared_operation [--number N]
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+
+from ibm_watson import AssistantV2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    service = AssistantV2(version='2021-06-14',
+                          authenticator=BearerTokenAuthenticator('token'))
+    service.send = lambda request, **kwargs: request
+    message = service.prepare_operation('message', 'assistant_id',
+                                        'session_id')
+    text = {'text': 'What are your opening hours?'}
+
+    cases = [
+        ('AssistantV2.message',
+         lambda: service.message('assistant_id', 'session_id', input=text)),
+        ('prepared message', lambda: message(input=text)),
+    ]
+    print('{0:<32}{1:>12}'.format('case', 'us/call'))
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print('{0:<32}{1:>12.2f}'.format(name, best / args.number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Audio streamed per second by `recognize_using_websocket`, for each pacing.
+
+A WAV file of `--hours` of 16 kHz mono audio is streamed to the local
+stand-in server with `fast` and `bounded` pacing, and its first
+`--real-time-seconds` with `real_time` pacing, whose rate should be the byte
+rate of the audio.
+
+Usage: python -m benchmarks.recognize_pacing [--hours H] [--max-rate B/S]
+       [--real-time-seconds S]
+"""
+
+import argparse
+import logging
+import os
+import struct
+import tempfile
+import time
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_watson import SpeechToTextV1
+from ibm_watson.websocket import AudioSource, RecognizeCallback
+
+from .fake_server import FakeWatsonServer
+
+SAMPLE_RATE = 16000
+BYTE_RATE = SAMPLE_RATE * 2
+
+
+def write_wav(path: str, seconds: float) -> int:
+    """Write a WAV file of silence; return its size."""
+    size = int(seconds * BYTE_RATE)
+    with open(path, 'wb') as wav:
+        wav.write(b'RIFF' + struct.pack('<I', 36 + size) + b'WAVE')
+        wav.write(b'fmt ' + struct.pack('<IHHIIHH', 16, 1, 1, SAMPLE_RATE,
+                                        BYTE_RATE, 2, 16))
+        wav.write(b'data' + struct.pack('<I', size))
+        # The samples are a hole in the file: silence, read without disk I/O.
+        wav.truncate(44 + size)
+    return 44 + size
+
+
+class _Done(RecognizeCallback):
+
+    def __init__(self):
+        RecognizeCallback.__init__(self)
+        self.transcripts = []
+
+    def on_transcription(self, transcript):
+        self.transcripts.append(transcript)
+
+
+def stream(server: FakeWatsonServer, path: str, **pacing) -> float:
+    """Stream a file with `recognize_using_websocket`; return the time."""
+    speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    speech_to_text.set_service_url(server.url)
+    callback = _Done()
+    with open(path, 'rb') as audio:
+        started = time.perf_counter()
+        speech_to_text.recognize_using_websocket(AudioSource(audio),
+                                                 'audio/wav', callback,
+                                                 **pacing)
+        elapsed = time.perf_counter() - started
+    assert server.audio_received[-1] == os.path.getsize(path), \
+        'the audio was not all sent'
+    assert callback.transcripts, 'no transcript was received'
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--hours', type=float, default=1.0)
+    parser.add_argument('--max-rate', type=int, default=10 * 1024 * 1024)
+    parser.add_argument('--real-time-seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    # The websocket listeners turn on the frame trace of websocket-client.
+    logging.getLogger('websocket').addFilter(
+        lambda record: record.levelno > logging.DEBUG)
+    print('{0:<28}{1:>14}{2:>10}{3:>14}'.format('pacing', 'bytes', 'seconds',
+                                                'bytes/s'))
+    with tempfile.TemporaryDirectory() as directory, \
+            FakeWatsonServer() as server:
+        long_audio = os.path.join(directory, 'long.wav')
+        short_audio = os.path.join(directory, 'short.wav')
+        runs = [
+            ('fast', long_audio, write_wav(long_audio, args.hours * 3600), {}),
+            ('bounded {0} B/s'.format(args.max_rate), long_audio,
+             os.path.getsize(long_audio), {
+                 'max_bytes_per_second': args.max_rate
+             }),
+            ('real_time {0} B/s'.format(BYTE_RATE), short_audio,
+             write_wav(short_audio, args.real_time_seconds), {
+                 'pacing': 'real_time'
+             }),
+        ]
+        for name, path, size, pacing in runs:
+            elapsed = stream(server, path, **pacing)
+            print('{0:<28}{1:>14}{2:>10.2f}{3:>14.0f}'.format(
+                name, size, elapsed, size / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Bytes on the wire of `AssistantV1.create_workspace`, with and without gzip
+request compression.
+
+The workspace is the one of the `create_workspace` unit test, with `--intents`
+intents of `--examples` examples each, and as many entities. The requests are
+sent to a local server that counts the bytes of each request body as they
+arrive, including the framing of chunked transfer encoding.
+
+Usage: python -m benchmarks.request_compression [--intents N] [--examples N]
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_watson import AssistantV1
+
+from .fixtures import load_mock_response
+
+WORDS = ('account', 'balance', 'card', 'check', 'close', 'open', 'transfer',
+         'payment', 'loan', 'rate', 'branch', 'hours', 'fee', 'statement',
+         'deposit', 'limit', 'online', 'password', 'reset', 'help', 'what',
+         'is', 'my', 'the', 'how', 'do', 'i', 'can', 'you', 'please', 'when',
+         'where', 'today', 'tomorrow', 'savings', 'credit', 'debit', 'pin')
+
+
+def sentence(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+
+
+def workspace(intents: int, examples: int) -> dict:
+    """Return the unit test workspace, with generated intents and entities."""
+    rng = random.Random(0)
+    document = load_mock_response('test_assistant_v1',
+                                  'test_create_workspace_all_params')
+    for key in ('workspace_id', 'created', 'updated', 'status', 'webhooks',
+                'counterexamples', 'dialog_nodes'):
+        document.pop(key, None)
+    document['intents'] = [{
+        'intent': 'intent_{0}'.format(i),
+        'description': sentence(rng),
+        'examples': [{
+            'text': sentence(rng)
+        } for _ in range(examples)]
+    } for i in range(intents)]
+    document['entities'] = [{
+        'entity': 'entity_{0}'.format(i),
+        'values': [{
+            'value': rng.choice(WORDS),
+            'synonyms': [sentence(rng) for _ in range(3)]
+        } for _ in range(examples)]
+    } for i in range(intents)]
+    return document
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        size = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                line = self.rfile.readline()
+                length = int(line.split(b';')[0], 16)
+                size += len(line) + len(self.rfile.read(length + 2))
+                if not length:
+                    break
+        else:
+            size = len(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.sizes.append(size)
+        body = b'{}'
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--intents', type=int, default=500)
+    parser.add_argument('--examples', type=int, default=20)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    server.daemon_threads = True
+    server.sizes = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    document = workspace(args.intents, args.examples)
+    print('workspace: {0} intents, {1} bytes of JSON'.format(
+        args.intents, len(json.dumps(document))))
+    print('{0:<16}{1:>14}{2:>10}{3:>14}'.format('compression', 'bytes on wire',
+                                                'ratio', 'ms/request'))
+    baseline = None
+    for level in (None, 1, 6, 9):
+        service = AssistantV1(version='2021-06-14',
+                              authenticator=NoAuthAuthenticator())
+        service.set_service_url('http://127.0.0.1:{0}'.format(
+            server.server_port))
+        if level is not None:
+            service.set_request_compression(level=level)
+        best = float('inf')
+        for _ in range(args.number):
+            started = time.perf_counter()
+            service.create_workspace(**document)
+            best = min(best, time.perf_counter() - started)
+        size = server.sizes[-1]
+        baseline = baseline or size
+        print('{0:<16}{1:>14}{2:>10.3f}{3:>14.2f}'.format(
+            'none' if level is None else 'gzip level {0}'.format(level), size,
+            size / baseline, best * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Per-call overhead of the SDK analytics headers.
+
+Compares the previous implementation, which formatted a new header dict on
+every call, with the cached `ibm_watson.common.get_sdk_headers`. The
+"operation" rows include the `headers = {}; headers.update(...)` copy done by
+each generated method.
+
+Usage: python -m benchmarks.sdk_headers [--number N]
+"""
+
+import argparse
+import timeit
+
+from ibm_watson import common
+
+
+def uncached_get_sdk_headers(service_name, service_version, operation_id):
+    headers = {}
+    headers[common.SDK_ANALYTICS_HEADER] = common.get_sdk_analytics(
+        service_name, service_version, operation_id)
+    headers[common.USER_AGENT_HEADER] = common.get_user_agent()
+    return headers
+
+
+def operation(get_sdk_headers):
+    headers = {}
+    sdk_headers = get_sdk_headers(service_name='assistant',
+                                  service_version='V2',
+                                  operation_id='message')
+    headers.update(sdk_headers)
+    return headers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=1000000)
+    args = parser.parse_args()
+
+    cases = [
+        ('get_sdk_headers (before)',
+         lambda: uncached_get_sdk_headers('assistant', 'V2', 'message')),
+        ('get_sdk_headers (after)',
+         lambda: common.get_sdk_headers('assistant', 'V2', 'message')),
+        ('operation headers (before)',
+         lambda: operation(uncached_get_sdk_headers)),
+        ('operation headers (after)',
+         lambda: operation(common.get_sdk_headers)),
+    ]
+    print('{0:<32}{1:>12}'.format('case', 'ns/call'))
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print('{0:<32}{1:>12.0f}'.format(name, best / args.number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
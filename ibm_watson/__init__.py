@@ -13,22 +13,137 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, ApiException
 
-from .assistant_v1 import AssistantV1
-from .assistant_v2 import AssistantV2
-from .language_translator_v3 import LanguageTranslatorV3
-from .natural_language_classifier_v1 import NaturalLanguageClassifierV1
-from .natural_language_understanding_v1 import NaturalLanguageUnderstandingV1
-from .personality_insights_v3 import PersonalityInsightsV3
-from .text_to_speech_v1 import TextToSpeechV1
-from .tone_analyzer_v3 import ToneAnalyzerV3
-from .discovery_v1 import DiscoveryV1
-from .discovery_v2 import DiscoveryV2
-from .compare_comply_v1 import CompareComplyV1
-from .visual_recognition_v3 import VisualRecognitionV3
 from .version import __version__
 from .common import get_sdk_headers
-from .speech_to_text_v1_adapter import SpeechToTextV1Adapter as SpeechToTextV1
-from .text_to_speech_adapter_v1 import TextToSpeechV1Adapter as TextToSpeechV1
-from .visual_recognition_v4 import VisualRecognitionV4
+
+# The generated service modules are large, so they are only imported when one
+# of their classes is first accessed (PEP 562). Maps the public name to the
+# module and the attribute that implement it.
+_LAZY_SERVICES = {
+    'AssistantV1': ('.assistant_v1', 'AssistantV1'),
+    'AssistantV2': ('.assistant_v2', 'AssistantV2'),
+    'LanguageTranslatorV3': ('.language_translator_v3', 'LanguageTranslatorV3'),
+    'NaturalLanguageClassifierV1':
+        ('.natural_language_classifier_v1', 'NaturalLanguageClassifierV1'),
+    'NaturalLanguageUnderstandingV1':
+        ('.natural_language_understanding_v1',
+         'NaturalLanguageUnderstandingV1'),
+    'PersonalityInsightsV3': ('.personality_insights_v3', 'PersonalityInsightsV3'),
+    'ToneAnalyzerV3': ('.tone_analyzer_v3', 'ToneAnalyzerV3'),
+    'DiscoveryV1': ('.discovery_v1', 'DiscoveryV1'),
+    'DiscoveryV2': ('.discovery_v2', 'DiscoveryV2'),
+    'CompareComplyV1': ('.compare_comply_v1', 'CompareComplyV1'),
+    'VisualRecognitionV3': ('.visual_recognition_v3', 'VisualRecognitionV3'),
+    'SpeechToTextV1': ('.speech_to_text_v1_adapter', 'SpeechToTextV1Adapter'),
+    'TextToSpeechV1': ('.text_to_speech_adapter_v1', 'TextToSpeechV1Adapter'),
+    'VisualRecognitionV4': ('.visual_recognition_v4', 'VisualRecognitionV4'),
+    'AsyncAssistantV1': ('.assistant_v1', 'AsyncAssistantV1'),
+    'AsyncAssistantV2': ('.assistant_v2', 'AsyncAssistantV2'),
+    'AsyncLanguageTranslatorV3':
+        ('.language_translator_v3', 'AsyncLanguageTranslatorV3'),
+    'AsyncNaturalLanguageClassifierV1':
+        ('.natural_language_classifier_v1', 'AsyncNaturalLanguageClassifierV1'),
+    'AsyncNaturalLanguageUnderstandingV1':
+        ('.natural_language_understanding_v1',
+         'AsyncNaturalLanguageUnderstandingV1'),
+    'AsyncPersonalityInsightsV3':
+        ('.personality_insights_v3', 'AsyncPersonalityInsightsV3'),
+    'AsyncToneAnalyzerV3': ('.tone_analyzer_v3', 'AsyncToneAnalyzerV3'),
+    'AsyncDiscoveryV1': ('.discovery_v1', 'AsyncDiscoveryV1'),
+    'AsyncDiscoveryV2': ('.discovery_v2', 'AsyncDiscoveryV2'),
+    'AsyncCompareComplyV1': ('.compare_comply_v1', 'AsyncCompareComplyV1'),
+    'AsyncVisualRecognitionV3':
+        ('.visual_recognition_v3', 'AsyncVisualRecognitionV3'),
+    'AsyncSpeechToTextV1': ('.speech_to_text_v1', 'AsyncSpeechToTextV1'),
+    'AsyncTextToSpeechV1': ('.text_to_speech_v1', 'AsyncTextToSpeechV1'),
+    'AsyncVisualRecognitionV4':
+        ('.visual_recognition_v4', 'AsyncVisualRecognitionV4'),
+    # Not services, but loaded on first use in the same way.
+    'ConnectionPoolConfig': ('.connection_pool', 'ConnectionPoolConfig'),
+    'BatchExecutor': ('.batch', 'BatchExecutor'),
+    'RateLimiter': ('.rate_limit', 'RateLimiter'),
+    'ResponseCache': ('.response_cache', 'ResponseCache'),
+    'ResultCache': ('.result_cache', 'ResultCache'),
+    'MetricsCollector': ('.instrumentation', 'MetricsCollector'),
+}
+
+# Submodules that used to be bound on the package as a side effect of the
+# eager imports, e.g. `ibm_watson.assistant_v1.MessageInput`.
+_LAZY_MODULES = frozenset([
+    'assistant_v1', 'assistant_v2', 'compare_comply_v1', 'discovery_v1',
+    'discovery_v2', 'language_translator_v3', 'natural_language_classifier_v1',
+    'natural_language_understanding_v1', 'personality_insights_v3',
+    'speech_to_text_v1', 'speech_to_text_v1_adapter', 'text_to_speech_v1',
+    'text_to_speech_adapter_v1', 'tone_analyzer_v3', 'visual_recognition_v3',
+    'visual_recognition_v4', 'websocket'
+])
+
+__all__ = [
+    'IAMTokenManager', 'DetailedResponse', 'BaseService', 'ApiException',
+    'get_sdk_headers'
+] + list(_LAZY_SERVICES)
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return import_module('.' + name, __name__)
+    try:
+        module_name, attr_name = _LAZY_SERVICES[name]
+    except KeyError:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(
+            __name__, name)) from None
+    value = getattr(import_module(module_name, __name__), attr_name)
+    # Cache on the package so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SERVICES) | _LAZY_MODULES)
+
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Static analysers, and interpreters without module __getattr__, get the
+    # eager imports.
+    from .assistant_v1 import AssistantV1
+    from .assistant_v2 import AssistantV2
+    from .language_translator_v3 import LanguageTranslatorV3
+    from .natural_language_classifier_v1 import NaturalLanguageClassifierV1
+    from .natural_language_understanding_v1 import NaturalLanguageUnderstandingV1
+    from .personality_insights_v3 import PersonalityInsightsV3
+    from .tone_analyzer_v3 import ToneAnalyzerV3
+    from .discovery_v1 import DiscoveryV1
+    from .discovery_v2 import DiscoveryV2
+    from .compare_comply_v1 import CompareComplyV1
+    from .visual_recognition_v3 import VisualRecognitionV3
+    from .speech_to_text_v1_adapter import SpeechToTextV1Adapter as SpeechToTextV1
+    from .text_to_speech_adapter_v1 import TextToSpeechV1Adapter as TextToSpeechV1
+    from .visual_recognition_v4 import VisualRecognitionV4
+    from .assistant_v1 import AsyncAssistantV1
+    from .assistant_v2 import AsyncAssistantV2
+    from .language_translator_v3 import AsyncLanguageTranslatorV3
+    from .natural_language_classifier_v1 import \
+        AsyncNaturalLanguageClassifierV1
+    from .natural_language_understanding_v1 import \
+        AsyncNaturalLanguageUnderstandingV1
+    from .personality_insights_v3 import AsyncPersonalityInsightsV3
+    from .tone_analyzer_v3 import AsyncToneAnalyzerV3
+    from .discovery_v1 import AsyncDiscoveryV1
+    from .discovery_v2 import AsyncDiscoveryV2
+    from .compare_comply_v1 import AsyncCompareComplyV1
+    from .visual_recognition_v3 import AsyncVisualRecognitionV3
+    from .speech_to_text_v1 import AsyncSpeechToTextV1
+    from .text_to_speech_v1 import AsyncTextToSpeechV1
+    from .visual_recognition_v4 import AsyncVisualRecognitionV4
+    from .connection_pool import ConnectionPoolConfig
+    from .batch import BatchExecutor
+    from .rate_limit import RateLimiter
+    from .response_cache import ResponseCache
+    from .result_cache import ResultCache
+    from .instrumentation import MetricsCollector
@@ -29,22 +29,23 @@ See: https://cloud.ibm.com/docs/assistant
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List
-import json
-import sys
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelDiscriminator, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class AssistantV1(BaseService):
+class AssistantV1(WatsonService):
     """The Assistant V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.assistant.watson.cloud.ibm.com'
@@ -55,6 +56,7 @@ class AssistantV1(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Assistant service.
@@ -65,17 +67,23 @@ class AssistantV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(AssistantV1))
 
     #########################
     # Message
@@ -171,7 +179,7 @@ class AssistantV1(BaseService):
             'user_id': user_id
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -188,7 +196,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MessageResponse, **kwargs)
         return response
 
     #########################
@@ -230,7 +238,7 @@ class AssistantV1(BaseService):
 
         data = {'input': input}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -248,7 +256,9 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=BulkClassifyResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -311,7 +321,9 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=WorkspaceCollection,
+                             **kwargs)
         return response
 
     def create_workspace(self,
@@ -397,7 +409,7 @@ class AssistantV1(BaseService):
             'entities': entities
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -411,7 +423,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Workspace, **kwargs)
         return response
 
     def get_workspace(self,
@@ -470,7 +482,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Workspace, **kwargs)
         return response
 
     def update_workspace(self,
@@ -574,7 +586,7 @@ class AssistantV1(BaseService):
             'entities': entities
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -591,7 +603,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Workspace, **kwargs)
         return response
 
     def delete_workspace(self, workspace_id: str, **kwargs) -> DetailedResponse:
@@ -705,7 +717,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=IntentCollection, **kwargs)
         return response
 
     def create_intent(self,
@@ -760,7 +772,7 @@ class AssistantV1(BaseService):
             'examples': examples
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -777,7 +789,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Intent, **kwargs)
         return response
 
     def get_intent(self,
@@ -835,7 +847,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Intent, **kwargs)
         return response
 
     def update_intent(self,
@@ -907,7 +919,7 @@ class AssistantV1(BaseService):
             'examples': new_examples
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -925,7 +937,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Intent, **kwargs)
         return response
 
     def delete_intent(self, workspace_id: str, intent: str,
@@ -1044,7 +1056,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ExampleCollection, **kwargs)
         return response
 
     def create_example(self,
@@ -1095,7 +1107,7 @@ class AssistantV1(BaseService):
 
         data = {'text': text, 'mentions': mentions}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1113,7 +1125,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Example, **kwargs)
         return response
 
     def get_example(self,
@@ -1166,7 +1178,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Example, **kwargs)
         return response
 
     def update_example(self,
@@ -1219,7 +1231,7 @@ class AssistantV1(BaseService):
 
         data = {'text': new_text, 'mentions': new_mentions}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1237,7 +1249,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Example, **kwargs)
         return response
 
     def delete_example(self, workspace_id: str, intent: str, text: str,
@@ -1355,7 +1367,9 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=CounterexampleCollection,
+                             **kwargs)
         return response
 
     def create_counterexample(self,
@@ -1398,7 +1412,7 @@ class AssistantV1(BaseService):
 
         data = {'text': text}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1416,7 +1430,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Counterexample, **kwargs)
         return response
 
     def get_counterexample(self,
@@ -1467,7 +1481,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Counterexample, **kwargs)
         return response
 
     def update_counterexample(self,
@@ -1511,7 +1525,7 @@ class AssistantV1(BaseService):
 
         data = {'text': new_text}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1529,7 +1543,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Counterexample, **kwargs)
         return response
 
     def delete_counterexample(self, workspace_id: str, text: str,
@@ -1650,7 +1664,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=EntityCollection, **kwargs)
         return response
 
     def create_entity(self,
@@ -1714,7 +1728,7 @@ class AssistantV1(BaseService):
             'values': values
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1731,7 +1745,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Entity, **kwargs)
         return response
 
     def get_entity(self,
@@ -1789,7 +1803,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Entity, **kwargs)
         return response
 
     def update_entity(self,
@@ -1868,7 +1882,7 @@ class AssistantV1(BaseService):
             'values': new_values
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1886,7 +1900,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Entity, **kwargs)
         return response
 
     def delete_entity(self, workspace_id: str, entity: str,
@@ -1992,7 +2006,9 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=EntityMentionCollection,
+                             **kwargs)
         return response
 
     #########################
@@ -2073,7 +2089,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ValueCollection, **kwargs)
         return response
 
     def create_value(self,
@@ -2142,7 +2158,7 @@ class AssistantV1(BaseService):
             'patterns': patterns
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2160,7 +2176,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Value, **kwargs)
         return response
 
     def get_value(self,
@@ -2222,7 +2238,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Value, **kwargs)
         return response
 
     def update_value(self,
@@ -2310,7 +2326,7 @@ class AssistantV1(BaseService):
             'patterns': new_patterns
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2328,7 +2344,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Value, **kwargs)
         return response
 
     def delete_value(self, workspace_id: str, entity: str, value: str,
@@ -2453,7 +2469,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SynonymCollection, **kwargs)
         return response
 
     def create_synonym(self,
@@ -2504,7 +2520,7 @@ class AssistantV1(BaseService):
 
         data = {'synonym': synonym}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2522,7 +2538,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Synonym, **kwargs)
         return response
 
     def get_synonym(self,
@@ -2580,7 +2596,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Synonym, **kwargs)
         return response
 
     def update_synonym(self,
@@ -2633,7 +2649,7 @@ class AssistantV1(BaseService):
 
         data = {'synonym': new_synonym}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2652,7 +2668,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Synonym, **kwargs)
         return response
 
     def delete_synonym(self, workspace_id: str, entity: str, value: str,
@@ -2773,7 +2789,9 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DialogNodeCollection,
+                             **kwargs)
         return response
 
     def create_dialog_node(self,
@@ -2907,7 +2925,7 @@ class AssistantV1(BaseService):
             'disambiguation_opt_out': disambiguation_opt_out
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2925,7 +2943,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DialogNode, **kwargs)
         return response
 
     def get_dialog_node(self,
@@ -2975,7 +2993,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DialogNode, **kwargs)
         return response
 
     def update_dialog_node(self,
@@ -3114,7 +3132,7 @@ class AssistantV1(BaseService):
             'disambiguation_opt_out': new_disambiguation_opt_out
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3132,7 +3150,7 @@ class AssistantV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DialogNode, **kwargs)
         return response
 
     def delete_dialog_node(self, workspace_id: str, dialog_node: str,
@@ -3242,7 +3260,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LogCollection, **kwargs)
         return response
 
     def list_all_logs(self,
@@ -3303,7 +3321,7 @@ class AssistantV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LogCollection, **kwargs)
         return response
 
     #########################
@@ -3483,18 +3501,28 @@ class ListDialogNodesEnums:
         UPDATED = 'updated'
 
 
+class AsyncAssistantV1(AsyncWatsonService, AssistantV1):
+    """The Assistant V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AgentAvailabilityMessage():
+class AgentAvailabilityMessage(Model):
     """
     AgentAvailabilityMessage.
 
     :attr str message: (optional) The text of the message.
     """
 
+    __slots__ = ('message',)
+
+    _fields = (
+        ModelField('message'),
+    )
+
     def __init__(self, *, message: str = None) -> None:
         """
         Initialize a AgentAvailabilityMessage object.
@@ -3503,46 +3531,8 @@ class AgentAvailabilityMessage():
         """
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AgentAvailabilityMessage':
-        """Initialize a AgentAvailabilityMessage object from a json dictionary."""
-        args = {}
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AgentAvailabilityMessage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AgentAvailabilityMessage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AgentAvailabilityMessage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AgentAvailabilityMessage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class BulkClassifyOutput():
+class BulkClassifyOutput(Model):
     """
     BulkClassifyOutput.
 
@@ -3554,6 +3544,14 @@ class BulkClassifyOutput():
           the utterance.
     """
 
+    __slots__ = ('input', 'entities', 'intents')
+
+    _fields = (
+        ModelField('input', 'model', 'BulkClassifyUtterance'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+    )
+
     def __init__(self,
                  *,
                  input: 'BulkClassifyUtterance' = None,
@@ -3573,58 +3571,8 @@ class BulkClassifyOutput():
         self.entities = entities
         self.intents = intents
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyOutput':
-        """Initialize a BulkClassifyOutput object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = BulkClassifyUtterance.from_dict(_dict.get('input'))
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyOutput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyOutput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BulkClassifyOutput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'BulkClassifyOutput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class BulkClassifyResponse():
+class BulkClassifyResponse(Model):
     """
     BulkClassifyResponse.
 
@@ -3632,6 +3580,12 @@ class BulkClassifyResponse():
           contain classification information for the submitted input utterances.
     """
 
+    __slots__ = ('output',)
+
+    _fields = (
+        ModelField('output', 'list', 'BulkClassifyOutput'),
+    )
+
     def __init__(self, *, output: List['BulkClassifyOutput'] = None) -> None:
         """
         Initialize a BulkClassifyResponse object.
@@ -3641,54 +3595,20 @@ class BulkClassifyResponse():
         """
         self.output = output
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyResponse':
-        """Initialize a BulkClassifyResponse object from a json dictionary."""
-        args = {}
-        if 'output' in _dict:
-            args['output'] = [
-                BulkClassifyOutput.from_dict(x) for x in _dict.get('output')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = [x.to_dict() for x in self.output]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'BulkClassifyResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BulkClassifyResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class BulkClassifyUtterance():
+class BulkClassifyUtterance(Model):
     """
     The user input utterance to classify.
 
     :attr str text: The text of the input utterance.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text', required=True),
+    )
+
     def __init__(self, text: str) -> None:
         """
         Initialize a BulkClassifyUtterance object.
@@ -3697,50 +3617,8 @@ class BulkClassifyUtterance():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyUtterance':
-        """Initialize a BulkClassifyUtterance object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in BulkClassifyUtterance JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyUtterance object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyUtterance object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BulkClassifyUtterance') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BulkClassifyUtterance') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CaptureGroup():
+class CaptureGroup(Model):
     """
     A recognized capture group for a pattern-based entity.
 
@@ -3749,6 +3627,13 @@ class CaptureGroup():
           where the entity value begins and ends in the input text.
     """
 
+    __slots__ = ('group', 'location')
+
+    _fields = (
+        ModelField('group', required=True),
+        ModelField('location'),
+    )
+
     def __init__(self, group: str, *, location: List[int] = None) -> None:
         """
         Initialize a CaptureGroup object.
@@ -3760,53 +3645,8 @@ class CaptureGroup():
         self.group = group
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CaptureGroup':
-        """Initialize a CaptureGroup object from a json dictionary."""
-        args = {}
-        if 'group' in _dict:
-            args['group'] = _dict.get('group')
-        else:
-            raise ValueError(
-                'Required property \'group\' not present in CaptureGroup JSON')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CaptureGroup object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'group') and self.group is not None:
-            _dict['group'] = self.group
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CaptureGroup object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CaptureGroup') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CaptureGroup') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class ChannelTransferInfo():
+class ChannelTransferInfo(Model):
     """
     Information used by an integration to transfer the conversation to a different
     channel.
@@ -3817,6 +3657,12 @@ class ChannelTransferInfo():
           representing the web chat integration.
     """
 
+    __slots__ = ('target',)
+
+    _fields = (
+        ModelField('target', 'model', 'ChannelTransferTarget', required=True),
+    )
+
     def __init__(self, target: 'ChannelTransferTarget') -> None:
         """
         Initialize a ChannelTransferInfo object.
@@ -3828,51 +3674,8 @@ class ChannelTransferInfo():
         """
         self.target = target
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferInfo':
-        """Initialize a ChannelTransferInfo object from a json dictionary."""
-        args = {}
-        if 'target' in _dict:
-            args['target'] = ChannelTransferTarget.from_dict(
-                _dict.get('target'))
-        else:
-            raise ValueError(
-                'Required property \'target\' not present in ChannelTransferInfo JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ChannelTransferInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ChannelTransferInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ChannelTransferTarget():
+class ChannelTransferTarget(Model):
     """
     An object specifying target channels available for the transfer. Each property of this
     object represents an available transfer target. Currently, the only supported property
@@ -3882,6 +3685,12 @@ class ChannelTransferTarget():
           the web chat integration.
     """
 
+    __slots__ = ('chat',)
+
+    _fields = (
+        ModelField('chat', 'model', 'ChannelTransferTargetChat'),
+    )
+
     def __init__(self, *, chat: 'ChannelTransferTargetChat' = None) -> None:
         """
         Initialize a ChannelTransferTarget object.
@@ -3891,53 +3700,20 @@ class ChannelTransferTarget():
         """
         self.chat = chat
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferTarget':
-        """Initialize a ChannelTransferTarget object from a json dictionary."""
-        args = {}
-        if 'chat' in _dict:
-            args['chat'] = ChannelTransferTargetChat.from_dict(
-                _dict.get('chat'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferTarget object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'chat') and self.chat is not None:
-            _dict['chat'] = self.chat.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferTarget object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'ChannelTransferTarget') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ChannelTransferTarget') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ChannelTransferTargetChat():
+class ChannelTransferTargetChat(Model):
     """
     Information for transferring to the web chat integration.
 
     :attr str url: (optional) The URL of the target web chat.
     """
 
+    __slots__ = ('url',)
+
+    _fields = (
+        ModelField('url'),
+    )
+
     def __init__(self, *, url: str = None) -> None:
         """
         Initialize a ChannelTransferTargetChat object.
@@ -3946,46 +3722,8 @@ class ChannelTransferTargetChat():
         """
         self.url = url
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferTargetChat':
-        """Initialize a ChannelTransferTargetChat object from a json dictionary."""
-        args = {}
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferTargetChat object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferTargetChat object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ChannelTransferTargetChat') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ChannelTransferTargetChat') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Context():
+class Context(Model):
     """
     State information for the conversation. To maintain state, include the context from
     the previous response.
@@ -3996,6 +3734,14 @@ class Context():
           message.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('conversation_id'),
+        ModelField('system'),
+        ModelField('metadata', 'model', 'MessageContextMetadata'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['conversation_id', 'system', 'metadata'])
 
@@ -4021,47 +3767,6 @@ class Context():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Context':
-        """Initialize a Context object from a json dictionary."""
-        args = {}
-        if 'conversation_id' in _dict:
-            args['conversation_id'] = _dict.get('conversation_id')
-        if 'system' in _dict:
-            args['system'] = _dict.get('system')
-        if 'metadata' in _dict:
-            args['metadata'] = MessageContextMetadata.from_dict(
-                _dict.get('metadata'))
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Context object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'conversation_id') and self.conversation_id is not None:
-            _dict['conversation_id'] = self.conversation_id
-        if hasattr(self, 'system') and self.system is not None:
-            _dict['system'] = self.system
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata.to_dict()
-        for _key in [
-                k for k in vars(self).keys() if k not in Context._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of Context"""
         _dict = {}
@@ -4083,22 +3788,8 @@ class Context():
             if _key not in Context._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this Context object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Context') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Context') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Counterexample():
+class Counterexample(Model):
     """
     Counterexample.
 
@@ -4111,6 +3802,14 @@ class Counterexample():
           the object.
     """
 
+    __slots__ = ('text', 'created', 'updated')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  text: str,
                  *,
@@ -4128,57 +3827,8 @@ class Counterexample():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Counterexample':
-        """Initialize a Counterexample object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in Counterexample JSON')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Counterexample object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Counterexample object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Counterexample') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Counterexample') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class CounterexampleCollection():
+class CounterexampleCollection(Model):
     """
     CounterexampleCollection.
 
@@ -4187,6 +3837,13 @@ class CounterexampleCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('counterexamples', 'pagination')
+
+    _fields = (
+        ModelField('counterexamples', 'list', 'Counterexample', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, counterexamples: List['Counterexample'],
                  pagination: 'Pagination') -> None:
         """
@@ -4199,64 +3856,8 @@ class CounterexampleCollection():
         self.counterexamples = counterexamples
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CounterexampleCollection':
-        """Initialize a CounterexampleCollection object from a json dictionary."""
-        args = {}
-        if 'counterexamples' in _dict:
-            args['counterexamples'] = [
-                Counterexample.from_dict(x)
-                for x in _dict.get('counterexamples')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'counterexamples\' not present in CounterexampleCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in CounterexampleCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CounterexampleCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'counterexamples') and self.counterexamples is not None:
-            _dict['counterexamples'] = [
-                x.to_dict() for x in self.counterexamples
-            ]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CounterexampleCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CounterexampleCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'CounterexampleCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CreateEntity():
+class CreateEntity(Model):
     """
     CreateEntity.
 
@@ -4277,6 +3878,19 @@ class CreateEntity():
           entity values.
     """
 
+    __slots__ = ('entity', 'description', 'metadata', 'fuzzy_match', 'created',
+                 'updated', 'values')
+
+    _fields = (
+        ModelField('entity', required=True),
+        ModelField('description'),
+        ModelField('metadata'),
+        ModelField('fuzzy_match'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('values', 'list', 'CreateValue'),
+    )
+
     def __init__(self,
                  entity: str,
                  *,
@@ -4312,75 +3926,8 @@ class CreateEntity():
         self.updated = updated
         self.values = values
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CreateEntity':
-        """Initialize a CreateEntity object from a json dictionary."""
-        args = {}
-        if 'entity' in _dict:
-            args['entity'] = _dict.get('entity')
-        else:
-            raise ValueError(
-                'Required property \'entity\' not present in CreateEntity JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'fuzzy_match' in _dict:
-            args['fuzzy_match'] = _dict.get('fuzzy_match')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'values' in _dict:
-            args['values'] = [
-                CreateValue.from_dict(x) for x in _dict.get('values')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CreateEntity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entity') and self.entity is not None:
-            _dict['entity'] = self.entity
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'fuzzy_match') and self.fuzzy_match is not None:
-            _dict['fuzzy_match'] = self.fuzzy_match
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'values') and self.values is not None:
-            _dict['values'] = [x.to_dict() for x in self.values]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CreateEntity object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'CreateEntity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CreateEntity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CreateIntent():
+class CreateIntent(Model):
     """
     CreateIntent.
 
@@ -4398,6 +3945,16 @@ class CreateIntent():
           intent.
     """
 
+    __slots__ = ('intent', 'description', 'created', 'updated', 'examples')
+
+    _fields = (
+        ModelField('intent', required=True),
+        ModelField('description'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('examples', 'list', 'Example'),
+    )
+
     def __init__(self,
                  intent: str,
                  *,
@@ -4424,67 +3981,8 @@ class CreateIntent():
         self.updated = updated
         self.examples = examples
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CreateIntent':
-        """Initialize a CreateIntent object from a json dictionary."""
-        args = {}
-        if 'intent' in _dict:
-            args['intent'] = _dict.get('intent')
-        else:
-            raise ValueError(
-                'Required property \'intent\' not present in CreateIntent JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'examples' in _dict:
-            args['examples'] = [
-                Example.from_dict(x) for x in _dict.get('examples')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CreateIntent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'intent') and self.intent is not None:
-            _dict['intent'] = self.intent
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CreateIntent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CreateIntent') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CreateIntent') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class CreateValue():
+class CreateValue(Model):
     """
     CreateValue.
 
@@ -4509,6 +4007,19 @@ class CreateValue():
           the object.
     """
 
+    __slots__ = ('value', 'metadata', 'type', 'synonyms', 'patterns', 'created',
+                 'updated')
+
+    _fields = (
+        ModelField('value', required=True),
+        ModelField('metadata'),
+        ModelField('type'),
+        ModelField('synonyms'),
+        ModelField('patterns'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  value: str,
                  *,
@@ -4547,71 +4058,6 @@ class CreateValue():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CreateValue':
-        """Initialize a CreateValue object from a json dictionary."""
-        args = {}
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in CreateValue JSON')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'synonyms' in _dict:
-            args['synonyms'] = _dict.get('synonyms')
-        if 'patterns' in _dict:
-            args['patterns'] = _dict.get('patterns')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CreateValue object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'synonyms') and self.synonyms is not None:
-            _dict['synonyms'] = self.synonyms
-        if hasattr(self, 'patterns') and self.patterns is not None:
-            _dict['patterns'] = self.patterns
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CreateValue object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CreateValue') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CreateValue') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         Specifies the type of entity value.
@@ -4620,7 +4066,7 @@ class CreateValue():
         PATTERNS = 'patterns'
 
 
-class DialogNode():
+class DialogNode(Model):
     """
     DialogNode.
 
@@ -4677,6 +4123,38 @@ class DialogNode():
           the object.
     """
 
+    __slots__ = ('dialog_node', 'description', 'conditions', 'parent',
+                 'previous_sibling', 'output', 'context', 'metadata',
+                 'next_step', 'title', 'type', 'event_name', 'variable',
+                 'actions', 'digress_in', 'digress_out', 'digress_out_slots',
+                 'user_label', 'disambiguation_opt_out', 'disabled', 'created',
+                 'updated')
+
+    _fields = (
+        ModelField('dialog_node', required=True),
+        ModelField('description'),
+        ModelField('conditions'),
+        ModelField('parent'),
+        ModelField('previous_sibling'),
+        ModelField('output', 'model', 'DialogNodeOutput'),
+        ModelField('context', 'model', 'DialogNodeContext'),
+        ModelField('metadata'),
+        ModelField('next_step', 'model', 'DialogNodeNextStep'),
+        ModelField('title'),
+        ModelField('type'),
+        ModelField('event_name'),
+        ModelField('variable'),
+        ModelField('actions', 'list', 'DialogNodeAction'),
+        ModelField('digress_in'),
+        ModelField('digress_out'),
+        ModelField('digress_out_slots'),
+        ModelField('user_label'),
+        ModelField('disambiguation_opt_out'),
+        ModelField('disabled'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  dialog_node: str,
                  *,
@@ -4778,138 +4256,6 @@ class DialogNode():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNode':
-        """Initialize a DialogNode object from a json dictionary."""
-        args = {}
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        else:
-            raise ValueError(
-                'Required property \'dialog_node\' not present in DialogNode JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'conditions' in _dict:
-            args['conditions'] = _dict.get('conditions')
-        if 'parent' in _dict:
-            args['parent'] = _dict.get('parent')
-        if 'previous_sibling' in _dict:
-            args['previous_sibling'] = _dict.get('previous_sibling')
-        if 'output' in _dict:
-            args['output'] = DialogNodeOutput.from_dict(_dict.get('output'))
-        if 'context' in _dict:
-            args['context'] = DialogNodeContext.from_dict(_dict.get('context'))
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'next_step' in _dict:
-            args['next_step'] = DialogNodeNextStep.from_dict(
-                _dict.get('next_step'))
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'event_name' in _dict:
-            args['event_name'] = _dict.get('event_name')
-        if 'variable' in _dict:
-            args['variable'] = _dict.get('variable')
-        if 'actions' in _dict:
-            args['actions'] = [
-                DialogNodeAction.from_dict(x) for x in _dict.get('actions')
-            ]
-        if 'digress_in' in _dict:
-            args['digress_in'] = _dict.get('digress_in')
-        if 'digress_out' in _dict:
-            args['digress_out'] = _dict.get('digress_out')
-        if 'digress_out_slots' in _dict:
-            args['digress_out_slots'] = _dict.get('digress_out_slots')
-        if 'user_label' in _dict:
-            args['user_label'] = _dict.get('user_label')
-        if 'disambiguation_opt_out' in _dict:
-            args['disambiguation_opt_out'] = _dict.get('disambiguation_opt_out')
-        if 'disabled' in _dict:
-            args['disabled'] = _dict.get('disabled')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNode object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'conditions') and self.conditions is not None:
-            _dict['conditions'] = self.conditions
-        if hasattr(self, 'parent') and self.parent is not None:
-            _dict['parent'] = self.parent
-        if hasattr(self,
-                   'previous_sibling') and self.previous_sibling is not None:
-            _dict['previous_sibling'] = self.previous_sibling
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output.to_dict()
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'next_step') and self.next_step is not None:
-            _dict['next_step'] = self.next_step.to_dict()
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'event_name') and self.event_name is not None:
-            _dict['event_name'] = self.event_name
-        if hasattr(self, 'variable') and self.variable is not None:
-            _dict['variable'] = self.variable
-        if hasattr(self, 'actions') and self.actions is not None:
-            _dict['actions'] = [x.to_dict() for x in self.actions]
-        if hasattr(self, 'digress_in') and self.digress_in is not None:
-            _dict['digress_in'] = self.digress_in
-        if hasattr(self, 'digress_out') and self.digress_out is not None:
-            _dict['digress_out'] = self.digress_out
-        if hasattr(self,
-                   'digress_out_slots') and self.digress_out_slots is not None:
-            _dict['digress_out_slots'] = self.digress_out_slots
-        if hasattr(self, 'user_label') and self.user_label is not None:
-            _dict['user_label'] = self.user_label
-        if hasattr(self, 'disambiguation_opt_out'
-                  ) and self.disambiguation_opt_out is not None:
-            _dict['disambiguation_opt_out'] = self.disambiguation_opt_out
-        if hasattr(self, 'disabled') and getattr(self, 'disabled') is not None:
-            _dict['disabled'] = getattr(self, 'disabled')
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNode object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNode') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNode') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         How the dialog node is processed.
@@ -4960,7 +4306,7 @@ class DialogNode():
         ALLOW_ALL = 'allow_all'
 
 
-class DialogNodeAction():
+class DialogNodeAction(Model):
     """
     DialogNodeAction.
 
@@ -4974,6 +4320,16 @@ class DialogNodeAction():
           client application will use to pass in credentials for the action.
     """
 
+    __slots__ = ('name', 'type', 'parameters', 'result_variable', 'credentials')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('type'),
+        ModelField('parameters'),
+        ModelField('result_variable', required=True),
+        ModelField('credentials'),
+    )
+
     def __init__(self,
                  name: str,
                  result_variable: str,
@@ -4999,69 +4355,6 @@ class DialogNodeAction():
         self.result_variable = result_variable
         self.credentials = credentials
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeAction':
-        """Initialize a DialogNodeAction object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in DialogNodeAction JSON'
-            )
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'parameters' in _dict:
-            args['parameters'] = _dict.get('parameters')
-        if 'result_variable' in _dict:
-            args['result_variable'] = _dict.get('result_variable')
-        else:
-            raise ValueError(
-                'Required property \'result_variable\' not present in DialogNodeAction JSON'
-            )
-        if 'credentials' in _dict:
-            args['credentials'] = _dict.get('credentials')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeAction object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'parameters') and self.parameters is not None:
-            _dict['parameters'] = self.parameters
-        if hasattr(self,
-                   'result_variable') and self.result_variable is not None:
-            _dict['result_variable'] = self.result_variable
-        if hasattr(self, 'credentials') and self.credentials is not None:
-            _dict['credentials'] = self.credentials
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeAction object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeAction') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeAction') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of action to invoke.
@@ -5073,7 +4366,7 @@ class DialogNodeAction():
         WEBHOOK = 'webhook'
 
 
-class DialogNodeCollection():
+class DialogNodeCollection(Model):
     """
     An array of dialog nodes.
 
@@ -5082,6 +4375,13 @@ class DialogNodeCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('dialog_nodes', 'pagination')
+
+    _fields = (
+        ModelField('dialog_nodes', 'list', 'DialogNode', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, dialog_nodes: List['DialogNode'],
                  pagination: 'Pagination') -> None:
         """
@@ -5094,60 +4394,8 @@ class DialogNodeCollection():
         self.dialog_nodes = dialog_nodes
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeCollection':
-        """Initialize a DialogNodeCollection object from a json dictionary."""
-        args = {}
-        if 'dialog_nodes' in _dict:
-            args['dialog_nodes'] = [
-                DialogNode.from_dict(x) for x in _dict.get('dialog_nodes')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'dialog_nodes\' not present in DialogNodeCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in DialogNodeCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'dialog_nodes') and self.dialog_nodes is not None:
-            _dict['dialog_nodes'] = [x.to_dict() for x in self.dialog_nodes]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DialogNodeCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeContext():
+class DialogNodeContext(Model):
     """
     The context for the dialog node.
 
@@ -5155,6 +4403,12 @@ class DialogNodeContext():
           integrations.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('integrations'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['integrations'])
 
@@ -5170,38 +4424,6 @@ class DialogNodeContext():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeContext':
-        """Initialize a DialogNodeContext object from a json dictionary."""
-        args = {}
-        if 'integrations' in _dict:
-            args['integrations'] = _dict.get('integrations')
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeContext object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'integrations') and self.integrations is not None:
-            _dict['integrations'] = self.integrations
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in DialogNodeContext._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of DialogNodeContext"""
         _dict = {}
@@ -5225,22 +4447,8 @@ class DialogNodeContext():
             if _key not in DialogNodeContext._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeContext object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeContext') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeContext') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class DialogNodeNextStep():
+class DialogNodeNextStep(Model):
     """
     The next step to execute following this dialog node.
 
@@ -5270,6 +4478,14 @@ class DialogNodeNextStep():
     :attr str selector: (optional) Which part of the dialog node to process next.
     """
 
+    __slots__ = ('behavior', 'dialog_node', 'selector')
+
+    _fields = (
+        ModelField('behavior', required=True),
+        ModelField('dialog_node'),
+        ModelField('selector'),
+    )
+
     def __init__(self,
                  behavior: str,
                  *,
@@ -5308,56 +4524,6 @@ class DialogNodeNextStep():
         self.dialog_node = dialog_node
         self.selector = selector
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeNextStep':
-        """Initialize a DialogNodeNextStep object from a json dictionary."""
-        args = {}
-        if 'behavior' in _dict:
-            args['behavior'] = _dict.get('behavior')
-        else:
-            raise ValueError(
-                'Required property \'behavior\' not present in DialogNodeNextStep JSON'
-            )
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        if 'selector' in _dict:
-            args['selector'] = _dict.get('selector')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeNextStep object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'behavior') and self.behavior is not None:
-            _dict['behavior'] = self.behavior
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        if hasattr(self, 'selector') and self.selector is not None:
-            _dict['selector'] = self.selector
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeNextStep object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeNextStep') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeNextStep') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class BehaviorEnum(str, Enum):
         """
         What happens after the dialog node completes. The valid values depend on the node
@@ -5399,7 +4565,7 @@ class DialogNodeNextStep():
         BODY = 'body'
 
 
-class DialogNodeOutput():
+class DialogNodeOutput(Model):
     """
     The output of the dialog node. For more information about how to specify dialog node
     output, see the
@@ -5414,6 +4580,14 @@ class DialogNodeOutput():
           specified output is handled.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('generic', 'list', 'DialogNodeOutputGeneric'),
+        ModelField('integrations'),
+        ModelField('modifiers', 'model', 'DialogNodeOutputModifiers'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['generic', 'integrations', 'modifiers'])
 
@@ -5441,50 +4615,6 @@ class DialogNodeOutput():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutput':
-        """Initialize a DialogNodeOutput object from a json dictionary."""
-        args = {}
-        if 'generic' in _dict:
-            args['generic'] = [
-                DialogNodeOutputGeneric.from_dict(x)
-                for x in _dict.get('generic')
-            ]
-        if 'integrations' in _dict:
-            args['integrations'] = _dict.get('integrations')
-        if 'modifiers' in _dict:
-            args['modifiers'] = DialogNodeOutputModifiers.from_dict(
-                _dict.get('modifiers'))
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'generic') and self.generic is not None:
-            _dict['generic'] = [x.to_dict() for x in self.generic]
-        if hasattr(self, 'integrations') and self.integrations is not None:
-            _dict['integrations'] = self.integrations
-        if hasattr(self, 'modifiers') and self.modifiers is not None:
-            _dict['modifiers'] = self.modifiers.to_dict()
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in DialogNodeOutput._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of DialogNodeOutput"""
         _dict = {}
@@ -5508,28 +4638,20 @@ class DialogNodeOutput():
             if _key not in DialogNodeOutput._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeOutput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'DialogNodeOutput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputConnectToAgentTransferInfo():
+class DialogNodeOutputConnectToAgentTransferInfo(Model):
     """
     Routing or other contextual information to be used by target service desk systems.
 
     :attr dict target: (optional)
     """
 
+    __slots__ = ('target',)
+
+    _fields = (
+        ModelField('target'),
+    )
+
     def __init__(self, *, target: dict = None) -> None:
         """
         Initialize a DialogNodeOutputConnectToAgentTransferInfo object.
@@ -5538,54 +4660,35 @@ class DialogNodeOutputConnectToAgentTransferInfo():
         """
         self.target = target
 
-    @classmethod
-    def from_dict(cls,
-                  _dict: Dict) -> 'DialogNodeOutputConnectToAgentTransferInfo':
-        """Initialize a DialogNodeOutputConnectToAgentTransferInfo object from a json dictionary."""
-        args = {}
-        if 'target' in _dict:
-            args['target'] = _dict.get('target')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputConnectToAgentTransferInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputConnectToAgentTransferInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self,
-               other: 'DialogNodeOutputConnectToAgentTransferInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'DialogNodeOutputConnectToAgentTransferInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputGeneric():
+class DialogNodeOutputGeneric(Model):
     """
     DialogNodeOutputGeneric.
 
     """
 
+    __slots__ = ()
+
+    _fields = ()
+
+    _discriminator = ModelDiscriminator(
+        'response_type', {
+            'channel_transfer':
+                'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer',
+            'connect_to_agent':
+                'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent',
+            'image': 'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage',
+            'option':
+                'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption',
+            'pause': 'DialogNodeOutputGenericDialogNodeOutputResponseTypePause',
+            'search_skill':
+                'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill',
+            'text': 'DialogNodeOutputGenericDialogNodeOutputResponseTypeText',
+            'user_defined':
+                'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined'
+        },
+        abstract=True)
+
     def __init__(self) -> None:
         """
         Initialize a DialogNodeOutputGeneric object.
@@ -5604,67 +4707,8 @@ class DialogNodeOutputGeneric():
             ]))
         raise Exception(msg)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputGeneric':
-        """Initialize a DialogNodeOutputGeneric object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        msg = (
-            "Cannot convert dictionary into an instance of base class 'DialogNodeOutputGeneric'. "
-            + "The discriminator value should map to a valid subclass: {1}"
-        ).format(", ".join([
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeText',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypePause',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer',
-            'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined'
-        ]))
-        raise Exception(msg)
 
-    @classmethod
-    def _from_dict(cls, _dict: Dict):
-        """Initialize a DialogNodeOutputGeneric object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping[
-            'channel_transfer'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer'
-        mapping[
-            'connect_to_agent'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent'
-        mapping[
-            'image'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage'
-        mapping[
-            'option'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption'
-        mapping[
-            'pause'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypePause'
-        mapping[
-            'search_skill'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill'
-        mapping[
-            'text'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeText'
-        mapping[
-            'user_defined'] = 'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined'
-        disc_value = _dict.get('response_type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'response_type\' not found in DialogNodeOutputGeneric JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class DialogNodeOutputModifiers():
+class DialogNodeOutputModifiers(Model):
     """
     Options that modify how specified output is handled.
 
@@ -5674,6 +4718,12 @@ class DialogNodeOutputModifiers():
           values.
     """
 
+    __slots__ = ('overwrite',)
+
+    _fields = (
+        ModelField('overwrite'),
+    )
+
     def __init__(self, *, overwrite: bool = None) -> None:
         """
         Initialize a DialogNodeOutputModifiers object.
@@ -5685,48 +4735,10 @@ class DialogNodeOutputModifiers():
         """
         self.overwrite = overwrite
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputModifiers':
-        """Initialize a DialogNodeOutputModifiers object from a json dictionary."""
-        args = {}
-        if 'overwrite' in _dict:
-            args['overwrite'] = _dict.get('overwrite')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputModifiers object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'overwrite') and self.overwrite is not None:
-            _dict['overwrite'] = self.overwrite
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputModifiers object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DialogNodeOutputModifiers') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeOutputModifiers') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputOptionsElement():
-    """
-    DialogNodeOutputOptionsElement.
+class DialogNodeOutputOptionsElement(Model):
+    """
+    DialogNodeOutputOptionsElement.
 
     :attr str label: The user-facing label for the option.
     :attr DialogNodeOutputOptionsElementValue value: An object defining the message
@@ -5734,6 +4746,14 @@ class DialogNodeOutputOptionsElement():
           corresponding option.
     """
 
+    __slots__ = ('label', 'value')
+
+    _fields = (
+        ModelField('label', required=True),
+        ModelField('value', 'model', 'DialogNodeOutputOptionsElementValue',
+                   required=True),
+    )
+
     def __init__(self, label: str,
                  value: 'DialogNodeOutputOptionsElementValue') -> None:
         """
@@ -5747,59 +4767,8 @@ class DialogNodeOutputOptionsElement():
         self.label = label
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputOptionsElement':
-        """Initialize a DialogNodeOutputOptionsElement object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        else:
-            raise ValueError(
-                'Required property \'label\' not present in DialogNodeOutputOptionsElement JSON'
-            )
-        if 'value' in _dict:
-            args['value'] = DialogNodeOutputOptionsElementValue.from_dict(
-                _dict.get('value'))
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in DialogNodeOutputOptionsElement JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputOptionsElement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputOptionsElement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeOutputOptionsElement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeOutputOptionsElement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputOptionsElementValue():
+class DialogNodeOutputOptionsElementValue(Model):
     """
     An object defining the message input to be sent to the Watson Assistant service if the
     user selects the corresponding option.
@@ -5816,6 +4785,14 @@ class DialogNodeOutputOptionsElementValue():
           applications that use the v1 **Get response to user input** method.
     """
 
+    __slots__ = ('input', 'intents', 'entities')
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+    )
+
     def __init__(self,
                  *,
                  input: 'MessageInput' = None,
@@ -5839,58 +4816,8 @@ class DialogNodeOutputOptionsElementValue():
         self.intents = intents
         self.entities = entities
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputOptionsElementValue':
-        """Initialize a DialogNodeOutputOptionsElementValue object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputOptionsElementValue object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputOptionsElementValue object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DialogNodeOutputOptionsElementValue') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeOutputOptionsElementValue') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputTextValuesElement():
+class DialogNodeOutputTextValuesElement(Model):
     """
     DialogNodeOutputTextValuesElement.
 
@@ -5899,6 +4826,12 @@ class DialogNodeOutputTextValuesElement():
           supported by the channel.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a DialogNodeOutputTextValuesElement object.
@@ -5909,46 +4842,8 @@ class DialogNodeOutputTextValuesElement():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputTextValuesElement':
-        """Initialize a DialogNodeOutputTextValuesElement object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputTextValuesElement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputTextValuesElement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeOutputTextValuesElement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'DialogNodeOutputTextValuesElement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeVisitedDetails():
+class DialogNodeVisitedDetails(Model):
     """
     DialogNodeVisitedDetails.
 
@@ -5958,6 +4853,14 @@ class DialogNodeVisitedDetails():
     :attr str conditions: (optional) The conditions that trigger the dialog node.
     """
 
+    __slots__ = ('dialog_node', 'title', 'conditions')
+
+    _fields = (
+        ModelField('dialog_node'),
+        ModelField('title'),
+        ModelField('conditions'),
+    )
+
     def __init__(self,
                  *,
                  dialog_node: str = None,
@@ -5976,54 +4879,8 @@ class DialogNodeVisitedDetails():
         self.title = title
         self.conditions = conditions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeVisitedDetails':
-        """Initialize a DialogNodeVisitedDetails object from a json dictionary."""
-        args = {}
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'conditions' in _dict:
-            args['conditions'] = _dict.get('conditions')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeVisitedDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'conditions') and self.conditions is not None:
-            _dict['conditions'] = self.conditions
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeVisitedDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeVisitedDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeVisitedDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class DialogSuggestion():
+class DialogSuggestion(Model):
     """
     DialogSuggestion.
 
@@ -6040,6 +4897,15 @@ class DialogSuggestion():
           value of the dialog node's **title** or **user_label** property.
     """
 
+    __slots__ = ('label', 'value', 'output', 'dialog_node')
+
+    _fields = (
+        ModelField('label', required=True),
+        ModelField('value', 'model', 'DialogSuggestionValue', required=True),
+        ModelField('output'),
+        ModelField('dialog_node'),
+    )
+
     def __init__(self,
                  label: str,
                  value: 'DialogSuggestionValue',
@@ -6066,66 +4932,8 @@ class DialogSuggestion():
         self.output = output
         self.dialog_node = dialog_node
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogSuggestion':
-        """Initialize a DialogSuggestion object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        else:
-            raise ValueError(
-                'Required property \'label\' not present in DialogSuggestion JSON'
-            )
-        if 'value' in _dict:
-            args['value'] = DialogSuggestionValue.from_dict(_dict.get('value'))
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in DialogSuggestion JSON'
-            )
-        if 'output' in _dict:
-            args['output'] = _dict.get('output')
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogSuggestion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value.to_dict()
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogSuggestion object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogSuggestion') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogSuggestion') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class DialogSuggestionValue():
+class DialogSuggestionValue(Model):
     """
     An object defining the message input, intents, and entities to be sent to the Watson
     Assistant service if the user selects the corresponding disambiguation option.
@@ -6138,6 +4946,14 @@ class DialogSuggestionValue():
           along with the user input.
     """
 
+    __slots__ = ('input', 'intents', 'entities')
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+    )
+
     def __init__(self,
                  *,
                  input: 'MessageInput' = None,
@@ -6157,58 +4973,8 @@ class DialogSuggestionValue():
         self.intents = intents
         self.entities = entities
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogSuggestionValue':
-        """Initialize a DialogSuggestionValue object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogSuggestionValue object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogSuggestionValue object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogSuggestionValue') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogSuggestionValue') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Entity():
+class Entity(Model):
     """
     Entity.
 
@@ -6229,6 +4995,19 @@ class Entity():
           values.
     """
 
+    __slots__ = ('entity', 'description', 'metadata', 'fuzzy_match', 'created',
+                 'updated', 'values')
+
+    _fields = (
+        ModelField('entity', required=True),
+        ModelField('description'),
+        ModelField('metadata'),
+        ModelField('fuzzy_match'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('values', 'list', 'Value'),
+    )
+
     def __init__(self,
                  entity: str,
                  *,
@@ -6264,73 +5043,8 @@ class Entity():
         self.updated = updated
         self.values = values
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Entity':
-        """Initialize a Entity object from a json dictionary."""
-        args = {}
-        if 'entity' in _dict:
-            args['entity'] = _dict.get('entity')
-        else:
-            raise ValueError(
-                'Required property \'entity\' not present in Entity JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'fuzzy_match' in _dict:
-            args['fuzzy_match'] = _dict.get('fuzzy_match')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'values' in _dict:
-            args['values'] = [Value.from_dict(x) for x in _dict.get('values')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Entity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entity') and self.entity is not None:
-            _dict['entity'] = self.entity
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'fuzzy_match') and self.fuzzy_match is not None:
-            _dict['fuzzy_match'] = self.fuzzy_match
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'values') and self.values is not None:
-            _dict['values'] = [x.to_dict() for x in self.values]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Entity object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Entity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Entity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EntityCollection():
+class EntityCollection(Model):
     """
     An array of objects describing the entities for the workspace.
 
@@ -6339,6 +5053,13 @@ class EntityCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('entities', 'pagination')
+
+    _fields = (
+        ModelField('entities', 'list', 'Entity', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, entities: List['Entity'],
                  pagination: 'Pagination') -> None:
         """
@@ -6351,60 +5072,8 @@ class EntityCollection():
         self.entities = entities
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntityCollection':
-        """Initialize a EntityCollection object from a json dictionary."""
-        args = {}
-        if 'entities' in _dict:
-            args['entities'] = [
-                Entity.from_dict(x) for x in _dict.get('entities')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'entities\' not present in EntityCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in EntityCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntityCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntityCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntityCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'EntityCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EntityMention():
+class EntityMention(Model):
     """
     An object describing a contextual entity mention.
 
@@ -6414,6 +5083,14 @@ class EntityMention():
           where the entity mentions begin and end in the input text.
     """
 
+    __slots__ = ('text', 'intent', 'location')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('intent', required=True),
+        ModelField('location', required=True),
+    )
+
     def __init__(self, text: str, intent: str, location: List[int]) -> None:
         """
         Initialize a EntityMention object.
@@ -6427,65 +5104,8 @@ class EntityMention():
         self.intent = intent
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntityMention':
-        """Initialize a EntityMention object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in EntityMention JSON')
-        if 'intent' in _dict:
-            args['intent'] = _dict.get('intent')
-        else:
-            raise ValueError(
-                'Required property \'intent\' not present in EntityMention JSON'
-            )
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        else:
-            raise ValueError(
-                'Required property \'location\' not present in EntityMention JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntityMention object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'intent') and self.intent is not None:
-            _dict['intent'] = self.intent
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntityMention object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntityMention') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EntityMention') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class EntityMentionCollection():
+class EntityMentionCollection(Model):
     """
     EntityMentionCollection.
 
@@ -6494,6 +5114,13 @@ class EntityMentionCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('examples', 'pagination')
+
+    _fields = (
+        ModelField('examples', 'list', 'EntityMention', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, examples: List['EntityMention'],
                  pagination: 'Pagination') -> None:
         """
@@ -6506,60 +5133,8 @@ class EntityMentionCollection():
         self.examples = examples
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntityMentionCollection':
-        """Initialize a EntityMentionCollection object from a json dictionary."""
-        args = {}
-        if 'examples' in _dict:
-            args['examples'] = [
-                EntityMention.from_dict(x) for x in _dict.get('examples')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'examples\' not present in EntityMentionCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in EntityMentionCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntityMentionCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntityMentionCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntityMentionCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EntityMentionCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Example():
+class Example(Model):
     """
     Example.
 
@@ -6573,6 +5148,15 @@ class Example():
           the object.
     """
 
+    __slots__ = ('text', 'mentions', 'created', 'updated')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('mentions', 'list', 'Mention'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  text: str,
                  *,
@@ -6594,63 +5178,8 @@ class Example():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Example':
-        """Initialize a Example object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in Example JSON')
-        if 'mentions' in _dict:
-            args['mentions'] = [
-                Mention.from_dict(x) for x in _dict.get('mentions')
-            ]
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Example object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'mentions') and self.mentions is not None:
-            _dict['mentions'] = [x.to_dict() for x in self.mentions]
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this Example object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Example') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Example') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ExampleCollection():
+class ExampleCollection(Model):
     """
     ExampleCollection.
 
@@ -6659,6 +5188,13 @@ class ExampleCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('examples', 'pagination')
+
+    _fields = (
+        ModelField('examples', 'list', 'Example', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, examples: List['Example'],
                  pagination: 'Pagination') -> None:
         """
@@ -6671,60 +5207,8 @@ class ExampleCollection():
         self.examples = examples
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ExampleCollection':
-        """Initialize a ExampleCollection object from a json dictionary."""
-        args = {}
-        if 'examples' in _dict:
-            args['examples'] = [
-                Example.from_dict(x) for x in _dict.get('examples')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'examples\' not present in ExampleCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in ExampleCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ExampleCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ExampleCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'ExampleCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ExampleCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Intent():
+class Intent(Model):
     """
     Intent.
 
@@ -6742,6 +5226,16 @@ class Intent():
           intent.
     """
 
+    __slots__ = ('intent', 'description', 'created', 'updated', 'examples')
+
+    _fields = (
+        ModelField('intent', required=True),
+        ModelField('description'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('examples', 'list', 'Example'),
+    )
+
     def __init__(self,
                  intent: str,
                  *,
@@ -6768,67 +5262,8 @@ class Intent():
         self.updated = updated
         self.examples = examples
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Intent':
-        """Initialize a Intent object from a json dictionary."""
-        args = {}
-        if 'intent' in _dict:
-            args['intent'] = _dict.get('intent')
-        else:
-            raise ValueError(
-                'Required property \'intent\' not present in Intent JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'examples' in _dict:
-            args['examples'] = [
-                Example.from_dict(x) for x in _dict.get('examples')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Intent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'intent') and self.intent is not None:
-            _dict['intent'] = self.intent
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Intent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Intent') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'Intent') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class IntentCollection():
+class IntentCollection(Model):
     """
     IntentCollection.
 
@@ -6837,6 +5272,13 @@ class IntentCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('intents', 'pagination')
+
+    _fields = (
+        ModelField('intents', 'list', 'Intent', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, intents: List['Intent'],
                  pagination: 'Pagination') -> None:
         """
@@ -6849,60 +5291,8 @@ class IntentCollection():
         self.intents = intents
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IntentCollection':
-        """Initialize a IntentCollection object from a json dictionary."""
-        args = {}
-        if 'intents' in _dict:
-            args['intents'] = [
-                Intent.from_dict(x) for x in _dict.get('intents')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'intents\' not present in IntentCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in IntentCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IntentCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IntentCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IntentCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'IntentCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class Log():
+class Log(Model):
     """
     Log.
 
@@ -6920,6 +5310,19 @@ class Log():
           made.
     """
 
+    __slots__ = ('request', 'response', 'log_id', 'request_timestamp',
+                 'response_timestamp', 'workspace_id', 'language')
+
+    _fields = (
+        ModelField('request', 'model', 'MessageRequest', required=True),
+        ModelField('response', 'model', 'MessageResponse', required=True),
+        ModelField('log_id', required=True),
+        ModelField('request_timestamp', required=True),
+        ModelField('response_timestamp', required=True),
+        ModelField('workspace_id', required=True),
+        ModelField('language', required=True),
+    )
+
     def __init__(self, request: 'MessageRequest', response: 'MessageResponse',
                  log_id: str, request_timestamp: str, response_timestamp: str,
                  workspace_id: str, language: str) -> None:
@@ -6947,96 +5350,8 @@ class Log():
         self.workspace_id = workspace_id
         self.language = language
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Log':
-        """Initialize a Log object from a json dictionary."""
-        args = {}
-        if 'request' in _dict:
-            args['request'] = MessageRequest.from_dict(_dict.get('request'))
-        else:
-            raise ValueError(
-                'Required property \'request\' not present in Log JSON')
-        if 'response' in _dict:
-            args['response'] = MessageResponse.from_dict(_dict.get('response'))
-        else:
-            raise ValueError(
-                'Required property \'response\' not present in Log JSON')
-        if 'log_id' in _dict:
-            args['log_id'] = _dict.get('log_id')
-        else:
-            raise ValueError(
-                'Required property \'log_id\' not present in Log JSON')
-        if 'request_timestamp' in _dict:
-            args['request_timestamp'] = _dict.get('request_timestamp')
-        else:
-            raise ValueError(
-                'Required property \'request_timestamp\' not present in Log JSON'
-            )
-        if 'response_timestamp' in _dict:
-            args['response_timestamp'] = _dict.get('response_timestamp')
-        else:
-            raise ValueError(
-                'Required property \'response_timestamp\' not present in Log JSON'
-            )
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        else:
-            raise ValueError(
-                'Required property \'workspace_id\' not present in Log JSON')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in Log JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Log object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'request') and self.request is not None:
-            _dict['request'] = self.request.to_dict()
-        if hasattr(self, 'response') and self.response is not None:
-            _dict['response'] = self.response.to_dict()
-        if hasattr(self, 'log_id') and self.log_id is not None:
-            _dict['log_id'] = self.log_id
-        if hasattr(self,
-                   'request_timestamp') and self.request_timestamp is not None:
-            _dict['request_timestamp'] = self.request_timestamp
-        if hasattr(
-                self,
-                'response_timestamp') and self.response_timestamp is not None:
-            _dict['response_timestamp'] = self.response_timestamp
-        if hasattr(self, 'workspace_id') and self.workspace_id is not None:
-            _dict['workspace_id'] = self.workspace_id
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Log object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Log') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Log') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class LogCollection():
+class LogCollection(Model):
     """
     LogCollection.
 
@@ -7044,6 +5359,13 @@ class LogCollection():
     :attr LogPagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('logs', 'pagination')
+
+    _fields = (
+        ModelField('logs', 'list', 'Log', required=True),
+        ModelField('pagination', 'model', 'LogPagination', required=True),
+    )
+
     def __init__(self, logs: List['Log'], pagination: 'LogPagination') -> None:
         """
         Initialize a LogCollection object.
@@ -7055,58 +5377,8 @@ class LogCollection():
         self.logs = logs
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogCollection':
-        """Initialize a LogCollection object from a json dictionary."""
-        args = {}
-        if 'logs' in _dict:
-            args['logs'] = [Log.from_dict(x) for x in _dict.get('logs')]
-        else:
-            raise ValueError(
-                'Required property \'logs\' not present in LogCollection JSON')
-        if 'pagination' in _dict:
-            args['pagination'] = LogPagination.from_dict(
-                _dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in LogCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'logs') and self.logs is not None:
-            _dict['logs'] = [x.to_dict() for x in self.logs]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this LogCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class LogMessage():
+class LogMessage(Model):
     """
     Log message details.
 
@@ -7118,6 +5390,15 @@ class LogMessage():
           element that generated the error message.
     """
 
+    __slots__ = ('level', 'msg', 'code', 'source')
+
+    _fields = (
+        ModelField('level', required=True),
+        ModelField('msg', required=True),
+        ModelField('code', required=True),
+        ModelField('source', 'model', 'LogMessageSource'),
+    )
+
     def __init__(self,
                  level: str,
                  msg: str,
@@ -7139,65 +5420,6 @@ class LogMessage():
         self.code = code
         self.source = source
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessage':
-        """Initialize a LogMessage object from a json dictionary."""
-        args = {}
-        if 'level' in _dict:
-            args['level'] = _dict.get('level')
-        else:
-            raise ValueError(
-                'Required property \'level\' not present in LogMessage JSON')
-        if 'msg' in _dict:
-            args['msg'] = _dict.get('msg')
-        else:
-            raise ValueError(
-                'Required property \'msg\' not present in LogMessage JSON')
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in LogMessage JSON')
-        if 'source' in _dict:
-            args['source'] = LogMessageSource.from_dict(_dict.get('source'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'level') and self.level is not None:
-            _dict['level'] = self.level
-        if hasattr(self, 'msg') and self.msg is not None:
-            _dict['msg'] = self.msg
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LevelEnum(str, Enum):
         """
         The severity of the log message.
@@ -7207,7 +5429,7 @@ class LogMessage():
         WARN = 'warn'
 
 
-class LogMessageSource():
+class LogMessageSource(Model):
     """
     An object that identifies the dialog element that generated the error message.
 
@@ -7217,6 +5439,13 @@ class LogMessageSource():
           generated the error message.
     """
 
+    __slots__ = ('type', 'dialog_node')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('dialog_node'),
+    )
+
     def __init__(self, *, type: str = None, dialog_node: str = None) -> None:
         """
         Initialize a LogMessageSource object.
@@ -7229,48 +5458,6 @@ class LogMessageSource():
         self.type = type
         self.dialog_node = dialog_node
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSource':
-        """Initialize a LogMessageSource object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessageSource object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessageSource object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessageSource') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessageSource') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         A string that indicates the type of dialog element that generated the error
@@ -7279,7 +5466,7 @@ class LogMessageSource():
         DIALOG_NODE = 'dialog_node'
 
 
-class LogPagination():
+class LogPagination(Model):
     """
     The pagination data for the returned objects.
 
@@ -7289,6 +5476,14 @@ class LogPagination():
     :attr str next_cursor: (optional) A token identifying the next page of results.
     """
 
+    __slots__ = ('next_url', 'matched', 'next_cursor')
+
+    _fields = (
+        ModelField('next_url'),
+        ModelField('matched'),
+        ModelField('next_cursor'),
+    )
+
     def __init__(self,
                  *,
                  next_url: str = None,
@@ -7307,54 +5502,8 @@ class LogPagination():
         self.matched = matched
         self.next_cursor = next_cursor
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogPagination':
-        """Initialize a LogPagination object from a json dictionary."""
-        args = {}
-        if 'next_url' in _dict:
-            args['next_url'] = _dict.get('next_url')
-        if 'matched' in _dict:
-            args['matched'] = _dict.get('matched')
-        if 'next_cursor' in _dict:
-            args['next_cursor'] = _dict.get('next_cursor')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogPagination object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'next_url') and self.next_url is not None:
-            _dict['next_url'] = self.next_url
-        if hasattr(self, 'matched') and self.matched is not None:
-            _dict['matched'] = self.matched
-        if hasattr(self, 'next_cursor') and self.next_cursor is not None:
-            _dict['next_cursor'] = self.next_cursor
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogPagination object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogPagination') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'LogPagination') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Mention():
+class Mention(Model):
     """
     A mention of a contextual entity.
 
@@ -7363,6 +5512,13 @@ class Mention():
           where the entity mentions begin and end in the input text.
     """
 
+    __slots__ = ('entity', 'location')
+
+    _fields = (
+        ModelField('entity', required=True),
+        ModelField('location', required=True),
+    )
+
     def __init__(self, entity: str, location: List[int]) -> None:
         """
         Initialize a Mention object.
@@ -7374,56 +5530,8 @@ class Mention():
         self.entity = entity
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Mention':
-        """Initialize a Mention object from a json dictionary."""
-        args = {}
-        if 'entity' in _dict:
-            args['entity'] = _dict.get('entity')
-        else:
-            raise ValueError(
-                'Required property \'entity\' not present in Mention JSON')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        else:
-            raise ValueError(
-                'Required property \'location\' not present in Mention JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Mention object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entity') and self.entity is not None:
-            _dict['entity'] = self.entity
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Mention object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Mention') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Mention') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MessageContextMetadata():
+class MessageContextMetadata(Model):
     """
     Metadata related to the message.
 
@@ -7442,6 +5550,13 @@ class MessageContextMetadata():
           request, the value specified at the root is used.
     """
 
+    __slots__ = ('deployment', 'user_id')
+
+    _fields = (
+        ModelField('deployment'),
+        ModelField('user_id'),
+    )
+
     def __init__(self, *, deployment: str = None, user_id: str = None) -> None:
         """
         Initialize a MessageContextMetadata object.
@@ -7463,50 +5578,8 @@ class MessageContextMetadata():
         self.deployment = deployment
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextMetadata':
-        """Initialize a MessageContextMetadata object from a json dictionary."""
-        args = {}
-        if 'deployment' in _dict:
-            args['deployment'] = _dict.get('deployment')
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'deployment') and self.deployment is not None:
-            _dict['deployment'] = self.deployment
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class MessageInput():
+class MessageInput(Model):
     """
     An input object that includes the input text.
 
@@ -7530,6 +5603,16 @@ class MessageInput():
           is returned only if autocorrection is enabled and the user input was corrected.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('text'),
+        ModelField('spelling_suggestions'),
+        ModelField('spelling_auto_correct'),
+        ModelField('suggested_text'),
+        ModelField('original_text'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset([
         'text', 'spelling_suggestions', 'spelling_auto_correct',
@@ -7570,58 +5653,6 @@ class MessageInput():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInput':
-        """Initialize a MessageInput object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'spelling_suggestions' in _dict:
-            args['spelling_suggestions'] = _dict.get('spelling_suggestions')
-        if 'spelling_auto_correct' in _dict:
-            args['spelling_auto_correct'] = _dict.get('spelling_auto_correct')
-        if 'suggested_text' in _dict:
-            args['suggested_text'] = _dict.get('suggested_text')
-        if 'original_text' in _dict:
-            args['original_text'] = _dict.get('original_text')
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'spelling_suggestions'
-                  ) and self.spelling_suggestions is not None:
-            _dict['spelling_suggestions'] = self.spelling_suggestions
-        if hasattr(self, 'spelling_auto_correct'
-                  ) and self.spelling_auto_correct is not None:
-            _dict['spelling_auto_correct'] = self.spelling_auto_correct
-        if hasattr(self, 'suggested_text') and getattr(
-                self, 'suggested_text') is not None:
-            _dict['suggested_text'] = getattr(self, 'suggested_text')
-        if hasattr(self, 'original_text') and getattr(
-                self, 'original_text') is not None:
-            _dict['original_text'] = getattr(self, 'original_text')
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in MessageInput._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of MessageInput"""
         _dict = {}
@@ -7645,22 +5676,8 @@ class MessageInput():
             if _key not in MessageInput._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInput object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MessageInput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageRequest():
+class MessageRequest(Model):
     """
     A request sent to the workspace, including the user input and context.
 
@@ -7692,6 +5709,20 @@ class MessageRequest():
           the value specified at the root is used.
     """
 
+    __slots__ = ('input', 'intents', 'entities', 'alternate_intents', 'context',
+                 'output', 'actions', 'user_id')
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('alternate_intents'),
+        ModelField('context', 'model', 'Context'),
+        ModelField('output', 'model', 'OutputData'),
+        ModelField('actions', 'list', 'DialogNodeAction'),
+        ModelField('user_id'),
+    )
+
     def __init__(self,
                  *,
                  input: 'MessageInput' = None,
@@ -7742,81 +5773,8 @@ class MessageRequest():
         self.actions = actions
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageRequest':
-        """Initialize a MessageRequest object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'alternate_intents' in _dict:
-            args['alternate_intents'] = _dict.get('alternate_intents')
-        if 'context' in _dict:
-            args['context'] = Context.from_dict(_dict.get('context'))
-        if 'output' in _dict:
-            args['output'] = OutputData.from_dict(_dict.get('output'))
-        if 'actions' in _dict:
-            args['actions'] = [
-                DialogNodeAction.from_dict(x) for x in _dict.get('actions')
-            ]
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageRequest object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self,
-                   'alternate_intents') and self.alternate_intents is not None:
-            _dict['alternate_intents'] = self.alternate_intents
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output.to_dict()
-        if hasattr(self, 'actions') and getattr(self, 'actions') is not None:
-            _dict['actions'] = [x.to_dict() for x in getattr(self, 'actions')]
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageRequest object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageRequest') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'MessageRequest') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageResponse():
+class MessageResponse(Model):
     """
     The response sent by the workspace, including the output text, detected intents and
     entities, and context.
@@ -7846,6 +5804,20 @@ class MessageResponse():
           the value specified at the root is used.
     """
 
+    __slots__ = ('input', 'intents', 'entities', 'alternate_intents', 'context',
+                 'output', 'actions', 'user_id')
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput', required=True),
+        ModelField('intents', 'list', 'RuntimeIntent', required=True),
+        ModelField('entities', 'list', 'RuntimeEntity', required=True),
+        ModelField('alternate_intents'),
+        ModelField('context', 'model', 'Context', required=True),
+        ModelField('output', 'model', 'OutputData', required=True),
+        ModelField('actions', 'list', 'DialogNodeAction'),
+        ModelField('user_id', required=True),
+    )
+
     def __init__(self,
                  input: 'MessageInput',
                  intents: List['RuntimeIntent'],
@@ -7890,105 +5862,8 @@ class MessageResponse():
         self.actions = actions
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageResponse':
-        """Initialize a MessageResponse object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        else:
-            raise ValueError(
-                'Required property \'input\' not present in MessageResponse JSON'
-            )
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'intents\' not present in MessageResponse JSON'
-            )
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'entities\' not present in MessageResponse JSON'
-            )
-        if 'alternate_intents' in _dict:
-            args['alternate_intents'] = _dict.get('alternate_intents')
-        if 'context' in _dict:
-            args['context'] = Context.from_dict(_dict.get('context'))
-        else:
-            raise ValueError(
-                'Required property \'context\' not present in MessageResponse JSON'
-            )
-        if 'output' in _dict:
-            args['output'] = OutputData.from_dict(_dict.get('output'))
-        else:
-            raise ValueError(
-                'Required property \'output\' not present in MessageResponse JSON'
-            )
-        if 'actions' in _dict:
-            args['actions'] = [
-                DialogNodeAction.from_dict(x) for x in _dict.get('actions')
-            ]
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        else:
-            raise ValueError(
-                'Required property \'user_id\' not present in MessageResponse JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self,
-                   'alternate_intents') and self.alternate_intents is not None:
-            _dict['alternate_intents'] = self.alternate_intents
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output.to_dict()
-        if hasattr(self, 'actions') and getattr(self, 'actions') is not None:
-            _dict['actions'] = [x.to_dict() for x in getattr(self, 'actions')]
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class OutputData():
+class OutputData(Model):
     """
     An output object that includes the response to the user, the dialog nodes that were
     triggered, and messages from the log.
@@ -8009,6 +5884,16 @@ class OutputData():
           supported response types.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('nodes_visited'),
+        ModelField('nodes_visited_details', 'list', 'DialogNodeVisitedDetails'),
+        ModelField('log_messages', 'list', 'LogMessage', required=True),
+        ModelField('text', required=True),
+        ModelField('generic', 'list', 'RuntimeResponseGeneric'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset([
         'nodes_visited', 'nodes_visited_details', 'log_messages', 'text',
@@ -8050,71 +5935,6 @@ class OutputData():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'OutputData':
-        """Initialize a OutputData object from a json dictionary."""
-        args = {}
-        if 'nodes_visited' in _dict:
-            args['nodes_visited'] = _dict.get('nodes_visited')
-        if 'nodes_visited_details' in _dict:
-            args['nodes_visited_details'] = [
-                DialogNodeVisitedDetails.from_dict(x)
-                for x in _dict.get('nodes_visited_details')
-            ]
-        if 'log_messages' in _dict:
-            args['log_messages'] = [
-                LogMessage.from_dict(x) for x in _dict.get('log_messages')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'log_messages\' not present in OutputData JSON'
-            )
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in OutputData JSON')
-        if 'generic' in _dict:
-            args['generic'] = [
-                RuntimeResponseGeneric.from_dict(x)
-                for x in _dict.get('generic')
-            ]
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a OutputData object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'nodes_visited') and self.nodes_visited is not None:
-            _dict['nodes_visited'] = self.nodes_visited
-        if hasattr(self, 'nodes_visited_details'
-                  ) and self.nodes_visited_details is not None:
-            _dict['nodes_visited_details'] = [
-                x.to_dict() for x in self.nodes_visited_details
-            ]
-        if hasattr(self, 'log_messages') and self.log_messages is not None:
-            _dict['log_messages'] = [x.to_dict() for x in self.log_messages]
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'generic') and self.generic is not None:
-            _dict['generic'] = [x.to_dict() for x in self.generic]
-        for _key in [
-                k for k in vars(self).keys() if k not in OutputData._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of OutputData"""
         _dict = {}
@@ -8136,22 +5956,8 @@ class OutputData():
             if _key not in OutputData._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this OutputData object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'OutputData') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'OutputData') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Pagination():
+class Pagination(Model):
     """
     The pagination data for the returned objects.
 
@@ -8167,6 +5973,18 @@ class Pagination():
     :attr str next_cursor: (optional) A token identifying the next page of results.
     """
 
+    __slots__ = ('refresh_url', 'next_url', 'total', 'matched',
+                 'refresh_cursor', 'next_cursor')
+
+    _fields = (
+        ModelField('refresh_url', required=True),
+        ModelField('next_url'),
+        ModelField('total'),
+        ModelField('matched'),
+        ModelField('refresh_cursor'),
+        ModelField('next_cursor'),
+    )
+
     def __init__(self,
                  refresh_url: str,
                  *,
@@ -8197,76 +6015,20 @@ class Pagination():
         self.refresh_cursor = refresh_cursor
         self.next_cursor = next_cursor
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Pagination':
-        """Initialize a Pagination object from a json dictionary."""
-        args = {}
-        if 'refresh_url' in _dict:
-            args['refresh_url'] = _dict.get('refresh_url')
-        else:
-            raise ValueError(
-                'Required property \'refresh_url\' not present in Pagination JSON'
-            )
-        if 'next_url' in _dict:
-            args['next_url'] = _dict.get('next_url')
-        if 'total' in _dict:
-            args['total'] = _dict.get('total')
-        if 'matched' in _dict:
-            args['matched'] = _dict.get('matched')
-        if 'refresh_cursor' in _dict:
-            args['refresh_cursor'] = _dict.get('refresh_cursor')
-        if 'next_cursor' in _dict:
-            args['next_cursor'] = _dict.get('next_cursor')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Pagination object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'refresh_url') and self.refresh_url is not None:
-            _dict['refresh_url'] = self.refresh_url
-        if hasattr(self, 'next_url') and self.next_url is not None:
-            _dict['next_url'] = self.next_url
-        if hasattr(self, 'total') and self.total is not None:
-            _dict['total'] = self.total
-        if hasattr(self, 'matched') and self.matched is not None:
-            _dict['matched'] = self.matched
-        if hasattr(self, 'refresh_cursor') and self.refresh_cursor is not None:
-            _dict['refresh_cursor'] = self.refresh_cursor
-        if hasattr(self, 'next_cursor') and self.next_cursor is not None:
-            _dict['next_cursor'] = self.next_cursor
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Pagination object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Pagination') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'Pagination') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ResponseGenericChannel():
+class ResponseGenericChannel(Model):
     """
     ResponseGenericChannel.
 
     :attr str channel: (optional) A channel for which the response is intended.
     """
 
+    __slots__ = ('channel',)
+
+    _fields = (
+        ModelField('channel'),
+    )
+
     def __init__(self, *, channel: str = None) -> None:
         """
         Initialize a ResponseGenericChannel object.
@@ -8276,44 +6038,6 @@ class ResponseGenericChannel():
         """
         self.channel = channel
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ResponseGenericChannel':
-        """Initialize a ResponseGenericChannel object from a json dictionary."""
-        args = {}
-        if 'channel' in _dict:
-            args['channel'] = _dict.get('channel')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ResponseGenericChannel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'channel') and self.channel is not None:
-            _dict['channel'] = self.channel
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ResponseGenericChannel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ResponseGenericChannel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ResponseGenericChannel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ChannelEnum(str, Enum):
         """
         A channel for which the response is intended.
@@ -8327,7 +6051,7 @@ class ResponseGenericChannel():
         WHATSAPP = 'whatsapp'
 
 
-class RuntimeEntity():
+class RuntimeEntity(Model):
     """
     A term from the request that was identified as an entity.
 
@@ -8359,6 +6083,21 @@ class RuntimeEntity():
           enabled for the workspace.
     """
 
+    __slots__ = ('entity', 'location', 'value', 'confidence', 'metadata',
+                 'groups', 'interpretation', 'alternatives', 'role')
+
+    _fields = (
+        ModelField('entity', required=True),
+        ModelField('location'),
+        ModelField('value', required=True),
+        ModelField('confidence'),
+        ModelField('metadata'),
+        ModelField('groups', 'list', 'CaptureGroup'),
+        ModelField('interpretation', 'model', 'RuntimeEntityInterpretation'),
+        ModelField('alternatives', 'list', 'RuntimeEntityAlternative'),
+        ModelField('role', 'model', 'RuntimeEntityRole'),
+    )
+
     def __init__(self,
                  entity: str,
                  value: str,
@@ -8414,91 +6153,8 @@ class RuntimeEntity():
         self.alternatives = alternatives
         self.role = role
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntity':
-        """Initialize a RuntimeEntity object from a json dictionary."""
-        args = {}
-        if 'entity' in _dict:
-            args['entity'] = _dict.get('entity')
-        else:
-            raise ValueError(
-                'Required property \'entity\' not present in RuntimeEntity JSON'
-            )
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in RuntimeEntity JSON')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'groups' in _dict:
-            args['groups'] = [
-                CaptureGroup.from_dict(x) for x in _dict.get('groups')
-            ]
-        if 'interpretation' in _dict:
-            args['interpretation'] = RuntimeEntityInterpretation.from_dict(
-                _dict.get('interpretation'))
-        if 'alternatives' in _dict:
-            args['alternatives'] = [
-                RuntimeEntityAlternative.from_dict(x)
-                for x in _dict.get('alternatives')
-            ]
-        if 'role' in _dict:
-            args['role'] = RuntimeEntityRole.from_dict(_dict.get('role'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entity') and self.entity is not None:
-            _dict['entity'] = self.entity
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'groups') and self.groups is not None:
-            _dict['groups'] = [x.to_dict() for x in self.groups]
-        if hasattr(self, 'interpretation') and self.interpretation is not None:
-            _dict['interpretation'] = self.interpretation.to_dict()
-        if hasattr(self, 'alternatives') and self.alternatives is not None:
-            _dict['alternatives'] = [x.to_dict() for x in self.alternatives]
-        if hasattr(self, 'role') and self.role is not None:
-            _dict['role'] = self.role.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntity object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class RuntimeEntityAlternative():
+class RuntimeEntityAlternative(Model):
     """
     An alternative value for the recognized entity.
 
@@ -8508,6 +6164,13 @@ class RuntimeEntityAlternative():
           confidence in the recognized entity.
     """
 
+    __slots__ = ('value', 'confidence')
+
+    _fields = (
+        ModelField('value'),
+        ModelField('confidence'),
+    )
+
     def __init__(self, *, value: str = None, confidence: float = None) -> None:
         """
         Initialize a RuntimeEntityAlternative object.
@@ -8520,50 +6183,8 @@ class RuntimeEntityAlternative():
         self.value = value
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityAlternative':
-        """Initialize a RuntimeEntityAlternative object from a json dictionary."""
-        args = {}
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityAlternative object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityAlternative object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityAlternative') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityAlternative') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RuntimeEntityInterpretation():
+class RuntimeEntityInterpretation(Model):
     """
     RuntimeEntityInterpretation.
 
@@ -8637,6 +6258,44 @@ class RuntimeEntityInterpretation():
           time value (for example, `EST`).
     """
 
+    __slots__ = ('calendar_type', 'datetime_link', 'festival', 'granularity',
+                 'range_link', 'range_modifier', 'relative_day',
+                 'relative_month', 'relative_week', 'relative_weekend',
+                 'relative_year', 'specific_day', 'specific_day_of_week',
+                 'specific_month', 'specific_quarter', 'specific_year',
+                 'numeric_value', 'subtype', 'part_of_day', 'relative_hour',
+                 'relative_minute', 'relative_second', 'specific_hour',
+                 'specific_minute', 'specific_second', 'timezone')
+
+    _fields = (
+        ModelField('calendar_type'),
+        ModelField('datetime_link'),
+        ModelField('festival'),
+        ModelField('granularity'),
+        ModelField('range_link'),
+        ModelField('range_modifier'),
+        ModelField('relative_day'),
+        ModelField('relative_month'),
+        ModelField('relative_week'),
+        ModelField('relative_weekend'),
+        ModelField('relative_year'),
+        ModelField('specific_day'),
+        ModelField('specific_day_of_week'),
+        ModelField('specific_month'),
+        ModelField('specific_quarter'),
+        ModelField('specific_year'),
+        ModelField('numeric_value'),
+        ModelField('subtype'),
+        ModelField('part_of_day'),
+        ModelField('relative_hour'),
+        ModelField('relative_minute'),
+        ModelField('relative_second'),
+        ModelField('specific_hour'),
+        ModelField('specific_minute'),
+        ModelField('specific_second'),
+        ModelField('timezone'),
+    )
+
     def __init__(self,
                  *,
                  calendar_type: str = None,
@@ -8769,151 +6428,6 @@ class RuntimeEntityInterpretation():
         self.specific_second = specific_second
         self.timezone = timezone
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityInterpretation':
-        """Initialize a RuntimeEntityInterpretation object from a json dictionary."""
-        args = {}
-        if 'calendar_type' in _dict:
-            args['calendar_type'] = _dict.get('calendar_type')
-        if 'datetime_link' in _dict:
-            args['datetime_link'] = _dict.get('datetime_link')
-        if 'festival' in _dict:
-            args['festival'] = _dict.get('festival')
-        if 'granularity' in _dict:
-            args['granularity'] = _dict.get('granularity')
-        if 'range_link' in _dict:
-            args['range_link'] = _dict.get('range_link')
-        if 'range_modifier' in _dict:
-            args['range_modifier'] = _dict.get('range_modifier')
-        if 'relative_day' in _dict:
-            args['relative_day'] = _dict.get('relative_day')
-        if 'relative_month' in _dict:
-            args['relative_month'] = _dict.get('relative_month')
-        if 'relative_week' in _dict:
-            args['relative_week'] = _dict.get('relative_week')
-        if 'relative_weekend' in _dict:
-            args['relative_weekend'] = _dict.get('relative_weekend')
-        if 'relative_year' in _dict:
-            args['relative_year'] = _dict.get('relative_year')
-        if 'specific_day' in _dict:
-            args['specific_day'] = _dict.get('specific_day')
-        if 'specific_day_of_week' in _dict:
-            args['specific_day_of_week'] = _dict.get('specific_day_of_week')
-        if 'specific_month' in _dict:
-            args['specific_month'] = _dict.get('specific_month')
-        if 'specific_quarter' in _dict:
-            args['specific_quarter'] = _dict.get('specific_quarter')
-        if 'specific_year' in _dict:
-            args['specific_year'] = _dict.get('specific_year')
-        if 'numeric_value' in _dict:
-            args['numeric_value'] = _dict.get('numeric_value')
-        if 'subtype' in _dict:
-            args['subtype'] = _dict.get('subtype')
-        if 'part_of_day' in _dict:
-            args['part_of_day'] = _dict.get('part_of_day')
-        if 'relative_hour' in _dict:
-            args['relative_hour'] = _dict.get('relative_hour')
-        if 'relative_minute' in _dict:
-            args['relative_minute'] = _dict.get('relative_minute')
-        if 'relative_second' in _dict:
-            args['relative_second'] = _dict.get('relative_second')
-        if 'specific_hour' in _dict:
-            args['specific_hour'] = _dict.get('specific_hour')
-        if 'specific_minute' in _dict:
-            args['specific_minute'] = _dict.get('specific_minute')
-        if 'specific_second' in _dict:
-            args['specific_second'] = _dict.get('specific_second')
-        if 'timezone' in _dict:
-            args['timezone'] = _dict.get('timezone')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityInterpretation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'calendar_type') and self.calendar_type is not None:
-            _dict['calendar_type'] = self.calendar_type
-        if hasattr(self, 'datetime_link') and self.datetime_link is not None:
-            _dict['datetime_link'] = self.datetime_link
-        if hasattr(self, 'festival') and self.festival is not None:
-            _dict['festival'] = self.festival
-        if hasattr(self, 'granularity') and self.granularity is not None:
-            _dict['granularity'] = self.granularity
-        if hasattr(self, 'range_link') and self.range_link is not None:
-            _dict['range_link'] = self.range_link
-        if hasattr(self, 'range_modifier') and self.range_modifier is not None:
-            _dict['range_modifier'] = self.range_modifier
-        if hasattr(self, 'relative_day') and self.relative_day is not None:
-            _dict['relative_day'] = self.relative_day
-        if hasattr(self, 'relative_month') and self.relative_month is not None:
-            _dict['relative_month'] = self.relative_month
-        if hasattr(self, 'relative_week') and self.relative_week is not None:
-            _dict['relative_week'] = self.relative_week
-        if hasattr(self,
-                   'relative_weekend') and self.relative_weekend is not None:
-            _dict['relative_weekend'] = self.relative_weekend
-        if hasattr(self, 'relative_year') and self.relative_year is not None:
-            _dict['relative_year'] = self.relative_year
-        if hasattr(self, 'specific_day') and self.specific_day is not None:
-            _dict['specific_day'] = self.specific_day
-        if hasattr(self, 'specific_day_of_week'
-                  ) and self.specific_day_of_week is not None:
-            _dict['specific_day_of_week'] = self.specific_day_of_week
-        if hasattr(self, 'specific_month') and self.specific_month is not None:
-            _dict['specific_month'] = self.specific_month
-        if hasattr(self,
-                   'specific_quarter') and self.specific_quarter is not None:
-            _dict['specific_quarter'] = self.specific_quarter
-        if hasattr(self, 'specific_year') and self.specific_year is not None:
-            _dict['specific_year'] = self.specific_year
-        if hasattr(self, 'numeric_value') and self.numeric_value is not None:
-            _dict['numeric_value'] = self.numeric_value
-        if hasattr(self, 'subtype') and self.subtype is not None:
-            _dict['subtype'] = self.subtype
-        if hasattr(self, 'part_of_day') and self.part_of_day is not None:
-            _dict['part_of_day'] = self.part_of_day
-        if hasattr(self, 'relative_hour') and self.relative_hour is not None:
-            _dict['relative_hour'] = self.relative_hour
-        if hasattr(self,
-                   'relative_minute') and self.relative_minute is not None:
-            _dict['relative_minute'] = self.relative_minute
-        if hasattr(self,
-                   'relative_second') and self.relative_second is not None:
-            _dict['relative_second'] = self.relative_second
-        if hasattr(self, 'specific_hour') and self.specific_hour is not None:
-            _dict['specific_hour'] = self.specific_hour
-        if hasattr(self,
-                   'specific_minute') and self.specific_minute is not None:
-            _dict['specific_minute'] = self.specific_minute
-        if hasattr(self,
-                   'specific_second') and self.specific_second is not None:
-            _dict['specific_second'] = self.specific_second
-        if hasattr(self, 'timezone') and self.timezone is not None:
-            _dict['timezone'] = self.timezone
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityInterpretation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityInterpretation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityInterpretation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class GranularityEnum(str, Enum):
         """
         The precision or duration of a time range specified by a recognized `@sys-time` or
@@ -8932,7 +6446,7 @@ class RuntimeEntityInterpretation():
         YEAR = 'year'
 
 
-class RuntimeEntityRole():
+class RuntimeEntityRole(Model):
     """
     An object describing the role played by a system entity that is specifies the
     beginning or end of a range recognized in the user input. This property is included
@@ -8941,6 +6455,12 @@ class RuntimeEntityRole():
     :attr str type: (optional) The relationship of the entity to the range.
     """
 
+    __slots__ = ('type',)
+
+    _fields = (
+        ModelField('type'),
+    )
+
     def __init__(self, *, type: str = None) -> None:
         """
         Initialize a RuntimeEntityRole object.
@@ -8949,44 +6469,6 @@ class RuntimeEntityRole():
         """
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityRole':
-        """Initialize a RuntimeEntityRole object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityRole object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityRole object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityRole') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityRole') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The relationship of the entity to the range.
@@ -8999,7 +6481,7 @@ class RuntimeEntityRole():
         TIME_TO = 'time_to'
 
 
-class RuntimeIntent():
+class RuntimeIntent(Model):
     """
     An intent identified in the user input.
 
@@ -9008,6 +6490,13 @@ class RuntimeIntent():
           in the intent.
     """
 
+    __slots__ = ('intent', 'confidence')
+
+    _fields = (
+        ModelField('intent', required=True),
+        ModelField('confidence', required=True),
+    )
+
     def __init__(self, intent: str, confidence: float) -> None:
         """
         Initialize a RuntimeIntent object.
@@ -9019,63 +6508,33 @@ class RuntimeIntent():
         self.intent = intent
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeIntent':
-        """Initialize a RuntimeIntent object from a json dictionary."""
-        args = {}
-        if 'intent' in _dict:
-            args['intent'] = _dict.get('intent')
-        else:
-            raise ValueError(
-                'Required property \'intent\' not present in RuntimeIntent JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in RuntimeIntent JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeIntent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'intent') and self.intent is not None:
-            _dict['intent'] = self.intent
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeIntent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeIntent') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeIntent') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class RuntimeResponseGeneric():
+class RuntimeResponseGeneric(Model):
     """
     RuntimeResponseGeneric.
 
     """
 
+    __slots__ = ()
+
+    _fields = ()
+
+    _discriminator = ModelDiscriminator(
+        'response_type', {
+            'channel_transfer':
+                'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer',
+            'connect_to_agent':
+                'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent',
+            'image': 'RuntimeResponseGenericRuntimeResponseTypeImage',
+            'option': 'RuntimeResponseGenericRuntimeResponseTypeOption',
+            'suggestion': 'RuntimeResponseGenericRuntimeResponseTypeSuggestion',
+            'pause': 'RuntimeResponseGenericRuntimeResponseTypePause',
+            'text': 'RuntimeResponseGenericRuntimeResponseTypeText',
+            'user_defined':
+                'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
+        },
+        abstract=True)
+
     def __init__(self) -> None:
         """
         Initialize a RuntimeResponseGeneric object.
@@ -9094,63 +6553,8 @@ class RuntimeResponseGeneric():
             ]))
         raise Exception(msg)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeResponseGeneric':
-        """Initialize a RuntimeResponseGeneric object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        msg = (
-            "Cannot convert dictionary into an instance of base class 'RuntimeResponseGeneric'. "
-            + "The discriminator value should map to a valid subclass: {1}"
-        ).format(", ".join([
-            'RuntimeResponseGenericRuntimeResponseTypeText',
-            'RuntimeResponseGenericRuntimeResponseTypePause',
-            'RuntimeResponseGenericRuntimeResponseTypeImage',
-            'RuntimeResponseGenericRuntimeResponseTypeOption',
-            'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent',
-            'RuntimeResponseGenericRuntimeResponseTypeSuggestion',
-            'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer',
-            'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-        ]))
-        raise Exception(msg)
 
-    @classmethod
-    def _from_dict(cls, _dict: Dict):
-        """Initialize a RuntimeResponseGeneric object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping[
-            'channel_transfer'] = 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-        mapping[
-            'connect_to_agent'] = 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-        mapping['image'] = 'RuntimeResponseGenericRuntimeResponseTypeImage'
-        mapping['option'] = 'RuntimeResponseGenericRuntimeResponseTypeOption'
-        mapping[
-            'suggestion'] = 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-        mapping['pause'] = 'RuntimeResponseGenericRuntimeResponseTypePause'
-        mapping['text'] = 'RuntimeResponseGenericRuntimeResponseTypeText'
-        mapping[
-            'user_defined'] = 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-        disc_value = _dict.get('response_type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'response_type\' not found in RuntimeResponseGeneric JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class Synonym():
+class Synonym(Model):
     """
     Synonym.
 
@@ -9163,6 +6567,14 @@ class Synonym():
           the object.
     """
 
+    __slots__ = ('synonym', 'created', 'updated')
+
+    _fields = (
+        ModelField('synonym', required=True),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  synonym: str,
                  *,
@@ -9176,61 +6588,12 @@ class Synonym():
                - It cannot contain carriage return, newline, or tab characters.
                - It cannot consist of only whitespace characters.
         """
-        self.synonym = synonym
-        self.created = created
-        self.updated = updated
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Synonym':
-        """Initialize a Synonym object from a json dictionary."""
-        args = {}
-        if 'synonym' in _dict:
-            args['synonym'] = _dict.get('synonym')
-        else:
-            raise ValueError(
-                'Required property \'synonym\' not present in Synonym JSON')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Synonym object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'synonym') and self.synonym is not None:
-            _dict['synonym'] = self.synonym
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Synonym object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Synonym') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Synonym') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
+        self.synonym = synonym
+        self.created = created
+        self.updated = updated
 
 
-class SynonymCollection():
+class SynonymCollection(Model):
     """
     SynonymCollection.
 
@@ -9238,6 +6601,13 @@ class SynonymCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('synonyms', 'pagination')
+
+    _fields = (
+        ModelField('synonyms', 'list', 'Synonym', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, synonyms: List['Synonym'],
                  pagination: 'Pagination') -> None:
         """
@@ -9249,60 +6619,8 @@ class SynonymCollection():
         self.synonyms = synonyms
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SynonymCollection':
-        """Initialize a SynonymCollection object from a json dictionary."""
-        args = {}
-        if 'synonyms' in _dict:
-            args['synonyms'] = [
-                Synonym.from_dict(x) for x in _dict.get('synonyms')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'synonyms\' not present in SynonymCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in SynonymCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SynonymCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'synonyms') and self.synonyms is not None:
-            _dict['synonyms'] = [x.to_dict() for x in self.synonyms]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this SynonymCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SynonymCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SynonymCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Value():
+class Value(Model):
     """
     Value.
 
@@ -9327,6 +6645,19 @@ class Value():
           the object.
     """
 
+    __slots__ = ('value', 'metadata', 'type', 'synonyms', 'patterns', 'created',
+                 'updated')
+
+    _fields = (
+        ModelField('value', required=True),
+        ModelField('metadata'),
+        ModelField('type', required=True),
+        ModelField('synonyms'),
+        ModelField('patterns'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  value: str,
                  type: str,
@@ -9365,74 +6696,6 @@ class Value():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Value':
-        """Initialize a Value object from a json dictionary."""
-        args = {}
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in Value JSON')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in Value JSON')
-        if 'synonyms' in _dict:
-            args['synonyms'] = _dict.get('synonyms')
-        if 'patterns' in _dict:
-            args['patterns'] = _dict.get('patterns')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Value object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'synonyms') and self.synonyms is not None:
-            _dict['synonyms'] = self.synonyms
-        if hasattr(self, 'patterns') and self.patterns is not None:
-            _dict['patterns'] = self.patterns
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Value object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Value') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Value') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         Specifies the type of entity value.
@@ -9441,7 +6704,7 @@ class Value():
         PATTERNS = 'patterns'
 
 
-class ValueCollection():
+class ValueCollection(Model):
     """
     ValueCollection.
 
@@ -9449,6 +6712,13 @@ class ValueCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('values', 'pagination')
+
+    _fields = (
+        ModelField('values', 'list', 'Value', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, values: List['Value'], pagination: 'Pagination') -> None:
         """
         Initialize a ValueCollection object.
@@ -9459,58 +6729,8 @@ class ValueCollection():
         self.values = values
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ValueCollection':
-        """Initialize a ValueCollection object from a json dictionary."""
-        args = {}
-        if 'values' in _dict:
-            args['values'] = [Value.from_dict(x) for x in _dict.get('values')]
-        else:
-            raise ValueError(
-                'Required property \'values\' not present in ValueCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in ValueCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ValueCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'values') and self.values is not None:
-            _dict['values'] = [x.to_dict() for x in self.values]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ValueCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ValueCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ValueCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Webhook():
+class Webhook(Model):
     """
     A webhook that can be used by dialog nodes to make programmatic calls to an external
     function.
@@ -9524,6 +6744,14 @@ class Webhook():
           to pass with the HTTP request.
     """
 
+    __slots__ = ('url', 'name', 'headers_')
+
+    _fields = (
+        ModelField('url', required=True),
+        ModelField('name', required=True),
+        ModelField('headers_', 'list', 'WebhookHeader', key='headers'),
+    )
+
     def __init__(self,
                  url: str,
                  name: str,
@@ -9543,62 +6771,8 @@ class Webhook():
         self.name = name
         self.headers_ = headers_
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Webhook':
-        """Initialize a Webhook object from a json dictionary."""
-        args = {}
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in Webhook JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Webhook JSON')
-        if 'headers' in _dict:
-            args['headers_'] = [
-                WebhookHeader.from_dict(x) for x in _dict.get('headers')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Webhook object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'headers_') and self.headers_ is not None:
-            _dict['headers'] = [x.to_dict() for x in self.headers_]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Webhook object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Webhook') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Webhook') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WebhookHeader():
+class WebhookHeader(Model):
     """
     A key/value pair defining an HTTP header and a value.
 
@@ -9606,6 +6780,13 @@ class WebhookHeader():
     :attr str value: The value of an HTTP header.
     """
 
+    __slots__ = ('name', 'value')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('value', required=True),
+    )
+
     def __init__(self, name: str, value: str) -> None:
         """
         Initialize a WebhookHeader object.
@@ -9616,56 +6797,8 @@ class WebhookHeader():
         self.name = name
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WebhookHeader':
-        """Initialize a WebhookHeader object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in WebhookHeader JSON')
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in WebhookHeader JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WebhookHeader object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WebhookHeader object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WebhookHeader') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WebhookHeader') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Workspace():
+class Workspace(Model):
     """
     Workspace.
 
@@ -9695,6 +6828,29 @@ class Workspace():
           entities for the workspace.
     """
 
+    __slots__ = ('name', 'description', 'language', 'workspace_id',
+                 'dialog_nodes', 'counterexamples', 'created', 'updated',
+                 'metadata', 'learning_opt_out', 'system_settings', 'status',
+                 'webhooks', 'intents', 'entities')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('description'),
+        ModelField('language', required=True),
+        ModelField('workspace_id', required=True),
+        ModelField('dialog_nodes', 'list', 'DialogNode'),
+        ModelField('counterexamples', 'list', 'Counterexample'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('metadata'),
+        ModelField('learning_opt_out', required=True),
+        ModelField('system_settings', 'model', 'WorkspaceSystemSettings'),
+        ModelField('status'),
+        ModelField('webhooks', 'list', 'Webhook'),
+        ModelField('intents', 'list', 'Intent'),
+        ModelField('entities', 'list', 'Entity'),
+    )
+
     def __init__(self,
                  name: str,
                  language: str,
@@ -9753,132 +6909,6 @@ class Workspace():
         self.intents = intents
         self.entities = entities
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Workspace':
-        """Initialize a Workspace object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Workspace JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in Workspace JSON')
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        else:
-            raise ValueError(
-                'Required property \'workspace_id\' not present in Workspace JSON'
-            )
-        if 'dialog_nodes' in _dict:
-            args['dialog_nodes'] = [
-                DialogNode.from_dict(x) for x in _dict.get('dialog_nodes')
-            ]
-        if 'counterexamples' in _dict:
-            args['counterexamples'] = [
-                Counterexample.from_dict(x)
-                for x in _dict.get('counterexamples')
-            ]
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'learning_opt_out' in _dict:
-            args['learning_opt_out'] = _dict.get('learning_opt_out')
-        else:
-            raise ValueError(
-                'Required property \'learning_opt_out\' not present in Workspace JSON'
-            )
-        if 'system_settings' in _dict:
-            args['system_settings'] = WorkspaceSystemSettings.from_dict(
-                _dict.get('system_settings'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'webhooks' in _dict:
-            args['webhooks'] = [
-                Webhook.from_dict(x) for x in _dict.get('webhooks')
-            ]
-        if 'intents' in _dict:
-            args['intents'] = [
-                Intent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                Entity.from_dict(x) for x in _dict.get('entities')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Workspace object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'workspace_id') and getattr(
-                self, 'workspace_id') is not None:
-            _dict['workspace_id'] = getattr(self, 'workspace_id')
-        if hasattr(self, 'dialog_nodes') and self.dialog_nodes is not None:
-            _dict['dialog_nodes'] = [x.to_dict() for x in self.dialog_nodes]
-        if hasattr(self,
-                   'counterexamples') and self.counterexamples is not None:
-            _dict['counterexamples'] = [
-                x.to_dict() for x in self.counterexamples
-            ]
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self,
-                   'learning_opt_out') and self.learning_opt_out is not None:
-            _dict['learning_opt_out'] = self.learning_opt_out
-        if hasattr(self,
-                   'system_settings') and self.system_settings is not None:
-            _dict['system_settings'] = self.system_settings.to_dict()
-        if hasattr(self, 'status') and getattr(self, 'status') is not None:
-            _dict['status'] = getattr(self, 'status')
-        if hasattr(self, 'webhooks') and self.webhooks is not None:
-            _dict['webhooks'] = [x.to_dict() for x in self.webhooks]
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Workspace object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Workspace') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Workspace') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the workspace.
@@ -9890,7 +6920,7 @@ class Workspace():
         UNAVAILABLE = 'Unavailable'
 
 
-class WorkspaceCollection():
+class WorkspaceCollection(Model):
     """
     WorkspaceCollection.
 
@@ -9899,6 +6929,13 @@ class WorkspaceCollection():
     :attr Pagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('workspaces', 'pagination')
+
+    _fields = (
+        ModelField('workspaces', 'list', 'Workspace', required=True),
+        ModelField('pagination', 'model', 'Pagination', required=True),
+    )
+
     def __init__(self, workspaces: List['Workspace'],
                  pagination: 'Pagination') -> None:
         """
@@ -9911,60 +6948,8 @@ class WorkspaceCollection():
         self.workspaces = workspaces
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceCollection':
-        """Initialize a WorkspaceCollection object from a json dictionary."""
-        args = {}
-        if 'workspaces' in _dict:
-            args['workspaces'] = [
-                Workspace.from_dict(x) for x in _dict.get('workspaces')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'workspaces\' not present in WorkspaceCollection JSON'
-            )
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in WorkspaceCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'workspaces') and self.workspaces is not None:
-            _dict['workspaces'] = [x.to_dict() for x in self.workspaces]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WorkspaceCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class WorkspaceSystemSettings():
+class WorkspaceSystemSettings(Model):
     """
     Global settings for the workspace.
 
@@ -9987,6 +6972,22 @@ class WorkspaceSystemSettings():
           related to detection of irrelevant input.
     """
 
+    __slots__ = ('tooling', 'disambiguation', 'human_agent_assist',
+                 'spelling_suggestions', 'spelling_auto_correct',
+                 'system_entities', 'off_topic')
+
+    _fields = (
+        ModelField('tooling', 'model', 'WorkspaceSystemSettingsTooling'),
+        ModelField('disambiguation', 'model',
+                   'WorkspaceSystemSettingsDisambiguation'),
+        ModelField('human_agent_assist'),
+        ModelField('spelling_suggestions'),
+        ModelField('spelling_auto_correct'),
+        ModelField('system_entities', 'model',
+                   'WorkspaceSystemSettingsSystemEntities'),
+        ModelField('off_topic', 'model', 'WorkspaceSystemSettingsOffTopic'),
+    )
+
     def __init__(
             self,
             *,
@@ -10027,81 +7028,8 @@ class WorkspaceSystemSettings():
         self.system_entities = system_entities
         self.off_topic = off_topic
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceSystemSettings':
-        """Initialize a WorkspaceSystemSettings object from a json dictionary."""
-        args = {}
-        if 'tooling' in _dict:
-            args['tooling'] = WorkspaceSystemSettingsTooling.from_dict(
-                _dict.get('tooling'))
-        if 'disambiguation' in _dict:
-            args[
-                'disambiguation'] = WorkspaceSystemSettingsDisambiguation.from_dict(
-                    _dict.get('disambiguation'))
-        if 'human_agent_assist' in _dict:
-            args['human_agent_assist'] = _dict.get('human_agent_assist')
-        if 'spelling_suggestions' in _dict:
-            args['spelling_suggestions'] = _dict.get('spelling_suggestions')
-        if 'spelling_auto_correct' in _dict:
-            args['spelling_auto_correct'] = _dict.get('spelling_auto_correct')
-        if 'system_entities' in _dict:
-            args[
-                'system_entities'] = WorkspaceSystemSettingsSystemEntities.from_dict(
-                    _dict.get('system_entities'))
-        if 'off_topic' in _dict:
-            args['off_topic'] = WorkspaceSystemSettingsOffTopic.from_dict(
-                _dict.get('off_topic'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceSystemSettings object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'tooling') and self.tooling is not None:
-            _dict['tooling'] = self.tooling.to_dict()
-        if hasattr(self, 'disambiguation') and self.disambiguation is not None:
-            _dict['disambiguation'] = self.disambiguation.to_dict()
-        if hasattr(
-                self,
-                'human_agent_assist') and self.human_agent_assist is not None:
-            _dict['human_agent_assist'] = self.human_agent_assist
-        if hasattr(self, 'spelling_suggestions'
-                  ) and self.spelling_suggestions is not None:
-            _dict['spelling_suggestions'] = self.spelling_suggestions
-        if hasattr(self, 'spelling_auto_correct'
-                  ) and self.spelling_auto_correct is not None:
-            _dict['spelling_auto_correct'] = self.spelling_auto_correct
-        if hasattr(self,
-                   'system_entities') and self.system_entities is not None:
-            _dict['system_entities'] = self.system_entities.to_dict()
-        if hasattr(self, 'off_topic') and self.off_topic is not None:
-            _dict['off_topic'] = self.off_topic.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceSystemSettings object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceSystemSettings') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'WorkspaceSystemSettings') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WorkspaceSystemSettingsDisambiguation():
+class WorkspaceSystemSettingsDisambiguation(Model):
     """
     Workspace settings related to the disambiguation feature.
 
@@ -10123,6 +7051,19 @@ class WorkspaceSystemSettingsDisambiguation():
     :attr str suggestion_text_policy: (optional) For internal use only.
     """
 
+    __slots__ = ('prompt', 'none_of_the_above_prompt', 'enabled', 'sensitivity',
+                 'randomize', 'max_suggestions', 'suggestion_text_policy')
+
+    _fields = (
+        ModelField('prompt'),
+        ModelField('none_of_the_above_prompt'),
+        ModelField('enabled'),
+        ModelField('sensitivity'),
+        ModelField('randomize'),
+        ModelField('max_suggestions'),
+        ModelField('suggestion_text_policy'),
+    )
+
     def __init__(self,
                  *,
                  prompt: str = None,
@@ -10160,72 +7101,6 @@ class WorkspaceSystemSettingsDisambiguation():
         self.max_suggestions = max_suggestions
         self.suggestion_text_policy = suggestion_text_policy
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceSystemSettingsDisambiguation':
-        """Initialize a WorkspaceSystemSettingsDisambiguation object from a json dictionary."""
-        args = {}
-        if 'prompt' in _dict:
-            args['prompt'] = _dict.get('prompt')
-        if 'none_of_the_above_prompt' in _dict:
-            args['none_of_the_above_prompt'] = _dict.get(
-                'none_of_the_above_prompt')
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'sensitivity' in _dict:
-            args['sensitivity'] = _dict.get('sensitivity')
-        if 'randomize' in _dict:
-            args['randomize'] = _dict.get('randomize')
-        if 'max_suggestions' in _dict:
-            args['max_suggestions'] = _dict.get('max_suggestions')
-        if 'suggestion_text_policy' in _dict:
-            args['suggestion_text_policy'] = _dict.get('suggestion_text_policy')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceSystemSettingsDisambiguation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'prompt') and self.prompt is not None:
-            _dict['prompt'] = self.prompt
-        if hasattr(self, 'none_of_the_above_prompt'
-                  ) and self.none_of_the_above_prompt is not None:
-            _dict['none_of_the_above_prompt'] = self.none_of_the_above_prompt
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'sensitivity') and self.sensitivity is not None:
-            _dict['sensitivity'] = self.sensitivity
-        if hasattr(self, 'randomize') and self.randomize is not None:
-            _dict['randomize'] = self.randomize
-        if hasattr(self,
-                   'max_suggestions') and self.max_suggestions is not None:
-            _dict['max_suggestions'] = self.max_suggestions
-        if hasattr(self, 'suggestion_text_policy'
-                  ) and self.suggestion_text_policy is not None:
-            _dict['suggestion_text_policy'] = self.suggestion_text_policy
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceSystemSettingsDisambiguation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceSystemSettingsDisambiguation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WorkspaceSystemSettingsDisambiguation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class SensitivityEnum(str, Enum):
         """
         The sensitivity of the disambiguation feature to intent detection uncertainty.
@@ -10240,7 +7115,7 @@ class WorkspaceSystemSettingsDisambiguation():
         LOW = 'low'
 
 
-class WorkspaceSystemSettingsOffTopic():
+class WorkspaceSystemSettingsOffTopic(Model):
     """
     Workspace settings related to detection of irrelevant input.
 
@@ -10248,6 +7123,12 @@ class WorkspaceSystemSettingsOffTopic():
           for the workspace.
     """
 
+    __slots__ = ('enabled',)
+
+    _fields = (
+        ModelField('enabled'),
+    )
+
     def __init__(self, *, enabled: bool = None) -> None:
         """
         Initialize a WorkspaceSystemSettingsOffTopic object.
@@ -10257,46 +7138,8 @@ class WorkspaceSystemSettingsOffTopic():
         """
         self.enabled = enabled
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceSystemSettingsOffTopic':
-        """Initialize a WorkspaceSystemSettingsOffTopic object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceSystemSettingsOffTopic object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceSystemSettingsOffTopic object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceSystemSettingsOffTopic') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WorkspaceSystemSettingsOffTopic') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WorkspaceSystemSettingsSystemEntities():
+class WorkspaceSystemSettingsSystemEntities(Model):
     """
     Workspace settings related to the behavior of system entities.
 
@@ -10304,6 +7147,12 @@ class WorkspaceSystemSettingsSystemEntities():
           the workspace.
     """
 
+    __slots__ = ('enabled',)
+
+    _fields = (
+        ModelField('enabled'),
+    )
+
     def __init__(self, *, enabled: bool = None) -> None:
         """
         Initialize a WorkspaceSystemSettingsSystemEntities object.
@@ -10313,46 +7162,8 @@ class WorkspaceSystemSettingsSystemEntities():
         """
         self.enabled = enabled
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceSystemSettingsSystemEntities':
-        """Initialize a WorkspaceSystemSettingsSystemEntities object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceSystemSettingsSystemEntities object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceSystemSettingsSystemEntities object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceSystemSettingsSystemEntities') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WorkspaceSystemSettingsSystemEntities') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class WorkspaceSystemSettingsTooling():
+class WorkspaceSystemSettingsTooling(Model):
     """
     Workspace settings related to the Watson Assistant user interface.
 
@@ -10360,6 +7171,12 @@ class WorkspaceSystemSettingsTooling():
           displays text responses within the `output.generic` object.
     """
 
+    __slots__ = ('store_generic_responses',)
+
+    _fields = (
+        ModelField('store_generic_responses'),
+    )
+
     def __init__(self, *, store_generic_responses: bool = None) -> None:
         """
         Initialize a WorkspaceSystemSettingsTooling object.
@@ -10369,46 +7186,6 @@ class WorkspaceSystemSettingsTooling():
         """
         self.store_generic_responses = store_generic_responses
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WorkspaceSystemSettingsTooling':
-        """Initialize a WorkspaceSystemSettingsTooling object from a json dictionary."""
-        args = {}
-        if 'store_generic_responses' in _dict:
-            args['store_generic_responses'] = _dict.get(
-                'store_generic_responses')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WorkspaceSystemSettingsTooling object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'store_generic_responses'
-                  ) and self.store_generic_responses is not None:
-            _dict['store_generic_responses'] = self.store_generic_responses
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WorkspaceSystemSettingsTooling object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WorkspaceSystemSettingsTooling') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WorkspaceSystemSettingsTooling') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer(
         DialogNodeOutputGeneric):
@@ -10425,6 +7202,17 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'message_to_user', 'transfer_info',
+                 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_user', required=True),
+        ModelField('transfer_info', 'model', 'ChannelTransferInfo',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  message_to_user: str,
@@ -10450,81 +7238,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer(
         self.transfer_info = transfer_info
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer JSON'
-            )
-        if 'message_to_user' in _dict:
-            args['message_to_user'] = _dict.get('message_to_user')
-        else:
-            raise ValueError(
-                'Required property \'message_to_user\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer JSON'
-            )
-        if 'transfer_info' in _dict:
-            args['transfer_info'] = ChannelTransferInfo.from_dict(
-                _dict.get('transfer_info'))
-        else:
-            raise ValueError(
-                'Required property \'transfer_info\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self,
-                   'message_to_user') and self.message_to_user is not None:
-            _dict['message_to_user'] = self.message_to_user
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other:
-        'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other:
-        'DialogNodeOutputGenericDialogNodeOutputResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent(
         DialogNodeOutputGeneric):
@@ -10548,6 +7261,19 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'message_to_human_agent', 'agent_available',
+                 'agent_unavailable', 'transfer_info', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_human_agent'),
+        ModelField('agent_available', 'model', 'AgentAvailabilityMessage'),
+        ModelField('agent_unavailable', 'model', 'AgentAvailabilityMessage'),
+        ModelField('transfer_info', 'model',
+                   'DialogNodeOutputConnectToAgentTransferInfo'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(
             self,
             response_type: str,
@@ -10585,86 +7311,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent(
         self.transfer_info = transfer_info
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent JSON'
-            )
-        if 'message_to_human_agent' in _dict:
-            args['message_to_human_agent'] = _dict.get('message_to_human_agent')
-        if 'agent_available' in _dict:
-            args['agent_available'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_available'))
-        if 'agent_unavailable' in _dict:
-            args['agent_unavailable'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_unavailable'))
-        if 'transfer_info' in _dict:
-            args[
-                'transfer_info'] = DialogNodeOutputConnectToAgentTransferInfo.from_dict(
-                    _dict.get('transfer_info'))
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'message_to_human_agent'
-                  ) and self.message_to_human_agent is not None:
-            _dict['message_to_human_agent'] = self.message_to_human_agent
-        if hasattr(self,
-                   'agent_available') and self.agent_available is not None:
-            _dict['agent_available'] = self.agent_available.to_dict()
-        if hasattr(self,
-                   'agent_unavailable') and self.agent_unavailable is not None:
-            _dict['agent_unavailable'] = self.agent_unavailable.to_dict()
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class DialogNodeOutputGenericDialogNodeOutputResponseTypeImage(
         DialogNodeOutputGeneric):
@@ -10683,6 +7329,18 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeImage(
           readers or other situations where the image cannot be seen.
     """
 
+    __slots__ = ('response_type', 'source', 'title', 'description', 'channels',
+                 'alt_text')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('source', required=True),
+        ModelField('title'),
+        ModelField('description'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+        ModelField('alt_text'),
+    )
+
     def __init__(self,
                  response_type: str,
                  source: str,
@@ -10714,81 +7372,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeImage(
         self.channels = channels
         self.alt_text = alt_text
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeImage object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeImage JSON'
-            )
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeImage JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        if 'alt_text' in _dict:
-            args['alt_text'] = _dict.get('alt_text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeImage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        if hasattr(self, 'alt_text') and self.alt_text is not None:
-            _dict['alt_text'] = self.alt_text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeImage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeImage'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class DialogNodeOutputGenericDialogNodeOutputResponseTypeOption(
         DialogNodeOutputGeneric):
@@ -10809,6 +7392,19 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeOption(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'title', 'description', 'preference',
+                 'options', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('title', required=True),
+        ModelField('description'),
+        ModelField('preference'),
+        ModelField('options', 'list', 'DialogNodeOutputOptionsElement',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  title: str,
@@ -10842,88 +7438,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeOption(
         self.options = options
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeOption object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeOption JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        else:
-            raise ValueError(
-                'Required property \'title\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeOption JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'preference' in _dict:
-            args['preference'] = _dict.get('preference')
-        if 'options' in _dict:
-            args['options'] = [
-                DialogNodeOutputOptionsElement.from_dict(x)
-                for x in _dict.get('options')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'options\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeOption JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeOption object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'preference') and self.preference is not None:
-            _dict['preference'] = self.preference
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = [x.to_dict() for x in self.options]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeOption object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeOption'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PreferenceEnum(str, Enum):
         """
         The preferred type of control to display, if supported by the channel.
@@ -10947,6 +7461,15 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypePause(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'time', 'typing', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('time', required=True),
+        ModelField('typing'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  time: int,
@@ -10972,73 +7495,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypePause(
         self.typing = typing
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypePause':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypePause object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypePause JSON'
-            )
-        if 'time' in _dict:
-            args['time'] = _dict.get('time')
-        else:
-            raise ValueError(
-                'Required property \'time\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypePause JSON'
-            )
-        if 'typing' in _dict:
-            args['typing'] = _dict.get('typing')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypePause object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'time') and self.time is not None:
-            _dict['time'] = self.time
-        if hasattr(self, 'typing') and self.typing is not None:
-            _dict['typing'] = self.typing
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypePause object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypePause'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypePause'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill(
         DialogNodeOutputGeneric):
@@ -11064,6 +7520,18 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'query', 'query_type', 'filter',
+                 'discovery_version', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('query', required=True),
+        ModelField('query_type', required=True),
+        ModelField('filter'),
+        ModelField('discovery_version'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  query: str,
@@ -11103,88 +7571,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill(
         self.discovery_version = discovery_version
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill JSON'
-            )
-        if 'query' in _dict:
-            args['query'] = _dict.get('query')
-        else:
-            raise ValueError(
-                'Required property \'query\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill JSON'
-            )
-        if 'query_type' in _dict:
-            args['query_type'] = _dict.get('query_type')
-        else:
-            raise ValueError(
-                'Required property \'query_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill JSON'
-            )
-        if 'filter' in _dict:
-            args['filter'] = _dict.get('filter')
-        if 'discovery_version' in _dict:
-            args['discovery_version'] = _dict.get('discovery_version')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'query') and self.query is not None:
-            _dict['query'] = self.query
-        if hasattr(self, 'query_type') and self.query_type is not None:
-            _dict['query_type'] = self.query_type
-        if hasattr(self, 'filter') and self.filter is not None:
-            _dict['filter'] = self.filter
-        if hasattr(self,
-                   'discovery_version') and self.discovery_version is not None:
-            _dict['discovery_version'] = self.discovery_version
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeSearchSkill'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class QueryTypeEnum(str, Enum):
         """
         The type of the search query.
@@ -11210,6 +7596,18 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeText(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'values', 'selection_policy', 'delimiter',
+                 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('values', 'list', 'DialogNodeOutputTextValuesElement',
+                   required=True),
+        ModelField('selection_policy'),
+        ModelField('delimiter'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  values: List['DialogNodeOutputTextValuesElement'],
@@ -11239,81 +7637,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeText(
         self.delimiter = delimiter
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeText':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeText object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeText JSON'
-            )
-        if 'values' in _dict:
-            args['values'] = [
-                DialogNodeOutputTextValuesElement.from_dict(x)
-                for x in _dict.get('values')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'values\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeText JSON'
-            )
-        if 'selection_policy' in _dict:
-            args['selection_policy'] = _dict.get('selection_policy')
-        if 'delimiter' in _dict:
-            args['delimiter'] = _dict.get('delimiter')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeText object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'values') and self.values is not None:
-            _dict['values'] = [x.to_dict() for x in self.values]
-        if hasattr(self,
-                   'selection_policy') and self.selection_policy is not None:
-            _dict['selection_policy'] = self.selection_policy
-        if hasattr(self, 'delimiter') and self.delimiter is not None:
-            _dict['delimiter'] = self.delimiter
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeText object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeText'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeText'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class SelectionPolicyEnum(str, Enum):
         """
         How a response is selected from the list, if more than one response is specified.
@@ -11337,6 +7660,14 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined(
           specifying channels for which the response is intended.
     """
 
+    __slots__ = ('response_type', 'user_defined', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('user_defined', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  user_defined: dict,
@@ -11359,71 +7690,6 @@ class DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined(
         self.user_defined = user_defined
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined':
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined JSON'
-            )
-        if 'user_defined' in _dict:
-            args['user_defined'] = _dict.get('user_defined')
-        else:
-            raise ValueError(
-                'Required property \'user_defined\' not present in DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'user_defined') and self.user_defined is not None:
-            _dict['user_defined'] = self.user_defined
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self,
-        other: 'DialogNodeOutputGenericDialogNodeOutputResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
         RuntimeResponseGeneric):
@@ -11442,6 +7708,17 @@ class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
           be handled by an API client.
     """
 
+    __slots__ = ('response_type', 'message_to_user', 'transfer_info',
+                 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_user', required=True),
+        ModelField('transfer_info', 'model', 'ChannelTransferInfo',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  message_to_user: str,
@@ -11469,79 +7746,6 @@ class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
         self.transfer_info = transfer_info
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'message_to_user' in _dict:
-            args['message_to_user'] = _dict.get('message_to_user')
-        else:
-            raise ValueError(
-                'Required property \'message_to_user\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'transfer_info' in _dict:
-            args['transfer_info'] = ChannelTransferInfo.from_dict(
-                _dict.get('transfer_info'))
-        else:
-            raise ValueError(
-                'Required property \'transfer_info\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self,
-                   'message_to_user') and self.message_to_user is not None:
-            _dict['message_to_user'] = self.message_to_user
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
         RuntimeResponseGeneric):
@@ -11573,6 +7777,22 @@ class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'message_to_human_agent', 'agent_available',
+                 'agent_unavailable', 'transfer_info', 'topic', 'dialog_node',
+                 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_human_agent'),
+        ModelField('agent_available', 'model', 'AgentAvailabilityMessage'),
+        ModelField('agent_unavailable', 'model', 'AgentAvailabilityMessage'),
+        ModelField('transfer_info', 'model',
+                   'DialogNodeOutputConnectToAgentTransferInfo'),
+        ModelField('topic'),
+        ModelField('dialog_node'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(
             self,
             response_type: str,
@@ -11622,92 +7842,6 @@ class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
         self.dialog_node = dialog_node
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeConnectToAgent JSON'
-            )
-        if 'message_to_human_agent' in _dict:
-            args['message_to_human_agent'] = _dict.get('message_to_human_agent')
-        if 'agent_available' in _dict:
-            args['agent_available'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_available'))
-        if 'agent_unavailable' in _dict:
-            args['agent_unavailable'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_unavailable'))
-        if 'transfer_info' in _dict:
-            args[
-                'transfer_info'] = DialogNodeOutputConnectToAgentTransferInfo.from_dict(
-                    _dict.get('transfer_info'))
-        if 'topic' in _dict:
-            args['topic'] = _dict.get('topic')
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'message_to_human_agent'
-                  ) and self.message_to_human_agent is not None:
-            _dict['message_to_human_agent'] = self.message_to_human_agent
-        if hasattr(self,
-                   'agent_available') and self.agent_available is not None:
-            _dict['agent_available'] = self.agent_available.to_dict()
-        if hasattr(self,
-                   'agent_unavailable') and self.agent_unavailable is not None:
-            _dict['agent_unavailable'] = self.agent_unavailable.to_dict()
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'topic') and self.topic is not None:
-            _dict['topic'] = self.topic
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
     """
@@ -11727,6 +7861,18 @@ class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
           readers or other situations where the image cannot be seen.
     """
 
+    __slots__ = ('response_type', 'source', 'title', 'description', 'channels',
+                 'alt_text')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('source', required=True),
+        ModelField('title'),
+        ModelField('description'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+        ModelField('alt_text'),
+    )
+
     def __init__(self,
                  response_type: str,
                  source: str,
@@ -11761,79 +7907,6 @@ class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
         self.channels = channels
         self.alt_text = alt_text
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeImage':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeImage object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeImage JSON'
-            )
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in RuntimeResponseGenericRuntimeResponseTypeImage JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        if 'alt_text' in _dict:
-            args['alt_text'] = _dict.get('alt_text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeImage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        if hasattr(self, 'alt_text') and self.alt_text is not None:
-            _dict['alt_text'] = self.alt_text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeImage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeImage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeImage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
     """
@@ -11852,6 +7925,19 @@ class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'title', 'description', 'preference',
+                 'options', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('title', required=True),
+        ModelField('description'),
+        ModelField('preference'),
+        ModelField('options', 'list', 'DialogNodeOutputOptionsElement',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  title: str,
@@ -11886,88 +7972,6 @@ class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
         self.options = options
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeOption':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeOption object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        else:
-            raise ValueError(
-                'Required property \'title\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'preference' in _dict:
-            args['preference'] = _dict.get('preference')
-        if 'options' in _dict:
-            args['options'] = [
-                DialogNodeOutputOptionsElement.from_dict(x)
-                for x in _dict.get('options')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'options\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeOption object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'preference') and self.preference is not None:
-            _dict['preference'] = self.preference
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = [x.to_dict() for x in self.options]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeOption object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeOption') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeOption') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PreferenceEnum(str, Enum):
         """
         The preferred type of control to display.
@@ -11991,6 +7995,15 @@ class RuntimeResponseGenericRuntimeResponseTypePause(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'time', 'typing', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('time', required=True),
+        ModelField('typing'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  time: int,
@@ -12017,71 +8030,6 @@ class RuntimeResponseGenericRuntimeResponseTypePause(RuntimeResponseGeneric):
         self.typing = typing
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypePause':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypePause object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypePause JSON'
-            )
-        if 'time' in _dict:
-            args['time'] = _dict.get('time')
-        else:
-            raise ValueError(
-                'Required property \'time\' not present in RuntimeResponseGenericRuntimeResponseTypePause JSON'
-            )
-        if 'typing' in _dict:
-            args['typing'] = _dict.get('typing')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypePause object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'time') and self.time is not None:
-            _dict['time'] = self.time
-        if hasattr(self, 'typing') and self.typing is not None:
-            _dict['typing'] = self.typing
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypePause object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypePause') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypePause') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
         RuntimeResponseGeneric):
@@ -12099,6 +8047,15 @@ class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'title', 'suggestions', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('title', required=True),
+        ModelField('suggestions', 'list', 'DialogSuggestion', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  title: str,
@@ -12126,79 +8083,6 @@ class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
         self.suggestions = suggestions
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeSuggestion':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSuggestion object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        else:
-            raise ValueError(
-                'Required property \'title\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'suggestions' in _dict:
-            args['suggestions'] = [
-                DialogSuggestion.from_dict(x) for x in _dict.get('suggestions')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'suggestions\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSuggestion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'suggestions') and self.suggestions is not None:
-            _dict['suggestions'] = [x.to_dict() for x in self.suggestions]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeSuggestion object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
     """
@@ -12213,6 +8097,14 @@ class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'text', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('text', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  text: str,
@@ -12235,67 +8127,6 @@ class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
         self.text = text
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeText':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeText object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeText JSON'
-            )
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in RuntimeResponseGenericRuntimeResponseTypeText JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeText object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeText object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeText') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeText') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
         RuntimeResponseGeneric):
@@ -12312,6 +8143,14 @@ class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'user_defined', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('user_defined', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  user_defined: dict,
@@ -12334,66 +8173,3 @@ class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
         self.response_type = response_type
         self.user_defined = user_defined
         self.channels = channels
-
-    @classmethod
-    def from_dict(
-            cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeUserDefined':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeUserDefined object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeUserDefined JSON'
-            )
-        if 'user_defined' in _dict:
-            args['user_defined'] = _dict.get('user_defined')
-        else:
-            raise ValueError(
-                'Required property \'user_defined\' not present in RuntimeResponseGenericRuntimeResponseTypeUserDefined JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeUserDefined object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'user_defined') and self.user_defined is not None:
-            _dict['user_defined'] = self.user_defined
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeUserDefined object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -28,22 +28,23 @@ See: https://cloud.ibm.com/docs/assistant
 
 from enum import Enum
 from typing import Dict, List
-import json
-import sys
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelDiscriminator, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class AssistantV2(BaseService):
+class AssistantV2(WatsonService):
     """The Assistant V2 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.assistant.watson.cloud.ibm.com'
@@ -54,6 +55,7 @@ class AssistantV2(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Assistant service.
@@ -64,17 +66,23 @@ class AssistantV2(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V2',
+                             get_operation_ids(AssistantV2))
 
     #########################
     # Sessions
@@ -124,7 +132,7 @@ class AssistantV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SessionResponse, **kwargs)
         return response
 
     def delete_session(self, assistant_id: str, session_id: str,
@@ -244,7 +252,7 @@ class AssistantV2(BaseService):
 
         data = {'input': input, 'context': context, 'user_id': user_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -262,7 +270,7 @@ class AssistantV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MessageResponse, **kwargs)
         return response
 
     def message_stateless(self,
@@ -324,7 +332,7 @@ class AssistantV2(BaseService):
 
         data = {'input': input, 'context': context, 'user_id': user_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -341,7 +349,9 @@ class AssistantV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=MessageResponseStateless,
+                             **kwargs)
         return response
 
     #########################
@@ -386,7 +396,7 @@ class AssistantV2(BaseService):
 
         data = {'input': input}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -404,7 +414,9 @@ class AssistantV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=BulkClassifyResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -475,7 +487,7 @@ class AssistantV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LogCollection, **kwargs)
         return response
 
     #########################
@@ -529,18 +541,28 @@ class AssistantV2(BaseService):
         return response
 
 
+class AsyncAssistantV2(AsyncWatsonService, AssistantV2):
+    """The Assistant V2 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AgentAvailabilityMessage():
+class AgentAvailabilityMessage(Model):
     """
     AgentAvailabilityMessage.
 
     :attr str message: (optional) The text of the message.
     """
 
+    __slots__ = ('message',)
+
+    _fields = (
+        ModelField('message'),
+    )
+
     def __init__(self, *, message: str = None) -> None:
         """
         Initialize a AgentAvailabilityMessage object.
@@ -549,46 +571,8 @@ class AgentAvailabilityMessage():
         """
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AgentAvailabilityMessage':
-        """Initialize a AgentAvailabilityMessage object from a json dictionary."""
-        args = {}
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AgentAvailabilityMessage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AgentAvailabilityMessage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AgentAvailabilityMessage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AgentAvailabilityMessage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class BulkClassifyOutput():
+class BulkClassifyOutput(Model):
     """
     BulkClassifyOutput.
 
@@ -600,6 +584,14 @@ class BulkClassifyOutput():
           the utterance.
     """
 
+    __slots__ = ('input', 'entities', 'intents')
+
+    _fields = (
+        ModelField('input', 'model', 'BulkClassifyUtterance'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+    )
+
     def __init__(self,
                  *,
                  input: 'BulkClassifyUtterance' = None,
@@ -619,58 +611,8 @@ class BulkClassifyOutput():
         self.entities = entities
         self.intents = intents
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyOutput':
-        """Initialize a BulkClassifyOutput object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = BulkClassifyUtterance.from_dict(_dict.get('input'))
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyOutput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyOutput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BulkClassifyOutput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'BulkClassifyOutput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class BulkClassifyResponse():
+class BulkClassifyResponse(Model):
     """
     BulkClassifyResponse.
 
@@ -678,6 +620,12 @@ class BulkClassifyResponse():
           contain classification information for the submitted input utterances.
     """
 
+    __slots__ = ('output',)
+
+    _fields = (
+        ModelField('output', 'list', 'BulkClassifyOutput'),
+    )
+
     def __init__(self, *, output: List['BulkClassifyOutput'] = None) -> None:
         """
         Initialize a BulkClassifyResponse object.
@@ -687,54 +635,20 @@ class BulkClassifyResponse():
         """
         self.output = output
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyResponse':
-        """Initialize a BulkClassifyResponse object from a json dictionary."""
-        args = {}
-        if 'output' in _dict:
-            args['output'] = [
-                BulkClassifyOutput.from_dict(x) for x in _dict.get('output')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = [x.to_dict() for x in self.output]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'BulkClassifyResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BulkClassifyResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class BulkClassifyUtterance():
+class BulkClassifyUtterance(Model):
     """
     The user input utterance to classify.
 
     :attr str text: The text of the input utterance.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text', required=True),
+    )
+
     def __init__(self, text: str) -> None:
         """
         Initialize a BulkClassifyUtterance object.
@@ -743,50 +657,8 @@ class BulkClassifyUtterance():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BulkClassifyUtterance':
-        """Initialize a BulkClassifyUtterance object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in BulkClassifyUtterance JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BulkClassifyUtterance object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this BulkClassifyUtterance object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BulkClassifyUtterance') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BulkClassifyUtterance') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CaptureGroup():
+class CaptureGroup(Model):
     """
     CaptureGroup.
 
@@ -795,6 +667,13 @@ class CaptureGroup():
           where the entity value begins and ends in the input text.
     """
 
+    __slots__ = ('group', 'location')
+
+    _fields = (
+        ModelField('group', required=True),
+        ModelField('location'),
+    )
+
     def __init__(self, group: str, *, location: List[int] = None) -> None:
         """
         Initialize a CaptureGroup object.
@@ -806,53 +685,8 @@ class CaptureGroup():
         self.group = group
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CaptureGroup':
-        """Initialize a CaptureGroup object from a json dictionary."""
-        args = {}
-        if 'group' in _dict:
-            args['group'] = _dict.get('group')
-        else:
-            raise ValueError(
-                'Required property \'group\' not present in CaptureGroup JSON')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CaptureGroup object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'group') and self.group is not None:
-            _dict['group'] = self.group
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CaptureGroup object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CaptureGroup') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CaptureGroup') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class ChannelTransferInfo():
+class ChannelTransferInfo(Model):
     """
     Information used by an integration to transfer the conversation to a different
     channel.
@@ -863,6 +697,12 @@ class ChannelTransferInfo():
           representing the web chat integration.
     """
 
+    __slots__ = ('target',)
+
+    _fields = (
+        ModelField('target', 'model', 'ChannelTransferTarget', required=True),
+    )
+
     def __init__(self, target: 'ChannelTransferTarget') -> None:
         """
         Initialize a ChannelTransferInfo object.
@@ -874,51 +714,8 @@ class ChannelTransferInfo():
         """
         self.target = target
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferInfo':
-        """Initialize a ChannelTransferInfo object from a json dictionary."""
-        args = {}
-        if 'target' in _dict:
-            args['target'] = ChannelTransferTarget.from_dict(
-                _dict.get('target'))
-        else:
-            raise ValueError(
-                'Required property \'target\' not present in ChannelTransferInfo JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ChannelTransferInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ChannelTransferInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ChannelTransferTarget():
+class ChannelTransferTarget(Model):
     """
     An object specifying target channels available for the transfer. Each property of this
     object represents an available transfer target. Currently, the only supported property
@@ -928,6 +725,12 @@ class ChannelTransferTarget():
           the web chat integration.
     """
 
+    __slots__ = ('chat',)
+
+    _fields = (
+        ModelField('chat', 'model', 'ChannelTransferTargetChat'),
+    )
+
     def __init__(self, *, chat: 'ChannelTransferTargetChat' = None) -> None:
         """
         Initialize a ChannelTransferTarget object.
@@ -937,53 +740,20 @@ class ChannelTransferTarget():
         """
         self.chat = chat
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferTarget':
-        """Initialize a ChannelTransferTarget object from a json dictionary."""
-        args = {}
-        if 'chat' in _dict:
-            args['chat'] = ChannelTransferTargetChat.from_dict(
-                _dict.get('chat'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferTarget object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'chat') and self.chat is not None:
-            _dict['chat'] = self.chat.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferTarget object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'ChannelTransferTarget') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ChannelTransferTarget') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ChannelTransferTargetChat():
+class ChannelTransferTargetChat(Model):
     """
     Information for transferring to the web chat integration.
 
     :attr str url: (optional) The URL of the target web chat.
     """
 
+    __slots__ = ('url',)
+
+    _fields = (
+        ModelField('url'),
+    )
+
     def __init__(self, *, url: str = None) -> None:
         """
         Initialize a ChannelTransferTargetChat object.
@@ -992,46 +762,8 @@ class ChannelTransferTargetChat():
         """
         self.url = url
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ChannelTransferTargetChat':
-        """Initialize a ChannelTransferTargetChat object from a json dictionary."""
-        args = {}
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ChannelTransferTargetChat object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ChannelTransferTargetChat object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ChannelTransferTargetChat') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ChannelTransferTargetChat') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class DialogLogMessage():
+class DialogLogMessage(Model):
     """
     Dialog log message details.
 
@@ -1043,6 +775,15 @@ class DialogLogMessage():
           element that generated the error message.
     """
 
+    __slots__ = ('level', 'message', 'code', 'source')
+
+    _fields = (
+        ModelField('level', required=True),
+        ModelField('message', required=True),
+        ModelField('code', required=True),
+        ModelField('source', 'model', 'LogMessageSource'),
+    )
+
     def __init__(self,
                  level: str,
                  message: str,
@@ -1064,68 +805,6 @@ class DialogLogMessage():
         self.code = code
         self.source = source
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogLogMessage':
-        """Initialize a DialogLogMessage object from a json dictionary."""
-        args = {}
-        if 'level' in _dict:
-            args['level'] = _dict.get('level')
-        else:
-            raise ValueError(
-                'Required property \'level\' not present in DialogLogMessage JSON'
-            )
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        else:
-            raise ValueError(
-                'Required property \'message\' not present in DialogLogMessage JSON'
-            )
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in DialogLogMessage JSON'
-            )
-        if 'source' in _dict:
-            args['source'] = LogMessageSource.from_dict(_dict.get('source'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogLogMessage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'level') and self.level is not None:
-            _dict['level'] = self.level
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogLogMessage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogLogMessage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogLogMessage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LevelEnum(str, Enum):
         """
         The severity of the log message.
@@ -1135,7 +814,7 @@ class DialogLogMessage():
         WARN = 'warn'
 
 
-class DialogNodeAction():
+class DialogNodeAction(Model):
     """
     DialogNodeAction.
 
@@ -1149,6 +828,16 @@ class DialogNodeAction():
           client application will use to pass in credentials for the action.
     """
 
+    __slots__ = ('name', 'type', 'parameters', 'result_variable', 'credentials')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('type'),
+        ModelField('parameters'),
+        ModelField('result_variable', required=True),
+        ModelField('credentials'),
+    )
+
     def __init__(self,
                  name: str,
                  result_variable: str,
@@ -1174,69 +863,6 @@ class DialogNodeAction():
         self.result_variable = result_variable
         self.credentials = credentials
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeAction':
-        """Initialize a DialogNodeAction object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in DialogNodeAction JSON'
-            )
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'parameters' in _dict:
-            args['parameters'] = _dict.get('parameters')
-        if 'result_variable' in _dict:
-            args['result_variable'] = _dict.get('result_variable')
-        else:
-            raise ValueError(
-                'Required property \'result_variable\' not present in DialogNodeAction JSON'
-            )
-        if 'credentials' in _dict:
-            args['credentials'] = _dict.get('credentials')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeAction object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'parameters') and self.parameters is not None:
-            _dict['parameters'] = self.parameters
-        if hasattr(self,
-                   'result_variable') and self.result_variable is not None:
-            _dict['result_variable'] = self.result_variable
-        if hasattr(self, 'credentials') and self.credentials is not None:
-            _dict['credentials'] = self.credentials
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeAction object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeAction') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeAction') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of action to invoke.
@@ -1247,13 +873,19 @@ class DialogNodeAction():
         CLOUD_FUNCTION = 'cloud-function'
 
 
-class DialogNodeOutputConnectToAgentTransferInfo():
+class DialogNodeOutputConnectToAgentTransferInfo(Model):
     """
     Routing or other contextual information to be used by target service desk systems.
 
     :attr dict target: (optional)
     """
 
+    __slots__ = ('target',)
+
+    _fields = (
+        ModelField('target'),
+    )
+
     def __init__(self, *, target: dict = None) -> None:
         """
         Initialize a DialogNodeOutputConnectToAgentTransferInfo object.
@@ -1262,49 +894,8 @@ class DialogNodeOutputConnectToAgentTransferInfo():
         """
         self.target = target
 
-    @classmethod
-    def from_dict(cls,
-                  _dict: Dict) -> 'DialogNodeOutputConnectToAgentTransferInfo':
-        """Initialize a DialogNodeOutputConnectToAgentTransferInfo object from a json dictionary."""
-        args = {}
-        if 'target' in _dict:
-            args['target'] = _dict.get('target')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputConnectToAgentTransferInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputConnectToAgentTransferInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self,
-               other: 'DialogNodeOutputConnectToAgentTransferInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'DialogNodeOutputConnectToAgentTransferInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputOptionsElement():
+class DialogNodeOutputOptionsElement(Model):
     """
     DialogNodeOutputOptionsElement.
 
@@ -1313,6 +904,14 @@ class DialogNodeOutputOptionsElement():
           input to be sent to the assistant if the user selects the corresponding option.
     """
 
+    __slots__ = ('label', 'value')
+
+    _fields = (
+        ModelField('label', required=True),
+        ModelField('value', 'model', 'DialogNodeOutputOptionsElementValue',
+                   required=True),
+    )
+
     def __init__(self, label: str,
                  value: 'DialogNodeOutputOptionsElementValue') -> None:
         """
@@ -1326,59 +925,8 @@ class DialogNodeOutputOptionsElement():
         self.label = label
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputOptionsElement':
-        """Initialize a DialogNodeOutputOptionsElement object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        else:
-            raise ValueError(
-                'Required property \'label\' not present in DialogNodeOutputOptionsElement JSON'
-            )
-        if 'value' in _dict:
-            args['value'] = DialogNodeOutputOptionsElementValue.from_dict(
-                _dict.get('value'))
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in DialogNodeOutputOptionsElement JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputOptionsElement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputOptionsElement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeOutputOptionsElement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeOutputOptionsElement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogNodeOutputOptionsElementValue():
+class DialogNodeOutputOptionsElementValue(Model):
     """
     An object defining the message input to be sent to the assistant if the user selects
     the corresponding option.
@@ -1387,6 +935,12 @@ class DialogNodeOutputOptionsElementValue():
           text.
     """
 
+    __slots__ = ('input',)
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+    )
+
     def __init__(self, *, input: 'MessageInput' = None) -> None:
         """
         Initialize a DialogNodeOutputOptionsElementValue object.
@@ -1396,46 +950,8 @@ class DialogNodeOutputOptionsElementValue():
         """
         self.input = input
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodeOutputOptionsElementValue':
-        """Initialize a DialogNodeOutputOptionsElementValue object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodeOutputOptionsElementValue object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodeOutputOptionsElementValue object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodeOutputOptionsElementValue') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogNodeOutputOptionsElementValue') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class DialogNodesVisited():
+class DialogNodesVisited(Model):
     """
     DialogNodesVisited.
 
@@ -1445,6 +961,14 @@ class DialogNodesVisited():
     :attr str conditions: (optional) The conditions that trigger the dialog node.
     """
 
+    __slots__ = ('dialog_node', 'title', 'conditions')
+
+    _fields = (
+        ModelField('dialog_node'),
+        ModelField('title'),
+        ModelField('conditions'),
+    )
+
     def __init__(self,
                  *,
                  dialog_node: str = None,
@@ -1463,54 +987,8 @@ class DialogNodesVisited():
         self.title = title
         self.conditions = conditions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogNodesVisited':
-        """Initialize a DialogNodesVisited object from a json dictionary."""
-        args = {}
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'conditions' in _dict:
-            args['conditions'] = _dict.get('conditions')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogNodesVisited object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'conditions') and self.conditions is not None:
-            _dict['conditions'] = self.conditions
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogNodesVisited object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogNodesVisited') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'DialogNodesVisited') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogSuggestion():
+class DialogSuggestion(Model):
     """
     DialogSuggestion.
 
@@ -1524,6 +1002,14 @@ class DialogSuggestion():
           Watson Assistant service if the user selects the corresponding option.
     """
 
+    __slots__ = ('label', 'value', 'output')
+
+    _fields = (
+        ModelField('label', required=True),
+        ModelField('value', 'model', 'DialogSuggestionValue', required=True),
+        ModelField('output'),
+    )
+
     def __init__(self,
                  label: str,
                  value: 'DialogSuggestionValue',
@@ -1545,62 +1031,8 @@ class DialogSuggestion():
         self.value = value
         self.output = output
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogSuggestion':
-        """Initialize a DialogSuggestion object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        else:
-            raise ValueError(
-                'Required property \'label\' not present in DialogSuggestion JSON'
-            )
-        if 'value' in _dict:
-            args['value'] = DialogSuggestionValue.from_dict(_dict.get('value'))
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in DialogSuggestion JSON'
-            )
-        if 'output' in _dict:
-            args['output'] = _dict.get('output')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogSuggestion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value.to_dict()
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogSuggestion object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DialogSuggestion') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogSuggestion') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DialogSuggestionValue():
+class DialogSuggestionValue(Model):
     """
     An object defining the message input to be sent to the assistant if the user selects
     the corresponding disambiguation option.
@@ -1609,6 +1041,12 @@ class DialogSuggestionValue():
           text.
     """
 
+    __slots__ = ('input',)
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+    )
+
     def __init__(self, *, input: 'MessageInput' = None) -> None:
         """
         Initialize a DialogSuggestionValue object.
@@ -1618,46 +1056,8 @@ class DialogSuggestionValue():
         """
         self.input = input
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DialogSuggestionValue':
-        """Initialize a DialogSuggestionValue object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DialogSuggestionValue object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DialogSuggestionValue object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DialogSuggestionValue') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DialogSuggestionValue') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Log():
+class Log(Model):
     """
     Log.
 
@@ -1680,6 +1080,24 @@ class Log():
           any.
     """
 
+    __slots__ = ('log_id', 'request', 'response', 'assistant_id', 'session_id',
+                 'skill_id', 'snapshot', 'request_timestamp',
+                 'response_timestamp', 'language', 'customer_id')
+
+    _fields = (
+        ModelField('log_id', required=True),
+        ModelField('request', 'model', 'MessageRequest', required=True),
+        ModelField('response', 'model', 'MessageResponse', required=True),
+        ModelField('assistant_id', required=True),
+        ModelField('session_id', required=True),
+        ModelField('skill_id', required=True),
+        ModelField('snapshot', required=True),
+        ModelField('request_timestamp', required=True),
+        ModelField('response_timestamp', required=True),
+        ModelField('language', required=True),
+        ModelField('customer_id'),
+    )
+
     def __init__(self,
                  log_id: str,
                  request: 'MessageRequest',
@@ -1727,121 +1145,8 @@ class Log():
         self.language = language
         self.customer_id = customer_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Log':
-        """Initialize a Log object from a json dictionary."""
-        args = {}
-        if 'log_id' in _dict:
-            args['log_id'] = _dict.get('log_id')
-        else:
-            raise ValueError(
-                'Required property \'log_id\' not present in Log JSON')
-        if 'request' in _dict:
-            args['request'] = MessageRequest.from_dict(_dict.get('request'))
-        else:
-            raise ValueError(
-                'Required property \'request\' not present in Log JSON')
-        if 'response' in _dict:
-            args['response'] = MessageResponse.from_dict(_dict.get('response'))
-        else:
-            raise ValueError(
-                'Required property \'response\' not present in Log JSON')
-        if 'assistant_id' in _dict:
-            args['assistant_id'] = _dict.get('assistant_id')
-        else:
-            raise ValueError(
-                'Required property \'assistant_id\' not present in Log JSON')
-        if 'session_id' in _dict:
-            args['session_id'] = _dict.get('session_id')
-        else:
-            raise ValueError(
-                'Required property \'session_id\' not present in Log JSON')
-        if 'skill_id' in _dict:
-            args['skill_id'] = _dict.get('skill_id')
-        else:
-            raise ValueError(
-                'Required property \'skill_id\' not present in Log JSON')
-        if 'snapshot' in _dict:
-            args['snapshot'] = _dict.get('snapshot')
-        else:
-            raise ValueError(
-                'Required property \'snapshot\' not present in Log JSON')
-        if 'request_timestamp' in _dict:
-            args['request_timestamp'] = _dict.get('request_timestamp')
-        else:
-            raise ValueError(
-                'Required property \'request_timestamp\' not present in Log JSON'
-            )
-        if 'response_timestamp' in _dict:
-            args['response_timestamp'] = _dict.get('response_timestamp')
-        else:
-            raise ValueError(
-                'Required property \'response_timestamp\' not present in Log JSON'
-            )
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in Log JSON')
-        if 'customer_id' in _dict:
-            args['customer_id'] = _dict.get('customer_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Log object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'log_id') and self.log_id is not None:
-            _dict['log_id'] = self.log_id
-        if hasattr(self, 'request') and self.request is not None:
-            _dict['request'] = self.request.to_dict()
-        if hasattr(self, 'response') and self.response is not None:
-            _dict['response'] = self.response.to_dict()
-        if hasattr(self, 'assistant_id') and self.assistant_id is not None:
-            _dict['assistant_id'] = self.assistant_id
-        if hasattr(self, 'session_id') and self.session_id is not None:
-            _dict['session_id'] = self.session_id
-        if hasattr(self, 'skill_id') and self.skill_id is not None:
-            _dict['skill_id'] = self.skill_id
-        if hasattr(self, 'snapshot') and self.snapshot is not None:
-            _dict['snapshot'] = self.snapshot
-        if hasattr(self,
-                   'request_timestamp') and self.request_timestamp is not None:
-            _dict['request_timestamp'] = self.request_timestamp
-        if hasattr(
-                self,
-                'response_timestamp') and self.response_timestamp is not None:
-            _dict['response_timestamp'] = self.response_timestamp
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'customer_id') and self.customer_id is not None:
-            _dict['customer_id'] = self.customer_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Log object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Log') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Log') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class LogCollection():
+class LogCollection(Model):
     """
     LogCollection.
 
@@ -1849,6 +1154,13 @@ class LogCollection():
     :attr LogPagination pagination: The pagination data for the returned objects.
     """
 
+    __slots__ = ('logs', 'pagination')
+
+    _fields = (
+        ModelField('logs', 'list', 'Log', required=True),
+        ModelField('pagination', 'model', 'LogPagination', required=True),
+    )
+
     def __init__(self, logs: List['Log'], pagination: 'LogPagination') -> None:
         """
         Initialize a LogCollection object.
@@ -1860,63 +1172,26 @@ class LogCollection():
         self.logs = logs
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogCollection':
-        """Initialize a LogCollection object from a json dictionary."""
-        args = {}
-        if 'logs' in _dict:
-            args['logs'] = [Log.from_dict(x) for x in _dict.get('logs')]
-        else:
-            raise ValueError(
-                'Required property \'logs\' not present in LogCollection JSON')
-        if 'pagination' in _dict:
-            args['pagination'] = LogPagination.from_dict(
-                _dict.get('pagination'))
-        else:
-            raise ValueError(
-                'Required property \'pagination\' not present in LogCollection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'logs') and self.logs is not None:
-            _dict['logs'] = [x.to_dict() for x in self.logs]
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class LogMessageSource():
+class LogMessageSource(Model):
     """
     An object that identifies the dialog element that generated the error message.
 
     """
 
+    __slots__ = ()
+
+    _fields = ()
+
+    _discriminator = ModelDiscriminator(
+        'type', {
+            'dialog_node': 'LogMessageSourceDialogNode',
+            'action': 'LogMessageSourceAction',
+            'step': 'LogMessageSourceStep',
+            'handler': 'LogMessageSourceHandler'
+        },
+        abstract=True)
+
     def __init__(self) -> None:
         """
         Initialize a LogMessageSource object.
@@ -1929,49 +1204,8 @@ class LogMessageSource():
             ]))
         raise Exception(msg)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSource':
-        """Initialize a LogMessageSource object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        msg = (
-            "Cannot convert dictionary into an instance of base class 'LogMessageSource'. "
-            + "The discriminator value should map to a valid subclass: {1}"
-        ).format(", ".join([
-            'LogMessageSourceDialogNode', 'LogMessageSourceAction',
-            'LogMessageSourceStep', 'LogMessageSourceHandler'
-        ]))
-        raise Exception(msg)
 
-    @classmethod
-    def _from_dict(cls, _dict: Dict):
-        """Initialize a LogMessageSource object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping['dialog_node'] = 'LogMessageSourceDialogNode'
-        mapping['action'] = 'LogMessageSourceAction'
-        mapping['step'] = 'LogMessageSourceStep'
-        mapping['handler'] = 'LogMessageSourceHandler'
-        disc_value = _dict.get('type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'type\' not found in LogMessageSource JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class LogPagination():
+class LogPagination(Model):
     """
     The pagination data for the returned objects.
 
@@ -1981,6 +1215,14 @@ class LogPagination():
     :attr str next_cursor: (optional) A token identifying the next page of results.
     """
 
+    __slots__ = ('next_url', 'matched', 'next_cursor')
+
+    _fields = (
+        ModelField('next_url'),
+        ModelField('matched'),
+        ModelField('next_cursor'),
+    )
+
     def __init__(self,
                  *,
                  next_url: str = None,
@@ -1999,54 +1241,8 @@ class LogPagination():
         self.matched = matched
         self.next_cursor = next_cursor
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogPagination':
-        """Initialize a LogPagination object from a json dictionary."""
-        args = {}
-        if 'next_url' in _dict:
-            args['next_url'] = _dict.get('next_url')
-        if 'matched' in _dict:
-            args['matched'] = _dict.get('matched')
-        if 'next_cursor' in _dict:
-            args['next_cursor'] = _dict.get('next_cursor')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogPagination object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'next_url') and self.next_url is not None:
-            _dict['next_url'] = self.next_url
-        if hasattr(self, 'matched') and self.matched is not None:
-            _dict['matched'] = self.matched
-        if hasattr(self, 'next_cursor') and self.next_cursor is not None:
-            _dict['next_cursor'] = self.next_cursor
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogPagination object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogPagination') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'LogPagination') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageContext():
+class MessageContext(Model):
     """
     MessageContext.
 
@@ -2058,6 +1254,13 @@ class MessageContext():
           variables that apply to the dialog skill used by the assistant.
     """
 
+    __slots__ = ('global_', 'skills')
+
+    _fields = (
+        ModelField('global_', 'model', 'MessageContextGlobal', key='global'),
+        ModelField('skills', 'dict', 'MessageContextSkill'),
+    )
+
     def __init__(self,
                  *,
                  global_: 'MessageContextGlobal' = None,
@@ -2075,54 +1278,8 @@ class MessageContext():
         self.global_ = global_
         self.skills = skills
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContext':
-        """Initialize a MessageContext object from a json dictionary."""
-        args = {}
-        if 'global' in _dict:
-            args['global_'] = MessageContextGlobal.from_dict(
-                _dict.get('global'))
-        if 'skills' in _dict:
-            args['skills'] = {
-                k: MessageContextSkill.from_dict(v)
-                for k, v in _dict.get('skills').items()
-            }
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContext object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'global_') and self.global_ is not None:
-            _dict['global'] = self.global_.to_dict()
-        if hasattr(self, 'skills') and self.skills is not None:
-            _dict['skills'] = {k: v.to_dict() for k, v in self.skills.items()}
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContext object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MessageContext') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContext') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageContextGlobal():
+class MessageContextGlobal(Model):
     """
     Session context data that is shared by all skills used by the Assistant.
 
@@ -2131,6 +1288,13 @@ class MessageContextGlobal():
     :attr str session_id: (optional) The session ID.
     """
 
+    __slots__ = ('system', 'session_id')
+
+    _fields = (
+        ModelField('system', 'model', 'MessageContextGlobalSystem'),
+        ModelField('session_id'),
+    )
+
     def __init__(self,
                  *,
                  system: 'MessageContextGlobalSystem' = None,
@@ -2144,52 +1308,8 @@ class MessageContextGlobal():
         self.system = system
         self.session_id = session_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextGlobal':
-        """Initialize a MessageContextGlobal object from a json dictionary."""
-        args = {}
-        if 'system' in _dict:
-            args['system'] = MessageContextGlobalSystem.from_dict(
-                _dict.get('system'))
-        if 'session_id' in _dict:
-            args['session_id'] = _dict.get('session_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextGlobal object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'system') and self.system is not None:
-            _dict['system'] = self.system.to_dict()
-        if hasattr(self, 'session_id') and getattr(self,
-                                                   'session_id') is not None:
-            _dict['session_id'] = getattr(self, 'session_id')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextGlobal object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextGlobal') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextGlobal') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class MessageContextGlobalStateless():
+class MessageContextGlobalStateless(Model):
     """
     Session context data that is shared by all skills used by the Assistant.
 
@@ -2198,6 +1318,13 @@ class MessageContextGlobalStateless():
     :attr str session_id: (optional) The unique identifier of the session.
     """
 
+    __slots__ = ('system', 'session_id')
+
+    _fields = (
+        ModelField('system', 'model', 'MessageContextGlobalSystem'),
+        ModelField('session_id'),
+    )
+
     def __init__(self,
                  *,
                  system: 'MessageContextGlobalSystem' = None,
@@ -2212,51 +1339,8 @@ class MessageContextGlobalStateless():
         self.system = system
         self.session_id = session_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextGlobalStateless':
-        """Initialize a MessageContextGlobalStateless object from a json dictionary."""
-        args = {}
-        if 'system' in _dict:
-            args['system'] = MessageContextGlobalSystem.from_dict(
-                _dict.get('system'))
-        if 'session_id' in _dict:
-            args['session_id'] = _dict.get('session_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextGlobalStateless object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'system') and self.system is not None:
-            _dict['system'] = self.system.to_dict()
-        if hasattr(self, 'session_id') and self.session_id is not None:
-            _dict['session_id'] = self.session_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextGlobalStateless object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextGlobalStateless') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextGlobalStateless') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MessageContextGlobalSystem():
+class MessageContextGlobalSystem(Model):
     """
     Built-in system properties that apply to all skills used by the assistant.
 
@@ -2308,6 +1392,19 @@ class MessageContextGlobalSystem():
           assistant uses).
     """
 
+    __slots__ = ('timezone', 'user_id', 'turn_count', 'locale',
+                 'reference_time', 'session_start_time', 'state')
+
+    _fields = (
+        ModelField('timezone'),
+        ModelField('user_id'),
+        ModelField('turn_count'),
+        ModelField('locale'),
+        ModelField('reference_time'),
+        ModelField('session_start_time'),
+        ModelField('state'),
+    )
+
     def __init__(self,
                  *,
                  timezone: str = None,
@@ -2377,70 +1474,6 @@ class MessageContextGlobalSystem():
         self.session_start_time = session_start_time
         self.state = state
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextGlobalSystem':
-        """Initialize a MessageContextGlobalSystem object from a json dictionary."""
-        args = {}
-        if 'timezone' in _dict:
-            args['timezone'] = _dict.get('timezone')
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        if 'turn_count' in _dict:
-            args['turn_count'] = _dict.get('turn_count')
-        if 'locale' in _dict:
-            args['locale'] = _dict.get('locale')
-        if 'reference_time' in _dict:
-            args['reference_time'] = _dict.get('reference_time')
-        if 'session_start_time' in _dict:
-            args['session_start_time'] = _dict.get('session_start_time')
-        if 'state' in _dict:
-            args['state'] = _dict.get('state')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextGlobalSystem object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'timezone') and self.timezone is not None:
-            _dict['timezone'] = self.timezone
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        if hasattr(self, 'turn_count') and self.turn_count is not None:
-            _dict['turn_count'] = self.turn_count
-        if hasattr(self, 'locale') and self.locale is not None:
-            _dict['locale'] = self.locale
-        if hasattr(self, 'reference_time') and self.reference_time is not None:
-            _dict['reference_time'] = self.reference_time
-        if hasattr(
-                self,
-                'session_start_time') and self.session_start_time is not None:
-            _dict['session_start_time'] = self.session_start_time
-        if hasattr(self, 'state') and self.state is not None:
-            _dict['state'] = self.state
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextGlobalSystem object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextGlobalSystem') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextGlobalSystem') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LocaleEnum(str, Enum):
         """
         The language code for localization in the user input. The specified locale
@@ -2467,7 +1500,7 @@ class MessageContextGlobalSystem():
         ZH_TW = 'zh-tw'
 
 
-class MessageContextSkill():
+class MessageContextSkill(Model):
     """
     Contains information specific to a particular skill used by the Assistant. The
     property name must be the same as the name of the skill (for example, `main skill`).
@@ -2478,6 +1511,13 @@ class MessageContextSkill():
           the skill.
     """
 
+    __slots__ = ('user_defined', 'system')
+
+    _fields = (
+        ModelField('user_defined'),
+        ModelField('system', 'model', 'MessageContextSkillSystem'),
+    )
+
     def __init__(self,
                  *,
                  user_defined: dict = None,
@@ -2493,51 +1533,8 @@ class MessageContextSkill():
         self.user_defined = user_defined
         self.system = system
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextSkill':
-        """Initialize a MessageContextSkill object from a json dictionary."""
-        args = {}
-        if 'user_defined' in _dict:
-            args['user_defined'] = _dict.get('user_defined')
-        if 'system' in _dict:
-            args['system'] = MessageContextSkillSystem.from_dict(
-                _dict.get('system'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextSkill object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'user_defined') and self.user_defined is not None:
-            _dict['user_defined'] = self.user_defined
-        if hasattr(self, 'system') and self.system is not None:
-            _dict['system'] = self.system.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextSkill object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MessageContextSkill') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextSkill') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageContextSkillSystem():
+class MessageContextSkillSystem(Model):
     """
     System context data used by the skill.
 
@@ -2548,6 +1545,12 @@ class MessageContextSkillSystem():
           state value to restore a paused conversation whose session is expired.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('state'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['state'])
 
@@ -2566,38 +1569,6 @@ class MessageContextSkillSystem():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextSkillSystem':
-        """Initialize a MessageContextSkillSystem object from a json dictionary."""
-        args = {}
-        if 'state' in _dict:
-            args['state'] = _dict.get('state')
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextSkillSystem object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'state') and self.state is not None:
-            _dict['state'] = self.state
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in MessageContextSkillSystem._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of MessageContextSkillSystem"""
         _dict = {}
@@ -2621,22 +1592,8 @@ class MessageContextSkillSystem():
             if _key not in MessageContextSkillSystem._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextSkillSystem object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextSkillSystem') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextSkillSystem') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class MessageContextStateless():
+class MessageContextStateless(Model):
     """
     MessageContextStateless.
 
@@ -2648,6 +1605,14 @@ class MessageContextStateless():
           variables that apply to the dialog skill used by the assistant.
     """
 
+    __slots__ = ('global_', 'skills')
+
+    _fields = (
+        ModelField('global_', 'model', 'MessageContextGlobalStateless',
+                   key='global'),
+        ModelField('skills', 'dict', 'MessageContextSkill'),
+    )
+
     def __init__(self,
                  *,
                  global_: 'MessageContextGlobalStateless' = None,
@@ -2665,54 +1630,8 @@ class MessageContextStateless():
         self.global_ = global_
         self.skills = skills
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageContextStateless':
-        """Initialize a MessageContextStateless object from a json dictionary."""
-        args = {}
-        if 'global' in _dict:
-            args['global_'] = MessageContextGlobalStateless.from_dict(
-                _dict.get('global'))
-        if 'skills' in _dict:
-            args['skills'] = {
-                k: MessageContextSkill.from_dict(v)
-                for k, v in _dict.get('skills').items()
-            }
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageContextStateless object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'global_') and self.global_ is not None:
-            _dict['global'] = self.global_.to_dict()
-        if hasattr(self, 'skills') and self.skills is not None:
-            _dict['skills'] = {k: v.to_dict() for k, v in self.skills.items()}
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageContextStateless object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageContextStateless') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageContextStateless') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MessageInput():
+class MessageInput(Model):
     """
     An input object that includes the input text.
 
@@ -2735,6 +1654,18 @@ class MessageInput():
           how the assistant responds.
     """
 
+    __slots__ = ('message_type', 'text', 'intents', 'entities', 'suggestion_id',
+                 'options')
+
+    _fields = (
+        ModelField('message_type'),
+        ModelField('text'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('suggestion_id'),
+        ModelField('options', 'model', 'MessageInputOptions'),
+    )
+
     def __init__(self,
                  *,
                  message_type: str = None,
@@ -2773,69 +1704,6 @@ class MessageInput():
         self.suggestion_id = suggestion_id
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInput':
-        """Initialize a MessageInput object from a json dictionary."""
-        args = {}
-        if 'message_type' in _dict:
-            args['message_type'] = _dict.get('message_type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'suggestion_id' in _dict:
-            args['suggestion_id'] = _dict.get('suggestion_id')
-        if 'options' in _dict:
-            args['options'] = MessageInputOptions.from_dict(
-                _dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'message_type') and self.message_type is not None:
-            _dict['message_type'] = self.message_type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'suggestion_id') and self.suggestion_id is not None:
-            _dict['suggestion_id'] = self.suggestion_id
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageInput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class MessageTypeEnum(str, Enum):
         """
         The type of the message:
@@ -2849,7 +1717,7 @@ class MessageInput():
         SEARCH = 'search'
 
 
-class MessageInputOptions():
+class MessageInputOptions(Model):
     """
     Optional properties that control how the assistant responds.
 
@@ -2876,6 +1744,18 @@ class MessageInputOptions():
           of **return_context**.
     """
 
+    __slots__ = ('restart', 'alternate_intents', 'spelling', 'debug',
+                 'return_context', 'export')
+
+    _fields = (
+        ModelField('restart'),
+        ModelField('alternate_intents'),
+        ModelField('spelling', 'model', 'MessageInputOptionsSpelling'),
+        ModelField('debug'),
+        ModelField('return_context'),
+        ModelField('export'),
+    )
+
     def __init__(self,
                  *,
                  restart: bool = None,
@@ -2917,68 +1797,8 @@ class MessageInputOptions():
         self.return_context = return_context
         self.export = export
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInputOptions':
-        """Initialize a MessageInputOptions object from a json dictionary."""
-        args = {}
-        if 'restart' in _dict:
-            args['restart'] = _dict.get('restart')
-        if 'alternate_intents' in _dict:
-            args['alternate_intents'] = _dict.get('alternate_intents')
-        if 'spelling' in _dict:
-            args['spelling'] = MessageInputOptionsSpelling.from_dict(
-                _dict.get('spelling'))
-        if 'debug' in _dict:
-            args['debug'] = _dict.get('debug')
-        if 'return_context' in _dict:
-            args['return_context'] = _dict.get('return_context')
-        if 'export' in _dict:
-            args['export'] = _dict.get('export')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInputOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'restart') and self.restart is not None:
-            _dict['restart'] = self.restart
-        if hasattr(self,
-                   'alternate_intents') and self.alternate_intents is not None:
-            _dict['alternate_intents'] = self.alternate_intents
-        if hasattr(self, 'spelling') and self.spelling is not None:
-            _dict['spelling'] = self.spelling.to_dict()
-        if hasattr(self, 'debug') and self.debug is not None:
-            _dict['debug'] = self.debug
-        if hasattr(self, 'return_context') and self.return_context is not None:
-            _dict['return_context'] = self.return_context
-        if hasattr(self, 'export') and self.export is not None:
-            _dict['export'] = self.export
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInputOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageInputOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInputOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MessageInputOptionsSpelling():
+class MessageInputOptionsSpelling(Model):
     """
     Spelling correction options for the message. Any options specified on an individual
     message override the settings configured for the skill.
@@ -2998,6 +1818,13 @@ class MessageInputOptionsSpelling():
           settings for the skill.
     """
 
+    __slots__ = ('suggestions', 'auto_correct')
+
+    _fields = (
+        ModelField('suggestions'),
+        ModelField('auto_correct'),
+    )
+
     def __init__(self,
                  *,
                  suggestions: bool = None,
@@ -3022,50 +1849,8 @@ class MessageInputOptionsSpelling():
         self.suggestions = suggestions
         self.auto_correct = auto_correct
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInputOptionsSpelling':
-        """Initialize a MessageInputOptionsSpelling object from a json dictionary."""
-        args = {}
-        if 'suggestions' in _dict:
-            args['suggestions'] = _dict.get('suggestions')
-        if 'auto_correct' in _dict:
-            args['auto_correct'] = _dict.get('auto_correct')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInputOptionsSpelling object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'suggestions') and self.suggestions is not None:
-            _dict['suggestions'] = self.suggestions
-        if hasattr(self, 'auto_correct') and self.auto_correct is not None:
-            _dict['auto_correct'] = self.auto_correct
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInputOptionsSpelling object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageInputOptionsSpelling') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInputOptionsSpelling') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class MessageInputOptionsStateless():
+class MessageInputOptionsStateless(Model):
     """
     Optional properties that control how the assistant responds.
 
@@ -3082,6 +1867,15 @@ class MessageInputOptionsStateless():
           `output.debug` property.
     """
 
+    __slots__ = ('restart', 'alternate_intents', 'spelling', 'debug')
+
+    _fields = (
+        ModelField('restart'),
+        ModelField('alternate_intents'),
+        ModelField('spelling', 'model', 'MessageInputOptionsSpelling'),
+        ModelField('debug'),
+    )
+
     def __init__(self,
                  *,
                  restart: bool = None,
@@ -3108,60 +1902,8 @@ class MessageInputOptionsStateless():
         self.spelling = spelling
         self.debug = debug
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInputOptionsStateless':
-        """Initialize a MessageInputOptionsStateless object from a json dictionary."""
-        args = {}
-        if 'restart' in _dict:
-            args['restart'] = _dict.get('restart')
-        if 'alternate_intents' in _dict:
-            args['alternate_intents'] = _dict.get('alternate_intents')
-        if 'spelling' in _dict:
-            args['spelling'] = MessageInputOptionsSpelling.from_dict(
-                _dict.get('spelling'))
-        if 'debug' in _dict:
-            args['debug'] = _dict.get('debug')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInputOptionsStateless object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'restart') and self.restart is not None:
-            _dict['restart'] = self.restart
-        if hasattr(self,
-                   'alternate_intents') and self.alternate_intents is not None:
-            _dict['alternate_intents'] = self.alternate_intents
-        if hasattr(self, 'spelling') and self.spelling is not None:
-            _dict['spelling'] = self.spelling.to_dict()
-        if hasattr(self, 'debug') and self.debug is not None:
-            _dict['debug'] = self.debug
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInputOptionsStateless object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageInputOptionsStateless') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInputOptionsStateless') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageInputStateless():
+class MessageInputStateless(Model):
     """
     An input object that includes the input text.
 
@@ -3184,6 +1926,18 @@ class MessageInputStateless():
           control how the assistant responds.
     """
 
+    __slots__ = ('message_type', 'text', 'intents', 'entities', 'suggestion_id',
+                 'options')
+
+    _fields = (
+        ModelField('message_type'),
+        ModelField('text'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('suggestion_id'),
+        ModelField('options', 'model', 'MessageInputOptionsStateless'),
+    )
+
     def __init__(self,
                  *,
                  message_type: str = None,
@@ -3222,69 +1976,6 @@ class MessageInputStateless():
         self.suggestion_id = suggestion_id
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageInputStateless':
-        """Initialize a MessageInputStateless object from a json dictionary."""
-        args = {}
-        if 'message_type' in _dict:
-            args['message_type'] = _dict.get('message_type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'suggestion_id' in _dict:
-            args['suggestion_id'] = _dict.get('suggestion_id')
-        if 'options' in _dict:
-            args['options'] = MessageInputOptionsStateless.from_dict(
-                _dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageInputStateless object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'message_type') and self.message_type is not None:
-            _dict['message_type'] = self.message_type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'suggestion_id') and self.suggestion_id is not None:
-            _dict['suggestion_id'] = self.suggestion_id
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageInputStateless object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageInputStateless') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageInputStateless') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class MessageTypeEnum(str, Enum):
         """
         The type of the message:
@@ -3298,7 +1989,7 @@ class MessageInputStateless():
         SEARCH = 'search'
 
 
-class MessageOutput():
+class MessageOutput(Model):
     """
     Assistant output to be rendered or processed by the client.
 
@@ -3320,6 +2011,19 @@ class MessageOutput():
           spelling corrections in the user input that was received.
     """
 
+    __slots__ = ('generic', 'intents', 'entities', 'actions', 'debug',
+                 'user_defined', 'spelling')
+
+    _fields = (
+        ModelField('generic', 'list', 'RuntimeResponseGeneric'),
+        ModelField('intents', 'list', 'RuntimeIntent'),
+        ModelField('entities', 'list', 'RuntimeEntity'),
+        ModelField('actions', 'list', 'DialogNodeAction'),
+        ModelField('debug', 'model', 'MessageOutputDebug'),
+        ModelField('user_defined'),
+        ModelField('spelling', 'model', 'MessageOutputSpelling'),
+    )
+
     def __init__(self,
                  *,
                  generic: List['RuntimeResponseGeneric'] = None,
@@ -3358,80 +2062,8 @@ class MessageOutput():
         self.user_defined = user_defined
         self.spelling = spelling
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageOutput':
-        """Initialize a MessageOutput object from a json dictionary."""
-        args = {}
-        if 'generic' in _dict:
-            args['generic'] = [
-                RuntimeResponseGeneric.from_dict(x)
-                for x in _dict.get('generic')
-            ]
-        if 'intents' in _dict:
-            args['intents'] = [
-                RuntimeIntent.from_dict(x) for x in _dict.get('intents')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                RuntimeEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'actions' in _dict:
-            args['actions'] = [
-                DialogNodeAction.from_dict(x) for x in _dict.get('actions')
-            ]
-        if 'debug' in _dict:
-            args['debug'] = MessageOutputDebug.from_dict(_dict.get('debug'))
-        if 'user_defined' in _dict:
-            args['user_defined'] = _dict.get('user_defined')
-        if 'spelling' in _dict:
-            args['spelling'] = MessageOutputSpelling.from_dict(
-                _dict.get('spelling'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageOutput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'generic') and self.generic is not None:
-            _dict['generic'] = [x.to_dict() for x in self.generic]
-        if hasattr(self, 'intents') and self.intents is not None:
-            _dict['intents'] = [x.to_dict() for x in self.intents]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'actions') and self.actions is not None:
-            _dict['actions'] = [x.to_dict() for x in self.actions]
-        if hasattr(self, 'debug') and self.debug is not None:
-            _dict['debug'] = self.debug.to_dict()
-        if hasattr(self, 'user_defined') and self.user_defined is not None:
-            _dict['user_defined'] = self.user_defined
-        if hasattr(self, 'spelling') and self.spelling is not None:
-            _dict['spelling'] = self.spelling.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageOutput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageOutput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'MessageOutput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageOutputDebug():
+class MessageOutputDebug(Model):
     """
     Additional detailed information about a message response and how it was generated.
 
@@ -3447,6 +2079,16 @@ class MessageOutputDebug():
           completed by itself or got interrupted.
     """
 
+    __slots__ = ('nodes_visited', 'log_messages', 'branch_exited',
+                 'branch_exited_reason')
+
+    _fields = (
+        ModelField('nodes_visited', 'list', 'DialogNodesVisited'),
+        ModelField('log_messages', 'list', 'DialogLogMessage'),
+        ModelField('branch_exited'),
+        ModelField('branch_exited_reason'),
+    )
+
     def __init__(self,
                  *,
                  nodes_visited: List['DialogNodesVisited'] = None,
@@ -3472,62 +2114,6 @@ class MessageOutputDebug():
         self.branch_exited = branch_exited
         self.branch_exited_reason = branch_exited_reason
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageOutputDebug':
-        """Initialize a MessageOutputDebug object from a json dictionary."""
-        args = {}
-        if 'nodes_visited' in _dict:
-            args['nodes_visited'] = [
-                DialogNodesVisited.from_dict(x)
-                for x in _dict.get('nodes_visited')
-            ]
-        if 'log_messages' in _dict:
-            args['log_messages'] = [
-                DialogLogMessage.from_dict(x) for x in _dict.get('log_messages')
-            ]
-        if 'branch_exited' in _dict:
-            args['branch_exited'] = _dict.get('branch_exited')
-        if 'branch_exited_reason' in _dict:
-            args['branch_exited_reason'] = _dict.get('branch_exited_reason')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageOutputDebug object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'nodes_visited') and self.nodes_visited is not None:
-            _dict['nodes_visited'] = [x.to_dict() for x in self.nodes_visited]
-        if hasattr(self, 'log_messages') and self.log_messages is not None:
-            _dict['log_messages'] = [x.to_dict() for x in self.log_messages]
-        if hasattr(self, 'branch_exited') and self.branch_exited is not None:
-            _dict['branch_exited'] = self.branch_exited
-        if hasattr(self, 'branch_exited_reason'
-                  ) and self.branch_exited_reason is not None:
-            _dict['branch_exited_reason'] = self.branch_exited_reason
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageOutputDebug object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageOutputDebug') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageOutputDebug') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class BranchExitedReasonEnum(str, Enum):
         """
         When `branch_exited` is set to `true` by the Assistant, the `branch_exited_reason`
@@ -3537,7 +2123,7 @@ class MessageOutputDebug():
         FALLBACK = 'fallback'
 
 
-class MessageOutputSpelling():
+class MessageOutputSpelling(Model):
     """
     Properties describing any spelling corrections in the user input that was received.
 
@@ -3551,6 +2137,14 @@ class MessageOutputSpelling():
           autocorrection is disabled.
     """
 
+    __slots__ = ('text', 'original_text', 'suggested_text')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('original_text'),
+        ModelField('suggested_text'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -3573,54 +2167,8 @@ class MessageOutputSpelling():
         self.original_text = original_text
         self.suggested_text = suggested_text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageOutputSpelling':
-        """Initialize a MessageOutputSpelling object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'original_text' in _dict:
-            args['original_text'] = _dict.get('original_text')
-        if 'suggested_text' in _dict:
-            args['suggested_text'] = _dict.get('suggested_text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageOutputSpelling object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'original_text') and self.original_text is not None:
-            _dict['original_text'] = self.original_text
-        if hasattr(self, 'suggested_text') and self.suggested_text is not None:
-            _dict['suggested_text'] = self.suggested_text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageOutputSpelling object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageOutputSpelling') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageOutputSpelling') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class MessageRequest():
+class MessageRequest(Model):
     """
     A stateful message request formatted for the Watson Assistant service.
 
@@ -3644,6 +2192,14 @@ class MessageRequest():
           specified at the root is used.
     """
 
+    __slots__ = ('input', 'context', 'user_id')
+
+    _fields = (
+        ModelField('input', 'model', 'MessageInput'),
+        ModelField('context', 'model', 'MessageContext'),
+        ModelField('user_id'),
+    )
+
     def __init__(self,
                  *,
                  input: 'MessageInput' = None,
@@ -3675,54 +2231,8 @@ class MessageRequest():
         self.context = context
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageRequest':
-        """Initialize a MessageRequest object from a json dictionary."""
-        args = {}
-        if 'input' in _dict:
-            args['input'] = MessageInput.from_dict(_dict.get('input'))
-        if 'context' in _dict:
-            args['context'] = MessageContext.from_dict(_dict.get('context'))
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageRequest object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input') and self.input is not None:
-            _dict['input'] = self.input.to_dict()
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageRequest object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageRequest') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageRequest') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageResponse():
+class MessageResponse(Model):
     """
     A response from the Watson Assistant service.
 
@@ -3745,6 +2255,14 @@ class MessageResponse():
           system context.
     """
 
+    __slots__ = ('output', 'context', 'user_id')
+
+    _fields = (
+        ModelField('output', 'model', 'MessageOutput', required=True),
+        ModelField('context', 'model', 'MessageContext'),
+        ModelField('user_id', required=True),
+    )
+
     def __init__(self,
                  output: 'MessageOutput',
                  user_id: str,
@@ -3775,62 +2293,8 @@ class MessageResponse():
         self.context = context
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageResponse':
-        """Initialize a MessageResponse object from a json dictionary."""
-        args = {}
-        if 'output' in _dict:
-            args['output'] = MessageOutput.from_dict(_dict.get('output'))
-        else:
-            raise ValueError(
-                'Required property \'output\' not present in MessageResponse JSON'
-            )
-        if 'context' in _dict:
-            args['context'] = MessageContext.from_dict(_dict.get('context'))
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        else:
-            raise ValueError(
-                'Required property \'user_id\' not present in MessageResponse JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output.to_dict()
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MessageResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MessageResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MessageResponseStateless():
+class MessageResponseStateless(Model):
     """
     A stateless response from the Watson Assistant service.
 
@@ -3851,6 +2315,15 @@ class MessageResponseStateless():
           system context.
     """
 
+    __slots__ = ('output', 'context', 'user_id')
+
+    _fields = (
+        ModelField('output', 'model', 'MessageOutput', required=True),
+        ModelField('context', 'model', 'MessageContextStateless',
+                   required=True),
+        ModelField('user_id'),
+    )
+
     def __init__(self,
                  output: 'MessageOutput',
                  context: 'MessageContextStateless',
@@ -3879,69 +2352,20 @@ class MessageResponseStateless():
         self.context = context
         self.user_id = user_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MessageResponseStateless':
-        """Initialize a MessageResponseStateless object from a json dictionary."""
-        args = {}
-        if 'output' in _dict:
-            args['output'] = MessageOutput.from_dict(_dict.get('output'))
-        else:
-            raise ValueError(
-                'Required property \'output\' not present in MessageResponseStateless JSON'
-            )
-        if 'context' in _dict:
-            args['context'] = MessageContextStateless.from_dict(
-                _dict.get('context'))
-        else:
-            raise ValueError(
-                'Required property \'context\' not present in MessageResponseStateless JSON'
-            )
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MessageResponseStateless object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'output') and self.output is not None:
-            _dict['output'] = self.output.to_dict()
-        if hasattr(self, 'context') and self.context is not None:
-            _dict['context'] = self.context.to_dict()
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MessageResponseStateless object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MessageResponseStateless') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'MessageResponseStateless') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ResponseGenericChannel():
+class ResponseGenericChannel(Model):
     """
     ResponseGenericChannel.
 
     :attr str channel: (optional) A channel for which the response is intended.
     """
 
+    __slots__ = ('channel',)
+
+    _fields = (
+        ModelField('channel'),
+    )
+
     def __init__(self, *, channel: str = None) -> None:
         """
         Initialize a ResponseGenericChannel object.
@@ -3951,46 +2375,8 @@ class ResponseGenericChannel():
         """
         self.channel = channel
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ResponseGenericChannel':
-        """Initialize a ResponseGenericChannel object from a json dictionary."""
-        args = {}
-        if 'channel' in _dict:
-            args['channel'] = _dict.get('channel')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ResponseGenericChannel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'channel') and self.channel is not None:
-            _dict['channel'] = self.channel
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ResponseGenericChannel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ResponseGenericChannel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ResponseGenericChannel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class RuntimeEntity():
+class RuntimeEntity(Model):
     """
     The entity value that was recognized in the user input.
 
@@ -4025,6 +2411,21 @@ class RuntimeEntity():
           enabled for the skill.
     """
 
+    __slots__ = ('entity', 'location', 'value', 'confidence', 'metadata',
+                 'groups', 'interpretation', 'alternatives', 'role')
+
+    _fields = (
+        ModelField('entity', required=True),
+        ModelField('location'),
+        ModelField('value', required=True),
+        ModelField('confidence'),
+        ModelField('metadata'),
+        ModelField('groups', 'list', 'CaptureGroup'),
+        ModelField('interpretation', 'model', 'RuntimeEntityInterpretation'),
+        ModelField('alternatives', 'list', 'RuntimeEntityAlternative'),
+        ModelField('role', 'model', 'RuntimeEntityRole'),
+    )
+
     def __init__(self,
                  entity: str,
                  value: str,
@@ -4083,91 +2484,8 @@ class RuntimeEntity():
         self.alternatives = alternatives
         self.role = role
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntity':
-        """Initialize a RuntimeEntity object from a json dictionary."""
-        args = {}
-        if 'entity' in _dict:
-            args['entity'] = _dict.get('entity')
-        else:
-            raise ValueError(
-                'Required property \'entity\' not present in RuntimeEntity JSON'
-            )
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        else:
-            raise ValueError(
-                'Required property \'value\' not present in RuntimeEntity JSON')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'groups' in _dict:
-            args['groups'] = [
-                CaptureGroup.from_dict(x) for x in _dict.get('groups')
-            ]
-        if 'interpretation' in _dict:
-            args['interpretation'] = RuntimeEntityInterpretation.from_dict(
-                _dict.get('interpretation'))
-        if 'alternatives' in _dict:
-            args['alternatives'] = [
-                RuntimeEntityAlternative.from_dict(x)
-                for x in _dict.get('alternatives')
-            ]
-        if 'role' in _dict:
-            args['role'] = RuntimeEntityRole.from_dict(_dict.get('role'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entity') and self.entity is not None:
-            _dict['entity'] = self.entity
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'groups') and self.groups is not None:
-            _dict['groups'] = [x.to_dict() for x in self.groups]
-        if hasattr(self, 'interpretation') and self.interpretation is not None:
-            _dict['interpretation'] = self.interpretation.to_dict()
-        if hasattr(self, 'alternatives') and self.alternatives is not None:
-            _dict['alternatives'] = [x.to_dict() for x in self.alternatives]
-        if hasattr(self, 'role') and self.role is not None:
-            _dict['role'] = self.role.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntity object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class RuntimeEntityAlternative():
+class RuntimeEntityAlternative(Model):
     """
     An alternative value for the recognized entity.
 
@@ -4177,6 +2495,13 @@ class RuntimeEntityAlternative():
           confidence in the recognized entity.
     """
 
+    __slots__ = ('value', 'confidence')
+
+    _fields = (
+        ModelField('value'),
+        ModelField('confidence'),
+    )
+
     def __init__(self, *, value: str = None, confidence: float = None) -> None:
         """
         Initialize a RuntimeEntityAlternative object.
@@ -4189,50 +2514,8 @@ class RuntimeEntityAlternative():
         self.value = value
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityAlternative':
-        """Initialize a RuntimeEntityAlternative object from a json dictionary."""
-        args = {}
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityAlternative object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityAlternative object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityAlternative') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityAlternative') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RuntimeEntityInterpretation():
+class RuntimeEntityInterpretation(Model):
     """
     RuntimeEntityInterpretation.
 
@@ -4306,6 +2589,44 @@ class RuntimeEntityInterpretation():
           time value (for example, `EST`).
     """
 
+    __slots__ = ('calendar_type', 'datetime_link', 'festival', 'granularity',
+                 'range_link', 'range_modifier', 'relative_day',
+                 'relative_month', 'relative_week', 'relative_weekend',
+                 'relative_year', 'specific_day', 'specific_day_of_week',
+                 'specific_month', 'specific_quarter', 'specific_year',
+                 'numeric_value', 'subtype', 'part_of_day', 'relative_hour',
+                 'relative_minute', 'relative_second', 'specific_hour',
+                 'specific_minute', 'specific_second', 'timezone')
+
+    _fields = (
+        ModelField('calendar_type'),
+        ModelField('datetime_link'),
+        ModelField('festival'),
+        ModelField('granularity'),
+        ModelField('range_link'),
+        ModelField('range_modifier'),
+        ModelField('relative_day'),
+        ModelField('relative_month'),
+        ModelField('relative_week'),
+        ModelField('relative_weekend'),
+        ModelField('relative_year'),
+        ModelField('specific_day'),
+        ModelField('specific_day_of_week'),
+        ModelField('specific_month'),
+        ModelField('specific_quarter'),
+        ModelField('specific_year'),
+        ModelField('numeric_value'),
+        ModelField('subtype'),
+        ModelField('part_of_day'),
+        ModelField('relative_hour'),
+        ModelField('relative_minute'),
+        ModelField('relative_second'),
+        ModelField('specific_hour'),
+        ModelField('specific_minute'),
+        ModelField('specific_second'),
+        ModelField('timezone'),
+    )
+
     def __init__(self,
                  *,
                  calendar_type: str = None,
@@ -4438,151 +2759,6 @@ class RuntimeEntityInterpretation():
         self.specific_second = specific_second
         self.timezone = timezone
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityInterpretation':
-        """Initialize a RuntimeEntityInterpretation object from a json dictionary."""
-        args = {}
-        if 'calendar_type' in _dict:
-            args['calendar_type'] = _dict.get('calendar_type')
-        if 'datetime_link' in _dict:
-            args['datetime_link'] = _dict.get('datetime_link')
-        if 'festival' in _dict:
-            args['festival'] = _dict.get('festival')
-        if 'granularity' in _dict:
-            args['granularity'] = _dict.get('granularity')
-        if 'range_link' in _dict:
-            args['range_link'] = _dict.get('range_link')
-        if 'range_modifier' in _dict:
-            args['range_modifier'] = _dict.get('range_modifier')
-        if 'relative_day' in _dict:
-            args['relative_day'] = _dict.get('relative_day')
-        if 'relative_month' in _dict:
-            args['relative_month'] = _dict.get('relative_month')
-        if 'relative_week' in _dict:
-            args['relative_week'] = _dict.get('relative_week')
-        if 'relative_weekend' in _dict:
-            args['relative_weekend'] = _dict.get('relative_weekend')
-        if 'relative_year' in _dict:
-            args['relative_year'] = _dict.get('relative_year')
-        if 'specific_day' in _dict:
-            args['specific_day'] = _dict.get('specific_day')
-        if 'specific_day_of_week' in _dict:
-            args['specific_day_of_week'] = _dict.get('specific_day_of_week')
-        if 'specific_month' in _dict:
-            args['specific_month'] = _dict.get('specific_month')
-        if 'specific_quarter' in _dict:
-            args['specific_quarter'] = _dict.get('specific_quarter')
-        if 'specific_year' in _dict:
-            args['specific_year'] = _dict.get('specific_year')
-        if 'numeric_value' in _dict:
-            args['numeric_value'] = _dict.get('numeric_value')
-        if 'subtype' in _dict:
-            args['subtype'] = _dict.get('subtype')
-        if 'part_of_day' in _dict:
-            args['part_of_day'] = _dict.get('part_of_day')
-        if 'relative_hour' in _dict:
-            args['relative_hour'] = _dict.get('relative_hour')
-        if 'relative_minute' in _dict:
-            args['relative_minute'] = _dict.get('relative_minute')
-        if 'relative_second' in _dict:
-            args['relative_second'] = _dict.get('relative_second')
-        if 'specific_hour' in _dict:
-            args['specific_hour'] = _dict.get('specific_hour')
-        if 'specific_minute' in _dict:
-            args['specific_minute'] = _dict.get('specific_minute')
-        if 'specific_second' in _dict:
-            args['specific_second'] = _dict.get('specific_second')
-        if 'timezone' in _dict:
-            args['timezone'] = _dict.get('timezone')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityInterpretation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'calendar_type') and self.calendar_type is not None:
-            _dict['calendar_type'] = self.calendar_type
-        if hasattr(self, 'datetime_link') and self.datetime_link is not None:
-            _dict['datetime_link'] = self.datetime_link
-        if hasattr(self, 'festival') and self.festival is not None:
-            _dict['festival'] = self.festival
-        if hasattr(self, 'granularity') and self.granularity is not None:
-            _dict['granularity'] = self.granularity
-        if hasattr(self, 'range_link') and self.range_link is not None:
-            _dict['range_link'] = self.range_link
-        if hasattr(self, 'range_modifier') and self.range_modifier is not None:
-            _dict['range_modifier'] = self.range_modifier
-        if hasattr(self, 'relative_day') and self.relative_day is not None:
-            _dict['relative_day'] = self.relative_day
-        if hasattr(self, 'relative_month') and self.relative_month is not None:
-            _dict['relative_month'] = self.relative_month
-        if hasattr(self, 'relative_week') and self.relative_week is not None:
-            _dict['relative_week'] = self.relative_week
-        if hasattr(self,
-                   'relative_weekend') and self.relative_weekend is not None:
-            _dict['relative_weekend'] = self.relative_weekend
-        if hasattr(self, 'relative_year') and self.relative_year is not None:
-            _dict['relative_year'] = self.relative_year
-        if hasattr(self, 'specific_day') and self.specific_day is not None:
-            _dict['specific_day'] = self.specific_day
-        if hasattr(self, 'specific_day_of_week'
-                  ) and self.specific_day_of_week is not None:
-            _dict['specific_day_of_week'] = self.specific_day_of_week
-        if hasattr(self, 'specific_month') and self.specific_month is not None:
-            _dict['specific_month'] = self.specific_month
-        if hasattr(self,
-                   'specific_quarter') and self.specific_quarter is not None:
-            _dict['specific_quarter'] = self.specific_quarter
-        if hasattr(self, 'specific_year') and self.specific_year is not None:
-            _dict['specific_year'] = self.specific_year
-        if hasattr(self, 'numeric_value') and self.numeric_value is not None:
-            _dict['numeric_value'] = self.numeric_value
-        if hasattr(self, 'subtype') and self.subtype is not None:
-            _dict['subtype'] = self.subtype
-        if hasattr(self, 'part_of_day') and self.part_of_day is not None:
-            _dict['part_of_day'] = self.part_of_day
-        if hasattr(self, 'relative_hour') and self.relative_hour is not None:
-            _dict['relative_hour'] = self.relative_hour
-        if hasattr(self,
-                   'relative_minute') and self.relative_minute is not None:
-            _dict['relative_minute'] = self.relative_minute
-        if hasattr(self,
-                   'relative_second') and self.relative_second is not None:
-            _dict['relative_second'] = self.relative_second
-        if hasattr(self, 'specific_hour') and self.specific_hour is not None:
-            _dict['specific_hour'] = self.specific_hour
-        if hasattr(self,
-                   'specific_minute') and self.specific_minute is not None:
-            _dict['specific_minute'] = self.specific_minute
-        if hasattr(self,
-                   'specific_second') and self.specific_second is not None:
-            _dict['specific_second'] = self.specific_second
-        if hasattr(self, 'timezone') and self.timezone is not None:
-            _dict['timezone'] = self.timezone
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityInterpretation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityInterpretation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityInterpretation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class GranularityEnum(str, Enum):
         """
         The precision or duration of a time range specified by a recognized `@sys-time` or
@@ -4601,7 +2777,7 @@ class RuntimeEntityInterpretation():
         YEAR = 'year'
 
 
-class RuntimeEntityRole():
+class RuntimeEntityRole(Model):
     """
     An object describing the role played by a system entity that is specifies the
     beginning or end of a range recognized in the user input. This property is included
@@ -4610,6 +2786,12 @@ class RuntimeEntityRole():
     :attr str type: (optional) The relationship of the entity to the range.
     """
 
+    __slots__ = ('type',)
+
+    _fields = (
+        ModelField('type'),
+    )
+
     def __init__(self, *, type: str = None) -> None:
         """
         Initialize a RuntimeEntityRole object.
@@ -4618,44 +2800,6 @@ class RuntimeEntityRole():
         """
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeEntityRole':
-        """Initialize a RuntimeEntityRole object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeEntityRole object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeEntityRole object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeEntityRole') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeEntityRole') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The relationship of the entity to the range.
@@ -4668,7 +2812,7 @@ class RuntimeEntityRole():
         TIME_TO = 'time_to'
 
 
-class RuntimeIntent():
+class RuntimeIntent(Model):
     """
     An intent identified in the user input.
 
@@ -4677,6 +2821,13 @@ class RuntimeIntent():
           in the intent.
     """
 
+    __slots__ = ('intent', 'confidence')
+
+    _fields = (
+        ModelField('intent', required=True),
+        ModelField('confidence', required=True),
+    )
+
     def __init__(self, intent: str, confidence: float) -> None:
         """
         Initialize a RuntimeIntent object.
@@ -4688,63 +2839,34 @@ class RuntimeIntent():
         self.intent = intent
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeIntent':
-        """Initialize a RuntimeIntent object from a json dictionary."""
-        args = {}
-        if 'intent' in _dict:
-            args['intent'] = _dict.get('intent')
-        else:
-            raise ValueError(
-                'Required property \'intent\' not present in RuntimeIntent JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in RuntimeIntent JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeIntent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'intent') and self.intent is not None:
-            _dict['intent'] = self.intent
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeIntent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RuntimeIntent') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RuntimeIntent') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class RuntimeResponseGeneric():
+class RuntimeResponseGeneric(Model):
     """
     RuntimeResponseGeneric.
 
     """
 
+    __slots__ = ()
+
+    _fields = ()
+
+    _discriminator = ModelDiscriminator(
+        'response_type', {
+            'channel_transfer':
+                'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer',
+            'connect_to_agent':
+                'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent',
+            'image': 'RuntimeResponseGenericRuntimeResponseTypeImage',
+            'option': 'RuntimeResponseGenericRuntimeResponseTypeOption',
+            'suggestion': 'RuntimeResponseGenericRuntimeResponseTypeSuggestion',
+            'pause': 'RuntimeResponseGenericRuntimeResponseTypePause',
+            'search': 'RuntimeResponseGenericRuntimeResponseTypeSearch',
+            'text': 'RuntimeResponseGenericRuntimeResponseTypeText',
+            'user_defined':
+                'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
+        },
+        abstract=True)
+
     def __init__(self) -> None:
         """
         Initialize a RuntimeResponseGeneric object.
@@ -4764,65 +2886,8 @@ class RuntimeResponseGeneric():
             ]))
         raise Exception(msg)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RuntimeResponseGeneric':
-        """Initialize a RuntimeResponseGeneric object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        msg = (
-            "Cannot convert dictionary into an instance of base class 'RuntimeResponseGeneric'. "
-            + "The discriminator value should map to a valid subclass: {1}"
-        ).format(", ".join([
-            'RuntimeResponseGenericRuntimeResponseTypeText',
-            'RuntimeResponseGenericRuntimeResponseTypePause',
-            'RuntimeResponseGenericRuntimeResponseTypeImage',
-            'RuntimeResponseGenericRuntimeResponseTypeOption',
-            'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent',
-            'RuntimeResponseGenericRuntimeResponseTypeSuggestion',
-            'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer',
-            'RuntimeResponseGenericRuntimeResponseTypeSearch',
-            'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-        ]))
-        raise Exception(msg)
 
-    @classmethod
-    def _from_dict(cls, _dict: Dict):
-        """Initialize a RuntimeResponseGeneric object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping[
-            'channel_transfer'] = 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-        mapping[
-            'connect_to_agent'] = 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-        mapping['image'] = 'RuntimeResponseGenericRuntimeResponseTypeImage'
-        mapping['option'] = 'RuntimeResponseGenericRuntimeResponseTypeOption'
-        mapping[
-            'suggestion'] = 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-        mapping['pause'] = 'RuntimeResponseGenericRuntimeResponseTypePause'
-        mapping['search'] = 'RuntimeResponseGenericRuntimeResponseTypeSearch'
-        mapping['text'] = 'RuntimeResponseGenericRuntimeResponseTypeText'
-        mapping[
-            'user_defined'] = 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-        disc_value = _dict.get('response_type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'response_type\' not found in RuntimeResponseGeneric JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class SearchResult():
+class SearchResult(Model):
     """
     SearchResult.
 
@@ -4851,6 +2916,20 @@ class SearchResult():
           only if the search skill is connected to a Discovery v2 service instance.
     """
 
+    __slots__ = ('id', 'result_metadata', 'body', 'title', 'url', 'highlight',
+                 'answers')
+
+    _fields = (
+        ModelField('id', required=True),
+        ModelField('result_metadata', 'model', 'SearchResultMetadata',
+                   required=True),
+        ModelField('body'),
+        ModelField('title'),
+        ModelField('url'),
+        ModelField('highlight', 'model', 'SearchResultHighlight'),
+        ModelField('answers', 'list', 'SearchResultAnswer'),
+    )
+
     def __init__(self,
                  id: str,
                  result_metadata: 'SearchResultMetadata',
@@ -4896,82 +2975,8 @@ class SearchResult():
         self.highlight = highlight
         self.answers = answers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SearchResult':
-        """Initialize a SearchResult object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        else:
-            raise ValueError(
-                'Required property \'id\' not present in SearchResult JSON')
-        if 'result_metadata' in _dict:
-            args['result_metadata'] = SearchResultMetadata.from_dict(
-                _dict.get('result_metadata'))
-        else:
-            raise ValueError(
-                'Required property \'result_metadata\' not present in SearchResult JSON'
-            )
-        if 'body' in _dict:
-            args['body'] = _dict.get('body')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        if 'highlight' in _dict:
-            args['highlight'] = SearchResultHighlight.from_dict(
-                _dict.get('highlight'))
-        if 'answers' in _dict:
-            args['answers'] = [
-                SearchResultAnswer.from_dict(x) for x in _dict.get('answers')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SearchResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        if hasattr(self,
-                   'result_metadata') and self.result_metadata is not None:
-            _dict['result_metadata'] = self.result_metadata.to_dict()
-        if hasattr(self, 'body') and self.body is not None:
-            _dict['body'] = self.body
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'highlight') and self.highlight is not None:
-            _dict['highlight'] = self.highlight.to_dict()
-        if hasattr(self, 'answers') and self.answers is not None:
-            _dict['answers'] = [x.to_dict() for x in self.answers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SearchResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SearchResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SearchResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class SearchResultAnswer():
+class SearchResultAnswer(Model):
     """
     An object specifing a segment of text that was identified as a direct answer to the
     search query.
@@ -4981,6 +2986,13 @@ class SearchResultAnswer():
           Discovery service.
     """
 
+    __slots__ = ('text', 'confidence')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('confidence', required=True),
+    )
+
     def __init__(self, text: str, confidence: float) -> None:
         """
         Initialize a SearchResultAnswer object.
@@ -4992,58 +3004,8 @@ class SearchResultAnswer():
         self.text = text
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SearchResultAnswer':
-        """Initialize a SearchResultAnswer object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in SearchResultAnswer JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in SearchResultAnswer JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SearchResultAnswer object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SearchResultAnswer object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SearchResultAnswer') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SearchResultAnswer') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class SearchResultHighlight():
+class SearchResultHighlight(Model):
     """
     An object containing segments of text from search results with query-matching text
     highlighted using HTML `<em>` tags.
@@ -5058,6 +3020,14 @@ class SearchResultHighlight():
           from URLs in the search results, with query-matching substrings highlighted.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('body'),
+        ModelField('title'),
+        ModelField('url'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['body', 'title', 'url'])
 
@@ -5087,46 +3057,6 @@ class SearchResultHighlight():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SearchResultHighlight':
-        """Initialize a SearchResultHighlight object from a json dictionary."""
-        args = {}
-        if 'body' in _dict:
-            args['body'] = _dict.get('body')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SearchResultHighlight object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'body') and self.body is not None:
-            _dict['body'] = self.body
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in SearchResultHighlight._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of SearchResultHighlight"""
         _dict = {}
@@ -5150,22 +3080,8 @@ class SearchResultHighlight():
             if _key not in SearchResultHighlight._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this SearchResultHighlight object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'SearchResultHighlight') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SearchResultHighlight') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SearchResultMetadata():
+class SearchResultMetadata(Model):
     """
     An object containing search result metadata from the Discovery service.
 
@@ -5176,6 +3092,13 @@ class SearchResultMetadata():
           indicates a greater match to the query parameters.
     """
 
+    __slots__ = ('confidence', 'score')
+
+    _fields = (
+        ModelField('confidence'),
+        ModelField('score'),
+    )
+
     def __init__(self,
                  *,
                  confidence: float = None,
@@ -5192,56 +3115,20 @@ class SearchResultMetadata():
         self.confidence = confidence
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SearchResultMetadata':
-        """Initialize a SearchResultMetadata object from a json dictionary."""
-        args = {}
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SearchResultMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SearchResultMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SearchResultMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'SearchResultMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SessionResponse():
+class SessionResponse(Model):
     """
     SessionResponse.
 
     :attr str session_id: The session ID.
     """
 
+    __slots__ = ('session_id',)
+
+    _fields = (
+        ModelField('session_id', required=True),
+    )
+
     def __init__(self, session_id: str) -> None:
         """
         Initialize a SessionResponse object.
@@ -5250,48 +3137,6 @@ class SessionResponse():
         """
         self.session_id = session_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SessionResponse':
-        """Initialize a SessionResponse object from a json dictionary."""
-        args = {}
-        if 'session_id' in _dict:
-            args['session_id'] = _dict.get('session_id')
-        else:
-            raise ValueError(
-                'Required property \'session_id\' not present in SessionResponse JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SessionResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'session_id') and self.session_id is not None:
-            _dict['session_id'] = self.session_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SessionResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SessionResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SessionResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class LogMessageSourceAction(LogMessageSource):
     """
@@ -5303,6 +3148,13 @@ class LogMessageSourceAction(LogMessageSource):
           message.
     """
 
+    __slots__ = ('type', 'action')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('action', required=True),
+    )
+
     def __init__(self, type: str, action: str) -> None:
         """
         Initialize a LogMessageSourceAction object.
@@ -5316,56 +3168,6 @@ class LogMessageSourceAction(LogMessageSource):
         self.type = type
         self.action = action
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSourceAction':
-        """Initialize a LogMessageSourceAction object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in LogMessageSourceAction JSON'
-            )
-        if 'action' in _dict:
-            args['action'] = _dict.get('action')
-        else:
-            raise ValueError(
-                'Required property \'action\' not present in LogMessageSourceAction JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessageSourceAction object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'action') and self.action is not None:
-            _dict['action'] = self.action
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessageSourceAction object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessageSourceAction') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessageSourceAction') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class LogMessageSourceDialogNode(LogMessageSource):
     """
@@ -5377,6 +3179,13 @@ class LogMessageSourceDialogNode(LogMessageSource):
           the error message.
     """
 
+    __slots__ = ('type', 'dialog_node')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('dialog_node', required=True),
+    )
+
     def __init__(self, type: str, dialog_node: str) -> None:
         """
         Initialize a LogMessageSourceDialogNode object.
@@ -5390,56 +3199,6 @@ class LogMessageSourceDialogNode(LogMessageSource):
         self.type = type
         self.dialog_node = dialog_node
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSourceDialogNode':
-        """Initialize a LogMessageSourceDialogNode object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in LogMessageSourceDialogNode JSON'
-            )
-        if 'dialog_node' in _dict:
-            args['dialog_node'] = _dict.get('dialog_node')
-        else:
-            raise ValueError(
-                'Required property \'dialog_node\' not present in LogMessageSourceDialogNode JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessageSourceDialogNode object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'dialog_node') and self.dialog_node is not None:
-            _dict['dialog_node'] = self.dialog_node
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessageSourceDialogNode object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessageSourceDialogNode') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessageSourceDialogNode') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class LogMessageSourceHandler(LogMessageSource):
     """
@@ -5455,6 +3214,15 @@ class LogMessageSourceHandler(LogMessageSource):
           message.
     """
 
+    __slots__ = ('type', 'action', 'step', 'handler')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('action', required=True),
+        ModelField('step'),
+        ModelField('handler', required=True),
+    )
+
     def __init__(self,
                  type: str,
                  action: str,
@@ -5479,68 +3247,6 @@ class LogMessageSourceHandler(LogMessageSource):
         self.step = step
         self.handler = handler
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSourceHandler':
-        """Initialize a LogMessageSourceHandler object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in LogMessageSourceHandler JSON'
-            )
-        if 'action' in _dict:
-            args['action'] = _dict.get('action')
-        else:
-            raise ValueError(
-                'Required property \'action\' not present in LogMessageSourceHandler JSON'
-            )
-        if 'step' in _dict:
-            args['step'] = _dict.get('step')
-        if 'handler' in _dict:
-            args['handler'] = _dict.get('handler')
-        else:
-            raise ValueError(
-                'Required property \'handler\' not present in LogMessageSourceHandler JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessageSourceHandler object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'action') and self.action is not None:
-            _dict['action'] = self.action
-        if hasattr(self, 'step') and self.step is not None:
-            _dict['step'] = self.step
-        if hasattr(self, 'handler') and self.handler is not None:
-            _dict['handler'] = self.handler
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessageSourceHandler object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessageSourceHandler') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessageSourceHandler') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class LogMessageSourceStep(LogMessageSource):
     """
@@ -5554,6 +3260,14 @@ class LogMessageSourceStep(LogMessageSource):
           message.
     """
 
+    __slots__ = ('type', 'action', 'step')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('action', required=True),
+        ModelField('step', required=True),
+    )
+
     def __init__(self, type: str, action: str, step: str) -> None:
         """
         Initialize a LogMessageSourceStep object.
@@ -5570,64 +3284,6 @@ class LogMessageSourceStep(LogMessageSource):
         self.action = action
         self.step = step
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogMessageSourceStep':
-        """Initialize a LogMessageSourceStep object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in LogMessageSourceStep JSON'
-            )
-        if 'action' in _dict:
-            args['action'] = _dict.get('action')
-        else:
-            raise ValueError(
-                'Required property \'action\' not present in LogMessageSourceStep JSON'
-            )
-        if 'step' in _dict:
-            args['step'] = _dict.get('step')
-        else:
-            raise ValueError(
-                'Required property \'step\' not present in LogMessageSourceStep JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogMessageSourceStep object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'action') and self.action is not None:
-            _dict['action'] = self.action
-        if hasattr(self, 'step') and self.step is not None:
-            _dict['step'] = self.step
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogMessageSourceStep object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogMessageSourceStep') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogMessageSourceStep') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
         RuntimeResponseGeneric):
@@ -5646,6 +3302,17 @@ class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'message_to_user', 'transfer_info',
+                 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_user', required=True),
+        ModelField('transfer_info', 'model', 'ChannelTransferInfo',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  message_to_user: str,
@@ -5673,79 +3340,6 @@ class RuntimeResponseGenericRuntimeResponseTypeChannelTransfer(
         self.transfer_info = transfer_info
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'message_to_user' in _dict:
-            args['message_to_user'] = _dict.get('message_to_user')
-        else:
-            raise ValueError(
-                'Required property \'message_to_user\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'transfer_info' in _dict:
-            args['transfer_info'] = ChannelTransferInfo.from_dict(
-                _dict.get('transfer_info'))
-        else:
-            raise ValueError(
-                'Required property \'transfer_info\' not present in RuntimeResponseGenericRuntimeResponseTypeChannelTransfer JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self,
-                   'message_to_user') and self.message_to_user is not None:
-            _dict['message_to_user'] = self.message_to_user
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeChannelTransfer object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeChannelTransfer'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
         RuntimeResponseGeneric):
@@ -5774,6 +3368,20 @@ class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'message_to_human_agent', 'agent_available',
+                 'agent_unavailable', 'transfer_info', 'topic', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('message_to_human_agent'),
+        ModelField('agent_available', 'model', 'AgentAvailabilityMessage'),
+        ModelField('agent_unavailable', 'model', 'AgentAvailabilityMessage'),
+        ModelField('transfer_info', 'model',
+                   'DialogNodeOutputConnectToAgentTransferInfo'),
+        ModelField('topic'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(
             self,
             response_type: str,
@@ -5818,88 +3426,6 @@ class RuntimeResponseGenericRuntimeResponseTypeConnectToAgent(
         self.topic = topic
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-        cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeConnectToAgent JSON'
-            )
-        if 'message_to_human_agent' in _dict:
-            args['message_to_human_agent'] = _dict.get('message_to_human_agent')
-        if 'agent_available' in _dict:
-            args['agent_available'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_available'))
-        if 'agent_unavailable' in _dict:
-            args['agent_unavailable'] = AgentAvailabilityMessage.from_dict(
-                _dict.get('agent_unavailable'))
-        if 'transfer_info' in _dict:
-            args[
-                'transfer_info'] = DialogNodeOutputConnectToAgentTransferInfo.from_dict(
-                    _dict.get('transfer_info'))
-        if 'topic' in _dict:
-            args['topic'] = _dict.get('topic')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'message_to_human_agent'
-                  ) and self.message_to_human_agent is not None:
-            _dict['message_to_human_agent'] = self.message_to_human_agent
-        if hasattr(self,
-                   'agent_available') and self.agent_available is not None:
-            _dict['agent_available'] = self.agent_available.to_dict()
-        if hasattr(self,
-                   'agent_unavailable') and self.agent_unavailable is not None:
-            _dict['agent_unavailable'] = self.agent_unavailable.to_dict()
-        if hasattr(self, 'transfer_info') and self.transfer_info is not None:
-            _dict['transfer_info'] = self.transfer_info.to_dict()
-        if hasattr(self, 'topic') and self.topic is not None:
-            _dict['topic'] = self.topic
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeConnectToAgent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-        self, other: 'RuntimeResponseGenericRuntimeResponseTypeConnectToAgent'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
     """
@@ -5918,6 +3444,18 @@ class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
           readers or other situations where the image cannot be seen.
     """
 
+    __slots__ = ('response_type', 'source', 'title', 'description', 'channels',
+                 'alt_text')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('source', required=True),
+        ModelField('title'),
+        ModelField('description'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+        ModelField('alt_text'),
+    )
+
     def __init__(self,
                  response_type: str,
                  source: str,
@@ -5951,79 +3489,6 @@ class RuntimeResponseGenericRuntimeResponseTypeImage(RuntimeResponseGeneric):
         self.channels = channels
         self.alt_text = alt_text
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeImage':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeImage object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeImage JSON'
-            )
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in RuntimeResponseGenericRuntimeResponseTypeImage JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        if 'alt_text' in _dict:
-            args['alt_text'] = _dict.get('alt_text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeImage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        if hasattr(self, 'alt_text') and self.alt_text is not None:
-            _dict['alt_text'] = self.alt_text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeImage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeImage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeImage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
     """
@@ -6042,6 +3507,19 @@ class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'title', 'description', 'preference',
+                 'options', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('title', required=True),
+        ModelField('description'),
+        ModelField('preference'),
+        ModelField('options', 'list', 'DialogNodeOutputOptionsElement',
+                   required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  title: str,
@@ -6076,88 +3554,6 @@ class RuntimeResponseGenericRuntimeResponseTypeOption(RuntimeResponseGeneric):
         self.options = options
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeOption':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeOption object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        else:
-            raise ValueError(
-                'Required property \'title\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'preference' in _dict:
-            args['preference'] = _dict.get('preference')
-        if 'options' in _dict:
-            args['options'] = [
-                DialogNodeOutputOptionsElement.from_dict(x)
-                for x in _dict.get('options')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'options\' not present in RuntimeResponseGenericRuntimeResponseTypeOption JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeOption object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'preference') and self.preference is not None:
-            _dict['preference'] = self.preference
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = [x.to_dict() for x in self.options]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeOption object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeOption') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeOption') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PreferenceEnum(str, Enum):
         """
         The preferred type of control to display.
@@ -6181,6 +3577,15 @@ class RuntimeResponseGenericRuntimeResponseTypePause(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'time', 'typing', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('time', required=True),
+        ModelField('typing'),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  time: int,
@@ -6207,71 +3612,6 @@ class RuntimeResponseGenericRuntimeResponseTypePause(RuntimeResponseGeneric):
         self.typing = typing
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypePause':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypePause object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypePause JSON'
-            )
-        if 'time' in _dict:
-            args['time'] = _dict.get('time')
-        else:
-            raise ValueError(
-                'Required property \'time\' not present in RuntimeResponseGenericRuntimeResponseTypePause JSON'
-            )
-        if 'typing' in _dict:
-            args['typing'] = _dict.get('typing')
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypePause object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'time') and self.time is not None:
-            _dict['time'] = self.time
-        if hasattr(self, 'typing') and self.typing is not None:
-            _dict['typing'] = self.typing
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypePause object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypePause') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypePause') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeSearch(RuntimeResponseGeneric):
     """
@@ -6291,6 +3631,17 @@ class RuntimeResponseGenericRuntimeResponseTypeSearch(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'header', 'primary_results',
+                 'additional_results', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('header', required=True),
+        ModelField('primary_results', 'list', 'SearchResult', required=True),
+        ModelField('additional_results', 'list', 'SearchResult', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  header: str,
@@ -6324,97 +3675,6 @@ class RuntimeResponseGenericRuntimeResponseTypeSearch(RuntimeResponseGeneric):
         self.additional_results = additional_results
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeSearch':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSearch object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeSearch JSON'
-            )
-        if 'header' in _dict:
-            args['header'] = _dict.get('header')
-        else:
-            raise ValueError(
-                'Required property \'header\' not present in RuntimeResponseGenericRuntimeResponseTypeSearch JSON'
-            )
-        if 'primary_results' in _dict:
-            args['primary_results'] = [
-                SearchResult.from_dict(x) for x in _dict.get('primary_results')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'primary_results\' not present in RuntimeResponseGenericRuntimeResponseTypeSearch JSON'
-            )
-        if 'additional_results' in _dict:
-            args['additional_results'] = [
-                SearchResult.from_dict(x)
-                for x in _dict.get('additional_results')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'additional_results\' not present in RuntimeResponseGenericRuntimeResponseTypeSearch JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSearch object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'header') and self.header is not None:
-            _dict['header'] = self.header
-        if hasattr(self,
-                   'primary_results') and self.primary_results is not None:
-            _dict['primary_results'] = [
-                x.to_dict() for x in self.primary_results
-            ]
-        if hasattr(
-                self,
-                'additional_results') and self.additional_results is not None:
-            _dict['additional_results'] = [
-                x.to_dict() for x in self.additional_results
-            ]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeSearch object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeSearch') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self,
-            other: 'RuntimeResponseGenericRuntimeResponseTypeSearch') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
         RuntimeResponseGeneric):
@@ -6432,6 +3692,15 @@ class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'title', 'suggestions', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('title', required=True),
+        ModelField('suggestions', 'list', 'DialogSuggestion', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  title: str,
@@ -6459,79 +3728,6 @@ class RuntimeResponseGenericRuntimeResponseTypeSuggestion(
         self.suggestions = suggestions
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeSuggestion':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSuggestion object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        else:
-            raise ValueError(
-                'Required property \'title\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'suggestions' in _dict:
-            args['suggestions'] = [
-                DialogSuggestion.from_dict(x) for x in _dict.get('suggestions')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'suggestions\' not present in RuntimeResponseGenericRuntimeResponseTypeSuggestion JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeSuggestion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'suggestions') and self.suggestions is not None:
-            _dict['suggestions'] = [x.to_dict() for x in self.suggestions]
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeSuggestion object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeSuggestion'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
     """
@@ -6546,6 +3742,14 @@ class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'text', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('text', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  text: str,
@@ -6568,67 +3772,6 @@ class RuntimeResponseGenericRuntimeResponseTypeText(RuntimeResponseGeneric):
         self.text = text
         self.channels = channels
 
-    @classmethod
-    def from_dict(
-            cls,
-            _dict: Dict) -> 'RuntimeResponseGenericRuntimeResponseTypeText':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeText object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeText JSON'
-            )
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in RuntimeResponseGenericRuntimeResponseTypeText JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeText object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeText object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeText') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self,
-               other: 'RuntimeResponseGenericRuntimeResponseTypeText') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
         RuntimeResponseGeneric):
@@ -6645,6 +3788,14 @@ class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
           handled by an API client.
     """
 
+    __slots__ = ('response_type', 'user_defined', 'channels')
+
+    _fields = (
+        ModelField('response_type', required=True),
+        ModelField('user_defined', required=True),
+        ModelField('channels', 'list', 'ResponseGenericChannel'),
+    )
+
     def __init__(self,
                  response_type: str,
                  user_defined: dict,
@@ -6667,66 +3818,3 @@ class RuntimeResponseGenericRuntimeResponseTypeUserDefined(
         self.response_type = response_type
         self.user_defined = user_defined
         self.channels = channels
-
-    @classmethod
-    def from_dict(
-            cls, _dict: Dict
-    ) -> 'RuntimeResponseGenericRuntimeResponseTypeUserDefined':
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeUserDefined object from a json dictionary."""
-        args = {}
-        if 'response_type' in _dict:
-            args['response_type'] = _dict.get('response_type')
-        else:
-            raise ValueError(
-                'Required property \'response_type\' not present in RuntimeResponseGenericRuntimeResponseTypeUserDefined JSON'
-            )
-        if 'user_defined' in _dict:
-            args['user_defined'] = _dict.get('user_defined')
-        else:
-            raise ValueError(
-                'Required property \'user_defined\' not present in RuntimeResponseGenericRuntimeResponseTypeUserDefined JSON'
-            )
-        if 'channels' in _dict:
-            args['channels'] = [
-                ResponseGenericChannel.from_dict(x)
-                for x in _dict.get('channels')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RuntimeResponseGenericRuntimeResponseTypeUserDefined object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'response_type') and self.response_type is not None:
-            _dict['response_type'] = self.response_type
-        if hasattr(self, 'user_defined') and self.user_defined is not None:
-            _dict['user_defined'] = self.user_defined
-        if hasattr(self, 'channels') and self.channels is not None:
-            _dict['channels'] = [x.to_dict() for x in self.channels]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RuntimeResponseGenericRuntimeResponseTypeUserDefined object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(
-            self, other: 'RuntimeResponseGenericRuntimeResponseTypeUserDefined'
-    ) -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -0,0 +1,263 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Concurrent execution of one operation over many inputs.
+
+A `BatchExecutor` calls an operation once for each dictionary of keyword
+arguments, a bounded number of calls at a time, and yields one `BatchResult`
+per input:
+
+    from ibm_watson.batch import BatchExecutor
+
+    executor = BatchExecutor(nlu.analyze, max_workers=16)
+    items = ({'text': text, 'features': features} for text in documents)
+    for result in executor.map(items):
+        if result.error is None:
+            print(result.response.get_result())
+
+Calls rejected with status 429 (Too Many Requests) pause the whole batch for
+the time given by the Retry-After header, or an exponential backoff, and are
+retried. Other errors are reported in the result of their input and do not
+stop the batch. Operations of the asynchronous clients are run on the event
+loop with `amap`.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import random
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .common import get_retry_after
+
+
+class BatchResult():
+    """
+    The outcome of the call of an operation for one input of a batch.
+
+    :attr int index: The position of the input in the batch.
+    :attr dict kwargs: The keyword arguments of the call.
+    :attr DetailedResponse response: The response, or `None` if the call
+          failed.
+    :attr Exception error: The exception raised by the last attempt, or
+          `None` if the call succeeded.
+    :attr int attempts: The number of times the operation was called.
+    """
+
+    __slots__ = ('index', 'kwargs', 'response', 'error', 'attempts')
+
+    def __init__(self,
+                 index: int,
+                 kwargs: dict,
+                 response: DetailedResponse = None,
+                 error: Exception = None,
+                 attempts: int = 1) -> None:
+        self.index = index
+        self.kwargs = kwargs
+        self.response = response
+        self.error = error
+        self.attempts = attempts
+
+    def get_result(self):
+        """Return the result of the response, or raise the error of the call."""
+        if self.error is not None:
+            raise self.error
+        return self.response.get_result()
+
+    def __repr__(self) -> str:
+        outcome = ('error={0!r}'.format(self.error) if self.error is not None
+                   else 'status_code={0}'.format(
+                       self.response.get_status_code()))
+        return 'BatchResult(index={0}, {1}, attempts={2})'.format(
+            self.index, outcome, self.attempts)
+
+
+class BatchExecutor():
+    """
+    Runs an operation concurrently over an iterable of keyword arguments.
+
+    The inputs are consumed lazily: at most `2 * max_workers` of them are
+    pending at any time, so batches of any size run in constant memory.
+
+    :param Callable operation: The operation to call, such as `nlu.analyze`.
+           For `amap`, an operation of an asynchronous client.
+    :param int max_workers: (optional) The maximum number of concurrent calls.
+    :param bool ordered: (optional) Whether results are yielded in the order
+           of the inputs. Otherwise they are yielded as the calls complete.
+    :param int max_retries: (optional) The number of times a call rejected
+           with status 429 is retried before its error is reported.
+    :param float retry_interval: (optional) The maximum backoff, in seconds,
+           when a 429 response has no Retry-After header.
+    """
+
+    def __init__(self,
+                 operation: Callable,
+                 *,
+                 max_workers: int = 8,
+                 ordered: bool = True,
+                 max_retries: int = 5,
+                 retry_interval: float = 30.0) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.operation = operation
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def map(self, items: Iterable[dict]) -> Iterator[BatchResult]:
+        """
+        Call the operation with each dictionary of `items` in a thread pool.
+
+        :param Iterable[dict] items: The keyword arguments of each call.
+        :return: One result per input.
+        :rtype: Iterator[BatchResult]
+        """
+        items = enumerate(items)
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(
+                self.max_workers,
+                thread_name_prefix='ibm-watson-batch') as pool:
+
+            def submit():
+                for index, kwargs in items:
+                    pending.append(pool.submit(self._call, index, kwargs))
+                    if len(pending) >= 2 * self.max_workers:
+                        return
+
+            submit()
+            try:
+                while pending:
+                    if self.ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = concurrent.futures.wait(
+                            pending,
+                            return_when=concurrent.futures.FIRST_COMPLETED)
+                        future = next(iter(done))
+                        pending.remove(future)
+                    result = future.result()
+                    submit()
+                    yield result
+            finally:
+                # When the caller stops early, skip the calls not started yet.
+                for future in pending:
+                    future.cancel()
+
+    async def amap(self, items: Iterable[dict]) -> AsyncIterator[BatchResult]:
+        """
+        Await the operation with each dictionary of `items` on the event loop.
+
+        :param Iterable[dict] items: The keyword arguments of each call.
+        :return: One result per input.
+        :rtype: AsyncIterator[BatchResult]
+        """
+        items = enumerate(items)
+        pending = collections.deque()
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        def submit():
+            for index, kwargs in items:
+                pending.append(
+                    loop.create_task(self._acall(semaphore, index, kwargs)))
+                if len(pending) >= 2 * self.max_workers:
+                    return
+
+        submit()
+        try:
+            while pending:
+                if self.ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                    pending.remove(task)
+                result = await task
+                submit()
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _call(self, index: int, kwargs: dict) -> BatchResult:
+        attempts = 0
+        while True:
+            delay = self._get_pause()
+            if delay > 0:
+                time.sleep(delay)
+            attempts += 1
+            try:
+                response = self.operation(**kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                delay = self._get_retry_delay(error, attempts)
+                if delay is None:
+                    return BatchResult(index, kwargs, error=error,
+                                       attempts=attempts)
+                self._pause(delay)
+            else:
+                return BatchResult(index, kwargs, response, attempts=attempts)
+
+    async def _acall(self, semaphore: asyncio.Semaphore, index: int,
+                     kwargs: dict) -> BatchResult:
+        attempts = 0
+        while True:
+            async with semaphore:
+                delay = self._get_pause()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                attempts += 1
+                try:
+                    response = await self.operation(**kwargs)
+                except Exception as error:  # pylint: disable=broad-except
+                    delay = self._get_retry_delay(error, attempts)
+                    if delay is None:
+                        return BatchResult(index, kwargs, error=error,
+                                           attempts=attempts)
+                    self._pause(delay)
+                else:
+                    return BatchResult(index,
+                                       kwargs,
+                                       response,
+                                       attempts=attempts)
+
+    def _get_retry_delay(self, error: Exception,
+                         attempts: int) -> Optional[float]:
+        """Return the delay before retrying a failed call, or None."""
+        if (not isinstance(error, ApiException) or
+                error.status_code != 429 or attempts > self.max_retries):
+            return None
+        delay = get_retry_after(error.http_response)
+        if delay is None:
+            delay = min(self.retry_interval, 2**(attempts - 1))
+            delay *= random.uniform(0.5, 1.0)
+        return delay
+
+    def _pause(self, delay: float) -> None:
+        """Hold all calls of the batch for `delay` seconds."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def _get_pause(self) -> float:
+        with self._lock:
+            return self._resume_at - time.monotonic()
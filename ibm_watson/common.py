@@ -14,7 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import email.utils
 import platform
+import re
+import time
 from .version import __version__
 
 SDK_ANALYTICS_HEADER = 'X-IBMCloud-SDK-Analytics'
@@ -38,13 +41,109 @@ def get_sdk_analytics(service_name, service_version, operation_id):
         service_name, service_version, operation_id)
 
 
+_OPERATION_ID = re.compile(r'operation_id=([^;]*)')
+
+
+def get_operation_id(headers):
+    """
+    Return the operation_id of the SDK analytics header of a request.
+
+    :return: The operation_id, or `None` if the request has no such header.
+    """
+    match = _OPERATION_ID.search(headers.get(SDK_ANALYTICS_HEADER) or '')
+    return match.group(1) if match is not None else None
+
+
+def get_retry_after(http_response):
+    """
+    Return the number of seconds to wait given by a Retry-After header.
+
+    :param http_response: A response of `requests` or `httpx`, or `None`.
+    :return: The delay in seconds, or `None` if the response has no valid
+             Retry-After header.
+    """
+    if http_response is None:
+        return None
+    value = http_response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
 user_agent = '{0}-{1} {2}'.format(SDK_NAME, __version__, get_system_info())
 
 
+class _ReadOnlyHeaders(dict):
+    """
+    A `dict` that refuses modification.
+
+    Subclassing `dict` rather than using `types.MappingProxyType` keeps the
+    `headers.update(sdk_headers)` done by every operation on the fast path.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('SDK headers are shared and cannot be modified')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Copies and unpickled instances are ordinary, mutable dicts.
+        return (dict, (dict(self),))
+
+
+# SDK headers keyed by (service_name, service_version, operation_id).
+_sdk_headers_cache = {}
+
+
 def get_sdk_headers(service_name, service_version, operation_id):
-    headers = {}
-    headers[SDK_ANALYTICS_HEADER] = get_sdk_analytics(service_name,
-                                                      service_version,
-                                                      operation_id)
-    headers[USER_AGENT_HEADER] = get_user_agent()
+    """
+    Return the SDK analytics and User-Agent headers of an operation.
+
+    The headers are built once per (service_name, service_version,
+    operation_id) and shared by every later call, so the returned mapping is
+    read-only. Copy it into a new `dict` to modify it.
+    """
+    key = (service_name, service_version, operation_id)
+    headers = _sdk_headers_cache.get(key)
+    if headers is None:
+        headers = _ReadOnlyHeaders({
+            SDK_ANALYTICS_HEADER:
+                get_sdk_analytics(service_name, service_version, operation_id),
+            USER_AGENT_HEADER:
+                get_user_agent()
+        })
+        _sdk_headers_cache[key] = headers
     return headers
+
+
+def get_operation_ids(service_class):
+    """
+    Return the operation ids of a generated service class.
+
+    Every public method of a generated service is an operation whose
+    operation_id is the method name.
+    """
+    return [
+        name for name, member in vars(service_class).items()
+        if not name.startswith('_') and callable(member)
+    ]
+
+
+def prebuild_sdk_headers(service_name, service_version, operation_ids):
+    """
+    Build the SDK headers of the given operations ahead of the first request.
+
+    Services call this from their constructor so that no header is formatted
+    on the request path.
+    """
+    for operation_id in operation_ids:
+        get_sdk_headers(service_name, service_version, operation_id)
@@ -32,22 +32,24 @@ See: https://cloud.ibm.com/docs/compare-comply?topic=compare-comply-about
 
 from datetime import datetime
 from enum import Enum
-from typing import BinaryIO, Dict, List
-import json
+from typing import BinaryIO, List
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class CompareComplyV1(BaseService):
+class CompareComplyV1(WatsonService):
     """The Compare Comply V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.compare-comply.watson.cloud.ibm.com'
@@ -58,6 +60,7 @@ class CompareComplyV1(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Compare Comply service.
@@ -68,6 +71,9 @@ class CompareComplyV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         print(
             'warning: On 30 November 2021, Compare and Comply will no longer be available. For more information, see https://github.com/watson-developer-cloud/python-sdk#compare-and-comply-deprecation.'
@@ -77,11 +83,14 @@ class CompareComplyV1(BaseService):
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(CompareComplyV1))
 
     #########################
     # HTML conversion
@@ -135,7 +144,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=HTMLReturn, **kwargs)
         return response
 
     #########################
@@ -190,7 +199,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ClassifyReturn, **kwargs)
         return response
 
     #########################
@@ -245,7 +254,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TableReturn, **kwargs)
         return response
 
     #########################
@@ -317,7 +326,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CompareReturn, **kwargs)
         return response
 
     #########################
@@ -365,7 +374,7 @@ class CompareComplyV1(BaseService):
             'comment': comment
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -379,7 +388,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=FeedbackReturn, **kwargs)
         return response
 
     def list_feedback(self,
@@ -491,7 +500,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=FeedbackList, **kwargs)
         return response
 
     def get_feedback(self,
@@ -539,7 +548,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=GetFeedback, **kwargs)
         return response
 
     def delete_feedback(self,
@@ -587,7 +596,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=FeedbackDeleted, **kwargs)
         return response
 
     #########################
@@ -693,7 +702,7 @@ class CompareComplyV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=BatchStatus, **kwargs)
         return response
 
     def list_batches(self, **kwargs) -> DetailedResponse:
@@ -725,7 +734,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Batches, **kwargs)
         return response
 
     def get_batch(self, batch_id: str, **kwargs) -> DetailedResponse:
@@ -764,7 +773,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=BatchStatus, **kwargs)
         return response
 
     def update_batch(self,
@@ -817,7 +826,7 @@ class CompareComplyV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=BatchStatus, **kwargs)
         return response
 
 
@@ -1033,12 +1042,16 @@ class UpdateBatchEnums:
         TABLES = 'tables'
 
 
+class AsyncCompareComplyV1(AsyncWatsonService, CompareComplyV1):
+    """The Compare Comply V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class Address():
+class Address(Model):
     """
     A party's address.
 
@@ -1048,6 +1061,13 @@ class Address():
           `end`.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -1063,50 +1083,8 @@ class Address():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Address':
-        """Initialize a Address object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Address object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Address object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Address') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Address') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AlignedElement():
+
+class AlignedElement(Model):
     """
     AlignedElement.
 
@@ -1122,6 +1100,16 @@ class AlignedElement():
           are contractual clauses of significance.
     """
 
+    __slots__ = ('element_pair', 'identical_text', 'provenance_ids',
+                 'significant_elements')
+
+    _fields = (
+        ModelField('element_pair', 'list', 'ElementPair'),
+        ModelField('identical_text'),
+        ModelField('provenance_ids'),
+        ModelField('significant_elements'),
+    )
+
     def __init__(self,
                  *,
                  element_pair: List['ElementPair'] = None,
@@ -1148,61 +1136,8 @@ class AlignedElement():
         self.provenance_ids = provenance_ids
         self.significant_elements = significant_elements
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AlignedElement':
-        """Initialize a AlignedElement object from a json dictionary."""
-        args = {}
-        if 'element_pair' in _dict:
-            args['element_pair'] = [
-                ElementPair.from_dict(x) for x in _dict.get('element_pair')
-            ]
-        if 'identical_text' in _dict:
-            args['identical_text'] = _dict.get('identical_text')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'significant_elements' in _dict:
-            args['significant_elements'] = _dict.get('significant_elements')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AlignedElement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'element_pair') and self.element_pair is not None:
-            _dict['element_pair'] = [x.to_dict() for x in self.element_pair]
-        if hasattr(self, 'identical_text') and self.identical_text is not None:
-            _dict['identical_text'] = self.identical_text
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'significant_elements'
-                  ) and self.significant_elements is not None:
-            _dict['significant_elements'] = self.significant_elements
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AlignedElement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AlignedElement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AlignedElement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Attribute():
+
+class Attribute(Model):
     """
     List of document attributes.
 
@@ -1213,6 +1148,14 @@ class Attribute():
           `end`.
     """
 
+    __slots__ = ('type', 'text', 'location')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -1231,52 +1174,6 @@ class Attribute():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Attribute':
-        """Initialize a Attribute object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Attribute object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Attribute object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Attribute') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Attribute') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of attribute.
@@ -1292,7 +1189,7 @@ class Attribute():
         PERSON = 'Person'
 
 
-class BatchStatus():
+class BatchStatus(Model):
     """
     The batch-request status.
 
@@ -1316,6 +1213,23 @@ class BatchStatus():
           batch request.
     """
 
+    __slots__ = ('function', 'input_bucket_location', 'input_bucket_name',
+                 'output_bucket_location', 'output_bucket_name', 'batch_id',
+                 'document_counts', 'status', 'created', 'updated')
+
+    _fields = (
+        ModelField('function'),
+        ModelField('input_bucket_location'),
+        ModelField('input_bucket_name'),
+        ModelField('output_bucket_location'),
+        ModelField('output_bucket_name'),
+        ModelField('batch_id'),
+        ModelField('document_counts', 'model', 'DocCounts'),
+        ModelField('status'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  *,
                  function: str = None,
@@ -1363,87 +1277,6 @@ class BatchStatus():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BatchStatus':
-        """Initialize a BatchStatus object from a json dictionary."""
-        args = {}
-        if 'function' in _dict:
-            args['function'] = _dict.get('function')
-        if 'input_bucket_location' in _dict:
-            args['input_bucket_location'] = _dict.get('input_bucket_location')
-        if 'input_bucket_name' in _dict:
-            args['input_bucket_name'] = _dict.get('input_bucket_name')
-        if 'output_bucket_location' in _dict:
-            args['output_bucket_location'] = _dict.get('output_bucket_location')
-        if 'output_bucket_name' in _dict:
-            args['output_bucket_name'] = _dict.get('output_bucket_name')
-        if 'batch_id' in _dict:
-            args['batch_id'] = _dict.get('batch_id')
-        if 'document_counts' in _dict:
-            args['document_counts'] = DocCounts.from_dict(
-                _dict.get('document_counts'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BatchStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'function') and self.function is not None:
-            _dict['function'] = self.function
-        if hasattr(self, 'input_bucket_location'
-                  ) and self.input_bucket_location is not None:
-            _dict['input_bucket_location'] = self.input_bucket_location
-        if hasattr(self,
-                   'input_bucket_name') and self.input_bucket_name is not None:
-            _dict['input_bucket_name'] = self.input_bucket_name
-        if hasattr(self, 'output_bucket_location'
-                  ) and self.output_bucket_location is not None:
-            _dict['output_bucket_location'] = self.output_bucket_location
-        if hasattr(
-                self,
-                'output_bucket_name') and self.output_bucket_name is not None:
-            _dict['output_bucket_name'] = self.output_bucket_name
-        if hasattr(self, 'batch_id') and self.batch_id is not None:
-            _dict['batch_id'] = self.batch_id
-        if hasattr(self,
-                   'document_counts') and self.document_counts is not None:
-            _dict['document_counts'] = self.document_counts.to_dict()
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = datetime_to_string(self.updated)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BatchStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BatchStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BatchStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class FunctionEnum(str, Enum):
         """
         The method to be run against the documents. Possible values are `html_conversion`,
@@ -1454,7 +1287,7 @@ class BatchStatus():
         TABLES = 'tables'
 
 
-class Batches():
+class Batches(Model):
     """
     The results of a successful **List Batches** request.
 
@@ -1462,6 +1295,12 @@ class Batches():
           requests.
     """
 
+    __slots__ = ('batches',)
+
+    _fields = (
+        ModelField('batches', 'list', 'BatchStatus'),
+    )
+
     def __init__(self, *, batches: List['BatchStatus'] = None) -> None:
         """
         Initialize a Batches object.
@@ -1471,48 +1310,8 @@ class Batches():
         """
         self.batches = batches
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Batches':
-        """Initialize a Batches object from a json dictionary."""
-        args = {}
-        if 'batches' in _dict:
-            args['batches'] = [
-                BatchStatus.from_dict(x) for x in _dict.get('batches')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Batches object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'batches') and self.batches is not None:
-            _dict['batches'] = [x.to_dict() for x in self.batches]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Batches object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Batches') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Batches') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class BodyCells():
+
+class BodyCells(Model):
     """
     Cells that are not table header, column header, or row header cells.
 
@@ -1547,6 +1346,30 @@ class BodyCells():
     :attr List[Attribute] attributes: (optional)
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'row_index_begin',
+                 'row_index_end', 'column_index_begin', 'column_index_end',
+                 'row_header_ids', 'row_header_texts',
+                 'row_header_texts_normalized', 'column_header_ids',
+                 'column_header_texts', 'column_header_texts_normalized',
+                 'attributes')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+        ModelField('row_header_ids'),
+        ModelField('row_header_texts'),
+        ModelField('row_header_texts_normalized'),
+        ModelField('column_header_ids'),
+        ModelField('column_header_texts'),
+        ModelField('column_header_texts_normalized'),
+        ModelField('attributes', 'list', 'Attribute'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -1614,114 +1437,8 @@ class BodyCells():
         self.column_header_texts_normalized = column_header_texts_normalized
         self.attributes = attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'BodyCells':
-        """Initialize a BodyCells object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        if 'row_header_ids' in _dict:
-            args['row_header_ids'] = _dict.get('row_header_ids')
-        if 'row_header_texts' in _dict:
-            args['row_header_texts'] = _dict.get('row_header_texts')
-        if 'row_header_texts_normalized' in _dict:
-            args['row_header_texts_normalized'] = _dict.get(
-                'row_header_texts_normalized')
-        if 'column_header_ids' in _dict:
-            args['column_header_ids'] = _dict.get('column_header_ids')
-        if 'column_header_texts' in _dict:
-            args['column_header_texts'] = _dict.get('column_header_texts')
-        if 'column_header_texts_normalized' in _dict:
-            args['column_header_texts_normalized'] = _dict.get(
-                'column_header_texts_normalized')
-        if 'attributes' in _dict:
-            args['attributes'] = [
-                Attribute.from_dict(x) for x in _dict.get('attributes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a BodyCells object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        if hasattr(self, 'row_header_ids') and self.row_header_ids is not None:
-            _dict['row_header_ids'] = self.row_header_ids
-        if hasattr(self,
-                   'row_header_texts') and self.row_header_texts is not None:
-            _dict['row_header_texts'] = self.row_header_texts
-        if hasattr(self, 'row_header_texts_normalized'
-                  ) and self.row_header_texts_normalized is not None:
-            _dict[
-                'row_header_texts_normalized'] = self.row_header_texts_normalized
-        if hasattr(self,
-                   'column_header_ids') and self.column_header_ids is not None:
-            _dict['column_header_ids'] = self.column_header_ids
-        if hasattr(
-                self,
-                'column_header_texts') and self.column_header_texts is not None:
-            _dict['column_header_texts'] = self.column_header_texts
-        if hasattr(self, 'column_header_texts_normalized'
-                  ) and self.column_header_texts_normalized is not None:
-            _dict[
-                'column_header_texts_normalized'] = self.column_header_texts_normalized
-        if hasattr(self, 'attributes') and self.attributes is not None:
-            _dict['attributes'] = [x.to_dict() for x in self.attributes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this BodyCells object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'BodyCells') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'BodyCells') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Category():
+
+class Category(Model):
     """
     Information defining an element's subject matter.
 
@@ -1732,6 +1449,14 @@ class Category():
           entry in the updated labels response.
     """
 
+    __slots__ = ('label', 'provenance_ids', 'modification')
+
+    _fields = (
+        ModelField('label'),
+        ModelField('provenance_ids'),
+        ModelField('modification'),
+    )
+
     def __init__(self,
                  *,
                  label: str = None,
@@ -1750,52 +1475,6 @@ class Category():
         self.provenance_ids = provenance_ids
         self.modification = modification
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Category':
-        """Initialize a Category object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'modification' in _dict:
-            args['modification'] = _dict.get('modification')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Category object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'modification') and self.modification is not None:
-            _dict['modification'] = self.modification
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Category object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Category') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Category') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LabelEnum(str, Enum):
         """
         The category of the associated element.
@@ -1835,13 +1514,19 @@ class Category():
         REMOVED = 'removed'
 
 
-class CategoryComparison():
+class CategoryComparison(Model):
     """
     Information defining an element's subject matter.
 
     :attr str label: (optional) The category of the associated element.
     """
 
+    __slots__ = ('label',)
+
+    _fields = (
+        ModelField('label'),
+    )
+
     def __init__(self, *, label: str = None) -> None:
         """
         Initialize a CategoryComparison object.
@@ -1850,44 +1535,6 @@ class CategoryComparison():
         """
         self.label = label
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoryComparison':
-        """Initialize a CategoryComparison object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoryComparison object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoryComparison object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoryComparison') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoryComparison') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LabelEnum(str, Enum):
         """
         The category of the associated element.
@@ -1919,7 +1566,7 @@ class CategoryComparison():
         WARRANTIES = 'Warranties'
 
 
-class ClassifyReturn():
+class ClassifyReturn(Model):
     """
     The analysis of objects returned by the **Element classification** method.
 
@@ -1954,6 +1601,29 @@ class ClassifyReturn():
           the input document.
     """
 
+    __slots__ = ('document', 'model_id', 'model_version', 'elements',
+                 'effective_dates', 'contract_amounts', 'termination_dates',
+                 'contract_types', 'contract_terms', 'payment_terms',
+                 'contract_currencies', 'tables', 'document_structure',
+                 'parties')
+
+    _fields = (
+        ModelField('document', 'model', 'Document'),
+        ModelField('model_id'),
+        ModelField('model_version'),
+        ModelField('elements', 'list', 'Element'),
+        ModelField('effective_dates', 'list', 'EffectiveDates'),
+        ModelField('contract_amounts', 'list', 'ContractAmts'),
+        ModelField('termination_dates', 'list', 'TerminationDates'),
+        ModelField('contract_types', 'list', 'ContractTypes'),
+        ModelField('contract_terms', 'list', 'ContractTerms'),
+        ModelField('payment_terms', 'list', 'PaymentTerms'),
+        ModelField('contract_currencies', 'list', 'ContractCurrencies'),
+        ModelField('tables', 'list', 'Tables'),
+        ModelField('document_structure', 'model', 'DocStructure'),
+        ModelField('parties', 'list', 'Parties'),
+    )
+
     def __init__(self,
                  *,
                  document: 'Document' = None,
@@ -2019,135 +1689,8 @@ class ClassifyReturn():
         self.document_structure = document_structure
         self.parties = parties
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifyReturn':
-        """Initialize a ClassifyReturn object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = Document.from_dict(_dict.get('document'))
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'elements' in _dict:
-            args['elements'] = [
-                Element.from_dict(x) for x in _dict.get('elements')
-            ]
-        if 'effective_dates' in _dict:
-            args['effective_dates'] = [
-                EffectiveDates.from_dict(x)
-                for x in _dict.get('effective_dates')
-            ]
-        if 'contract_amounts' in _dict:
-            args['contract_amounts'] = [
-                ContractAmts.from_dict(x) for x in _dict.get('contract_amounts')
-            ]
-        if 'termination_dates' in _dict:
-            args['termination_dates'] = [
-                TerminationDates.from_dict(x)
-                for x in _dict.get('termination_dates')
-            ]
-        if 'contract_types' in _dict:
-            args['contract_types'] = [
-                ContractTypes.from_dict(x) for x in _dict.get('contract_types')
-            ]
-        if 'contract_terms' in _dict:
-            args['contract_terms'] = [
-                ContractTerms.from_dict(x) for x in _dict.get('contract_terms')
-            ]
-        if 'payment_terms' in _dict:
-            args['payment_terms'] = [
-                PaymentTerms.from_dict(x) for x in _dict.get('payment_terms')
-            ]
-        if 'contract_currencies' in _dict:
-            args['contract_currencies'] = [
-                ContractCurrencies.from_dict(x)
-                for x in _dict.get('contract_currencies')
-            ]
-        if 'tables' in _dict:
-            args['tables'] = [Tables.from_dict(x) for x in _dict.get('tables')]
-        if 'document_structure' in _dict:
-            args['document_structure'] = DocStructure.from_dict(
-                _dict.get('document_structure'))
-        if 'parties' in _dict:
-            args['parties'] = [
-                Parties.from_dict(x) for x in _dict.get('parties')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifyReturn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'elements') and self.elements is not None:
-            _dict['elements'] = [x.to_dict() for x in self.elements]
-        if hasattr(self,
-                   'effective_dates') and self.effective_dates is not None:
-            _dict['effective_dates'] = [
-                x.to_dict() for x in self.effective_dates
-            ]
-        if hasattr(self,
-                   'contract_amounts') and self.contract_amounts is not None:
-            _dict['contract_amounts'] = [
-                x.to_dict() for x in self.contract_amounts
-            ]
-        if hasattr(self,
-                   'termination_dates') and self.termination_dates is not None:
-            _dict['termination_dates'] = [
-                x.to_dict() for x in self.termination_dates
-            ]
-        if hasattr(self, 'contract_types') and self.contract_types is not None:
-            _dict['contract_types'] = [x.to_dict() for x in self.contract_types]
-        if hasattr(self, 'contract_terms') and self.contract_terms is not None:
-            _dict['contract_terms'] = [x.to_dict() for x in self.contract_terms]
-        if hasattr(self, 'payment_terms') and self.payment_terms is not None:
-            _dict['payment_terms'] = [x.to_dict() for x in self.payment_terms]
-        if hasattr(
-                self,
-                'contract_currencies') and self.contract_currencies is not None:
-            _dict['contract_currencies'] = [
-                x.to_dict() for x in self.contract_currencies
-            ]
-        if hasattr(self, 'tables') and self.tables is not None:
-            _dict['tables'] = [x.to_dict() for x in self.tables]
-        if hasattr(
-                self,
-                'document_structure') and self.document_structure is not None:
-            _dict['document_structure'] = self.document_structure.to_dict()
-        if hasattr(self, 'parties') and self.parties is not None:
-            _dict['parties'] = [x.to_dict() for x in self.parties]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifyReturn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifyReturn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifyReturn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ColumnHeaders():
+
+class ColumnHeaders(Model):
     """
     Column-level cells, each applicable as a header to other cells in the same column as
     itself, of the current table.
@@ -2171,6 +1714,21 @@ class ColumnHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'text_normalized',
+                 'row_index_begin', 'row_index_end', 'column_index_begin',
+                 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -2212,79 +1770,8 @@ class ColumnHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ColumnHeaders':
-        """Initialize a ColumnHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ColumnHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ColumnHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ColumnHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ColumnHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CompareReturn():
+
+class CompareReturn(Model):
     """
     The comparison of the two submitted documents.
 
@@ -2301,6 +1788,17 @@ class CompareReturn():
           that do not semantically align between the compared documents.
     """
 
+    __slots__ = ('model_id', 'model_version', 'documents', 'aligned_elements',
+                 'unaligned_elements')
+
+    _fields = (
+        ModelField('model_id'),
+        ModelField('model_version'),
+        ModelField('documents', 'list', 'Document'),
+        ModelField('aligned_elements', 'list', 'AlignedElement'),
+        ModelField('unaligned_elements', 'list', 'UnalignedElement'),
+    )
+
     def __init__(self,
                  *,
                  model_id: str = None,
@@ -2329,77 +1827,8 @@ class CompareReturn():
         self.aligned_elements = aligned_elements
         self.unaligned_elements = unaligned_elements
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CompareReturn':
-        """Initialize a CompareReturn object from a json dictionary."""
-        args = {}
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'documents' in _dict:
-            args['documents'] = [
-                Document.from_dict(x) for x in _dict.get('documents')
-            ]
-        if 'aligned_elements' in _dict:
-            args['aligned_elements'] = [
-                AlignedElement.from_dict(x)
-                for x in _dict.get('aligned_elements')
-            ]
-        if 'unaligned_elements' in _dict:
-            args['unaligned_elements'] = [
-                UnalignedElement.from_dict(x)
-                for x in _dict.get('unaligned_elements')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CompareReturn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'documents') and self.documents is not None:
-            _dict['documents'] = [x.to_dict() for x in self.documents]
-        if hasattr(self,
-                   'aligned_elements') and self.aligned_elements is not None:
-            _dict['aligned_elements'] = [
-                x.to_dict() for x in self.aligned_elements
-            ]
-        if hasattr(
-                self,
-                'unaligned_elements') and self.unaligned_elements is not None:
-            _dict['unaligned_elements'] = [
-                x.to_dict() for x in self.unaligned_elements
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CompareReturn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CompareReturn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CompareReturn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Contact():
+
+class Contact(Model):
     """
     A contact.
 
@@ -2407,6 +1836,13 @@ class Contact():
     :attr str role: (optional) A string listing the role of the contact.
     """
 
+    __slots__ = ('name', 'role')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('role'),
+    )
+
     def __init__(self, *, name: str = None, role: str = None) -> None:
         """
         Initialize a Contact object.
@@ -2417,50 +1853,8 @@ class Contact():
         self.name = name
         self.role = role
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Contact':
-        """Initialize a Contact object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'role' in _dict:
-            args['role'] = _dict.get('role')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Contact object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'role') and self.role is not None:
-            _dict['role'] = self.role
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Contact object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Contact') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Contact') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Contexts():
+
+class Contexts(Model):
     """
     Text that is related to the contents of the table and that precedes or follows the
     current table.
@@ -2471,6 +1865,13 @@ class Contexts():
           `end`.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -2486,50 +1887,8 @@ class Contexts():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Contexts':
-        """Initialize a Contexts object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Contexts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Contexts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Contexts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Contexts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ContractAmts():
+
+class ContractAmts(Model):
     """
     A monetary amount identified in the input document.
 
@@ -2549,6 +1908,18 @@ class ContractAmts():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'interpretation', 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('interpretation', 'model', 'Interpretation'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -2582,67 +1953,6 @@ class ContractAmts():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ContractAmts':
-        """Initialize a ContractAmts object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'interpretation' in _dict:
-            args['interpretation'] = Interpretation.from_dict(
-                _dict.get('interpretation'))
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ContractAmts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'interpretation') and self.interpretation is not None:
-            _dict['interpretation'] = self.interpretation.to_dict()
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ContractAmts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ContractAmts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ContractAmts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the contract amount.
@@ -2652,7 +1962,7 @@ class ContractAmts():
         LOW = 'Low'
 
 
-class ContractCurrencies():
+class ContractCurrencies(Model):
     """
     The contract currencies that are declared in the document.
 
@@ -2670,6 +1980,17 @@ class ContractCurrencies():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -2699,62 +2020,6 @@ class ContractCurrencies():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ContractCurrencies':
-        """Initialize a ContractCurrencies object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ContractCurrencies object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ContractCurrencies object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ContractCurrencies') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ContractCurrencies') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the contract currency.
@@ -2764,7 +2029,7 @@ class ContractCurrencies():
         LOW = 'Low'
 
 
-class ContractTerms():
+class ContractTerms(Model):
     """
     The duration or durations of the contract.
 
@@ -2784,6 +2049,18 @@ class ContractTerms():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'interpretation', 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('interpretation', 'model', 'Interpretation'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -2817,67 +2094,6 @@ class ContractTerms():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ContractTerms':
-        """Initialize a ContractTerms object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'interpretation' in _dict:
-            args['interpretation'] = Interpretation.from_dict(
-                _dict.get('interpretation'))
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ContractTerms object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'interpretation') and self.interpretation is not None:
-            _dict['interpretation'] = self.interpretation.to_dict()
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ContractTerms object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ContractTerms') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ContractTerms') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the contract term.
@@ -2887,7 +2103,7 @@ class ContractTerms():
         LOW = 'Low'
 
 
-class ContractTypes():
+class ContractTypes(Model):
     """
     The contract type identified in the input document.
 
@@ -2901,6 +2117,15 @@ class ContractTypes():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -2924,57 +2149,6 @@ class ContractTypes():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ContractTypes':
-        """Initialize a ContractTypes object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ContractTypes object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ContractTypes object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ContractTypes') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ContractTypes') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the contract type.
@@ -2984,7 +2158,7 @@ class ContractTypes():
         LOW = 'Low'
 
 
-class DocCounts():
+class DocCounts(Model):
     """
     Document counts.
 
@@ -2994,6 +2168,15 @@ class DocCounts():
     :attr int failed: (optional) Number of documents not successfully processed.
     """
 
+    __slots__ = ('total', 'pending', 'successful', 'failed')
+
+    _fields = (
+        ModelField('total'),
+        ModelField('pending'),
+        ModelField('successful'),
+        ModelField('failed'),
+    )
+
     def __init__(self,
                  *,
                  total: int = None,
@@ -3015,58 +2198,8 @@ class DocCounts():
         self.successful = successful
         self.failed = failed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocCounts':
-        """Initialize a DocCounts object from a json dictionary."""
-        args = {}
-        if 'total' in _dict:
-            args['total'] = _dict.get('total')
-        if 'pending' in _dict:
-            args['pending'] = _dict.get('pending')
-        if 'successful' in _dict:
-            args['successful'] = _dict.get('successful')
-        if 'failed' in _dict:
-            args['failed'] = _dict.get('failed')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocCounts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'total') and self.total is not None:
-            _dict['total'] = self.total
-        if hasattr(self, 'pending') and self.pending is not None:
-            _dict['pending'] = self.pending
-        if hasattr(self, 'successful') and self.successful is not None:
-            _dict['successful'] = self.successful
-        if hasattr(self, 'failed') and self.failed is not None:
-            _dict['failed'] = self.failed
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocCounts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocCounts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocCounts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocInfo():
+
+class DocInfo(Model):
     """
     Information about the parsed input document.
 
@@ -3076,6 +2209,14 @@ class DocInfo():
     :attr str hash: (optional) The MD5 hash of the input document.
     """
 
+    __slots__ = ('html', 'title', 'hash')
+
+    _fields = (
+        ModelField('html'),
+        ModelField('title'),
+        ModelField('hash'),
+    )
+
     def __init__(self,
                  *,
                  html: str = None,
@@ -3094,54 +2235,8 @@ class DocInfo():
         self.title = title
         self.hash = hash
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocInfo':
-        """Initialize a DocInfo object from a json dictionary."""
-        args = {}
-        if 'html' in _dict:
-            args['html'] = _dict.get('html')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'hash' in _dict:
-            args['hash'] = _dict.get('hash')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'html') and self.html is not None:
-            _dict['html'] = self.html
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'hash') and self.hash is not None:
-            _dict['hash'] = self.hash
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocStructure():
+
+class DocStructure(Model):
     """
     The structure of the input document.
 
@@ -3155,6 +2250,14 @@ class DocStructure():
           paragraph, in parallel with the `section_titles` and `leading_sentences` arrays.
     """
 
+    __slots__ = ('section_titles', 'leading_sentences', 'paragraphs')
+
+    _fields = (
+        ModelField('section_titles', 'list', 'SectionTitles'),
+        ModelField('leading_sentences', 'list', 'LeadingSentence'),
+        ModelField('paragraphs', 'list', 'Paragraphs'),
+    )
+
     def __init__(self,
                  *,
                  section_titles: List['SectionTitles'] = None,
@@ -3177,64 +2280,8 @@ class DocStructure():
         self.leading_sentences = leading_sentences
         self.paragraphs = paragraphs
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocStructure':
-        """Initialize a DocStructure object from a json dictionary."""
-        args = {}
-        if 'section_titles' in _dict:
-            args['section_titles'] = [
-                SectionTitles.from_dict(x) for x in _dict.get('section_titles')
-            ]
-        if 'leading_sentences' in _dict:
-            args['leading_sentences'] = [
-                LeadingSentence.from_dict(x)
-                for x in _dict.get('leading_sentences')
-            ]
-        if 'paragraphs' in _dict:
-            args['paragraphs'] = [
-                Paragraphs.from_dict(x) for x in _dict.get('paragraphs')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocStructure object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'section_titles') and self.section_titles is not None:
-            _dict['section_titles'] = [x.to_dict() for x in self.section_titles]
-        if hasattr(self,
-                   'leading_sentences') and self.leading_sentences is not None:
-            _dict['leading_sentences'] = [
-                x.to_dict() for x in self.leading_sentences
-            ]
-        if hasattr(self, 'paragraphs') and self.paragraphs is not None:
-            _dict['paragraphs'] = [x.to_dict() for x in self.paragraphs]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocStructure object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocStructure') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocStructure') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Document():
+
+class Document(Model):
     """
     Basic information about the input document.
 
@@ -3246,6 +2293,15 @@ class Document():
           only in the output of the **Comparing two documents** method.
     """
 
+    __slots__ = ('title', 'html', 'hash', 'label')
+
+    _fields = (
+        ModelField('title'),
+        ModelField('html'),
+        ModelField('hash'),
+        ModelField('label'),
+    )
+
     def __init__(self,
                  *,
                  title: str = None,
@@ -3267,58 +2323,8 @@ class Document():
         self.hash = hash
         self.label = label
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Document':
-        """Initialize a Document object from a json dictionary."""
-        args = {}
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'html' in _dict:
-            args['html'] = _dict.get('html')
-        if 'hash' in _dict:
-            args['hash'] = _dict.get('hash')
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Document object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'html') and self.html is not None:
-            _dict['html'] = self.html
-        if hasattr(self, 'hash') and self.hash is not None:
-            _dict['hash'] = self.hash
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Document object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Document') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Document') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EffectiveDates():
+
+class EffectiveDates(Model):
     """
     An effective date.
 
@@ -3335,6 +2341,17 @@ class EffectiveDates():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -3363,62 +2380,6 @@ class EffectiveDates():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EffectiveDates':
-        """Initialize a EffectiveDates object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EffectiveDates object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EffectiveDates object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EffectiveDates') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EffectiveDates') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the effective date.
@@ -3428,7 +2389,7 @@ class EffectiveDates():
         LOW = 'Low'
 
 
-class Element():
+class Element(Model):
     """
     A component part of the document.
 
@@ -3443,6 +2404,16 @@ class Element():
     :attr List[Attribute] attributes: (optional) List of document attributes.
     """
 
+    __slots__ = ('location', 'text', 'types', 'categories', 'attributes')
+
+    _fields = (
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('types', 'list', 'TypeLabel'),
+        ModelField('categories', 'list', 'Category'),
+        ModelField('attributes', 'list', 'Attribute'),
+    )
+
     def __init__(self,
                  *,
                  location: 'Location' = None,
@@ -3470,66 +2441,8 @@ class Element():
         self.categories = categories
         self.attributes = attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Element':
-        """Initialize a Element object from a json dictionary."""
-        args = {}
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'types' in _dict:
-            args['types'] = [TypeLabel.from_dict(x) for x in _dict.get('types')]
-        if 'categories' in _dict:
-            args['categories'] = [
-                Category.from_dict(x) for x in _dict.get('categories')
-            ]
-        if 'attributes' in _dict:
-            args['attributes'] = [
-                Attribute.from_dict(x) for x in _dict.get('attributes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Element object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        if hasattr(self, 'attributes') and self.attributes is not None:
-            _dict['attributes'] = [x.to_dict() for x in self.attributes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Element object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Element') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Element') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ElementLocations():
+
+class ElementLocations(Model):
     """
     A list of `begin` and `end` indexes that indicate the locations of the elements in the
     input document.
@@ -3540,6 +2453,13 @@ class ElementLocations():
           element in the input document.
     """
 
+    __slots__ = ('begin', 'end')
+
+    _fields = (
+        ModelField('begin'),
+        ModelField('end'),
+    )
+
     def __init__(self, *, begin: int = None, end: int = None) -> None:
         """
         Initialize a ElementLocations object.
@@ -3552,50 +2472,8 @@ class ElementLocations():
         self.begin = begin
         self.end = end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ElementLocations':
-        """Initialize a ElementLocations object from a json dictionary."""
-        args = {}
-        if 'begin' in _dict:
-            args['begin'] = _dict.get('begin')
-        if 'end' in _dict:
-            args['end'] = _dict.get('end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ElementLocations object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'begin') and self.begin is not None:
-            _dict['begin'] = self.begin
-        if hasattr(self, 'end') and self.end is not None:
-            _dict['end'] = self.end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ElementLocations object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ElementLocations') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ElementLocations') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ElementPair():
+
+class ElementPair(Model):
     """
     Details of semantically aligned elements.
 
@@ -3614,6 +2492,18 @@ class ElementPair():
     :attr List[Attribute] attributes: (optional) List of document attributes.
     """
 
+    __slots__ = ('document_label', 'text', 'location', 'types', 'categories',
+                 'attributes')
+
+    _fields = (
+        ModelField('document_label'),
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('types', 'list', 'TypeLabelComparison'),
+        ModelField('categories', 'list', 'CategoryComparison'),
+        ModelField('attributes', 'list', 'Attribute'),
+    )
+
     def __init__(self,
                  *,
                  document_label: str = None,
@@ -3646,72 +2536,8 @@ class ElementPair():
         self.categories = categories
         self.attributes = attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ElementPair':
-        """Initialize a ElementPair object from a json dictionary."""
-        args = {}
-        if 'document_label' in _dict:
-            args['document_label'] = _dict.get('document_label')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'types' in _dict:
-            args['types'] = [
-                TypeLabelComparison.from_dict(x) for x in _dict.get('types')
-            ]
-        if 'categories' in _dict:
-            args['categories'] = [
-                CategoryComparison.from_dict(x) for x in _dict.get('categories')
-            ]
-        if 'attributes' in _dict:
-            args['attributes'] = [
-                Attribute.from_dict(x) for x in _dict.get('attributes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ElementPair object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_label') and self.document_label is not None:
-            _dict['document_label'] = self.document_label
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        if hasattr(self, 'attributes') and self.attributes is not None:
-            _dict['attributes'] = [x.to_dict() for x in self.attributes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ElementPair object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ElementPair') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ElementPair') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeedbackDataInput():
+
+class FeedbackDataInput(Model):
     """
     Feedback data for submission.
 
@@ -3731,6 +2557,21 @@ class FeedbackDataInput():
           document, accounting for the submitted feedback.
     """
 
+    __slots__ = ('feedback_type', 'document', 'model_id', 'model_version',
+                 'location', 'text', 'original_labels', 'updated_labels')
+
+    _fields = (
+        ModelField('feedback_type', required=True),
+        ModelField('document', 'model', 'ShortDoc'),
+        ModelField('model_id'),
+        ModelField('model_version'),
+        ModelField('location', 'model', 'Location', required=True),
+        ModelField('text', required=True),
+        ModelField('original_labels', 'model', 'OriginalLabelsIn',
+                   required=True),
+        ModelField('updated_labels', 'model', 'UpdatedLabelsIn', required=True),
+    )
+
     def __init__(self,
                  feedback_type: str,
                  location: 'Location',
@@ -3769,97 +2610,8 @@ class FeedbackDataInput():
         self.original_labels = original_labels
         self.updated_labels = updated_labels
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeedbackDataInput':
-        """Initialize a FeedbackDataInput object from a json dictionary."""
-        args = {}
-        if 'feedback_type' in _dict:
-            args['feedback_type'] = _dict.get('feedback_type')
-        else:
-            raise ValueError(
-                'Required property \'feedback_type\' not present in FeedbackDataInput JSON'
-            )
-        if 'document' in _dict:
-            args['document'] = ShortDoc.from_dict(_dict.get('document'))
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        else:
-            raise ValueError(
-                'Required property \'location\' not present in FeedbackDataInput JSON'
-            )
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in FeedbackDataInput JSON'
-            )
-        if 'original_labels' in _dict:
-            args['original_labels'] = OriginalLabelsIn.from_dict(
-                _dict.get('original_labels'))
-        else:
-            raise ValueError(
-                'Required property \'original_labels\' not present in FeedbackDataInput JSON'
-            )
-        if 'updated_labels' in _dict:
-            args['updated_labels'] = UpdatedLabelsIn.from_dict(
-                _dict.get('updated_labels'))
-        else:
-            raise ValueError(
-                'Required property \'updated_labels\' not present in FeedbackDataInput JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeedbackDataInput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'feedback_type') and self.feedback_type is not None:
-            _dict['feedback_type'] = self.feedback_type
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'original_labels') and self.original_labels is not None:
-            _dict['original_labels'] = self.original_labels.to_dict()
-        if hasattr(self, 'updated_labels') and self.updated_labels is not None:
-            _dict['updated_labels'] = self.updated_labels.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeedbackDataInput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeedbackDataInput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeedbackDataInput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeedbackDataOutput():
+
+class FeedbackDataOutput(Model):
     """
     Information returned from the **Add Feedback** method.
 
@@ -3882,6 +2634,22 @@ class FeedbackDataOutput():
           length of the output.
     """
 
+    __slots__ = ('feedback_type', 'document', 'model_id', 'model_version',
+                 'location', 'text', 'original_labels', 'updated_labels',
+                 'pagination')
+
+    _fields = (
+        ModelField('feedback_type'),
+        ModelField('document', 'model', 'ShortDoc'),
+        ModelField('model_id'),
+        ModelField('model_version'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('original_labels', 'model', 'OriginalLabelsOut'),
+        ModelField('updated_labels', 'model', 'UpdatedLabelsOut'),
+        ModelField('pagination', 'model', 'Pagination'),
+    )
+
     def __init__(self,
                  *,
                  feedback_type: str = None,
@@ -3925,81 +2693,8 @@ class FeedbackDataOutput():
         self.updated_labels = updated_labels
         self.pagination = pagination
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeedbackDataOutput':
-        """Initialize a FeedbackDataOutput object from a json dictionary."""
-        args = {}
-        if 'feedback_type' in _dict:
-            args['feedback_type'] = _dict.get('feedback_type')
-        if 'document' in _dict:
-            args['document'] = ShortDoc.from_dict(_dict.get('document'))
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'original_labels' in _dict:
-            args['original_labels'] = OriginalLabelsOut.from_dict(
-                _dict.get('original_labels'))
-        if 'updated_labels' in _dict:
-            args['updated_labels'] = UpdatedLabelsOut.from_dict(
-                _dict.get('updated_labels'))
-        if 'pagination' in _dict:
-            args['pagination'] = Pagination.from_dict(_dict.get('pagination'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeedbackDataOutput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'feedback_type') and self.feedback_type is not None:
-            _dict['feedback_type'] = self.feedback_type
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'original_labels') and self.original_labels is not None:
-            _dict['original_labels'] = self.original_labels.to_dict()
-        if hasattr(self, 'updated_labels') and self.updated_labels is not None:
-            _dict['updated_labels'] = self.updated_labels.to_dict()
-        if hasattr(self, 'pagination') and self.pagination is not None:
-            _dict['pagination'] = self.pagination.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeedbackDataOutput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeedbackDataOutput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeedbackDataOutput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeedbackDeleted():
+
+class FeedbackDeleted(Model):
     """
     The status and message of the deletion request.
 
@@ -4007,6 +2702,13 @@ class FeedbackDeleted():
     :attr str message: (optional) Status message returned from the service.
     """
 
+    __slots__ = ('status', 'message')
+
+    _fields = (
+        ModelField('status'),
+        ModelField('message'),
+    )
+
     def __init__(self, *, status: int = None, message: str = None) -> None:
         """
         Initialize a FeedbackDeleted object.
@@ -4017,50 +2719,8 @@ class FeedbackDeleted():
         self.status = status
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeedbackDeleted':
-        """Initialize a FeedbackDeleted object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeedbackDeleted object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeedbackDeleted object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeedbackDeleted') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeedbackDeleted') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeedbackList():
+
+class FeedbackList(Model):
     """
     The results of a successful **List Feedback** request for all feedback.
 
@@ -4068,6 +2728,12 @@ class FeedbackList():
           document.
     """
 
+    __slots__ = ('feedback',)
+
+    _fields = (
+        ModelField('feedback', 'list', 'GetFeedback'),
+    )
+
     def __init__(self, *, feedback: List['GetFeedback'] = None) -> None:
         """
         Initialize a FeedbackList object.
@@ -4077,48 +2743,8 @@ class FeedbackList():
         """
         self.feedback = feedback
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeedbackList':
-        """Initialize a FeedbackList object from a json dictionary."""
-        args = {}
-        if 'feedback' in _dict:
-            args['feedback'] = [
-                GetFeedback.from_dict(x) for x in _dict.get('feedback')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeedbackList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'feedback') and self.feedback is not None:
-            _dict['feedback'] = [x.to_dict() for x in self.feedback]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeedbackList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeedbackList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeedbackList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeedbackReturn():
+
+class FeedbackReturn(Model):
     """
     Information about the document and the submitted feedback.
 
@@ -4133,6 +2759,17 @@ class FeedbackReturn():
           **Add Feedback** method.
     """
 
+    __slots__ = ('feedback_id', 'user_id', 'comment', 'created',
+                 'feedback_data')
+
+    _fields = (
+        ModelField('feedback_id'),
+        ModelField('user_id'),
+        ModelField('comment'),
+        ModelField('created', 'datetime'),
+        ModelField('feedback_data', 'model', 'FeedbackDataOutput'),
+    )
+
     def __init__(self,
                  *,
                  feedback_id: str = None,
@@ -4159,63 +2796,8 @@ class FeedbackReturn():
         self.created = created
         self.feedback_data = feedback_data
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeedbackReturn':
-        """Initialize a FeedbackReturn object from a json dictionary."""
-        args = {}
-        if 'feedback_id' in _dict:
-            args['feedback_id'] = _dict.get('feedback_id')
-        if 'user_id' in _dict:
-            args['user_id'] = _dict.get('user_id')
-        if 'comment' in _dict:
-            args['comment'] = _dict.get('comment')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'feedback_data' in _dict:
-            args['feedback_data'] = FeedbackDataOutput.from_dict(
-                _dict.get('feedback_data'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeedbackReturn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'feedback_id') and self.feedback_id is not None:
-            _dict['feedback_id'] = self.feedback_id
-        if hasattr(self, 'user_id') and self.user_id is not None:
-            _dict['user_id'] = self.user_id
-        if hasattr(self, 'comment') and self.comment is not None:
-            _dict['comment'] = self.comment
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'feedback_data') and self.feedback_data is not None:
-            _dict['feedback_data'] = self.feedback_data.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeedbackReturn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeedbackReturn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeedbackReturn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class GetFeedback():
+
+class GetFeedback(Model):
     """
     The results of a successful **Get Feedback** request for a single feedback entry.
 
@@ -4229,6 +2811,15 @@ class GetFeedback():
           **Add Feedback** method.
     """
 
+    __slots__ = ('feedback_id', 'created', 'comment', 'feedback_data')
+
+    _fields = (
+        ModelField('feedback_id'),
+        ModelField('created', 'datetime'),
+        ModelField('comment'),
+        ModelField('feedback_data', 'model', 'FeedbackDataOutput'),
+    )
+
     def __init__(self,
                  *,
                  feedback_id: str = None,
@@ -4252,59 +2843,8 @@ class GetFeedback():
         self.comment = comment
         self.feedback_data = feedback_data
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'GetFeedback':
-        """Initialize a GetFeedback object from a json dictionary."""
-        args = {}
-        if 'feedback_id' in _dict:
-            args['feedback_id'] = _dict.get('feedback_id')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'comment' in _dict:
-            args['comment'] = _dict.get('comment')
-        if 'feedback_data' in _dict:
-            args['feedback_data'] = FeedbackDataOutput.from_dict(
-                _dict.get('feedback_data'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a GetFeedback object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'feedback_id') and self.feedback_id is not None:
-            _dict['feedback_id'] = self.feedback_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'comment') and self.comment is not None:
-            _dict['comment'] = self.comment
-        if hasattr(self, 'feedback_data') and self.feedback_data is not None:
-            _dict['feedback_data'] = self.feedback_data.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this GetFeedback object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'GetFeedback') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'GetFeedback') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class HTMLReturn():
+
+class HTMLReturn(Model):
     """
     The HTML converted from an input document.
 
@@ -4316,6 +2856,16 @@ class HTMLReturn():
     :attr str html: (optional) The HTML version of the input document.
     """
 
+    __slots__ = ('num_pages', 'author', 'publication_date', 'title', 'html')
+
+    _fields = (
+        ModelField('num_pages'),
+        ModelField('author'),
+        ModelField('publication_date'),
+        ModelField('title'),
+        ModelField('html'),
+    )
+
     def __init__(self,
                  *,
                  num_pages: str = None,
@@ -4341,63 +2891,8 @@ class HTMLReturn():
         self.title = title
         self.html = html
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'HTMLReturn':
-        """Initialize a HTMLReturn object from a json dictionary."""
-        args = {}
-        if 'num_pages' in _dict:
-            args['num_pages'] = _dict.get('num_pages')
-        if 'author' in _dict:
-            args['author'] = _dict.get('author')
-        if 'publication_date' in _dict:
-            args['publication_date'] = _dict.get('publication_date')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'html' in _dict:
-            args['html'] = _dict.get('html')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a HTMLReturn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'num_pages') and self.num_pages is not None:
-            _dict['num_pages'] = self.num_pages
-        if hasattr(self, 'author') and self.author is not None:
-            _dict['author'] = self.author
-        if hasattr(self,
-                   'publication_date') and self.publication_date is not None:
-            _dict['publication_date'] = self.publication_date
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'html') and self.html is not None:
-            _dict['html'] = self.html
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this HTMLReturn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'HTMLReturn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'HTMLReturn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Interpretation():
+
+class Interpretation(Model):
     """
     The details of the normalized text, if applicable. This element is optional; it is
     returned only if normalized text exists.
@@ -4414,6 +2909,14 @@ class Interpretation():
           contains the ambiguous symbol as-is.
     """
 
+    __slots__ = ('value', 'numeric_value', 'unit')
+
+    _fields = (
+        ModelField('value'),
+        ModelField('numeric_value'),
+        ModelField('unit'),
+    )
+
     def __init__(self,
                  *,
                  value: str = None,
@@ -4438,54 +2941,8 @@ class Interpretation():
         self.numeric_value = numeric_value
         self.unit = unit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Interpretation':
-        """Initialize a Interpretation object from a json dictionary."""
-        args = {}
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        if 'numeric_value' in _dict:
-            args['numeric_value'] = _dict.get('numeric_value')
-        if 'unit' in _dict:
-            args['unit'] = _dict.get('unit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Interpretation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        if hasattr(self, 'numeric_value') and self.numeric_value is not None:
-            _dict['numeric_value'] = self.numeric_value
-        if hasattr(self, 'unit') and self.unit is not None:
-            _dict['unit'] = self.unit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Interpretation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Interpretation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Interpretation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Key():
+
+class Key(Model):
     """
     A key in a key-value pair.
 
@@ -4497,6 +2954,14 @@ class Key():
           markup.
     """
 
+    __slots__ = ('cell_id', 'location', 'text')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -4516,54 +2981,8 @@ class Key():
         self.location = location
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Key':
-        """Initialize a Key object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Key object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Key object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Key') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Key') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class KeyValuePair():
+
+class KeyValuePair(Model):
     """
     Key-value pairs detected across cell boundaries.
 
@@ -4571,6 +2990,13 @@ class KeyValuePair():
     :attr List[Value] value: (optional) A list of values in a key-value pair.
     """
 
+    __slots__ = ('key', 'value')
+
+    _fields = (
+        ModelField('key', 'model', 'Key'),
+        ModelField('value', 'list', 'Value'),
+    )
+
     def __init__(self,
                  *,
                  key: 'Key' = None,
@@ -4584,50 +3010,8 @@ class KeyValuePair():
         self.key = key
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'KeyValuePair':
-        """Initialize a KeyValuePair object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = Key.from_dict(_dict.get('key'))
-        if 'value' in _dict:
-            args['value'] = [Value.from_dict(x) for x in _dict.get('value')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a KeyValuePair object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key.to_dict()
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = [x.to_dict() for x in self.value]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this KeyValuePair object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'KeyValuePair') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'KeyValuePair') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Label():
+
+class Label(Model):
     """
     A pair of `nature` and `party` objects. The `nature` object identifies the effect of
     the element on the identified `party`, and the `party` object identifies the affected
@@ -4637,6 +3021,13 @@ class Label():
     :attr str party: The identified `party` of the element.
     """
 
+    __slots__ = ('nature', 'party')
+
+    _fields = (
+        ModelField('nature', required=True),
+        ModelField('party', required=True),
+    )
+
     def __init__(self, nature: str, party: str) -> None:
         """
         Initialize a Label object.
@@ -4647,56 +3038,8 @@ class Label():
         self.nature = nature
         self.party = party
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Label':
-        """Initialize a Label object from a json dictionary."""
-        args = {}
-        if 'nature' in _dict:
-            args['nature'] = _dict.get('nature')
-        else:
-            raise ValueError(
-                'Required property \'nature\' not present in Label JSON')
-        if 'party' in _dict:
-            args['party'] = _dict.get('party')
-        else:
-            raise ValueError(
-                'Required property \'party\' not present in Label JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Label object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'nature') and self.nature is not None:
-            _dict['nature'] = self.nature
-        if hasattr(self, 'party') and self.party is not None:
-            _dict['party'] = self.party
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Label object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Label') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Label') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class LeadingSentence():
+
+class LeadingSentence(Model):
     """
     The leading sentences in a section or subsection of the input document.
 
@@ -4708,6 +3051,14 @@ class LeadingSentence():
           `location` objects that lists the locations of detected leading sentences.
     """
 
+    __slots__ = ('text', 'location', 'element_locations')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('element_locations', 'list', 'ElementLocations'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -4727,60 +3078,8 @@ class LeadingSentence():
         self.location = location
         self.element_locations = element_locations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LeadingSentence':
-        """Initialize a LeadingSentence object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'element_locations' in _dict:
-            args['element_locations'] = [
-                ElementLocations.from_dict(x)
-                for x in _dict.get('element_locations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LeadingSentence object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self,
-                   'element_locations') and self.element_locations is not None:
-            _dict['element_locations'] = [
-                x.to_dict() for x in self.element_locations
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LeadingSentence object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LeadingSentence') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LeadingSentence') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Location():
+
+class Location(Model):
     """
     The numeric location of the identified element in the document, represented with two
     integers labeled `begin` and `end`.
@@ -4789,6 +3088,13 @@ class Location():
     :attr int end: The element's `end` index.
     """
 
+    __slots__ = ('begin', 'end')
+
+    _fields = (
+        ModelField('begin', required=True),
+        ModelField('end', required=True),
+    )
+
     def __init__(self, begin: int, end: int) -> None:
         """
         Initialize a Location object.
@@ -4799,56 +3105,8 @@ class Location():
         self.begin = begin
         self.end = end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Location':
-        """Initialize a Location object from a json dictionary."""
-        args = {}
-        if 'begin' in _dict:
-            args['begin'] = _dict.get('begin')
-        else:
-            raise ValueError(
-                'Required property \'begin\' not present in Location JSON')
-        if 'end' in _dict:
-            args['end'] = _dict.get('end')
-        else:
-            raise ValueError(
-                'Required property \'end\' not present in Location JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Location object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'begin') and self.begin is not None:
-            _dict['begin'] = self.begin
-        if hasattr(self, 'end') and self.end is not None:
-            _dict['end'] = self.end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Location object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Location') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Location') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Mention():
+
+class Mention(Model):
     """
     A mention of a party.
 
@@ -4858,6 +3116,13 @@ class Mention():
           `end`.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -4873,50 +3138,8 @@ class Mention():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Mention':
-        """Initialize a Mention object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Mention object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Mention object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Mention') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Mention') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class OriginalLabelsIn():
+
+class OriginalLabelsIn(Model):
     """
     The original labeling from the input document, without the submitted feedback.
 
@@ -4926,6 +3149,13 @@ class OriginalLabelsIn():
           element falls; in other words, the subject matter of the element.
     """
 
+    __slots__ = ('types', 'categories')
+
+    _fields = (
+        ModelField('types', 'list', 'TypeLabel', required=True),
+        ModelField('categories', 'list', 'Category', required=True),
+    )
+
     def __init__(self, types: List['TypeLabel'],
                  categories: List['Category']) -> None:
         """
@@ -4939,60 +3169,8 @@ class OriginalLabelsIn():
         self.types = types
         self.categories = categories
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'OriginalLabelsIn':
-        """Initialize a OriginalLabelsIn object from a json dictionary."""
-        args = {}
-        if 'types' in _dict:
-            args['types'] = [TypeLabel.from_dict(x) for x in _dict.get('types')]
-        else:
-            raise ValueError(
-                'Required property \'types\' not present in OriginalLabelsIn JSON'
-            )
-        if 'categories' in _dict:
-            args['categories'] = [
-                Category.from_dict(x) for x in _dict.get('categories')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'categories\' not present in OriginalLabelsIn JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a OriginalLabelsIn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this OriginalLabelsIn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'OriginalLabelsIn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'OriginalLabelsIn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class OriginalLabelsOut():
+
+class OriginalLabelsOut(Model):
     """
     The original labeling from the input document, without the submitted feedback.
 
@@ -5002,6 +3180,13 @@ class OriginalLabelsOut():
           which the element falls; in other words, the subject matter of the element.
     """
 
+    __slots__ = ('types', 'categories')
+
+    _fields = (
+        ModelField('types', 'list', 'TypeLabel'),
+        ModelField('categories', 'list', 'Category'),
+    )
+
     def __init__(self,
                  *,
                  types: List['TypeLabel'] = None,
@@ -5018,52 +3203,8 @@ class OriginalLabelsOut():
         self.types = types
         self.categories = categories
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'OriginalLabelsOut':
-        """Initialize a OriginalLabelsOut object from a json dictionary."""
-        args = {}
-        if 'types' in _dict:
-            args['types'] = [TypeLabel.from_dict(x) for x in _dict.get('types')]
-        if 'categories' in _dict:
-            args['categories'] = [
-                Category.from_dict(x) for x in _dict.get('categories')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a OriginalLabelsOut object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this OriginalLabelsOut object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'OriginalLabelsOut') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'OriginalLabelsOut') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Pagination():
+
+class Pagination(Model):
     """
     Pagination details, if required by the length of the output.
 
@@ -5076,6 +3217,17 @@ class Pagination():
     :attr int total: (optional) Reserved for future use.
     """
 
+    __slots__ = ('refresh_cursor', 'next_cursor', 'refresh_url', 'next_url',
+                 'total')
+
+    _fields = (
+        ModelField('refresh_cursor'),
+        ModelField('next_cursor'),
+        ModelField('refresh_url'),
+        ModelField('next_url'),
+        ModelField('total'),
+    )
+
     def __init__(self,
                  *,
                  refresh_cursor: str = None,
@@ -5102,62 +3254,8 @@ class Pagination():
         self.next_url = next_url
         self.total = total
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Pagination':
-        """Initialize a Pagination object from a json dictionary."""
-        args = {}
-        if 'refresh_cursor' in _dict:
-            args['refresh_cursor'] = _dict.get('refresh_cursor')
-        if 'next_cursor' in _dict:
-            args['next_cursor'] = _dict.get('next_cursor')
-        if 'refresh_url' in _dict:
-            args['refresh_url'] = _dict.get('refresh_url')
-        if 'next_url' in _dict:
-            args['next_url'] = _dict.get('next_url')
-        if 'total' in _dict:
-            args['total'] = _dict.get('total')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Pagination object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'refresh_cursor') and self.refresh_cursor is not None:
-            _dict['refresh_cursor'] = self.refresh_cursor
-        if hasattr(self, 'next_cursor') and self.next_cursor is not None:
-            _dict['next_cursor'] = self.next_cursor
-        if hasattr(self, 'refresh_url') and self.refresh_url is not None:
-            _dict['refresh_url'] = self.refresh_url
-        if hasattr(self, 'next_url') and self.next_url is not None:
-            _dict['next_url'] = self.next_url
-        if hasattr(self, 'total') and self.total is not None:
-            _dict['total'] = self.total
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Pagination object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Pagination') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Pagination') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Paragraphs():
+
+class Paragraphs(Model):
     """
     The locations of each paragraph in the input document.
 
@@ -5166,6 +3264,12 @@ class Paragraphs():
           `end`.
     """
 
+    __slots__ = ('location',)
+
+    _fields = (
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self, *, location: 'Location' = None) -> None:
         """
         Initialize a Paragraphs object.
@@ -5176,46 +3280,8 @@ class Paragraphs():
         """
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Paragraphs':
-        """Initialize a Paragraphs object from a json dictionary."""
-        args = {}
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Paragraphs object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Paragraphs object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Paragraphs') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Paragraphs') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Parties():
+class Parties(Model):
     """
     A party and its corresponding role, including address and contact information if
     identified.
@@ -5232,6 +3298,18 @@ class Parties():
           input document.
     """
 
+    __slots__ = ('party', 'role', 'importance', 'addresses', 'contacts',
+                 'mentions')
+
+    _fields = (
+        ModelField('party'),
+        ModelField('role'),
+        ModelField('importance'),
+        ModelField('addresses', 'list', 'Address'),
+        ModelField('contacts', 'list', 'Contact'),
+        ModelField('mentions', 'list', 'Mention'),
+    )
+
     def __init__(self,
                  *,
                  party: str = None,
@@ -5261,70 +3339,6 @@ class Parties():
         self.contacts = contacts
         self.mentions = mentions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Parties':
-        """Initialize a Parties object from a json dictionary."""
-        args = {}
-        if 'party' in _dict:
-            args['party'] = _dict.get('party')
-        if 'role' in _dict:
-            args['role'] = _dict.get('role')
-        if 'importance' in _dict:
-            args['importance'] = _dict.get('importance')
-        if 'addresses' in _dict:
-            args['addresses'] = [
-                Address.from_dict(x) for x in _dict.get('addresses')
-            ]
-        if 'contacts' in _dict:
-            args['contacts'] = [
-                Contact.from_dict(x) for x in _dict.get('contacts')
-            ]
-        if 'mentions' in _dict:
-            args['mentions'] = [
-                Mention.from_dict(x) for x in _dict.get('mentions')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Parties object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'party') and self.party is not None:
-            _dict['party'] = self.party
-        if hasattr(self, 'role') and self.role is not None:
-            _dict['role'] = self.role
-        if hasattr(self, 'importance') and self.importance is not None:
-            _dict['importance'] = self.importance
-        if hasattr(self, 'addresses') and self.addresses is not None:
-            _dict['addresses'] = [x.to_dict() for x in self.addresses]
-        if hasattr(self, 'contacts') and self.contacts is not None:
-            _dict['contacts'] = [x.to_dict() for x in self.contacts]
-        if hasattr(self, 'mentions') and self.mentions is not None:
-            _dict['mentions'] = [x.to_dict() for x in self.mentions]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Parties object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Parties') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Parties') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ImportanceEnum(str, Enum):
         """
         A string that identifies the importance of the party.
@@ -5333,7 +3347,7 @@ class Parties():
         UNKNOWN = 'Unknown'
 
 
-class PaymentTerms():
+class PaymentTerms(Model):
     """
     The document's payment duration or durations.
 
@@ -5353,6 +3367,18 @@ class PaymentTerms():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'interpretation', 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('interpretation', 'model', 'Interpretation'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -5386,67 +3412,6 @@ class PaymentTerms():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'PaymentTerms':
-        """Initialize a PaymentTerms object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'interpretation' in _dict:
-            args['interpretation'] = Interpretation.from_dict(
-                _dict.get('interpretation'))
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a PaymentTerms object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'interpretation') and self.interpretation is not None:
-            _dict['interpretation'] = self.interpretation.to_dict()
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this PaymentTerms object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'PaymentTerms') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'PaymentTerms') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the payment term.
@@ -5456,7 +3421,7 @@ class PaymentTerms():
         LOW = 'Low'
 
 
-class RowHeaders():
+class RowHeaders(Model):
     """
     Row-level cells, each applicable as a header to other cells in the same row as itself,
     of the current table.
@@ -5480,6 +3445,21 @@ class RowHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'text_normalized',
+                 'row_index_begin', 'row_index_end', 'column_index_begin',
+                 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -5521,79 +3501,8 @@ class RowHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RowHeaders':
-        """Initialize a RowHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RowHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RowHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RowHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RowHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SectionTitle():
+
+class SectionTitle(Model):
     """
     The table's section title, if identified.
 
@@ -5603,6 +3512,13 @@ class SectionTitle():
           `end`.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -5618,50 +3534,8 @@ class SectionTitle():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SectionTitle':
-        """Initialize a SectionTitle object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SectionTitle object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SectionTitle object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SectionTitle') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SectionTitle') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SectionTitles():
+
+class SectionTitles(Model):
     """
     An array containing one object per section or subsection detected in the input
     document. Sections and subsections are not nested; instead, they are flattened out and
@@ -5679,6 +3553,15 @@ class SectionTitles():
           `location` objects that lists the locations of detected section titles.
     """
 
+    __slots__ = ('text', 'location', 'level', 'element_locations')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('level'),
+        ModelField('element_locations', 'list', 'ElementLocations'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -5704,64 +3587,8 @@ class SectionTitles():
         self.level = level
         self.element_locations = element_locations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SectionTitles':
-        """Initialize a SectionTitles object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'level' in _dict:
-            args['level'] = _dict.get('level')
-        if 'element_locations' in _dict:
-            args['element_locations'] = [
-                ElementLocations.from_dict(x)
-                for x in _dict.get('element_locations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SectionTitles object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'level') and self.level is not None:
-            _dict['level'] = self.level
-        if hasattr(self,
-                   'element_locations') and self.element_locations is not None:
-            _dict['element_locations'] = [
-                x.to_dict() for x in self.element_locations
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SectionTitles object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SectionTitles') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SectionTitles') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ShortDoc():
+
+class ShortDoc(Model):
     """
     Brief information about the input document.
 
@@ -5769,6 +3596,13 @@ class ShortDoc():
     :attr str hash: (optional) The MD5 hash of the input document.
     """
 
+    __slots__ = ('title', 'hash')
+
+    _fields = (
+        ModelField('title'),
+        ModelField('hash'),
+    )
+
     def __init__(self, *, title: str = None, hash: str = None) -> None:
         """
         Initialize a ShortDoc object.
@@ -5780,50 +3614,8 @@ class ShortDoc():
         self.title = title
         self.hash = hash
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ShortDoc':
-        """Initialize a ShortDoc object from a json dictionary."""
-        args = {}
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'hash' in _dict:
-            args['hash'] = _dict.get('hash')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ShortDoc object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'hash') and self.hash is not None:
-            _dict['hash'] = self.hash
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ShortDoc object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ShortDoc') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ShortDoc') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableHeaders():
+
+class TableHeaders(Model):
     """
     The contents of the current table's header.
 
@@ -5843,6 +3635,19 @@ class TableHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'row_index_begin',
+                 'row_index_end', 'column_index_begin', 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location'),
+        ModelField('text'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -5879,74 +3684,8 @@ class TableHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableHeaders':
-        """Initialize a TableHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableReturn():
+
+class TableReturn(Model):
     """
     The analysis of the document's tables.
 
@@ -5958,6 +3697,15 @@ class TableReturn():
           the input document.
     """
 
+    __slots__ = ('document', 'model_id', 'model_version', 'tables')
+
+    _fields = (
+        ModelField('document', 'model', 'DocInfo'),
+        ModelField('model_id'),
+        ModelField('model_version'),
+        ModelField('tables', 'list', 'Tables'),
+    )
+
     def __init__(self,
                  *,
                  document: 'DocInfo' = None,
@@ -5980,58 +3728,8 @@ class TableReturn():
         self.model_version = model_version
         self.tables = tables
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableReturn':
-        """Initialize a TableReturn object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = DocInfo.from_dict(_dict.get('document'))
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'tables' in _dict:
-            args['tables'] = [Tables.from_dict(x) for x in _dict.get('tables')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableReturn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'tables') and self.tables is not None:
-            _dict['tables'] = [x.to_dict() for x in self.tables]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableReturn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableReturn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableReturn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableTitle():
+
+class TableTitle(Model):
     """
     If identified, the title or caption of the current table of the form `Table x.: ...`.
     Empty when no title is identified. When exposed, the `title` is also excluded from the
@@ -6043,6 +3741,13 @@ class TableTitle():
     :attr str text: (optional) The text of the identified table title or caption.
     """
 
+    __slots__ = ('location', 'text')
+
+    _fields = (
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  location: 'Location' = None,
@@ -6059,50 +3764,8 @@ class TableTitle():
         self.location = location
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableTitle':
-        """Initialize a TableTitle object from a json dictionary."""
-        args = {}
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableTitle object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableTitle object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableTitle') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableTitle') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Tables():
+
+class Tables(Model):
     """
     The contents of the tables extracted from a document.
 
@@ -6135,6 +3798,23 @@ class Tables():
           identified in the current table.
     """
 
+    __slots__ = ('location', 'text', 'section_title', 'title', 'table_headers',
+                 'row_headers', 'column_headers', 'body_cells', 'contexts',
+                 'key_value_pairs')
+
+    _fields = (
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('section_title', 'model', 'SectionTitle'),
+        ModelField('title', 'model', 'TableTitle'),
+        ModelField('table_headers', 'list', 'TableHeaders'),
+        ModelField('row_headers', 'list', 'RowHeaders'),
+        ModelField('column_headers', 'list', 'ColumnHeaders'),
+        ModelField('body_cells', 'list', 'BodyCells'),
+        ModelField('contexts', 'list', 'Contexts'),
+        ModelField('key_value_pairs', 'list', 'KeyValuePair'),
+    )
+
     def __init__(self,
                  *,
                  location: 'Location' = None,
@@ -6189,98 +3869,8 @@ class Tables():
         self.contexts = contexts
         self.key_value_pairs = key_value_pairs
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Tables':
-        """Initialize a Tables object from a json dictionary."""
-        args = {}
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'section_title' in _dict:
-            args['section_title'] = SectionTitle.from_dict(
-                _dict.get('section_title'))
-        if 'title' in _dict:
-            args['title'] = TableTitle.from_dict(_dict.get('title'))
-        if 'table_headers' in _dict:
-            args['table_headers'] = [
-                TableHeaders.from_dict(x) for x in _dict.get('table_headers')
-            ]
-        if 'row_headers' in _dict:
-            args['row_headers'] = [
-                RowHeaders.from_dict(x) for x in _dict.get('row_headers')
-            ]
-        if 'column_headers' in _dict:
-            args['column_headers'] = [
-                ColumnHeaders.from_dict(x) for x in _dict.get('column_headers')
-            ]
-        if 'body_cells' in _dict:
-            args['body_cells'] = [
-                BodyCells.from_dict(x) for x in _dict.get('body_cells')
-            ]
-        if 'contexts' in _dict:
-            args['contexts'] = [
-                Contexts.from_dict(x) for x in _dict.get('contexts')
-            ]
-        if 'key_value_pairs' in _dict:
-            args['key_value_pairs'] = [
-                KeyValuePair.from_dict(x) for x in _dict.get('key_value_pairs')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Tables object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'section_title') and self.section_title is not None:
-            _dict['section_title'] = self.section_title.to_dict()
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title.to_dict()
-        if hasattr(self, 'table_headers') and self.table_headers is not None:
-            _dict['table_headers'] = [x.to_dict() for x in self.table_headers]
-        if hasattr(self, 'row_headers') and self.row_headers is not None:
-            _dict['row_headers'] = [x.to_dict() for x in self.row_headers]
-        if hasattr(self, 'column_headers') and self.column_headers is not None:
-            _dict['column_headers'] = [x.to_dict() for x in self.column_headers]
-        if hasattr(self, 'body_cells') and self.body_cells is not None:
-            _dict['body_cells'] = [x.to_dict() for x in self.body_cells]
-        if hasattr(self, 'contexts') and self.contexts is not None:
-            _dict['contexts'] = [x.to_dict() for x in self.contexts]
-        if hasattr(self,
-                   'key_value_pairs') and self.key_value_pairs is not None:
-            _dict['key_value_pairs'] = [
-                x.to_dict() for x in self.key_value_pairs
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Tables object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Tables') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Tables') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TerminationDates():
+
+class TerminationDates(Model):
     """
     Termination dates identified in the input document.
 
@@ -6297,6 +3887,17 @@ class TerminationDates():
           `end`.
     """
 
+    __slots__ = ('confidence_level', 'text', 'text_normalized',
+                 'provenance_ids', 'location')
+
+    _fields = (
+        ModelField('confidence_level'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('provenance_ids'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  confidence_level: str = None,
@@ -6325,62 +3926,6 @@ class TerminationDates():
         self.provenance_ids = provenance_ids
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TerminationDates':
-        """Initialize a TerminationDates object from a json dictionary."""
-        args = {}
-        if 'confidence_level' in _dict:
-            args['confidence_level'] = _dict.get('confidence_level')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TerminationDates object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'confidence_level') and self.confidence_level is not None:
-            _dict['confidence_level'] = self.confidence_level
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TerminationDates object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TerminationDates') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TerminationDates') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ConfidenceLevelEnum(str, Enum):
         """
         The confidence level in the identification of the termination date.
@@ -6390,7 +3935,7 @@ class TerminationDates():
         LOW = 'Low'
 
 
-class TypeLabel():
+class TypeLabel(Model):
     """
     Identification of a specific type.
 
@@ -6403,6 +3948,14 @@ class TypeLabel():
           entry in the updated labels response.
     """
 
+    __slots__ = ('label', 'provenance_ids', 'modification')
+
+    _fields = (
+        ModelField('label', 'model', 'Label'),
+        ModelField('provenance_ids'),
+        ModelField('modification'),
+    )
+
     def __init__(self,
                  *,
                  label: 'Label' = None,
@@ -6423,52 +3976,6 @@ class TypeLabel():
         self.provenance_ids = provenance_ids
         self.modification = modification
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TypeLabel':
-        """Initialize a TypeLabel object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = Label.from_dict(_dict.get('label'))
-        if 'provenance_ids' in _dict:
-            args['provenance_ids'] = _dict.get('provenance_ids')
-        if 'modification' in _dict:
-            args['modification'] = _dict.get('modification')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TypeLabel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label.to_dict()
-        if hasattr(self, 'provenance_ids') and self.provenance_ids is not None:
-            _dict['provenance_ids'] = self.provenance_ids
-        if hasattr(self, 'modification') and self.modification is not None:
-            _dict['modification'] = self.modification
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TypeLabel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TypeLabel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TypeLabel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ModificationEnum(str, Enum):
         """
         The type of modification of the feedback entry in the updated labels response.
@@ -6478,7 +3985,7 @@ class TypeLabel():
         REMOVED = 'removed'
 
 
-class TypeLabelComparison():
+class TypeLabelComparison(Model):
     """
     Identification of a specific type.
 
@@ -6487,6 +3994,12 @@ class TypeLabelComparison():
           and the `party` object identifies the affected party.
     """
 
+    __slots__ = ('label',)
+
+    _fields = (
+        ModelField('label', 'model', 'Label'),
+    )
+
     def __init__(self, *, label: 'Label' = None) -> None:
         """
         Initialize a TypeLabelComparison object.
@@ -6497,46 +4010,8 @@ class TypeLabelComparison():
         """
         self.label = label
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TypeLabelComparison':
-        """Initialize a TypeLabelComparison object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = Label.from_dict(_dict.get('label'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TypeLabelComparison object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TypeLabelComparison object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TypeLabelComparison') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TypeLabelComparison') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class UnalignedElement():
+class UnalignedElement(Model):
     """
     Element that does not align semantically between two compared documents.
 
@@ -6555,6 +4030,18 @@ class UnalignedElement():
     :attr List[Attribute] attributes: (optional) List of document attributes.
     """
 
+    __slots__ = ('document_label', 'location', 'text', 'types', 'categories',
+                 'attributes')
+
+    _fields = (
+        ModelField('document_label'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+        ModelField('types', 'list', 'TypeLabelComparison'),
+        ModelField('categories', 'list', 'CategoryComparison'),
+        ModelField('attributes', 'list', 'Attribute'),
+    )
+
     def __init__(self,
                  *,
                  document_label: str = None,
@@ -6587,72 +4074,8 @@ class UnalignedElement():
         self.categories = categories
         self.attributes = attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UnalignedElement':
-        """Initialize a UnalignedElement object from a json dictionary."""
-        args = {}
-        if 'document_label' in _dict:
-            args['document_label'] = _dict.get('document_label')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'types' in _dict:
-            args['types'] = [
-                TypeLabelComparison.from_dict(x) for x in _dict.get('types')
-            ]
-        if 'categories' in _dict:
-            args['categories'] = [
-                CategoryComparison.from_dict(x) for x in _dict.get('categories')
-            ]
-        if 'attributes' in _dict:
-            args['attributes'] = [
-                Attribute.from_dict(x) for x in _dict.get('attributes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UnalignedElement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_label') and self.document_label is not None:
-            _dict['document_label'] = self.document_label
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        if hasattr(self, 'attributes') and self.attributes is not None:
-            _dict['attributes'] = [x.to_dict() for x in self.attributes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UnalignedElement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UnalignedElement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UnalignedElement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class UpdatedLabelsIn():
+
+class UpdatedLabelsIn(Model):
     """
     The updated labeling from the input document, accounting for the submitted feedback.
 
@@ -6662,6 +4085,13 @@ class UpdatedLabelsIn():
           element falls; in other words, the subject matter of the element.
     """
 
+    __slots__ = ('types', 'categories')
+
+    _fields = (
+        ModelField('types', 'list', 'TypeLabel', required=True),
+        ModelField('categories', 'list', 'Category', required=True),
+    )
+
     def __init__(self, types: List['TypeLabel'],
                  categories: List['Category']) -> None:
         """
@@ -6675,60 +4105,8 @@ class UpdatedLabelsIn():
         self.types = types
         self.categories = categories
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UpdatedLabelsIn':
-        """Initialize a UpdatedLabelsIn object from a json dictionary."""
-        args = {}
-        if 'types' in _dict:
-            args['types'] = [TypeLabel.from_dict(x) for x in _dict.get('types')]
-        else:
-            raise ValueError(
-                'Required property \'types\' not present in UpdatedLabelsIn JSON'
-            )
-        if 'categories' in _dict:
-            args['categories'] = [
-                Category.from_dict(x) for x in _dict.get('categories')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'categories\' not present in UpdatedLabelsIn JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UpdatedLabelsIn object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UpdatedLabelsIn object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UpdatedLabelsIn') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UpdatedLabelsIn') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class UpdatedLabelsOut():
+
+class UpdatedLabelsOut(Model):
     """
     The updated labeling from the input document, accounting for the submitted feedback.
 
@@ -6738,6 +4116,13 @@ class UpdatedLabelsOut():
           which the element falls; in other words, the subject matter of the element.
     """
 
+    __slots__ = ('types', 'categories')
+
+    _fields = (
+        ModelField('types', 'list', 'TypeLabel'),
+        ModelField('categories', 'list', 'Category'),
+    )
+
     def __init__(self,
                  *,
                  types: List['TypeLabel'] = None,
@@ -6754,52 +4139,8 @@ class UpdatedLabelsOut():
         self.types = types
         self.categories = categories
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UpdatedLabelsOut':
-        """Initialize a UpdatedLabelsOut object from a json dictionary."""
-        args = {}
-        if 'types' in _dict:
-            args['types'] = [TypeLabel.from_dict(x) for x in _dict.get('types')]
-        if 'categories' in _dict:
-            args['categories'] = [
-                Category.from_dict(x) for x in _dict.get('categories')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UpdatedLabelsOut object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'types') and self.types is not None:
-            _dict['types'] = [x.to_dict() for x in self.types]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UpdatedLabelsOut object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UpdatedLabelsOut') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UpdatedLabelsOut') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Value():
+
+class Value(Model):
     """
     A value in a key-value pair.
 
@@ -6811,6 +4152,14 @@ class Value():
           markup.
     """
 
+    __slots__ = ('cell_id', 'location', 'text')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'Location'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -6829,49 +4178,3 @@ class Value():
         self.cell_id = cell_id
         self.location = location
         self.text = text
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Value':
-        """Initialize a Value object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Value object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Value object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Value') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Value') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Gzip compression of request bodies.
+
+After `set_request_compression()`, a service sends the JSON and text request
+bodies of at least `min_size` bytes, such as the workspace of
+`create_workspace` or the content of `profile`, with `Content-Encoding: gzip`.
+A `GzipBody` compresses the body in chunks while it is sent, so no compressed
+copy of the whole body is held in memory.
+
+`BaseService.set_enable_gzip_compression()` compresses every request body,
+whatever its size and type, when the request is built.
+"""
+
+import re
+import zlib
+from typing import Iterator, Mapping, Optional
+
+from .multipart import get_size
+
+# Bodies smaller than this gain little from compression.
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_LEVEL = 6
+CHUNK_SIZE = 64 * 1024
+
+# The media types worth compressing: text, JSON and XML.
+_COMPRESSIBLE = re.compile(
+    r'^\s*(text/[^;\s]+|application/(\S+\+)?(json|xml))\s*(;|$)',
+    re.IGNORECASE)
+
+
+class GzipBody():
+    """
+    A request body, compressed with gzip while it is sent.
+
+    A body is iterated once, by `requests` or `httpx`, which send it with
+    chunked transfer encoding.
+
+    :param data: The body: `bytes`, `str`, a binary or text file, or an
+           iterable of `bytes`.
+    :param int level: (optional) The compression level, from 1 (fastest) to 9
+           (smallest).
+    :param int chunk_size: (optional) The number of bytes compressed at a
+           time.
+
+    :attr int bytes_in: The number of bytes compressed so far.
+    :attr int bytes_out: The number of compressed bytes produced so far.
+    """
+
+    def __init__(self,
+                 data,
+                 *,
+                 level: int = DEFAULT_LEVEL,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        self.data = data
+        self.level = level
+        self.chunk_size = chunk_size
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        # wbits=31 writes the gzip header and trailer.
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        for chunk in self._iter_data():
+            self.bytes_in += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                self.bytes_out += len(compressed)
+                yield compressed
+        compressed = compressor.flush()
+        self.bytes_out += len(compressed)
+        yield compressed
+
+    def _iter_data(self) -> Iterator[bytes]:
+        data = self.data
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if isinstance(data, bytes):
+            # Slices of a memoryview do not copy the body.
+            view = memoryview(data)
+            for start in range(0, len(view), self.chunk_size):
+                yield view[start:start + self.chunk_size]
+        elif hasattr(data, 'read'):
+            while True:
+                chunk = data.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+        else:
+            for chunk in data:
+                yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    def __repr__(self) -> str:
+        return '<GzipBody bytes_in={0} bytes_out={1}>'.format(
+            self.bytes_in, self.bytes_out)
+
+
+def should_compress(data, headers: Mapping[str, str],
+                    min_size: Optional[int]) -> bool:
+    """
+    Return whether a request body is compressed.
+
+    :param data: The request body.
+    :param Mapping headers: The request headers.
+    :param int min_size: The size from which bodies are compressed, or `None`
+           if compression is disabled.
+    """
+    if min_size is None or data is None or isinstance(data, dict):
+        return False
+    content_type = None
+    for name, value in headers.items():
+        name = name.lower()
+        if name == 'content-encoding':
+            return False
+        if name == 'content-type':
+            content_type = value
+    if not _COMPRESSIBLE.match(content_type or ''):
+        return False
+    if isinstance(data, (bytes, str)):
+        return len(data) >= min_size
+    # Streams of unknown size are compressed.
+    size = get_size(data)
+    return size is None or size >= min_size
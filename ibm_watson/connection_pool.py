@@ -0,0 +1,224 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+HTTP connection pool settings of the Watson services.
+
+A `ConnectionPoolConfig` passed to a service constructor sizes the pools of
+kept-alive connections of that service. Services created with an equal
+config that has `shared=True` use the same pools, so a worker that talks to
+several services in one region opens one set of TCP and TLS connections:
+
+    from ibm_watson import AssistantV2, DiscoveryV2, ConnectionPoolConfig
+
+    pool = ConnectionPoolConfig(pool_maxsize=32, idle_timeout=50, shared=True)
+    assistant = AssistantV2(version, authenticator=authenticator,
+                            connection_pool=pool)
+    discovery = DiscoveryV2(version, authenticator=authenticator,
+                            connection_pool=pool)
+"""
+
+import socket
+import threading
+import time
+
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionPoolConfig():
+    """
+    Connection pool settings of a service.
+
+    :attr int pool_connections: The number of hosts whose connection pools
+          are kept.
+    :attr int pool_maxsize: The maximum number of connections kept open to
+          each host.
+    :attr bool pool_block: Whether a request waits for a free connection when
+          `pool_maxsize` connections to its host are in use, instead of
+          opening a connection that is discarded afterwards.
+    :attr float idle_timeout: Connections that have been idle for longer than
+          this many seconds are closed and reopened rather than reused. Set it
+          below the keep-alive timeout of the server to avoid sending requests
+          on connections the server is closing. `None` keeps idle connections
+          indefinitely.
+    :attr bool tcp_keepalive: Whether TCP keep-alive probes are enabled on the
+          connections.
+    :attr bool shared: Whether the pools are shared with the other services
+          created with an equal config.
+    """
+
+    __slots__ = ('pool_connections', 'pool_maxsize', 'pool_block',
+                 'idle_timeout', 'tcp_keepalive', 'shared')
+
+    def __init__(self,
+                 *,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 idle_timeout: float = None,
+                 tcp_keepalive: bool = False,
+                 shared: bool = False) -> None:
+        """
+        Initialize a ConnectionPoolConfig object.
+
+        :param int pool_connections: (optional) The number of hosts whose
+               connection pools are kept.
+        :param int pool_maxsize: (optional) The maximum number of connections
+               kept open to each host.
+        :param bool pool_block: (optional) Whether a request waits for a free
+               connection when all connections to its host are in use.
+        :param float idle_timeout: (optional) The number of seconds after
+               which an idle connection is closed instead of reused.
+        :param bool tcp_keepalive: (optional) Whether TCP keep-alive probes are
+               enabled.
+        :param bool shared: (optional) Whether the pools are shared with the
+               other services created with an equal config.
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError(
+                'pool_connections and pool_maxsize must be at least 1')
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError('idle_timeout must be positive')
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.idle_timeout = idle_timeout
+        self.tcp_keepalive = tcp_keepalive
+        self.shared = shared
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: 'ConnectionPoolConfig') -> bool:
+        if not isinstance(other, ConnectionPoolConfig):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return 'ConnectionPoolConfig({0})'.format(', '.join(
+            '{0}={1!r}'.format(name, getattr(self, name))
+            for name in self.__slots__))
+
+
+class _IdleEvictionMixin():
+    """Closes connections that were idle too long when they are taken."""
+
+    idle_timeout = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        idle_since = getattr(conn, '_idle_since', None)
+        if (idle_since is not None and
+                time.monotonic() - idle_since > self.idle_timeout):
+            # A closed connection reconnects on its next request.
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._idle_since = time.monotonic()
+        super()._put_conn(conn)
+
+
+class _IdleEvictionHTTPConnectionPool(_IdleEvictionMixin, HTTPConnectionPool):
+    pass
+
+
+class _IdleEvictionHTTPSConnectionPool(_IdleEvictionMixin,
+                                       HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(SSLHTTPAdapter):
+    """
+    Transport adapter that applies a `ConnectionPoolConfig`.
+
+    When the config is shared, the adapter uses the pool manager of the shared
+    pool registry, and only its retry settings are its own.
+    """
+
+    def __init__(self, config: ConnectionPoolConfig, **kwargs) -> None:
+        self.pool_config = config
+        super().__init__(pool_connections=config.pool_connections,
+                         pool_maxsize=config.pool_maxsize,
+                         pool_block=config.pool_block,
+                         **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        if self.pool_config.tcp_keepalive:
+            pool_kwargs['socket_options'] = (
+                HTTPConnection.default_socket_options +
+                [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        if not self.pool_config.shared:
+            super().init_poolmanager(connections, maxsize, block,
+                                     **pool_kwargs)
+            self._set_pool_classes()
+            return
+        key = (self.pool_config, bool(self._disable_ssl_verification))
+        with _shared_pools_lock:
+            poolmanager = _shared_pools.get(key)
+            if poolmanager is None:
+                super().init_poolmanager(connections, maxsize, block,
+                                         **pool_kwargs)
+                self._set_pool_classes()
+                _shared_pools[key] = self.poolmanager
+            else:
+                self._pool_connections = connections
+                self._pool_maxsize = maxsize
+                self._pool_block = block
+                self.poolmanager = poolmanager
+
+    def _set_pool_classes(self) -> None:
+        if self.pool_config.idle_timeout is None:
+            return
+        idle_timeout = self.pool_config.idle_timeout
+        self.poolmanager.pool_classes_by_scheme = {
+            'http':
+                type('HTTPConnectionPool', (_IdleEvictionHTTPConnectionPool,),
+                     {'idle_timeout': idle_timeout}),
+            'https':
+                type('HTTPSConnectionPool',
+                     (_IdleEvictionHTTPSConnectionPool,),
+                     {'idle_timeout': idle_timeout}),
+        }
+
+    def close(self) -> None:
+        # The pools of a shared adapter belong to the registry.
+        if not self.pool_config.shared:
+            super().close()
+
+
+# (ConnectionPoolConfig, disable SSL verification) -> urllib3 PoolManager
+_shared_pools = {}
+_shared_pools_lock = threading.Lock()
+
+
+def close_shared_pools() -> None:
+    """
+    Close the connections of all shared pools.
+
+    Services that use a shared pool keep working and open new connections on
+    their next request.
+    """
+    with _shared_pools_lock:
+        poolmanagers = list(_shared_pools.values())
+    for poolmanager in poolmanagers:
+        poolmanager.clear()
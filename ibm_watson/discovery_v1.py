@@ -31,22 +31,23 @@ from datetime import datetime
 from enum import Enum
 from os.path import basename
 from typing import BinaryIO, Dict, List
-import json
-import sys
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_list, convert_model, date_to_string, datetime_to_string, string_to_date, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_list, convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelDiscriminator, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class DiscoveryV1(BaseService):
+class DiscoveryV1(WatsonService):
     """The Discovery V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.discovery.watson.cloud.ibm.com'
@@ -57,6 +58,7 @@ class DiscoveryV1(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Discovery service.
@@ -67,17 +69,23 @@ class DiscoveryV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(DiscoveryV1))
 
     #########################
     # Environments
@@ -119,7 +127,7 @@ class DiscoveryV1(BaseService):
 
         data = {'name': name, 'description': description, 'size': size}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -133,7 +141,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Environment, **kwargs)
         return response
 
     def list_environments(self,
@@ -169,7 +177,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListEnvironmentsResponse,
+                             **kwargs)
         return response
 
     def get_environment(self, environment_id: str,
@@ -206,7 +216,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Environment, **kwargs)
         return response
 
     def update_environment(self,
@@ -245,7 +255,7 @@ class DiscoveryV1(BaseService):
 
         data = {'name': name, 'description': description, 'size': size}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -262,7 +272,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Environment, **kwargs)
         return response
 
     def delete_environment(self, environment_id: str,
@@ -299,7 +309,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DeleteEnvironmentResponse,
+                             **kwargs)
         return response
 
     def list_fields(self, environment_id: str, collection_ids: List[str],
@@ -347,7 +359,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListCollectionFieldsResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -426,7 +440,7 @@ class DiscoveryV1(BaseService):
             'source': source
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -444,7 +458,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Configuration, **kwargs)
         return response
 
     def list_configurations(self,
@@ -488,7 +502,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListConfigurationsResponse,
+                             **kwargs)
         return response
 
     def get_configuration(self, environment_id: str, configuration_id: str,
@@ -530,7 +546,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Configuration, **kwargs)
         return response
 
     def update_configuration(
@@ -608,7 +624,7 @@ class DiscoveryV1(BaseService):
             'source': source
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -627,7 +643,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Configuration, **kwargs)
         return response
 
     def delete_configuration(self, environment_id: str, configuration_id: str,
@@ -676,7 +692,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DeleteConfigurationResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -725,7 +743,7 @@ class DiscoveryV1(BaseService):
             'language': language
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -743,7 +761,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def list_collections(self,
@@ -787,7 +805,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListCollectionsResponse,
+                             **kwargs)
         return response
 
     def get_collection(self, environment_id: str, collection_id: str,
@@ -828,7 +848,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def update_collection(self,
@@ -873,7 +893,7 @@ class DiscoveryV1(BaseService):
             'configuration_id': configuration_id
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -891,7 +911,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def delete_collection(self, environment_id: str, collection_id: str,
@@ -932,7 +952,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DeleteCollectionResponse,
+                             **kwargs)
         return response
 
     def list_collection_fields(self, environment_id: str, collection_id: str,
@@ -975,7 +997,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListCollectionFieldsResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -1023,7 +1047,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Expansions, **kwargs)
         return response
 
     def create_expansions(self, environment_id: str, collection_id: str,
@@ -1073,7 +1097,7 @@ class DiscoveryV1(BaseService):
 
         data = {'expansions': expansions}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1091,7 +1115,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Expansions, **kwargs)
         return response
 
     def delete_expansions(self, environment_id: str, collection_id: str,
@@ -1180,7 +1204,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TokenDictStatusResponse,
+                             **kwargs)
         return response
 
     def create_tokenization_dictionary(
@@ -1223,7 +1249,7 @@ class DiscoveryV1(BaseService):
 
         data = {'tokenization_rules': tokenization_rules}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1241,7 +1267,9 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TokenDictStatusResponse,
+                             **kwargs)
         return response
 
     def delete_tokenization_dictionary(self, environment_id: str,
@@ -1328,7 +1356,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TokenDictStatusResponse,
+                             **kwargs)
         return response
 
     def create_stopword_list(self,
@@ -1389,7 +1419,9 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TokenDictStatusResponse,
+                             **kwargs)
         return response
 
     def delete_stopword_list(self, environment_id: str, collection_id: str,
@@ -1528,7 +1560,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentAccepted, **kwargs)
         return response
 
     def get_document_status(self, environment_id: str, collection_id: str,
@@ -1578,7 +1610,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentStatus, **kwargs)
         return response
 
     def update_document(self,
@@ -1659,7 +1691,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentAccepted, **kwargs)
         return response
 
     def delete_document(self, environment_id: str, collection_id: str,
@@ -1708,7 +1740,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DeleteDocumentResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -1864,7 +1898,7 @@ class DiscoveryV1(BaseService):
             'spelling_suggestions': spelling_suggestions
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1882,7 +1916,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=QueryResponse, **kwargs)
         return response
 
     def query_notices(self,
@@ -2022,7 +2056,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=QueryNoticesResponse,
+                             **kwargs)
         return response
 
     def federated_query(self,
@@ -2168,7 +2204,7 @@ class DiscoveryV1(BaseService):
             'bias': bias
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2186,7 +2222,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=QueryResponse, **kwargs)
         return response
 
     def federated_query_notices(self,
@@ -2310,7 +2346,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=QueryNoticesResponse,
+                             **kwargs)
         return response
 
     def get_autocompletion(self,
@@ -2374,7 +2412,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Completions, **kwargs)
         return response
 
     #########################
@@ -2421,7 +2459,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingDataSet, **kwargs)
         return response
 
     def add_training_data(self,
@@ -2471,7 +2509,7 @@ class DiscoveryV1(BaseService):
             'examples': examples
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2489,7 +2527,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuery, **kwargs)
         return response
 
     def delete_all_training_data(self, environment_id: str, collection_id: str,
@@ -2579,7 +2617,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuery, **kwargs)
         return response
 
     def delete_training_data(self, environment_id: str, collection_id: str,
@@ -2673,7 +2711,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TrainingExampleList,
+                             **kwargs)
         return response
 
     def create_training_example(self,
@@ -2723,7 +2763,7 @@ class DiscoveryV1(BaseService):
             'relevance': relevance
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2742,7 +2782,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingExample, **kwargs)
         return response
 
     def delete_training_example(self, environment_id: str, collection_id: str,
@@ -2840,7 +2880,7 @@ class DiscoveryV1(BaseService):
 
         data = {'cross_reference': cross_reference, 'relevance': relevance}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2861,7 +2901,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingExample, **kwargs)
         return response
 
     def get_training_example(self, environment_id: str, collection_id: str,
@@ -2914,7 +2954,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingExample, **kwargs)
         return response
 
     #########################
@@ -2996,7 +3036,7 @@ class DiscoveryV1(BaseService):
 
         data = {'type': type, 'data': data}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3010,7 +3050,9 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=CreateEventResponse,
+                             **kwargs)
         return response
 
     def query_log(self,
@@ -3074,7 +3116,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LogQueryResponse, **kwargs)
         return response
 
     def get_metrics_query(self,
@@ -3123,7 +3165,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MetricResponse, **kwargs)
         return response
 
     def get_metrics_query_event(self,
@@ -3173,7 +3215,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MetricResponse, **kwargs)
         return response
 
     def get_metrics_query_no_results(self,
@@ -3223,7 +3265,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MetricResponse, **kwargs)
         return response
 
     def get_metrics_event_rate(self,
@@ -3273,7 +3315,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=MetricResponse, **kwargs)
         return response
 
     def get_metrics_query_token_event(self,
@@ -3314,7 +3356,9 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=MetricTokenResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -3360,7 +3404,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CredentialsList, **kwargs)
         return response
 
     def create_credentials(self,
@@ -3420,7 +3464,7 @@ class DiscoveryV1(BaseService):
             'status': status
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3438,7 +3482,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Credentials, **kwargs)
         return response
 
     def get_credentials(self, environment_id: str, credential_id: str,
@@ -3484,7 +3528,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Credentials, **kwargs)
         return response
 
     def update_credentials(self,
@@ -3548,7 +3592,7 @@ class DiscoveryV1(BaseService):
             'status': status
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3566,7 +3610,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Credentials, **kwargs)
         return response
 
     def delete_credentials(self, environment_id: str, credential_id: str,
@@ -3610,7 +3654,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteCredentials, **kwargs)
         return response
 
     #########################
@@ -3653,7 +3697,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=GatewayList, **kwargs)
         return response
 
     def create_gateway(self,
@@ -3685,7 +3729,7 @@ class DiscoveryV1(BaseService):
 
         data = {'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3703,7 +3747,7 @@ class DiscoveryV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Gateway, **kwargs)
         return response
 
     def get_gateway(self, environment_id: str, gateway_id: str,
@@ -3746,7 +3790,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Gateway, **kwargs)
         return response
 
     def delete_gateway(self, environment_id: str, gateway_id: str,
@@ -3789,7 +3833,7 @@ class DiscoveryV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=GatewayDelete, **kwargs)
         return response
 
 
@@ -3875,12 +3919,16 @@ class GetMetricsEventRateEnums:
         DOCUMENT = 'document'
 
 
+class AsyncDiscoveryV1(AsyncWatsonService, DiscoveryV1):
+    """The Discovery V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AggregationResult():
+class AggregationResult(Model):
     """
     Aggregation results for the specified query.
 
@@ -3890,6 +3938,14 @@ class AggregationResult():
           the case of chained aggregations.
     """
 
+    __slots__ = ('key', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('key'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  *,
                  key: str = None,
@@ -3907,57 +3963,8 @@ class AggregationResult():
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AggregationResult':
-        """Initialize a AggregationResult object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'AggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Collection():
+class Collection(Model):
     """
     A collection for storing documents.
 
@@ -3985,6 +3992,27 @@ class Collection():
           document understanding information for this collection.
     """
 
+    __slots__ = ('collection_id', 'name', 'description', 'created', 'updated',
+                 'status', 'configuration_id', 'language', 'document_counts',
+                 'disk_usage', 'training_status', 'crawl_status',
+                 'smart_document_understanding')
+
+    _fields = (
+        ModelField('collection_id'),
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('status'),
+        ModelField('configuration_id'),
+        ModelField('language'),
+        ModelField('document_counts', 'model', 'DocumentCounts'),
+        ModelField('disk_usage', 'model', 'CollectionDiskUsage'),
+        ModelField('training_status', 'model', 'TrainingStatus'),
+        ModelField('crawl_status', 'model', 'CollectionCrawlStatus'),
+        ModelField('smart_document_understanding', 'model', 'SduStatus'),
+    )
+
     def __init__(self,
                  *,
                  collection_id: str = None,
@@ -4034,104 +4062,6 @@ class Collection():
         self.crawl_status = crawl_status
         self.smart_document_understanding = smart_document_understanding
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Collection':
-        """Initialize a Collection object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'configuration_id' in _dict:
-            args['configuration_id'] = _dict.get('configuration_id')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'document_counts' in _dict:
-            args['document_counts'] = DocumentCounts.from_dict(
-                _dict.get('document_counts'))
-        if 'disk_usage' in _dict:
-            args['disk_usage'] = CollectionDiskUsage.from_dict(
-                _dict.get('disk_usage'))
-        if 'training_status' in _dict:
-            args['training_status'] = TrainingStatus.from_dict(
-                _dict.get('training_status'))
-        if 'crawl_status' in _dict:
-            args['crawl_status'] = CollectionCrawlStatus.from_dict(
-                _dict.get('crawl_status'))
-        if 'smart_document_understanding' in _dict:
-            args['smart_document_understanding'] = SduStatus.from_dict(
-                _dict.get('smart_document_understanding'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Collection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'status') and getattr(self, 'status') is not None:
-            _dict['status'] = getattr(self, 'status')
-        if hasattr(self,
-                   'configuration_id') and self.configuration_id is not None:
-            _dict['configuration_id'] = self.configuration_id
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self,
-                   'document_counts') and self.document_counts is not None:
-            _dict['document_counts'] = self.document_counts.to_dict()
-        if hasattr(self, 'disk_usage') and self.disk_usage is not None:
-            _dict['disk_usage'] = self.disk_usage.to_dict()
-        if hasattr(self,
-                   'training_status') and self.training_status is not None:
-            _dict['training_status'] = self.training_status.to_dict()
-        if hasattr(self, 'crawl_status') and self.crawl_status is not None:
-            _dict['crawl_status'] = self.crawl_status.to_dict()
-        if hasattr(self, 'smart_document_understanding'
-                  ) and self.smart_document_understanding is not None:
-            _dict[
-                'smart_document_understanding'] = self.smart_document_understanding.to_dict(
-                )
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Collection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the collection.
@@ -4141,7 +4071,7 @@ class Collection():
         MAINTENANCE = 'maintenance'
 
 
-class CollectionCrawlStatus():
+class CollectionCrawlStatus(Model):
     """
     Object containing information about the crawl status of this collection.
 
@@ -4149,6 +4079,12 @@ class CollectionCrawlStatus():
           status information.
     """
 
+    __slots__ = ('source_crawl',)
+
+    _fields = (
+        ModelField('source_crawl', 'model', 'SourceStatus'),
+    )
+
     def __init__(self, *, source_crawl: 'SourceStatus' = None) -> None:
         """
         Initialize a CollectionCrawlStatus object.
@@ -4158,53 +4094,20 @@ class CollectionCrawlStatus():
         """
         self.source_crawl = source_crawl
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionCrawlStatus':
-        """Initialize a CollectionCrawlStatus object from a json dictionary."""
-        args = {}
-        if 'source_crawl' in _dict:
-            args['source_crawl'] = SourceStatus.from_dict(
-                _dict.get('source_crawl'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionCrawlStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'source_crawl') and self.source_crawl is not None:
-            _dict['source_crawl'] = self.source_crawl.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionCrawlStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionCrawlStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionCrawlStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionDiskUsage():
+class CollectionDiskUsage(Model):
     """
     Summary of the disk usage statistics for this collection.
 
     :attr int used_bytes: (optional) Number of bytes used by the collection.
     """
 
+    __slots__ = ('used_bytes',)
+
+    _fields = (
+        ModelField('used_bytes'),
+    )
+
     def __init__(self, *, used_bytes: int = None) -> None:
         """
         Initialize a CollectionDiskUsage object.
@@ -4212,47 +4115,8 @@ class CollectionDiskUsage():
         """
         self.used_bytes = used_bytes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionDiskUsage':
-        """Initialize a CollectionDiskUsage object from a json dictionary."""
-        args = {}
-        if 'used_bytes' in _dict:
-            args['used_bytes'] = _dict.get('used_bytes')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionDiskUsage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'used_bytes') and getattr(self,
-                                                   'used_bytes') is not None:
-            _dict['used_bytes'] = getattr(self, 'used_bytes')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionDiskUsage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionDiskUsage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionDiskUsage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class CollectionUsage():
+class CollectionUsage(Model):
     """
     Summary of the collection usage in the environment.
 
@@ -4261,6 +4125,13 @@ class CollectionUsage():
           environment.
     """
 
+    __slots__ = ('available', 'maximum_allowed')
+
+    _fields = (
+        ModelField('available'),
+        ModelField('maximum_allowed'),
+    )
+
     def __init__(self,
                  *,
                  available: int = None,
@@ -4272,52 +4143,8 @@ class CollectionUsage():
         self.available = available
         self.maximum_allowed = maximum_allowed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionUsage':
-        """Initialize a CollectionUsage object from a json dictionary."""
-        args = {}
-        if 'available' in _dict:
-            args['available'] = _dict.get('available')
-        if 'maximum_allowed' in _dict:
-            args['maximum_allowed'] = _dict.get('maximum_allowed')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionUsage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'available') and getattr(self,
-                                                  'available') is not None:
-            _dict['available'] = getattr(self, 'available')
-        if hasattr(self, 'maximum_allowed') and getattr(
-                self, 'maximum_allowed') is not None:
-            _dict['maximum_allowed'] = getattr(self, 'maximum_allowed')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionUsage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionUsage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'CollectionUsage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Completions():
+class Completions(Model):
     """
     An object containing an array of autocompletion suggestions.
 
@@ -4325,6 +4152,12 @@ class Completions():
           the provided prefix.
     """
 
+    __slots__ = ('completions',)
+
+    _fields = (
+        ModelField('completions'),
+    )
+
     def __init__(self, *, completions: List[str] = None) -> None:
         """
         Initialize a Completions object.
@@ -4334,46 +4167,8 @@ class Completions():
         """
         self.completions = completions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Completions':
-        """Initialize a Completions object from a json dictionary."""
-        args = {}
-        if 'completions' in _dict:
-            args['completions'] = _dict.get('completions')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Completions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'completions') and self.completions is not None:
-            _dict['completions'] = self.completions
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Completions object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Completions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Completions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Configuration():
+class Configuration(Model):
     """
     A custom configuration for the environment.
 
@@ -4396,6 +4191,22 @@ class Configuration():
           configuration.
     """
 
+    __slots__ = ('configuration_id', 'name', 'created', 'updated',
+                 'description', 'conversions', 'enrichments', 'normalizations',
+                 'source')
+
+    _fields = (
+        ModelField('configuration_id'),
+        ModelField('name', required=True),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('description'),
+        ModelField('conversions', 'model', 'Conversions'),
+        ModelField('enrichments', 'list', 'Enrichment'),
+        ModelField('normalizations', 'list', 'NormalizationOperation'),
+        ModelField('source', 'model', 'Source'),
+    )
+
     def __init__(self,
                  name: str,
                  *,
@@ -4433,88 +4244,8 @@ class Configuration():
         self.normalizations = normalizations
         self.source = source
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Configuration':
-        """Initialize a Configuration object from a json dictionary."""
-        args = {}
-        if 'configuration_id' in _dict:
-            args['configuration_id'] = _dict.get('configuration_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Configuration JSON')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'conversions' in _dict:
-            args['conversions'] = Conversions.from_dict(
-                _dict.get('conversions'))
-        if 'enrichments' in _dict:
-            args['enrichments'] = [
-                Enrichment.from_dict(x) for x in _dict.get('enrichments')
-            ]
-        if 'normalizations' in _dict:
-            args['normalizations'] = [
-                NormalizationOperation.from_dict(x)
-                for x in _dict.get('normalizations')
-            ]
-        if 'source' in _dict:
-            args['source'] = Source.from_dict(_dict.get('source'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Configuration object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'configuration_id') and getattr(
-                self, 'configuration_id') is not None:
-            _dict['configuration_id'] = getattr(self, 'configuration_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'conversions') and self.conversions is not None:
-            _dict['conversions'] = self.conversions.to_dict()
-        if hasattr(self, 'enrichments') and self.enrichments is not None:
-            _dict['enrichments'] = [x.to_dict() for x in self.enrichments]
-        if hasattr(self, 'normalizations') and self.normalizations is not None:
-            _dict['normalizations'] = [x.to_dict() for x in self.normalizations]
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Configuration object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Configuration') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Configuration') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Conversions():
+class Conversions(Model):
     """
     Document conversion settings.
 
@@ -4534,6 +4265,18 @@ class Conversions():
           recognition.
     """
 
+    __slots__ = ('pdf', 'word', 'html', 'segment', 'json_normalizations',
+                 'image_text_recognition')
+
+    _fields = (
+        ModelField('pdf', 'model', 'PdfSettings'),
+        ModelField('word', 'model', 'WordSettings'),
+        ModelField('html', 'model', 'HtmlSettings'),
+        ModelField('segment', 'model', 'SegmentSettings'),
+        ModelField('json_normalizations', 'list', 'NormalizationOperation'),
+        ModelField('image_text_recognition'),
+    )
+
     def __init__(self,
                  *,
                  pdf: 'PdfSettings' = None,
@@ -4568,74 +4311,8 @@ class Conversions():
         self.json_normalizations = json_normalizations
         self.image_text_recognition = image_text_recognition
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Conversions':
-        """Initialize a Conversions object from a json dictionary."""
-        args = {}
-        if 'pdf' in _dict:
-            args['pdf'] = PdfSettings.from_dict(_dict.get('pdf'))
-        if 'word' in _dict:
-            args['word'] = WordSettings.from_dict(_dict.get('word'))
-        if 'html' in _dict:
-            args['html'] = HtmlSettings.from_dict(_dict.get('html'))
-        if 'segment' in _dict:
-            args['segment'] = SegmentSettings.from_dict(_dict.get('segment'))
-        if 'json_normalizations' in _dict:
-            args['json_normalizations'] = [
-                NormalizationOperation.from_dict(x)
-                for x in _dict.get('json_normalizations')
-            ]
-        if 'image_text_recognition' in _dict:
-            args['image_text_recognition'] = _dict.get('image_text_recognition')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Conversions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'pdf') and self.pdf is not None:
-            _dict['pdf'] = self.pdf.to_dict()
-        if hasattr(self, 'word') and self.word is not None:
-            _dict['word'] = self.word.to_dict()
-        if hasattr(self, 'html') and self.html is not None:
-            _dict['html'] = self.html.to_dict()
-        if hasattr(self, 'segment') and self.segment is not None:
-            _dict['segment'] = self.segment.to_dict()
-        if hasattr(
-                self,
-                'json_normalizations') and self.json_normalizations is not None:
-            _dict['json_normalizations'] = [
-                x.to_dict() for x in self.json_normalizations
-            ]
-        if hasattr(self, 'image_text_recognition'
-                  ) and self.image_text_recognition is not None:
-            _dict['image_text_recognition'] = self.image_text_recognition
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Conversions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Conversions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Conversions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class CreateEventResponse():
+class CreateEventResponse(Model):
     """
     An object defining the event being created.
 
@@ -4643,6 +4320,13 @@ class CreateEventResponse():
     :attr EventData data: (optional) Query event data object.
     """
 
+    __slots__ = ('type', 'data')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('data', 'model', 'EventData'),
+    )
+
     def __init__(self, *, type: str = None, data: 'EventData' = None) -> None:
         """
         Initialize a CreateEventResponse object.
@@ -4653,48 +4337,6 @@ class CreateEventResponse():
         self.type = type
         self.data = data
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CreateEventResponse':
-        """Initialize a CreateEventResponse object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'data' in _dict:
-            args['data'] = EventData.from_dict(_dict.get('data'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CreateEventResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'data') and self.data is not None:
-            _dict['data'] = self.data.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CreateEventResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CreateEventResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CreateEventResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The event type that was created.
@@ -4702,7 +4344,7 @@ class CreateEventResponse():
         CLICK = 'click'
 
 
-class CredentialDetails():
+class CredentialDetails(Model):
     """
     Object containing details of the stored credentials.
     Obtain credentials for your source from the administrator of the source.
@@ -4785,6 +4427,35 @@ class CredentialDetails():
           documentation](https://cloud.ibm.com/docs/cloud-object-storage?topic=cloud-object-storage-using-hmac-credentials#using-hmac-credentials).
     """
 
+    __slots__ = ('credential_type', 'client_id', 'enterprise_id', 'url',
+                 'username', 'organization_url', 'site_collection_path',
+                 'client_secret', 'public_key_id', 'private_key', 'passphrase',
+                 'password', 'gateway_id', 'source_version',
+                 'web_application_url', 'domain', 'endpoint', 'access_key_id',
+                 'secret_access_key')
+
+    _fields = (
+        ModelField('credential_type'),
+        ModelField('client_id'),
+        ModelField('enterprise_id'),
+        ModelField('url'),
+        ModelField('username'),
+        ModelField('organization_url'),
+        ModelField('site_collection_path', key='site_collection.path'),
+        ModelField('client_secret'),
+        ModelField('public_key_id'),
+        ModelField('private_key'),
+        ModelField('passphrase'),
+        ModelField('password'),
+        ModelField('gateway_id'),
+        ModelField('source_version'),
+        ModelField('web_application_url'),
+        ModelField('domain'),
+        ModelField('endpoint'),
+        ModelField('access_key_id'),
+        ModelField('secret_access_key'),
+    )
+
     def __init__(self,
                  *,
                  credential_type: str = None,
@@ -4912,122 +4583,6 @@ class CredentialDetails():
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CredentialDetails':
-        """Initialize a CredentialDetails object from a json dictionary."""
-        args = {}
-        if 'credential_type' in _dict:
-            args['credential_type'] = _dict.get('credential_type')
-        if 'client_id' in _dict:
-            args['client_id'] = _dict.get('client_id')
-        if 'enterprise_id' in _dict:
-            args['enterprise_id'] = _dict.get('enterprise_id')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        if 'username' in _dict:
-            args['username'] = _dict.get('username')
-        if 'organization_url' in _dict:
-            args['organization_url'] = _dict.get('organization_url')
-        if 'site_collection.path' in _dict:
-            args['site_collection_path'] = _dict.get('site_collection.path')
-        if 'client_secret' in _dict:
-            args['client_secret'] = _dict.get('client_secret')
-        if 'public_key_id' in _dict:
-            args['public_key_id'] = _dict.get('public_key_id')
-        if 'private_key' in _dict:
-            args['private_key'] = _dict.get('private_key')
-        if 'passphrase' in _dict:
-            args['passphrase'] = _dict.get('passphrase')
-        if 'password' in _dict:
-            args['password'] = _dict.get('password')
-        if 'gateway_id' in _dict:
-            args['gateway_id'] = _dict.get('gateway_id')
-        if 'source_version' in _dict:
-            args['source_version'] = _dict.get('source_version')
-        if 'web_application_url' in _dict:
-            args['web_application_url'] = _dict.get('web_application_url')
-        if 'domain' in _dict:
-            args['domain'] = _dict.get('domain')
-        if 'endpoint' in _dict:
-            args['endpoint'] = _dict.get('endpoint')
-        if 'access_key_id' in _dict:
-            args['access_key_id'] = _dict.get('access_key_id')
-        if 'secret_access_key' in _dict:
-            args['secret_access_key'] = _dict.get('secret_access_key')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CredentialDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'credential_type') and self.credential_type is not None:
-            _dict['credential_type'] = self.credential_type
-        if hasattr(self, 'client_id') and self.client_id is not None:
-            _dict['client_id'] = self.client_id
-        if hasattr(self, 'enterprise_id') and self.enterprise_id is not None:
-            _dict['enterprise_id'] = self.enterprise_id
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'username') and self.username is not None:
-            _dict['username'] = self.username
-        if hasattr(self,
-                   'organization_url') and self.organization_url is not None:
-            _dict['organization_url'] = self.organization_url
-        if hasattr(self, 'site_collection_path'
-                  ) and self.site_collection_path is not None:
-            _dict['site_collection.path'] = self.site_collection_path
-        if hasattr(self, 'client_secret') and self.client_secret is not None:
-            _dict['client_secret'] = self.client_secret
-        if hasattr(self, 'public_key_id') and self.public_key_id is not None:
-            _dict['public_key_id'] = self.public_key_id
-        if hasattr(self, 'private_key') and self.private_key is not None:
-            _dict['private_key'] = self.private_key
-        if hasattr(self, 'passphrase') and self.passphrase is not None:
-            _dict['passphrase'] = self.passphrase
-        if hasattr(self, 'password') and self.password is not None:
-            _dict['password'] = self.password
-        if hasattr(self, 'gateway_id') and self.gateway_id is not None:
-            _dict['gateway_id'] = self.gateway_id
-        if hasattr(self, 'source_version') and self.source_version is not None:
-            _dict['source_version'] = self.source_version
-        if hasattr(
-                self,
-                'web_application_url') and self.web_application_url is not None:
-            _dict['web_application_url'] = self.web_application_url
-        if hasattr(self, 'domain') and self.domain is not None:
-            _dict['domain'] = self.domain
-        if hasattr(self, 'endpoint') and self.endpoint is not None:
-            _dict['endpoint'] = self.endpoint
-        if hasattr(self, 'access_key_id') and self.access_key_id is not None:
-            _dict['access_key_id'] = self.access_key_id
-        if hasattr(self,
-                   'secret_access_key') and self.secret_access_key is not None:
-            _dict['secret_access_key'] = self.secret_access_key
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CredentialDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CredentialDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CredentialDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CredentialTypeEnum(str, Enum):
         """
         The authentication method for this credentials definition. The
@@ -5056,7 +4611,7 @@ class CredentialDetails():
         ONLINE = 'online'
 
 
-class Credentials():
+class Credentials(Model):
     """
     Object containing credential information.
 
@@ -5079,6 +4634,15 @@ class Credentials():
           status of the authentication process.
     """
 
+    __slots__ = ('credential_id', 'source_type', 'credential_details', 'status')
+
+    _fields = (
+        ModelField('credential_id'),
+        ModelField('source_type'),
+        ModelField('credential_details', 'model', 'CredentialDetails'),
+        ModelField('status', 'model', 'StatusDetails'),
+    )
+
     def __init__(self,
                  *,
                  credential_id: str = None,
@@ -5110,60 +4674,6 @@ class Credentials():
         self.credential_details = credential_details
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Credentials':
-        """Initialize a Credentials object from a json dictionary."""
-        args = {}
-        if 'credential_id' in _dict:
-            args['credential_id'] = _dict.get('credential_id')
-        if 'source_type' in _dict:
-            args['source_type'] = _dict.get('source_type')
-        if 'credential_details' in _dict:
-            args['credential_details'] = CredentialDetails.from_dict(
-                _dict.get('credential_details'))
-        if 'status' in _dict:
-            args['status'] = StatusDetails.from_dict(_dict.get('status'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Credentials object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'credential_id') and getattr(
-                self, 'credential_id') is not None:
-            _dict['credential_id'] = getattr(self, 'credential_id')
-        if hasattr(self, 'source_type') and self.source_type is not None:
-            _dict['source_type'] = self.source_type
-        if hasattr(
-                self,
-                'credential_details') and self.credential_details is not None:
-            _dict['credential_details'] = self.credential_details.to_dict()
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Credentials object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Credentials') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Credentials') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class SourceTypeEnum(str, Enum):
         """
         The source that this credentials object connects to.
@@ -5183,7 +4693,7 @@ class Credentials():
         CLOUD_OBJECT_STORAGE = 'cloud_object_storage'
 
 
-class CredentialsList():
+class CredentialsList(Model):
     """
     Object containing array of credential definitions.
 
@@ -5191,6 +4701,12 @@ class CredentialsList():
           definitions that were created for this instance.
     """
 
+    __slots__ = ('credentials',)
+
+    _fields = (
+        ModelField('credentials', 'list', 'Credentials'),
+    )
+
     def __init__(self, *, credentials: List['Credentials'] = None) -> None:
         """
         Initialize a CredentialsList object.
@@ -5200,48 +4716,8 @@ class CredentialsList():
         """
         self.credentials = credentials
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CredentialsList':
-        """Initialize a CredentialsList object from a json dictionary."""
-        args = {}
-        if 'credentials' in _dict:
-            args['credentials'] = [
-                Credentials.from_dict(x) for x in _dict.get('credentials')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CredentialsList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'credentials') and self.credentials is not None:
-            _dict['credentials'] = [x.to_dict() for x in self.credentials]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this CredentialsList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CredentialsList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CredentialsList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DeleteCollectionResponse():
+class DeleteCollectionResponse(Model):
     """
     Response object returned when deleting a colleciton.
 
@@ -5251,6 +4727,13 @@ class DeleteCollectionResponse():
           deletion operation is `deleted`.
     """
 
+    __slots__ = ('collection_id', 'status')
+
+    _fields = (
+        ModelField('collection_id', required=True),
+        ModelField('status', required=True),
+    )
+
     def __init__(self, collection_id: str, status: str) -> None:
         """
         Initialize a DeleteCollectionResponse object.
@@ -5263,56 +4746,6 @@ class DeleteCollectionResponse():
         self.collection_id = collection_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteCollectionResponse':
-        """Initialize a DeleteCollectionResponse object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in DeleteCollectionResponse JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DeleteCollectionResponse JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteCollectionResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteCollectionResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteCollectionResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteCollectionResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the collection. The status of a successful deletion operation is
@@ -5321,7 +4754,7 @@ class DeleteCollectionResponse():
         DELETED = 'deleted'
 
 
-class DeleteConfigurationResponse():
+class DeleteConfigurationResponse(Model):
     """
     Information returned when a configuration is deleted.
 
@@ -5331,6 +4764,14 @@ class DeleteConfigurationResponse():
     :attr List[Notice] notices: (optional) An array of notice messages, if any.
     """
 
+    __slots__ = ('configuration_id', 'status', 'notices')
+
+    _fields = (
+        ModelField('configuration_id', required=True),
+        ModelField('status', required=True),
+        ModelField('notices', 'list', 'Notice'),
+    )
+
     def __init__(self,
                  configuration_id: str,
                  status: str,
@@ -5349,63 +4790,6 @@ class DeleteConfigurationResponse():
         self.status = status
         self.notices = notices
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteConfigurationResponse':
-        """Initialize a DeleteConfigurationResponse object from a json dictionary."""
-        args = {}
-        if 'configuration_id' in _dict:
-            args['configuration_id'] = _dict.get('configuration_id')
-        else:
-            raise ValueError(
-                'Required property \'configuration_id\' not present in DeleteConfigurationResponse JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DeleteConfigurationResponse JSON'
-            )
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteConfigurationResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'configuration_id') and self.configuration_id is not None:
-            _dict['configuration_id'] = self.configuration_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteConfigurationResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteConfigurationResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteConfigurationResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the configuration. A deleted configuration has the status deleted.
@@ -5413,7 +4797,7 @@ class DeleteConfigurationResponse():
         DELETED = 'deleted'
 
 
-class DeleteCredentials():
+class DeleteCredentials(Model):
     """
     Object returned after credentials are deleted.
 
@@ -5422,6 +4806,13 @@ class DeleteCredentials():
     :attr str status: (optional) The status of the deletion request.
     """
 
+    __slots__ = ('credential_id', 'status')
+
+    _fields = (
+        ModelField('credential_id'),
+        ModelField('status'),
+    )
+
     def __init__(self,
                  *,
                  credential_id: str = None,
@@ -5436,48 +4827,6 @@ class DeleteCredentials():
         self.credential_id = credential_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteCredentials':
-        """Initialize a DeleteCredentials object from a json dictionary."""
-        args = {}
-        if 'credential_id' in _dict:
-            args['credential_id'] = _dict.get('credential_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteCredentials object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'credential_id') and self.credential_id is not None:
-            _dict['credential_id'] = self.credential_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteCredentials object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteCredentials') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteCredentials') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the deletion request.
@@ -5485,7 +4834,7 @@ class DeleteCredentials():
         DELETED = 'deleted'
 
 
-class DeleteDocumentResponse():
+class DeleteDocumentResponse(Model):
     """
     Information returned when a document is deleted.
 
@@ -5494,6 +4843,13 @@ class DeleteDocumentResponse():
           status deleted.
     """
 
+    __slots__ = ('document_id', 'status')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('status'),
+    )
+
     def __init__(self, *, document_id: str = None, status: str = None) -> None:
         """
         Initialize a DeleteDocumentResponse object.
@@ -5505,48 +4861,6 @@ class DeleteDocumentResponse():
         self.document_id = document_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteDocumentResponse':
-        """Initialize a DeleteDocumentResponse object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteDocumentResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteDocumentResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteDocumentResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteDocumentResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the document. A deleted document has the status deleted.
@@ -5554,7 +4868,7 @@ class DeleteDocumentResponse():
         DELETED = 'deleted'
 
 
-class DeleteEnvironmentResponse():
+class DeleteEnvironmentResponse(Model):
     """
     Response object returned when deleting an environment.
 
@@ -5562,6 +4876,13 @@ class DeleteEnvironmentResponse():
     :attr str status: Status of the environment.
     """
 
+    __slots__ = ('environment_id', 'status')
+
+    _fields = (
+        ModelField('environment_id', required=True),
+        ModelField('status', required=True),
+    )
+
     def __init__(self, environment_id: str, status: str) -> None:
         """
         Initialize a DeleteEnvironmentResponse object.
@@ -5572,56 +4893,6 @@ class DeleteEnvironmentResponse():
         self.environment_id = environment_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteEnvironmentResponse':
-        """Initialize a DeleteEnvironmentResponse object from a json dictionary."""
-        args = {}
-        if 'environment_id' in _dict:
-            args['environment_id'] = _dict.get('environment_id')
-        else:
-            raise ValueError(
-                'Required property \'environment_id\' not present in DeleteEnvironmentResponse JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DeleteEnvironmentResponse JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteEnvironmentResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environment_id') and self.environment_id is not None:
-            _dict['environment_id'] = self.environment_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteEnvironmentResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteEnvironmentResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteEnvironmentResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the environment.
@@ -5629,7 +4900,7 @@ class DeleteEnvironmentResponse():
         DELETED = 'deleted'
 
 
-class DiskUsage():
+class DiskUsage(Model):
     """
     Summary of the disk usage statistics for the environment.
 
@@ -5639,6 +4910,13 @@ class DiskUsage():
           the environment's disk capacity.
     """
 
+    __slots__ = ('used_bytes', 'maximum_allowed_bytes')
+
+    _fields = (
+        ModelField('used_bytes'),
+        ModelField('maximum_allowed_bytes'),
+    )
+
     def __init__(self,
                  *,
                  used_bytes: int = None,
@@ -5650,53 +4928,8 @@ class DiskUsage():
         self.used_bytes = used_bytes
         self.maximum_allowed_bytes = maximum_allowed_bytes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DiskUsage':
-        """Initialize a DiskUsage object from a json dictionary."""
-        args = {}
-        if 'used_bytes' in _dict:
-            args['used_bytes'] = _dict.get('used_bytes')
-        if 'maximum_allowed_bytes' in _dict:
-            args['maximum_allowed_bytes'] = _dict.get('maximum_allowed_bytes')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DiskUsage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'used_bytes') and getattr(self,
-                                                   'used_bytes') is not None:
-            _dict['used_bytes'] = getattr(self, 'used_bytes')
-        if hasattr(self, 'maximum_allowed_bytes') and getattr(
-                self, 'maximum_allowed_bytes') is not None:
-            _dict['maximum_allowed_bytes'] = getattr(self,
-                                                     'maximum_allowed_bytes')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DiskUsage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DiskUsage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'DiskUsage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentAccepted():
+class DocumentAccepted(Model):
     """
     Information returned after an uploaded document is accepted.
 
@@ -5710,6 +4943,14 @@ class DocumentAccepted():
           document-ingestion process.
     """
 
+    __slots__ = ('document_id', 'status', 'notices')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('status'),
+        ModelField('notices', 'list', 'Notice'),
+    )
+
     def __init__(self,
                  *,
                  document_id: str = None,
@@ -5731,54 +4972,6 @@ class DocumentAccepted():
         self.status = status
         self.notices = notices
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentAccepted':
-        """Initialize a DocumentAccepted object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentAccepted object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentAccepted object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentAccepted') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentAccepted') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the document in the ingestion process. A status of `processing` is
@@ -5789,7 +4982,7 @@ class DocumentAccepted():
         PENDING = 'pending'
 
 
-class DocumentCounts():
+class DocumentCounts(Model):
     """
     Object containing collection document count information.
 
@@ -5803,6 +4996,15 @@ class DocumentCounts():
           the collection, but have not yet started processing.
     """
 
+    __slots__ = ('available', 'processing', 'failed', 'pending')
+
+    _fields = (
+        ModelField('available'),
+        ModelField('processing'),
+        ModelField('failed'),
+        ModelField('pending'),
+    )
+
     def __init__(self,
                  *,
                  available: int = None,
@@ -5818,60 +5020,8 @@ class DocumentCounts():
         self.failed = failed
         self.pending = pending
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentCounts':
-        """Initialize a DocumentCounts object from a json dictionary."""
-        args = {}
-        if 'available' in _dict:
-            args['available'] = _dict.get('available')
-        if 'processing' in _dict:
-            args['processing'] = _dict.get('processing')
-        if 'failed' in _dict:
-            args['failed'] = _dict.get('failed')
-        if 'pending' in _dict:
-            args['pending'] = _dict.get('pending')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentCounts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'available') and getattr(self,
-                                                  'available') is not None:
-            _dict['available'] = getattr(self, 'available')
-        if hasattr(self, 'processing') and getattr(self,
-                                                   'processing') is not None:
-            _dict['processing'] = getattr(self, 'processing')
-        if hasattr(self, 'failed') and getattr(self, 'failed') is not None:
-            _dict['failed'] = getattr(self, 'failed')
-        if hasattr(self, 'pending') and getattr(self, 'pending') is not None:
-            _dict['pending'] = getattr(self, 'pending')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentCounts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentCounts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentCounts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentStatus():
+class DocumentStatus(Model):
     """
     Status information about a submitted document.
 
@@ -5888,6 +5038,21 @@ class DocumentStatus():
           process.
     """
 
+    __slots__ = ('document_id', 'configuration_id', 'status',
+                 'status_description', 'filename', 'file_type', 'sha1',
+                 'notices')
+
+    _fields = (
+        ModelField('document_id', required=True),
+        ModelField('configuration_id'),
+        ModelField('status', required=True),
+        ModelField('status_description', required=True),
+        ModelField('filename'),
+        ModelField('file_type'),
+        ModelField('sha1'),
+        ModelField('notices', 'list', 'Notice', required=True),
+    )
+
     def __init__(self,
                  document_id: str,
                  status: str,
@@ -5921,93 +5086,6 @@ class DocumentStatus():
         self.sha1 = sha1
         self.notices = notices
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentStatus':
-        """Initialize a DocumentStatus object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        else:
-            raise ValueError(
-                'Required property \'document_id\' not present in DocumentStatus JSON'
-            )
-        if 'configuration_id' in _dict:
-            args['configuration_id'] = _dict.get('configuration_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DocumentStatus JSON'
-            )
-        if 'status_description' in _dict:
-            args['status_description'] = _dict.get('status_description')
-        else:
-            raise ValueError(
-                'Required property \'status_description\' not present in DocumentStatus JSON'
-            )
-        if 'filename' in _dict:
-            args['filename'] = _dict.get('filename')
-        if 'file_type' in _dict:
-            args['file_type'] = _dict.get('file_type')
-        if 'sha1' in _dict:
-            args['sha1'] = _dict.get('sha1')
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'notices\' not present in DocumentStatus JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and getattr(self,
-                                                    'document_id') is not None:
-            _dict['document_id'] = getattr(self, 'document_id')
-        if hasattr(self, 'configuration_id') and getattr(
-                self, 'configuration_id') is not None:
-            _dict['configuration_id'] = getattr(self, 'configuration_id')
-        if hasattr(self, 'status') and getattr(self, 'status') is not None:
-            _dict['status'] = getattr(self, 'status')
-        if hasattr(self, 'status_description') and getattr(
-                self, 'status_description') is not None:
-            _dict['status_description'] = getattr(self, 'status_description')
-        if hasattr(self, 'filename') and self.filename is not None:
-            _dict['filename'] = self.filename
-        if hasattr(self, 'file_type') and self.file_type is not None:
-            _dict['file_type'] = self.file_type
-        if hasattr(self, 'sha1') and self.sha1 is not None:
-            _dict['sha1'] = self.sha1
-        if hasattr(self, 'notices') and getattr(self, 'notices') is not None:
-            _dict['notices'] = [x.to_dict() for x in getattr(self, 'notices')]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the document in the ingestion process.
@@ -6028,7 +5106,7 @@ class DocumentStatus():
         JSON = 'json'
 
 
-class Enrichment():
+class Enrichment(Model):
     """
     Enrichment step to perform on the document. Each enrichment is performed on the
     specified field in the order that they are listed in the configuration.
@@ -6058,6 +5136,20 @@ class Enrichment():
           particular enrichment.
     """
 
+    __slots__ = ('description', 'destination_field', 'source_field',
+                 'overwrite', 'enrichment', 'ignore_downstream_errors',
+                 'options')
+
+    _fields = (
+        ModelField('description'),
+        ModelField('destination_field', required=True),
+        ModelField('source_field', required=True),
+        ModelField('overwrite'),
+        ModelField('enrichment', required=True),
+        ModelField('ignore_downstream_errors'),
+        ModelField('options', 'model', 'EnrichmentOptions'),
+    )
+
     def __init__(self,
                  destination_field: str,
                  source_field: str,
@@ -6103,85 +5195,8 @@ class Enrichment():
         self.ignore_downstream_errors = ignore_downstream_errors
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Enrichment':
-        """Initialize a Enrichment object from a json dictionary."""
-        args = {}
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'destination_field' in _dict:
-            args['destination_field'] = _dict.get('destination_field')
-        else:
-            raise ValueError(
-                'Required property \'destination_field\' not present in Enrichment JSON'
-            )
-        if 'source_field' in _dict:
-            args['source_field'] = _dict.get('source_field')
-        else:
-            raise ValueError(
-                'Required property \'source_field\' not present in Enrichment JSON'
-            )
-        if 'overwrite' in _dict:
-            args['overwrite'] = _dict.get('overwrite')
-        if 'enrichment' in _dict:
-            args['enrichment'] = _dict.get('enrichment')
-        else:
-            raise ValueError(
-                'Required property \'enrichment\' not present in Enrichment JSON'
-            )
-        if 'ignore_downstream_errors' in _dict:
-            args['ignore_downstream_errors'] = _dict.get(
-                'ignore_downstream_errors')
-        if 'options' in _dict:
-            args['options'] = EnrichmentOptions.from_dict(_dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Enrichment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self,
-                   'destination_field') and self.destination_field is not None:
-            _dict['destination_field'] = self.destination_field
-        if hasattr(self, 'source_field') and self.source_field is not None:
-            _dict['source_field'] = self.source_field
-        if hasattr(self, 'overwrite') and self.overwrite is not None:
-            _dict['overwrite'] = self.overwrite
-        if hasattr(self, 'enrichment') and self.enrichment is not None:
-            _dict['enrichment'] = self.enrichment
-        if hasattr(self, 'ignore_downstream_errors'
-                  ) and self.ignore_downstream_errors is not None:
-            _dict['ignore_downstream_errors'] = self.ignore_downstream_errors
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Enrichment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Enrichment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'Enrichment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EnrichmentOptions():
+class EnrichmentOptions(Model):
     """
     Options which are specific to a particular enrichment.
 
@@ -6197,6 +5212,14 @@ class EnrichmentOptions():
           element extraction model to use. The only model available is `contract`.
     """
 
+    __slots__ = ('features', 'language', 'model')
+
+    _fields = (
+        ModelField('features', 'model', 'NluEnrichmentFeatures'),
+        ModelField('language'),
+        ModelField('model'),
+    )
+
     def __init__(self,
                  *,
                  features: 'NluEnrichmentFeatures' = None,
@@ -6220,53 +5243,6 @@ class EnrichmentOptions():
         self.language = language
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EnrichmentOptions':
-        """Initialize a EnrichmentOptions object from a json dictionary."""
-        args = {}
-        if 'features' in _dict:
-            args['features'] = NluEnrichmentFeatures.from_dict(
-                _dict.get('features'))
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EnrichmentOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'features') and self.features is not None:
-            _dict['features'] = self.features.to_dict()
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EnrichmentOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EnrichmentOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EnrichmentOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class LanguageEnum(str, Enum):
         """
         ISO 639-1 code indicating the language to use for the analysis. This code
@@ -6286,7 +5262,7 @@ class EnrichmentOptions():
         SV = 'sv'
 
 
-class Environment():
+class Environment(Model):
     """
     Details about an environment.
 
@@ -6313,6 +5289,24 @@ class Environment():
           Relevancy Training for this environment.
     """
 
+    __slots__ = ('environment_id', 'name', 'description', 'created', 'updated',
+                 'status', 'read_only', 'size', 'requested_size',
+                 'index_capacity', 'search_status')
+
+    _fields = (
+        ModelField('environment_id'),
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('status'),
+        ModelField('read_only'),
+        ModelField('size'),
+        ModelField('requested_size'),
+        ModelField('index_capacity', 'model', 'IndexCapacity'),
+        ModelField('search_status', 'model', 'SearchStatus'),
+    )
+
     def __init__(self,
                  *,
                  environment_id: str = None,
@@ -6353,88 +5347,6 @@ class Environment():
         self.index_capacity = index_capacity
         self.search_status = search_status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Environment':
-        """Initialize a Environment object from a json dictionary."""
-        args = {}
-        if 'environment_id' in _dict:
-            args['environment_id'] = _dict.get('environment_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'read_only' in _dict:
-            args['read_only'] = _dict.get('read_only')
-        if 'size' in _dict:
-            args['size'] = _dict.get('size')
-        if 'requested_size' in _dict:
-            args['requested_size'] = _dict.get('requested_size')
-        if 'index_capacity' in _dict:
-            args['index_capacity'] = IndexCapacity.from_dict(
-                _dict.get('index_capacity'))
-        if 'search_status' in _dict:
-            args['search_status'] = SearchStatus.from_dict(
-                _dict.get('search_status'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Environment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environment_id') and getattr(
-                self, 'environment_id') is not None:
-            _dict['environment_id'] = getattr(self, 'environment_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'status') and getattr(self, 'status') is not None:
-            _dict['status'] = getattr(self, 'status')
-        if hasattr(self, 'read_only') and getattr(self,
-                                                  'read_only') is not None:
-            _dict['read_only'] = getattr(self, 'read_only')
-        if hasattr(self, 'size') and self.size is not None:
-            _dict['size'] = self.size
-        if hasattr(self, 'requested_size') and self.requested_size is not None:
-            _dict['requested_size'] = self.requested_size
-        if hasattr(self, 'index_capacity') and self.index_capacity is not None:
-            _dict['index_capacity'] = self.index_capacity.to_dict()
-        if hasattr(self, 'search_status') and self.search_status is not None:
-            _dict['search_status'] = self.search_status.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Environment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Environment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Environment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Current status of the environment. `resizing` is displayed when a request to
@@ -6462,7 +5374,7 @@ class Environment():
         XXXL = 'XXXL'
 
 
-class EnvironmentDocuments():
+class EnvironmentDocuments(Model):
     """
     Summary of the document usage statistics for the environment.
 
@@ -6471,6 +5383,13 @@ class EnvironmentDocuments():
           environment's capacity.
     """
 
+    __slots__ = ('available', 'maximum_allowed')
+
+    _fields = (
+        ModelField('available'),
+        ModelField('maximum_allowed'),
+    )
+
     def __init__(self,
                  *,
                  available: int = None,
@@ -6482,52 +5401,8 @@ class EnvironmentDocuments():
         self.available = available
         self.maximum_allowed = maximum_allowed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EnvironmentDocuments':
-        """Initialize a EnvironmentDocuments object from a json dictionary."""
-        args = {}
-        if 'available' in _dict:
-            args['available'] = _dict.get('available')
-        if 'maximum_allowed' in _dict:
-            args['maximum_allowed'] = _dict.get('maximum_allowed')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EnvironmentDocuments object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'available') and getattr(self,
-                                                  'available') is not None:
-            _dict['available'] = getattr(self, 'available')
-        if hasattr(self, 'maximum_allowed') and getattr(
-                self, 'maximum_allowed') is not None:
-            _dict['maximum_allowed'] = getattr(self, 'maximum_allowed')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EnvironmentDocuments object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EnvironmentDocuments') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EnvironmentDocuments') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class EventData():
+class EventData(Model):
     """
     Query event data object.
 
@@ -6548,6 +5423,19 @@ class EventData():
           and any events associated with that query are stored with the same **query_id**.
     """
 
+    __slots__ = ('environment_id', 'session_token', 'client_timestamp',
+                 'display_rank', 'collection_id', 'document_id', 'query_id')
+
+    _fields = (
+        ModelField('environment_id', required=True),
+        ModelField('session_token', required=True),
+        ModelField('client_timestamp', 'datetime'),
+        ModelField('display_rank'),
+        ModelField('collection_id', required=True),
+        ModelField('document_id', required=True),
+        ModelField('query_id'),
+    )
+
     def __init__(self,
                  environment_id: str,
                  session_token: str,
@@ -6582,89 +5470,8 @@ class EventData():
         self.document_id = document_id
         self.query_id = query_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EventData':
-        """Initialize a EventData object from a json dictionary."""
-        args = {}
-        if 'environment_id' in _dict:
-            args['environment_id'] = _dict.get('environment_id')
-        else:
-            raise ValueError(
-                'Required property \'environment_id\' not present in EventData JSON'
-            )
-        if 'session_token' in _dict:
-            args['session_token'] = _dict.get('session_token')
-        else:
-            raise ValueError(
-                'Required property \'session_token\' not present in EventData JSON'
-            )
-        if 'client_timestamp' in _dict:
-            args['client_timestamp'] = string_to_datetime(
-                _dict.get('client_timestamp'))
-        if 'display_rank' in _dict:
-            args['display_rank'] = _dict.get('display_rank')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in EventData JSON'
-            )
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        else:
-            raise ValueError(
-                'Required property \'document_id\' not present in EventData JSON'
-            )
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EventData object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environment_id') and self.environment_id is not None:
-            _dict['environment_id'] = self.environment_id
-        if hasattr(self, 'session_token') and self.session_token is not None:
-            _dict['session_token'] = self.session_token
-        if hasattr(self,
-                   'client_timestamp') and self.client_timestamp is not None:
-            _dict['client_timestamp'] = datetime_to_string(
-                self.client_timestamp)
-        if hasattr(self, 'display_rank') and self.display_rank is not None:
-            _dict['display_rank'] = self.display_rank
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'query_id') and getattr(self, 'query_id') is not None:
-            _dict['query_id'] = getattr(self, 'query_id')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EventData object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EventData') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EventData') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class Expansion():
+class Expansion(Model):
     """
     An expansion definition. Each object respresents one set of expandable strings. For
     example, you could have expansions for the word `hot` in one object, and expansions
@@ -6677,6 +5484,13 @@ class Expansion():
           input term list.
     """
 
+    __slots__ = ('input_terms', 'expanded_terms')
+
+    _fields = (
+        ModelField('input_terms'),
+        ModelField('expanded_terms', required=True),
+    )
+
     def __init__(self,
                  expanded_terms: List[str],
                  *,
@@ -6694,54 +5508,8 @@ class Expansion():
         self.input_terms = input_terms
         self.expanded_terms = expanded_terms
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Expansion':
-        """Initialize a Expansion object from a json dictionary."""
-        args = {}
-        if 'input_terms' in _dict:
-            args['input_terms'] = _dict.get('input_terms')
-        if 'expanded_terms' in _dict:
-            args['expanded_terms'] = _dict.get('expanded_terms')
-        else:
-            raise ValueError(
-                'Required property \'expanded_terms\' not present in Expansion JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Expansion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'input_terms') and self.input_terms is not None:
-            _dict['input_terms'] = self.input_terms
-        if hasattr(self, 'expanded_terms') and self.expanded_terms is not None:
-            _dict['expanded_terms'] = self.expanded_terms
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Expansion object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Expansion') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'Expansion') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Expansions():
+class Expansions(Model):
     """
     The query expansion definitions for the specified collection.
 
@@ -6760,6 +5528,12 @@ class Expansions():
           **expanded_terms** array.
     """
 
+    __slots__ = ('expansions',)
+
+    _fields = (
+        ModelField('expansions', 'list', 'Expansion', required=True),
+    )
+
     def __init__(self, expansions: List['Expansion']) -> None:
         """
         Initialize a Expansions object.
@@ -6780,52 +5554,8 @@ class Expansions():
         """
         self.expansions = expansions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Expansions':
-        """Initialize a Expansions object from a json dictionary."""
-        args = {}
-        if 'expansions' in _dict:
-            args['expansions'] = [
-                Expansion.from_dict(x) for x in _dict.get('expansions')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'expansions\' not present in Expansions JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Expansions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'expansions') and self.expansions is not None:
-            _dict['expansions'] = [x.to_dict() for x in self.expansions]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Expansions object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Expansions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Expansions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Field():
+class Field(Model):
     """
     Object containing field details.
 
@@ -6833,6 +5563,13 @@ class Field():
     :attr str type: (optional) The type of the field.
     """
 
+    __slots__ = ('field', 'type')
+
+    _fields = (
+        ModelField('field'),
+        ModelField('type'),
+    )
+
     def __init__(self, *, field: str = None, type: str = None) -> None:
         """
         Initialize a Field object.
@@ -6841,48 +5578,6 @@ class Field():
         self.field = field
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Field':
-        """Initialize a Field object from a json dictionary."""
-        args = {}
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Field object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'field') and getattr(self, 'field') is not None:
-            _dict['field'] = getattr(self, 'field')
-        if hasattr(self, 'type') and getattr(self, 'type') is not None:
-            _dict['type'] = getattr(self, 'type')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Field object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Field') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Field') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of the field.
@@ -6900,7 +5595,7 @@ class Field():
         BINARY = 'binary'
 
 
-class FontSetting():
+class FontSetting(Model):
     """
     Font matching configuration.
 
@@ -6913,6 +5608,17 @@ class FontSetting():
     :attr str name: (optional) The name of the font.
     """
 
+    __slots__ = ('level', 'min_size', 'max_size', 'bold', 'italic', 'name')
+
+    _fields = (
+        ModelField('level'),
+        ModelField('min_size'),
+        ModelField('max_size'),
+        ModelField('bold'),
+        ModelField('italic'),
+        ModelField('name'),
+    )
+
     def __init__(self,
                  *,
                  level: int = None,
@@ -6941,66 +5647,8 @@ class FontSetting():
         self.italic = italic
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FontSetting':
-        """Initialize a FontSetting object from a json dictionary."""
-        args = {}
-        if 'level' in _dict:
-            args['level'] = _dict.get('level')
-        if 'min_size' in _dict:
-            args['min_size'] = _dict.get('min_size')
-        if 'max_size' in _dict:
-            args['max_size'] = _dict.get('max_size')
-        if 'bold' in _dict:
-            args['bold'] = _dict.get('bold')
-        if 'italic' in _dict:
-            args['italic'] = _dict.get('italic')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FontSetting object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'level') and self.level is not None:
-            _dict['level'] = self.level
-        if hasattr(self, 'min_size') and self.min_size is not None:
-            _dict['min_size'] = self.min_size
-        if hasattr(self, 'max_size') and self.max_size is not None:
-            _dict['max_size'] = self.max_size
-        if hasattr(self, 'bold') and self.bold is not None:
-            _dict['bold'] = self.bold
-        if hasattr(self, 'italic') and self.italic is not None:
-            _dict['italic'] = self.italic
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FontSetting object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FontSetting') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FontSetting') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class Gateway():
+class Gateway(Model):
     """
     Object describing a specific gateway.
 
@@ -7015,6 +5663,16 @@ class Gateway():
           value of this field is used when configuring the remotly installed gateway.
     """
 
+    __slots__ = ('gateway_id', 'name', 'status', 'token', 'token_id')
+
+    _fields = (
+        ModelField('gateway_id'),
+        ModelField('name'),
+        ModelField('status'),
+        ModelField('token'),
+        ModelField('token_id'),
+    )
+
     def __init__(self,
                  *,
                  gateway_id: str = None,
@@ -7042,60 +5700,6 @@ class Gateway():
         self.token = token
         self.token_id = token_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Gateway':
-        """Initialize a Gateway object from a json dictionary."""
-        args = {}
-        if 'gateway_id' in _dict:
-            args['gateway_id'] = _dict.get('gateway_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'token' in _dict:
-            args['token'] = _dict.get('token')
-        if 'token_id' in _dict:
-            args['token_id'] = _dict.get('token_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Gateway object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'gateway_id') and self.gateway_id is not None:
-            _dict['gateway_id'] = self.gateway_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'token') and self.token is not None:
-            _dict['token'] = self.token
-        if hasattr(self, 'token_id') and self.token_id is not None:
-            _dict['token_id'] = self.token_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Gateway object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Gateway') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Gateway') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the gateway. `connected` means the gateway is connected to
@@ -7105,7 +5709,7 @@ class Gateway():
         IDLE = 'idle'
 
 
-class GatewayDelete():
+class GatewayDelete(Model):
     """
     Gatway deletion confirmation.
 
@@ -7113,6 +5717,13 @@ class GatewayDelete():
     :attr str status: (optional) The status of the request.
     """
 
+    __slots__ = ('gateway_id', 'status')
+
+    _fields = (
+        ModelField('gateway_id'),
+        ModelField('status'),
+    )
+
     def __init__(self, *, gateway_id: str = None, status: str = None) -> None:
         """
         Initialize a GatewayDelete object.
@@ -7123,50 +5734,8 @@ class GatewayDelete():
         self.gateway_id = gateway_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'GatewayDelete':
-        """Initialize a GatewayDelete object from a json dictionary."""
-        args = {}
-        if 'gateway_id' in _dict:
-            args['gateway_id'] = _dict.get('gateway_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a GatewayDelete object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'gateway_id') and self.gateway_id is not None:
-            _dict['gateway_id'] = self.gateway_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this GatewayDelete object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'GatewayDelete') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'GatewayDelete') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class GatewayList():
+class GatewayList(Model):
     """
     Object containing gateways array.
 
@@ -7174,6 +5743,12 @@ class GatewayList():
           connections.
     """
 
+    __slots__ = ('gateways',)
+
+    _fields = (
+        ModelField('gateways', 'list', 'Gateway'),
+    )
+
     def __init__(self, *, gateways: List['Gateway'] = None) -> None:
         """
         Initialize a GatewayList object.
@@ -7183,48 +5758,8 @@ class GatewayList():
         """
         self.gateways = gateways
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'GatewayList':
-        """Initialize a GatewayList object from a json dictionary."""
-        args = {}
-        if 'gateways' in _dict:
-            args['gateways'] = [
-                Gateway.from_dict(x) for x in _dict.get('gateways')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a GatewayList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'gateways') and self.gateways is not None:
-            _dict['gateways'] = [x.to_dict() for x in self.gateways]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this GatewayList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'GatewayList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'GatewayList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class HtmlSettings():
+class HtmlSettings(Model):
     """
     A list of HTML conversion settings.
 
@@ -7242,6 +5777,19 @@ class HtmlSettings():
           to exclude.
     """
 
+    __slots__ = ('exclude_tags_completely', 'exclude_tags_keep_content',
+                 'keep_content', 'exclude_content', 'keep_tag_attributes',
+                 'exclude_tag_attributes')
+
+    _fields = (
+        ModelField('exclude_tags_completely'),
+        ModelField('exclude_tags_keep_content'),
+        ModelField('keep_content', 'model', 'XPathPatterns'),
+        ModelField('exclude_content', 'model', 'XPathPatterns'),
+        ModelField('keep_tag_attributes'),
+        ModelField('exclude_tag_attributes'),
+    )
+
     def __init__(self,
                  *,
                  exclude_tags_completely: List[str] = None,
@@ -7273,76 +5821,8 @@ class HtmlSettings():
         self.keep_tag_attributes = keep_tag_attributes
         self.exclude_tag_attributes = exclude_tag_attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'HtmlSettings':
-        """Initialize a HtmlSettings object from a json dictionary."""
-        args = {}
-        if 'exclude_tags_completely' in _dict:
-            args['exclude_tags_completely'] = _dict.get(
-                'exclude_tags_completely')
-        if 'exclude_tags_keep_content' in _dict:
-            args['exclude_tags_keep_content'] = _dict.get(
-                'exclude_tags_keep_content')
-        if 'keep_content' in _dict:
-            args['keep_content'] = XPathPatterns.from_dict(
-                _dict.get('keep_content'))
-        if 'exclude_content' in _dict:
-            args['exclude_content'] = XPathPatterns.from_dict(
-                _dict.get('exclude_content'))
-        if 'keep_tag_attributes' in _dict:
-            args['keep_tag_attributes'] = _dict.get('keep_tag_attributes')
-        if 'exclude_tag_attributes' in _dict:
-            args['exclude_tag_attributes'] = _dict.get('exclude_tag_attributes')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a HtmlSettings object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'exclude_tags_completely'
-                  ) and self.exclude_tags_completely is not None:
-            _dict['exclude_tags_completely'] = self.exclude_tags_completely
-        if hasattr(self, 'exclude_tags_keep_content'
-                  ) and self.exclude_tags_keep_content is not None:
-            _dict['exclude_tags_keep_content'] = self.exclude_tags_keep_content
-        if hasattr(self, 'keep_content') and self.keep_content is not None:
-            _dict['keep_content'] = self.keep_content.to_dict()
-        if hasattr(self,
-                   'exclude_content') and self.exclude_content is not None:
-            _dict['exclude_content'] = self.exclude_content.to_dict()
-        if hasattr(
-                self,
-                'keep_tag_attributes') and self.keep_tag_attributes is not None:
-            _dict['keep_tag_attributes'] = self.keep_tag_attributes
-        if hasattr(self, 'exclude_tag_attributes'
-                  ) and self.exclude_tag_attributes is not None:
-            _dict['exclude_tag_attributes'] = self.exclude_tag_attributes
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this HtmlSettings object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'HtmlSettings') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'HtmlSettings') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class IndexCapacity():
+class IndexCapacity(Model):
     """
     Details about the resource usage and capacity of the environment.
 
@@ -7354,6 +5834,14 @@ class IndexCapacity():
           the environment.
     """
 
+    __slots__ = ('documents', 'disk_usage', 'collections')
+
+    _fields = (
+        ModelField('documents', 'model', 'EnvironmentDocuments'),
+        ModelField('disk_usage', 'model', 'DiskUsage'),
+        ModelField('collections', 'model', 'CollectionUsage'),
+    )
+
     def __init__(self,
                  *,
                  documents: 'EnvironmentDocuments' = None,
@@ -7373,56 +5861,8 @@ class IndexCapacity():
         self.disk_usage = disk_usage
         self.collections = collections
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IndexCapacity':
-        """Initialize a IndexCapacity object from a json dictionary."""
-        args = {}
-        if 'documents' in _dict:
-            args['documents'] = EnvironmentDocuments.from_dict(
-                _dict.get('documents'))
-        if 'disk_usage' in _dict:
-            args['disk_usage'] = DiskUsage.from_dict(_dict.get('disk_usage'))
-        if 'collections' in _dict:
-            args['collections'] = CollectionUsage.from_dict(
-                _dict.get('collections'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IndexCapacity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'documents') and self.documents is not None:
-            _dict['documents'] = self.documents.to_dict()
-        if hasattr(self, 'disk_usage') and self.disk_usage is not None:
-            _dict['disk_usage'] = self.disk_usage.to_dict()
-        if hasattr(self, 'collections') and self.collections is not None:
-            _dict['collections'] = self.collections.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IndexCapacity object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IndexCapacity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'IndexCapacity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListCollectionFieldsResponse():
+class ListCollectionFieldsResponse(Model):
     """
     The list of fetched fields.
     The fields are returned using a fully qualified name format, however, the format
@@ -7439,6 +5879,12 @@ class ListCollectionFieldsResponse():
           field in the collections.
     """
 
+    __slots__ = ('fields',)
+
+    _fields = (
+        ModelField('fields', 'list', 'Field'),
+    )
+
     def __init__(self, *, fields: List['Field'] = None) -> None:
         """
         Initialize a ListCollectionFieldsResponse object.
@@ -7448,46 +5894,8 @@ class ListCollectionFieldsResponse():
         """
         self.fields = fields
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListCollectionFieldsResponse':
-        """Initialize a ListCollectionFieldsResponse object from a json dictionary."""
-        args = {}
-        if 'fields' in _dict:
-            args['fields'] = [Field.from_dict(x) for x in _dict.get('fields')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListCollectionFieldsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'fields') and self.fields is not None:
-            _dict['fields'] = [x.to_dict() for x in self.fields]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListCollectionFieldsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'ListCollectionFieldsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListCollectionFieldsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListCollectionsResponse():
+class ListCollectionsResponse(Model):
     """
     Response object containing an array of collection details.
 
@@ -7495,6 +5903,12 @@ class ListCollectionsResponse():
           about each collection in the environment.
     """
 
+    __slots__ = ('collections',)
+
+    _fields = (
+        ModelField('collections', 'list', 'Collection'),
+    )
+
     def __init__(self, *, collections: List['Collection'] = None) -> None:
         """
         Initialize a ListCollectionsResponse object.
@@ -7504,48 +5918,8 @@ class ListCollectionsResponse():
         """
         self.collections = collections
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListCollectionsResponse':
-        """Initialize a ListCollectionsResponse object from a json dictionary."""
-        args = {}
-        if 'collections' in _dict:
-            args['collections'] = [
-                Collection.from_dict(x) for x in _dict.get('collections')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListCollectionsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collections') and self.collections is not None:
-            _dict['collections'] = [x.to_dict() for x in self.collections]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this ListCollectionsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListCollectionsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListCollectionsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListConfigurationsResponse():
+class ListConfigurationsResponse(Model):
     """
     Object containing an array of available configurations.
 
@@ -7553,6 +5927,12 @@ class ListConfigurationsResponse():
           that are available for the service instance.
     """
 
+    __slots__ = ('configurations',)
+
+    _fields = (
+        ModelField('configurations', 'list', 'Configuration'),
+    )
+
     def __init__(self, *, configurations: List['Configuration'] = None) -> None:
         """
         Initialize a ListConfigurationsResponse object.
@@ -7562,48 +5942,8 @@ class ListConfigurationsResponse():
         """
         self.configurations = configurations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListConfigurationsResponse':
-        """Initialize a ListConfigurationsResponse object from a json dictionary."""
-        args = {}
-        if 'configurations' in _dict:
-            args['configurations'] = [
-                Configuration.from_dict(x) for x in _dict.get('configurations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListConfigurationsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'configurations') and self.configurations is not None:
-            _dict['configurations'] = [x.to_dict() for x in self.configurations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListConfigurationsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListConfigurationsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListConfigurationsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class ListEnvironmentsResponse():
+class ListEnvironmentsResponse(Model):
     """
     Response object containing an array of configured environments.
 
@@ -7611,6 +5951,12 @@ class ListEnvironmentsResponse():
           are available for the service instance.
     """
 
+    __slots__ = ('environments',)
+
+    _fields = (
+        ModelField('environments', 'list', 'Environment'),
+    )
+
     def __init__(self, *, environments: List['Environment'] = None) -> None:
         """
         Initialize a ListEnvironmentsResponse object.
@@ -7620,48 +5966,8 @@ class ListEnvironmentsResponse():
         """
         self.environments = environments
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListEnvironmentsResponse':
-        """Initialize a ListEnvironmentsResponse object from a json dictionary."""
-        args = {}
-        if 'environments' in _dict:
-            args['environments'] = [
-                Environment.from_dict(x) for x in _dict.get('environments')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListEnvironmentsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environments') and self.environments is not None:
-            _dict['environments'] = [x.to_dict() for x in self.environments]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListEnvironmentsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListEnvironmentsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ListEnvironmentsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class LogQueryResponse():
+class LogQueryResponse(Model):
     """
     Object containing results that match the requested **logs** query.
 
@@ -7670,6 +5976,13 @@ class LogQueryResponse():
           response results.
     """
 
+    __slots__ = ('matching_results', 'results')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('results', 'list', 'LogQueryResponseResult'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -7684,54 +5997,8 @@ class LogQueryResponse():
         self.matching_results = matching_results
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogQueryResponse':
-        """Initialize a LogQueryResponse object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'results' in _dict:
-            args['results'] = [
-                LogQueryResponseResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogQueryResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogQueryResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'LogQueryResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogQueryResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class LogQueryResponseResult():
+class LogQueryResponseResult(Model):
     """
     Individual result object for a **logs** query. Each object represents either a query
     to a Discovery collection or an event that is associated with a query.
@@ -7787,6 +6054,30 @@ class LogQueryResponseResult():
           associated with. Only returned with logs of type `event`.
     """
 
+    __slots__ = ('environment_id', 'customer_id', 'document_type',
+                 'natural_language_query', 'document_results',
+                 'created_timestamp', 'client_timestamp', 'query_id',
+                 'session_token', 'collection_id', 'display_rank',
+                 'document_id', 'event_type', 'result_type')
+
+    _fields = (
+        ModelField('environment_id'),
+        ModelField('customer_id'),
+        ModelField('document_type'),
+        ModelField('natural_language_query'),
+        ModelField('document_results', 'model',
+                   'LogQueryResponseResultDocuments'),
+        ModelField('created_timestamp', 'datetime'),
+        ModelField('client_timestamp', 'datetime'),
+        ModelField('query_id'),
+        ModelField('session_token'),
+        ModelField('collection_id'),
+        ModelField('display_rank'),
+        ModelField('document_id'),
+        ModelField('event_type'),
+        ModelField('result_type'),
+    )
+
     def __init__(self,
                  *,
                  environment_id: str = None,
@@ -7873,106 +6164,6 @@ class LogQueryResponseResult():
         self.event_type = event_type
         self.result_type = result_type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogQueryResponseResult':
-        """Initialize a LogQueryResponseResult object from a json dictionary."""
-        args = {}
-        if 'environment_id' in _dict:
-            args['environment_id'] = _dict.get('environment_id')
-        if 'customer_id' in _dict:
-            args['customer_id'] = _dict.get('customer_id')
-        if 'document_type' in _dict:
-            args['document_type'] = _dict.get('document_type')
-        if 'natural_language_query' in _dict:
-            args['natural_language_query'] = _dict.get('natural_language_query')
-        if 'document_results' in _dict:
-            args[
-                'document_results'] = LogQueryResponseResultDocuments.from_dict(
-                    _dict.get('document_results'))
-        if 'created_timestamp' in _dict:
-            args['created_timestamp'] = string_to_datetime(
-                _dict.get('created_timestamp'))
-        if 'client_timestamp' in _dict:
-            args['client_timestamp'] = string_to_datetime(
-                _dict.get('client_timestamp'))
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        if 'session_token' in _dict:
-            args['session_token'] = _dict.get('session_token')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'display_rank' in _dict:
-            args['display_rank'] = _dict.get('display_rank')
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'event_type' in _dict:
-            args['event_type'] = _dict.get('event_type')
-        if 'result_type' in _dict:
-            args['result_type'] = _dict.get('result_type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogQueryResponseResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environment_id') and self.environment_id is not None:
-            _dict['environment_id'] = self.environment_id
-        if hasattr(self, 'customer_id') and self.customer_id is not None:
-            _dict['customer_id'] = self.customer_id
-        if hasattr(self, 'document_type') and self.document_type is not None:
-            _dict['document_type'] = self.document_type
-        if hasattr(self, 'natural_language_query'
-                  ) and self.natural_language_query is not None:
-            _dict['natural_language_query'] = self.natural_language_query
-        if hasattr(self,
-                   'document_results') and self.document_results is not None:
-            _dict['document_results'] = self.document_results.to_dict()
-        if hasattr(self,
-                   'created_timestamp') and self.created_timestamp is not None:
-            _dict['created_timestamp'] = datetime_to_string(
-                self.created_timestamp)
-        if hasattr(self,
-                   'client_timestamp') and self.client_timestamp is not None:
-            _dict['client_timestamp'] = datetime_to_string(
-                self.client_timestamp)
-        if hasattr(self, 'query_id') and self.query_id is not None:
-            _dict['query_id'] = self.query_id
-        if hasattr(self, 'session_token') and self.session_token is not None:
-            _dict['session_token'] = self.session_token
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'display_rank') and self.display_rank is not None:
-            _dict['display_rank'] = self.display_rank
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'event_type') and self.event_type is not None:
-            _dict['event_type'] = self.event_type
-        if hasattr(self, 'result_type') and self.result_type is not None:
-            _dict['result_type'] = self.result_type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogQueryResponseResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogQueryResponseResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogQueryResponseResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class DocumentTypeEnum(str, Enum):
         """
         The type of log entry returned.
@@ -8000,7 +6191,7 @@ class LogQueryResponseResult():
         DOCUMENT = 'document'
 
 
-class LogQueryResponseResultDocuments():
+class LogQueryResponseResultDocuments(Model):
     """
     Object containing result information that was returned by the query used to create
     this log entry. Only returned with logs of type `query`.
@@ -8011,6 +6202,13 @@ class LogQueryResponseResultDocuments():
           associate with this log.
     """
 
+    __slots__ = ('results', 'count')
+
+    _fields = (
+        ModelField('results', 'list', 'LogQueryResponseResultDocumentsResult'),
+        ModelField('count'),
+    )
+
     def __init__(self,
                  *,
                  results: List['LogQueryResponseResultDocumentsResult'] = None,
@@ -8026,53 +6224,8 @@ class LogQueryResponseResultDocuments():
         self.results = results
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogQueryResponseResultDocuments':
-        """Initialize a LogQueryResponseResultDocuments object from a json dictionary."""
-        args = {}
-        if 'results' in _dict:
-            args['results'] = [
-                LogQueryResponseResultDocumentsResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogQueryResponseResultDocuments object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogQueryResponseResultDocuments object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogQueryResponseResultDocuments') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogQueryResponseResultDocuments') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class LogQueryResponseResultDocumentsResult():
+class LogQueryResponseResultDocumentsResult(Model):
     """
     Each object in the **results** array corresponds to an individual document returned by
     the original query.
@@ -8089,6 +6242,17 @@ class LogQueryResponseResultDocumentsResult():
           represented by this result.
     """
 
+    __slots__ = ('position', 'document_id', 'score', 'confidence',
+                 'collection_id')
+
+    _fields = (
+        ModelField('position'),
+        ModelField('document_id'),
+        ModelField('score'),
+        ModelField('confidence'),
+        ModelField('collection_id'),
+    )
+
     def __init__(self,
                  *,
                  position: int = None,
@@ -8116,62 +6280,8 @@ class LogQueryResponseResultDocumentsResult():
         self.confidence = confidence
         self.collection_id = collection_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LogQueryResponseResultDocumentsResult':
-        """Initialize a LogQueryResponseResultDocumentsResult object from a json dictionary."""
-        args = {}
-        if 'position' in _dict:
-            args['position'] = _dict.get('position')
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LogQueryResponseResultDocumentsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'position') and self.position is not None:
-            _dict['position'] = self.position
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LogQueryResponseResultDocumentsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LogQueryResponseResultDocumentsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LogQueryResponseResultDocumentsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MetricAggregation():
+class MetricAggregation(Model):
     """
     An aggregation analyzing log information for queries and events.
 
@@ -8183,6 +6293,14 @@ class MetricAggregation():
           aggregation query results.
     """
 
+    __slots__ = ('interval', 'event_type', 'results')
+
+    _fields = (
+        ModelField('interval'),
+        ModelField('event_type'),
+        ModelField('results', 'list', 'MetricAggregationResult'),
+    )
+
     def __init__(self,
                  *,
                  interval: str = None,
@@ -8202,57 +6320,8 @@ class MetricAggregation():
         self.event_type = event_type
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricAggregation':
-        """Initialize a MetricAggregation object from a json dictionary."""
-        args = {}
-        if 'interval' in _dict:
-            args['interval'] = _dict.get('interval')
-        if 'event_type' in _dict:
-            args['event_type'] = _dict.get('event_type')
-        if 'results' in _dict:
-            args['results'] = [
-                MetricAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'interval') and self.interval is not None:
-            _dict['interval'] = self.interval
-        if hasattr(self, 'event_type') and self.event_type is not None:
-            _dict['event_type'] = self.event_type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MetricAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'MetricAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MetricAggregationResult():
+class MetricAggregationResult(Model):
     """
     Aggregation result data for the requested metric.
 
@@ -8266,6 +6335,15 @@ class MetricAggregationResult():
           **event_rate** metrics.
     """
 
+    __slots__ = ('key_as_string', 'key', 'matching_results', 'event_rate')
+
+    _fields = (
+        ModelField('key_as_string', 'datetime'),
+        ModelField('key'),
+        ModelField('matching_results'),
+        ModelField('event_rate'),
+    )
+
     def __init__(self,
                  *,
                  key_as_string: datetime = None,
@@ -8289,60 +6367,8 @@ class MetricAggregationResult():
         self.matching_results = matching_results
         self.event_rate = event_rate
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricAggregationResult':
-        """Initialize a MetricAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key_as_string' in _dict:
-            args['key_as_string'] = string_to_datetime(
-                _dict.get('key_as_string'))
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'event_rate' in _dict:
-            args['event_rate'] = _dict.get('event_rate')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key_as_string') and self.key_as_string is not None:
-            _dict['key_as_string'] = datetime_to_string(self.key_as_string)
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'event_rate') and self.event_rate is not None:
-            _dict['event_rate'] = self.event_rate
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MetricAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MetricAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MetricResponse():
+class MetricResponse(Model):
     """
     The response generated from a call to a **metrics** method.
 
@@ -8350,6 +6376,12 @@ class MetricResponse():
           aggregations.
     """
 
+    __slots__ = ('aggregations',)
+
+    _fields = (
+        ModelField('aggregations', 'list', 'MetricAggregation'),
+    )
+
     def __init__(self,
                  *,
                  aggregations: List['MetricAggregation'] = None) -> None:
@@ -8361,49 +6393,8 @@ class MetricResponse():
         """
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricResponse':
-        """Initialize a MetricResponse object from a json dictionary."""
-        args = {}
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                MetricAggregation.from_dict(x)
-                for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MetricResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MetricResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MetricTokenAggregation():
+class MetricTokenAggregation(Model):
     """
     An aggregation analyzing log information for queries and events.
 
@@ -8413,6 +6404,13 @@ class MetricTokenAggregation():
           for the metric token aggregation.
     """
 
+    __slots__ = ('event_type', 'results')
+
+    _fields = (
+        ModelField('event_type'),
+        ModelField('results', 'list', 'MetricTokenAggregationResult'),
+    )
+
     def __init__(self,
                  *,
                  event_type: str = None,
@@ -8428,53 +6426,8 @@ class MetricTokenAggregation():
         self.event_type = event_type
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricTokenAggregation':
-        """Initialize a MetricTokenAggregation object from a json dictionary."""
-        args = {}
-        if 'event_type' in _dict:
-            args['event_type'] = _dict.get('event_type')
-        if 'results' in _dict:
-            args['results'] = [
-                MetricTokenAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricTokenAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'event_type') and self.event_type is not None:
-            _dict['event_type'] = self.event_type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricTokenAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MetricTokenAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MetricTokenAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class MetricTokenAggregationResult():
+class MetricTokenAggregationResult(Model):
     """
     Aggregation result data for the requested metric.
 
@@ -8486,6 +6439,14 @@ class MetricTokenAggregationResult():
           stored in the log for 30 days).
     """
 
+    __slots__ = ('key', 'matching_results', 'event_rate')
+
+    _fields = (
+        ModelField('key'),
+        ModelField('matching_results'),
+        ModelField('event_rate'),
+    )
+
     def __init__(self,
                  *,
                  key: str = None,
@@ -8505,55 +6466,8 @@ class MetricTokenAggregationResult():
         self.matching_results = matching_results
         self.event_rate = event_rate
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricTokenAggregationResult':
-        """Initialize a MetricTokenAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'event_rate' in _dict:
-            args['event_rate'] = _dict.get('event_rate')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricTokenAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'event_rate') and self.event_rate is not None:
-            _dict['event_rate'] = self.event_rate
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricTokenAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MetricTokenAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'MetricTokenAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MetricTokenResponse():
+class MetricTokenResponse(Model):
     """
     The response generated from a call to a **metrics** method that evaluates tokens.
 
@@ -8561,6 +6475,12 @@ class MetricTokenResponse():
           token aggregations.
     """
 
+    __slots__ = ('aggregations',)
+
+    _fields = (
+        ModelField('aggregations', 'list', 'MetricTokenAggregation'),
+    )
+
     def __init__(self,
                  *,
                  aggregations: List['MetricTokenAggregation'] = None) -> None:
@@ -8572,49 +6492,8 @@ class MetricTokenResponse():
         """
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetricTokenResponse':
-        """Initialize a MetricTokenResponse object from a json dictionary."""
-        args = {}
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                MetricTokenAggregation.from_dict(x)
-                for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetricTokenResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this MetricTokenResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'MetricTokenResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MetricTokenResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentConcepts():
+class NluEnrichmentConcepts(Model):
     """
     An object specifiying the concepts enrichment and related parameters.
 
@@ -8622,6 +6501,12 @@ class NluEnrichmentConcepts():
           from each instance of the specified field.
     """
 
+    __slots__ = ('limit',)
+
+    _fields = (
+        ModelField('limit'),
+    )
+
     def __init__(self, *, limit: int = None) -> None:
         """
         Initialize a NluEnrichmentConcepts object.
@@ -8631,46 +6516,8 @@ class NluEnrichmentConcepts():
         """
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentConcepts':
-        """Initialize a NluEnrichmentConcepts object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentConcepts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentConcepts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentConcepts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentConcepts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class NluEnrichmentEmotion():
+class NluEnrichmentEmotion(Model):
     """
     An object specifying the emotion detection enrichment and related parameters.
 
@@ -8680,6 +6527,13 @@ class NluEnrichmentEmotion():
           that will have any associated emotions detected.
     """
 
+    __slots__ = ('document', 'targets')
+
+    _fields = (
+        ModelField('document'),
+        ModelField('targets'),
+    )
+
     def __init__(self,
                  *,
                  document: bool = None,
@@ -8695,52 +6549,10 @@ class NluEnrichmentEmotion():
         self.document = document
         self.targets = targets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentEmotion':
-        """Initialize a NluEnrichmentEmotion object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = _dict.get('document')
-        if 'targets' in _dict:
-            args['targets'] = _dict.get('targets')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentEmotion object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = self.targets
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentEmotion object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'NluEnrichmentEmotion') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentEmotion') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentEntities():
-    """
-    An object speficying the Entities enrichment and related parameters.
+class NluEnrichmentEntities(Model):
+    """
+    An object speficying the Entities enrichment and related parameters.
 
     :attr bool sentiment: (optional) When `true`, sentiment analysis of entities
           will be performed on the specified field.
@@ -8760,6 +6572,19 @@ class NluEnrichmentEntities():
           model `alchemy`.
     """
 
+    __slots__ = ('sentiment', 'emotion', 'limit', 'mentions', 'mention_types',
+                 'sentence_locations', 'model')
+
+    _fields = (
+        ModelField('sentiment'),
+        ModelField('emotion'),
+        ModelField('limit'),
+        ModelField('mentions'),
+        ModelField('mention_types'),
+        ModelField('sentence_locations'),
+        ModelField('model'),
+    )
+
     def __init__(self,
                  *,
                  sentiment: bool = None,
@@ -8797,72 +6622,8 @@ class NluEnrichmentEntities():
         self.sentence_locations = sentence_locations
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentEntities':
-        """Initialize a NluEnrichmentEntities object from a json dictionary."""
-        args = {}
-        if 'sentiment' in _dict:
-            args['sentiment'] = _dict.get('sentiment')
-        if 'emotion' in _dict:
-            args['emotion'] = _dict.get('emotion')
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        if 'mentions' in _dict:
-            args['mentions'] = _dict.get('mentions')
-        if 'mention_types' in _dict:
-            args['mention_types'] = _dict.get('mention_types')
-        if 'sentence_locations' in _dict:
-            args['sentence_locations'] = _dict.get('sentence_locations')
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentEntities object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        if hasattr(self, 'mentions') and self.mentions is not None:
-            _dict['mentions'] = self.mentions
-        if hasattr(self, 'mention_types') and self.mention_types is not None:
-            _dict['mention_types'] = self.mention_types
-        if hasattr(
-                self,
-                'sentence_locations') and self.sentence_locations is not None:
-            _dict['sentence_locations'] = self.sentence_locations
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentEntities object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentEntities') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'NluEnrichmentEntities') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentFeatures():
+class NluEnrichmentFeatures(Model):
     """
     Object containing Natural Language Understanding features to be used.
 
@@ -8884,6 +6645,20 @@ class NluEnrichmentFeatures():
           concepts enrichment and related parameters.
     """
 
+    __slots__ = ('keywords', 'entities', 'sentiment', 'emotion', 'categories',
+                 'semantic_roles', 'relations', 'concepts')
+
+    _fields = (
+        ModelField('keywords', 'model', 'NluEnrichmentKeywords'),
+        ModelField('entities', 'model', 'NluEnrichmentEntities'),
+        ModelField('sentiment', 'model', 'NluEnrichmentSentiment'),
+        ModelField('emotion', 'model', 'NluEnrichmentEmotion'),
+        ModelField('categories'),
+        ModelField('semantic_roles', 'model', 'NluEnrichmentSemanticRoles'),
+        ModelField('relations', 'model', 'NluEnrichmentRelations'),
+        ModelField('concepts', 'model', 'NluEnrichmentConcepts'),
+    )
+
     def __init__(self,
                  *,
                  keywords: 'NluEnrichmentKeywords' = None,
@@ -8923,81 +6698,8 @@ class NluEnrichmentFeatures():
         self.relations = relations
         self.concepts = concepts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentFeatures':
-        """Initialize a NluEnrichmentFeatures object from a json dictionary."""
-        args = {}
-        if 'keywords' in _dict:
-            args['keywords'] = NluEnrichmentKeywords.from_dict(
-                _dict.get('keywords'))
-        if 'entities' in _dict:
-            args['entities'] = NluEnrichmentEntities.from_dict(
-                _dict.get('entities'))
-        if 'sentiment' in _dict:
-            args['sentiment'] = NluEnrichmentSentiment.from_dict(
-                _dict.get('sentiment'))
-        if 'emotion' in _dict:
-            args['emotion'] = NluEnrichmentEmotion.from_dict(
-                _dict.get('emotion'))
-        if 'categories' in _dict:
-            args['categories'] = _dict.get('categories')
-        if 'semantic_roles' in _dict:
-            args['semantic_roles'] = NluEnrichmentSemanticRoles.from_dict(
-                _dict.get('semantic_roles'))
-        if 'relations' in _dict:
-            args['relations'] = NluEnrichmentRelations.from_dict(
-                _dict.get('relations'))
-        if 'concepts' in _dict:
-            args['concepts'] = NluEnrichmentConcepts.from_dict(
-                _dict.get('concepts'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentFeatures object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = self.keywords.to_dict()
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = self.entities.to_dict()
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment.to_dict()
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = self.categories
-        if hasattr(self, 'semantic_roles') and self.semantic_roles is not None:
-            _dict['semantic_roles'] = self.semantic_roles.to_dict()
-        if hasattr(self, 'relations') and self.relations is not None:
-            _dict['relations'] = self.relations.to_dict()
-        if hasattr(self, 'concepts') and self.concepts is not None:
-            _dict['concepts'] = self.concepts.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentFeatures object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentFeatures') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentFeatures') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class NluEnrichmentKeywords():
+class NluEnrichmentKeywords(Model):
     """
     An object specifying the Keyword enrichment and related parameters.
 
@@ -9009,6 +6711,14 @@ class NluEnrichmentKeywords():
           instance of the specified field.
     """
 
+    __slots__ = ('sentiment', 'emotion', 'limit')
+
+    _fields = (
+        ModelField('sentiment'),
+        ModelField('emotion'),
+        ModelField('limit'),
+    )
+
     def __init__(self,
                  *,
                  sentiment: bool = None,
@@ -9028,54 +6738,8 @@ class NluEnrichmentKeywords():
         self.emotion = emotion
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentKeywords':
-        """Initialize a NluEnrichmentKeywords object from a json dictionary."""
-        args = {}
-        if 'sentiment' in _dict:
-            args['sentiment'] = _dict.get('sentiment')
-        if 'emotion' in _dict:
-            args['emotion'] = _dict.get('emotion')
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentKeywords object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentKeywords object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentKeywords') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'NluEnrichmentKeywords') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentRelations():
+class NluEnrichmentRelations(Model):
     """
     An object specifying the relations enrichment and related parameters.
 
@@ -9085,6 +6749,12 @@ class NluEnrichmentRelations():
           model is`en-news`.
     """
 
+    __slots__ = ('model',)
+
+    _fields = (
+        ModelField('model'),
+    )
+
     def __init__(self, *, model: str = None) -> None:
         """
         Initialize a NluEnrichmentRelations object.
@@ -9096,46 +6766,8 @@ class NluEnrichmentRelations():
         """
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentRelations':
-        """Initialize a NluEnrichmentRelations object from a json dictionary."""
-        args = {}
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentRelations object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentRelations object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'NluEnrichmentRelations') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentRelations') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentSemanticRoles():
+class NluEnrichmentSemanticRoles(Model):
     """
     An object specifiying the semantic roles enrichment and related parameters.
 
@@ -9147,6 +6779,14 @@ class NluEnrichmentSemanticRoles():
           extact from each instance of the specified field.
     """
 
+    __slots__ = ('entities', 'keywords', 'limit')
+
+    _fields = (
+        ModelField('entities'),
+        ModelField('keywords'),
+        ModelField('limit'),
+    )
+
     def __init__(self,
                  *,
                  entities: bool = None,
@@ -9166,54 +6806,8 @@ class NluEnrichmentSemanticRoles():
         self.keywords = keywords
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentSemanticRoles':
-        """Initialize a NluEnrichmentSemanticRoles object from a json dictionary."""
-        args = {}
-        if 'entities' in _dict:
-            args['entities'] = _dict.get('entities')
-        if 'keywords' in _dict:
-            args['keywords'] = _dict.get('keywords')
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentSemanticRoles object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = self.entities
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = self.keywords
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentSemanticRoles object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentSemanticRoles') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentSemanticRoles') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class NluEnrichmentSentiment():
+class NluEnrichmentSentiment(Model):
     """
     An object specifying the sentiment extraction enrichment and related parameters.
 
@@ -9223,6 +6817,13 @@ class NluEnrichmentSentiment():
           that will have any associated sentiment analyzed.
     """
 
+    __slots__ = ('document', 'targets')
+
+    _fields = (
+        ModelField('document'),
+        ModelField('targets'),
+    )
+
     def __init__(self,
                  *,
                  document: bool = None,
@@ -9238,50 +6839,8 @@ class NluEnrichmentSentiment():
         self.document = document
         self.targets = targets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NluEnrichmentSentiment':
-        """Initialize a NluEnrichmentSentiment object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = _dict.get('document')
-        if 'targets' in _dict:
-            args['targets'] = _dict.get('targets')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NluEnrichmentSentiment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = self.targets
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NluEnrichmentSentiment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NluEnrichmentSentiment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NluEnrichmentSentiment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class NormalizationOperation():
+class NormalizationOperation(Model):
     """
     Object containing normalization operations.
 
@@ -9314,6 +6873,14 @@ class NormalizationOperation():
     :attr str destination_field: (optional) The destination field for the operation.
     """
 
+    __slots__ = ('operation', 'source_field', 'destination_field')
+
+    _fields = (
+        ModelField('operation'),
+        ModelField('source_field'),
+        ModelField('destination_field'),
+    )
+
     def __init__(self,
                  *,
                  operation: str = None,
@@ -9357,53 +6924,6 @@ class NormalizationOperation():
         self.source_field = source_field
         self.destination_field = destination_field
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'NormalizationOperation':
-        """Initialize a NormalizationOperation object from a json dictionary."""
-        args = {}
-        if 'operation' in _dict:
-            args['operation'] = _dict.get('operation')
-        if 'source_field' in _dict:
-            args['source_field'] = _dict.get('source_field')
-        if 'destination_field' in _dict:
-            args['destination_field'] = _dict.get('destination_field')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a NormalizationOperation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'operation') and self.operation is not None:
-            _dict['operation'] = self.operation
-        if hasattr(self, 'source_field') and self.source_field is not None:
-            _dict['source_field'] = self.source_field
-        if hasattr(self,
-                   'destination_field') and self.destination_field is not None:
-            _dict['destination_field'] = self.destination_field
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this NormalizationOperation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'NormalizationOperation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'NormalizationOperation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class OperationEnum(str, Enum):
         """
         Identifies what type of operation to perform.
@@ -9438,7 +6958,7 @@ class NormalizationOperation():
         REMOVE_NULLS = 'remove_nulls'
 
 
-class Notice():
+class Notice(Model):
     """
     A notice produced for the collection.
 
@@ -9469,6 +6989,19 @@ class Notice():
     :attr str description: (optional) The description of the notice.
     """
 
+    __slots__ = ('notice_id', 'created', 'document_id', 'query_id', 'severity',
+                 'step', 'description')
+
+    _fields = (
+        ModelField('notice_id'),
+        ModelField('created', 'datetime'),
+        ModelField('document_id'),
+        ModelField('query_id'),
+        ModelField('severity'),
+        ModelField('step'),
+        ModelField('description'),
+    )
+
     def __init__(self,
                  *,
                  notice_id: str = None,
@@ -9490,71 +7023,6 @@ class Notice():
         self.step = step
         self.description = description
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Notice':
-        """Initialize a Notice object from a json dictionary."""
-        args = {}
-        if 'notice_id' in _dict:
-            args['notice_id'] = _dict.get('notice_id')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        if 'severity' in _dict:
-            args['severity'] = _dict.get('severity')
-        if 'step' in _dict:
-            args['step'] = _dict.get('step')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Notice object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'notice_id') and getattr(self,
-                                                  'notice_id') is not None:
-            _dict['notice_id'] = getattr(self, 'notice_id')
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'document_id') and getattr(self,
-                                                    'document_id') is not None:
-            _dict['document_id'] = getattr(self, 'document_id')
-        if hasattr(self, 'query_id') and getattr(self, 'query_id') is not None:
-            _dict['query_id'] = getattr(self, 'query_id')
-        if hasattr(self, 'severity') and getattr(self, 'severity') is not None:
-            _dict['severity'] = getattr(self, 'severity')
-        if hasattr(self, 'step') and getattr(self, 'step') is not None:
-            _dict['step'] = getattr(self, 'step')
-        if hasattr(self, 'description') and getattr(self,
-                                                    'description') is not None:
-            _dict['description'] = getattr(self, 'description')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Notice object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class SeverityEnum(str, Enum):
         """
         Severity level of the notice.
@@ -9563,13 +7031,19 @@ class Notice():
         ERROR = 'error'
 
 
-class PdfHeadingDetection():
+class PdfHeadingDetection(Model):
     """
     Object containing heading detection conversion settings for PDF documents.
 
     :attr List[FontSetting] fonts: (optional) Array of font matching configurations.
     """
 
+    __slots__ = ('fonts',)
+
+    _fields = (
+        ModelField('fonts', 'list', 'FontSetting'),
+    )
+
     def __init__(self, *, fonts: List['FontSetting'] = None) -> None:
         """
         Initialize a PdfHeadingDetection object.
@@ -9579,48 +7053,8 @@ class PdfHeadingDetection():
         """
         self.fonts = fonts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'PdfHeadingDetection':
-        """Initialize a PdfHeadingDetection object from a json dictionary."""
-        args = {}
-        if 'fonts' in _dict:
-            args['fonts'] = [
-                FontSetting.from_dict(x) for x in _dict.get('fonts')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a PdfHeadingDetection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'fonts') and self.fonts is not None:
-            _dict['fonts'] = [x.to_dict() for x in self.fonts]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this PdfHeadingDetection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'PdfHeadingDetection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'PdfHeadingDetection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class PdfSettings():
+class PdfSettings(Model):
     """
     A list of PDF conversion settings.
 
@@ -9628,6 +7062,12 @@ class PdfSettings():
           detection conversion settings for PDF documents.
     """
 
+    __slots__ = ('heading',)
+
+    _fields = (
+        ModelField('heading', 'model', 'PdfHeadingDetection'),
+    )
+
     def __init__(self, *, heading: 'PdfHeadingDetection' = None) -> None:
         """
         Initialize a PdfSettings object.
@@ -9637,47 +7077,8 @@ class PdfSettings():
         """
         self.heading = heading
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'PdfSettings':
-        """Initialize a PdfSettings object from a json dictionary."""
-        args = {}
-        if 'heading' in _dict:
-            args['heading'] = PdfHeadingDetection.from_dict(
-                _dict.get('heading'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a PdfSettings object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'heading') and self.heading is not None:
-            _dict['heading'] = self.heading.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this PdfSettings object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'PdfSettings') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'PdfSettings') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryAggregation():
+class QueryAggregation(Model):
     """
     An aggregation produced by  Discovery to analyze the input provided.
 
@@ -9689,6 +7090,30 @@ class QueryAggregation():
           Discovery.
     """
 
+    __slots__ = ('type', 'results', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
+    _discriminator = ModelDiscriminator(
+        'type', {
+            'histogram': 'Histogram',
+            'max': 'Calculation',
+            'min': 'Calculation',
+            'average': 'Calculation',
+            'sum': 'Calculation',
+            'unique_count': 'Calculation',
+            'term': 'Term',
+            'filter': 'Filter',
+            'nested': 'Nested',
+            'timeslice': 'Timeslice',
+            'top_hits': 'TopHits'
+        })
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -9711,94 +7136,8 @@ class QueryAggregation():
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryAggregation':
-        """Initialize a QueryAggregation object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping['histogram'] = 'Histogram'
-        mapping['max'] = 'Calculation'
-        mapping['min'] = 'Calculation'
-        mapping['average'] = 'Calculation'
-        mapping['sum'] = 'Calculation'
-        mapping['unique_count'] = 'Calculation'
-        mapping['term'] = 'Term'
-        mapping['filter'] = 'Filter'
-        mapping['nested'] = 'Nested'
-        mapping['timeslice'] = 'Timeslice'
-        mapping['top_hits'] = 'TopHits'
-        disc_value = _dict.get('type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'type\' not found in QueryAggregation JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class QueryNoticesResponse():
+class QueryNoticesResponse(Model):
     """
     Object containing notice query results.
 
@@ -9813,6 +7152,17 @@ class QueryNoticesResponse():
           this notices query.
     """
 
+    __slots__ = ('matching_results', 'results', 'aggregations', 'passages',
+                 'duplicates_removed')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('results', 'list', 'QueryNoticesResult'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('passages', 'list', 'QueryPassages'),
+        ModelField('duplicates_removed'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -9839,71 +7189,8 @@ class QueryNoticesResponse():
         self.passages = passages
         self.duplicates_removed = duplicates_removed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryNoticesResponse':
-        """Initialize a QueryNoticesResponse object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryNoticesResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'passages' in _dict:
-            args['passages'] = [
-                QueryPassages.from_dict(x) for x in _dict.get('passages')
-            ]
-        if 'duplicates_removed' in _dict:
-            args['duplicates_removed'] = _dict.get('duplicates_removed')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryNoticesResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'passages') and self.passages is not None:
-            _dict['passages'] = [x.to_dict() for x in self.passages]
-        if hasattr(
-                self,
-                'duplicates_removed') and self.duplicates_removed is not None:
-            _dict['duplicates_removed'] = self.duplicates_removed
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryNoticesResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryNoticesResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryNoticesResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryNoticesResult():
+class QueryNoticesResult(Model):
     """
     Query result object.
 
@@ -9922,6 +7209,20 @@ class QueryNoticesResult():
     :attr List[Notice] notices: (optional) Array of notices for the document.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('id'),
+        ModelField('metadata'),
+        ModelField('collection_id'),
+        ModelField('result_metadata', 'model', 'QueryResultMetadata'),
+        ModelField('code'),
+        ModelField('filename'),
+        ModelField('file_type'),
+        ModelField('sha1'),
+        ModelField('notices', 'list', 'Notice'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset([
         'id', 'metadata', 'collection_id', 'result_metadata', 'code',
@@ -9972,74 +7273,6 @@ class QueryNoticesResult():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryNoticesResult':
-        """Initialize a QueryNoticesResult object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'result_metadata' in _dict:
-            args['result_metadata'] = QueryResultMetadata.from_dict(
-                _dict.get('result_metadata'))
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        if 'filename' in _dict:
-            args['filename'] = _dict.get('filename')
-        if 'file_type' in _dict:
-            args['file_type'] = _dict.get('file_type')
-        if 'sha1' in _dict:
-            args['sha1'] = _dict.get('sha1')
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryNoticesResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self,
-                   'result_metadata') and self.result_metadata is not None:
-            _dict['result_metadata'] = self.result_metadata.to_dict()
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'filename') and self.filename is not None:
-            _dict['filename'] = self.filename
-        if hasattr(self, 'file_type') and self.file_type is not None:
-            _dict['file_type'] = self.file_type
-        if hasattr(self, 'sha1') and self.sha1 is not None:
-            _dict['sha1'] = self.sha1
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in QueryNoticesResult._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of QueryNoticesResult"""
         _dict = {}
@@ -10063,20 +7296,6 @@ class QueryNoticesResult():
             if _key not in QueryNoticesResult._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryNoticesResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryNoticesResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryNoticesResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class FileTypeEnum(str, Enum):
         """
         The type of the original source file.
@@ -10087,7 +7306,7 @@ class QueryNoticesResult():
         JSON = 'json'
 
 
-class QueryPassages():
+class QueryPassages(Model):
     """
     A passage query result.
 
@@ -10104,6 +7323,18 @@ class QueryPassages():
           been extracted.
     """
 
+    __slots__ = ('document_id', 'passage_score', 'passage_text', 'start_offset',
+                 'end_offset', 'field')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('passage_score'),
+        ModelField('passage_text'),
+        ModelField('start_offset'),
+        ModelField('end_offset'),
+        ModelField('field'),
+    )
+
     def __init__(self,
                  *,
                  document_id: str = None,
@@ -10134,66 +7365,8 @@ class QueryPassages():
         self.end_offset = end_offset
         self.field = field
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryPassages':
-        """Initialize a QueryPassages object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'passage_score' in _dict:
-            args['passage_score'] = _dict.get('passage_score')
-        if 'passage_text' in _dict:
-            args['passage_text'] = _dict.get('passage_text')
-        if 'start_offset' in _dict:
-            args['start_offset'] = _dict.get('start_offset')
-        if 'end_offset' in _dict:
-            args['end_offset'] = _dict.get('end_offset')
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryPassages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'passage_score') and self.passage_score is not None:
-            _dict['passage_score'] = self.passage_score
-        if hasattr(self, 'passage_text') and self.passage_text is not None:
-            _dict['passage_text'] = self.passage_text
-        if hasattr(self, 'start_offset') and self.start_offset is not None:
-            _dict['start_offset'] = self.start_offset
-        if hasattr(self, 'end_offset') and self.end_offset is not None:
-            _dict['end_offset'] = self.end_offset
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryPassages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryPassages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryPassages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryResponse():
+class QueryResponse(Model):
     """
     A response containing the documents and aggregations for the query.
 
@@ -10217,6 +7390,21 @@ class QueryResponse():
           language query.
     """
 
+    __slots__ = ('matching_results', 'results', 'aggregations', 'passages',
+                 'duplicates_removed', 'session_token', 'retrieval_details',
+                 'suggested_query')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('results', 'list', 'QueryResult'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('passages', 'list', 'QueryPassages'),
+        ModelField('duplicates_removed'),
+        ModelField('session_token'),
+        ModelField('retrieval_details', 'model', 'RetrievalDetails'),
+        ModelField('suggested_query'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -10258,86 +7446,8 @@ class QueryResponse():
         self.retrieval_details = retrieval_details
         self.suggested_query = suggested_query
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResponse':
-        """Initialize a QueryResponse object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'passages' in _dict:
-            args['passages'] = [
-                QueryPassages.from_dict(x) for x in _dict.get('passages')
-            ]
-        if 'duplicates_removed' in _dict:
-            args['duplicates_removed'] = _dict.get('duplicates_removed')
-        if 'session_token' in _dict:
-            args['session_token'] = _dict.get('session_token')
-        if 'retrieval_details' in _dict:
-            args['retrieval_details'] = RetrievalDetails.from_dict(
-                _dict.get('retrieval_details'))
-        if 'suggested_query' in _dict:
-            args['suggested_query'] = _dict.get('suggested_query')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'passages') and self.passages is not None:
-            _dict['passages'] = [x.to_dict() for x in self.passages]
-        if hasattr(
-                self,
-                'duplicates_removed') and self.duplicates_removed is not None:
-            _dict['duplicates_removed'] = self.duplicates_removed
-        if hasattr(self, 'session_token') and self.session_token is not None:
-            _dict['session_token'] = self.session_token
-        if hasattr(self,
-                   'retrieval_details') and self.retrieval_details is not None:
-            _dict['retrieval_details'] = self.retrieval_details.to_dict()
-        if hasattr(self,
-                   'suggested_query') and self.suggested_query is not None:
-            _dict['suggested_query'] = self.suggested_query
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'QueryResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryResult():
+class QueryResult(Model):
     """
     Query result object.
 
@@ -10349,6 +7459,15 @@ class QueryResult():
           result.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('id'),
+        ModelField('metadata'),
+        ModelField('collection_id'),
+        ModelField('result_metadata', 'model', 'QueryResultMetadata'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(
         ['id', 'metadata', 'collection_id', 'result_metadata'])
@@ -10378,51 +7497,6 @@ class QueryResult():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResult':
-        """Initialize a QueryResult object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'result_metadata' in _dict:
-            args['result_metadata'] = QueryResultMetadata.from_dict(
-                _dict.get('result_metadata'))
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self,
-                   'result_metadata') and self.result_metadata is not None:
-            _dict['result_metadata'] = self.result_metadata.to_dict()
-        for _key in [
-                k for k in vars(self).keys() if k not in QueryResult._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of QueryResult"""
         _dict = {}
@@ -10444,22 +7518,8 @@ class QueryResult():
             if _key not in QueryResult._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class QueryResultMetadata():
+class QueryResultMetadata(Model):
     """
     Metadata of a query result.
 
@@ -10473,6 +7533,13 @@ class QueryResultMetadata():
           specified in the `document_retrieval_strategy` field of the result set.
     """
 
+    __slots__ = ('score', 'confidence')
+
+    _fields = (
+        ModelField('score', required=True),
+        ModelField('confidence'),
+    )
+
     def __init__(self, score: float, *, confidence: float = None) -> None:
         """
         Initialize a QueryResultMetadata object.
@@ -10490,54 +7557,8 @@ class QueryResultMetadata():
         self.score = score
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResultMetadata':
-        """Initialize a QueryResultMetadata object from a json dictionary."""
-        args = {}
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in QueryResultMetadata JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResultMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResultMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResultMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResultMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RetrievalDetails():
+class RetrievalDetails(Model):
     """
     An object contain retrieval type information.
 
@@ -10552,6 +7573,12 @@ class RetrievalDetails():
           listed as `untrained`.
     """
 
+    __slots__ = ('document_retrieval_strategy',)
+
+    _fields = (
+        ModelField('document_retrieval_strategy'),
+    )
+
     def __init__(self, *, document_retrieval_strategy: str = None) -> None:
         """
         Initialize a RetrievalDetails object.
@@ -10569,47 +7596,6 @@ class RetrievalDetails():
         """
         self.document_retrieval_strategy = document_retrieval_strategy
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RetrievalDetails':
-        """Initialize a RetrievalDetails object from a json dictionary."""
-        args = {}
-        if 'document_retrieval_strategy' in _dict:
-            args['document_retrieval_strategy'] = _dict.get(
-                'document_retrieval_strategy')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RetrievalDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_retrieval_strategy'
-                  ) and self.document_retrieval_strategy is not None:
-            _dict[
-                'document_retrieval_strategy'] = self.document_retrieval_strategy
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RetrievalDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RetrievalDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RetrievalDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class DocumentRetrievalStrategyEnum(str, Enum):
         """
         Indentifies the document retrieval strategy used for this query.
@@ -10627,7 +7613,7 @@ class RetrievalDetails():
         CONTINUOUS_RELEVANCY_TRAINING = 'continuous_relevancy_training'
 
 
-class SduStatus():
+class SduStatus(Model):
     """
     Object containing smart document understanding information for this collection.
 
@@ -10654,6 +7640,17 @@ class SduStatus():
           smart document understanding fields that exist in this collection.
     """
 
+    __slots__ = ('enabled', 'total_annotated_pages', 'total_pages',
+                 'total_documents', 'custom_fields')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('total_annotated_pages'),
+        ModelField('total_pages'),
+        ModelField('total_documents'),
+        ModelField('custom_fields', 'model', 'SduStatusCustomFields'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -10692,65 +7689,8 @@ class SduStatus():
         self.total_documents = total_documents
         self.custom_fields = custom_fields
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SduStatus':
-        """Initialize a SduStatus object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'total_annotated_pages' in _dict:
-            args['total_annotated_pages'] = _dict.get('total_annotated_pages')
-        if 'total_pages' in _dict:
-            args['total_pages'] = _dict.get('total_pages')
-        if 'total_documents' in _dict:
-            args['total_documents'] = _dict.get('total_documents')
-        if 'custom_fields' in _dict:
-            args['custom_fields'] = SduStatusCustomFields.from_dict(
-                _dict.get('custom_fields'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SduStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'total_annotated_pages'
-                  ) and self.total_annotated_pages is not None:
-            _dict['total_annotated_pages'] = self.total_annotated_pages
-        if hasattr(self, 'total_pages') and self.total_pages is not None:
-            _dict['total_pages'] = self.total_pages
-        if hasattr(self,
-                   'total_documents') and self.total_documents is not None:
-            _dict['total_documents'] = self.total_documents
-        if hasattr(self, 'custom_fields') and self.custom_fields is not None:
-            _dict['custom_fields'] = self.custom_fields.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SduStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SduStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'SduStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SduStatusCustomFields():
+class SduStatusCustomFields(Model):
     """
     Information about custom smart document understanding fields that exist in this
     collection.
@@ -10761,6 +7701,13 @@ class SduStatusCustomFields():
           are allowed in this collection.
     """
 
+    __slots__ = ('defined', 'maximum_allowed')
+
+    _fields = (
+        ModelField('defined'),
+        ModelField('maximum_allowed'),
+    )
+
     def __init__(self,
                  *,
                  defined: int = None,
@@ -10776,51 +7723,8 @@ class SduStatusCustomFields():
         self.defined = defined
         self.maximum_allowed = maximum_allowed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SduStatusCustomFields':
-        """Initialize a SduStatusCustomFields object from a json dictionary."""
-        args = {}
-        if 'defined' in _dict:
-            args['defined'] = _dict.get('defined')
-        if 'maximum_allowed' in _dict:
-            args['maximum_allowed'] = _dict.get('maximum_allowed')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SduStatusCustomFields object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'defined') and self.defined is not None:
-            _dict['defined'] = self.defined
-        if hasattr(self,
-                   'maximum_allowed') and self.maximum_allowed is not None:
-            _dict['maximum_allowed'] = self.maximum_allowed
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SduStatusCustomFields object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'SduStatusCustomFields') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SduStatusCustomFields') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SearchStatus():
+class SearchStatus(Model):
     """
     Information about the Continuous Relevancy Training for this environment.
 
@@ -10834,6 +7738,15 @@ class SearchStatus():
           training for this environment.
     """
 
+    __slots__ = ('scope', 'status', 'status_description', 'last_trained')
+
+    _fields = (
+        ModelField('scope'),
+        ModelField('status'),
+        ModelField('status_description'),
+        ModelField('last_trained', 'date'),
+    )
+
     def __init__(self,
                  *,
                  scope: str = None,
@@ -10857,58 +7770,6 @@ class SearchStatus():
         self.status_description = status_description
         self.last_trained = last_trained
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SearchStatus':
-        """Initialize a SearchStatus object from a json dictionary."""
-        args = {}
-        if 'scope' in _dict:
-            args['scope'] = _dict.get('scope')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'status_description' in _dict:
-            args['status_description'] = _dict.get('status_description')
-        if 'last_trained' in _dict:
-            args['last_trained'] = string_to_date(_dict.get('last_trained'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SearchStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'scope') and self.scope is not None:
-            _dict['scope'] = self.scope
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(
-                self,
-                'status_description') and self.status_description is not None:
-            _dict['status_description'] = self.status_description
-        if hasattr(self, 'last_trained') and self.last_trained is not None:
-            _dict['last_trained'] = date_to_string(self.last_trained)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SearchStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SearchStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SearchStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of Continuous Relevancy Training for this environment.
@@ -10920,7 +7781,7 @@ class SearchStatus():
         NOT_APPLICABLE = 'NOT_APPLICABLE'
 
 
-class SegmentSettings():
+class SegmentSettings(Model):
     """
     A list of Document Segmentation settings.
 
@@ -10943,6 +7804,14 @@ class SegmentSettings():
           `true` in the **smart_document_understanding** object.
     """
 
+    __slots__ = ('enabled', 'selector_tags', 'annotated_fields')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('selector_tags'),
+        ModelField('annotated_fields'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -10975,55 +7844,8 @@ class SegmentSettings():
         self.selector_tags = selector_tags
         self.annotated_fields = annotated_fields
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SegmentSettings':
-        """Initialize a SegmentSettings object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'selector_tags' in _dict:
-            args['selector_tags'] = _dict.get('selector_tags')
-        if 'annotated_fields' in _dict:
-            args['annotated_fields'] = _dict.get('annotated_fields')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SegmentSettings object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'selector_tags') and self.selector_tags is not None:
-            _dict['selector_tags'] = self.selector_tags
-        if hasattr(self,
-                   'annotated_fields') and self.annotated_fields is not None:
-            _dict['annotated_fields'] = self.annotated_fields
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SegmentSettings object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SegmentSettings') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SegmentSettings') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class Source():
+class Source(Model):
     """
     Object containing source parameters for the configuration.
 
@@ -11046,6 +7868,15 @@ class Source():
           items to crawl from the source system.
     """
 
+    __slots__ = ('type', 'credential_id', 'schedule', 'options')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('credential_id'),
+        ModelField('schedule', 'model', 'SourceSchedule'),
+        ModelField('options', 'model', 'SourceOptions'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -11078,56 +7909,6 @@ class Source():
         self.schedule = schedule
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Source':
-        """Initialize a Source object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'credential_id' in _dict:
-            args['credential_id'] = _dict.get('credential_id')
-        if 'schedule' in _dict:
-            args['schedule'] = SourceSchedule.from_dict(_dict.get('schedule'))
-        if 'options' in _dict:
-            args['options'] = SourceOptions.from_dict(_dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Source object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'credential_id') and self.credential_id is not None:
-            _dict['credential_id'] = self.credential_id
-        if hasattr(self, 'schedule') and self.schedule is not None:
-            _dict['schedule'] = self.schedule.to_dict()
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Source object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Source') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Source') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of source to connect to.
@@ -11146,7 +7927,7 @@ class Source():
         CLOUD_OBJECT_STORAGE = 'cloud_object_storage'
 
 
-class SourceOptions():
+class SourceOptions(Model):
     """
     The **options** object defines which items to crawl from the source system.
 
@@ -11172,6 +7953,18 @@ class SourceOptions():
           array must not be specified.
     """
 
+    __slots__ = ('folders', 'objects', 'site_collections', 'urls', 'buckets',
+                 'crawl_all_buckets')
+
+    _fields = (
+        ModelField('folders', 'list', 'SourceOptionsFolder'),
+        ModelField('objects', 'list', 'SourceOptionsObject'),
+        ModelField('site_collections', 'list', 'SourceOptionsSiteColl'),
+        ModelField('urls', 'list', 'SourceOptionsWebCrawl'),
+        ModelField('buckets', 'list', 'SourceOptionsBuckets'),
+        ModelField('crawl_all_buckets'),
+    )
+
     def __init__(self,
                  *,
                  folders: List['SourceOptionsFolder'] = None,
@@ -11212,81 +8005,8 @@ class SourceOptions():
         self.buckets = buckets
         self.crawl_all_buckets = crawl_all_buckets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptions':
-        """Initialize a SourceOptions object from a json dictionary."""
-        args = {}
-        if 'folders' in _dict:
-            args['folders'] = [
-                SourceOptionsFolder.from_dict(x) for x in _dict.get('folders')
-            ]
-        if 'objects' in _dict:
-            args['objects'] = [
-                SourceOptionsObject.from_dict(x) for x in _dict.get('objects')
-            ]
-        if 'site_collections' in _dict:
-            args['site_collections'] = [
-                SourceOptionsSiteColl.from_dict(x)
-                for x in _dict.get('site_collections')
-            ]
-        if 'urls' in _dict:
-            args['urls'] = [
-                SourceOptionsWebCrawl.from_dict(x) for x in _dict.get('urls')
-            ]
-        if 'buckets' in _dict:
-            args['buckets'] = [
-                SourceOptionsBuckets.from_dict(x) for x in _dict.get('buckets')
-            ]
-        if 'crawl_all_buckets' in _dict:
-            args['crawl_all_buckets'] = _dict.get('crawl_all_buckets')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'folders') and self.folders is not None:
-            _dict['folders'] = [x.to_dict() for x in self.folders]
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = [x.to_dict() for x in self.objects]
-        if hasattr(self,
-                   'site_collections') and self.site_collections is not None:
-            _dict['site_collections'] = [
-                x.to_dict() for x in self.site_collections
-            ]
-        if hasattr(self, 'urls') and self.urls is not None:
-            _dict['urls'] = [x.to_dict() for x in self.urls]
-        if hasattr(self, 'buckets') and self.buckets is not None:
-            _dict['buckets'] = [x.to_dict() for x in self.buckets]
-        if hasattr(self,
-                   'crawl_all_buckets') and self.crawl_all_buckets is not None:
-            _dict['crawl_all_buckets'] = self.crawl_all_buckets
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'SourceOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SourceOptionsBuckets():
+class SourceOptionsBuckets(Model):
     """
     Object defining a cloud object store bucket to crawl.
 
@@ -11295,6 +8015,13 @@ class SourceOptionsBuckets():
           object store bucket. If not specified, all documents in the bucket are crawled.
     """
 
+    __slots__ = ('name', 'limit')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('limit'),
+    )
+
     def __init__(self, name: str, *, limit: int = None) -> None:
         """
         Initialize a SourceOptionsBuckets object.
@@ -11307,54 +8034,8 @@ class SourceOptionsBuckets():
         self.name = name
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptionsBuckets':
-        """Initialize a SourceOptionsBuckets object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in SourceOptionsBuckets JSON'
-            )
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptionsBuckets object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptionsBuckets object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SourceOptionsBuckets') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptionsBuckets') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class SourceOptionsFolder():
+class SourceOptionsFolder(Model):
     """
     Object that defines a box folder to crawl with this configuration.
 
@@ -11365,6 +8046,14 @@ class SourceOptionsFolder():
           folder. By default, all documents in the folder are crawled.
     """
 
+    __slots__ = ('owner_user_id', 'folder_id', 'limit')
+
+    _fields = (
+        ModelField('owner_user_id', required=True),
+        ModelField('folder_id', required=True),
+        ModelField('limit'),
+    )
+
     def __init__(self,
                  owner_user_id: str,
                  folder_id: str,
@@ -11383,62 +8072,8 @@ class SourceOptionsFolder():
         self.folder_id = folder_id
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptionsFolder':
-        """Initialize a SourceOptionsFolder object from a json dictionary."""
-        args = {}
-        if 'owner_user_id' in _dict:
-            args['owner_user_id'] = _dict.get('owner_user_id')
-        else:
-            raise ValueError(
-                'Required property \'owner_user_id\' not present in SourceOptionsFolder JSON'
-            )
-        if 'folder_id' in _dict:
-            args['folder_id'] = _dict.get('folder_id')
-        else:
-            raise ValueError(
-                'Required property \'folder_id\' not present in SourceOptionsFolder JSON'
-            )
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptionsFolder object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'owner_user_id') and self.owner_user_id is not None:
-            _dict['owner_user_id'] = self.owner_user_id
-        if hasattr(self, 'folder_id') and self.folder_id is not None:
-            _dict['folder_id'] = self.folder_id
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptionsFolder object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'SourceOptionsFolder') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptionsFolder') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SourceOptionsObject():
+class SourceOptionsObject(Model):
     """
     Object that defines a Salesforce document object type crawl with this configuration.
 
@@ -11448,6 +8083,13 @@ class SourceOptionsObject():
           document object. By default, all documents in the document object are crawled.
     """
 
+    __slots__ = ('name', 'limit')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('limit'),
+    )
+
     def __init__(self, name: str, *, limit: int = None) -> None:
         """
         Initialize a SourceOptionsObject object.
@@ -11461,54 +8103,8 @@ class SourceOptionsObject():
         self.name = name
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptionsObject':
-        """Initialize a SourceOptionsObject object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in SourceOptionsObject JSON'
-            )
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptionsObject object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptionsObject object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SourceOptionsObject') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptionsObject') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class SourceOptionsSiteColl():
+class SourceOptionsSiteColl(Model):
     """
     Object that defines a Microsoft SharePoint site collection to crawl with this
     configuration.
@@ -11520,6 +8116,13 @@ class SourceOptionsSiteColl():
           site collection. By default, all documents in the site collection are crawled.
     """
 
+    __slots__ = ('site_collection_path', 'limit')
+
+    _fields = (
+        ModelField('site_collection_path', required=True),
+        ModelField('limit'),
+    )
+
     def __init__(self, site_collection_path: str, *, limit: int = None) -> None:
         """
         Initialize a SourceOptionsSiteColl object.
@@ -11535,55 +8138,8 @@ class SourceOptionsSiteColl():
         self.site_collection_path = site_collection_path
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptionsSiteColl':
-        """Initialize a SourceOptionsSiteColl object from a json dictionary."""
-        args = {}
-        if 'site_collection_path' in _dict:
-            args['site_collection_path'] = _dict.get('site_collection_path')
-        else:
-            raise ValueError(
-                'Required property \'site_collection_path\' not present in SourceOptionsSiteColl JSON'
-            )
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptionsSiteColl object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'site_collection_path'
-                  ) and self.site_collection_path is not None:
-            _dict['site_collection_path'] = self.site_collection_path
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptionsSiteColl object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'SourceOptionsSiteColl') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptionsSiteColl') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SourceOptionsWebCrawl():
+class SourceOptionsWebCrawl(Model):
     """
     Object defining which URL to crawl and how to crawl it.
 
@@ -11614,6 +8170,21 @@ class SourceOptionsWebCrawl():
           `https://ibm.com/watson/discovery`.
     """
 
+    __slots__ = ('url', 'limit_to_starting_hosts', 'crawl_speed',
+                 'allow_untrusted_certificate', 'maximum_hops',
+                 'request_timeout', 'override_robots_txt', 'blacklist')
+
+    _fields = (
+        ModelField('url', required=True),
+        ModelField('limit_to_starting_hosts'),
+        ModelField('crawl_speed'),
+        ModelField('allow_untrusted_certificate'),
+        ModelField('maximum_hops'),
+        ModelField('request_timeout'),
+        ModelField('override_robots_txt'),
+        ModelField('blacklist'),
+    )
+
     def __init__(self,
                  url: str,
                  *,
@@ -11663,84 +8234,6 @@ class SourceOptionsWebCrawl():
         self.override_robots_txt = override_robots_txt
         self.blacklist = blacklist
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceOptionsWebCrawl':
-        """Initialize a SourceOptionsWebCrawl object from a json dictionary."""
-        args = {}
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in SourceOptionsWebCrawl JSON'
-            )
-        if 'limit_to_starting_hosts' in _dict:
-            args['limit_to_starting_hosts'] = _dict.get(
-                'limit_to_starting_hosts')
-        if 'crawl_speed' in _dict:
-            args['crawl_speed'] = _dict.get('crawl_speed')
-        if 'allow_untrusted_certificate' in _dict:
-            args['allow_untrusted_certificate'] = _dict.get(
-                'allow_untrusted_certificate')
-        if 'maximum_hops' in _dict:
-            args['maximum_hops'] = _dict.get('maximum_hops')
-        if 'request_timeout' in _dict:
-            args['request_timeout'] = _dict.get('request_timeout')
-        if 'override_robots_txt' in _dict:
-            args['override_robots_txt'] = _dict.get('override_robots_txt')
-        if 'blacklist' in _dict:
-            args['blacklist'] = _dict.get('blacklist')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceOptionsWebCrawl object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'limit_to_starting_hosts'
-                  ) and self.limit_to_starting_hosts is not None:
-            _dict['limit_to_starting_hosts'] = self.limit_to_starting_hosts
-        if hasattr(self, 'crawl_speed') and self.crawl_speed is not None:
-            _dict['crawl_speed'] = self.crawl_speed
-        if hasattr(self, 'allow_untrusted_certificate'
-                  ) and self.allow_untrusted_certificate is not None:
-            _dict[
-                'allow_untrusted_certificate'] = self.allow_untrusted_certificate
-        if hasattr(self, 'maximum_hops') and self.maximum_hops is not None:
-            _dict['maximum_hops'] = self.maximum_hops
-        if hasattr(self,
-                   'request_timeout') and self.request_timeout is not None:
-            _dict['request_timeout'] = self.request_timeout
-        if hasattr(
-                self,
-                'override_robots_txt') and self.override_robots_txt is not None:
-            _dict['override_robots_txt'] = self.override_robots_txt
-        if hasattr(self, 'blacklist') and self.blacklist is not None:
-            _dict['blacklist'] = self.blacklist
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceOptionsWebCrawl object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SourceOptionsWebCrawl') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceOptionsWebCrawl') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CrawlSpeedEnum(str, Enum):
         """
         The number of concurrent URLs to fetch. `gentle` means one URL is fetched at a
@@ -11754,7 +8247,7 @@ class SourceOptionsWebCrawl():
         AGGRESSIVE = 'aggressive'
 
 
-class SourceSchedule():
+class SourceSchedule(Model):
     """
     Object containing the schedule information for the source.
 
@@ -11775,6 +8268,14 @@ class SourceSchedule():
           06:00.
     """
 
+    __slots__ = ('enabled', 'time_zone', 'frequency')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('time_zone'),
+        ModelField('frequency'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -11803,52 +8304,6 @@ class SourceSchedule():
         self.time_zone = time_zone
         self.frequency = frequency
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceSchedule':
-        """Initialize a SourceSchedule object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'time_zone' in _dict:
-            args['time_zone'] = _dict.get('time_zone')
-        if 'frequency' in _dict:
-            args['frequency'] = _dict.get('frequency')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceSchedule object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'time_zone') and self.time_zone is not None:
-            _dict['time_zone'] = self.time_zone
-        if hasattr(self, 'frequency') and self.frequency is not None:
-            _dict['frequency'] = self.frequency
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceSchedule object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SourceSchedule') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceSchedule') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class FrequencyEnum(str, Enum):
         """
         The crawl schedule in the specified **time_zone**.
@@ -11865,7 +8320,7 @@ class SourceSchedule():
         HOURLY = 'hourly'
 
 
-class SourceStatus():
+class SourceStatus(Model):
     """
     Object containing source crawl status information.
 
@@ -11881,6 +8336,13 @@ class SourceStatus():
           time of the next crawl attempt.
     """
 
+    __slots__ = ('status', 'next_crawl')
+
+    _fields = (
+        ModelField('status'),
+        ModelField('next_crawl', 'datetime'),
+    )
+
     def __init__(self,
                  *,
                  status: str = None,
@@ -11903,48 +8365,6 @@ class SourceStatus():
         self.status = status
         self.next_crawl = next_crawl
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SourceStatus':
-        """Initialize a SourceStatus object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'next_crawl' in _dict:
-            args['next_crawl'] = string_to_datetime(_dict.get('next_crawl'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SourceStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'next_crawl') and self.next_crawl is not None:
-            _dict['next_crawl'] = datetime_to_string(self.next_crawl)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SourceStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SourceStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SourceStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the source crawl for this collection. This field returns
@@ -11963,7 +8383,7 @@ class SourceStatus():
         UNKNOWN = 'unknown'
 
 
-class StatusDetails():
+class StatusDetails(Model):
     """
     Object that contains details about the status of the authentication process.
 
@@ -11973,6 +8393,13 @@ class StatusDetails():
           describes why the authentication was unsuccessful.
     """
 
+    __slots__ = ('authenticated', 'error_message')
+
+    _fields = (
+        ModelField('authenticated'),
+        ModelField('error_message'),
+    )
+
     def __init__(self,
                  *,
                  authenticated: bool = None,
@@ -11988,50 +8415,8 @@ class StatusDetails():
         self.authenticated = authenticated
         self.error_message = error_message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'StatusDetails':
-        """Initialize a StatusDetails object from a json dictionary."""
-        args = {}
-        if 'authenticated' in _dict:
-            args['authenticated'] = _dict.get('authenticated')
-        if 'error_message' in _dict:
-            args['error_message'] = _dict.get('error_message')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a StatusDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'authenticated') and self.authenticated is not None:
-            _dict['authenticated'] = self.authenticated
-        if hasattr(self, 'error_message') and self.error_message is not None:
-            _dict['error_message'] = self.error_message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this StatusDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'StatusDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'StatusDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TokenDictRule():
+class TokenDictRule(Model):
     """
     An object defining a single tokenizaion rule.
 
@@ -12044,6 +8429,15 @@ class TokenDictRule():
           For example `noun`. Custom parts of speech can be specified.
     """
 
+    __slots__ = ('text', 'tokens', 'readings', 'part_of_speech')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('tokens', required=True),
+        ModelField('readings'),
+        ModelField('part_of_speech', required=True),
+    )
+
     def __init__(self,
                  text: str,
                  tokens: List[str],
@@ -12066,69 +8460,8 @@ class TokenDictRule():
         self.readings = readings
         self.part_of_speech = part_of_speech
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TokenDictRule':
-        """Initialize a TokenDictRule object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in TokenDictRule JSON')
-        if 'tokens' in _dict:
-            args['tokens'] = _dict.get('tokens')
-        else:
-            raise ValueError(
-                'Required property \'tokens\' not present in TokenDictRule JSON'
-            )
-        if 'readings' in _dict:
-            args['readings'] = _dict.get('readings')
-        if 'part_of_speech' in _dict:
-            args['part_of_speech'] = _dict.get('part_of_speech')
-        else:
-            raise ValueError(
-                'Required property \'part_of_speech\' not present in TokenDictRule JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TokenDictRule object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'tokens') and self.tokens is not None:
-            _dict['tokens'] = self.tokens
-        if hasattr(self, 'readings') and self.readings is not None:
-            _dict['readings'] = self.readings
-        if hasattr(self, 'part_of_speech') and self.part_of_speech is not None:
-            _dict['part_of_speech'] = self.part_of_speech
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this TokenDictRule object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TokenDictRule') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TokenDictRule') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TokenDictStatusResponse():
+class TokenDictStatusResponse(Model):
     """
     Object describing the current status of the wordlist.
 
@@ -12138,6 +8471,13 @@ class TokenDictStatusResponse():
           `tokenization_dictionary` or `stopwords`.
     """
 
+    __slots__ = ('status', 'type')
+
+    _fields = (
+        ModelField('status'),
+        ModelField('type'),
+    )
+
     def __init__(self, *, status: str = None, type: str = None) -> None:
         """
         Initialize a TokenDictStatusResponse object.
@@ -12150,48 +8490,6 @@ class TokenDictStatusResponse():
         self.status = status
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TokenDictStatusResponse':
-        """Initialize a TokenDictStatusResponse object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TokenDictStatusResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TokenDictStatusResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TokenDictStatusResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TokenDictStatusResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Current wordlist status for the specified collection.
@@ -12201,7 +8499,7 @@ class TokenDictStatusResponse():
         NOT_FOUND = 'not found'
 
 
-class TopHitsResults():
+class TopHitsResults(Model):
     """
     Top hit information for this query.
 
@@ -12210,6 +8508,13 @@ class TopHitsResults():
           aggregation.
     """
 
+    __slots__ = ('matching_results', 'hits')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('hits', 'list', 'QueryResult'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -12224,51 +8529,8 @@ class TopHitsResults():
         self.matching_results = matching_results
         self.hits = hits
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TopHitsResults':
-        """Initialize a TopHitsResults object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'hits' in _dict:
-            args['hits'] = [QueryResult.from_dict(x) for x in _dict.get('hits')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TopHitsResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'hits') and self.hits is not None:
-            _dict['hits'] = [x.to_dict() for x in self.hits]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TopHitsResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TopHitsResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TopHitsResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TrainingDataSet():
+class TrainingDataSet(Model):
     """
     Training information for a specific collection.
 
@@ -12279,6 +8541,14 @@ class TrainingDataSet():
     :attr List[TrainingQuery] queries: (optional) Array of training queries.
     """
 
+    __slots__ = ('environment_id', 'collection_id', 'queries')
+
+    _fields = (
+        ModelField('environment_id'),
+        ModelField('collection_id'),
+        ModelField('queries', 'list', 'TrainingQuery'),
+    )
+
     def __init__(self,
                  *,
                  environment_id: str = None,
@@ -12297,56 +8567,8 @@ class TrainingDataSet():
         self.collection_id = collection_id
         self.queries = queries
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingDataSet':
-        """Initialize a TrainingDataSet object from a json dictionary."""
-        args = {}
-        if 'environment_id' in _dict:
-            args['environment_id'] = _dict.get('environment_id')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'queries' in _dict:
-            args['queries'] = [
-                TrainingQuery.from_dict(x) for x in _dict.get('queries')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingDataSet object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'environment_id') and self.environment_id is not None:
-            _dict['environment_id'] = self.environment_id
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'queries') and self.queries is not None:
-            _dict['queries'] = [x.to_dict() for x in self.queries]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingDataSet object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingDataSet') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TrainingDataSet') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingExample():
+class TrainingExample(Model):
     """
     Training example details.
 
@@ -12357,6 +8579,14 @@ class TrainingExample():
     :attr int relevance: (optional) The relevance of the training example.
     """
 
+    __slots__ = ('document_id', 'cross_reference', 'relevance')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('cross_reference'),
+        ModelField('relevance'),
+    )
+
     def __init__(self,
                  *,
                  document_id: str = None,
@@ -12375,61 +8605,20 @@ class TrainingExample():
         self.cross_reference = cross_reference
         self.relevance = relevance
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingExample':
-        """Initialize a TrainingExample object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'cross_reference' in _dict:
-            args['cross_reference'] = _dict.get('cross_reference')
-        if 'relevance' in _dict:
-            args['relevance'] = _dict.get('relevance')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingExample object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self,
-                   'cross_reference') and self.cross_reference is not None:
-            _dict['cross_reference'] = self.cross_reference
-        if hasattr(self, 'relevance') and self.relevance is not None:
-            _dict['relevance'] = self.relevance
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingExample object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingExample') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingExample') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingExampleList():
+class TrainingExampleList(Model):
     """
     Object containing an array of training examples.
 
     :attr List[TrainingExample] examples: (optional) Array of training examples.
     """
 
+    __slots__ = ('examples',)
+
+    _fields = (
+        ModelField('examples', 'list', 'TrainingExample'),
+    )
+
     def __init__(self, *, examples: List['TrainingExample'] = None) -> None:
         """
         Initialize a TrainingExampleList object.
@@ -12439,48 +8628,8 @@ class TrainingExampleList():
         """
         self.examples = examples
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingExampleList':
-        """Initialize a TrainingExampleList object from a json dictionary."""
-        args = {}
-        if 'examples' in _dict:
-            args['examples'] = [
-                TrainingExample.from_dict(x) for x in _dict.get('examples')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingExampleList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingExampleList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingExampleList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TrainingExampleList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingQuery():
+class TrainingQuery(Model):
     """
     Training query details.
 
@@ -12492,6 +8641,15 @@ class TrainingQuery():
     :attr List[TrainingExample] examples: (optional) Array of training examples.
     """
 
+    __slots__ = ('query_id', 'natural_language_query', 'filter', 'examples')
+
+    _fields = (
+        ModelField('query_id'),
+        ModelField('natural_language_query'),
+        ModelField('filter'),
+        ModelField('examples', 'list', 'TrainingExample'),
+    )
+
     def __init__(self,
                  *,
                  query_id: str = None,
@@ -12515,61 +8673,8 @@ class TrainingQuery():
         self.filter = filter
         self.examples = examples
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingQuery':
-        """Initialize a TrainingQuery object from a json dictionary."""
-        args = {}
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        if 'natural_language_query' in _dict:
-            args['natural_language_query'] = _dict.get('natural_language_query')
-        if 'filter' in _dict:
-            args['filter'] = _dict.get('filter')
-        if 'examples' in _dict:
-            args['examples'] = [
-                TrainingExample.from_dict(x) for x in _dict.get('examples')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingQuery object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'query_id') and self.query_id is not None:
-            _dict['query_id'] = self.query_id
-        if hasattr(self, 'natural_language_query'
-                  ) and self.natural_language_query is not None:
-            _dict['natural_language_query'] = self.natural_language_query
-        if hasattr(self, 'filter') and self.filter is not None:
-            _dict['filter'] = self.filter
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingQuery object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingQuery') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingQuery') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class TrainingStatus():
+class TrainingStatus(Model):
     """
     Training status details.
 
@@ -12593,6 +8698,23 @@ class TrainingStatus():
           uploaded.
     """
 
+    __slots__ = ('total_examples', 'available', 'processing',
+                 'minimum_queries_added', 'minimum_examples_added',
+                 'sufficient_label_diversity', 'notices',
+                 'successfully_trained', 'data_updated')
+
+    _fields = (
+        ModelField('total_examples'),
+        ModelField('available'),
+        ModelField('processing'),
+        ModelField('minimum_queries_added'),
+        ModelField('minimum_examples_added'),
+        ModelField('sufficient_label_diversity'),
+        ModelField('notices'),
+        ModelField('successfully_trained', 'datetime'),
+        ModelField('data_updated', 'datetime'),
+    )
+
     def __init__(self,
                  *,
                  total_examples: int = None,
@@ -12637,86 +8759,8 @@ class TrainingStatus():
         self.successfully_trained = successfully_trained
         self.data_updated = data_updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingStatus':
-        """Initialize a TrainingStatus object from a json dictionary."""
-        args = {}
-        if 'total_examples' in _dict:
-            args['total_examples'] = _dict.get('total_examples')
-        if 'available' in _dict:
-            args['available'] = _dict.get('available')
-        if 'processing' in _dict:
-            args['processing'] = _dict.get('processing')
-        if 'minimum_queries_added' in _dict:
-            args['minimum_queries_added'] = _dict.get('minimum_queries_added')
-        if 'minimum_examples_added' in _dict:
-            args['minimum_examples_added'] = _dict.get('minimum_examples_added')
-        if 'sufficient_label_diversity' in _dict:
-            args['sufficient_label_diversity'] = _dict.get(
-                'sufficient_label_diversity')
-        if 'notices' in _dict:
-            args['notices'] = _dict.get('notices')
-        if 'successfully_trained' in _dict:
-            args['successfully_trained'] = string_to_datetime(
-                _dict.get('successfully_trained'))
-        if 'data_updated' in _dict:
-            args['data_updated'] = string_to_datetime(_dict.get('data_updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'total_examples') and self.total_examples is not None:
-            _dict['total_examples'] = self.total_examples
-        if hasattr(self, 'available') and self.available is not None:
-            _dict['available'] = self.available
-        if hasattr(self, 'processing') and self.processing is not None:
-            _dict['processing'] = self.processing
-        if hasattr(self, 'minimum_queries_added'
-                  ) and self.minimum_queries_added is not None:
-            _dict['minimum_queries_added'] = self.minimum_queries_added
-        if hasattr(self, 'minimum_examples_added'
-                  ) and self.minimum_examples_added is not None:
-            _dict['minimum_examples_added'] = self.minimum_examples_added
-        if hasattr(self, 'sufficient_label_diversity'
-                  ) and self.sufficient_label_diversity is not None:
-            _dict[
-                'sufficient_label_diversity'] = self.sufficient_label_diversity
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = self.notices
-        if hasattr(self, 'successfully_trained'
-                  ) and self.successfully_trained is not None:
-            _dict['successfully_trained'] = datetime_to_string(
-                self.successfully_trained)
-        if hasattr(self, 'data_updated') and self.data_updated is not None:
-            _dict['data_updated'] = datetime_to_string(self.data_updated)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TrainingStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordHeadingDetection():
+class WordHeadingDetection(Model):
     """
     Object containing heading detection conversion settings for Microsoft Word documents.
 
@@ -12725,6 +8769,13 @@ class WordHeadingDetection():
           convert.
     """
 
+    __slots__ = ('fonts', 'styles')
+
+    _fields = (
+        ModelField('fonts', 'list', 'FontSetting'),
+        ModelField('styles', 'list', 'WordStyle'),
+    )
+
     def __init__(self,
                  *,
                  fonts: List['FontSetting'] = None,
@@ -12740,54 +8791,8 @@ class WordHeadingDetection():
         self.fonts = fonts
         self.styles = styles
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordHeadingDetection':
-        """Initialize a WordHeadingDetection object from a json dictionary."""
-        args = {}
-        if 'fonts' in _dict:
-            args['fonts'] = [
-                FontSetting.from_dict(x) for x in _dict.get('fonts')
-            ]
-        if 'styles' in _dict:
-            args['styles'] = [
-                WordStyle.from_dict(x) for x in _dict.get('styles')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordHeadingDetection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'fonts') and self.fonts is not None:
-            _dict['fonts'] = [x.to_dict() for x in self.fonts]
-        if hasattr(self, 'styles') and self.styles is not None:
-            _dict['styles'] = [x.to_dict() for x in self.styles]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this WordHeadingDetection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordHeadingDetection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WordHeadingDetection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordSettings():
+class WordSettings(Model):
     """
     A list of Word conversion settings.
 
@@ -12795,6 +8800,12 @@ class WordSettings():
           detection conversion settings for Microsoft Word documents.
     """
 
+    __slots__ = ('heading',)
+
+    _fields = (
+        ModelField('heading', 'model', 'WordHeadingDetection'),
+    )
+
     def __init__(self, *, heading: 'WordHeadingDetection' = None) -> None:
         """
         Initialize a WordSettings object.
@@ -12804,47 +8815,8 @@ class WordSettings():
         """
         self.heading = heading
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordSettings':
-        """Initialize a WordSettings object from a json dictionary."""
-        args = {}
-        if 'heading' in _dict:
-            args['heading'] = WordHeadingDetection.from_dict(
-                _dict.get('heading'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordSettings object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'heading') and self.heading is not None:
-            _dict['heading'] = self.heading.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WordSettings object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordSettings') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'WordSettings') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordStyle():
+class WordStyle(Model):
     """
     Microsoft Word styles to convert into a specified HTML head level.
 
@@ -12853,6 +8825,13 @@ class WordStyle():
     :attr List[str] names: (optional) Array of word style names to convert.
     """
 
+    __slots__ = ('level', 'names')
+
+    _fields = (
+        ModelField('level'),
+        ModelField('names'),
+    )
+
     def __init__(self, *, level: int = None, names: List[str] = None) -> None:
         """
         Initialize a WordStyle object.
@@ -12864,56 +8843,20 @@ class WordStyle():
         self.level = level
         self.names = names
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordStyle':
-        """Initialize a WordStyle object from a json dictionary."""
-        args = {}
-        if 'level' in _dict:
-            args['level'] = _dict.get('level')
-        if 'names' in _dict:
-            args['names'] = _dict.get('names')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordStyle object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'level') and self.level is not None:
-            _dict['level'] = self.level
-        if hasattr(self, 'names') and self.names is not None:
-            _dict['names'] = self.names
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WordStyle object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordStyle') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WordStyle') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class XPathPatterns():
+class XPathPatterns(Model):
     """
     Object containing an array of XPaths.
 
     :attr List[str] xpaths: (optional) An array to XPaths.
     """
 
+    __slots__ = ('xpaths',)
+
+    _fields = (
+        ModelField('xpaths'),
+    )
+
     def __init__(self, *, xpaths: List[str] = None) -> None:
         """
         Initialize a XPathPatterns object.
@@ -12922,44 +8865,6 @@ class XPathPatterns():
         """
         self.xpaths = xpaths
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'XPathPatterns':
-        """Initialize a XPathPatterns object from a json dictionary."""
-        args = {}
-        if 'xpaths' in _dict:
-            args['xpaths'] = _dict.get('xpaths')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a XPathPatterns object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'xpaths') and self.xpaths is not None:
-            _dict['xpaths'] = self.xpaths
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this XPathPatterns object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'XPathPatterns') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'XPathPatterns') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Calculation(QueryAggregation):
     """
@@ -12970,6 +8875,17 @@ class Calculation(QueryAggregation):
     :attr float value: (optional) Value of the aggregation.
     """
 
+    __slots__ = ('field', 'value')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('field'),
+        ModelField('value'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -12999,69 +8915,6 @@ class Calculation(QueryAggregation):
         self.field = field
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Calculation':
-        """Initialize a Calculation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Calculation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Calculation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Calculation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Calculation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Filter(QueryAggregation):
     """
@@ -13070,6 +8923,16 @@ class Filter(QueryAggregation):
     :attr str match: (optional) The match the aggregated results queried for.
     """
 
+    __slots__ = ('match',)
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('match'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13095,65 +8958,6 @@ class Filter(QueryAggregation):
         self.aggregations = aggregations
         self.match = match
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Filter':
-        """Initialize a Filter object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'match' in _dict:
-            args['match'] = _dict.get('match')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Filter object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'match') and self.match is not None:
-            _dict['match'] = self.match
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Filter object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Filter') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Filter') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Histogram(QueryAggregation):
     """
@@ -13165,6 +8969,17 @@ class Histogram(QueryAggregation):
           type).
     """
 
+    __slots__ = ('field', 'interval')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('field'),
+        ModelField('interval'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13195,69 +9010,6 @@ class Histogram(QueryAggregation):
         self.field = field
         self.interval = interval
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Histogram':
-        """Initialize a Histogram object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'interval' in _dict:
-            args['interval'] = _dict.get('interval')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Histogram object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'interval') and self.interval is not None:
-            _dict['interval'] = self.interval
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Histogram object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Histogram') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Histogram') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Nested(QueryAggregation):
     """
@@ -13267,6 +9019,16 @@ class Nested(QueryAggregation):
           restricted to.
     """
 
+    __slots__ = ('path',)
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('path'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13293,65 +9055,6 @@ class Nested(QueryAggregation):
         self.aggregations = aggregations
         self.path = path
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Nested':
-        """Initialize a Nested object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'path' in _dict:
-            args['path'] = _dict.get('path')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Nested object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'path') and self.path is not None:
-            _dict['path'] = self.path
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Nested object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Nested') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Nested') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Term(QueryAggregation):
     """
@@ -13362,6 +9065,17 @@ class Term(QueryAggregation):
     :attr int count: (optional) The number of terms identified.
     """
 
+    __slots__ = ('field', 'count')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('field'),
+        ModelField('count'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13391,69 +9105,6 @@ class Term(QueryAggregation):
         self.field = field
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Term':
-        """Initialize a Term object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Term object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Term object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Term') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Term') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class Timeslice(QueryAggregation):
     """
@@ -13469,6 +9120,18 @@ class Timeslice(QueryAggregation):
           series.
     """
 
+    __slots__ = ('field', 'interval', 'anomaly')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('field'),
+        ModelField('interval'),
+        ModelField('anomaly'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13505,73 +9168,6 @@ class Timeslice(QueryAggregation):
         self.interval = interval
         self.anomaly = anomaly
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Timeslice':
-        """Initialize a Timeslice object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'interval' in _dict:
-            args['interval'] = _dict.get('interval')
-        if 'anomaly' in _dict:
-            args['anomaly'] = _dict.get('anomaly')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Timeslice object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'interval') and self.interval is not None:
-            _dict['interval'] = self.interval
-        if hasattr(self, 'anomaly') and self.anomaly is not None:
-            _dict['anomaly'] = self.anomaly
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Timeslice object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Timeslice') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Timeslice') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class TopHits(QueryAggregation):
     """
@@ -13581,6 +9177,17 @@ class TopHits(QueryAggregation):
     :attr TopHitsResults hits: (optional)
     """
 
+    __slots__ = ('size', 'hits')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('results', 'list', 'AggregationResult'),
+        ModelField('matching_results'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('size'),
+        ModelField('hits', 'model', 'TopHitsResults'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -13608,66 +9215,3 @@ class TopHits(QueryAggregation):
         self.aggregations = aggregations
         self.size = size
         self.hits = hits
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TopHits':
-        """Initialize a TopHits object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'results' in _dict:
-            args['results'] = [
-                AggregationResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'size' in _dict:
-            args['size'] = _dict.get('size')
-        if 'hits' in _dict:
-            args['hits'] = TopHitsResults.from_dict(_dict.get('hits'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TopHits object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self, 'size') and self.size is not None:
-            _dict['size'] = self.size
-        if hasattr(self, 'hits') and self.hits is not None:
-            _dict['hits'] = self.hits.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TopHits object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TopHits') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TopHits') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -31,21 +31,23 @@ from enum import Enum
 from os.path import basename
 from typing import BinaryIO, Dict, List
 import json
-import sys
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_list, convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_list, convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelDiscriminator, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class DiscoveryV2(BaseService):
+class DiscoveryV2(WatsonService):
     """The Discovery V2 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.discovery.watson.cloud.ibm.com'
@@ -56,6 +58,7 @@ class DiscoveryV2(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Discovery service.
@@ -66,17 +69,23 @@ class DiscoveryV2(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V2',
+                             get_operation_ids(DiscoveryV2))
 
     #########################
     # Collections
@@ -118,7 +127,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListCollectionsResponse,
+                             **kwargs)
         return response
 
     def create_collection(self,
@@ -167,7 +178,7 @@ class DiscoveryV2(BaseService):
             'enrichments': enrichments
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -184,7 +195,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CollectionDetails, **kwargs)
         return response
 
     def get_collection(self, project_id: str, collection_id: str,
@@ -228,7 +239,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CollectionDetails, **kwargs)
         return response
 
     def update_collection(self,
@@ -276,7 +287,7 @@ class DiscoveryV2(BaseService):
             'enrichments': enrichments
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -294,7 +305,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CollectionDetails, **kwargs)
         return response
 
     def delete_collection(self, project_id: str, collection_id: str,
@@ -456,7 +467,7 @@ class DiscoveryV2(BaseService):
             'passages': passages
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -473,7 +484,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=QueryResponse, **kwargs)
         return response
 
     def get_autocompletion(self,
@@ -537,7 +548,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Completions, **kwargs)
         return response
 
     def query_collection_notices(self,
@@ -612,7 +623,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=QueryNoticesResponse,
+                             **kwargs)
         return response
 
     def query_notices(self,
@@ -682,7 +695,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=QueryNoticesResponse,
+                             **kwargs)
         return response
 
     def list_fields(self,
@@ -732,7 +747,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ListFieldsResponse, **kwargs)
         return response
 
     #########################
@@ -777,7 +792,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ComponentSettingsResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -881,7 +898,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentAccepted, **kwargs)
         return response
 
     def update_document(self,
@@ -974,7 +991,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentAccepted, **kwargs)
         return response
 
     def delete_document(self,
@@ -1037,7 +1054,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=DeleteDocumentResponse,
+                             **kwargs)
         return response
 
     #########################
@@ -1082,7 +1101,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuerySet, **kwargs)
         return response
 
     def delete_training_queries(self, project_id: str,
@@ -1171,7 +1190,7 @@ class DiscoveryV2(BaseService):
             'filter': filter
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1189,7 +1208,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuery, **kwargs)
         return response
 
     def get_training_query(self, project_id: str, query_id: str,
@@ -1234,7 +1253,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuery, **kwargs)
         return response
 
     def update_training_query(self,
@@ -1286,7 +1305,7 @@ class DiscoveryV2(BaseService):
             'filter': filter
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1304,7 +1323,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingQuery, **kwargs)
         return response
 
     def delete_training_query(self, project_id: str, query_id: str,
@@ -1429,7 +1448,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AnalyzedDocument, **kwargs)
         return response
 
     #########################
@@ -1474,7 +1493,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Enrichments, **kwargs)
         return response
 
     def create_enrichment(self,
@@ -1530,7 +1549,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Enrichment, **kwargs)
         return response
 
     def get_enrichment(self, project_id: str, enrichment_id: str,
@@ -1574,7 +1593,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Enrichment, **kwargs)
         return response
 
     def update_enrichment(self,
@@ -1615,7 +1634,7 @@ class DiscoveryV2(BaseService):
 
         data = {'name': name, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1633,7 +1652,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Enrichment, **kwargs)
         return response
 
     def delete_enrichment(self, project_id: str, enrichment_id: str,
@@ -1713,7 +1732,9 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListProjectsResponse,
+                             **kwargs)
         return response
 
     def create_project(self,
@@ -1760,7 +1781,7 @@ class DiscoveryV2(BaseService):
             'default_query_parameters': default_query_parameters
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1774,7 +1795,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ProjectDetails, **kwargs)
         return response
 
     def get_project(self, project_id: str, **kwargs) -> DetailedResponse:
@@ -1813,7 +1834,7 @@ class DiscoveryV2(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ProjectDetails, **kwargs)
         return response
 
     def update_project(self,
@@ -1846,7 +1867,7 @@ class DiscoveryV2(BaseService):
 
         data = {'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1863,7 +1884,7 @@ class DiscoveryV2(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ProjectDetails, **kwargs)
         return response
 
     def delete_project(self, project_id: str, **kwargs) -> DetailedResponse:
@@ -2003,12 +2024,16 @@ class AnalyzeDocumentEnums:
         APPLICATION_XHTML_XML = 'application/xhtml+xml'
 
 
+class AsyncDiscoveryV2(AsyncWatsonService, DiscoveryV2):
+    """The Discovery V2 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AnalyzedDocument():
+class AnalyzedDocument(Model):
     """
     An object that contains the converted document and any identified enrichments.
 
@@ -2017,6 +2042,13 @@ class AnalyzedDocument():
     :attr AnalyzedResult result: (optional) Result of the document analysis.
     """
 
+    __slots__ = ('notices', 'result')
+
+    _fields = (
+        ModelField('notices', 'list', 'Notice'),
+        ModelField('result', 'model', 'AnalyzedResult'),
+    )
+
     def __init__(self,
                  *,
                  notices: List['Notice'] = None,
@@ -2031,58 +2063,20 @@ class AnalyzedDocument():
         self.notices = notices
         self.result = result
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AnalyzedDocument':
-        """Initialize a AnalyzedDocument object from a json dictionary."""
-        args = {}
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        if 'result' in _dict:
-            args['result'] = AnalyzedResult.from_dict(_dict.get('result'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AnalyzedDocument object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        if hasattr(self, 'result') and self.result is not None:
-            _dict['result'] = self.result.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AnalyzedDocument object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AnalyzedDocument') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'AnalyzedDocument') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AnalyzedResult():
+class AnalyzedResult(Model):
     """
     Result of the document analysis.
 
     :attr dict metadata: (optional) Metadata of the document.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('metadata'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(['metadata'])
 
@@ -2097,38 +2091,6 @@ class AnalyzedResult():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AnalyzedResult':
-        """Initialize a AnalyzedResult object from a json dictionary."""
-        args = {}
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AnalyzedResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        for _key in [
-                k for k in vars(self).keys()
-                if k not in AnalyzedResult._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of AnalyzedResult"""
         _dict = {}
@@ -2152,22 +2114,8 @@ class AnalyzedResult():
             if _key not in AnalyzedResult._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this AnalyzedResult object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'AnalyzedResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AnalyzedResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Collection():
+class Collection(Model):
     """
     A collection for storing documents.
 
@@ -2175,6 +2123,13 @@ class Collection():
     :attr str name: (optional) The name of the collection.
     """
 
+    __slots__ = ('collection_id', 'name')
+
+    _fields = (
+        ModelField('collection_id'),
+        ModelField('name'),
+    )
+
     def __init__(self, *, collection_id: str = None, name: str = None) -> None:
         """
         Initialize a Collection object.
@@ -2184,51 +2139,8 @@ class Collection():
         self.collection_id = collection_id
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Collection':
-        """Initialize a Collection object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Collection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this Collection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionDetails():
+class CollectionDetails(Model):
     """
     A collection for storing documents.
 
@@ -2241,6 +2153,18 @@ class CollectionDetails():
           that are applied to this collection.
     """
 
+    __slots__ = ('collection_id', 'name', 'description', 'created', 'language',
+                 'enrichments')
+
+    _fields = (
+        ModelField('collection_id'),
+        ModelField('name', required=True),
+        ModelField('description'),
+        ModelField('created', 'datetime'),
+        ModelField('language'),
+        ModelField('enrichments', 'list', 'CollectionEnrichment'),
+    )
+
     def __init__(self,
                  name: str,
                  *,
@@ -2265,74 +2189,8 @@ class CollectionDetails():
         self.language = language
         self.enrichments = enrichments
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionDetails':
-        """Initialize a CollectionDetails object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in CollectionDetails JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'enrichments' in _dict:
-            args['enrichments'] = [
-                CollectionEnrichment.from_dict(x)
-                for x in _dict.get('enrichments')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'enrichments') and self.enrichments is not None:
-            _dict['enrichments'] = [x.to_dict() for x in self.enrichments]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class CollectionEnrichment():
+class CollectionEnrichment(Model):
     """
     An object describing an Enrichment for a collection.
 
@@ -2343,6 +2201,13 @@ class CollectionEnrichment():
           an array automatically, even if the field contains a single value.
     """
 
+    __slots__ = ('enrichment_id', 'fields')
+
+    _fields = (
+        ModelField('enrichment_id'),
+        ModelField('fields'),
+    )
+
     def __init__(self,
                  *,
                  enrichment_id: str = None,
@@ -2361,50 +2226,8 @@ class CollectionEnrichment():
         self.enrichment_id = enrichment_id
         self.fields = fields
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionEnrichment':
-        """Initialize a CollectionEnrichment object from a json dictionary."""
-        args = {}
-        if 'enrichment_id' in _dict:
-            args['enrichment_id'] = _dict.get('enrichment_id')
-        if 'fields' in _dict:
-            args['fields'] = _dict.get('fields')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionEnrichment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enrichment_id') and self.enrichment_id is not None:
-            _dict['enrichment_id'] = self.enrichment_id
-        if hasattr(self, 'fields') and self.fields is not None:
-            _dict['fields'] = self.fields
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionEnrichment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionEnrichment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'CollectionEnrichment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Completions():
+class Completions(Model):
     """
     An object that contains an array of autocompletion suggestions.
 
@@ -2412,6 +2235,12 @@ class Completions():
           on the provided prefix.
     """
 
+    __slots__ = ('completions',)
+
+    _fields = (
+        ModelField('completions'),
+    )
+
     def __init__(self, *, completions: List[str] = None) -> None:
         """
         Initialize a Completions object.
@@ -2421,46 +2250,8 @@ class Completions():
         """
         self.completions = completions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Completions':
-        """Initialize a Completions object from a json dictionary."""
-        args = {}
-        if 'completions' in _dict:
-            args['completions'] = _dict.get('completions')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Completions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'completions') and self.completions is not None:
-            _dict['completions'] = self.completions
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Completions object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'Completions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Completions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ComponentSettingsAggregation():
+class ComponentSettingsAggregation(Model):
     """
     Display settings for aggregations.
 
@@ -2473,6 +2264,16 @@ class ComponentSettingsAggregation():
           rendering the aggregation.
     """
 
+    __slots__ = ('name', 'label', 'multiple_selections_allowed',
+                 'visualization_type')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('label'),
+        ModelField('multiple_selections_allowed'),
+        ModelField('visualization_type'),
+    )
+
     def __init__(self,
                  *,
                  name: str = None,
@@ -2495,61 +2296,6 @@ class ComponentSettingsAggregation():
         self.multiple_selections_allowed = multiple_selections_allowed
         self.visualization_type = visualization_type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ComponentSettingsAggregation':
-        """Initialize a ComponentSettingsAggregation object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        if 'multiple_selections_allowed' in _dict:
-            args['multiple_selections_allowed'] = _dict.get(
-                'multiple_selections_allowed')
-        if 'visualization_type' in _dict:
-            args['visualization_type'] = _dict.get('visualization_type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ComponentSettingsAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'multiple_selections_allowed'
-                  ) and self.multiple_selections_allowed is not None:
-            _dict[
-                'multiple_selections_allowed'] = self.multiple_selections_allowed
-        if hasattr(
-                self,
-                'visualization_type') and self.visualization_type is not None:
-            _dict['visualization_type'] = self.visualization_type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ComponentSettingsAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ComponentSettingsAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ComponentSettingsAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class VisualizationTypeEnum(str, Enum):
         """
         Type of visualization to use when rendering the aggregation.
@@ -2560,7 +2306,7 @@ class ComponentSettingsAggregation():
         MAP = 'map'
 
 
-class ComponentSettingsFieldsShown():
+class ComponentSettingsFieldsShown(Model):
     """
     Fields shown in the results section of the UI.
 
@@ -2568,6 +2314,13 @@ class ComponentSettingsFieldsShown():
     :attr ComponentSettingsFieldsShownTitle title: (optional) Title label.
     """
 
+    __slots__ = ('body', 'title')
+
+    _fields = (
+        ModelField('body', 'model', 'ComponentSettingsFieldsShownBody'),
+        ModelField('title', 'model', 'ComponentSettingsFieldsShownTitle'),
+    )
+
     def __init__(self,
                  *,
                  body: 'ComponentSettingsFieldsShownBody' = None,
@@ -2581,52 +2334,8 @@ class ComponentSettingsFieldsShown():
         self.body = body
         self.title = title
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ComponentSettingsFieldsShown':
-        """Initialize a ComponentSettingsFieldsShown object from a json dictionary."""
-        args = {}
-        if 'body' in _dict:
-            args['body'] = ComponentSettingsFieldsShownBody.from_dict(
-                _dict.get('body'))
-        if 'title' in _dict:
-            args['title'] = ComponentSettingsFieldsShownTitle.from_dict(
-                _dict.get('title'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ComponentSettingsFieldsShown object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'body') and self.body is not None:
-            _dict['body'] = self.body.to_dict()
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ComponentSettingsFieldsShown object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ComponentSettingsFieldsShown') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ComponentSettingsFieldsShown') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class ComponentSettingsFieldsShownBody():
+class ComponentSettingsFieldsShownBody(Model):
     """
     Body label.
 
@@ -2634,6 +2343,13 @@ class ComponentSettingsFieldsShownBody():
     :attr str field: (optional) Use a specific field as the title.
     """
 
+    __slots__ = ('use_passage', 'field')
+
+    _fields = (
+        ModelField('use_passage'),
+        ModelField('field'),
+    )
+
     def __init__(self, *, use_passage: bool = None, field: str = None) -> None:
         """
         Initialize a ComponentSettingsFieldsShownBody object.
@@ -2644,56 +2360,20 @@ class ComponentSettingsFieldsShownBody():
         self.use_passage = use_passage
         self.field = field
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ComponentSettingsFieldsShownBody':
-        """Initialize a ComponentSettingsFieldsShownBody object from a json dictionary."""
-        args = {}
-        if 'use_passage' in _dict:
-            args['use_passage'] = _dict.get('use_passage')
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ComponentSettingsFieldsShownBody object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'use_passage') and self.use_passage is not None:
-            _dict['use_passage'] = self.use_passage
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ComponentSettingsFieldsShownBody object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ComponentSettingsFieldsShownBody') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ComponentSettingsFieldsShownBody') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ComponentSettingsFieldsShownTitle():
+class ComponentSettingsFieldsShownTitle(Model):
     """
     Title label.
 
     :attr str field: (optional) Use a specific field as the title.
     """
 
+    __slots__ = ('field',)
+
+    _fields = (
+        ModelField('field'),
+    )
+
     def __init__(self, *, field: str = None) -> None:
         """
         Initialize a ComponentSettingsFieldsShownTitle object.
@@ -2702,46 +2382,8 @@ class ComponentSettingsFieldsShownTitle():
         """
         self.field = field
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ComponentSettingsFieldsShownTitle':
-        """Initialize a ComponentSettingsFieldsShownTitle object from a json dictionary."""
-        args = {}
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ComponentSettingsFieldsShownTitle object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ComponentSettingsFieldsShownTitle object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'ComponentSettingsFieldsShownTitle') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ComponentSettingsFieldsShownTitle') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ComponentSettingsResponse():
+class ComponentSettingsResponse(Model):
     """
     The default component settings for this project.
 
@@ -2755,6 +2397,17 @@ class ComponentSettingsResponse():
           component setting aggregations.
     """
 
+    __slots__ = ('fields_shown', 'autocomplete', 'structured_search',
+                 'results_per_page', 'aggregations')
+
+    _fields = (
+        ModelField('fields_shown', 'model', 'ComponentSettingsFieldsShown'),
+        ModelField('autocomplete'),
+        ModelField('structured_search'),
+        ModelField('results_per_page'),
+        ModelField('aggregations', 'list', 'ComponentSettingsAggregation'),
+    )
+
     def __init__(
             self,
             *,
@@ -2782,68 +2435,8 @@ class ComponentSettingsResponse():
         self.results_per_page = results_per_page
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ComponentSettingsResponse':
-        """Initialize a ComponentSettingsResponse object from a json dictionary."""
-        args = {}
-        if 'fields_shown' in _dict:
-            args['fields_shown'] = ComponentSettingsFieldsShown.from_dict(
-                _dict.get('fields_shown'))
-        if 'autocomplete' in _dict:
-            args['autocomplete'] = _dict.get('autocomplete')
-        if 'structured_search' in _dict:
-            args['structured_search'] = _dict.get('structured_search')
-        if 'results_per_page' in _dict:
-            args['results_per_page'] = _dict.get('results_per_page')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                ComponentSettingsAggregation.from_dict(x)
-                for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ComponentSettingsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'fields_shown') and self.fields_shown is not None:
-            _dict['fields_shown'] = self.fields_shown.to_dict()
-        if hasattr(self, 'autocomplete') and self.autocomplete is not None:
-            _dict['autocomplete'] = self.autocomplete
-        if hasattr(self,
-                   'structured_search') and self.structured_search is not None:
-            _dict['structured_search'] = self.structured_search
-        if hasattr(self,
-                   'results_per_page') and self.results_per_page is not None:
-            _dict['results_per_page'] = self.results_per_page
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this ComponentSettingsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ComponentSettingsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ComponentSettingsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CreateEnrichment():
+class CreateEnrichment(Model):
     """
     Information about a specific enrichment.
 
@@ -2855,6 +2448,15 @@ class CreateEnrichment():
           options are not included in responses from the List Enrichments method.
     """
 
+    __slots__ = ('name', 'description', 'type', 'options')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('type'),
+        ModelField('options', 'model', 'EnrichmentOptions'),
+    )
+
     def __init__(self,
                  *,
                  name: str = None,
@@ -2877,56 +2479,6 @@ class CreateEnrichment():
         self.type = type
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CreateEnrichment':
-        """Initialize a CreateEnrichment object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'options' in _dict:
-            args['options'] = EnrichmentOptions.from_dict(_dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CreateEnrichment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CreateEnrichment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CreateEnrichment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CreateEnrichment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of this enrichment.
@@ -2938,7 +2490,7 @@ class CreateEnrichment():
         WATSON_KNOWLEDGE_STUDIO_MODEL = 'watson_knowledge_studio_model'
 
 
-class DefaultQueryParams():
+class DefaultQueryParams(Model):
     """
     Default query parameters for this project.
 
@@ -2964,6 +2516,24 @@ class DefaultQueryParams():
           document results if present by default.
     """
 
+    __slots__ = ('collection_ids', 'passages', 'table_results', 'aggregation',
+                 'suggested_refinements', 'spelling_suggestions', 'highlight',
+                 'count', 'sort', 'return_')
+
+    _fields = (
+        ModelField('collection_ids'),
+        ModelField('passages', 'model', 'DefaultQueryParamsPassages'),
+        ModelField('table_results', 'model', 'DefaultQueryParamsTableResults'),
+        ModelField('aggregation'),
+        ModelField('suggested_refinements', 'model',
+                   'DefaultQueryParamsSuggestedRefinements'),
+        ModelField('spelling_suggestions'),
+        ModelField('highlight'),
+        ModelField('count'),
+        ModelField('sort'),
+        ModelField('return_', key='return'),
+    )
+
     def __init__(self,
                  *,
                  collection_ids: List[str] = None,
@@ -3014,89 +2584,8 @@ class DefaultQueryParams():
         self.sort = sort
         self.return_ = return_
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DefaultQueryParams':
-        """Initialize a DefaultQueryParams object from a json dictionary."""
-        args = {}
-        if 'collection_ids' in _dict:
-            args['collection_ids'] = _dict.get('collection_ids')
-        if 'passages' in _dict:
-            args['passages'] = DefaultQueryParamsPassages.from_dict(
-                _dict.get('passages'))
-        if 'table_results' in _dict:
-            args['table_results'] = DefaultQueryParamsTableResults.from_dict(
-                _dict.get('table_results'))
-        if 'aggregation' in _dict:
-            args['aggregation'] = _dict.get('aggregation')
-        if 'suggested_refinements' in _dict:
-            args[
-                'suggested_refinements'] = DefaultQueryParamsSuggestedRefinements.from_dict(
-                    _dict.get('suggested_refinements'))
-        if 'spelling_suggestions' in _dict:
-            args['spelling_suggestions'] = _dict.get('spelling_suggestions')
-        if 'highlight' in _dict:
-            args['highlight'] = _dict.get('highlight')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'sort' in _dict:
-            args['sort'] = _dict.get('sort')
-        if 'return' in _dict:
-            args['return_'] = _dict.get('return')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DefaultQueryParams object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_ids') and self.collection_ids is not None:
-            _dict['collection_ids'] = self.collection_ids
-        if hasattr(self, 'passages') and self.passages is not None:
-            _dict['passages'] = self.passages.to_dict()
-        if hasattr(self, 'table_results') and self.table_results is not None:
-            _dict['table_results'] = self.table_results.to_dict()
-        if hasattr(self, 'aggregation') and self.aggregation is not None:
-            _dict['aggregation'] = self.aggregation
-        if hasattr(self, 'suggested_refinements'
-                  ) and self.suggested_refinements is not None:
-            _dict['suggested_refinements'] = self.suggested_refinements.to_dict(
-            )
-        if hasattr(self, 'spelling_suggestions'
-                  ) and self.spelling_suggestions is not None:
-            _dict['spelling_suggestions'] = self.spelling_suggestions
-        if hasattr(self, 'highlight') and self.highlight is not None:
-            _dict['highlight'] = self.highlight
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'sort') and self.sort is not None:
-            _dict['sort'] = self.sort
-        if hasattr(self, 'return_') and self.return_ is not None:
-            _dict['return'] = self.return_
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DefaultQueryParams object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DefaultQueryParams') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DefaultQueryParams') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class DefaultQueryParamsPassages():
+class DefaultQueryParamsPassages(Model):
     """
     Default settings configuration for passage search options.
 
@@ -3114,6 +2603,18 @@ class DefaultQueryParamsPassages():
           that can be taken from a single document as the result of a passage query.
     """
 
+    __slots__ = ('enabled', 'count', 'fields', 'characters', 'per_document',
+                 'max_per_document')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('count'),
+        ModelField('fields'),
+        ModelField('characters'),
+        ModelField('per_document'),
+        ModelField('max_per_document'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -3146,67 +2647,8 @@ class DefaultQueryParamsPassages():
         self.per_document = per_document
         self.max_per_document = max_per_document
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DefaultQueryParamsPassages':
-        """Initialize a DefaultQueryParamsPassages object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'fields' in _dict:
-            args['fields'] = _dict.get('fields')
-        if 'characters' in _dict:
-            args['characters'] = _dict.get('characters')
-        if 'per_document' in _dict:
-            args['per_document'] = _dict.get('per_document')
-        if 'max_per_document' in _dict:
-            args['max_per_document'] = _dict.get('max_per_document')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DefaultQueryParamsPassages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'fields') and self.fields is not None:
-            _dict['fields'] = self.fields
-        if hasattr(self, 'characters') and self.characters is not None:
-            _dict['characters'] = self.characters
-        if hasattr(self, 'per_document') and self.per_document is not None:
-            _dict['per_document'] = self.per_document
-        if hasattr(self,
-                   'max_per_document') and self.max_per_document is not None:
-            _dict['max_per_document'] = self.max_per_document
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DefaultQueryParamsPassages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DefaultQueryParamsPassages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'DefaultQueryParamsPassages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DefaultQueryParamsSuggestedRefinements():
+class DefaultQueryParamsSuggestedRefinements(Model):
     """
     Object that contains suggested refinement settings. Available with Premium plans only.
 
@@ -3216,6 +2658,13 @@ class DefaultQueryParamsSuggestedRefinements():
           default.
     """
 
+    __slots__ = ('enabled', 'count')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('count'),
+    )
+
     def __init__(self, *, enabled: bool = None, count: int = None) -> None:
         """
         Initialize a DefaultQueryParamsSuggestedRefinements object.
@@ -3228,50 +2677,8 @@ class DefaultQueryParamsSuggestedRefinements():
         self.enabled = enabled
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DefaultQueryParamsSuggestedRefinements':
-        """Initialize a DefaultQueryParamsSuggestedRefinements object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DefaultQueryParamsSuggestedRefinements object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DefaultQueryParamsSuggestedRefinements object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DefaultQueryParamsSuggestedRefinements') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DefaultQueryParamsSuggestedRefinements') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DefaultQueryParamsTableResults():
+class DefaultQueryParamsTableResults(Model):
     """
     Default project query settings for table results.
 
@@ -3282,6 +2689,14 @@ class DefaultQueryParamsTableResults():
           each result document.
     """
 
+    __slots__ = ('enabled', 'count', 'per_document')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('count'),
+        ModelField('per_document'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -3301,54 +2716,8 @@ class DefaultQueryParamsTableResults():
         self.count = count
         self.per_document = per_document
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DefaultQueryParamsTableResults':
-        """Initialize a DefaultQueryParamsTableResults object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'per_document' in _dict:
-            args['per_document'] = _dict.get('per_document')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DefaultQueryParamsTableResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'per_document') and self.per_document is not None:
-            _dict['per_document'] = self.per_document
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DefaultQueryParamsTableResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DefaultQueryParamsTableResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DefaultQueryParamsTableResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class DeleteDocumentResponse():
+class DeleteDocumentResponse(Model):
     """
     Information returned when a document is deleted.
 
@@ -3357,6 +2726,13 @@ class DeleteDocumentResponse():
           status deleted.
     """
 
+    __slots__ = ('document_id', 'status')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('status'),
+    )
+
     def __init__(self, *, document_id: str = None, status: str = None) -> None:
         """
         Initialize a DeleteDocumentResponse object.
@@ -3368,48 +2744,6 @@ class DeleteDocumentResponse():
         self.document_id = document_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteDocumentResponse':
-        """Initialize a DeleteDocumentResponse object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteDocumentResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteDocumentResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteDocumentResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteDocumentResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the document. A deleted document has the status deleted.
@@ -3417,7 +2751,7 @@ class DeleteDocumentResponse():
         DELETED = 'deleted'
 
 
-class DocumentAccepted():
+class DocumentAccepted(Model):
     """
     Information returned after an uploaded document is accepted.
 
@@ -3429,6 +2763,13 @@ class DocumentAccepted():
           others.
     """
 
+    __slots__ = ('document_id', 'status')
+
+    _fields = (
+        ModelField('document_id'),
+        ModelField('status'),
+    )
+
     def __init__(self, *, document_id: str = None, status: str = None) -> None:
         """
         Initialize a DocumentAccepted object.
@@ -3443,48 +2784,6 @@ class DocumentAccepted():
         self.document_id = document_id
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentAccepted':
-        """Initialize a DocumentAccepted object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentAccepted object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentAccepted object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentAccepted') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentAccepted') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Status of the document in the ingestion process. A status of `processing` is
@@ -3495,7 +2794,7 @@ class DocumentAccepted():
         PENDING = 'pending'
 
 
-class DocumentAttribute():
+class DocumentAttribute(Model):
     """
     List of document attributes.
 
@@ -3506,6 +2805,14 @@ class DocumentAttribute():
           `begin` and `end`.
     """
 
+    __slots__ = ('type', 'text', 'location')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('text'),
+        ModelField('location', 'model', 'TableElementLocation'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -3524,55 +2831,8 @@ class DocumentAttribute():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentAttribute':
-        """Initialize a DocumentAttribute object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentAttribute object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentAttribute object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'DocumentAttribute') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentAttribute') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Enrichment():
+class Enrichment(Model):
     """
     Information about a specific enrichment.
 
@@ -3585,6 +2845,16 @@ class Enrichment():
           options are not included in responses from the List Enrichments method.
     """
 
+    __slots__ = ('enrichment_id', 'name', 'description', 'type', 'options')
+
+    _fields = (
+        ModelField('enrichment_id'),
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('type'),
+        ModelField('options', 'model', 'EnrichmentOptions'),
+    )
+
     def __init__(self,
                  *,
                  enrichment_id: str = None,
@@ -3609,61 +2879,6 @@ class Enrichment():
         self.type = type
         self.options = options
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Enrichment':
-        """Initialize a Enrichment object from a json dictionary."""
-        args = {}
-        if 'enrichment_id' in _dict:
-            args['enrichment_id'] = _dict.get('enrichment_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'options' in _dict:
-            args['options'] = EnrichmentOptions.from_dict(_dict.get('options'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Enrichment object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enrichment_id') and getattr(
-                self, 'enrichment_id') is not None:
-            _dict['enrichment_id'] = getattr(self, 'enrichment_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'options') and self.options is not None:
-            _dict['options'] = self.options.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Enrichment object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Enrichment') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Enrichment') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of this enrichment.
@@ -3678,7 +2893,7 @@ class Enrichment():
         WATSON_KNOWLEDGE_STUDIO_MODEL = 'watson_knowledge_studio_model'
 
 
-class EnrichmentOptions():
+class EnrichmentOptions(Model):
     """
     An object that contains options for the current enrichment. Starting with version
     `2020-08-30`, the enrichment options are not included in responses from the List
@@ -3698,6 +2913,16 @@ class EnrichmentOptions():
           creating any other type of enrichment.
     """
 
+    __slots__ = ('languages', 'entity_type', 'regular_expression',
+                 'result_field')
+
+    _fields = (
+        ModelField('languages'),
+        ModelField('entity_type'),
+        ModelField('regular_expression'),
+        ModelField('result_field'),
+    )
+
     def __init__(self,
                  *,
                  languages: List[str] = None,
@@ -3726,60 +2951,8 @@ class EnrichmentOptions():
         self.regular_expression = regular_expression
         self.result_field = result_field
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EnrichmentOptions':
-        """Initialize a EnrichmentOptions object from a json dictionary."""
-        args = {}
-        if 'languages' in _dict:
-            args['languages'] = _dict.get('languages')
-        if 'entity_type' in _dict:
-            args['entity_type'] = _dict.get('entity_type')
-        if 'regular_expression' in _dict:
-            args['regular_expression'] = _dict.get('regular_expression')
-        if 'result_field' in _dict:
-            args['result_field'] = _dict.get('result_field')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EnrichmentOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'languages') and self.languages is not None:
-            _dict['languages'] = self.languages
-        if hasattr(self, 'entity_type') and self.entity_type is not None:
-            _dict['entity_type'] = self.entity_type
-        if hasattr(
-                self,
-                'regular_expression') and self.regular_expression is not None:
-            _dict['regular_expression'] = self.regular_expression
-        if hasattr(self, 'result_field') and self.result_field is not None:
-            _dict['result_field'] = self.result_field
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EnrichmentOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EnrichmentOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EnrichmentOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class Enrichments():
+class Enrichments(Model):
     """
     An object that contains an array of enrichment definitions.
 
@@ -3787,6 +2960,12 @@ class Enrichments():
           definitions.
     """
 
+    __slots__ = ('enrichments',)
+
+    _fields = (
+        ModelField('enrichments', 'list', 'Enrichment'),
+    )
+
     def __init__(self, *, enrichments: List['Enrichment'] = None) -> None:
         """
         Initialize a Enrichments object.
@@ -3796,48 +2975,8 @@ class Enrichments():
         """
         self.enrichments = enrichments
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Enrichments':
-        """Initialize a Enrichments object from a json dictionary."""
-        args = {}
-        if 'enrichments' in _dict:
-            args['enrichments'] = [
-                Enrichment.from_dict(x) for x in _dict.get('enrichments')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Enrichments object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enrichments') and self.enrichments is not None:
-            _dict['enrichments'] = [x.to_dict() for x in self.enrichments]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Enrichments object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Enrichments') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'Enrichments') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Field():
+class Field(Model):
     """
     Object that contains field details.
 
@@ -3847,6 +2986,14 @@ class Field():
           the field was found.
     """
 
+    __slots__ = ('field', 'type', 'collection_id')
+
+    _fields = (
+        ModelField('field'),
+        ModelField('type'),
+        ModelField('collection_id'),
+    )
+
     def __init__(self,
                  *,
                  field: str = None,
@@ -3860,53 +3007,6 @@ class Field():
         self.type = type
         self.collection_id = collection_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Field':
-        """Initialize a Field object from a json dictionary."""
-        args = {}
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Field object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'field') and getattr(self, 'field') is not None:
-            _dict['field'] = getattr(self, 'field')
-        if hasattr(self, 'type') and getattr(self, 'type') is not None:
-            _dict['type'] = getattr(self, 'type')
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Field object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Field') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Field') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of the field.
@@ -3924,7 +3024,7 @@ class Field():
         BINARY = 'binary'
 
 
-class ListCollectionsResponse():
+class ListCollectionsResponse(Model):
     """
     Response object that contains an array of collection details.
 
@@ -3932,6 +3032,12 @@ class ListCollectionsResponse():
           information about each collection in the project.
     """
 
+    __slots__ = ('collections',)
+
+    _fields = (
+        ModelField('collections', 'list', 'Collection'),
+    )
+
     def __init__(self, *, collections: List['Collection'] = None) -> None:
         """
         Initialize a ListCollectionsResponse object.
@@ -3941,48 +3047,8 @@ class ListCollectionsResponse():
         """
         self.collections = collections
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListCollectionsResponse':
-        """Initialize a ListCollectionsResponse object from a json dictionary."""
-        args = {}
-        if 'collections' in _dict:
-            args['collections'] = [
-                Collection.from_dict(x) for x in _dict.get('collections')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListCollectionsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collections') and self.collections is not None:
-            _dict['collections'] = [x.to_dict() for x in self.collections]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListCollectionsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListCollectionsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListCollectionsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class ListFieldsResponse():
+class ListFieldsResponse(Model):
     """
     The list of fetched fields.
     The fields are returned using a fully qualified name format, however, the format
@@ -3996,6 +3062,12 @@ class ListFieldsResponse():
           each field in the collections.
     """
 
+    __slots__ = ('fields',)
+
+    _fields = (
+        ModelField('fields', 'list', 'Field'),
+    )
+
     def __init__(self, *, fields: List['Field'] = None) -> None:
         """
         Initialize a ListFieldsResponse object.
@@ -4005,51 +3077,19 @@ class ListFieldsResponse():
         """
         self.fields = fields
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListFieldsResponse':
-        """Initialize a ListFieldsResponse object from a json dictionary."""
-        args = {}
-        if 'fields' in _dict:
-            args['fields'] = [Field.from_dict(x) for x in _dict.get('fields')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListFieldsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'fields') and self.fields is not None:
-            _dict['fields'] = [x.to_dict() for x in self.fields]
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
+class ListProjectsResponse(Model):
+    """
+    A list of projects in this instance.
 
-    def __str__(self) -> str:
-        """Return a `str` version of this ListFieldsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
+    :attr List[ProjectListDetails] projects: (optional) An array of project details.
+    """
 
-    def __eq__(self, other: 'ListFieldsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
+    __slots__ = ('projects',)
 
-    def __ne__(self, other: 'ListFieldsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListProjectsResponse():
-    """
-    A list of projects in this instance.
-
-    :attr List[ProjectListDetails] projects: (optional) An array of project details.
-    """
+    _fields = (
+        ModelField('projects', 'list', 'ProjectListDetails'),
+    )
 
     def __init__(self, *, projects: List['ProjectListDetails'] = None) -> None:
         """
@@ -4060,48 +3100,8 @@ class ListProjectsResponse():
         """
         self.projects = projects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListProjectsResponse':
-        """Initialize a ListProjectsResponse object from a json dictionary."""
-        args = {}
-        if 'projects' in _dict:
-            args['projects'] = [
-                ProjectListDetails.from_dict(x) for x in _dict.get('projects')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListProjectsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'projects') and self.projects is not None:
-            _dict['projects'] = [x.to_dict() for x in self.projects]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListProjectsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListProjectsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'ListProjectsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Notice():
+class Notice(Model):
     """
     A notice produced for the collection.
 
@@ -4131,6 +3131,20 @@ class Notice():
     :attr str description: (optional) The description of the notice.
     """
 
+    __slots__ = ('notice_id', 'created', 'document_id', 'collection_id',
+                 'query_id', 'severity', 'step', 'description')
+
+    _fields = (
+        ModelField('notice_id'),
+        ModelField('created', 'datetime'),
+        ModelField('document_id'),
+        ModelField('collection_id'),
+        ModelField('query_id'),
+        ModelField('severity'),
+        ModelField('step'),
+        ModelField('description'),
+    )
+
     def __init__(self,
                  *,
                  notice_id: str = None,
@@ -4154,76 +3168,6 @@ class Notice():
         self.step = step
         self.description = description
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Notice':
-        """Initialize a Notice object from a json dictionary."""
-        args = {}
-        if 'notice_id' in _dict:
-            args['notice_id'] = _dict.get('notice_id')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        if 'severity' in _dict:
-            args['severity'] = _dict.get('severity')
-        if 'step' in _dict:
-            args['step'] = _dict.get('step')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Notice object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'notice_id') and getattr(self,
-                                                  'notice_id') is not None:
-            _dict['notice_id'] = getattr(self, 'notice_id')
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'document_id') and getattr(self,
-                                                    'document_id') is not None:
-            _dict['document_id'] = getattr(self, 'document_id')
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        if hasattr(self, 'query_id') and getattr(self, 'query_id') is not None:
-            _dict['query_id'] = getattr(self, 'query_id')
-        if hasattr(self, 'severity') and getattr(self, 'severity') is not None:
-            _dict['severity'] = getattr(self, 'severity')
-        if hasattr(self, 'step') and getattr(self, 'step') is not None:
-            _dict['step'] = getattr(self, 'step')
-        if hasattr(self, 'description') and getattr(self,
-                                                    'description') is not None:
-            _dict['description'] = getattr(self, 'description')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Notice object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class SeverityEnum(str, Enum):
         """
         Severity level of the notice.
@@ -4232,7 +3176,7 @@ class Notice():
         ERROR = 'error'
 
 
-class ProjectDetails():
+class ProjectDetails(Model):
     """
     Detailed information about the specified project.
 
@@ -4251,6 +3195,19 @@ class ProjectDetails():
           parameters for this project.
     """
 
+    __slots__ = ('project_id', 'name', 'type', 'relevancy_training_status',
+                 'collection_count', 'default_query_parameters')
+
+    _fields = (
+        ModelField('project_id'),
+        ModelField('name'),
+        ModelField('type'),
+        ModelField('relevancy_training_status', 'model',
+                   'ProjectListDetailsRelevancyTrainingStatus'),
+        ModelField('collection_count'),
+        ModelField('default_query_parameters', 'model', 'DefaultQueryParams'),
+    )
+
     def __init__(self,
                  *,
                  project_id: str = None,
@@ -4281,75 +3238,6 @@ class ProjectDetails():
         self.collection_count = collection_count
         self.default_query_parameters = default_query_parameters
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ProjectDetails':
-        """Initialize a ProjectDetails object from a json dictionary."""
-        args = {}
-        if 'project_id' in _dict:
-            args['project_id'] = _dict.get('project_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'relevancy_training_status' in _dict:
-            args[
-                'relevancy_training_status'] = ProjectListDetailsRelevancyTrainingStatus.from_dict(
-                    _dict.get('relevancy_training_status'))
-        if 'collection_count' in _dict:
-            args['collection_count'] = _dict.get('collection_count')
-        if 'default_query_parameters' in _dict:
-            args['default_query_parameters'] = DefaultQueryParams.from_dict(
-                _dict.get('default_query_parameters'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ProjectDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'project_id') and getattr(self,
-                                                   'project_id') is not None:
-            _dict['project_id'] = getattr(self, 'project_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'relevancy_training_status'
-                  ) and self.relevancy_training_status is not None:
-            _dict[
-                'relevancy_training_status'] = self.relevancy_training_status.to_dict(
-                )
-        if hasattr(self, 'collection_count') and getattr(
-                self, 'collection_count') is not None:
-            _dict['collection_count'] = getattr(self, 'collection_count')
-        if hasattr(self, 'default_query_parameters'
-                  ) and self.default_query_parameters is not None:
-            _dict[
-                'default_query_parameters'] = self.default_query_parameters.to_dict(
-                )
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ProjectDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ProjectDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ProjectDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of project.
@@ -4365,7 +3253,7 @@ class ProjectDetails():
         OTHER = 'other'
 
 
-class ProjectListDetails():
+class ProjectListDetails(Model):
     """
     Details about a specific project.
 
@@ -4382,6 +3270,18 @@ class ProjectListDetails():
           this project.
     """
 
+    __slots__ = ('project_id', 'name', 'type', 'relevancy_training_status',
+                 'collection_count')
+
+    _fields = (
+        ModelField('project_id'),
+        ModelField('name'),
+        ModelField('type'),
+        ModelField('relevancy_training_status', 'model',
+                   'ProjectListDetailsRelevancyTrainingStatus'),
+        ModelField('collection_count'),
+    )
+
     def __init__(self,
                  *,
                  project_id: str = None,
@@ -4408,67 +3308,6 @@ class ProjectListDetails():
         self.relevancy_training_status = relevancy_training_status
         self.collection_count = collection_count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ProjectListDetails':
-        """Initialize a ProjectListDetails object from a json dictionary."""
-        args = {}
-        if 'project_id' in _dict:
-            args['project_id'] = _dict.get('project_id')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'relevancy_training_status' in _dict:
-            args[
-                'relevancy_training_status'] = ProjectListDetailsRelevancyTrainingStatus.from_dict(
-                    _dict.get('relevancy_training_status'))
-        if 'collection_count' in _dict:
-            args['collection_count'] = _dict.get('collection_count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ProjectListDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'project_id') and getattr(self,
-                                                   'project_id') is not None:
-            _dict['project_id'] = getattr(self, 'project_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'relevancy_training_status'
-                  ) and self.relevancy_training_status is not None:
-            _dict[
-                'relevancy_training_status'] = self.relevancy_training_status.to_dict(
-                )
-        if hasattr(self, 'collection_count') and getattr(
-                self, 'collection_count') is not None:
-            _dict['collection_count'] = getattr(self, 'collection_count')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ProjectListDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ProjectListDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ProjectListDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of project.
@@ -4484,7 +3323,7 @@ class ProjectListDetails():
         OTHER = 'other'
 
 
-class ProjectListDetailsRelevancyTrainingStatus():
+class ProjectListDetailsRelevancyTrainingStatus(Model):
     """
     Relevancy training status information for this project.
 
@@ -4506,6 +3345,22 @@ class ProjectListDetailsRelevancyTrainingStatus():
           queries required to train has been met.
     """
 
+    __slots__ = ('data_updated', 'total_examples', 'sufficient_label_diversity',
+                 'processing', 'minimum_examples_added', 'successfully_trained',
+                 'available', 'notices', 'minimum_queries_added')
+
+    _fields = (
+        ModelField('data_updated'),
+        ModelField('total_examples'),
+        ModelField('sufficient_label_diversity'),
+        ModelField('processing'),
+        ModelField('minimum_examples_added'),
+        ModelField('successfully_trained'),
+        ModelField('available'),
+        ModelField('notices'),
+        ModelField('minimum_queries_added'),
+    )
+
     def __init__(self,
                  *,
                  data_updated: str = None,
@@ -4547,87 +3402,8 @@ class ProjectListDetailsRelevancyTrainingStatus():
         self.notices = notices
         self.minimum_queries_added = minimum_queries_added
 
-    @classmethod
-    def from_dict(cls,
-                  _dict: Dict) -> 'ProjectListDetailsRelevancyTrainingStatus':
-        """Initialize a ProjectListDetailsRelevancyTrainingStatus object from a json dictionary."""
-        args = {}
-        if 'data_updated' in _dict:
-            args['data_updated'] = _dict.get('data_updated')
-        if 'total_examples' in _dict:
-            args['total_examples'] = _dict.get('total_examples')
-        if 'sufficient_label_diversity' in _dict:
-            args['sufficient_label_diversity'] = _dict.get(
-                'sufficient_label_diversity')
-        if 'processing' in _dict:
-            args['processing'] = _dict.get('processing')
-        if 'minimum_examples_added' in _dict:
-            args['minimum_examples_added'] = _dict.get('minimum_examples_added')
-        if 'successfully_trained' in _dict:
-            args['successfully_trained'] = _dict.get('successfully_trained')
-        if 'available' in _dict:
-            args['available'] = _dict.get('available')
-        if 'notices' in _dict:
-            args['notices'] = _dict.get('notices')
-        if 'minimum_queries_added' in _dict:
-            args['minimum_queries_added'] = _dict.get('minimum_queries_added')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ProjectListDetailsRelevancyTrainingStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'data_updated') and self.data_updated is not None:
-            _dict['data_updated'] = self.data_updated
-        if hasattr(self, 'total_examples') and self.total_examples is not None:
-            _dict['total_examples'] = self.total_examples
-        if hasattr(self, 'sufficient_label_diversity'
-                  ) and self.sufficient_label_diversity is not None:
-            _dict[
-                'sufficient_label_diversity'] = self.sufficient_label_diversity
-        if hasattr(self, 'processing') and self.processing is not None:
-            _dict['processing'] = self.processing
-        if hasattr(self, 'minimum_examples_added'
-                  ) and self.minimum_examples_added is not None:
-            _dict['minimum_examples_added'] = self.minimum_examples_added
-        if hasattr(self, 'successfully_trained'
-                  ) and self.successfully_trained is not None:
-            _dict['successfully_trained'] = self.successfully_trained
-        if hasattr(self, 'available') and self.available is not None:
-            _dict['available'] = self.available
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = self.notices
-        if hasattr(self, 'minimum_queries_added'
-                  ) and self.minimum_queries_added is not None:
-            _dict['minimum_queries_added'] = self.minimum_queries_added
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ProjectListDetailsRelevancyTrainingStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self,
-               other: 'ProjectListDetailsRelevancyTrainingStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self,
-               other: 'ProjectListDetailsRelevancyTrainingStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryAggregation():
+class QueryAggregation(Model):
     """
     An abstract aggregation type produced by Discovery to analyze the input provided.
 
@@ -4636,6 +3412,28 @@ class QueryAggregation():
           top_hits.
     """
 
+    __slots__ = ('type',)
+
+    _fields = (
+        ModelField('type', required=True),
+    )
+
+    _discriminator = ModelDiscriminator(
+        'type', {
+            'term': 'QueryTermAggregation',
+            'histogram': 'QueryHistogramAggregation',
+            'timeslice': 'QueryTimesliceAggregation',
+            'nested': 'QueryNestedAggregation',
+            'filter': 'QueryFilterAggregation',
+            'min': 'QueryCalculationAggregation',
+            'max': 'QueryCalculationAggregation',
+            'sum': 'QueryCalculationAggregation',
+            'average': 'QueryCalculationAggregation',
+            'unique_count': 'QueryCalculationAggregation',
+            'top_hits': 'QueryTopHitsAggregation',
+            'group_by': 'QueryGroupByAggregation'
+        })
+
     def __init__(self, type: str) -> None:
         """
         Initialize a QueryAggregation object.
@@ -4646,82 +3444,8 @@ class QueryAggregation():
         """
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryAggregation':
-        """Initialize a QueryAggregation object from a json dictionary."""
-        disc_class = cls._get_class_by_discriminator(_dict)
-        if disc_class != cls:
-            return disc_class.from_dict(_dict)
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryAggregation JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-    @classmethod
-    def _get_class_by_discriminator(cls, _dict: Dict) -> object:
-        mapping = {}
-        mapping['term'] = 'QueryTermAggregation'
-        mapping['histogram'] = 'QueryHistogramAggregation'
-        mapping['timeslice'] = 'QueryTimesliceAggregation'
-        mapping['nested'] = 'QueryNestedAggregation'
-        mapping['filter'] = 'QueryFilterAggregation'
-        mapping['min'] = 'QueryCalculationAggregation'
-        mapping['max'] = 'QueryCalculationAggregation'
-        mapping['sum'] = 'QueryCalculationAggregation'
-        mapping['average'] = 'QueryCalculationAggregation'
-        mapping['unique_count'] = 'QueryCalculationAggregation'
-        mapping['top_hits'] = 'QueryTopHitsAggregation'
-        mapping['group_by'] = 'QueryGroupByAggregation'
-        disc_value = _dict.get('type')
-        if disc_value is None:
-            raise ValueError(
-                'Discriminator property \'type\' not found in QueryAggregation JSON'
-            )
-        class_name = mapping.get(disc_value, disc_value)
-        try:
-            disc_class = getattr(sys.modules[__name__], class_name)
-        except AttributeError:
-            disc_class = cls
-        if isinstance(disc_class, object):
-            return disc_class
-        raise TypeError('%s is not a discriminator class' % class_name)
-
-
-class QueryGroupByAggregationResult():
+class QueryGroupByAggregationResult(Model):
     """
     Top value result for the term aggregation.
 
@@ -4738,6 +3462,19 @@ class QueryGroupByAggregationResult():
           sub-aggregations.
     """
 
+    __slots__ = ('key', 'matching_results', 'relevancy',
+                 'total_matching_documents', 'estimated_matching_documents',
+                 'aggregations')
+
+    _fields = (
+        ModelField('key', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('relevancy'),
+        ModelField('total_matching_documents'),
+        ModelField('estimated_matching_documents'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  key: str,
                  matching_results: int,
@@ -4770,82 +3507,8 @@ class QueryGroupByAggregationResult():
         self.estimated_matching_documents = estimated_matching_documents
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryGroupByAggregationResult':
-        """Initialize a QueryGroupByAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        else:
-            raise ValueError(
-                'Required property \'key\' not present in QueryGroupByAggregationResult JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryGroupByAggregationResult JSON'
-            )
-        if 'relevancy' in _dict:
-            args['relevancy'] = _dict.get('relevancy')
-        if 'total_matching_documents' in _dict:
-            args['total_matching_documents'] = _dict.get(
-                'total_matching_documents')
-        if 'estimated_matching_documents' in _dict:
-            args['estimated_matching_documents'] = _dict.get(
-                'estimated_matching_documents')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryGroupByAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'relevancy') and self.relevancy is not None:
-            _dict['relevancy'] = self.relevancy
-        if hasattr(self, 'total_matching_documents'
-                  ) and self.total_matching_documents is not None:
-            _dict['total_matching_documents'] = self.total_matching_documents
-        if hasattr(self, 'estimated_matching_documents'
-                  ) and self.estimated_matching_documents is not None:
-            _dict[
-                'estimated_matching_documents'] = self.estimated_matching_documents
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryGroupByAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryGroupByAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryGroupByAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryHistogramAggregationResult():
+class QueryHistogramAggregationResult(Model):
     """
     Histogram numeric interval result.
 
@@ -4856,6 +3519,14 @@ class QueryHistogramAggregationResult():
           sub-aggregations.
     """
 
+    __slots__ = ('key', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('key', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  key: int,
                  matching_results: int,
@@ -4874,65 +3545,8 @@ class QueryHistogramAggregationResult():
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryHistogramAggregationResult':
-        """Initialize a QueryHistogramAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        else:
-            raise ValueError(
-                'Required property \'key\' not present in QueryHistogramAggregationResult JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryHistogramAggregationResult JSON'
-            )
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryHistogramAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryHistogramAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryHistogramAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryHistogramAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryLargePassages():
+class QueryLargePassages(Model):
     """
     Configuration for passage retrieval.
 
@@ -4974,6 +3588,21 @@ class QueryLargePassages():
           return per passage if the **find_answers** parmeter is specified as `true`.
     """
 
+    __slots__ = ('enabled', 'per_document', 'max_per_document', 'fields',
+                 'count', 'characters', 'find_answers',
+                 'max_answers_per_passage')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('per_document'),
+        ModelField('max_per_document'),
+        ModelField('fields'),
+        ModelField('count'),
+        ModelField('characters'),
+        ModelField('find_answers'),
+        ModelField('max_answers_per_passage'),
+    )
+
     def __init__(self,
                  *,
                  enabled: bool = None,
@@ -5038,77 +3667,8 @@ class QueryLargePassages():
         self.find_answers = find_answers
         self.max_answers_per_passage = max_answers_per_passage
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryLargePassages':
-        """Initialize a QueryLargePassages object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'per_document' in _dict:
-            args['per_document'] = _dict.get('per_document')
-        if 'max_per_document' in _dict:
-            args['max_per_document'] = _dict.get('max_per_document')
-        if 'fields' in _dict:
-            args['fields'] = _dict.get('fields')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'characters' in _dict:
-            args['characters'] = _dict.get('characters')
-        if 'find_answers' in _dict:
-            args['find_answers'] = _dict.get('find_answers')
-        if 'max_answers_per_passage' in _dict:
-            args['max_answers_per_passage'] = _dict.get(
-                'max_answers_per_passage')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryLargePassages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'per_document') and self.per_document is not None:
-            _dict['per_document'] = self.per_document
-        if hasattr(self,
-                   'max_per_document') and self.max_per_document is not None:
-            _dict['max_per_document'] = self.max_per_document
-        if hasattr(self, 'fields') and self.fields is not None:
-            _dict['fields'] = self.fields
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'characters') and self.characters is not None:
-            _dict['characters'] = self.characters
-        if hasattr(self, 'find_answers') and self.find_answers is not None:
-            _dict['find_answers'] = self.find_answers
-        if hasattr(self, 'max_answers_per_passage'
-                  ) and self.max_answers_per_passage is not None:
-            _dict['max_answers_per_passage'] = self.max_answers_per_passage
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryLargePassages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryLargePassages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryLargePassages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class QueryLargeSuggestedRefinements():
+class QueryLargeSuggestedRefinements(Model):
     """
     Configuration for suggested refinements. Available with Premium plans only.
 
@@ -5117,6 +3677,13 @@ class QueryLargeSuggestedRefinements():
           returned. The maximum is `100`.
     """
 
+    __slots__ = ('enabled', 'count')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('count'),
+    )
+
     def __init__(self, *, enabled: bool = None, count: int = None) -> None:
         """
         Initialize a QueryLargeSuggestedRefinements object.
@@ -5128,50 +3695,8 @@ class QueryLargeSuggestedRefinements():
         self.enabled = enabled
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryLargeSuggestedRefinements':
-        """Initialize a QueryLargeSuggestedRefinements object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryLargeSuggestedRefinements object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryLargeSuggestedRefinements object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryLargeSuggestedRefinements') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'QueryLargeSuggestedRefinements') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryLargeTableResults():
+class QueryLargeTableResults(Model):
     """
     Configuration for table retrieval.
 
@@ -5179,6 +3704,13 @@ class QueryLargeTableResults():
     :attr int count: (optional) Maximum number of tables to return.
     """
 
+    __slots__ = ('enabled', 'count')
+
+    _fields = (
+        ModelField('enabled'),
+        ModelField('count'),
+    )
+
     def __init__(self, *, enabled: bool = None, count: int = None) -> None:
         """
         Initialize a QueryLargeTableResults object.
@@ -5189,50 +3721,8 @@ class QueryLargeTableResults():
         self.enabled = enabled
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryLargeTableResults':
-        """Initialize a QueryLargeTableResults object from a json dictionary."""
-        args = {}
-        if 'enabled' in _dict:
-            args['enabled'] = _dict.get('enabled')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryLargeTableResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'enabled') and self.enabled is not None:
-            _dict['enabled'] = self.enabled
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryLargeTableResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryLargeTableResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryLargeTableResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryNoticesResponse():
+class QueryNoticesResponse(Model):
     """
     Object that contains notice query results.
 
@@ -5241,6 +3731,13 @@ class QueryNoticesResponse():
           query.
     """
 
+    __slots__ = ('matching_results', 'notices')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('notices', 'list', 'Notice'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -5255,53 +3752,8 @@ class QueryNoticesResponse():
         self.matching_results = matching_results
         self.notices = notices
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryNoticesResponse':
-        """Initialize a QueryNoticesResponse object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryNoticesResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryNoticesResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryNoticesResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'QueryNoticesResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryResponse():
+class QueryResponse(Model):
     """
     A response that contains the documents and aggregations for the query.
 
@@ -5322,6 +3774,21 @@ class QueryResponse():
           the query from across all of the collections in the project.
     """
 
+    __slots__ = ('matching_results', 'results', 'aggregations',
+                 'retrieval_details', 'suggested_query',
+                 'suggested_refinements', 'table_results', 'passages')
+
+    _fields = (
+        ModelField('matching_results'),
+        ModelField('results', 'list', 'QueryResult'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+        ModelField('retrieval_details', 'model', 'RetrievalDetails'),
+        ModelField('suggested_query'),
+        ModelField('suggested_refinements', 'list', 'QuerySuggestedRefinement'),
+        ModelField('table_results', 'list', 'QueryTableResult'),
+        ModelField('passages', 'list', 'QueryResponsePassage'),
+    )
+
     def __init__(self,
                  *,
                  matching_results: int = None,
@@ -5362,93 +3829,8 @@ class QueryResponse():
         self.table_results = table_results
         self.passages = passages
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResponse':
-        """Initialize a QueryResponse object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryResult.from_dict(x) for x in _dict.get('results')
-            ]
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        if 'retrieval_details' in _dict:
-            args['retrieval_details'] = RetrievalDetails.from_dict(
-                _dict.get('retrieval_details'))
-        if 'suggested_query' in _dict:
-            args['suggested_query'] = _dict.get('suggested_query')
-        if 'suggested_refinements' in _dict:
-            args['suggested_refinements'] = [
-                QuerySuggestedRefinement.from_dict(x)
-                for x in _dict.get('suggested_refinements')
-            ]
-        if 'table_results' in _dict:
-            args['table_results'] = [
-                QueryTableResult.from_dict(x)
-                for x in _dict.get('table_results')
-            ]
-        if 'passages' in _dict:
-            args['passages'] = [
-                QueryResponsePassage.from_dict(x) for x in _dict.get('passages')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        if hasattr(self,
-                   'retrieval_details') and self.retrieval_details is not None:
-            _dict['retrieval_details'] = self.retrieval_details.to_dict()
-        if hasattr(self,
-                   'suggested_query') and self.suggested_query is not None:
-            _dict['suggested_query'] = self.suggested_query
-        if hasattr(self, 'suggested_refinements'
-                  ) and self.suggested_refinements is not None:
-            _dict['suggested_refinements'] = [
-                x.to_dict() for x in self.suggested_refinements
-            ]
-        if hasattr(self, 'table_results') and self.table_results is not None:
-            _dict['table_results'] = [x.to_dict() for x in self.table_results]
-        if hasattr(self, 'passages') and self.passages is not None:
-            _dict['passages'] = [x.to_dict() for x in self.passages]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class QueryResponsePassage():
+class QueryResponsePassage(Model):
     """
     A passage query response.
 
@@ -5470,6 +3852,22 @@ class QueryResponsePassage():
           answers to the specified query.
     """
 
+    __slots__ = ('passage_text', 'passage_score', 'document_id',
+                 'collection_id', 'start_offset', 'end_offset', 'field',
+                 'confidence', 'answers')
+
+    _fields = (
+        ModelField('passage_text'),
+        ModelField('passage_score'),
+        ModelField('document_id'),
+        ModelField('collection_id'),
+        ModelField('start_offset'),
+        ModelField('end_offset'),
+        ModelField('field'),
+        ModelField('confidence'),
+        ModelField('answers', 'list', 'ResultPassageAnswer'),
+    )
+
     def __init__(self,
                  *,
                  passage_text: str = None,
@@ -5512,80 +3910,8 @@ class QueryResponsePassage():
         self.confidence = confidence
         self.answers = answers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResponsePassage':
-        """Initialize a QueryResponsePassage object from a json dictionary."""
-        args = {}
-        if 'passage_text' in _dict:
-            args['passage_text'] = _dict.get('passage_text')
-        if 'passage_score' in _dict:
-            args['passage_score'] = _dict.get('passage_score')
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'start_offset' in _dict:
-            args['start_offset'] = _dict.get('start_offset')
-        if 'end_offset' in _dict:
-            args['end_offset'] = _dict.get('end_offset')
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'answers' in _dict:
-            args['answers'] = [
-                ResultPassageAnswer.from_dict(x) for x in _dict.get('answers')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResponsePassage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'passage_text') and self.passage_text is not None:
-            _dict['passage_text'] = self.passage_text
-        if hasattr(self, 'passage_score') and self.passage_score is not None:
-            _dict['passage_score'] = self.passage_score
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'start_offset') and self.start_offset is not None:
-            _dict['start_offset'] = self.start_offset
-        if hasattr(self, 'end_offset') and self.end_offset is not None:
-            _dict['end_offset'] = self.end_offset
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'answers') and self.answers is not None:
-            _dict['answers'] = [x.to_dict() for x in self.answers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResponsePassage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResponsePassage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'QueryResponsePassage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryResult():
+class QueryResult(Model):
     """
     Result document for the specified query.
 
@@ -5596,6 +3922,16 @@ class QueryResult():
           document that best matches the query.
     """
 
+    __slots__ = ('__dict__',)
+
+    _fields = (
+        ModelField('document_id', required=True),
+        ModelField('metadata'),
+        ModelField('result_metadata', 'model', 'QueryResultMetadata',
+                   required=True),
+        ModelField('document_passages', 'list', 'QueryResultPassage'),
+    )
+
     # The set of defined properties for the class
     _properties = frozenset(
         ['document_id', 'metadata', 'result_metadata', 'document_passages'])
@@ -5624,65 +3960,6 @@ class QueryResult():
         for _key, _value in kwargs.items():
             setattr(self, _key, _value)
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResult':
-        """Initialize a QueryResult object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        else:
-            raise ValueError(
-                'Required property \'document_id\' not present in QueryResult JSON'
-            )
-        if 'metadata' in _dict:
-            args['metadata'] = _dict.get('metadata')
-        if 'result_metadata' in _dict:
-            args['result_metadata'] = QueryResultMetadata.from_dict(
-                _dict.get('result_metadata'))
-        else:
-            raise ValueError(
-                'Required property \'result_metadata\' not present in QueryResult JSON'
-            )
-        if 'document_passages' in _dict:
-            args['document_passages'] = [
-                QueryResultPassage.from_dict(x)
-                for x in _dict.get('document_passages')
-            ]
-        args.update(
-            {k: v for (k, v) in _dict.items() if k not in cls._properties})
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata
-        if hasattr(self,
-                   'result_metadata') and self.result_metadata is not None:
-            _dict['result_metadata'] = self.result_metadata.to_dict()
-        if hasattr(self,
-                   'document_passages') and self.document_passages is not None:
-            _dict['document_passages'] = [
-                x.to_dict() for x in self.document_passages
-            ]
-        for _key in [
-                k for k in vars(self).keys() if k not in QueryResult._properties
-        ]:
-            if getattr(self, _key, None) is not None:
-                _dict[_key] = getattr(self, _key)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
     def get_properties(self) -> Dict:
         """Return a dictionary of arbitrary properties from this instance of QueryResult"""
         _dict = {}
@@ -5704,22 +3981,8 @@ class QueryResult():
             if _key not in QueryResult._properties:
                 setattr(self, _key, _value)
 
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class QueryResultMetadata():
+class QueryResultMetadata(Model):
     """
     Metadata of a query result.
 
@@ -5736,6 +3999,14 @@ class QueryResultMetadata():
           in the query.
     """
 
+    __slots__ = ('document_retrieval_source', 'collection_id', 'confidence')
+
+    _fields = (
+        ModelField('document_retrieval_source'),
+        ModelField('collection_id', required=True),
+        ModelField('confidence'),
+    )
+
     def __init__(self,
                  collection_id: str,
                  *,
@@ -5760,58 +4031,6 @@ class QueryResultMetadata():
         self.collection_id = collection_id
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResultMetadata':
-        """Initialize a QueryResultMetadata object from a json dictionary."""
-        args = {}
-        if 'document_retrieval_source' in _dict:
-            args['document_retrieval_source'] = _dict.get(
-                'document_retrieval_source')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in QueryResultMetadata JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResultMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_retrieval_source'
-                  ) and self.document_retrieval_source is not None:
-            _dict['document_retrieval_source'] = self.document_retrieval_source
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResultMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryResultMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResultMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class DocumentRetrievalSourceEnum(str, Enum):
         """
         The document retrieval source that produced this search result.
@@ -5820,7 +4039,7 @@ class QueryResultMetadata():
         CURATION = 'curation'
 
 
-class QueryResultPassage():
+class QueryResultPassage(Model):
     """
     A passage query result.
 
@@ -5837,6 +4056,18 @@ class QueryResultPassage():
           to the specified query.
     """
 
+    __slots__ = ('passage_text', 'start_offset', 'end_offset', 'field',
+                 'confidence', 'answers')
+
+    _fields = (
+        ModelField('passage_text'),
+        ModelField('start_offset'),
+        ModelField('end_offset'),
+        ModelField('field'),
+        ModelField('confidence'),
+        ModelField('answers', 'list', 'ResultPassageAnswer'),
+    )
+
     def __init__(self,
                  *,
                  passage_text: str = None,
@@ -5867,74 +4098,20 @@ class QueryResultPassage():
         self.confidence = confidence
         self.answers = answers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryResultPassage':
-        """Initialize a QueryResultPassage object from a json dictionary."""
-        args = {}
-        if 'passage_text' in _dict:
-            args['passage_text'] = _dict.get('passage_text')
-        if 'start_offset' in _dict:
-            args['start_offset'] = _dict.get('start_offset')
-        if 'end_offset' in _dict:
-            args['end_offset'] = _dict.get('end_offset')
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'answers' in _dict:
-            args['answers'] = [
-                ResultPassageAnswer.from_dict(x) for x in _dict.get('answers')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryResultPassage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'passage_text') and self.passage_text is not None:
-            _dict['passage_text'] = self.passage_text
-        if hasattr(self, 'start_offset') and self.start_offset is not None:
-            _dict['start_offset'] = self.start_offset
-        if hasattr(self, 'end_offset') and self.end_offset is not None:
-            _dict['end_offset'] = self.end_offset
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'answers') and self.answers is not None:
-            _dict['answers'] = [x.to_dict() for x in self.answers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryResultPassage object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'QueryResultPassage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryResultPassage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QuerySuggestedRefinement():
+class QuerySuggestedRefinement(Model):
     """
     A suggested additional query term or terms user to filter results.
 
     :attr str text: (optional) The text used to filter.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a QuerySuggestedRefinement object.
@@ -5943,46 +4120,8 @@ class QuerySuggestedRefinement():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QuerySuggestedRefinement':
-        """Initialize a QuerySuggestedRefinement object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QuerySuggestedRefinement object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
 
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QuerySuggestedRefinement object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QuerySuggestedRefinement') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QuerySuggestedRefinement') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryTableResult():
+class QueryTableResult(Model):
     """
     A tables whose content or context match a search query.
 
@@ -5998,6 +4137,18 @@ class QueryTableResult():
           Understanding Enrichment.
     """
 
+    __slots__ = ('table_id', 'source_document_id', 'collection_id',
+                 'table_html', 'table_html_offset', 'table')
+
+    _fields = (
+        ModelField('table_id'),
+        ModelField('source_document_id'),
+        ModelField('collection_id'),
+        ModelField('table_html'),
+        ModelField('table_html_offset'),
+        ModelField('table', 'model', 'TableResultTable'),
+    )
+
     def __init__(self,
                  *,
                  table_id: str = None,
@@ -6027,69 +4178,8 @@ class QueryTableResult():
         self.table_html_offset = table_html_offset
         self.table = table
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTableResult':
-        """Initialize a QueryTableResult object from a json dictionary."""
-        args = {}
-        if 'table_id' in _dict:
-            args['table_id'] = _dict.get('table_id')
-        if 'source_document_id' in _dict:
-            args['source_document_id'] = _dict.get('source_document_id')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'table_html' in _dict:
-            args['table_html'] = _dict.get('table_html')
-        if 'table_html_offset' in _dict:
-            args['table_html_offset'] = _dict.get('table_html_offset')
-        if 'table' in _dict:
-            args['table'] = TableResultTable.from_dict(_dict.get('table'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTableResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'table_id') and self.table_id is not None:
-            _dict['table_id'] = self.table_id
-        if hasattr(
-                self,
-                'source_document_id') and self.source_document_id is not None:
-            _dict['source_document_id'] = self.source_document_id
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'table_html') and self.table_html is not None:
-            _dict['table_html'] = self.table_html
-        if hasattr(self,
-                   'table_html_offset') and self.table_html_offset is not None:
-            _dict['table_html_offset'] = self.table_html_offset
-        if hasattr(self, 'table') and self.table is not None:
-            _dict['table'] = self.table.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTableResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTableResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTableResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class QueryTermAggregationResult():
+class QueryTermAggregationResult(Model):
     """
     Top value result for the term aggregation.
 
@@ -6106,6 +4196,19 @@ class QueryTermAggregationResult():
           sub-aggregations.
     """
 
+    __slots__ = ('key', 'matching_results', 'relevancy',
+                 'total_matching_documents', 'estimated_matching_documents',
+                 'aggregations')
+
+    _fields = (
+        ModelField('key', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('relevancy'),
+        ModelField('total_matching_documents'),
+        ModelField('estimated_matching_documents'),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  key: str,
                  matching_results: int,
@@ -6138,82 +4241,8 @@ class QueryTermAggregationResult():
         self.estimated_matching_documents = estimated_matching_documents
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTermAggregationResult':
-        """Initialize a QueryTermAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        else:
-            raise ValueError(
-                'Required property \'key\' not present in QueryTermAggregationResult JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryTermAggregationResult JSON'
-            )
-        if 'relevancy' in _dict:
-            args['relevancy'] = _dict.get('relevancy')
-        if 'total_matching_documents' in _dict:
-            args['total_matching_documents'] = _dict.get(
-                'total_matching_documents')
-        if 'estimated_matching_documents' in _dict:
-            args['estimated_matching_documents'] = _dict.get(
-                'estimated_matching_documents')
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTermAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'relevancy') and self.relevancy is not None:
-            _dict['relevancy'] = self.relevancy
-        if hasattr(self, 'total_matching_documents'
-                  ) and self.total_matching_documents is not None:
-            _dict['total_matching_documents'] = self.total_matching_documents
-        if hasattr(self, 'estimated_matching_documents'
-                  ) and self.estimated_matching_documents is not None:
-            _dict[
-                'estimated_matching_documents'] = self.estimated_matching_documents
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTermAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTermAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTermAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class QueryTimesliceAggregationResult():
+class QueryTimesliceAggregationResult(Model):
     """
     A timeslice interval segment.
 
@@ -6227,6 +4256,15 @@ class QueryTimesliceAggregationResult():
           sub-aggregations.
     """
 
+    __slots__ = ('key_as_string', 'key', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('key_as_string', required=True),
+        ModelField('key', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  key_as_string: str,
                  key: int,
@@ -6250,73 +4288,8 @@ class QueryTimesliceAggregationResult():
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTimesliceAggregationResult':
-        """Initialize a QueryTimesliceAggregationResult object from a json dictionary."""
-        args = {}
-        if 'key_as_string' in _dict:
-            args['key_as_string'] = _dict.get('key_as_string')
-        else:
-            raise ValueError(
-                'Required property \'key_as_string\' not present in QueryTimesliceAggregationResult JSON'
-            )
-        if 'key' in _dict:
-            args['key'] = _dict.get('key')
-        else:
-            raise ValueError(
-                'Required property \'key\' not present in QueryTimesliceAggregationResult JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryTimesliceAggregationResult JSON'
-            )
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTimesliceAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key_as_string') and self.key_as_string is not None:
-            _dict['key_as_string'] = self.key_as_string
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTimesliceAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'QueryTimesliceAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTimesliceAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class QueryTopHitsAggregationResult():
+class QueryTopHitsAggregationResult(Model):
     """
     A query response that contains the matching documents for the preceding aggregations.
 
@@ -6324,6 +4297,13 @@ class QueryTopHitsAggregationResult():
     :attr List[dict] hits: (optional) An array of the document results.
     """
 
+    __slots__ = ('matching_results', 'hits')
+
+    _fields = (
+        ModelField('matching_results', required=True),
+        ModelField('hits'),
+    )
+
     def __init__(self,
                  matching_results: int,
                  *,
@@ -6337,55 +4317,8 @@ class QueryTopHitsAggregationResult():
         self.matching_results = matching_results
         self.hits = hits
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTopHitsAggregationResult':
-        """Initialize a QueryTopHitsAggregationResult object from a json dictionary."""
-        args = {}
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryTopHitsAggregationResult JSON'
-            )
-        if 'hits' in _dict:
-            args['hits'] = _dict.get('hits')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTopHitsAggregationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'hits') and self.hits is not None:
-            _dict['hits'] = self.hits
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTopHitsAggregationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTopHitsAggregationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTopHitsAggregationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class ResultPassageAnswer():
+class ResultPassageAnswer(Model):
     """
     Object that contains a potential answer to the specified query.
 
@@ -6399,6 +4332,15 @@ class ResultPassageAnswer():
           answer is relevant.
     """
 
+    __slots__ = ('answer_text', 'start_offset', 'end_offset', 'confidence')
+
+    _fields = (
+        ModelField('answer_text'),
+        ModelField('start_offset'),
+        ModelField('end_offset'),
+        ModelField('confidence'),
+    )
+
     def __init__(self,
                  *,
                  answer_text: str = None,
@@ -6422,58 +4364,8 @@ class ResultPassageAnswer():
         self.end_offset = end_offset
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ResultPassageAnswer':
-        """Initialize a ResultPassageAnswer object from a json dictionary."""
-        args = {}
-        if 'answer_text' in _dict:
-            args['answer_text'] = _dict.get('answer_text')
-        if 'start_offset' in _dict:
-            args['start_offset'] = _dict.get('start_offset')
-        if 'end_offset' in _dict:
-            args['end_offset'] = _dict.get('end_offset')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ResultPassageAnswer object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'answer_text') and self.answer_text is not None:
-            _dict['answer_text'] = self.answer_text
-        if hasattr(self, 'start_offset') and self.start_offset is not None:
-            _dict['start_offset'] = self.start_offset
-        if hasattr(self, 'end_offset') and self.end_offset is not None:
-            _dict['end_offset'] = self.end_offset
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ResultPassageAnswer object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ResultPassageAnswer') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ResultPassageAnswer') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
-class RetrievalDetails():
+class RetrievalDetails(Model):
     """
     An object contain retrieval type information.
 
@@ -6485,6 +4377,12 @@ class RetrievalDetails():
           listed as `untrained`.
     """
 
+    __slots__ = ('document_retrieval_strategy',)
+
+    _fields = (
+        ModelField('document_retrieval_strategy'),
+    )
+
     def __init__(self, *, document_retrieval_strategy: str = None) -> None:
         """
         Initialize a RetrievalDetails object.
@@ -6498,47 +4396,6 @@ class RetrievalDetails():
         """
         self.document_retrieval_strategy = document_retrieval_strategy
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RetrievalDetails':
-        """Initialize a RetrievalDetails object from a json dictionary."""
-        args = {}
-        if 'document_retrieval_strategy' in _dict:
-            args['document_retrieval_strategy'] = _dict.get(
-                'document_retrieval_strategy')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RetrievalDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_retrieval_strategy'
-                  ) and self.document_retrieval_strategy is not None:
-            _dict[
-                'document_retrieval_strategy'] = self.document_retrieval_strategy
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RetrievalDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RetrievalDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RetrievalDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class DocumentRetrievalStrategyEnum(str, Enum):
         """
         Identifies the document retrieval strategy used for this query.
@@ -6552,7 +4409,7 @@ class RetrievalDetails():
         RELEVANCY_TRAINING = 'relevancy_training'
 
 
-class TableBodyCells():
+class TableBodyCells(Model):
     """
     Cells that are not table header, column header, or row header cells.
 
@@ -6586,6 +4443,32 @@ class TableBodyCells():
           attributes.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'row_index_begin',
+                 'row_index_end', 'column_index_begin', 'column_index_end',
+                 'row_header_ids', 'row_header_texts',
+                 'row_header_texts_normalized', 'column_header_ids',
+                 'column_header_texts', 'column_header_texts_normalized',
+                 'attributes')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'TableElementLocation'),
+        ModelField('text'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+        ModelField('row_header_ids', 'list', 'TableRowHeaderIds'),
+        ModelField('row_header_texts', 'list', 'TableRowHeaderTexts'),
+        ModelField('row_header_texts_normalized', 'list',
+                   'TableRowHeaderTextsNormalized'),
+        ModelField('column_header_ids', 'list', 'TableColumnHeaderIds'),
+        ModelField('column_header_texts', 'list', 'TableColumnHeaderTexts'),
+        ModelField('column_header_texts_normalized', 'list',
+                   'TableColumnHeaderTextsNormalized'),
+        ModelField('attributes', 'list', 'DocumentAttribute'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -6653,139 +4536,8 @@ class TableBodyCells():
         self.column_header_texts_normalized = column_header_texts_normalized
         self.attributes = attributes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableBodyCells':
-        """Initialize a TableBodyCells object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        if 'row_header_ids' in _dict:
-            args['row_header_ids'] = [
-                TableRowHeaderIds.from_dict(x)
-                for x in _dict.get('row_header_ids')
-            ]
-        if 'row_header_texts' in _dict:
-            args['row_header_texts'] = [
-                TableRowHeaderTexts.from_dict(x)
-                for x in _dict.get('row_header_texts')
-            ]
-        if 'row_header_texts_normalized' in _dict:
-            args['row_header_texts_normalized'] = [
-                TableRowHeaderTextsNormalized.from_dict(x)
-                for x in _dict.get('row_header_texts_normalized')
-            ]
-        if 'column_header_ids' in _dict:
-            args['column_header_ids'] = [
-                TableColumnHeaderIds.from_dict(x)
-                for x in _dict.get('column_header_ids')
-            ]
-        if 'column_header_texts' in _dict:
-            args['column_header_texts'] = [
-                TableColumnHeaderTexts.from_dict(x)
-                for x in _dict.get('column_header_texts')
-            ]
-        if 'column_header_texts_normalized' in _dict:
-            args['column_header_texts_normalized'] = [
-                TableColumnHeaderTextsNormalized.from_dict(x)
-                for x in _dict.get('column_header_texts_normalized')
-            ]
-        if 'attributes' in _dict:
-            args['attributes'] = [
-                DocumentAttribute.from_dict(x) for x in _dict.get('attributes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableBodyCells object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        if hasattr(self, 'row_header_ids') and self.row_header_ids is not None:
-            _dict['row_header_ids'] = [x.to_dict() for x in self.row_header_ids]
-        if hasattr(self,
-                   'row_header_texts') and self.row_header_texts is not None:
-            _dict['row_header_texts'] = [
-                x.to_dict() for x in self.row_header_texts
-            ]
-        if hasattr(self, 'row_header_texts_normalized'
-                  ) and self.row_header_texts_normalized is not None:
-            _dict['row_header_texts_normalized'] = [
-                x.to_dict() for x in self.row_header_texts_normalized
-            ]
-        if hasattr(self,
-                   'column_header_ids') and self.column_header_ids is not None:
-            _dict['column_header_ids'] = [
-                x.to_dict() for x in self.column_header_ids
-            ]
-        if hasattr(
-                self,
-                'column_header_texts') and self.column_header_texts is not None:
-            _dict['column_header_texts'] = [
-                x.to_dict() for x in self.column_header_texts
-            ]
-        if hasattr(self, 'column_header_texts_normalized'
-                  ) and self.column_header_texts_normalized is not None:
-            _dict['column_header_texts_normalized'] = [
-                x.to_dict() for x in self.column_header_texts_normalized
-            ]
-        if hasattr(self, 'attributes') and self.attributes is not None:
-            _dict['attributes'] = [x.to_dict() for x in self.attributes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableBodyCells object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'TableBodyCells') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableBodyCells') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableCellKey():
+class TableCellKey(Model):
     """
     A key in a key-value pair.
 
@@ -6797,6 +4549,14 @@ class TableCellKey():
           markup.
     """
 
+    __slots__ = ('cell_id', 'location', 'text')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'TableElementLocation'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -6816,55 +4576,8 @@ class TableCellKey():
         self.location = location
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableCellKey':
-        """Initialize a TableCellKey object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableCellKey object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableCellKey object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableCellKey') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableCellKey') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TableCellValues():
+class TableCellValues(Model):
     """
     A value in a key-value pair.
 
@@ -6876,6 +4589,14 @@ class TableCellValues():
           markup.
     """
 
+    __slots__ = ('cell_id', 'location', 'text')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'TableElementLocation'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -6895,55 +4616,8 @@ class TableCellValues():
         self.location = location
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableCellValues':
-        """Initialize a TableCellValues object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableCellValues object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableCellValues object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableCellValues') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TableCellValues') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableColumnHeaderIds():
+class TableColumnHeaderIds(Model):
     """
     An array of values, each being the `id` value of a column header that is applicable to
     the current cell.
@@ -6951,6 +4625,12 @@ class TableColumnHeaderIds():
     :attr str id: (optional) The `id` value of a column header.
     """
 
+    __slots__ = ('id',)
+
+    _fields = (
+        ModelField('id'),
+    )
+
     def __init__(self, *, id: str = None) -> None:
         """
         Initialize a TableColumnHeaderIds object.
@@ -6959,46 +4639,8 @@ class TableColumnHeaderIds():
         """
         self.id = id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableColumnHeaderIds':
-        """Initialize a TableColumnHeaderIds object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableColumnHeaderIds object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableColumnHeaderIds object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableColumnHeaderIds') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableColumnHeaderIds') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TableColumnHeaderTexts():
+class TableColumnHeaderTexts(Model):
     """
     An array of values, each being the `text` value of a column header that is applicable
     to the current cell.
@@ -7006,6 +4648,12 @@ class TableColumnHeaderTexts():
     :attr str text: (optional) The `text` value of a column header.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a TableColumnHeaderTexts object.
@@ -7014,46 +4662,8 @@ class TableColumnHeaderTexts():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableColumnHeaderTexts':
-        """Initialize a TableColumnHeaderTexts object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableColumnHeaderTexts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableColumnHeaderTexts object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'TableColumnHeaderTexts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableColumnHeaderTexts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableColumnHeaderTextsNormalized():
+class TableColumnHeaderTextsNormalized(Model):
     """
     If you provide customization input, the normalized version of the column header texts
     according to the customization; otherwise, the same value as `column_header_texts`.
@@ -7062,6 +4672,12 @@ class TableColumnHeaderTextsNormalized():
           text.
     """
 
+    __slots__ = ('text_normalized',)
+
+    _fields = (
+        ModelField('text_normalized'),
+    )
+
     def __init__(self, *, text_normalized: str = None) -> None:
         """
         Initialize a TableColumnHeaderTextsNormalized object.
@@ -7071,47 +4687,8 @@ class TableColumnHeaderTextsNormalized():
         """
         self.text_normalized = text_normalized
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableColumnHeaderTextsNormalized':
-        """Initialize a TableColumnHeaderTextsNormalized object from a json dictionary."""
-        args = {}
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableColumnHeaderTextsNormalized object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this TableColumnHeaderTextsNormalized object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableColumnHeaderTextsNormalized') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableColumnHeaderTextsNormalized') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableColumnHeaders():
+class TableColumnHeaders(Model):
     """
     Column-level cells, each applicable as a header to other cells in the same column as
     itself, of the current table.
@@ -7135,6 +4712,21 @@ class TableColumnHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'text_normalized',
+                 'row_index_begin', 'row_index_end', 'column_index_begin',
+                 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -7176,79 +4768,8 @@ class TableColumnHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableColumnHeaders':
-        """Initialize a TableColumnHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableColumnHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableColumnHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableColumnHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TableColumnHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableElementLocation():
+class TableElementLocation(Model):
     """
     The numeric location of the identified element in the document, represented with two
     integers labeled `begin` and `end`.
@@ -7257,6 +4778,13 @@ class TableElementLocation():
     :attr int end: The element's `end` index.
     """
 
+    __slots__ = ('begin', 'end')
+
+    _fields = (
+        ModelField('begin', required=True),
+        ModelField('end', required=True),
+    )
+
     def __init__(self, begin: int, end: int) -> None:
         """
         Initialize a TableElementLocation object.
@@ -7267,58 +4795,8 @@ class TableElementLocation():
         self.begin = begin
         self.end = end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableElementLocation':
-        """Initialize a TableElementLocation object from a json dictionary."""
-        args = {}
-        if 'begin' in _dict:
-            args['begin'] = _dict.get('begin')
-        else:
-            raise ValueError(
-                'Required property \'begin\' not present in TableElementLocation JSON'
-            )
-        if 'end' in _dict:
-            args['end'] = _dict.get('end')
-        else:
-            raise ValueError(
-                'Required property \'end\' not present in TableElementLocation JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableElementLocation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'begin') and self.begin is not None:
-            _dict['begin'] = self.begin
-        if hasattr(self, 'end') and self.end is not None:
-            _dict['end'] = self.end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableElementLocation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableElementLocation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableElementLocation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TableHeaders():
+class TableHeaders(Model):
     """
     The contents of the current table's header.
 
@@ -7338,6 +4816,19 @@ class TableHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'row_index_begin',
+                 'row_index_end', 'column_index_begin', 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location'),
+        ModelField('text'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -7374,74 +4865,8 @@ class TableHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableHeaders':
-        """Initialize a TableHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TableHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableKeyValuePairs():
+class TableKeyValuePairs(Model):
     """
     Key-value pairs detected across cell boundaries.
 
@@ -7450,6 +4875,13 @@ class TableKeyValuePairs():
           pair.
     """
 
+    __slots__ = ('key', 'value')
+
+    _fields = (
+        ModelField('key', 'model', 'TableCellKey'),
+        ModelField('value', 'list', 'TableCellValues'),
+    )
+
     def __init__(self,
                  *,
                  key: 'TableCellKey' = None,
@@ -7464,52 +4896,8 @@ class TableKeyValuePairs():
         self.key = key
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableKeyValuePairs':
-        """Initialize a TableKeyValuePairs object from a json dictionary."""
-        args = {}
-        if 'key' in _dict:
-            args['key'] = TableCellKey.from_dict(_dict.get('key'))
-        if 'value' in _dict:
-            args['value'] = [
-                TableCellValues.from_dict(x) for x in _dict.get('value')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableKeyValuePairs object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'key') and self.key is not None:
-            _dict['key'] = self.key.to_dict()
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = [x.to_dict() for x in self.value]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this TableKeyValuePairs object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableKeyValuePairs') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableKeyValuePairs') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableResultTable():
+class TableResultTable(Model):
     """
     Full table object retrieved from Table Understanding Enrichment.
 
@@ -7539,6 +4927,23 @@ class TableResultTable():
           entries across the document related to the current table being parsed.
     """
 
+    __slots__ = ('location', 'text', 'section_title', 'title', 'table_headers',
+                 'row_headers', 'column_headers', 'key_value_pairs',
+                 'body_cells', 'contexts')
+
+    _fields = (
+        ModelField('location', 'model', 'TableElementLocation'),
+        ModelField('text'),
+        ModelField('section_title', 'model', 'TableTextLocation'),
+        ModelField('title', 'model', 'TableTextLocation'),
+        ModelField('table_headers', 'list', 'TableHeaders'),
+        ModelField('row_headers', 'list', 'TableRowHeaders'),
+        ModelField('column_headers', 'list', 'TableColumnHeaders'),
+        ModelField('key_value_pairs', 'list', 'TableKeyValuePairs'),
+        ModelField('body_cells', 'list', 'TableBodyCells'),
+        ModelField('contexts', 'list', 'TableTextLocation'),
+    )
+
     def __init__(self,
                  *,
                  location: 'TableElementLocation' = None,
@@ -7591,101 +4996,8 @@ class TableResultTable():
         self.body_cells = body_cells
         self.contexts = contexts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableResultTable':
-        """Initialize a TableResultTable object from a json dictionary."""
-        args = {}
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'section_title' in _dict:
-            args['section_title'] = TableTextLocation.from_dict(
-                _dict.get('section_title'))
-        if 'title' in _dict:
-            args['title'] = TableTextLocation.from_dict(_dict.get('title'))
-        if 'table_headers' in _dict:
-            args['table_headers'] = [
-                TableHeaders.from_dict(x) for x in _dict.get('table_headers')
-            ]
-        if 'row_headers' in _dict:
-            args['row_headers'] = [
-                TableRowHeaders.from_dict(x) for x in _dict.get('row_headers')
-            ]
-        if 'column_headers' in _dict:
-            args['column_headers'] = [
-                TableColumnHeaders.from_dict(x)
-                for x in _dict.get('column_headers')
-            ]
-        if 'key_value_pairs' in _dict:
-            args['key_value_pairs'] = [
-                TableKeyValuePairs.from_dict(x)
-                for x in _dict.get('key_value_pairs')
-            ]
-        if 'body_cells' in _dict:
-            args['body_cells'] = [
-                TableBodyCells.from_dict(x) for x in _dict.get('body_cells')
-            ]
-        if 'contexts' in _dict:
-            args['contexts'] = [
-                TableTextLocation.from_dict(x) for x in _dict.get('contexts')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableResultTable object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'section_title') and self.section_title is not None:
-            _dict['section_title'] = self.section_title.to_dict()
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title.to_dict()
-        if hasattr(self, 'table_headers') and self.table_headers is not None:
-            _dict['table_headers'] = [x.to_dict() for x in self.table_headers]
-        if hasattr(self, 'row_headers') and self.row_headers is not None:
-            _dict['row_headers'] = [x.to_dict() for x in self.row_headers]
-        if hasattr(self, 'column_headers') and self.column_headers is not None:
-            _dict['column_headers'] = [x.to_dict() for x in self.column_headers]
-        if hasattr(self,
-                   'key_value_pairs') and self.key_value_pairs is not None:
-            _dict['key_value_pairs'] = [
-                x.to_dict() for x in self.key_value_pairs
-            ]
-        if hasattr(self, 'body_cells') and self.body_cells is not None:
-            _dict['body_cells'] = [x.to_dict() for x in self.body_cells]
-        if hasattr(self, 'contexts') and self.contexts is not None:
-            _dict['contexts'] = [x.to_dict() for x in self.contexts]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableResultTable object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableResultTable') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
 
-    def __ne__(self, other: 'TableResultTable') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableRowHeaderIds():
+class TableRowHeaderIds(Model):
     """
     An array of values, each being the `id` value of a row header that is applicable to
     this body cell.
@@ -7693,6 +5005,12 @@ class TableRowHeaderIds():
     :attr str id: (optional) The `id` values of a row header.
     """
 
+    __slots__ = ('id',)
+
+    _fields = (
+        ModelField('id'),
+    )
+
     def __init__(self, *, id: str = None) -> None:
         """
         Initialize a TableRowHeaderIds object.
@@ -7701,46 +5019,8 @@ class TableRowHeaderIds():
         """
         self.id = id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableRowHeaderIds':
-        """Initialize a TableRowHeaderIds object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableRowHeaderIds object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableRowHeaderIds object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableRowHeaderIds') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableRowHeaderIds') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TableRowHeaderTexts():
+class TableRowHeaderTexts(Model):
     """
     An array of values, each being the `text` value of a row header that is applicable to
     this body cell.
@@ -7748,6 +5028,12 @@ class TableRowHeaderTexts():
     :attr str text: (optional) The `text` value of a row header.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a TableRowHeaderTexts object.
@@ -7756,46 +5042,8 @@ class TableRowHeaderTexts():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableRowHeaderTexts':
-        """Initialize a TableRowHeaderTexts object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableRowHeaderTexts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableRowHeaderTexts object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'TableRowHeaderTexts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableRowHeaderTexts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableRowHeaderTextsNormalized():
+class TableRowHeaderTextsNormalized(Model):
     """
     If you provide customization input, the normalized version of the row header texts
     according to the customization; otherwise, the same value as `row_header_texts`.
@@ -7804,6 +5052,12 @@ class TableRowHeaderTextsNormalized():
           text.
     """
 
+    __slots__ = ('text_normalized',)
+
+    _fields = (
+        ModelField('text_normalized'),
+    )
+
     def __init__(self, *, text_normalized: str = None) -> None:
         """
         Initialize a TableRowHeaderTextsNormalized object.
@@ -7813,47 +5067,8 @@ class TableRowHeaderTextsNormalized():
         """
         self.text_normalized = text_normalized
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableRowHeaderTextsNormalized':
-        """Initialize a TableRowHeaderTextsNormalized object from a json dictionary."""
-        args = {}
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableRowHeaderTextsNormalized object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableRowHeaderTextsNormalized object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableRowHeaderTextsNormalized') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableRowHeaderTextsNormalized') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TableRowHeaders():
+class TableRowHeaders(Model):
     """
     Row-level cells, each applicable as a header to other cells in the same row as itself,
     of the current table.
@@ -7877,6 +5092,21 @@ class TableRowHeaders():
           location in the current table.
     """
 
+    __slots__ = ('cell_id', 'location', 'text', 'text_normalized',
+                 'row_index_begin', 'row_index_end', 'column_index_begin',
+                 'column_index_end')
+
+    _fields = (
+        ModelField('cell_id'),
+        ModelField('location', 'model', 'TableElementLocation'),
+        ModelField('text'),
+        ModelField('text_normalized'),
+        ModelField('row_index_begin'),
+        ModelField('row_index_end'),
+        ModelField('column_index_begin'),
+        ModelField('column_index_end'),
+    )
+
     def __init__(self,
                  *,
                  cell_id: str = None,
@@ -7918,80 +5148,8 @@ class TableRowHeaders():
         self.column_index_begin = column_index_begin
         self.column_index_end = column_index_end
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableRowHeaders':
-        """Initialize a TableRowHeaders object from a json dictionary."""
-        args = {}
-        if 'cell_id' in _dict:
-            args['cell_id'] = _dict.get('cell_id')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'text_normalized' in _dict:
-            args['text_normalized'] = _dict.get('text_normalized')
-        if 'row_index_begin' in _dict:
-            args['row_index_begin'] = _dict.get('row_index_begin')
-        if 'row_index_end' in _dict:
-            args['row_index_end'] = _dict.get('row_index_end')
-        if 'column_index_begin' in _dict:
-            args['column_index_begin'] = _dict.get('column_index_begin')
-        if 'column_index_end' in _dict:
-            args['column_index_end'] = _dict.get('column_index_end')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableRowHeaders object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'cell_id') and self.cell_id is not None:
-            _dict['cell_id'] = self.cell_id
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self,
-                   'text_normalized') and self.text_normalized is not None:
-            _dict['text_normalized'] = self.text_normalized
-        if hasattr(self,
-                   'row_index_begin') and self.row_index_begin is not None:
-            _dict['row_index_begin'] = self.row_index_begin
-        if hasattr(self, 'row_index_end') and self.row_index_end is not None:
-            _dict['row_index_end'] = self.row_index_end
-        if hasattr(
-                self,
-                'column_index_begin') and self.column_index_begin is not None:
-            _dict['column_index_begin'] = self.column_index_begin
-        if hasattr(self,
-                   'column_index_end') and self.column_index_end is not None:
-            _dict['column_index_end'] = self.column_index_end
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableRowHeaders object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'TableRowHeaders') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableRowHeaders') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TableTextLocation():
+class TableTextLocation(Model):
     """
     Text and associated location within a table.
 
@@ -8001,6 +5159,13 @@ class TableTextLocation():
           `begin` and `end`.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location', 'model', 'TableElementLocation'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -8016,51 +5181,8 @@ class TableTextLocation():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TableTextLocation':
-        """Initialize a TableTextLocation object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = TableElementLocation.from_dict(
-                _dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TableTextLocation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TableTextLocation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TableTextLocation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TableTextLocation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TrainingExample():
+class TrainingExample(Model):
     """
     Object that contains example response details for a training query.
 
@@ -8072,6 +5194,17 @@ class TrainingExample():
     :attr datetime updated: (optional) The date and time the example was updated.
     """
 
+    __slots__ = ('document_id', 'collection_id', 'relevance', 'created',
+                 'updated')
+
+    _fields = (
+        ModelField('document_id', required=True),
+        ModelField('collection_id', required=True),
+        ModelField('relevance', required=True),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  document_id: str,
                  collection_id: str,
@@ -8094,74 +5227,8 @@ class TrainingExample():
         self.created = created
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingExample':
-        """Initialize a TrainingExample object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        else:
-            raise ValueError(
-                'Required property \'document_id\' not present in TrainingExample JSON'
-            )
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in TrainingExample JSON'
-            )
-        if 'relevance' in _dict:
-            args['relevance'] = _dict.get('relevance')
-        else:
-            raise ValueError(
-                'Required property \'relevance\' not present in TrainingExample JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingExample object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'relevance') and self.relevance is not None:
-            _dict['relevance'] = self.relevance
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingExample object."""
-        return json.dumps(self.to_dict(), indent=2)
 
-    def __eq__(self, other: 'TrainingExample') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingExample') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingQuery():
+class TrainingQuery(Model):
     """
     Object that contains training query details.
 
@@ -8174,6 +5241,18 @@ class TrainingQuery():
     :attr List[TrainingExample] examples: Array of training examples.
     """
 
+    __slots__ = ('query_id', 'natural_language_query', 'filter', 'created',
+                 'updated', 'examples')
+
+    _fields = (
+        ModelField('query_id'),
+        ModelField('natural_language_query', required=True),
+        ModelField('filter'),
+        ModelField('created', 'datetime'),
+        ModelField('updated', 'datetime'),
+        ModelField('examples', 'list', 'TrainingExample', required=True),
+    )
+
     def __init__(self,
                  natural_language_query: str,
                  examples: List['TrainingExample'],
@@ -8198,83 +5277,20 @@ class TrainingQuery():
         self.updated = updated
         self.examples = examples
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingQuery':
-        """Initialize a TrainingQuery object from a json dictionary."""
-        args = {}
-        if 'query_id' in _dict:
-            args['query_id'] = _dict.get('query_id')
-        if 'natural_language_query' in _dict:
-            args['natural_language_query'] = _dict.get('natural_language_query')
-        else:
-            raise ValueError(
-                'Required property \'natural_language_query\' not present in TrainingQuery JSON'
-            )
-        if 'filter' in _dict:
-            args['filter'] = _dict.get('filter')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'examples' in _dict:
-            args['examples'] = [
-                TrainingExample.from_dict(x) for x in _dict.get('examples')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'examples\' not present in TrainingQuery JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingQuery object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'query_id') and getattr(self, 'query_id') is not None:
-            _dict['query_id'] = getattr(self, 'query_id')
-        if hasattr(self, 'natural_language_query'
-                  ) and self.natural_language_query is not None:
-            _dict['natural_language_query'] = self.natural_language_query
-        if hasattr(self, 'filter') and self.filter is not None:
-            _dict['filter'] = self.filter
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'examples') and self.examples is not None:
-            _dict['examples'] = [x.to_dict() for x in self.examples]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingQuery object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingQuery') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingQuery') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
 
-
-class TrainingQuerySet():
+class TrainingQuerySet(Model):
     """
     Object specifying the training queries contained in the identified training set.
 
     :attr List[TrainingQuery] queries: (optional) Array of training queries.
     """
 
+    __slots__ = ('queries',)
+
+    _fields = (
+        ModelField('queries', 'list', 'TrainingQuery'),
+    )
+
     def __init__(self, *, queries: List['TrainingQuery'] = None) -> None:
         """
         Initialize a TrainingQuerySet object.
@@ -8283,46 +5299,6 @@ class TrainingQuerySet():
         """
         self.queries = queries
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingQuerySet':
-        """Initialize a TrainingQuerySet object from a json dictionary."""
-        args = {}
-        if 'queries' in _dict:
-            args['queries'] = [
-                TrainingQuery.from_dict(x) for x in _dict.get('queries')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingQuerySet object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'queries') and self.queries is not None:
-            _dict['queries'] = [x.to_dict() for x in self.queries]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingQuerySet object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingQuerySet') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingQuerySet') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryCalculationAggregation(QueryAggregation):
     """
@@ -8333,6 +5309,14 @@ class QueryCalculationAggregation(QueryAggregation):
     :attr float value: (optional) The value of the calculation.
     """
 
+    __slots__ = ('field', 'value')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('field', required=True),
+        ModelField('value'),
+    )
+
     def __init__(self, type: str, field: str, *, value: float = None) -> None:
         """
         Initialize a QueryCalculationAggregation object.
@@ -8347,60 +5331,6 @@ class QueryCalculationAggregation(QueryAggregation):
         self.field = field
         self.value = value
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryCalculationAggregation':
-        """Initialize a QueryCalculationAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryCalculationAggregation JSON'
-            )
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        else:
-            raise ValueError(
-                'Required property \'field\' not present in QueryCalculationAggregation JSON'
-            )
-        if 'value' in _dict:
-            args['value'] = _dict.get('value')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryCalculationAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'value') and self.value is not None:
-            _dict['value'] = self.value
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryCalculationAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryCalculationAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryCalculationAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryFilterAggregation(QueryAggregation):
     """
@@ -8413,6 +5343,15 @@ class QueryFilterAggregation(QueryAggregation):
           sub-aggregations.
     """
 
+    __slots__ = ('match', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('match', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  type: str,
                  match: str,
@@ -8436,71 +5375,6 @@ class QueryFilterAggregation(QueryAggregation):
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryFilterAggregation':
-        """Initialize a QueryFilterAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryFilterAggregation JSON'
-            )
-        if 'match' in _dict:
-            args['match'] = _dict.get('match')
-        else:
-            raise ValueError(
-                'Required property \'match\' not present in QueryFilterAggregation JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryFilterAggregation JSON'
-            )
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryFilterAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'match') and self.match is not None:
-            _dict['match'] = self.match
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryFilterAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryFilterAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryFilterAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryGroupByAggregation(QueryAggregation):
     """
@@ -8510,6 +5384,13 @@ class QueryGroupByAggregation(QueryAggregation):
           values for the field.
     """
 
+    __slots__ = ('results',)
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('results', 'list', 'QueryGroupByAggregationResult'),
+    )
+
     def __init__(self,
                  type: str,
                  *,
@@ -8526,55 +5407,6 @@ class QueryGroupByAggregation(QueryAggregation):
         self.type = type
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryGroupByAggregation':
-        """Initialize a QueryGroupByAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryGroupByAggregation JSON'
-            )
-        if 'results' in _dict:
-            args['results'] = [
-                QueryGroupByAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryGroupByAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryGroupByAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryGroupByAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryGroupByAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryHistogramAggregation(QueryAggregation):
     """
@@ -8589,6 +5421,16 @@ class QueryHistogramAggregation(QueryAggregation):
           intervals.
     """
 
+    __slots__ = ('field', 'interval', 'name', 'results')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('field', required=True),
+        ModelField('interval', required=True),
+        ModelField('name'),
+        ModelField('results', 'list', 'QueryHistogramAggregationResult'),
+    )
+
     def __init__(
             self,
             type: str,
@@ -8617,75 +5459,6 @@ class QueryHistogramAggregation(QueryAggregation):
         self.name = name
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryHistogramAggregation':
-        """Initialize a QueryHistogramAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryHistogramAggregation JSON'
-            )
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        else:
-            raise ValueError(
-                'Required property \'field\' not present in QueryHistogramAggregation JSON'
-            )
-        if 'interval' in _dict:
-            args['interval'] = _dict.get('interval')
-        else:
-            raise ValueError(
-                'Required property \'interval\' not present in QueryHistogramAggregation JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryHistogramAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryHistogramAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'interval') and self.interval is not None:
-            _dict['interval'] = self.interval
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryHistogramAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryHistogramAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryHistogramAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryNestedAggregation(QueryAggregation):
     """
@@ -8699,6 +5472,15 @@ class QueryNestedAggregation(QueryAggregation):
           sub-aggregations.
     """
 
+    __slots__ = ('path', 'matching_results', 'aggregations')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('path', required=True),
+        ModelField('matching_results', required=True),
+        ModelField('aggregations', 'list', 'QueryAggregation'),
+    )
+
     def __init__(self,
                  type: str,
                  path: str,
@@ -8723,71 +5505,6 @@ class QueryNestedAggregation(QueryAggregation):
         self.matching_results = matching_results
         self.aggregations = aggregations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryNestedAggregation':
-        """Initialize a QueryNestedAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryNestedAggregation JSON'
-            )
-        if 'path' in _dict:
-            args['path'] = _dict.get('path')
-        else:
-            raise ValueError(
-                'Required property \'path\' not present in QueryNestedAggregation JSON'
-            )
-        if 'matching_results' in _dict:
-            args['matching_results'] = _dict.get('matching_results')
-        else:
-            raise ValueError(
-                'Required property \'matching_results\' not present in QueryNestedAggregation JSON'
-            )
-        if 'aggregations' in _dict:
-            args['aggregations'] = [
-                QueryAggregation.from_dict(x) for x in _dict.get('aggregations')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryNestedAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'path') and self.path is not None:
-            _dict['path'] = self.path
-        if hasattr(self,
-                   'matching_results') and self.matching_results is not None:
-            _dict['matching_results'] = self.matching_results
-        if hasattr(self, 'aggregations') and self.aggregations is not None:
-            _dict['aggregations'] = [x.to_dict() for x in self.aggregations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryNestedAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryNestedAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryNestedAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryTermAggregation(QueryAggregation):
     """
@@ -8801,6 +5518,16 @@ class QueryTermAggregation(QueryAggregation):
           for the field.
     """
 
+    __slots__ = ('field', 'count', 'name', 'results')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('field', required=True),
+        ModelField('count'),
+        ModelField('name'),
+        ModelField('results', 'list', 'QueryTermAggregationResult'),
+    )
+
     def __init__(self,
                  type: str,
                  field: str,
@@ -8828,71 +5555,6 @@ class QueryTermAggregation(QueryAggregation):
         self.name = name
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTermAggregation':
-        """Initialize a QueryTermAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryTermAggregation JSON'
-            )
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        else:
-            raise ValueError(
-                'Required property \'field\' not present in QueryTermAggregation JSON'
-            )
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryTermAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTermAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTermAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTermAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTermAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryTimesliceAggregation(QueryAggregation):
     """
@@ -8907,6 +5569,16 @@ class QueryTimesliceAggregation(QueryAggregation):
           aggregation results.
     """
 
+    __slots__ = ('field', 'interval', 'name', 'results')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('field', required=True),
+        ModelField('interval', required=True),
+        ModelField('name'),
+        ModelField('results', 'list', 'QueryTimesliceAggregationResult'),
+    )
+
     def __init__(
             self,
             type: str,
@@ -8935,75 +5607,6 @@ class QueryTimesliceAggregation(QueryAggregation):
         self.name = name
         self.results = results
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTimesliceAggregation':
-        """Initialize a QueryTimesliceAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryTimesliceAggregation JSON'
-            )
-        if 'field' in _dict:
-            args['field'] = _dict.get('field')
-        else:
-            raise ValueError(
-                'Required property \'field\' not present in QueryTimesliceAggregation JSON'
-            )
-        if 'interval' in _dict:
-            args['interval'] = _dict.get('interval')
-        else:
-            raise ValueError(
-                'Required property \'interval\' not present in QueryTimesliceAggregation JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'results' in _dict:
-            args['results'] = [
-                QueryTimesliceAggregationResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTimesliceAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'field') and self.field is not None:
-            _dict['field'] = self.field
-        if hasattr(self, 'interval') and self.interval is not None:
-            _dict['interval'] = self.interval
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTimesliceAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTimesliceAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTimesliceAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
 
 class QueryTopHitsAggregation(QueryAggregation):
     """
@@ -9015,6 +5618,15 @@ class QueryTopHitsAggregation(QueryAggregation):
     :attr QueryTopHitsAggregationResult hits: (optional)
     """
 
+    __slots__ = ('size', 'name', 'hits')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('size', required=True),
+        ModelField('name'),
+        ModelField('hits', 'model', 'QueryTopHitsAggregationResult'),
+    )
+
     def __init__(self,
                  type: str,
                  size: int,
@@ -9036,62 +5648,3 @@ class QueryTopHitsAggregation(QueryAggregation):
         self.size = size
         self.name = name
         self.hits = hits
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'QueryTopHitsAggregation':
-        """Initialize a QueryTopHitsAggregation object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in QueryTopHitsAggregation JSON'
-            )
-        if 'size' in _dict:
-            args['size'] = _dict.get('size')
-        else:
-            raise ValueError(
-                'Required property \'size\' not present in QueryTopHitsAggregation JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'hits' in _dict:
-            args['hits'] = QueryTopHitsAggregationResult.from_dict(
-                _dict.get('hits'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a QueryTopHitsAggregation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'size') and self.size is not None:
-            _dict['size'] = self.size
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'hits') and self.hits is not None:
-            _dict['hits'] = self.hits.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this QueryTopHitsAggregation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'QueryTopHitsAggregation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'QueryTopHitsAggregation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
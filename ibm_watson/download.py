@@ -0,0 +1,325 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming downloads of binary results.
+
+Operations such as `synthesize`, `get_audio`, `get_model_file` or
+`get_translated_document` return audio, models or documents. With
+`WatsonService.download`, their bodies are read in chunks, so they are never
+held in memory as a whole:
+
+    with text_to_speech.download('synthesize', 'Hello',
+                                 accept='audio/wav') as audio:
+        for chunk in audio:
+            player.write(chunk)
+
+    visual_recognition.download('get_model_file', collection_id, 'objects',
+                                'rscnn', destination='model.rscnn',
+                                resume=True, checksum='sha256:9f86d0...')
+
+With `resume=True`, a download to a file that already holds the start of the
+body continues after it, and a download interrupted by a connection error
+continues where it stopped, with a `Range` request. A server that ignores the
+range sends the whole body again, and the part already read is skipped.
+"""
+
+import hashlib
+import io
+import os
+import re
+from typing import AsyncIterator, BinaryIO, Callable, Iterator, Union
+
+import requests
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+CHUNK_SIZE = 64 * 1024
+# The number of times an interrupted download is resumed.
+MAX_RESUMES = 3
+
+_CONTENT_RANGE = re.compile(r'^bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)$')
+
+
+class _BaseDownload():
+
+    def __init__(self,
+                 send: Callable,
+                 *,
+                 chunk_size: int = CHUNK_SIZE,
+                 resume: bool = False,
+                 checksum: str = None) -> None:
+        self._send = send
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.checksum = checksum
+        self.response = None
+        self.size = None
+        self.position = 0
+        self.resumes = 0
+        self._hash = None
+        if checksum is not None:
+            algorithm, _, expected = checksum.partition(':')
+            if not expected:
+                raise ValueError(
+                    'checksum must be "<algorithm>:<hex digest>", not '
+                    '{0!r}'.format(checksum))
+            self._hash = hashlib.new(algorithm)
+            self._expected = expected.lower()
+        self._skip = 0
+        self._done = False
+
+    def _start(self, response: DetailedResponse) -> None:
+        """Read the size of the body, and where it starts, from a response."""
+        self.response = response
+        headers = response.get_headers()
+        self._skip = 0
+        if response.get_status_code() == 206:
+            match = _CONTENT_RANGE.match(headers.get('Content-Range') or '')
+            if match is None or int(match.group(1) or -1) != self.position:
+                raise ValueError(
+                    'Unexpected Content-Range {0!r} for a download from byte '
+                    '{1}'.format(headers.get('Content-Range'), self.position))
+            if match.group(2) != '*':
+                self.size = int(match.group(2))
+            return
+        # The whole body; skip the part that was already read.
+        self._skip = self.position
+        length = headers.get('Content-Length')
+        if length is not None and not headers.get('Content-Encoding'):
+            self.size = int(length)
+        if response.get_result() is None:
+            self._done = True
+
+    def _start_error(self, err: ApiException) -> None:
+        """Handle a request for a range that starts at the end of the body."""
+        if err.status_code != 416 or not self.position:
+            raise err
+        headers = err.http_response.headers
+        match = _CONTENT_RANGE.match(headers.get('Content-Range') or '')
+        if match is None or match.group(2) == '*':
+            raise err
+        self.size = int(match.group(2))
+        self._done = True
+
+    def _update(self, chunk: bytes) -> bytes:
+        if self._skip:
+            skipped = min(self._skip, len(chunk))
+            self._skip -= skipped
+            chunk = chunk[skipped:]
+        self.position += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        return chunk
+
+    def _can_resume(self) -> bool:
+        return self.resume and self.resumes < MAX_RESUMES
+
+    def _finish(self) -> None:
+        """Check that the whole body was read, and its checksum."""
+        if self.size is not None and self.position != self.size:
+            raise ValueError('The download ended at byte {0} of {1}'.format(
+                self.position, self.size))
+        if self._hash is not None:
+            digest = self._hash.hexdigest()
+            if digest != self._expected:
+                raise ValueError(
+                    'The checksum of the download is {0}:{1}, not {2}'.format(
+                        self._hash.name, digest, self.checksum))
+
+    def _seek_end(self, file: BinaryIO) -> None:
+        """Continue the download after the content of `file`."""
+        self.position = file.seek(0, io.SEEK_END)
+        if self.position and self._hash is not None:
+            file.seek(0)
+            remaining = self.position
+            while remaining:
+                chunk = file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                self._hash.update(chunk)
+                remaining -= len(chunk)
+            file.seek(0, io.SEEK_END)
+
+
+class Download(_BaseDownload):
+    """
+    The binary result of an operation, read in chunks.
+
+    Downloads are created by `WatsonService.download`. Iterating a download
+    yields the chunks of the body, once; the response is closed when the
+    body has been read, or by `close()`.
+
+    :attr int chunk_size: The number of bytes read at a time.
+    :attr bool resume: Whether an interrupted download is resumed.
+    :attr DetailedResponse response: The response that is read, whose result
+          is the streamed `requests.Response`, or `None` before the request
+          is sent.
+    :attr int size: The size of the body, or `None` if unknown.
+    :attr int position: The number of bytes of the body read so far,
+          including the part already saved before a resumed download.
+    :attr int resumes: The number of times the download was resumed.
+    """
+
+    def open(self) -> 'Download':
+        """Send the request, if it was not sent yet."""
+        if self.response is None and not self._done:
+            try:
+                self._start(self._send(self.position))
+            except ApiException as err:
+                self._start_error(err)
+        return self
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.open()
+        try:
+            while not self._done:
+                try:
+                    for chunk in self.response.get_result().iter_content(
+                            self.chunk_size):
+                        chunk = self._update(chunk)
+                        if chunk:
+                            yield chunk
+                except (requests.exceptions.ChunkedEncodingError,
+                        requests.exceptions.ConnectionError):
+                    if not self._can_resume():
+                        raise
+                    self.close()
+                    self.response = None
+                    self.resumes += 1
+                    self.open()
+                else:
+                    self._done = True
+        finally:
+            self.close()
+        self._finish()
+
+    def save(self, destination: Union[str, os.PathLike, BinaryIO]) -> int:
+        """
+        Write the body to a file.
+
+        :param str|BinaryIO destination: A path, or a binary file. With
+               `resume`, the download continues after the content of the
+               file, which must also be readable if there is a checksum.
+        :return: The number of bytes written.
+        :rtype: int
+        """
+        if not isinstance(destination, (str, bytes, os.PathLike)):
+            return self._write(destination)
+        with open(destination, 'a+b' if self.resume else 'wb') as file:
+            return self._write(file)
+
+    def _write(self, file: BinaryIO) -> int:
+        if self.resume and self.response is None:
+            self._seek_end(file)
+        written = 0
+        for chunk in self:
+            file.write(chunk)
+            written += len(chunk)
+        return written
+
+    def close(self) -> None:
+        """Close the response."""
+        response = self.response
+        result = response.get_result() if response is not None else None
+        if result is not None:
+            result.close()
+
+    def __enter__(self) -> 'Download':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '<Download position={0} size={1}>'.format(
+            self.position, self.size)
+
+
+class AsyncDownload(_BaseDownload):
+    """
+    The binary result of an operation of an asynchronous client, read in
+    chunks.
+
+    Downloads are created by `AsyncWatsonService.download`, and have the
+    attributes of `Download`. They are iterated with `async for`.
+    """
+
+    async def open(self) -> 'AsyncDownload':
+        """Send the request, if it was not sent yet."""
+        if self.response is None and not self._done:
+            try:
+                self._start(await self._send(self.position))
+            except ApiException as err:
+                self._start_error(err)
+        return self
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import httpx
+        await self.open()
+        try:
+            while not self._done:
+                try:
+                    async for chunk in self.response.get_result().aiter_bytes(
+                            self.chunk_size):
+                        chunk = self._update(chunk)
+                        if chunk:
+                            yield chunk
+                except httpx.TransportError:
+                    if not self._can_resume():
+                        raise
+                    await self.aclose()
+                    self.response = None
+                    self.resumes += 1
+                    await self.open()
+                else:
+                    self._done = True
+        finally:
+            await self.aclose()
+        self._finish()
+
+    async def save(self, destination: Union[str, os.PathLike,
+                                            BinaryIO]) -> int:
+        """Write the body to a file, see `Download.save`."""
+        if not isinstance(destination, (str, bytes, os.PathLike)):
+            return await self._write(destination)
+        with open(destination, 'a+b' if self.resume else 'wb') as file:
+            return await self._write(file)
+
+    async def _write(self, file: BinaryIO) -> int:
+        if self.resume and self.response is None:
+            self._seek_end(file)
+        written = 0
+        async for chunk in self:
+            file.write(chunk)
+            written += len(chunk)
+        return written
+
+    async def aclose(self) -> None:
+        """Close the response."""
+        response = self.response
+        result = response.get_result() if response is not None else None
+        if result is not None:
+            await result.aclose()
+
+    async def __aenter__(self) -> 'AsyncDownload':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return '<AsyncDownload position={0} size={1}>'.format(
+            self.position, self.size)
+
@@ -0,0 +1,366 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Hooks that observe the requests of the services.
+
+An `Instrumentation` added to a service with `add_instrumentation()` is called
+before each request is sent, and after its response is received or it fails,
+with a `RequestEvent` that describes the operation and where its time went:
+
+    from ibm_watson.instrumentation import MetricsCollector
+
+    metrics = MetricsCollector()
+    assistant.add_instrumentation(metrics)
+    ...
+    for (service, operation), m in metrics.get_metrics().items():
+        print(operation, m.count, m.latency.get_percentile(0.99))
+
+`OpenTelemetryInstrumentation` records each request as an OpenTelemetry span.
+It requires the `opentelemetry-api` package.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import get_operation_id
+from .version import __version__
+
+# The upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+
+class RequestEvent():
+    """
+    The request of an operation, as seen by instrumentations.
+
+    :attr str service_name: The name of the service, such as `assistant`.
+    :attr str operation_id: The name of the operation, such as `message`.
+    :attr str method: The HTTP method.
+    :attr str url: The URL of the request, without query parameters.
+    :attr dict request: The prepared request.
+    :attr float start_time: When the operation started to build the request,
+          in `time.perf_counter()` seconds.
+    :attr float duration: The seconds from `start_time` to the response or
+          error, or `None` before then.
+    :attr dict phases: The seconds spent in each phase of the request:
+          `authenticate` (getting an access token), `prepare` (building the
+          request), `network` (until the response headers arrive), `read`
+          (reading the response body), `decode` (parsing JSON) and `model`
+          (building models). Phases that did not happen are missing.
+    :attr int status_code: The status code of the response or error, or
+          `None`.
+    :attr DetailedResponse response: The response, or `None`.
+    :attr Exception error: The error, or `None`.
+    :attr int bytes_sent: The size of the request body, compressed if it was
+          compressed by the SDK, or `None` if it is a file or stream.
+    :attr int bytes_received: The size of the response body read by the SDK.
+    :attr int retries: The number of times the request was sent again after
+          a 429 response.
+    :attr bool cached: Whether the response came from a cache.
+    :attr dict context: Storage for instrumentations, such as a span.
+    """
+
+    __slots__ = ('service_name', 'operation_id', 'method', 'url', 'request',
+                 'start_time', 'duration', 'phases', 'status_code',
+                 'response', 'error', 'bytes_sent', 'bytes_received',
+                 'retries', 'cached', 'context')
+
+    def __init__(self,
+                 service_name: str,
+                 request: dict,
+                 start_time: float = None,
+                 phases: Dict[str, float] = None) -> None:
+        self.service_name = service_name
+        self.operation_id = get_operation_id(request['headers'])
+        self.method = request['method']
+        self.url = request['url']
+        self.request = request
+        self.start_time = (start_time
+                           if start_time is not None else time.perf_counter())
+        self.duration = None
+        self.phases = phases if phases is not None else {}
+        self.status_code = None
+        self.response = None
+        self.error = None
+        data = request.get('data')
+        if isinstance(data, (bytes, str)):
+            self.bytes_sent = len(data)
+        else:
+            self.bytes_sent = 0 if data is None and not request.get(
+                'files') else None
+        self.bytes_received = 0
+        self.retries = 0
+        self.cached = False
+        self.context = {}
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Add `seconds` to the time spent in a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def finish(self,
+               response: DetailedResponse = None,
+               error: Exception = None) -> None:
+        """Record the outcome of the request."""
+        self.duration = time.perf_counter() - self.start_time
+        self.response = response
+        self.error = error
+        if response is not None:
+            self.status_code = response.get_status_code()
+        else:
+            self.status_code = getattr(error, 'status_code', None)
+
+    def __repr__(self) -> str:
+        return '<RequestEvent {0}.{1} status_code={2} duration={3}>'.format(
+            self.service_name, self.operation_id, self.status_code,
+            self.duration)
+
+
+class Instrumentation():
+    """
+    Observes the requests of the services it is added to.
+
+    Subclasses override the hooks they need. Hooks run on the thread, or the
+    event loop, that sends the request, so they should return quickly.
+    Exceptions raised by hooks propagate to the caller of the operation.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called when the request is about to be sent."""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called when the operation returns a response."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the operation raises an exception."""
+
+
+class Histogram():
+    """
+    A histogram of values in fixed buckets.
+
+    :attr tuple buckets: The upper bounds of the buckets. The last, implicit
+          bucket has no upper bound.
+    :attr list counts: The number of values in each bucket, one more than the
+          bounds.
+    :attr int count: The number of values.
+    :attr float sum: The sum of the values.
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        index = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def get_percentile(self, q: float) -> Optional[float]:
+        """
+        Return the upper bound of the bucket that holds the `q` quantile.
+
+        :param float q: The quantile, between 0 and 1.
+        :return: The bound, `inf` if the quantile is beyond the last bound, or
+                 `None` if there are no values.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def __repr__(self) -> str:
+        return '<Histogram count={0} sum={1:.6f}>'.format(self.count, self.sum)
+
+
+class OperationMetrics():
+    """
+    The metrics of one operation.
+
+    :attr int count: The number of calls.
+    :attr int errors: The number of calls that raised an exception.
+    :attr int retries: The number of requests sent again after a 429
+          response.
+    :attr int cache_hits: The number of calls answered from a cache.
+    :attr int bytes_sent: The total size of the known request bodies.
+    :attr int bytes_received: The total size of the response bodies.
+    :attr Histogram latency: The durations of the calls, in seconds.
+    :attr dict phases: The total seconds spent in each phase, see
+          `RequestEvent.phases`.
+    """
+
+    __slots__ = ('count', 'errors', 'retries', 'cache_hits', 'bytes_sent',
+                 'bytes_received', 'latency', 'phases')
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Histogram(buckets)
+        self.phases = {}
+
+    def __repr__(self) -> str:
+        return '<OperationMetrics count={0} errors={1} retries={2}>'.format(
+            self.count, self.errors, self.retries)
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Collects per-operation latency histograms, byte counts and retry counts.
+
+    A collector is thread-safe and can be added to several services.
+
+    :param Iterable[float] buckets: (optional) The upper bounds, in seconds,
+           of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def get_metrics(self) -> Dict[Tuple[str, str], OperationMetrics]:
+        """
+        Return the metrics collected so far.
+
+        :return: The metrics of each operation, keyed by (service name,
+                 operation name). The values are not updated by later calls.
+        """
+        with self._lock:
+            metrics = {}
+            for key, value in self._metrics.items():
+                copy = OperationMetrics(self.buckets)
+                for name in OperationMetrics.__slots__:
+                    setattr(copy, name, getattr(value, name))
+                copy.latency = Histogram(self.buckets)
+                copy.latency.counts = list(value.latency.counts)
+                copy.latency.count = value.latency.count
+                copy.latency.sum = value.latency.sum
+                copy.phases = dict(value.phases)
+                metrics[key] = copy
+            return metrics
+
+    def reset(self) -> None:
+        """Discard the metrics collected so far."""
+        with self._lock:
+            self._metrics.clear()
+
+    def _record(self, event: RequestEvent) -> None:
+        key = (event.service_name, event.operation_id)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = OperationMetrics(self.buckets)
+            metrics.count += 1
+            if event.error is not None:
+                metrics.errors += 1
+            metrics.retries += event.retries
+            if event.cached:
+                metrics.cache_hits += 1
+            metrics.bytes_sent += event.bytes_sent or 0
+            metrics.bytes_received += event.bytes_received
+            metrics.latency.observe(event.duration)
+            for phase, seconds in event.phases.items():
+                metrics.phases[phase] = metrics.phases.get(phase, 0.0) + seconds
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Records each request as an OpenTelemetry span of kind CLIENT.
+
+    The span is named `<service_name>.<operation_id>` and carries the HTTP
+    method, URL and status code, the byte counts, the retries and the time of
+    each phase as `watson.phase.<phase>` attributes.
+
+    :param tracer: (optional) The tracer to create spans with. By default,
+           the tracer of the global tracer provider.
+    """
+
+    def __init__(self, tracer=None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as err:
+            raise ImportError(
+                'OpenTelemetryInstrumentation requires opentelemetry-api: '
+                'pip install "ibm-watson[opentelemetry]"') from err
+        self._trace = trace
+        self.tracer = (tracer if tracer is not None else trace.get_tracer(
+            'ibm_watson', __version__))
+
+    def before_request(self, event: RequestEvent) -> None:
+        # The span starts when the operation started to build the request.
+        start_time = time.time() - (time.perf_counter() - event.start_time)
+        event.context['opentelemetry.span'] = self.tracer.start_span(
+            '{0}.{1}'.format(event.service_name, event.operation_id),
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=int(start_time * 1e9),
+            attributes={
+                'http.method': event.method,
+                'http.url': event.url,
+                'watson.service': event.service_name or '',
+                'watson.operation': event.operation_id or '',
+            })
+
+    def after_response(self, event: RequestEvent) -> None:
+        span = self._end(event)
+        span.end()
+
+    def on_error(self, event: RequestEvent) -> None:
+        span = self._end(event)
+        span.record_exception(event.error)
+        span.set_status(
+            self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    def _end(self, event: RequestEvent):
+        span = event.context.pop('opentelemetry.span')
+        if event.status_code is not None:
+            span.set_attribute('http.status_code', event.status_code)
+        if event.bytes_sent is not None:
+            span.set_attribute('watson.bytes_sent', event.bytes_sent)
+        span.set_attribute('watson.bytes_received', event.bytes_received)
+        span.set_attribute('watson.retries', event.retries)
+        span.set_attribute('watson.cached', event.cached)
+        for phase, seconds in event.phases.items():
+            span.set_attribute('watson.phase.' + phase, seconds)
+        return span
@@ -0,0 +1,163 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+JSON codecs used to encode request bodies and decode response bodies.
+
+The standard library `json` module is always available. The faster `orjson`
+and `ujson` packages are used when they are installed and selected, either
+for all services with `set_default_json_codec()` or for a single service with
+`set_json_codec()`:
+
+    from ibm_watson.json_codec import set_default_json_codec
+    set_default_json_codec('auto')  # orjson, then ujson, then json
+"""
+
+import json
+from typing import Union
+
+# Codec names tried, in order, by 'auto'.
+AUTO_CODECS = ('orjson', 'ujson', 'json')
+
+
+class JsonCodec():
+    """
+    Encodes Python values to UTF-8 JSON bytes and decodes JSON documents.
+
+    :attr str name: The name the codec is selected by.
+    """
+
+    name = None
+
+    def dumps(self, obj) -> bytes:
+        """Return `obj` serialized as UTF-8 encoded JSON."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]):
+        """
+        Return the value of the JSON document `data`.
+
+        Raises `ValueError` when `data` is not valid JSON.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return '<{0} {1!r}>'.format(type(self).__name__, self.name)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec backed by the standard library `json` module."""
+
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]):
+        # Control characters inside strings are accepted, as they are by the
+        # response decoding in ibm_cloud_sdk_core.
+        return json.loads(data, strict=False)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by `orjson`, which encodes straight to bytes."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]):
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # orjson rejects raw control characters inside strings.
+            return json.loads(data, strict=False)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec backed by `ujson`."""
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj) -> bytes:
+        return self._ujson.dumps(obj,
+                                 ensure_ascii=False,
+                                 escape_forward_slashes=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]):
+        return self._ujson.loads(data)
+
+
+_CODEC_CLASSES = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+# Codec instances by name, created on first use.
+_codecs = {}
+
+_default_codec = StdlibJsonCodec()
+
+
+def get_json_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Return the JSON codec selected by `codec`.
+
+    :param str|JsonCodec codec: A codec instance, a codec name (`json`,
+           `orjson` or `ujson`), or `auto` for the fastest installed codec.
+    :raises ValueError: If the name is unknown.
+    :raises ImportError: If the package backing the named codec is not
+            installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        for name in AUTO_CODECS:
+            try:
+                return get_json_codec(name)
+            except ImportError:
+                continue
+    if codec not in _CODEC_CLASSES:
+        raise ValueError('Unknown JSON codec {0!r}, expected one of {1}'.format(
+            codec, ', '.join(sorted(_CODEC_CLASSES) + ['auto'])))
+    instance = _codecs.get(codec)
+    if instance is None:
+        instance = _codecs.setdefault(codec, _CODEC_CLASSES[codec]())
+    return instance
+
+
+def get_default_json_codec() -> JsonCodec:
+    """Return the JSON codec of services that have not selected their own."""
+    return _default_codec
+
+
+def set_default_json_codec(codec: Union[str, JsonCodec]) -> None:
+    """
+    Set the JSON codec of services that have not selected their own.
+
+    :param str|JsonCodec codec: See `get_json_codec`.
+    """
+    global _default_codec
+    _default_codec = get_json_codec(codec)
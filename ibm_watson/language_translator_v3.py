@@ -29,22 +29,23 @@ See: https://cloud.ibm.com/docs/language-translator
 from datetime import datetime
 from enum import Enum
 from os.path import basename
-from typing import BinaryIO, Dict, List, TextIO, Union
-import json
+from typing import BinaryIO, List, TextIO, Union
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import datetime_to_string, string_to_datetime
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class LanguageTranslatorV3(BaseService):
+class LanguageTranslatorV3(WatsonService):
     """The Language Translator V3 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.language-translator.watson.cloud.ibm.com'
@@ -55,6 +56,7 @@ class LanguageTranslatorV3(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Language Translator service.
@@ -65,17 +67,23 @@ class LanguageTranslatorV3(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V3',
+                             get_operation_ids(LanguageTranslatorV3))
 
     #########################
     # Languages
@@ -115,7 +123,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Languages, **kwargs)
         return response
 
     #########################
@@ -177,7 +185,7 @@ class LanguageTranslatorV3(BaseService):
             'target': target
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -191,7 +199,7 @@ class LanguageTranslatorV3(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TranslationResult, **kwargs)
         return response
 
     #########################
@@ -229,7 +237,9 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=IdentifiableLanguages,
+                             **kwargs)
         return response
 
     def identify(self, text: Union[str, TextIO], **kwargs) -> DetailedResponse:
@@ -268,7 +278,9 @@ class LanguageTranslatorV3(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=IdentifiedLanguages,
+                             **kwargs)
         return response
 
     #########################
@@ -323,7 +335,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TranslationModels, **kwargs)
         return response
 
     def create_model(self,
@@ -462,7 +474,7 @@ class LanguageTranslatorV3(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TranslationModel, **kwargs)
         return response
 
     def delete_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -500,7 +512,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteModelResult, **kwargs)
         return response
 
     def get_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -540,7 +552,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TranslationModel, **kwargs)
         return response
 
     #########################
@@ -576,7 +588,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentList, **kwargs)
         return response
 
     def translate_document(self,
@@ -662,7 +674,7 @@ class LanguageTranslatorV3(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentStatus, **kwargs)
         return response
 
     def get_document_status(self, document_id: str,
@@ -701,7 +713,7 @@ class LanguageTranslatorV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DocumentStatus, **kwargs)
         return response
 
     def delete_document(self, document_id: str, **kwargs) -> DetailedResponse:
@@ -880,18 +892,28 @@ class GetTranslatedDocumentEnums:
         TEXT_XML = 'text/xml'
 
 
+class AsyncLanguageTranslatorV3(AsyncWatsonService, LanguageTranslatorV3):
+    """The Language Translator V3 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class DeleteModelResult():
+class DeleteModelResult(Model):
     """
     DeleteModelResult.
 
     :attr str status: "OK" indicates that the model was successfully deleted.
     """
 
+    __slots__ = ('status',)
+
+    _fields = (
+        ModelField('status', required=True),
+    )
+
     def __init__(self, status: str) -> None:
         """
         Initialize a DeleteModelResult object.
@@ -900,50 +922,8 @@ class DeleteModelResult():
         """
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteModelResult':
-        """Initialize a DeleteModelResult object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DeleteModelResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteModelResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteModelResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteModelResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteModelResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentList():
+
+class DocumentList(Model):
     """
     DocumentList.
 
@@ -951,6 +931,12 @@ class DocumentList():
           documents.
     """
 
+    __slots__ = ('documents',)
+
+    _fields = (
+        ModelField('documents', 'list', 'DocumentStatus', required=True),
+    )
+
     def __init__(self, documents: List['DocumentStatus']) -> None:
         """
         Initialize a DocumentList object.
@@ -960,52 +946,8 @@ class DocumentList():
         """
         self.documents = documents
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentList':
-        """Initialize a DocumentList object from a json dictionary."""
-        args = {}
-        if 'documents' in _dict:
-            args['documents'] = [
-                DocumentStatus.from_dict(x) for x in _dict.get('documents')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'documents\' not present in DocumentList JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'documents') and self.documents is not None:
-            _dict['documents'] = [x.to_dict() for x in self.documents]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentStatus():
+
+class DocumentStatus(Model):
     """
     Document information, including translation status.
 
@@ -1034,6 +976,26 @@ class DocumentStatus():
           document, present only if status=available.
     """
 
+    __slots__ = ('document_id', 'filename', 'status', 'model_id',
+                 'base_model_id', 'source', 'detected_language_confidence',
+                 'target', 'created', 'completed', 'word_count',
+                 'character_count')
+
+    _fields = (
+        ModelField('document_id', required=True),
+        ModelField('filename', required=True),
+        ModelField('status', required=True),
+        ModelField('model_id', required=True),
+        ModelField('base_model_id'),
+        ModelField('source', required=True),
+        ModelField('detected_language_confidence'),
+        ModelField('target', required=True),
+        ModelField('created', 'datetime', required=True),
+        ModelField('completed', 'datetime'),
+        ModelField('word_count'),
+        ModelField('character_count'),
+    )
+
     def __init__(self,
                  document_id: str,
                  filename: str,
@@ -1089,120 +1051,6 @@ class DocumentStatus():
         self.word_count = word_count
         self.character_count = character_count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentStatus':
-        """Initialize a DocumentStatus object from a json dictionary."""
-        args = {}
-        if 'document_id' in _dict:
-            args['document_id'] = _dict.get('document_id')
-        else:
-            raise ValueError(
-                'Required property \'document_id\' not present in DocumentStatus JSON'
-            )
-        if 'filename' in _dict:
-            args['filename'] = _dict.get('filename')
-        else:
-            raise ValueError(
-                'Required property \'filename\' not present in DocumentStatus JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in DocumentStatus JSON'
-            )
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        else:
-            raise ValueError(
-                'Required property \'model_id\' not present in DocumentStatus JSON'
-            )
-        if 'base_model_id' in _dict:
-            args['base_model_id'] = _dict.get('base_model_id')
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in DocumentStatus JSON'
-            )
-        if 'detected_language_confidence' in _dict:
-            args['detected_language_confidence'] = _dict.get(
-                'detected_language_confidence')
-        if 'target' in _dict:
-            args['target'] = _dict.get('target')
-        else:
-            raise ValueError(
-                'Required property \'target\' not present in DocumentStatus JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        else:
-            raise ValueError(
-                'Required property \'created\' not present in DocumentStatus JSON'
-            )
-        if 'completed' in _dict:
-            args['completed'] = string_to_datetime(_dict.get('completed'))
-        if 'word_count' in _dict:
-            args['word_count'] = _dict.get('word_count')
-        if 'character_count' in _dict:
-            args['character_count'] = _dict.get('character_count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_id') and self.document_id is not None:
-            _dict['document_id'] = self.document_id
-        if hasattr(self, 'filename') and self.filename is not None:
-            _dict['filename'] = self.filename
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'base_model_id') and self.base_model_id is not None:
-            _dict['base_model_id'] = self.base_model_id
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'detected_language_confidence'
-                  ) and self.detected_language_confidence is not None:
-            _dict[
-                'detected_language_confidence'] = self.detected_language_confidence
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'completed') and self.completed is not None:
-            _dict['completed'] = datetime_to_string(self.completed)
-        if hasattr(self, 'word_count') and self.word_count is not None:
-            _dict['word_count'] = self.word_count
-        if hasattr(self,
-                   'character_count') and self.character_count is not None:
-            _dict['character_count'] = self.character_count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the translation job associated with a submitted document.
@@ -1212,7 +1060,7 @@ class DocumentStatus():
         FAILED = 'failed'
 
 
-class IdentifiableLanguage():
+class IdentifiableLanguage(Model):
     """
     IdentifiableLanguage.
 
@@ -1220,6 +1068,13 @@ class IdentifiableLanguage():
     :attr str name: The name of the identifiable language.
     """
 
+    __slots__ = ('language', 'name')
+
+    _fields = (
+        ModelField('language', required=True),
+        ModelField('name', required=True),
+    )
+
     def __init__(self, language: str, name: str) -> None:
         """
         Initialize a IdentifiableLanguage object.
@@ -1230,58 +1085,8 @@ class IdentifiableLanguage():
         self.language = language
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IdentifiableLanguage':
-        """Initialize a IdentifiableLanguage object from a json dictionary."""
-        args = {}
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in IdentifiableLanguage JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in IdentifiableLanguage JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IdentifiableLanguage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IdentifiableLanguage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IdentifiableLanguage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'IdentifiableLanguage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class IdentifiableLanguages():
+
+class IdentifiableLanguages(Model):
     """
     IdentifiableLanguages.
 
@@ -1289,6 +1094,12 @@ class IdentifiableLanguages():
           service can identify.
     """
 
+    __slots__ = ('languages',)
+
+    _fields = (
+        ModelField('languages', 'list', 'IdentifiableLanguage', required=True),
+    )
+
     def __init__(self, languages: List['IdentifiableLanguage']) -> None:
         """
         Initialize a IdentifiableLanguages object.
@@ -1298,53 +1109,8 @@ class IdentifiableLanguages():
         """
         self.languages = languages
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IdentifiableLanguages':
-        """Initialize a IdentifiableLanguages object from a json dictionary."""
-        args = {}
-        if 'languages' in _dict:
-            args['languages'] = [
-                IdentifiableLanguage.from_dict(x)
-                for x in _dict.get('languages')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'languages\' not present in IdentifiableLanguages JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IdentifiableLanguages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'languages') and self.languages is not None:
-            _dict['languages'] = [x.to_dict() for x in self.languages]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IdentifiableLanguages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IdentifiableLanguages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'IdentifiableLanguages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class IdentifiedLanguage():
+
+class IdentifiedLanguage(Model):
     """
     IdentifiedLanguage.
 
@@ -1352,6 +1118,13 @@ class IdentifiedLanguage():
     :attr float confidence: The confidence score for the identified language.
     """
 
+    __slots__ = ('language', 'confidence')
+
+    _fields = (
+        ModelField('language', required=True),
+        ModelField('confidence', required=True),
+    )
+
     def __init__(self, language: str, confidence: float) -> None:
         """
         Initialize a IdentifiedLanguage object.
@@ -1362,58 +1135,8 @@ class IdentifiedLanguage():
         self.language = language
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IdentifiedLanguage':
-        """Initialize a IdentifiedLanguage object from a json dictionary."""
-        args = {}
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in IdentifiedLanguage JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in IdentifiedLanguage JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IdentifiedLanguage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IdentifiedLanguage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IdentifiedLanguage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'IdentifiedLanguage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class IdentifiedLanguages():
+
+class IdentifiedLanguages(Model):
     """
     IdentifiedLanguages.
 
@@ -1421,6 +1144,12 @@ class IdentifiedLanguages():
           confidence scores.
     """
 
+    __slots__ = ('languages',)
+
+    _fields = (
+        ModelField('languages', 'list', 'IdentifiedLanguage', required=True),
+    )
+
     def __init__(self, languages: List['IdentifiedLanguage']) -> None:
         """
         Initialize a IdentifiedLanguages object.
@@ -1430,52 +1159,8 @@ class IdentifiedLanguages():
         """
         self.languages = languages
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'IdentifiedLanguages':
-        """Initialize a IdentifiedLanguages object from a json dictionary."""
-        args = {}
-        if 'languages' in _dict:
-            args['languages'] = [
-                IdentifiedLanguage.from_dict(x) for x in _dict.get('languages')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'languages\' not present in IdentifiedLanguages JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a IdentifiedLanguages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'languages') and self.languages is not None:
-            _dict['languages'] = [x.to_dict() for x in self.languages]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this IdentifiedLanguages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'IdentifiedLanguages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'IdentifiedLanguages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Language():
+
+class Language(Model):
     """
     Response payload for languages.
 
@@ -1503,6 +1188,22 @@ class Language():
           `false` otherwise.
     """
 
+    __slots__ = ('language', 'language_name', 'native_language_name',
+                 'country_code', 'words_separated', 'direction',
+                 'supported_as_source', 'supported_as_target', 'identifiable')
+
+    _fields = (
+        ModelField('language'),
+        ModelField('language_name'),
+        ModelField('native_language_name'),
+        ModelField('country_code'),
+        ModelField('words_separated'),
+        ModelField('direction'),
+        ModelField('supported_as_source'),
+        ModelField('supported_as_target'),
+        ModelField('identifiable'),
+    )
+
     def __init__(self,
                  *,
                  language: str = None,
@@ -1550,84 +1251,8 @@ class Language():
         self.supported_as_target = supported_as_target
         self.identifiable = identifiable
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Language':
-        """Initialize a Language object from a json dictionary."""
-        args = {}
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'language_name' in _dict:
-            args['language_name'] = _dict.get('language_name')
-        if 'native_language_name' in _dict:
-            args['native_language_name'] = _dict.get('native_language_name')
-        if 'country_code' in _dict:
-            args['country_code'] = _dict.get('country_code')
-        if 'words_separated' in _dict:
-            args['words_separated'] = _dict.get('words_separated')
-        if 'direction' in _dict:
-            args['direction'] = _dict.get('direction')
-        if 'supported_as_source' in _dict:
-            args['supported_as_source'] = _dict.get('supported_as_source')
-        if 'supported_as_target' in _dict:
-            args['supported_as_target'] = _dict.get('supported_as_target')
-        if 'identifiable' in _dict:
-            args['identifiable'] = _dict.get('identifiable')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Language object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'language_name') and self.language_name is not None:
-            _dict['language_name'] = self.language_name
-        if hasattr(self, 'native_language_name'
-                  ) and self.native_language_name is not None:
-            _dict['native_language_name'] = self.native_language_name
-        if hasattr(self, 'country_code') and self.country_code is not None:
-            _dict['country_code'] = self.country_code
-        if hasattr(self,
-                   'words_separated') and self.words_separated is not None:
-            _dict['words_separated'] = self.words_separated
-        if hasattr(self, 'direction') and self.direction is not None:
-            _dict['direction'] = self.direction
-        if hasattr(
-                self,
-                'supported_as_source') and self.supported_as_source is not None:
-            _dict['supported_as_source'] = self.supported_as_source
-        if hasattr(
-                self,
-                'supported_as_target') and self.supported_as_target is not None:
-            _dict['supported_as_target'] = self.supported_as_target
-        if hasattr(self, 'identifiable') and self.identifiable is not None:
-            _dict['identifiable'] = self.identifiable
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Language object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Language') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Language') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Languages():
+
+class Languages(Model):
     """
     The response type for listing supported languages.
 
@@ -1635,6 +1260,12 @@ class Languages():
           about each language.
     """
 
+    __slots__ = ('languages',)
+
+    _fields = (
+        ModelField('languages', 'list', 'Language', required=True),
+    )
+
     def __init__(self, languages: List['Language']) -> None:
         """
         Initialize a Languages object.
@@ -1644,57 +1275,20 @@ class Languages():
         """
         self.languages = languages
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Languages':
-        """Initialize a Languages object from a json dictionary."""
-        args = {}
-        if 'languages' in _dict:
-            args['languages'] = [
-                Language.from_dict(x) for x in _dict.get('languages')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'languages\' not present in Languages JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Languages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'languages') and self.languages is not None:
-            _dict['languages'] = [x.to_dict() for x in self.languages]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Languages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Languages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Languages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Translation():
+
+class Translation(Model):
     """
     Translation.
 
     :attr str translation: Translation output in UTF-8.
     """
 
+    __slots__ = ('translation',)
+
+    _fields = (
+        ModelField('translation', required=True),
+    )
+
     def __init__(self, translation: str) -> None:
         """
         Initialize a Translation object.
@@ -1703,50 +1297,8 @@ class Translation():
         """
         self.translation = translation
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Translation':
-        """Initialize a Translation object from a json dictionary."""
-        args = {}
-        if 'translation' in _dict:
-            args['translation'] = _dict.get('translation')
-        else:
-            raise ValueError(
-                'Required property \'translation\' not present in Translation JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Translation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'translation') and self.translation is not None:
-            _dict['translation'] = self.translation
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Translation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Translation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Translation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TranslationModel():
+
+class TranslationModel(Model):
     """
     Response payload for models.
 
@@ -1771,6 +1323,22 @@ class TranslationModel():
     :attr str status: (optional) Availability of a model.
     """
 
+    __slots__ = ('model_id', 'name', 'source', 'target', 'base_model_id',
+                 'domain', 'customizable', 'default_model', 'owner', 'status')
+
+    _fields = (
+        ModelField('model_id', required=True),
+        ModelField('name'),
+        ModelField('source'),
+        ModelField('target'),
+        ModelField('base_model_id'),
+        ModelField('domain'),
+        ModelField('customizable'),
+        ModelField('default_model'),
+        ModelField('owner'),
+        ModelField('status'),
+    )
+
     def __init__(self,
                  model_id: str,
                  *,
@@ -1819,84 +1387,6 @@ class TranslationModel():
         self.owner = owner
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TranslationModel':
-        """Initialize a TranslationModel object from a json dictionary."""
-        args = {}
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        else:
-            raise ValueError(
-                'Required property \'model_id\' not present in TranslationModel JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        if 'target' in _dict:
-            args['target'] = _dict.get('target')
-        if 'base_model_id' in _dict:
-            args['base_model_id'] = _dict.get('base_model_id')
-        if 'domain' in _dict:
-            args['domain'] = _dict.get('domain')
-        if 'customizable' in _dict:
-            args['customizable'] = _dict.get('customizable')
-        if 'default_model' in _dict:
-            args['default_model'] = _dict.get('default_model')
-        if 'owner' in _dict:
-            args['owner'] = _dict.get('owner')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TranslationModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target
-        if hasattr(self, 'base_model_id') and self.base_model_id is not None:
-            _dict['base_model_id'] = self.base_model_id
-        if hasattr(self, 'domain') and self.domain is not None:
-            _dict['domain'] = self.domain
-        if hasattr(self, 'customizable') and self.customizable is not None:
-            _dict['customizable'] = self.customizable
-        if hasattr(self, 'default_model') and self.default_model is not None:
-            _dict['default_model'] = self.default_model
-        if hasattr(self, 'owner') and self.owner is not None:
-            _dict['owner'] = self.owner
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TranslationModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TranslationModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TranslationModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Availability of a model.
@@ -1913,13 +1403,19 @@ class TranslationModel():
         ERROR = 'error'
 
 
-class TranslationModels():
+class TranslationModels(Model):
     """
     The response type for listing existing translation models.
 
     :attr List[TranslationModel] models: An array of available models.
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'TranslationModel', required=True),
+    )
+
     def __init__(self, models: List['TranslationModel']) -> None:
         """
         Initialize a TranslationModels object.
@@ -1928,52 +1424,8 @@ class TranslationModels():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TranslationModels':
-        """Initialize a TranslationModels object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [
-                TranslationModel.from_dict(x) for x in _dict.get('models')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'models\' not present in TranslationModels JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TranslationModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TranslationModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TranslationModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TranslationModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TranslationResult():
+
+class TranslationResult(Model):
     """
     TranslationResult.
 
@@ -1989,6 +1441,17 @@ class TranslationResult():
           corresponding to the input text entries.
     """
 
+    __slots__ = ('word_count', 'character_count', 'detected_language',
+                 'detected_language_confidence', 'translations')
+
+    _fields = (
+        ModelField('word_count', required=True),
+        ModelField('character_count', required=True),
+        ModelField('detected_language'),
+        ModelField('detected_language_confidence'),
+        ModelField('translations', 'list', 'Translation', required=True),
+    )
+
     def __init__(self,
                  word_count: int,
                  character_count: int,
@@ -2016,76 +1479,3 @@ class TranslationResult():
         self.detected_language = detected_language
         self.detected_language_confidence = detected_language_confidence
         self.translations = translations
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TranslationResult':
-        """Initialize a TranslationResult object from a json dictionary."""
-        args = {}
-        if 'word_count' in _dict:
-            args['word_count'] = _dict.get('word_count')
-        else:
-            raise ValueError(
-                'Required property \'word_count\' not present in TranslationResult JSON'
-            )
-        if 'character_count' in _dict:
-            args['character_count'] = _dict.get('character_count')
-        else:
-            raise ValueError(
-                'Required property \'character_count\' not present in TranslationResult JSON'
-            )
-        if 'detected_language' in _dict:
-            args['detected_language'] = _dict.get('detected_language')
-        if 'detected_language_confidence' in _dict:
-            args['detected_language_confidence'] = _dict.get(
-                'detected_language_confidence')
-        if 'translations' in _dict:
-            args['translations'] = [
-                Translation.from_dict(x) for x in _dict.get('translations')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'translations\' not present in TranslationResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TranslationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'word_count') and self.word_count is not None:
-            _dict['word_count'] = self.word_count
-        if hasattr(self,
-                   'character_count') and self.character_count is not None:
-            _dict['character_count'] = self.character_count
-        if hasattr(self,
-                   'detected_language') and self.detected_language is not None:
-            _dict['detected_language'] = self.detected_language
-        if hasattr(self, 'detected_language_confidence'
-                  ) and self.detected_language_confidence is not None:
-            _dict[
-                'detected_language_confidence'] = self.detected_language_confidence
-        if hasattr(self, 'translations') and self.translations is not None:
-            _dict['translations'] = [x.to_dict() for x in self.translations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TranslationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TranslationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TranslationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
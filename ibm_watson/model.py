@@ -0,0 +1,604 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Behaviour shared by all of the generated Watson model classes.
+
+Models store their properties in `__slots__` instead of a per-instance
+`__dict__`, which makes large collections of them considerably smaller. Models
+that accept arbitrary properties (those with `get_properties` and
+`set_properties`, such as `assistant_v1.Context`) declare a `__dict__` slot
+instead and keep all of their properties in it.
+
+Each model lists its JSON properties in a `_fields` table of `ModelField`
+objects. `from_dict` and `to_dict` are generated from the table the first time
+they are used for a model class, so the model classes do not carry their own
+conversion code. The table is also used by `Model.from_dict_lazy`, which
+returns a view of a JSON dictionary that only decodes the properties that are
+read.
+
+Polymorphic models, whose JSON selects one of their subclasses, declare a
+`_discriminator` (a `ModelDiscriminator`) that maps the discriminator values
+to the subclasses.
+"""
+
+import json
+import sys
+from typing import Callable, Dict, List, Tuple
+
+from ibm_cloud_sdk_core import (date_to_string, datetime_to_string,
+                                string_to_date, string_to_datetime)
+
+# Slot attribute names of each model class, including inherited ones.
+_slot_names = {}
+
+# Resolved `_fields` of each model class.
+_model_fields = {}
+
+# Subclass of each discriminator value, for each polymorphic model class.
+_discriminated_classes = {}
+
+# Function that creates the lazy views of each model class.
+_lazy_factories = {}
+
+# Generated from_dict and to_dict functions of each model class.
+_decoders = {}
+_encoders = {}
+
+# Expressions that convert a JSON value to an attribute value, by field kind.
+_DECODE_EXPRESSIONS = {
+    'model': '{decode}({value})',
+    'list': '[{decode}(x) for x in {value}]',
+    'dict': '{{k: {decode}(v) for k, v in {value}.items()}}',
+    'datetime': 'string_to_datetime({value})',
+    'date': 'string_to_date({value})',
+}
+
+# Expressions that convert an attribute value to a JSON value, by field kind.
+_ENCODE_EXPRESSIONS = {
+    'model': '{value}.to_dict()',
+    'list': '[x.to_dict() for x in {value}]',
+    'dict': '{{k: v.to_dict() for k, v in {value}.items()}}',
+    'datetime': 'datetime_to_string({value})',
+    'date': 'date_to_string({value})',
+}
+
+
+class ModelField():
+    """
+    A JSON property of a model.
+
+    :attr str name: The attribute name of the property.
+    :attr str kind: How the JSON value is decoded: `value` (used as is),
+          `model`, `list` (a list of models), `dict` (a dictionary of models),
+          `datetime` or `date`.
+    :attr str model: The name of the model class of `model`, `list` and `dict`
+          properties, in the module of the model that declares the field.
+    :attr str key: The JSON property name, when it is not `name`.
+    :attr bool required: Whether the property must be present in the JSON.
+    """
+
+    __slots__ = ('name', 'kind', 'model', 'key', 'required', 'model_class')
+
+    def __init__(self,
+                 name: str,
+                 kind: str = 'value',
+                 model: str = None,
+                 *,
+                 key: str = None,
+                 required: bool = False) -> None:
+        self.name = name
+        self.kind = kind
+        self.model = model
+        self.key = key or name
+        self.required = required
+        self.model_class = None
+
+    def __repr__(self) -> str:
+        return ('ModelField({0!r}, {1!r}, {2!r}, key={3!r}, '
+                'required={4!r})').format(self.name, self.kind, self.model,
+                                          self.key, self.required)
+
+
+def get_fields(model_class: type) -> Tuple[ModelField, ...]:
+    """Return the `_fields` of a model class with their model classes set."""
+    fields = _model_fields.get(model_class)
+    if fields is None:
+        fields = model_class._fields
+        module = sys.modules[model_class.__module__]
+        for field in fields:
+            if field.model is not None and field.model_class is None:
+                field.model_class = getattr(module, field.model)
+        fields = _model_fields.setdefault(model_class, fields)
+    return fields
+
+
+def get_slot_names(model_class: type) -> Tuple[str, ...]:
+    """Return the names of the slot attributes of a model class."""
+    names = _slot_names.get(model_class)
+    if names is None:
+        names = []
+        for cls in reversed(model_class.__mro__):
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        names = _slot_names.setdefault(model_class, tuple(names))
+    return names
+
+
+class ModelDiscriminator():
+    """
+    The JSON property that selects the subclass of a polymorphic model.
+
+    :attr str property: The name of the JSON property.
+    :attr dict mapping: The name of the subclass for each value of the
+          property, in the module of the model that declares the
+          discriminator.
+    :attr bool abstract: Whether the model class itself cannot be created,
+          which makes a value without a subclass an error. Otherwise such
+          values are decoded as the model class itself.
+    """
+
+    __slots__ = ('property', 'mapping', 'abstract')
+
+    def __init__(self, property: str, mapping: Dict[str, str], *,
+                 abstract: bool = False) -> None:
+        # pylint: disable=redefined-builtin
+        self.property = property
+        self.mapping = mapping
+        self.abstract = abstract
+
+
+def get_discriminated_classes(model_class: type) -> Dict[str, type]:
+    """
+    Return the subclass of each discriminator value of a polymorphic model.
+
+    Mapped classes that do not exist in the module of the model are left out.
+    """
+    classes = _discriminated_classes.get(model_class)
+    if classes is None:
+        module = sys.modules[model_class.__module__]
+        classes = {}
+        for value, class_name in model_class._discriminator.mapping.items():
+            disc_class = getattr(module, class_name, None)
+            if disc_class is not None and disc_class is not model_class:
+                classes[value] = disc_class
+        classes = _discriminated_classes.setdefault(model_class, classes)
+    return classes
+
+
+def get_discriminated_class(model_class: type, _dict: Dict) -> type:
+    """
+    Return the class of the model that a json dictionary represents.
+
+    This is the subclass selected by the discriminator of `model_class`, or
+    `model_class` itself when it has no discriminator or no subclass matches.
+
+    :raises ValueError: If the discriminator property is missing.
+    :raises Exception: If no subclass matches and `model_class` is abstract.
+    """
+    discriminator = model_class.__dict__.get('_discriminator')
+    if discriminator is None:
+        return model_class
+    value = _dict.get(discriminator.property)
+    if value is None:
+        raise ValueError(
+            'Discriminator property \'{0}\' not found in {1} JSON'.format(
+                discriminator.property, model_class.__name__))
+    classes = get_discriminated_classes(model_class)
+    disc_class = classes.get(value)
+    if disc_class is not None:
+        return disc_class
+    if discriminator.abstract:
+        raise Exception(
+            'Cannot convert dictionary into an instance of base class {0!r}. '
+            'The discriminator value should map to a valid subclass: {1}'.
+            format(model_class.__name__,
+                   ', '.join(sorted({c.__name__ for c in classes.values()}))))
+    return model_class
+
+
+class Model():
+    """
+    Common base class of the Watson models.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+
+    # The ModelDiscriminator of a polymorphic model class.
+    _discriminator = None
+
+    # The model class of a lazy view class.
+    _eager_class = None
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Model':
+        """Initialize a model object from a json dictionary."""
+        decoder = _decoders.get(cls)
+        if decoder is None:
+            decoder = _compile_decoder(cls)
+        return decoder(_dict)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a model object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        encoder = _encoders.get(type(self))
+        if encoder is None:
+            encoder = _compile_encoder(type(self))
+        return encoder(self)
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @classmethod
+    def from_dict_lazy(cls, _dict: Dict) -> 'Model':
+        """
+        Return a lazy view of a json dictionary as an instance of this class.
+
+        Unlike `from_dict`, which decodes the whole dictionary up front, the
+        view only checks that the required properties are present. Each
+        property is decoded when it is first read and then kept, and nested
+        models are lazy views as well. Reading a few properties of a large
+        response, such as the first result of a `QueryResponse`, therefore
+        costs little more than the properties read.
+
+        The view keeps a reference to `_dict`, which must not be changed
+        while the view is used. Copying or pickling a view produces an
+        ordinary model. Models that accept arbitrary properties, such as
+        `assistant_v1.Context`, decode all of their own properties on the
+        first access to any of them.
+        """
+        return from_dict_lazy(cls, _dict)
+
+    def _get_state(self) -> Dict:
+        """Return the attributes of this model that have been set."""
+        state = {}
+        for name in get_slot_names(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    @property
+    def __dict__(self) -> Dict:
+        """
+        Return a new `dict` of the attributes of this model.
+
+        Kept for code written against models without `__slots__`, such as
+        `Model(**other.__dict__)`. Changing the returned `dict` does not change
+        the model. Models with a `__dict__` slot return their real `__dict__`.
+        """
+        return self._get_state()
+
+    def __eq__(self, other: 'Model') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self._eager_class or self.__class__):
+            return False
+        return vars(self) == vars(other)
+
+    def __ne__(self, other: 'Model') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    def __str__(self) -> str:
+        """Return a `str` version of this model."""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def _define_function(model_class: type, lines: List[str],
+                     namespace: Dict) -> Callable:
+    """Execute the source lines of a function and return the function."""
+    name = lines[0][len('def '):lines[0].index('(')]
+    filename = '<{0}.{1}>'.format(model_class.__qualname__, name)
+    code = compile('\n'.join(lines), filename, 'exec')
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def _compile_decoder(model_class: type) -> Callable:
+    """
+    Generate the from_dict function of a model class.
+
+    The function sets the attributes of a new instance directly, without
+    calling `__init__`. Models that accept arbitrary properties are created
+    with `__init__`, which sets the additional properties.
+    """
+    namespace = {
+        'cls': model_class,
+        'new': object.__new__,
+        'string_to_date': string_to_date,
+        'string_to_datetime': string_to_datetime,
+    }
+    dynamic = hasattr(model_class, '_properties')
+    lines = ['def from_dict(_dict):']
+    if '_discriminator' in model_class.__dict__:
+        # Look the subclass up directly, and leave the errors and the values
+        # without a subclass to get_discriminated_class.
+        namespace['classes'] = get_discriminated_classes(model_class)
+        namespace['discriminate'] = get_discriminated_class
+        lines.append('    disc_class = classes.get(_dict.get({0!r}))'.format(
+            model_class._discriminator.property))
+        lines.append('    if disc_class is None:')
+        lines.append('        disc_class = discriminate(cls, _dict)')
+        lines.append('    if disc_class is not cls:')
+        lines.append('        return disc_class.from_dict(_dict)')
+    fields = get_fields(model_class)
+    for field in fields:
+        if field.required:
+            message = 'Required property \'{0}\' not present in {1} JSON'
+            message = message.format(field.key, model_class.__name__)
+            lines.append('    if {0!r} not in _dict:'.format(field.key))
+            lines.append('        raise ValueError({0!r})'.format(message))
+    if dynamic:
+        lines.append('    args = {k: v for (k, v) in _dict.items() '
+                     'if k not in cls._properties}')
+    else:
+        lines.append('    obj = new(cls)')
+    lines.append('    get = _dict.get')
+    for index, field in enumerate(fields):
+        if field.kind == 'value':
+            expression = 'value'
+        else:
+            decode = 'decode_{0}'.format(index)
+            if field.model_class is not None:
+                namespace[decode] = field.model_class.from_dict
+            expression = 'None if value is None else ' + _DECODE_EXPRESSIONS[
+                field.kind].format(decode=decode, value='value')
+        lines.append('    value = get({0!r})'.format(field.key))
+        if dynamic:
+            lines.append('    if {0!r} in _dict:'.format(field.key))
+            lines.append('        args[{0!r}] = {1}'.format(
+                field.name, expression))
+        else:
+            lines.append('    obj.{0} = {1}'.format(field.name, expression))
+    lines.append('    return cls(**args)' if dynamic else '    return obj')
+    decoder = _define_function(model_class, lines, namespace)
+    return _decoders.setdefault(model_class, decoder)
+
+
+def _compile_encoder(model_class: type) -> Callable:
+    """Generate the to_dict function of a model class."""
+    namespace = {
+        'cls': model_class,
+        'date_to_string': date_to_string,
+        'datetime_to_string': datetime_to_string,
+    }
+    lines = ['def to_dict(self):', '    _dict = {}']
+    for field in get_fields(model_class):
+        expression = _ENCODE_EXPRESSIONS.get(field.kind, '{value}').format(
+            value='value')
+        lines.append('    try:')
+        lines.append('        value = self.{0}'.format(field.name))
+        lines.append('    except AttributeError:')
+        lines.append('        value = None')
+        lines.append('    if value is not None:')
+        lines.append('        _dict[{0!r}] = {1}'.format(field.key, expression))
+    if hasattr(model_class, '_properties'):
+        lines.append('    for _key in [k for k in vars(self).keys() '
+                     'if k not in cls._properties]:')
+        lines.append('        if getattr(self, _key, None) is not None:')
+        lines.append('            _dict[_key] = getattr(self, _key)')
+    lines.append('    return _dict')
+    encoder = _define_function(model_class, lines, namespace)
+    return _encoders.setdefault(model_class, encoder)
+
+
+class _LazyProperty():
+    """
+    Attribute of a lazy view that decodes its JSON property on first read.
+
+    The decoded value is stored in the slot of the model class, where later
+    reads find it.
+    """
+
+    __slots__ = ('field', 'slot', 'factory')
+
+    def __init__(self, field: ModelField, slot) -> None:
+        self.field = field
+        self.slot = slot
+        # Lazy view factory of the model class of the field, set on first use.
+        self.factory = None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        value = self.decode(instance._raw.get(self.field.key))
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance) -> None:
+        # The JSON property cannot be removed from the view, so deleting it
+        # leaves None, which `to_dict` omits like a missing property.
+        self.slot.__set__(instance, None)
+
+    def decode(self, value):
+        """Return the attribute value of the JSON value of the property."""
+        kind = self.field.kind
+        if value is None or kind == 'value':
+            return value
+        if kind == 'datetime':
+            return string_to_datetime(value)
+        if kind == 'date':
+            return string_to_date(value)
+        factory = self.factory
+        if factory is None:
+            factory = self.factory = _get_lazy_factory(self.field.model_class)
+        if kind == 'model':
+            return factory(value)
+        if kind == 'list':
+            return [factory(x) for x in value]
+        if kind == 'dict':
+            return {k: factory(v) for k, v in value.items()}
+        raise ValueError('Unknown field kind {0!r}'.format(kind))
+
+
+def _new_model(model_class: type, state: Dict) -> Model:
+    """Return a model with the given attributes, without calling `__init__`."""
+    model = model_class.__new__(model_class)
+    for name, value in state.items():
+        setattr(model, name, value)
+    return model
+
+
+def _reduce_lazy(self, protocol):
+    """Copy and pickle a lazy view as an instance of its model class."""
+    return (_new_model, (self._eager_class, dict(vars(self))))
+
+
+def _new_lazy_class(model_class: type, namespace: Dict) -> type:
+    """Return a lazy view class of a model class."""
+    namespace.update({
+        '__slots__': ('_raw',),
+        '__module__': model_class.__module__,
+        '__qualname__': model_class.__qualname__,
+        '__reduce_ex__': _reduce_lazy,
+        '_eager_class': model_class,
+    })
+    lazy_class = type(model_class.__name__, (model_class,), namespace)
+    _slot_names[lazy_class] = get_slot_names(model_class)
+    return lazy_class
+
+
+def _new_dynamic_lazy_class(model_class: type, fields: Tuple[ModelField, ...]):
+    """
+    Return a lazy view class of a model class with arbitrary properties.
+
+    These models keep their properties in a `__dict__`, so the view cannot
+    decode them one at a time. Instead all of them are set on the first
+    access to any property, and nested models are again lazy views.
+    """
+    properties = model_class._properties
+    decoders = tuple(_LazyProperty(field, None) for field in fields)
+    real_dict = next(c.__dict__['__dict__']
+                     for c in model_class.__mro__
+                     if '__dict__' in c.__dict__.get('__slots__', ()))
+
+    def hydrate(self):
+        raw = self._raw
+        self._raw = None
+        args = {k: v for (k, v) in raw.items() if k not in properties}
+        for decoder in decoders:
+            if decoder.field.key in raw:
+                args[decoder.field.name] = decoder.decode(
+                    raw[decoder.field.key])
+        model_class.__init__(self, **args)
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise AttributeError('{0!r} object has no attribute {1!r}'.format(
+                model_class.__name__, name))
+        hydrate(self)
+        return getattr(self, name)
+
+    def __setattr__(self, name, value):
+        if name != '_raw' and self._raw is not None:
+            hydrate(self)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self._raw is not None:
+            hydrate(self)
+        object.__delattr__(self, name)
+
+    def get_dict(self):
+        if self._raw is not None:
+            hydrate(self)
+        return real_dict.__get__(self)
+
+    return _new_lazy_class(
+        model_class, {
+            '__getattr__': __getattr__,
+            '__setattr__': __setattr__,
+            '__delattr__': __delattr__,
+            '__dict__': property(get_dict),
+        })
+
+
+def _new_lazy_factory(model_class: type):
+    """Return a function that creates lazy views of exactly `model_class`."""
+    fields = get_fields(model_class)
+    if hasattr(model_class, '_properties'):
+        lazy_class = _new_dynamic_lazy_class(model_class, fields)
+    else:
+        namespace = {}
+        for field in fields:
+            slot = next(c.__dict__[field.name]
+                        for c in model_class.__mro__
+                        if field.name in c.__dict__)
+            namespace[field.name] = _LazyProperty(field, slot)
+        lazy_class = _new_lazy_class(model_class, namespace)
+    new = lazy_class.__new__
+    set_raw = lazy_class._raw.__set__
+    required = tuple(field.key for field in fields if field.required)
+
+    def factory(_dict):
+        for key in required:
+            if key not in _dict:
+                raise ValueError(
+                    'Required property \'{0}\' not present in {1} JSON'.format(
+                        key, model_class.__name__))
+        view = new(lazy_class)
+        set_raw(view, _dict)
+        return view
+
+    return factory
+
+
+def _get_lazy_factory(model_class: type):
+    """
+    Return the function that creates lazy views of a model class.
+
+    The function takes a json dictionary and is built once per class, so that
+    the views of the items of long lists are cheap to create.
+    """
+    factory = _lazy_factories.get(model_class)
+    if factory is not None:
+        return factory
+
+    discriminator = model_class.__dict__.get('_discriminator')
+    if discriminator is None:
+        factory = _new_lazy_factory(model_class)
+    else:
+        # Abstract models raise in get_discriminated_class instead.
+        create = None if discriminator.abstract else _new_lazy_factory(
+            model_class)
+
+        def factory(_dict):
+            disc_class = get_discriminated_class(model_class, _dict)
+            if disc_class is model_class:
+                return create(_dict)
+            return _get_lazy_factory(disc_class)(_dict)
+
+    return _lazy_factories.setdefault(model_class, factory)
+
+
+def from_dict_lazy(model_class: type, _dict: Dict) -> Model:
+    """Return a lazy view of a json dictionary, see `Model.from_dict_lazy`."""
+    return _get_lazy_factory(model_class)(_dict)
@@ -0,0 +1,199 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming encoder of multipart/form-data request bodies.
+
+`requests` reads every file of a multipart request into memory before sending
+it. The services send the form data of operations such as
+`create_classifier` or `add_document` with a `MultipartEncoder` instead,
+which reads the files in chunks while the body is sent, so memory use does not
+depend on the size of the files.
+
+The parts are encoded exactly as `requests` encodes them. A part can also be
+an iterable of `bytes`, such as a generator. When the size of every part is
+known, the body has a Content-Length; otherwise it is sent with chunked
+transfer encoding.
+"""
+
+import io
+import os
+import stat
+import uuid
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from requests.utils import guess_filename
+from urllib3.fields import RequestField
+
+CHUNK_SIZE = 64 * 1024
+
+
+class MultipartEncoder():
+    """
+    A multipart/form-data body that reads its parts while it is sent.
+
+    An encoder is iterated once, by `requests` or `httpx`, or read with
+    `read()`.
+
+    :param list fields: The parts, as the `files` argument of `requests`: a
+           list of (name, value) pairs, where the value is a file, or a tuple
+           (filename, data[, content_type[, headers]]). The data is `bytes`,
+           `str`, a binary or text file, or an iterable of `bytes`.
+    :param str boundary: (optional) The boundary between parts. By default, a
+           random boundary.
+    :param int chunk_size: (optional) The number of bytes read from a file at
+           a time.
+
+    :attr str content_type: The Content-Type header of the body.
+    :attr int len: The size of the body, or `None` if a part has no known
+          size.
+    """
+
+    def __init__(self,
+                 fields: List[Tuple[str, object]],
+                 *,
+                 boundary: str = None,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.content_type = 'multipart/form-data; boundary={0}'.format(
+            self.boundary)
+        self._parts = []
+        for name, value in fields:
+            part = _get_part(name, value)
+            if part is not None:
+                self._parts.append(part)
+        self._closing = '--{0}--\r\n'.format(self.boundary).encode('latin-1')
+        self.len = self._get_length()
+        self._chunks = None
+        self._buffer = bytearray()
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._chunks is None:
+            self._chunks = self._iter_chunks()
+        if self._buffer:
+            buffered = bytes(self._buffer)
+            self._buffer.clear()
+            yield buffered
+        yield from self._chunks
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` more bytes of the body, or the rest of it."""
+        if self._chunks is None:
+            self._chunks = self._iter_chunks()
+        while size is None or size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def _get_length(self) -> Optional[int]:
+        length = len(self._closing)
+        for header, data in self._parts:
+            size = get_size(data)
+            if size is None:
+                return None
+            length += len(self._delimiter()) + len(header) + size + 2
+        return length
+
+    def _delimiter(self) -> bytes:
+        return '--{0}\r\n'.format(self.boundary).encode('latin-1')
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        delimiter = self._delimiter()
+        for header, data in self._parts:
+            yield delimiter + header
+            yield from _iter_data(data, self.chunk_size)
+            yield b'\r\n'
+        yield self._closing
+
+    def __repr__(self) -> str:
+        return '<MultipartEncoder parts={0} len={1}>'.format(
+            len(self._parts), self.len)
+
+
+def _get_part(name: str, value) -> Optional[Tuple[bytes, object]]:
+    """Return the rendered headers and the data of a part, as requests."""
+    content_type = headers = None
+    if isinstance(value, (tuple, list)):
+        if len(value) == 2:
+            filename, data = value
+        elif len(value) == 3:
+            filename, data, content_type = value
+        else:
+            filename, data, content_type, headers = value
+    else:
+        filename = guess_filename(value) or name
+        data = value
+    if data is None:
+        return None
+    if isinstance(data, int):
+        data = str(data)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    elif isinstance(data, bytearray):
+        data = bytes(data)
+    field = RequestField(name=name,
+                         data=b'',
+                         filename=filename,
+                         headers=headers)
+    field.make_multipart(content_type=content_type)
+    return field.render_headers().encode('utf-8'), data
+
+
+def get_size(data) -> Optional[int]:
+    """Return the number of bytes left in `data`, or `None` if unknown."""
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, io.TextIOBase) or not hasattr(data, 'read'):
+        # Encoded text, and iterables, have no size up front.
+        return None
+    try:
+        position = data.tell()
+    except (AttributeError, OSError):
+        return None
+    try:
+        status = os.fstat(data.fileno())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    else:
+        if stat.S_ISREG(status.st_mode):
+            return max(0, status.st_size - position)
+        return None
+    try:
+        end = data.seek(0, io.SEEK_END)
+        data.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return max(0, end - position)
+
+
+def _iter_data(data, chunk_size: int) -> Iterable[bytes]:
+    if isinstance(data, bytes):
+        yield data
+    elif hasattr(data, 'read'):
+        while True:
+            chunk = data.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+    else:
+        for chunk in data:
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
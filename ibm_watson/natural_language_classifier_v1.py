@@ -34,22 +34,24 @@ See: https://cloud.ibm.com/docs/natural-language-classifier
 
 from datetime import datetime
 from enum import Enum
-from typing import BinaryIO, Dict, List
-import json
+from typing import BinaryIO, List
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class NaturalLanguageClassifierV1(BaseService):
+class NaturalLanguageClassifierV1(WatsonService):
     """The Natural Language Classifier V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.natural-language-classifier.watson.cloud.ibm.com'
@@ -59,6 +61,7 @@ class NaturalLanguageClassifierV1(BaseService):
         self,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Natural Language Classifier service.
@@ -66,6 +69,9 @@ class NaturalLanguageClassifierV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         print(
             """
@@ -77,10 +83,13 @@ class NaturalLanguageClassifierV1(BaseService):
         ) 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(NaturalLanguageClassifierV1))
 
     #########################
     # Classify text
@@ -114,7 +123,7 @@ class NaturalLanguageClassifierV1(BaseService):
 
         data = {'text': text}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -131,7 +140,7 @@ class NaturalLanguageClassifierV1(BaseService):
                                        headers=headers,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classification, **kwargs)
         return response
 
     def classify_collection(self, classifier_id: str,
@@ -164,7 +173,7 @@ class NaturalLanguageClassifierV1(BaseService):
 
         data = {'collection': collection}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -181,7 +190,9 @@ class NaturalLanguageClassifierV1(BaseService):
                                        headers=headers,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ClassificationCollection,
+                             **kwargs)
         return response
 
     #########################
@@ -238,7 +249,7 @@ class NaturalLanguageClassifierV1(BaseService):
                                        headers=headers,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifier, **kwargs)
         return response
 
     def list_classifiers(self, **kwargs) -> DetailedResponse:
@@ -265,7 +276,7 @@ class NaturalLanguageClassifierV1(BaseService):
         url = '/v1/classifiers'
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ClassifierList, **kwargs)
         return response
 
     def get_classifier(self, classifier_id: str, **kwargs) -> DetailedResponse:
@@ -298,7 +309,7 @@ class NaturalLanguageClassifierV1(BaseService):
         url = '/v1/classifiers/{classifier_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifier, **kwargs)
         return response
 
     def delete_classifier(self, classifier_id: str,
@@ -336,12 +347,16 @@ class NaturalLanguageClassifierV1(BaseService):
         return response
 
 
+class AsyncNaturalLanguageClassifierV1(AsyncWatsonService, NaturalLanguageClassifierV1):
+    """The Natural Language Classifier V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class Classification():
+class Classification(Model):
     """
     Response from the classifier for a phrase.
 
@@ -353,6 +368,16 @@ class Classification():
           class-confidence pairs sorted in descending order of confidence.
     """
 
+    __slots__ = ('classifier_id', 'url', 'text', 'top_class', 'classes')
+
+    _fields = (
+        ModelField('classifier_id'),
+        ModelField('url'),
+        ModelField('text'),
+        ModelField('top_class'),
+        ModelField('classes', 'list', 'ClassifiedClass'),
+    )
+
     def __init__(self,
                  *,
                  classifier_id: str = None,
@@ -376,64 +401,8 @@ class Classification():
         self.top_class = top_class
         self.classes = classes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Classification':
-        """Initialize a Classification object from a json dictionary."""
-        args = {}
-        if 'classifier_id' in _dict:
-            args['classifier_id'] = _dict.get('classifier_id')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'top_class' in _dict:
-            args['top_class'] = _dict.get('top_class')
-        if 'classes' in _dict:
-            args['classes'] = [
-                ClassifiedClass.from_dict(x) for x in _dict.get('classes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Classification object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'classifier_id') and self.classifier_id is not None:
-            _dict['classifier_id'] = self.classifier_id
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'top_class') and self.top_class is not None:
-            _dict['top_class'] = self.top_class
-        if hasattr(self, 'classes') and self.classes is not None:
-            _dict['classes'] = [x.to_dict() for x in self.classes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Classification object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Classification') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Classification') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassificationCollection():
+
+class ClassificationCollection(Model):
     """
     Response from the classifier for multiple phrases.
 
@@ -443,6 +412,14 @@ class ClassificationCollection():
           responses for each submitted phrase.
     """
 
+    __slots__ = ('classifier_id', 'url', 'collection')
+
+    _fields = (
+        ModelField('classifier_id'),
+        ModelField('url'),
+        ModelField('collection', 'list', 'CollectionItem'),
+    )
+
     def __init__(self,
                  *,
                  classifier_id: str = None,
@@ -460,56 +437,8 @@ class ClassificationCollection():
         self.url = url
         self.collection = collection
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassificationCollection':
-        """Initialize a ClassificationCollection object from a json dictionary."""
-        args = {}
-        if 'classifier_id' in _dict:
-            args['classifier_id'] = _dict.get('classifier_id')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        if 'collection' in _dict:
-            args['collection'] = [
-                CollectionItem.from_dict(x) for x in _dict.get('collection')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassificationCollection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'classifier_id') and self.classifier_id is not None:
-            _dict['classifier_id'] = self.classifier_id
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'collection') and self.collection is not None:
-            _dict['collection'] = [x.to_dict() for x in self.collection]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassificationCollection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassificationCollection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassificationCollection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassifiedClass():
+
+class ClassifiedClass(Model):
     """
     Class and confidence.
 
@@ -519,6 +448,13 @@ class ClassifiedClass():
     :attr str class_name: (optional) Class label.
     """
 
+    __slots__ = ('confidence', 'class_name')
+
+    _fields = (
+        ModelField('confidence'),
+        ModelField('class_name'),
+    )
+
     def __init__(self,
                  *,
                  confidence: float = None,
@@ -534,50 +470,8 @@ class ClassifiedClass():
         self.confidence = confidence
         self.class_name = class_name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifiedClass':
-        """Initialize a ClassifiedClass object from a json dictionary."""
-        args = {}
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'class_name' in _dict:
-            args['class_name'] = _dict.get('class_name')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifiedClass object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'class_name') and self.class_name is not None:
-            _dict['class_name'] = self.class_name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifiedClass object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifiedClass') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifiedClass') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Classifier():
+
+class Classifier(Model):
     """
     A classifier for natural language phrases.
 
@@ -591,6 +485,19 @@ class Classifier():
     :attr str language: (optional) The language used for the classifier.
     """
 
+    __slots__ = ('name', 'url', 'status', 'classifier_id', 'created',
+                 'status_description', 'language')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('url', required=True),
+        ModelField('status'),
+        ModelField('classifier_id', required=True),
+        ModelField('created', 'datetime'),
+        ModelField('status_description'),
+        ModelField('language'),
+    )
+
     def __init__(self,
                  url: str,
                  classifier_id: str,
@@ -616,76 +523,6 @@ class Classifier():
         self.status_description = status_description
         self.language = language
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Classifier':
-        """Initialize a Classifier object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in Classifier JSON')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'classifier_id' in _dict:
-            args['classifier_id'] = _dict.get('classifier_id')
-        else:
-            raise ValueError(
-                'Required property \'classifier_id\' not present in Classifier JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'status_description' in _dict:
-            args['status_description'] = _dict.get('status_description')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Classifier object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'status') and getattr(self, 'status') is not None:
-            _dict['status'] = getattr(self, 'status')
-        if hasattr(self, 'classifier_id') and self.classifier_id is not None:
-            _dict['classifier_id'] = self.classifier_id
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'status_description') and getattr(
-                self, 'status_description') is not None:
-            _dict['status_description'] = getattr(self, 'status_description')
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Classifier object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Classifier') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Classifier') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The state of the classifier.
@@ -697,7 +534,7 @@ class Classifier():
         UNAVAILABLE = 'Unavailable'
 
 
-class ClassifierList():
+class ClassifierList(Model):
     """
     List of available classifiers.
 
@@ -705,6 +542,12 @@ class ClassifierList():
           Returns an empty array if no classifiers are available.
     """
 
+    __slots__ = ('classifiers',)
+
+    _fields = (
+        ModelField('classifiers', 'list', 'Classifier', required=True),
+    )
+
     def __init__(self, classifiers: List['Classifier']) -> None:
         """
         Initialize a ClassifierList object.
@@ -714,58 +557,20 @@ class ClassifierList():
         """
         self.classifiers = classifiers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifierList':
-        """Initialize a ClassifierList object from a json dictionary."""
-        args = {}
-        if 'classifiers' in _dict:
-            args['classifiers'] = [
-                Classifier.from_dict(x) for x in _dict.get('classifiers')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'classifiers\' not present in ClassifierList JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifierList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'classifiers') and self.classifiers is not None:
-            _dict['classifiers'] = [x.to_dict() for x in self.classifiers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifierList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifierList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifierList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassifyInput():
+
+class ClassifyInput(Model):
     """
     Request payload to classify.
 
     :attr str text: The submitted phrase. The maximum length is 2048 characters.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text', required=True),
+    )
+
     def __init__(self, text: str) -> None:
         """
         Initialize a ClassifyInput object.
@@ -775,49 +580,8 @@ class ClassifyInput():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifyInput':
-        """Initialize a ClassifyInput object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in ClassifyInput JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifyInput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifyInput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifyInput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifyInput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionItem():
+
+class CollectionItem(Model):
     """
     Response from the classifier for a phrase in a collection.
 
@@ -828,6 +592,14 @@ class CollectionItem():
           class-confidence pairs sorted in descending order of confidence.
     """
 
+    __slots__ = ('text', 'top_class', 'classes')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('top_class'),
+        ModelField('classes', 'list', 'ClassifiedClass'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -845,51 +617,3 @@ class CollectionItem():
         self.text = text
         self.top_class = top_class
         self.classes = classes
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionItem':
-        """Initialize a CollectionItem object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'top_class' in _dict:
-            args['top_class'] = _dict.get('top_class')
-        if 'classes' in _dict:
-            args['classes'] = [
-                ClassifiedClass.from_dict(x) for x in _dict.get('classes')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionItem object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'top_class') and self.top_class is not None:
-            _dict['top_class'] = self.top_class
-        if hasattr(self, 'classes') and self.classes is not None:
-            _dict['classes'] = [x.to_dict() for x in self.classes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionItem object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionItem') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionItem') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -31,22 +31,25 @@ See: https://cloud.ibm.com/docs/natural-language-understanding
 
 from datetime import datetime
 from enum import Enum
-from typing import BinaryIO, Dict, List
-import json
+from typing import BinaryIO, List
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model as BaseModel
+from .model import ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class NaturalLanguageUnderstandingV1(BaseService):
+class NaturalLanguageUnderstandingV1(WatsonService):
     """The Natural Language Understanding V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.natural-language-understanding.watson.cloud.ibm.com'
@@ -57,6 +60,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Natural Language Understanding service.
@@ -67,17 +71,23 @@ class NaturalLanguageUnderstandingV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(NaturalLanguageUnderstandingV1))
 
     #########################
     # Analyze
@@ -171,7 +181,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
             'limit_text_characters': limit_text_characters
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -185,7 +195,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AnalysisResults, **kwargs)
         return response
 
     #########################
@@ -223,7 +233,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ListModelsResults, **kwargs)
         return response
 
     def delete_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -261,7 +271,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteModelResults, **kwargs)
         return response
 
     #########################
@@ -340,7 +350,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SentimentModel, **kwargs)
         return response
 
     def list_sentiment_models(self, **kwargs) -> DetailedResponse:
@@ -372,7 +382,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ListSentimentModelsResponse,
+                             **kwargs)
         return response
 
     def get_sentiment_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -410,7 +422,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SentimentModel, **kwargs)
         return response
 
     def update_sentiment_model(self,
@@ -491,7 +503,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SentimentModel, **kwargs)
         return response
 
     def delete_sentiment_model(self, model_id: str,
@@ -531,7 +543,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteModelResults, **kwargs)
         return response
 
     #########################
@@ -615,7 +627,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CategoriesModel, **kwargs)
         return response
 
     def list_categories_models(self, **kwargs) -> DetailedResponse:
@@ -647,7 +659,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=CategoriesModelList,
+                             **kwargs)
         return response
 
     def get_categories_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -685,7 +699,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CategoriesModel, **kwargs)
         return response
 
     def update_categories_model(self,
@@ -771,7 +785,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CategoriesModel, **kwargs)
         return response
 
     def delete_categories_model(self, model_id: str,
@@ -811,7 +825,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteModelResults, **kwargs)
         return response
 
     #########################
@@ -896,7 +910,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ClassificationsModel,
+                             **kwargs)
         return response
 
     def list_classifications_models(self, **kwargs) -> DetailedResponse:
@@ -929,7 +945,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ClassificationsModelList,
+                             **kwargs)
         return response
 
     def get_classifications_model(self, model_id: str,
@@ -968,7 +986,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ClassificationsModel,
+                             **kwargs)
         return response
 
     def update_classifications_model(self,
@@ -1055,7 +1075,9 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=ClassificationsModel,
+                             **kwargs)
         return response
 
     def delete_classifications_model(self, model_id: str,
@@ -1096,7 +1118,7 @@ class NaturalLanguageUnderstandingV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=DeleteModelResults, **kwargs)
         return response
 
 
@@ -1152,12 +1174,16 @@ class UpdateClassificationsModelEnums:
         APPLICATION_JSON = 'application/json'
 
 
+class AsyncNaturalLanguageUnderstandingV1(AsyncWatsonService, NaturalLanguageUnderstandingV1):
+    """The Natural Language Understanding V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AnalysisResults():
+class AnalysisResults(BaseModel):
     """
     Results of the analysis, organized by feature.
 
@@ -1189,6 +1215,29 @@ class AnalysisResults():
           analysis.
     """
 
+    __slots__ = ('language', 'analyzed_text', 'retrieved_url', 'usage',
+                 'concepts', 'entities', 'keywords', 'categories',
+                 'classifications', 'emotion', 'metadata', 'relations',
+                 'semantic_roles', 'sentiment', 'syntax')
+
+    _fields = (
+        ModelField('language'),
+        ModelField('analyzed_text'),
+        ModelField('retrieved_url'),
+        ModelField('usage', 'model', 'AnalysisResultsUsage'),
+        ModelField('concepts', 'list', 'ConceptsResult'),
+        ModelField('entities', 'list', 'EntitiesResult'),
+        ModelField('keywords', 'list', 'KeywordsResult'),
+        ModelField('categories', 'list', 'CategoriesResult'),
+        ModelField('classifications', 'list', 'ClassificationsResult'),
+        ModelField('emotion', 'model', 'EmotionResult'),
+        ModelField('metadata', 'model', 'FeaturesResultsMetadata'),
+        ModelField('relations', 'list', 'RelationsResult'),
+        ModelField('semantic_roles', 'list', 'SemanticRolesResult'),
+        ModelField('sentiment', 'model', 'SentimentResult'),
+        ModelField('syntax', 'model', 'SyntaxResult'),
+    )
+
     def __init__(self,
                  *,
                  language: str = None,
@@ -1252,123 +1301,8 @@ class AnalysisResults():
         self.sentiment = sentiment
         self.syntax = syntax
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AnalysisResults':
-        """Initialize a AnalysisResults object from a json dictionary."""
-        args = {}
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'analyzed_text' in _dict:
-            args['analyzed_text'] = _dict.get('analyzed_text')
-        if 'retrieved_url' in _dict:
-            args['retrieved_url'] = _dict.get('retrieved_url')
-        if 'usage' in _dict:
-            args['usage'] = AnalysisResultsUsage.from_dict(_dict.get('usage'))
-        if 'concepts' in _dict:
-            args['concepts'] = [
-                ConceptsResult.from_dict(x) for x in _dict.get('concepts')
-            ]
-        if 'entities' in _dict:
-            args['entities'] = [
-                EntitiesResult.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'keywords' in _dict:
-            args['keywords'] = [
-                KeywordsResult.from_dict(x) for x in _dict.get('keywords')
-            ]
-        if 'categories' in _dict:
-            args['categories'] = [
-                CategoriesResult.from_dict(x) for x in _dict.get('categories')
-            ]
-        if 'classifications' in _dict:
-            args['classifications'] = [
-                ClassificationsResult.from_dict(x)
-                for x in _dict.get('classifications')
-            ]
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionResult.from_dict(_dict.get('emotion'))
-        if 'metadata' in _dict:
-            args['metadata'] = FeaturesResultsMetadata.from_dict(
-                _dict.get('metadata'))
-        if 'relations' in _dict:
-            args['relations'] = [
-                RelationsResult.from_dict(x) for x in _dict.get('relations')
-            ]
-        if 'semantic_roles' in _dict:
-            args['semantic_roles'] = [
-                SemanticRolesResult.from_dict(x)
-                for x in _dict.get('semantic_roles')
-            ]
-        if 'sentiment' in _dict:
-            args['sentiment'] = SentimentResult.from_dict(
-                _dict.get('sentiment'))
-        if 'syntax' in _dict:
-            args['syntax'] = SyntaxResult.from_dict(_dict.get('syntax'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AnalysisResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'analyzed_text') and self.analyzed_text is not None:
-            _dict['analyzed_text'] = self.analyzed_text
-        if hasattr(self, 'retrieved_url') and self.retrieved_url is not None:
-            _dict['retrieved_url'] = self.retrieved_url
-        if hasattr(self, 'usage') and self.usage is not None:
-            _dict['usage'] = self.usage.to_dict()
-        if hasattr(self, 'concepts') and self.concepts is not None:
-            _dict['concepts'] = [x.to_dict() for x in self.concepts]
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = [x.to_dict() for x in self.keywords]
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = [x.to_dict() for x in self.categories]
-        if hasattr(self,
-                   'classifications') and self.classifications is not None:
-            _dict['classifications'] = [
-                x.to_dict() for x in self.classifications
-            ]
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata.to_dict()
-        if hasattr(self, 'relations') and self.relations is not None:
-            _dict['relations'] = [x.to_dict() for x in self.relations]
-        if hasattr(self, 'semantic_roles') and self.semantic_roles is not None:
-            _dict['semantic_roles'] = [x.to_dict() for x in self.semantic_roles]
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment.to_dict()
-        if hasattr(self, 'syntax') and self.syntax is not None:
-            _dict['syntax'] = self.syntax.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AnalysisResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AnalysisResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AnalysisResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AnalysisResultsUsage():
+
+class AnalysisResultsUsage(BaseModel):
     """
     API usage information for the request.
 
@@ -1377,6 +1311,14 @@ class AnalysisResultsUsage():
     :attr int text_units: (optional) Number of 10,000-character units processed.
     """
 
+    __slots__ = ('features', 'text_characters', 'text_units')
+
+    _fields = (
+        ModelField('features'),
+        ModelField('text_characters'),
+        ModelField('text_units'),
+    )
+
     def __init__(self,
                  *,
                  features: int = None,
@@ -1394,61 +1336,20 @@ class AnalysisResultsUsage():
         self.text_characters = text_characters
         self.text_units = text_units
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AnalysisResultsUsage':
-        """Initialize a AnalysisResultsUsage object from a json dictionary."""
-        args = {}
-        if 'features' in _dict:
-            args['features'] = _dict.get('features')
-        if 'text_characters' in _dict:
-            args['text_characters'] = _dict.get('text_characters')
-        if 'text_units' in _dict:
-            args['text_units'] = _dict.get('text_units')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AnalysisResultsUsage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'features') and self.features is not None:
-            _dict['features'] = self.features
-        if hasattr(self,
-                   'text_characters') and self.text_characters is not None:
-            _dict['text_characters'] = self.text_characters
-        if hasattr(self, 'text_units') and self.text_units is not None:
-            _dict['text_units'] = self.text_units
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AnalysisResultsUsage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AnalysisResultsUsage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AnalysisResultsUsage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Author():
+
+class Author(BaseModel):
     """
     The author of the analyzed content.
 
     :attr str name: (optional) Name of the author.
     """
 
+    __slots__ = ('name',)
+
+    _fields = (
+        ModelField('name'),
+    )
+
     def __init__(self, *, name: str = None) -> None:
         """
         Initialize a Author object.
@@ -1457,46 +1358,8 @@ class Author():
         """
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Author':
-        """Initialize a Author object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Author object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Author object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Author') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Author') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CategoriesModel():
+
+class CategoriesModel(BaseModel):
     """
     Categories model.
 
@@ -1521,6 +1384,28 @@ class CategoriesModel():
           deployment.
     """
 
+    __slots__ = ('name', 'user_metadata', 'language', 'description',
+                 'model_version', 'workspace_id', 'version_description',
+                 'features', 'status', 'model_id', 'created', 'notices',
+                 'last_trained', 'last_deployed')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('user_metadata'),
+        ModelField('language', required=True),
+        ModelField('description'),
+        ModelField('model_version'),
+        ModelField('workspace_id'),
+        ModelField('version_description'),
+        ModelField('features'),
+        ModelField('status', required=True),
+        ModelField('model_id', required=True),
+        ModelField('created', 'datetime', required=True),
+        ModelField('notices', 'list', 'Notice'),
+        ModelField('last_trained', 'datetime'),
+        ModelField('last_deployed', 'datetime'),
+    )
+
     def __init__(self,
                  language: str,
                  status: str,
@@ -1576,117 +1461,6 @@ class CategoriesModel():
         self.last_trained = last_trained
         self.last_deployed = last_deployed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesModel':
-        """Initialize a CategoriesModel object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'user_metadata' in _dict:
-            args['user_metadata'] = _dict.get('user_metadata')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in CategoriesModel JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        if 'version_description' in _dict:
-            args['version_description'] = _dict.get('version_description')
-        if 'features' in _dict:
-            args['features'] = _dict.get('features')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in CategoriesModel JSON'
-            )
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        else:
-            raise ValueError(
-                'Required property \'model_id\' not present in CategoriesModel JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        else:
-            raise ValueError(
-                'Required property \'created\' not present in CategoriesModel JSON'
-            )
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        if 'last_trained' in _dict:
-            args['last_trained'] = string_to_datetime(_dict.get('last_trained'))
-        if 'last_deployed' in _dict:
-            args['last_deployed'] = string_to_datetime(
-                _dict.get('last_deployed'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'user_metadata') and self.user_metadata is not None:
-            _dict['user_metadata'] = self.user_metadata
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'workspace_id') and self.workspace_id is not None:
-            _dict['workspace_id'] = self.workspace_id
-        if hasattr(
-                self,
-                'version_description') and self.version_description is not None:
-            _dict['version_description'] = self.version_description
-        if hasattr(self, 'features') and self.features is not None:
-            _dict['features'] = self.features
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        if hasattr(self, 'last_trained') and self.last_trained is not None:
-            _dict['last_trained'] = datetime_to_string(self.last_trained)
-        if hasattr(self, 'last_deployed') and self.last_deployed is not None:
-            _dict['last_deployed'] = datetime_to_string(self.last_deployed)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         When the status is `available`, the model is ready to use.
@@ -1699,13 +1473,19 @@ class CategoriesModel():
         DELETED = 'deleted'
 
 
-class CategoriesModelList():
+class CategoriesModelList(BaseModel):
     """
     List of categories models.
 
     :attr List[CategoriesModel] models: (optional) The categories models.
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'CategoriesModel'),
+    )
+
     def __init__(self, *, models: List['CategoriesModel'] = None) -> None:
         """
         Initialize a CategoriesModelList object.
@@ -1714,48 +1494,8 @@ class CategoriesModelList():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesModelList':
-        """Initialize a CategoriesModelList object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [
-                CategoriesModel.from_dict(x) for x in _dict.get('models')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesModelList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesModelList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesModelList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesModelList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CategoriesOptions():
+
+class CategoriesOptions(BaseModel):
     """
     Returns a hierarchical taxonomy of the content. The top three categories are returned
     by default.
@@ -1771,6 +1511,14 @@ class CategoriesOptions():
           English categories.**.
     """
 
+    __slots__ = ('explanation', 'limit', 'model')
+
+    _fields = (
+        ModelField('explanation'),
+        ModelField('limit'),
+        ModelField('model'),
+    )
+
     def __init__(self,
                  *,
                  explanation: bool = None,
@@ -1792,54 +1540,8 @@ class CategoriesOptions():
         self.limit = limit
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesOptions':
-        """Initialize a CategoriesOptions object from a json dictionary."""
-        args = {}
-        if 'explanation' in _dict:
-            args['explanation'] = _dict.get('explanation')
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'explanation') and self.explanation is not None:
-            _dict['explanation'] = self.explanation
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CategoriesRelevantText():
+
+class CategoriesRelevantText(BaseModel):
     """
     Relevant text that contributed to the categorization.
 
@@ -1847,6 +1549,12 @@ class CategoriesRelevantText():
           categorization.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a CategoriesRelevantText object.
@@ -1856,46 +1564,8 @@ class CategoriesRelevantText():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesRelevantText':
-        """Initialize a CategoriesRelevantText object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesRelevantText object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesRelevantText object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesRelevantText') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesRelevantText') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CategoriesResult():
+
+class CategoriesResult(BaseModel):
     """
     A categorization of the analyzed text.
 
@@ -1908,6 +1578,14 @@ class CategoriesResult():
           to explain what contributed to the categories result.
     """
 
+    __slots__ = ('label', 'score', 'explanation')
+
+    _fields = (
+        ModelField('label'),
+        ModelField('score'),
+        ModelField('explanation', 'model', 'CategoriesResultExplanation'),
+    )
+
     def __init__(self,
                  *,
                  label: str = None,
@@ -1929,55 +1607,8 @@ class CategoriesResult():
         self.score = score
         self.explanation = explanation
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesResult':
-        """Initialize a CategoriesResult object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        if 'explanation' in _dict:
-            args['explanation'] = CategoriesResultExplanation.from_dict(
-                _dict.get('explanation'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'explanation') and self.explanation is not None:
-            _dict['explanation'] = self.explanation.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CategoriesResultExplanation():
+
+class CategoriesResultExplanation(BaseModel):
     """
     Information that helps to explain what contributed to the categories result.
 
@@ -1987,6 +1618,12 @@ class CategoriesResultExplanation():
           followed by phrases that were less and less impactful.
     """
 
+    __slots__ = ('relevant_text',)
+
+    _fields = (
+        ModelField('relevant_text', 'list', 'CategoriesRelevantText'),
+    )
+
     def __init__(self,
                  *,
                  relevant_text: List['CategoriesRelevantText'] = None) -> None:
@@ -2000,49 +1637,8 @@ class CategoriesResultExplanation():
         """
         self.relevant_text = relevant_text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CategoriesResultExplanation':
-        """Initialize a CategoriesResultExplanation object from a json dictionary."""
-        args = {}
-        if 'relevant_text' in _dict:
-            args['relevant_text'] = [
-                CategoriesRelevantText.from_dict(x)
-                for x in _dict.get('relevant_text')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CategoriesResultExplanation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'relevant_text') and self.relevant_text is not None:
-            _dict['relevant_text'] = [x.to_dict() for x in self.relevant_text]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CategoriesResultExplanation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CategoriesResultExplanation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CategoriesResultExplanation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassificationsModel():
+
+class ClassificationsModel(BaseModel):
     """
     Classifications model.
 
@@ -2067,6 +1663,28 @@ class ClassificationsModel():
           deployment.
     """
 
+    __slots__ = ('name', 'user_metadata', 'language', 'description',
+                 'model_version', 'workspace_id', 'version_description',
+                 'features', 'status', 'model_id', 'created', 'notices',
+                 'last_trained', 'last_deployed')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('user_metadata'),
+        ModelField('language', required=True),
+        ModelField('description'),
+        ModelField('model_version'),
+        ModelField('workspace_id'),
+        ModelField('version_description'),
+        ModelField('features'),
+        ModelField('status', required=True),
+        ModelField('model_id', required=True),
+        ModelField('created', 'datetime', required=True),
+        ModelField('notices', 'list', 'Notice'),
+        ModelField('last_trained', 'datetime'),
+        ModelField('last_deployed', 'datetime'),
+    )
+
     def __init__(self,
                  language: str,
                  status: str,
@@ -2122,117 +1740,6 @@ class ClassificationsModel():
         self.last_trained = last_trained
         self.last_deployed = last_deployed
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassificationsModel':
-        """Initialize a ClassificationsModel object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'user_metadata' in _dict:
-            args['user_metadata'] = _dict.get('user_metadata')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in ClassificationsModel JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        if 'version_description' in _dict:
-            args['version_description'] = _dict.get('version_description')
-        if 'features' in _dict:
-            args['features'] = _dict.get('features')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in ClassificationsModel JSON'
-            )
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        else:
-            raise ValueError(
-                'Required property \'model_id\' not present in ClassificationsModel JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        else:
-            raise ValueError(
-                'Required property \'created\' not present in ClassificationsModel JSON'
-            )
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        if 'last_trained' in _dict:
-            args['last_trained'] = string_to_datetime(_dict.get('last_trained'))
-        if 'last_deployed' in _dict:
-            args['last_deployed'] = string_to_datetime(
-                _dict.get('last_deployed'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassificationsModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'user_metadata') and self.user_metadata is not None:
-            _dict['user_metadata'] = self.user_metadata
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'workspace_id') and self.workspace_id is not None:
-            _dict['workspace_id'] = self.workspace_id
-        if hasattr(
-                self,
-                'version_description') and self.version_description is not None:
-            _dict['version_description'] = self.version_description
-        if hasattr(self, 'features') and self.features is not None:
-            _dict['features'] = self.features
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        if hasattr(self, 'last_trained') and self.last_trained is not None:
-            _dict['last_trained'] = datetime_to_string(self.last_trained)
-        if hasattr(self, 'last_deployed') and self.last_deployed is not None:
-            _dict['last_deployed'] = datetime_to_string(self.last_deployed)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassificationsModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassificationsModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassificationsModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         When the status is `available`, the model is ready to use.
@@ -2245,13 +1752,19 @@ class ClassificationsModel():
         DELETED = 'deleted'
 
 
-class ClassificationsModelList():
+class ClassificationsModelList(BaseModel):
     """
     List of classifications models.
 
     :attr List[ClassificationsModel] models: (optional) The classifications models.
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'ClassificationsModel'),
+    )
+
     def __init__(self, *, models: List['ClassificationsModel'] = None) -> None:
         """
         Initialize a ClassificationsModelList object.
@@ -2261,48 +1774,8 @@ class ClassificationsModelList():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassificationsModelList':
-        """Initialize a ClassificationsModelList object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [
-                ClassificationsModel.from_dict(x) for x in _dict.get('models')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassificationsModelList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassificationsModelList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassificationsModelList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassificationsModelList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassificationsOptions():
+
+class ClassificationsOptions(BaseModel):
     """
     Returns text classifications for the content.
     Supported languages: English only.
@@ -2312,6 +1785,12 @@ class ClassificationsOptions():
           ID of the classification model to be used.
     """
 
+    __slots__ = ('model',)
+
+    _fields = (
+        ModelField('model'),
+    )
+
     def __init__(self, *, model: str = None) -> None:
         """
         Initialize a ClassificationsOptions object.
@@ -2322,46 +1801,8 @@ class ClassificationsOptions():
         """
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassificationsOptions':
-        """Initialize a ClassificationsOptions object from a json dictionary."""
-        args = {}
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassificationsOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassificationsOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassificationsOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassificationsOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassificationsResult():
+
+class ClassificationsResult(BaseModel):
     """
     A classification of the analyzed text.
 
@@ -2370,6 +1811,13 @@ class ClassificationsResult():
           Higher values indicate greater confidence.
     """
 
+    __slots__ = ('class_name', 'confidence')
+
+    _fields = (
+        ModelField('class_name'),
+        ModelField('confidence'),
+    )
+
     def __init__(self,
                  *,
                  class_name: str = None,
@@ -2384,50 +1832,8 @@ class ClassificationsResult():
         self.class_name = class_name
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassificationsResult':
-        """Initialize a ClassificationsResult object from a json dictionary."""
-        args = {}
-        if 'class_name' in _dict:
-            args['class_name'] = _dict.get('class_name')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassificationsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'class_name') and self.class_name is not None:
-            _dict['class_name'] = self.class_name
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassificationsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassificationsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassificationsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ConceptsOptions():
+
+class ConceptsOptions(BaseModel):
     """
     Returns high-level concepts in the content. For example, a research paper about deep
     learning might return the concept, "Artificial Intelligence" although the term is not
@@ -2438,6 +1844,12 @@ class ConceptsOptions():
     :attr int limit: (optional) Maximum number of concepts to return.
     """
 
+    __slots__ = ('limit',)
+
+    _fields = (
+        ModelField('limit'),
+    )
+
     def __init__(self, *, limit: int = None) -> None:
         """
         Initialize a ConceptsOptions object.
@@ -2446,46 +1858,8 @@ class ConceptsOptions():
         """
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ConceptsOptions':
-        """Initialize a ConceptsOptions object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ConceptsOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ConceptsOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ConceptsOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ConceptsOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ConceptsResult():
+
+class ConceptsResult(BaseModel):
     """
     The general concepts referenced or alluded to in the analyzed text.
 
@@ -2496,6 +1870,14 @@ class ConceptsResult():
           resource.
     """
 
+    __slots__ = ('text', 'relevance', 'dbpedia_resource')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('relevance'),
+        ModelField('dbpedia_resource'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -2514,61 +1896,20 @@ class ConceptsResult():
         self.relevance = relevance
         self.dbpedia_resource = dbpedia_resource
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ConceptsResult':
-        """Initialize a ConceptsResult object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'relevance' in _dict:
-            args['relevance'] = _dict.get('relevance')
-        if 'dbpedia_resource' in _dict:
-            args['dbpedia_resource'] = _dict.get('dbpedia_resource')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ConceptsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'relevance') and self.relevance is not None:
-            _dict['relevance'] = self.relevance
-        if hasattr(self,
-                   'dbpedia_resource') and self.dbpedia_resource is not None:
-            _dict['dbpedia_resource'] = self.dbpedia_resource
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ConceptsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ConceptsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ConceptsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DeleteModelResults():
+
+class DeleteModelResults(BaseModel):
     """
     Delete model results.
 
     :attr str deleted: (optional) model_id of the deleted model.
     """
 
+    __slots__ = ('deleted',)
+
+    _fields = (
+        ModelField('deleted'),
+    )
+
     def __init__(self, *, deleted: str = None) -> None:
         """
         Initialize a DeleteModelResults object.
@@ -2577,46 +1918,8 @@ class DeleteModelResults():
         """
         self.deleted = deleted
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DeleteModelResults':
-        """Initialize a DeleteModelResults object from a json dictionary."""
-        args = {}
-        if 'deleted' in _dict:
-            args['deleted'] = _dict.get('deleted')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DeleteModelResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'deleted') and self.deleted is not None:
-            _dict['deleted'] = self.deleted
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DeleteModelResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DeleteModelResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DeleteModelResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DisambiguationResult():
+
+class DisambiguationResult(BaseModel):
     """
     Disambiguation information for the entity.
 
@@ -2626,6 +1929,14 @@ class DisambiguationResult():
     :attr List[str] subtype: (optional) Entity subtype information.
     """
 
+    __slots__ = ('name', 'dbpedia_resource', 'subtype')
+
+    _fields = (
+        ModelField('name'),
+        ModelField('dbpedia_resource'),
+        ModelField('subtype'),
+    )
+
     def __init__(self,
                  *,
                  name: str = None,
@@ -2643,55 +1954,8 @@ class DisambiguationResult():
         self.dbpedia_resource = dbpedia_resource
         self.subtype = subtype
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DisambiguationResult':
-        """Initialize a DisambiguationResult object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'dbpedia_resource' in _dict:
-            args['dbpedia_resource'] = _dict.get('dbpedia_resource')
-        if 'subtype' in _dict:
-            args['subtype'] = _dict.get('subtype')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DisambiguationResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self,
-                   'dbpedia_resource') and self.dbpedia_resource is not None:
-            _dict['dbpedia_resource'] = self.dbpedia_resource
-        if hasattr(self, 'subtype') and self.subtype is not None:
-            _dict['subtype'] = self.subtype
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DisambiguationResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DisambiguationResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DisambiguationResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentEmotionResults():
+
+class DocumentEmotionResults(BaseModel):
     """
     Emotion results for the document as a whole.
 
@@ -2699,6 +1963,12 @@ class DocumentEmotionResults():
           whole.
     """
 
+    __slots__ = ('emotion',)
+
+    _fields = (
+        ModelField('emotion', 'model', 'EmotionScores'),
+    )
+
     def __init__(self, *, emotion: 'EmotionScores' = None) -> None:
         """
         Initialize a DocumentEmotionResults object.
@@ -2708,46 +1978,8 @@ class DocumentEmotionResults():
         """
         self.emotion = emotion
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentEmotionResults':
-        """Initialize a DocumentEmotionResults object from a json dictionary."""
-        args = {}
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionScores.from_dict(_dict.get('emotion'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentEmotionResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentEmotionResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentEmotionResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentEmotionResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DocumentSentimentResults():
+
+class DocumentSentimentResults(BaseModel):
     """
     DocumentSentimentResults.
 
@@ -2757,6 +1989,13 @@ class DocumentSentimentResults():
           (positive).
     """
 
+    __slots__ = ('label', 'score')
+
+    _fields = (
+        ModelField('label'),
+        ModelField('score'),
+    )
+
     def __init__(self, *, label: str = None, score: float = None) -> None:
         """
         Initialize a DocumentSentimentResults object.
@@ -2769,50 +2008,8 @@ class DocumentSentimentResults():
         self.label = label
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentSentimentResults':
-        """Initialize a DocumentSentimentResults object from a json dictionary."""
-        args = {}
-        if 'label' in _dict:
-            args['label'] = _dict.get('label')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentSentimentResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'label') and self.label is not None:
-            _dict['label'] = self.label
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentSentimentResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentSentimentResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentSentimentResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EmotionOptions():
+
+class EmotionOptions(BaseModel):
     """
     Detects anger, disgust, fear, joy, or sadness that is conveyed in the content or by
     the context around target phrases specified in the targets parameter. You can analyze
@@ -2826,6 +2023,13 @@ class EmotionOptions():
           target string that is found in the document.
     """
 
+    __slots__ = ('document', 'targets')
+
+    _fields = (
+        ModelField('document'),
+        ModelField('targets'),
+    )
+
     def __init__(self,
                  *,
                  document: bool = None,
@@ -2841,50 +2045,8 @@ class EmotionOptions():
         self.document = document
         self.targets = targets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EmotionOptions':
-        """Initialize a EmotionOptions object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = _dict.get('document')
-        if 'targets' in _dict:
-            args['targets'] = _dict.get('targets')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EmotionOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = self.targets
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EmotionOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EmotionOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EmotionOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EmotionResult():
+
+class EmotionResult(BaseModel):
     """
     The detected anger, disgust, fear, joy, or sadness that is conveyed by the content.
     Emotion information can be returned for detected entities, keywords, or user-specified
@@ -2896,6 +2058,13 @@ class EmotionResult():
           specified targets.
     """
 
+    __slots__ = ('document', 'targets')
+
+    _fields = (
+        ModelField('document', 'model', 'DocumentEmotionResults'),
+        ModelField('targets', 'list', 'TargetedEmotionResults'),
+    )
+
     def __init__(self,
                  *,
                  document: 'DocumentEmotionResults' = None,
@@ -2911,54 +2080,8 @@ class EmotionResult():
         self.document = document
         self.targets = targets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EmotionResult':
-        """Initialize a EmotionResult object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = DocumentEmotionResults.from_dict(
-                _dict.get('document'))
-        if 'targets' in _dict:
-            args['targets'] = [
-                TargetedEmotionResults.from_dict(x)
-                for x in _dict.get('targets')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EmotionResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = [x.to_dict() for x in self.targets]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EmotionResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EmotionResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EmotionResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EmotionScores():
+
+class EmotionScores(BaseModel):
     """
     EmotionScores.
 
@@ -2974,6 +2097,16 @@ class EmotionScores():
           that the text is more likely to convey sadness.
     """
 
+    __slots__ = ('anger', 'disgust', 'fear', 'joy', 'sadness')
+
+    _fields = (
+        ModelField('anger'),
+        ModelField('disgust'),
+        ModelField('fear'),
+        ModelField('joy'),
+        ModelField('sadness'),
+    )
+
     def __init__(self,
                  *,
                  anger: float = None,
@@ -3001,62 +2134,8 @@ class EmotionScores():
         self.joy = joy
         self.sadness = sadness
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EmotionScores':
-        """Initialize a EmotionScores object from a json dictionary."""
-        args = {}
-        if 'anger' in _dict:
-            args['anger'] = _dict.get('anger')
-        if 'disgust' in _dict:
-            args['disgust'] = _dict.get('disgust')
-        if 'fear' in _dict:
-            args['fear'] = _dict.get('fear')
-        if 'joy' in _dict:
-            args['joy'] = _dict.get('joy')
-        if 'sadness' in _dict:
-            args['sadness'] = _dict.get('sadness')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EmotionScores object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'anger') and self.anger is not None:
-            _dict['anger'] = self.anger
-        if hasattr(self, 'disgust') and self.disgust is not None:
-            _dict['disgust'] = self.disgust
-        if hasattr(self, 'fear') and self.fear is not None:
-            _dict['fear'] = self.fear
-        if hasattr(self, 'joy') and self.joy is not None:
-            _dict['joy'] = self.joy
-        if hasattr(self, 'sadness') and self.sadness is not None:
-            _dict['sadness'] = self.sadness
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EmotionScores object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EmotionScores') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EmotionScores') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EntitiesOptions():
+
+class EntitiesOptions(BaseModel):
     """
     Identifies people, cities, organizations, and other entities in the content. For more
     information, see [Entity types and
@@ -3077,6 +2156,16 @@ class EntitiesOptions():
           detected keywords.
     """
 
+    __slots__ = ('limit', 'mentions', 'model', 'sentiment', 'emotion')
+
+    _fields = (
+        ModelField('limit'),
+        ModelField('mentions'),
+        ModelField('model'),
+        ModelField('sentiment'),
+        ModelField('emotion'),
+    )
+
     def __init__(self,
                  *,
                  limit: int = None,
@@ -3104,62 +2193,8 @@ class EntitiesOptions():
         self.sentiment = sentiment
         self.emotion = emotion
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntitiesOptions':
-        """Initialize a EntitiesOptions object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        if 'mentions' in _dict:
-            args['mentions'] = _dict.get('mentions')
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        if 'sentiment' in _dict:
-            args['sentiment'] = _dict.get('sentiment')
-        if 'emotion' in _dict:
-            args['emotion'] = _dict.get('emotion')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntitiesOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        if hasattr(self, 'mentions') and self.mentions is not None:
-            _dict['mentions'] = self.mentions
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntitiesOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntitiesOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EntitiesOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EntitiesResult():
+
+class EntitiesResult(BaseModel):
     """
     The important people, places, geopolitical entities and other types of entities in
     your content.
@@ -3182,6 +2217,21 @@ class EntitiesResult():
           for the entity.
     """
 
+    __slots__ = ('type', 'text', 'relevance', 'confidence', 'mentions', 'count',
+                 'emotion', 'sentiment', 'disambiguation')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('text'),
+        ModelField('relevance'),
+        ModelField('confidence'),
+        ModelField('mentions', 'list', 'EntityMention'),
+        ModelField('count'),
+        ModelField('emotion', 'model', 'EmotionScores'),
+        ModelField('sentiment', 'model', 'FeatureSentimentResults'),
+        ModelField('disambiguation', 'model', 'DisambiguationResult'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -3225,82 +2275,8 @@ class EntitiesResult():
         self.sentiment = sentiment
         self.disambiguation = disambiguation
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntitiesResult':
-        """Initialize a EntitiesResult object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'relevance' in _dict:
-            args['relevance'] = _dict.get('relevance')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'mentions' in _dict:
-            args['mentions'] = [
-                EntityMention.from_dict(x) for x in _dict.get('mentions')
-            ]
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionScores.from_dict(_dict.get('emotion'))
-        if 'sentiment' in _dict:
-            args['sentiment'] = FeatureSentimentResults.from_dict(
-                _dict.get('sentiment'))
-        if 'disambiguation' in _dict:
-            args['disambiguation'] = DisambiguationResult.from_dict(
-                _dict.get('disambiguation'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntitiesResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'relevance') and self.relevance is not None:
-            _dict['relevance'] = self.relevance
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'mentions') and self.mentions is not None:
-            _dict['mentions'] = [x.to_dict() for x in self.mentions]
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment.to_dict()
-        if hasattr(self, 'disambiguation') and self.disambiguation is not None:
-            _dict['disambiguation'] = self.disambiguation.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntitiesResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntitiesResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EntitiesResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class EntityMention():
+
+class EntityMention(BaseModel):
     """
     EntityMention.
 
@@ -3313,6 +2289,14 @@ class EntityMention():
           custom models return the confidence score.
     """
 
+    __slots__ = ('text', 'location', 'confidence')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location'),
+        ModelField('confidence'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -3333,54 +2317,8 @@ class EntityMention():
         self.location = location
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'EntityMention':
-        """Initialize a EntityMention object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a EntityMention object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this EntityMention object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'EntityMention') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'EntityMention') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeatureSentimentResults():
+
+class FeatureSentimentResults(BaseModel):
     """
     FeatureSentimentResults.
 
@@ -3388,6 +2326,12 @@ class FeatureSentimentResults():
           (positive).
     """
 
+    __slots__ = ('score',)
+
+    _fields = (
+        ModelField('score'),
+    )
+
     def __init__(self, *, score: float = None) -> None:
         """
         Initialize a FeatureSentimentResults object.
@@ -3397,46 +2341,8 @@ class FeatureSentimentResults():
         """
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeatureSentimentResults':
-        """Initialize a FeatureSentimentResults object from a json dictionary."""
-        args = {}
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeatureSentimentResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeatureSentimentResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeatureSentimentResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeatureSentimentResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Features():
+
+class Features(BaseModel):
     """
     Analysis features and options.
 
@@ -3495,6 +2401,25 @@ class Features():
           input text.
     """
 
+    __slots__ = ('classifications', 'concepts', 'emotion', 'entities',
+                 'keywords', 'metadata', 'relations', 'semantic_roles',
+                 'sentiment', 'summarization', 'categories', 'syntax')
+
+    _fields = (
+        ModelField('classifications', 'model', 'ClassificationsOptions'),
+        ModelField('concepts', 'model', 'ConceptsOptions'),
+        ModelField('emotion', 'model', 'EmotionOptions'),
+        ModelField('entities', 'model', 'EntitiesOptions'),
+        ModelField('keywords', 'model', 'KeywordsOptions'),
+        ModelField('metadata', 'model', 'MetadataOptions'),
+        ModelField('relations', 'model', 'RelationsOptions'),
+        ModelField('semantic_roles', 'model', 'SemanticRolesOptions'),
+        ModelField('sentiment', 'model', 'SentimentOptions'),
+        ModelField('summarization', 'model', 'SummarizationOptions'),
+        ModelField('categories', 'model', 'CategoriesOptions'),
+        ModelField('syntax', 'model', 'SyntaxOptions'),
+    )
+
     def __init__(self,
                  *,
                  classifications: 'ClassificationsOptions' = None,
@@ -3580,97 +2505,8 @@ class Features():
         self.categories = categories
         self.syntax = syntax
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Features':
-        """Initialize a Features object from a json dictionary."""
-        args = {}
-        if 'classifications' in _dict:
-            args['classifications'] = ClassificationsOptions.from_dict(
-                _dict.get('classifications'))
-        if 'concepts' in _dict:
-            args['concepts'] = ConceptsOptions.from_dict(_dict.get('concepts'))
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionOptions.from_dict(_dict.get('emotion'))
-        if 'entities' in _dict:
-            args['entities'] = EntitiesOptions.from_dict(_dict.get('entities'))
-        if 'keywords' in _dict:
-            args['keywords'] = KeywordsOptions.from_dict(_dict.get('keywords'))
-        if 'metadata' in _dict:
-            args['metadata'] = MetadataOptions.from_dict(_dict.get('metadata'))
-        if 'relations' in _dict:
-            args['relations'] = RelationsOptions.from_dict(
-                _dict.get('relations'))
-        if 'semantic_roles' in _dict:
-            args['semantic_roles'] = SemanticRolesOptions.from_dict(
-                _dict.get('semantic_roles'))
-        if 'sentiment' in _dict:
-            args['sentiment'] = SentimentOptions.from_dict(
-                _dict.get('sentiment'))
-        if 'summarization' in _dict:
-            args['summarization'] = SummarizationOptions.from_dict(
-                _dict.get('summarization'))
-        if 'categories' in _dict:
-            args['categories'] = CategoriesOptions.from_dict(
-                _dict.get('categories'))
-        if 'syntax' in _dict:
-            args['syntax'] = SyntaxOptions.from_dict(_dict.get('syntax'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Features object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'classifications') and self.classifications is not None:
-            _dict['classifications'] = self.classifications.to_dict()
-        if hasattr(self, 'concepts') and self.concepts is not None:
-            _dict['concepts'] = self.concepts.to_dict()
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = self.entities.to_dict()
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = self.keywords.to_dict()
-        if hasattr(self, 'metadata') and self.metadata is not None:
-            _dict['metadata'] = self.metadata.to_dict()
-        if hasattr(self, 'relations') and self.relations is not None:
-            _dict['relations'] = self.relations.to_dict()
-        if hasattr(self, 'semantic_roles') and self.semantic_roles is not None:
-            _dict['semantic_roles'] = self.semantic_roles.to_dict()
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment.to_dict()
-        if hasattr(self, 'summarization') and self.summarization is not None:
-            _dict['summarization'] = self.summarization.to_dict()
-        if hasattr(self, 'categories') and self.categories is not None:
-            _dict['categories'] = self.categories.to_dict()
-        if hasattr(self, 'syntax') and self.syntax is not None:
-            _dict['syntax'] = self.syntax.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Features object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Features') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Features') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class FeaturesResultsMetadata():
+
+class FeaturesResultsMetadata(BaseModel):
     """
     Webpage metadata, such as the author and the title of the page.
 
@@ -3682,6 +2518,16 @@ class FeaturesResultsMetadata():
     :attr List[Feed] feeds: (optional) RSS/ATOM feeds found on the webpage.
     """
 
+    __slots__ = ('authors', 'publication_date', 'title', 'image', 'feeds')
+
+    _fields = (
+        ModelField('authors', 'list', 'Author'),
+        ModelField('publication_date'),
+        ModelField('title'),
+        ModelField('image'),
+        ModelField('feeds', 'list', 'Feed'),
+    )
+
     def __init__(self,
                  *,
                  authors: List['Author'] = None,
@@ -3705,71 +2551,20 @@ class FeaturesResultsMetadata():
         self.image = image
         self.feeds = feeds
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FeaturesResultsMetadata':
-        """Initialize a FeaturesResultsMetadata object from a json dictionary."""
-        args = {}
-        if 'authors' in _dict:
-            args['authors'] = [
-                Author.from_dict(x) for x in _dict.get('authors')
-            ]
-        if 'publication_date' in _dict:
-            args['publication_date'] = _dict.get('publication_date')
-        if 'title' in _dict:
-            args['title'] = _dict.get('title')
-        if 'image' in _dict:
-            args['image'] = _dict.get('image')
-        if 'feeds' in _dict:
-            args['feeds'] = [Feed.from_dict(x) for x in _dict.get('feeds')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FeaturesResultsMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'authors') and self.authors is not None:
-            _dict['authors'] = [x.to_dict() for x in self.authors]
-        if hasattr(self,
-                   'publication_date') and self.publication_date is not None:
-            _dict['publication_date'] = self.publication_date
-        if hasattr(self, 'title') and self.title is not None:
-            _dict['title'] = self.title
-        if hasattr(self, 'image') and self.image is not None:
-            _dict['image'] = self.image
-        if hasattr(self, 'feeds') and self.feeds is not None:
-            _dict['feeds'] = [x.to_dict() for x in self.feeds]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FeaturesResultsMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FeaturesResultsMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FeaturesResultsMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Feed():
+
+class Feed(BaseModel):
     """
     RSS or ATOM feed found on the webpage.
 
     :attr str link: (optional) URL of the RSS or ATOM feed.
     """
 
+    __slots__ = ('link',)
+
+    _fields = (
+        ModelField('link'),
+    )
+
     def __init__(self, *, link: str = None) -> None:
         """
         Initialize a Feed object.
@@ -3778,46 +2573,8 @@ class Feed():
         """
         self.link = link
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Feed':
-        """Initialize a Feed object from a json dictionary."""
-        args = {}
-        if 'link' in _dict:
-            args['link'] = _dict.get('link')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Feed object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'link') and self.link is not None:
-            _dict['link'] = self.link
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Feed object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Feed') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Feed') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class KeywordsOptions():
+
+class KeywordsOptions(BaseModel):
     """
     Returns important keywords in the content.
     Supported languages: English, French, German, Italian, Japanese, Korean, Portuguese,
@@ -3830,6 +2587,14 @@ class KeywordsOptions():
           detected keywords.
     """
 
+    __slots__ = ('limit', 'sentiment', 'emotion')
+
+    _fields = (
+        ModelField('limit'),
+        ModelField('sentiment'),
+        ModelField('emotion'),
+    )
+
     def __init__(self,
                  *,
                  limit: int = None,
@@ -3848,54 +2613,8 @@ class KeywordsOptions():
         self.sentiment = sentiment
         self.emotion = emotion
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'KeywordsOptions':
-        """Initialize a KeywordsOptions object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        if 'sentiment' in _dict:
-            args['sentiment'] = _dict.get('sentiment')
-        if 'emotion' in _dict:
-            args['emotion'] = _dict.get('emotion')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a KeywordsOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this KeywordsOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'KeywordsOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'KeywordsOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class KeywordsResult():
+
+class KeywordsResult(BaseModel):
     """
     The important keywords in the content, organized by relevance.
 
@@ -3910,6 +2629,16 @@ class KeywordsResult():
           for the keyword, enabled with the `sentiment` option.
     """
 
+    __slots__ = ('count', 'relevance', 'text', 'emotion', 'sentiment')
+
+    _fields = (
+        ModelField('count'),
+        ModelField('relevance'),
+        ModelField('text'),
+        ModelField('emotion', 'model', 'EmotionScores'),
+        ModelField('sentiment', 'model', 'FeatureSentimentResults'),
+    )
+
     def __init__(self,
                  *,
                  count: int = None,
@@ -3936,69 +2665,20 @@ class KeywordsResult():
         self.emotion = emotion
         self.sentiment = sentiment
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'KeywordsResult':
-        """Initialize a KeywordsResult object from a json dictionary."""
-        args = {}
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        if 'relevance' in _dict:
-            args['relevance'] = _dict.get('relevance')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionScores.from_dict(_dict.get('emotion'))
-        if 'sentiment' in _dict:
-            args['sentiment'] = FeatureSentimentResults.from_dict(
-                _dict.get('sentiment'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a KeywordsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'relevance') and self.relevance is not None:
-            _dict['relevance'] = self.relevance
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        if hasattr(self, 'sentiment') and self.sentiment is not None:
-            _dict['sentiment'] = self.sentiment.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this KeywordsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'KeywordsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'KeywordsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListModelsResults():
+
+class ListModelsResults(BaseModel):
     """
     Custom models that are available for entities and relations.
 
     :attr List[Model] models: (optional) An array of available models.
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'Model'),
+    )
+
     def __init__(self, *, models: List['Model'] = None) -> None:
         """
         Initialize a ListModelsResults object.
@@ -4007,52 +2687,20 @@ class ListModelsResults():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListModelsResults':
-        """Initialize a ListModelsResults object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [Model.from_dict(x) for x in _dict.get('models')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListModelsResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListModelsResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListModelsResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListModelsResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ListSentimentModelsResponse():
+
+class ListSentimentModelsResponse(BaseModel):
     """
     ListSentimentModelsResponse.
 
     :attr List[SentimentModel] models: (optional)
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'SentimentModel'),
+    )
+
     def __init__(self, *, models: List['SentimentModel'] = None) -> None:
         """
         Initialize a ListSentimentModelsResponse object.
@@ -4061,94 +2709,26 @@ class ListSentimentModelsResponse():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ListSentimentModelsResponse':
-        """Initialize a ListSentimentModelsResponse object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [
-                SentimentModel.from_dict(x) for x in _dict.get('models')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ListSentimentModelsResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ListSentimentModelsResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ListSentimentModelsResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ListSentimentModelsResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class MetadataOptions():
+
+class MetadataOptions(BaseModel):
     """
     Returns information from the document, including author name, title, RSS/ATOM feeds,
     prominent page image, and publication date. Supports URL and HTML input types only.
 
     """
 
+    __slots__ = ()
+
+    _fields = ()
+
     def __init__(self) -> None:
         """
         Initialize a MetadataOptions object.
 
         """
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'MetadataOptions':
-        """Initialize a MetadataOptions object from a json dictionary."""
-        return cls(**_dict)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a MetadataOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        return vars(self)
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
 
-    def __str__(self) -> str:
-        """Return a `str` version of this MetadataOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'MetadataOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'MetadataOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Model():
+class Model(BaseModel):
     """
     Model.
 
@@ -4169,6 +2749,22 @@ class Model():
           created.
     """
 
+    __slots__ = ('status', 'model_id', 'language', 'description',
+                 'workspace_id', 'model_version', 'version',
+                 'version_description', 'created')
+
+    _fields = (
+        ModelField('status'),
+        ModelField('model_id'),
+        ModelField('language'),
+        ModelField('description'),
+        ModelField('workspace_id'),
+        ModelField('model_version'),
+        ModelField('version'),
+        ModelField('version_description'),
+        ModelField('created', 'datetime'),
+    )
+
     def __init__(self,
                  *,
                  status: str = None,
@@ -4209,78 +2805,6 @@ class Model():
         self.version_description = version_description
         self.created = created
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Model':
-        """Initialize a Model object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'version' in _dict:
-            args['version'] = _dict.get('version')
-        if 'version_description' in _dict:
-            args['version_description'] = _dict.get('version_description')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Model object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'workspace_id') and self.workspace_id is not None:
-            _dict['workspace_id'] = self.workspace_id
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'version') and self.version is not None:
-            _dict['version'] = self.version
-        if hasattr(
-                self,
-                'version_description') and self.version_description is not None:
-            _dict['version_description'] = self.version_description
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Model object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Model') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Model') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         When the status is `available`, the model is ready to use.
@@ -4293,7 +2817,7 @@ class Model():
         DELETED = 'deleted'
 
 
-class Notice():
+class Notice(BaseModel):
     """
     A list of messages describing model training issues when model status is `error`.
 
@@ -4301,6 +2825,12 @@ class Notice():
           training data.
     """
 
+    __slots__ = ('message',)
+
+    _fields = (
+        ModelField('message'),
+    )
+
     def __init__(self, *, message: str = None) -> None:
         """
         Initialize a Notice object.
@@ -4308,46 +2838,8 @@ class Notice():
         """
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Notice':
-        """Initialize a Notice object from a json dictionary."""
-        args = {}
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Notice object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'message') and getattr(self, 'message') is not None:
-            _dict['message'] = getattr(self, 'message')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Notice object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Notice') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RelationArgument():
+
+class RelationArgument(BaseModel):
     """
     RelationArgument.
 
@@ -4357,6 +2849,14 @@ class RelationArgument():
     :attr str text: (optional) Text that corresponds to the argument.
     """
 
+    __slots__ = ('entities', 'location', 'text')
+
+    _fields = (
+        ModelField('entities', 'list', 'RelationEntity'),
+        ModelField('location'),
+        ModelField('text'),
+    )
+
     def __init__(self,
                  *,
                  entities: List['RelationEntity'] = None,
@@ -4375,56 +2875,8 @@ class RelationArgument():
         self.location = location
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RelationArgument':
-        """Initialize a RelationArgument object from a json dictionary."""
-        args = {}
-        if 'entities' in _dict:
-            args['entities'] = [
-                RelationEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RelationArgument object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RelationArgument object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RelationArgument') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RelationArgument') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RelationEntity():
+
+class RelationEntity(BaseModel):
     """
     An entity that corresponds with an argument in a relation.
 
@@ -4432,6 +2884,13 @@ class RelationEntity():
     :attr str type: (optional) Entity type.
     """
 
+    __slots__ = ('text', 'type')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('type'),
+    )
+
     def __init__(self, *, text: str = None, type: str = None) -> None:
         """
         Initialize a RelationEntity object.
@@ -4442,50 +2901,8 @@ class RelationEntity():
         self.text = text
         self.type = type
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RelationEntity':
-        """Initialize a RelationEntity object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RelationEntity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RelationEntity object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RelationEntity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RelationEntity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RelationsOptions():
+
+class RelationsOptions(BaseModel):
     """
     Recognizes when two entities are related and identifies the type of relation. For
     example, an `awardedTo` relation might connect the entities "Nobel Prize" and "Albert
@@ -4499,6 +2916,12 @@ class RelationsOptions():
           ID to override the default model.
     """
 
+    __slots__ = ('model',)
+
+    _fields = (
+        ModelField('model'),
+    )
+
     def __init__(self, *, model: str = None) -> None:
         """
         Initialize a RelationsOptions object.
@@ -4509,46 +2932,8 @@ class RelationsOptions():
         """
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RelationsOptions':
-        """Initialize a RelationsOptions object from a json dictionary."""
-        args = {}
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RelationsOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RelationsOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RelationsOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RelationsOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RelationsResult():
+
+class RelationsResult(BaseModel):
     """
     The relations between entities found in the content.
 
@@ -4560,6 +2945,15 @@ class RelationsResult():
           involved in the relation.
     """
 
+    __slots__ = ('score', 'sentence', 'type', 'arguments')
+
+    _fields = (
+        ModelField('score'),
+        ModelField('sentence'),
+        ModelField('type'),
+        ModelField('arguments', 'list', 'RelationArgument'),
+    )
+
     def __init__(self,
                  *,
                  score: float = None,
@@ -4581,60 +2975,8 @@ class RelationsResult():
         self.type = type
         self.arguments = arguments
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RelationsResult':
-        """Initialize a RelationsResult object from a json dictionary."""
-        args = {}
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        if 'sentence' in _dict:
-            args['sentence'] = _dict.get('sentence')
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'arguments' in _dict:
-            args['arguments'] = [
-                RelationArgument.from_dict(x) for x in _dict.get('arguments')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RelationsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'sentence') and self.sentence is not None:
-            _dict['sentence'] = self.sentence
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'arguments') and self.arguments is not None:
-            _dict['arguments'] = [x.to_dict() for x in self.arguments]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RelationsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RelationsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RelationsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesEntity():
+
+class SemanticRolesEntity(BaseModel):
     """
     SemanticRolesEntity.
 
@@ -4642,6 +2984,13 @@ class SemanticRolesEntity():
     :attr str text: (optional) The entity text.
     """
 
+    __slots__ = ('type', 'text')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('text'),
+    )
+
     def __init__(self, *, type: str = None, text: str = None) -> None:
         """
         Initialize a SemanticRolesEntity object.
@@ -4652,56 +3001,20 @@ class SemanticRolesEntity():
         self.type = type
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesEntity':
-        """Initialize a SemanticRolesEntity object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesEntity object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesEntity object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesEntity') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesEntity') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesKeyword():
+
+class SemanticRolesKeyword(BaseModel):
     """
     SemanticRolesKeyword.
 
     :attr str text: (optional) The keyword text.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text'),
+    )
+
     def __init__(self, *, text: str = None) -> None:
         """
         Initialize a SemanticRolesKeyword object.
@@ -4710,46 +3023,8 @@ class SemanticRolesKeyword():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesKeyword':
-        """Initialize a SemanticRolesKeyword object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesKeyword object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesKeyword object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesKeyword') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesKeyword') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesOptions():
+
+class SemanticRolesOptions(BaseModel):
     """
     Parses sentences into subject, action, and object form.
     Supported languages: English, German, Japanese, Korean, Spanish.
@@ -4761,6 +3036,14 @@ class SemanticRolesOptions():
           for subjects and objects.
     """
 
+    __slots__ = ('limit', 'keywords', 'entities')
+
+    _fields = (
+        ModelField('limit'),
+        ModelField('keywords'),
+        ModelField('entities'),
+    )
+
     def __init__(self,
                  *,
                  limit: int = None,
@@ -4780,54 +3063,8 @@ class SemanticRolesOptions():
         self.keywords = keywords
         self.entities = entities
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesOptions':
-        """Initialize a SemanticRolesOptions object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        if 'keywords' in _dict:
-            args['keywords'] = _dict.get('keywords')
-        if 'entities' in _dict:
-            args['entities'] = _dict.get('entities')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = self.keywords
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = self.entities
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesResult():
+
+class SemanticRolesResult(BaseModel):
     """
     The object containing the actions and the objects the actions act upon.
 
@@ -4841,6 +3078,15 @@ class SemanticRolesResult():
           sentence.
     """
 
+    __slots__ = ('sentence', 'subject', 'action', 'object')
+
+    _fields = (
+        ModelField('sentence'),
+        ModelField('subject', 'model', 'SemanticRolesResultSubject'),
+        ModelField('action', 'model', 'SemanticRolesResultAction'),
+        ModelField('object', 'model', 'SemanticRolesResultObject'),
+    )
+
     def __init__(self,
                  *,
                  sentence: str = None,
@@ -4864,61 +3110,8 @@ class SemanticRolesResult():
         self.action = action
         self.object = object
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesResult':
-        """Initialize a SemanticRolesResult object from a json dictionary."""
-        args = {}
-        if 'sentence' in _dict:
-            args['sentence'] = _dict.get('sentence')
-        if 'subject' in _dict:
-            args['subject'] = SemanticRolesResultSubject.from_dict(
-                _dict.get('subject'))
-        if 'action' in _dict:
-            args['action'] = SemanticRolesResultAction.from_dict(
-                _dict.get('action'))
-        if 'object' in _dict:
-            args['object'] = SemanticRolesResultObject.from_dict(
-                _dict.get('object'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'sentence') and self.sentence is not None:
-            _dict['sentence'] = self.sentence
-        if hasattr(self, 'subject') and self.subject is not None:
-            _dict['subject'] = self.subject.to_dict()
-        if hasattr(self, 'action') and self.action is not None:
-            _dict['action'] = self.action.to_dict()
-        if hasattr(self, 'object') and self.object is not None:
-            _dict['object'] = self.object.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesResultAction():
+
+class SemanticRolesResultAction(BaseModel):
     """
     The extracted action from the sentence.
 
@@ -4927,6 +3120,14 @@ class SemanticRolesResultAction():
     :attr SemanticRolesVerb verb: (optional)
     """
 
+    __slots__ = ('text', 'normalized', 'verb')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('normalized'),
+        ModelField('verb', 'model', 'SemanticRolesVerb'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -4943,54 +3144,8 @@ class SemanticRolesResultAction():
         self.normalized = normalized
         self.verb = verb
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesResultAction':
-        """Initialize a SemanticRolesResultAction object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'normalized' in _dict:
-            args['normalized'] = _dict.get('normalized')
-        if 'verb' in _dict:
-            args['verb'] = SemanticRolesVerb.from_dict(_dict.get('verb'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesResultAction object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'normalized') and self.normalized is not None:
-            _dict['normalized'] = self.normalized
-        if hasattr(self, 'verb') and self.verb is not None:
-            _dict['verb'] = self.verb.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesResultAction object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesResultAction') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesResultAction') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesResultObject():
+
+class SemanticRolesResultObject(BaseModel):
     """
     The extracted object from the sentence.
 
@@ -4999,6 +3154,13 @@ class SemanticRolesResultObject():
           keywords.
     """
 
+    __slots__ = ('text', 'keywords')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('keywords', 'list', 'SemanticRolesKeyword'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -5013,52 +3175,8 @@ class SemanticRolesResultObject():
         self.text = text
         self.keywords = keywords
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesResultObject':
-        """Initialize a SemanticRolesResultObject object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'keywords' in _dict:
-            args['keywords'] = [
-                SemanticRolesKeyword.from_dict(x) for x in _dict.get('keywords')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesResultObject object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = [x.to_dict() for x in self.keywords]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesResultObject object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesResultObject') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesResultObject') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesResultSubject():
+
+class SemanticRolesResultSubject(BaseModel):
     """
     The extracted subject from the sentence.
 
@@ -5069,6 +3187,14 @@ class SemanticRolesResultSubject():
           keywords.
     """
 
+    __slots__ = ('text', 'entities', 'keywords')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('entities', 'list', 'SemanticRolesEntity'),
+        ModelField('keywords', 'list', 'SemanticRolesKeyword'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -5087,58 +3213,8 @@ class SemanticRolesResultSubject():
         self.entities = entities
         self.keywords = keywords
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesResultSubject':
-        """Initialize a SemanticRolesResultSubject object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'entities' in _dict:
-            args['entities'] = [
-                SemanticRolesEntity.from_dict(x) for x in _dict.get('entities')
-            ]
-        if 'keywords' in _dict:
-            args['keywords'] = [
-                SemanticRolesKeyword.from_dict(x) for x in _dict.get('keywords')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesResultSubject object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'entities') and self.entities is not None:
-            _dict['entities'] = [x.to_dict() for x in self.entities]
-        if hasattr(self, 'keywords') and self.keywords is not None:
-            _dict['keywords'] = [x.to_dict() for x in self.keywords]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesResultSubject object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesResultSubject') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesResultSubject') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SemanticRolesVerb():
+
+class SemanticRolesVerb(BaseModel):
     """
     SemanticRolesVerb.
 
@@ -5146,6 +3222,13 @@ class SemanticRolesVerb():
     :attr str tense: (optional) Verb tense.
     """
 
+    __slots__ = ('text', 'tense')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('tense'),
+    )
+
     def __init__(self, *, text: str = None, tense: str = None) -> None:
         """
         Initialize a SemanticRolesVerb object.
@@ -5156,50 +3239,8 @@ class SemanticRolesVerb():
         self.text = text
         self.tense = tense
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SemanticRolesVerb':
-        """Initialize a SemanticRolesVerb object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'tense' in _dict:
-            args['tense'] = _dict.get('tense')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SemanticRolesVerb object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'tense') and self.tense is not None:
-            _dict['tense'] = self.tense
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SemanticRolesVerb object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SemanticRolesVerb') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SemanticRolesVerb') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SentenceResult():
+
+class SentenceResult(BaseModel):
     """
     SentenceResult.
 
@@ -5208,6 +3249,13 @@ class SentenceResult():
           and end of the sentence in the analyzed text.
     """
 
+    __slots__ = ('text', 'location')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('location'),
+    )
+
     def __init__(self, *, text: str = None, location: List[int] = None) -> None:
         """
         Initialize a SentenceResult object.
@@ -5219,50 +3267,8 @@ class SentenceResult():
         self.text = text
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SentenceResult':
-        """Initialize a SentenceResult object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SentenceResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SentenceResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SentenceResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SentenceResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SentimentModel():
+
+class SentimentModel(BaseModel):
     """
     SentimentModel.
 
@@ -5289,6 +3295,28 @@ class SentimentModel():
     :attr str version_description: (optional) The description of the version.
     """
 
+    __slots__ = ('features', 'status', 'model_id', 'created', 'last_trained',
+                 'last_deployed', 'name', 'user_metadata', 'language',
+                 'description', 'model_version', 'notices', 'workspace_id',
+                 'version_description')
+
+    _fields = (
+        ModelField('features'),
+        ModelField('status'),
+        ModelField('model_id'),
+        ModelField('created', 'datetime'),
+        ModelField('last_trained', 'datetime'),
+        ModelField('last_deployed', 'datetime'),
+        ModelField('name'),
+        ModelField('user_metadata'),
+        ModelField('language'),
+        ModelField('description'),
+        ModelField('model_version'),
+        ModelField('notices', 'list', 'Notice'),
+        ModelField('workspace_id'),
+        ModelField('version_description'),
+    )
+
     def __init__(self,
                  *,
                  features: List[str] = None,
@@ -5345,101 +3373,6 @@ class SentimentModel():
         self.workspace_id = workspace_id
         self.version_description = version_description
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SentimentModel':
-        """Initialize a SentimentModel object from a json dictionary."""
-        args = {}
-        if 'features' in _dict:
-            args['features'] = _dict.get('features')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'model_id' in _dict:
-            args['model_id'] = _dict.get('model_id')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'last_trained' in _dict:
-            args['last_trained'] = string_to_datetime(_dict.get('last_trained'))
-        if 'last_deployed' in _dict:
-            args['last_deployed'] = string_to_datetime(
-                _dict.get('last_deployed'))
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'user_metadata' in _dict:
-            args['user_metadata'] = _dict.get('user_metadata')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'model_version' in _dict:
-            args['model_version'] = _dict.get('model_version')
-        if 'notices' in _dict:
-            args['notices'] = [
-                Notice.from_dict(x) for x in _dict.get('notices')
-            ]
-        if 'workspace_id' in _dict:
-            args['workspace_id'] = _dict.get('workspace_id')
-        if 'version_description' in _dict:
-            args['version_description'] = _dict.get('version_description')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SentimentModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'features') and self.features is not None:
-            _dict['features'] = self.features
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'model_id') and self.model_id is not None:
-            _dict['model_id'] = self.model_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'last_trained') and self.last_trained is not None:
-            _dict['last_trained'] = datetime_to_string(self.last_trained)
-        if hasattr(self, 'last_deployed') and self.last_deployed is not None:
-            _dict['last_deployed'] = datetime_to_string(self.last_deployed)
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'user_metadata') and self.user_metadata is not None:
-            _dict['user_metadata'] = self.user_metadata
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'model_version') and self.model_version is not None:
-            _dict['model_version'] = self.model_version
-        if hasattr(self, 'notices') and self.notices is not None:
-            _dict['notices'] = [x.to_dict() for x in self.notices]
-        if hasattr(self, 'workspace_id') and self.workspace_id is not None:
-            _dict['workspace_id'] = self.workspace_id
-        if hasattr(
-                self,
-                'version_description') and self.version_description is not None:
-            _dict['version_description'] = self.version_description
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SentimentModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SentimentModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SentimentModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         When the status is `available`, the model is ready to use.
@@ -5452,7 +3385,7 @@ class SentimentModel():
         DELETED = 'deleted'
 
 
-class SentimentOptions():
+class SentimentOptions(BaseModel):
     """
     Analyzes the general sentiment of your content or the sentiment toward specific target
     phrases. You can analyze sentiment for detected entities with `entities.sentiment` and
@@ -5471,6 +3404,14 @@ class SentimentOptions():
           keywords.
     """
 
+    __slots__ = ('document', 'targets', 'model')
+
+    _fields = (
+        ModelField('document'),
+        ModelField('targets'),
+        ModelField('model'),
+    )
+
     def __init__(self,
                  *,
                  document: bool = None,
@@ -5493,54 +3434,8 @@ class SentimentOptions():
         self.targets = targets
         self.model = model
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SentimentOptions':
-        """Initialize a SentimentOptions object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = _dict.get('document')
-        if 'targets' in _dict:
-            args['targets'] = _dict.get('targets')
-        if 'model' in _dict:
-            args['model'] = _dict.get('model')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SentimentOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = self.targets
-        if hasattr(self, 'model') and self.model is not None:
-            _dict['model'] = self.model
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SentimentOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SentimentOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SentimentOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SentimentResult():
+
+class SentimentResult(BaseModel):
     """
     The sentiment of the content.
 
@@ -5550,6 +3445,13 @@ class SentimentResult():
           to analyze.
     """
 
+    __slots__ = ('document', 'targets')
+
+    _fields = (
+        ModelField('document', 'model', 'DocumentSentimentResults'),
+        ModelField('targets', 'list', 'TargetedSentimentResults'),
+    )
+
     def __init__(self,
                  *,
                  document: 'DocumentSentimentResults' = None,
@@ -5565,54 +3467,8 @@ class SentimentResult():
         self.document = document
         self.targets = targets
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SentimentResult':
-        """Initialize a SentimentResult object from a json dictionary."""
-        args = {}
-        if 'document' in _dict:
-            args['document'] = DocumentSentimentResults.from_dict(
-                _dict.get('document'))
-        if 'targets' in _dict:
-            args['targets'] = [
-                TargetedSentimentResults.from_dict(x)
-                for x in _dict.get('targets')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SentimentResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document') and self.document is not None:
-            _dict['document'] = self.document.to_dict()
-        if hasattr(self, 'targets') and self.targets is not None:
-            _dict['targets'] = [x.to_dict() for x in self.targets]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SentimentResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SentimentResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SentimentResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SummarizationOptions():
+
+class SummarizationOptions(BaseModel):
     """
     (Experimental) Returns a summary of content.
     Supported languages: English only.
@@ -5620,6 +3476,12 @@ class SummarizationOptions():
     :attr int limit: (optional) Maximum number of summary sentences to return.
     """
 
+    __slots__ = ('limit',)
+
+    _fields = (
+        ModelField('limit'),
+    )
+
     def __init__(self, *, limit: int = None) -> None:
         """
         Initialize a SummarizationOptions object.
@@ -5628,46 +3490,8 @@ class SummarizationOptions():
         """
         self.limit = limit
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SummarizationOptions':
-        """Initialize a SummarizationOptions object from a json dictionary."""
-        args = {}
-        if 'limit' in _dict:
-            args['limit'] = _dict.get('limit')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SummarizationOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'limit') and self.limit is not None:
-            _dict['limit'] = self.limit
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SummarizationOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SummarizationOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SummarizationOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SyntaxOptions():
+
+class SyntaxOptions(BaseModel):
     """
     Returns tokens and sentences from the input text.
 
@@ -5676,6 +3500,13 @@ class SyntaxOptions():
           information.
     """
 
+    __slots__ = ('tokens', 'sentences')
+
+    _fields = (
+        ModelField('tokens', 'model', 'SyntaxOptionsTokens'),
+        ModelField('sentences'),
+    )
+
     def __init__(self,
                  *,
                  tokens: 'SyntaxOptionsTokens' = None,
@@ -5690,50 +3521,8 @@ class SyntaxOptions():
         self.tokens = tokens
         self.sentences = sentences
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SyntaxOptions':
-        """Initialize a SyntaxOptions object from a json dictionary."""
-        args = {}
-        if 'tokens' in _dict:
-            args['tokens'] = SyntaxOptionsTokens.from_dict(_dict.get('tokens'))
-        if 'sentences' in _dict:
-            args['sentences'] = _dict.get('sentences')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SyntaxOptions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'tokens') and self.tokens is not None:
-            _dict['tokens'] = self.tokens.to_dict()
-        if hasattr(self, 'sentences') and self.sentences is not None:
-            _dict['sentences'] = self.sentences
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SyntaxOptions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SyntaxOptions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SyntaxOptions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SyntaxOptionsTokens():
+
+class SyntaxOptionsTokens(BaseModel):
     """
     Tokenization options.
 
@@ -5743,6 +3532,13 @@ class SyntaxOptionsTokens():
           speech for each token.
     """
 
+    __slots__ = ('lemma', 'part_of_speech')
+
+    _fields = (
+        ModelField('lemma'),
+        ModelField('part_of_speech'),
+    )
+
     def __init__(self,
                  *,
                  lemma: bool = None,
@@ -5758,50 +3554,8 @@ class SyntaxOptionsTokens():
         self.lemma = lemma
         self.part_of_speech = part_of_speech
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SyntaxOptionsTokens':
-        """Initialize a SyntaxOptionsTokens object from a json dictionary."""
-        args = {}
-        if 'lemma' in _dict:
-            args['lemma'] = _dict.get('lemma')
-        if 'part_of_speech' in _dict:
-            args['part_of_speech'] = _dict.get('part_of_speech')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SyntaxOptionsTokens object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'lemma') and self.lemma is not None:
-            _dict['lemma'] = self.lemma
-        if hasattr(self, 'part_of_speech') and self.part_of_speech is not None:
-            _dict['part_of_speech'] = self.part_of_speech
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SyntaxOptionsTokens object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SyntaxOptionsTokens') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SyntaxOptionsTokens') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SyntaxResult():
+
+class SyntaxResult(BaseModel):
     """
     Tokens and sentences returned from syntax analysis.
 
@@ -5809,6 +3563,13 @@ class SyntaxResult():
     :attr List[SentenceResult] sentences: (optional)
     """
 
+    __slots__ = ('tokens', 'sentences')
+
+    _fields = (
+        ModelField('tokens', 'list', 'TokenResult'),
+        ModelField('sentences', 'list', 'SentenceResult'),
+    )
+
     def __init__(self,
                  *,
                  tokens: List['TokenResult'] = None,
@@ -5822,54 +3583,8 @@ class SyntaxResult():
         self.tokens = tokens
         self.sentences = sentences
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SyntaxResult':
-        """Initialize a SyntaxResult object from a json dictionary."""
-        args = {}
-        if 'tokens' in _dict:
-            args['tokens'] = [
-                TokenResult.from_dict(x) for x in _dict.get('tokens')
-            ]
-        if 'sentences' in _dict:
-            args['sentences'] = [
-                SentenceResult.from_dict(x) for x in _dict.get('sentences')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SyntaxResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'tokens') and self.tokens is not None:
-            _dict['tokens'] = [x.to_dict() for x in self.tokens]
-        if hasattr(self, 'sentences') and self.sentences is not None:
-            _dict['sentences'] = [x.to_dict() for x in self.sentences]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SyntaxResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SyntaxResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SyntaxResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TargetedEmotionResults():
+
+class TargetedEmotionResults(BaseModel):
     """
     Emotion results for a specified target.
 
@@ -5877,6 +3592,13 @@ class TargetedEmotionResults():
     :attr EmotionScores emotion: (optional) The emotion results for the target.
     """
 
+    __slots__ = ('text', 'emotion')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('emotion', 'model', 'EmotionScores'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -5891,50 +3613,8 @@ class TargetedEmotionResults():
         self.text = text
         self.emotion = emotion
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TargetedEmotionResults':
-        """Initialize a TargetedEmotionResults object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'emotion' in _dict:
-            args['emotion'] = EmotionScores.from_dict(_dict.get('emotion'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TargetedEmotionResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'emotion') and self.emotion is not None:
-            _dict['emotion'] = self.emotion.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TargetedEmotionResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TargetedEmotionResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TargetedEmotionResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TargetedSentimentResults():
+
+class TargetedSentimentResults(BaseModel):
     """
     TargetedSentimentResults.
 
@@ -5943,6 +3623,13 @@ class TargetedSentimentResults():
           (positive).
     """
 
+    __slots__ = ('text', 'score')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('score'),
+    )
+
     def __init__(self, *, text: str = None, score: float = None) -> None:
         """
         Initialize a TargetedSentimentResults object.
@@ -5954,50 +3641,8 @@ class TargetedSentimentResults():
         self.text = text
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TargetedSentimentResults':
-        """Initialize a TargetedSentimentResults object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TargetedSentimentResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TargetedSentimentResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TargetedSentimentResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TargetedSentimentResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TokenResult():
+
+class TokenResult(BaseModel):
     """
     TokenResult.
 
@@ -6011,6 +3656,15 @@ class TokenResult():
           [lemma](https://wikipedia.org/wiki/Lemma_%28morphology%29) of the token.
     """
 
+    __slots__ = ('text', 'part_of_speech', 'location', 'lemma')
+
+    _fields = (
+        ModelField('text'),
+        ModelField('part_of_speech'),
+        ModelField('location'),
+        ModelField('lemma'),
+    )
+
     def __init__(self,
                  *,
                  text: str = None,
@@ -6034,56 +3688,6 @@ class TokenResult():
         self.location = location
         self.lemma = lemma
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TokenResult':
-        """Initialize a TokenResult object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        if 'part_of_speech' in _dict:
-            args['part_of_speech'] = _dict.get('part_of_speech')
-        if 'location' in _dict:
-            args['location'] = _dict.get('location')
-        if 'lemma' in _dict:
-            args['lemma'] = _dict.get('lemma')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TokenResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'part_of_speech') and self.part_of_speech is not None:
-            _dict['part_of_speech'] = self.part_of_speech
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location
-        if hasattr(self, 'lemma') and self.lemma is not None:
-            _dict['lemma'] = self.lemma
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TokenResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TokenResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TokenResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PartOfSpeechEnum(str, Enum):
         """
         The part of speech of the token. For more information about the values, see
@@ -51,22 +51,24 @@ See: https://cloud.ibm.com/docs/personality-insights
 """
 
 from enum import Enum
-from typing import Dict, List, TextIO, Union
-import json
+from typing import List, TextIO, Union
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class PersonalityInsightsV3(BaseService):
+class PersonalityInsightsV3(WatsonService):
     """The Personality Insights V3 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.personality-insights.watson.cloud.ibm.com'
@@ -77,6 +79,7 @@ class PersonalityInsightsV3(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Personality Insights service.
@@ -87,6 +90,9 @@ class PersonalityInsightsV3(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         print(
             'warning: On 1 December 2021, Personality Insights will no longer be available. For more information, see https://github.com/watson-developer-cloud/python-sdk/tree/master#personality-insights-deprecation.'
@@ -96,11 +102,14 @@ class PersonalityInsightsV3(BaseService):
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V3',
+                             get_operation_ids(PersonalityInsightsV3))
 
     #########################
     # Methods
@@ -220,7 +229,7 @@ class PersonalityInsightsV3(BaseService):
         }
 
         if isinstance(content, dict):
-            data = json.dumps(content)
+            data = self.get_json_codec().dumps(content)
             if content_type is None:
                 headers['Content-Type'] = 'application/json'
         else:
@@ -236,7 +245,7 @@ class PersonalityInsightsV3(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Profile, **kwargs)
         return response
 
 
@@ -302,12 +311,16 @@ class ProfileEnums:
         ZH_TW = 'zh-tw'
 
 
+class AsyncPersonalityInsightsV3(AsyncWatsonService, PersonalityInsightsV3):
+    """The Personality Insights V3 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class Behavior():
+class Behavior(Model):
     """
     The temporal behavior for the input content.
 
@@ -321,6 +334,15 @@ class Behavior():
           day. The range is 0 to 1.
     """
 
+    __slots__ = ('trait_id', 'name', 'category', 'percentage')
+
+    _fields = (
+        ModelField('trait_id', required=True),
+        ModelField('name', required=True),
+        ModelField('category', required=True),
+        ModelField('percentage', required=True),
+    )
+
     def __init__(self, trait_id: str, name: str, category: str,
                  percentage: float) -> None:
         """
@@ -341,70 +363,8 @@ class Behavior():
         self.category = category
         self.percentage = percentage
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Behavior':
-        """Initialize a Behavior object from a json dictionary."""
-        args = {}
-        if 'trait_id' in _dict:
-            args['trait_id'] = _dict.get('trait_id')
-        else:
-            raise ValueError(
-                'Required property \'trait_id\' not present in Behavior JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Behavior JSON')
-        if 'category' in _dict:
-            args['category'] = _dict.get('category')
-        else:
-            raise ValueError(
-                'Required property \'category\' not present in Behavior JSON')
-        if 'percentage' in _dict:
-            args['percentage'] = _dict.get('percentage')
-        else:
-            raise ValueError(
-                'Required property \'percentage\' not present in Behavior JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Behavior object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'trait_id') and self.trait_id is not None:
-            _dict['trait_id'] = self.trait_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'category') and self.category is not None:
-            _dict['category'] = self.category
-        if hasattr(self, 'percentage') and self.percentage is not None:
-            _dict['percentage'] = self.percentage
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Behavior object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Behavior') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Behavior') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ConsumptionPreferences():
+
+class ConsumptionPreferences(Model):
     """
     A consumption preference that the service inferred from the input content.
 
@@ -421,6 +381,14 @@ class ConsumptionPreferences():
           input text, not a normalized percentile.
     """
 
+    __slots__ = ('consumption_preference_id', 'name', 'score')
+
+    _fields = (
+        ModelField('consumption_preference_id', required=True),
+        ModelField('name', required=True),
+        ModelField('score', required=True),
+    )
+
     def __init__(self, consumption_preference_id: str, name: str,
                  score: float) -> None:
         """
@@ -443,68 +411,8 @@ class ConsumptionPreferences():
         self.name = name
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ConsumptionPreferences':
-        """Initialize a ConsumptionPreferences object from a json dictionary."""
-        args = {}
-        if 'consumption_preference_id' in _dict:
-            args['consumption_preference_id'] = _dict.get(
-                'consumption_preference_id')
-        else:
-            raise ValueError(
-                'Required property \'consumption_preference_id\' not present in ConsumptionPreferences JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in ConsumptionPreferences JSON'
-            )
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in ConsumptionPreferences JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ConsumptionPreferences object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'consumption_preference_id'
-                  ) and self.consumption_preference_id is not None:
-            _dict['consumption_preference_id'] = self.consumption_preference_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ConsumptionPreferences object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ConsumptionPreferences') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ConsumptionPreferences') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ConsumptionPreferencesCategory():
+
+class ConsumptionPreferencesCategory(Model):
     """
     The consumption preferences that the service inferred from the input content.
 
@@ -516,6 +424,16 @@ class ConsumptionPreferencesCategory():
           inferred from the input text for the individual preferences of the category.
     """
 
+    __slots__ = ('consumption_preference_category_id', 'name',
+                 'consumption_preferences')
+
+    _fields = (
+        ModelField('consumption_preference_category_id', required=True),
+        ModelField('name', required=True),
+        ModelField('consumption_preferences', 'list', 'ConsumptionPreferences',
+                   required=True),
+    )
+
     def __init__(
             self, consumption_preference_category_id: str, name: str,
             consumption_preferences: List['ConsumptionPreferences']) -> None:
@@ -535,75 +453,8 @@ class ConsumptionPreferencesCategory():
         self.name = name
         self.consumption_preferences = consumption_preferences
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ConsumptionPreferencesCategory':
-        """Initialize a ConsumptionPreferencesCategory object from a json dictionary."""
-        args = {}
-        if 'consumption_preference_category_id' in _dict:
-            args['consumption_preference_category_id'] = _dict.get(
-                'consumption_preference_category_id')
-        else:
-            raise ValueError(
-                'Required property \'consumption_preference_category_id\' not present in ConsumptionPreferencesCategory JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in ConsumptionPreferencesCategory JSON'
-            )
-        if 'consumption_preferences' in _dict:
-            args['consumption_preferences'] = [
-                ConsumptionPreferences.from_dict(x)
-                for x in _dict.get('consumption_preferences')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'consumption_preferences\' not present in ConsumptionPreferencesCategory JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ConsumptionPreferencesCategory object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'consumption_preference_category_id'
-                  ) and self.consumption_preference_category_id is not None:
-            _dict[
-                'consumption_preference_category_id'] = self.consumption_preference_category_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'consumption_preferences'
-                  ) and self.consumption_preferences is not None:
-            _dict['consumption_preferences'] = [
-                x.to_dict() for x in self.consumption_preferences
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ConsumptionPreferencesCategory object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ConsumptionPreferencesCategory') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ConsumptionPreferencesCategory') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Content():
+
+class Content(Model):
     """
     The full input content that the service is to analyze.
 
@@ -611,6 +462,13 @@ class Content():
           provides the text that is to be analyzed.
     """
 
+    __slots__ = ('content_items',)
+
+    _fields = (
+        ModelField('content_items', 'list', 'ContentItem', key='contentItems',
+                   required=True),
+    )
+
     def __init__(self, content_items: List['ContentItem']) -> None:
         """
         Initialize a Content object.
@@ -620,52 +478,8 @@ class Content():
         """
         self.content_items = content_items
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Content':
-        """Initialize a Content object from a json dictionary."""
-        args = {}
-        if 'contentItems' in _dict:
-            args['content_items'] = [
-                ContentItem.from_dict(x) for x in _dict.get('contentItems')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'contentItems\' not present in Content JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Content object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'content_items') and self.content_items is not None:
-            _dict['contentItems'] = [x.to_dict() for x in self.content_items]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Content object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Content') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Content') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ContentItem():
+
+class ContentItem(Model):
     """
     An input content item that the service is to analyze.
 
@@ -700,6 +514,21 @@ class ContentItem():
           forwarded/copied version of another content item.
     """
 
+    __slots__ = ('content', 'id', 'created', 'updated', 'contenttype',
+                 'language', 'parentid', 'reply', 'forward')
+
+    _fields = (
+        ModelField('content', required=True),
+        ModelField('id'),
+        ModelField('created'),
+        ModelField('updated'),
+        ModelField('contenttype'),
+        ModelField('language'),
+        ModelField('parentid'),
+        ModelField('reply'),
+        ModelField('forward'),
+    )
+
     def __init__(self,
                  content: str,
                  *,
@@ -756,79 +585,6 @@ class ContentItem():
         self.reply = reply
         self.forward = forward
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ContentItem':
-        """Initialize a ContentItem object from a json dictionary."""
-        args = {}
-        if 'content' in _dict:
-            args['content'] = _dict.get('content')
-        else:
-            raise ValueError(
-                'Required property \'content\' not present in ContentItem JSON')
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        if 'created' in _dict:
-            args['created'] = _dict.get('created')
-        if 'updated' in _dict:
-            args['updated'] = _dict.get('updated')
-        if 'contenttype' in _dict:
-            args['contenttype'] = _dict.get('contenttype')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'parentid' in _dict:
-            args['parentid'] = _dict.get('parentid')
-        if 'reply' in _dict:
-            args['reply'] = _dict.get('reply')
-        if 'forward' in _dict:
-            args['forward'] = _dict.get('forward')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ContentItem object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'content') and self.content is not None:
-            _dict['content'] = self.content
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = self.created
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = self.updated
-        if hasattr(self, 'contenttype') and self.contenttype is not None:
-            _dict['contenttype'] = self.contenttype
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'parentid') and self.parentid is not None:
-            _dict['parentid'] = self.parentid
-        if hasattr(self, 'reply') and self.reply is not None:
-            _dict['reply'] = self.reply
-        if hasattr(self, 'forward') and self.forward is not None:
-            _dict['forward'] = self.forward
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ContentItem object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ContentItem') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ContentItem') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ContenttypeEnum(str, Enum):
         """
         The MIME type of the content. The default is plain text. The tags are stripped
@@ -856,7 +612,7 @@ class ContentItem():
         KO = 'ko'
 
 
-class Profile():
+class Profile(Model):
     """
     The personality profile that the service generated for the input content.
 
@@ -888,6 +644,23 @@ class Profile():
           no warnings.
     """
 
+    __slots__ = ('processed_language', 'word_count', 'word_count_message',
+                 'personality', 'needs', 'values', 'behavior',
+                 'consumption_preferences', 'warnings')
+
+    _fields = (
+        ModelField('processed_language', required=True),
+        ModelField('word_count', required=True),
+        ModelField('word_count_message'),
+        ModelField('personality', 'list', 'Trait', required=True),
+        ModelField('needs', 'list', 'Trait', required=True),
+        ModelField('values', 'list', 'Trait', required=True),
+        ModelField('behavior', 'list', 'Behavior'),
+        ModelField('consumption_preferences', 'list',
+                   'ConsumptionPreferencesCategory'),
+        ModelField('warnings', 'list', 'Warning', required=True),
+    )
+
     def __init__(
         self,
         processed_language: str,
@@ -943,111 +716,6 @@ class Profile():
         self.consumption_preferences = consumption_preferences
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Profile':
-        """Initialize a Profile object from a json dictionary."""
-        args = {}
-        if 'processed_language' in _dict:
-            args['processed_language'] = _dict.get('processed_language')
-        else:
-            raise ValueError(
-                'Required property \'processed_language\' not present in Profile JSON'
-            )
-        if 'word_count' in _dict:
-            args['word_count'] = _dict.get('word_count')
-        else:
-            raise ValueError(
-                'Required property \'word_count\' not present in Profile JSON')
-        if 'word_count_message' in _dict:
-            args['word_count_message'] = _dict.get('word_count_message')
-        if 'personality' in _dict:
-            args['personality'] = [
-                Trait.from_dict(x) for x in _dict.get('personality')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'personality\' not present in Profile JSON')
-        if 'needs' in _dict:
-            args['needs'] = [Trait.from_dict(x) for x in _dict.get('needs')]
-        else:
-            raise ValueError(
-                'Required property \'needs\' not present in Profile JSON')
-        if 'values' in _dict:
-            args['values'] = [Trait.from_dict(x) for x in _dict.get('values')]
-        else:
-            raise ValueError(
-                'Required property \'values\' not present in Profile JSON')
-        if 'behavior' in _dict:
-            args['behavior'] = [
-                Behavior.from_dict(x) for x in _dict.get('behavior')
-            ]
-        if 'consumption_preferences' in _dict:
-            args['consumption_preferences'] = [
-                ConsumptionPreferencesCategory.from_dict(x)
-                for x in _dict.get('consumption_preferences')
-            ]
-        if 'warnings' in _dict:
-            args['warnings'] = [
-                Warning.from_dict(x) for x in _dict.get('warnings')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'warnings\' not present in Profile JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Profile object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(
-                self,
-                'processed_language') and self.processed_language is not None:
-            _dict['processed_language'] = self.processed_language
-        if hasattr(self, 'word_count') and self.word_count is not None:
-            _dict['word_count'] = self.word_count
-        if hasattr(
-                self,
-                'word_count_message') and self.word_count_message is not None:
-            _dict['word_count_message'] = self.word_count_message
-        if hasattr(self, 'personality') and self.personality is not None:
-            _dict['personality'] = [x.to_dict() for x in self.personality]
-        if hasattr(self, 'needs') and self.needs is not None:
-            _dict['needs'] = [x.to_dict() for x in self.needs]
-        if hasattr(self, 'values') and self.values is not None:
-            _dict['values'] = [x.to_dict() for x in self.values]
-        if hasattr(self, 'behavior') and self.behavior is not None:
-            _dict['behavior'] = [x.to_dict() for x in self.behavior]
-        if hasattr(self, 'consumption_preferences'
-                  ) and self.consumption_preferences is not None:
-            _dict['consumption_preferences'] = [
-                x.to_dict() for x in self.consumption_preferences
-            ]
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = [x.to_dict() for x in self.warnings]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Profile object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Profile') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Profile') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ProcessedLanguageEnum(str, Enum):
         """
         The language model that was used to process the input.
@@ -1059,7 +727,7 @@ class Profile():
         KO = 'ko'
 
 
-class Trait():
+class Trait(Model):
     """
     The characteristics that the service inferred from the input content.
 
@@ -1097,6 +765,19 @@ class Trait():
           input text.
     """
 
+    __slots__ = ('trait_id', 'name', 'category', 'percentile', 'raw_score',
+                 'significant', 'children')
+
+    _fields = (
+        ModelField('trait_id', required=True),
+        ModelField('name', required=True),
+        ModelField('category', required=True),
+        ModelField('percentile', required=True),
+        ModelField('raw_score'),
+        ModelField('significant'),
+        ModelField('children', 'list', 'Trait'),
+    )
+
     def __init__(self,
                  trait_id: str,
                  name: str,
@@ -1152,82 +833,6 @@ class Trait():
         self.significant = significant
         self.children = children
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Trait':
-        """Initialize a Trait object from a json dictionary."""
-        args = {}
-        if 'trait_id' in _dict:
-            args['trait_id'] = _dict.get('trait_id')
-        else:
-            raise ValueError(
-                'Required property \'trait_id\' not present in Trait JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Trait JSON')
-        if 'category' in _dict:
-            args['category'] = _dict.get('category')
-        else:
-            raise ValueError(
-                'Required property \'category\' not present in Trait JSON')
-        if 'percentile' in _dict:
-            args['percentile'] = _dict.get('percentile')
-        else:
-            raise ValueError(
-                'Required property \'percentile\' not present in Trait JSON')
-        if 'raw_score' in _dict:
-            args['raw_score'] = _dict.get('raw_score')
-        if 'significant' in _dict:
-            args['significant'] = _dict.get('significant')
-        if 'children' in _dict:
-            args['children'] = [
-                Trait.from_dict(x) for x in _dict.get('children')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Trait object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'trait_id') and self.trait_id is not None:
-            _dict['trait_id'] = self.trait_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'category') and self.category is not None:
-            _dict['category'] = self.category
-        if hasattr(self, 'percentile') and self.percentile is not None:
-            _dict['percentile'] = self.percentile
-        if hasattr(self, 'raw_score') and self.raw_score is not None:
-            _dict['raw_score'] = self.raw_score
-        if hasattr(self, 'significant') and self.significant is not None:
-            _dict['significant'] = self.significant
-        if hasattr(self, 'children') and self.children is not None:
-            _dict['children'] = [x.to_dict() for x in self.children]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Trait object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Trait') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Trait') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CategoryEnum(str, Enum):
         """
         The category of the characteristic: `personality` for Big Five personality
@@ -1238,7 +843,7 @@ class Trait():
         VALUES = 'values'
 
 
-class Warning():
+class Warning(Model):
     """
     A warning message that is associated with the input content.
 
@@ -1260,6 +865,13 @@ class Warning():
           of the profile.
     """
 
+    __slots__ = ('warning_id', 'message')
+
+    _fields = (
+        ModelField('warning_id', required=True),
+        ModelField('message', required=True),
+    )
+
     def __init__(self, warning_id: str, message: str) -> None:
         """
         Initialize a Warning object.
@@ -1284,54 +896,6 @@ class Warning():
         self.warning_id = warning_id
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Warning':
-        """Initialize a Warning object from a json dictionary."""
-        args = {}
-        if 'warning_id' in _dict:
-            args['warning_id'] = _dict.get('warning_id')
-        else:
-            raise ValueError(
-                'Required property \'warning_id\' not present in Warning JSON')
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        else:
-            raise ValueError(
-                'Required property \'message\' not present in Warning JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Warning object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'warning_id') and self.warning_id is not None:
-            _dict['warning_id'] = self.warning_id
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Warning object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Warning') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Warning') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class WarningIdEnum(str, Enum):
         """
         The identifier of the warning message.
@@ -0,0 +1,260 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Adaptive client-side rate limiting of the requests of a service.
+
+A `RateLimiter` set on a service with `set_rate_limiter()` holds every request
+until it may be sent, and learns the limit of the service from its responses:
+
+- The number of requests in flight is limited, and the limit is adjusted by
+  additive increase, multiplicative decrease (AIMD): it grows by about one for
+  each round of successful requests and is halved on a 429 response.
+- A 429 response, or `X-RateLimit-Remaining: 0`, holds all requests until the
+  time given by the `Retry-After` or `X-RateLimit-Reset` header.
+- Optionally, a token bucket caps the request rate.
+
+Requests rejected with 429 are sent again, up to `max_retries` times, when
+their body can be resent. A limiter is thread-safe and can be shared by
+several services that count against the same limit.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Mapping, Optional
+
+# The delay of a request that waits for another to be released.
+_UNTIL_RELEASE = float('inf')
+
+
+class RateLimiter():
+    """
+    Adaptive concurrency and rate limit of the requests of one or more services.
+
+    :param int max_concurrency: (optional) The upper bound of the number of
+           requests in flight.
+    :param int min_concurrency: (optional) The lower bound the limit of
+           requests in flight is decreased to.
+    :param int initial_concurrency: (optional) The limit of requests in flight
+           to start with. Defaults to `max_concurrency`.
+    :param float rate: (optional) The maximum number of requests per second,
+           or `None` for no rate limit.
+    :param int burst: (optional) The number of requests that can be sent at
+           once before `rate` applies. Defaults to `max(1, rate)`.
+    :param float decrease: (optional) The factor the concurrency limit is
+           multiplied by on a 429 response.
+    :param int max_retries: (optional) The number of times a request rejected
+           with 429 is sent again.
+    :param float retry_interval: (optional) The maximum backoff, in seconds,
+           after a 429 response without a Retry-After header.
+
+    :attr float concurrency_limit: The current limit of requests in flight.
+    :attr int in_flight: The number of requests in flight.
+    :attr int throttled: The number of 429 responses received.
+    """
+
+    def __init__(self,
+                 *,
+                 max_concurrency: int = 32,
+                 min_concurrency: int = 1,
+                 initial_concurrency: int = None,
+                 rate: float = None,
+                 burst: int = None,
+                 decrease: float = 0.5,
+                 max_retries: int = 3,
+                 retry_interval: float = 30.0) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                'min_concurrency must be between 1 and max_concurrency')
+        if not 0 < decrease < 1:
+            raise ValueError('decrease must be between 0 and 1')
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.concurrency_limit = float(initial_concurrency or max_concurrency)
+        self.in_flight = 0
+        self.throttled = 0
+        self._condition = threading.Condition()
+        self._resume_at = 0.0
+        self._tokens = float(self.burst)
+        self._tokens_updated = time.monotonic()
+        self._decreased_at = 0.0
+        # The (event loop, future) of each coroutine waiting for a release,
+        # in the order they started waiting.
+        self._waiters = collections.deque()
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent, and count it as in flight.
+
+        :return: A token to pass to `release` when the response is received.
+        """
+        with self._condition:
+            while True:
+                delay = self._try_acquire()
+                if delay is None:
+                    return time.monotonic()
+                self._condition.wait(None if delay == _UNTIL_RELEASE else delay)
+
+    async def acquire_async(self) -> float:
+        """
+        Wait on the event loop until a request may be sent, see `acquire`.
+
+        Coroutines waiting for a request to be released are woken by
+        `release`, in the order they started waiting.
+        """
+        loop = asyncio.get_event_loop()
+        # Whether the coroutine has waited already, and keeps its place.
+        waited = False
+        while True:
+            future = None
+            with self._condition:
+                if self._waiters and not waited:
+                    # Wait behind the coroutines already waiting.
+                    delay = _UNTIL_RELEASE
+                else:
+                    delay = self._try_acquire()
+                if delay is None:
+                    # Hand the slots still free to the next coroutines, such
+                    # as after a Retry-After that held them all.
+                    self._wake_waiters(
+                        int(self.concurrency_limit) - self.in_flight)
+                    return time.monotonic()
+                if delay == _UNTIL_RELEASE:
+                    future = loop.create_future()
+                    if waited:
+                        self._waiters.appendleft((loop, future))
+                    else:
+                        self._waiters.append((loop, future))
+            try:
+                if future is not None:
+                    await future
+                else:
+                    # Retry-After, X-RateLimit-Reset or the token bucket.
+                    await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                with self._condition:
+                    if future is not None and \
+                            (loop, future) in self._waiters:
+                        self._waiters.remove((loop, future))
+                    else:
+                        # Pass on the wake-up this coroutine would have used.
+                        self._wake_waiters(1)
+                raise
+            waited = True
+
+    def release(self,
+                token: float,
+                status_code: Optional[int],
+                headers: Optional[Mapping[str, str]] = None,
+                retry_after: Optional[float] = None) -> None:
+        """
+        Count a request as completed and adjust the limits from its response.
+
+        :param float token: The value returned by `acquire`.
+        :param int status_code: The status code of the response, or `None` if
+               the request failed without a response.
+        :param headers: (optional) The headers of the response.
+        :param float retry_after: (optional) The delay requested by the
+               response, in seconds.
+        """
+        now = time.monotonic()
+        with self._condition:
+            self.in_flight -= 1
+            if status_code == 429:
+                self.throttled += 1
+                # Requests sent before the last decrease saw the old limit;
+                # decrease once per round of requests.
+                if token >= self._decreased_at:
+                    self.concurrency_limit = max(
+                        self.min_concurrency,
+                        self.concurrency_limit * self.decrease)
+                    self._decreased_at = now
+                if retry_after is None:
+                    retry_after = min(self.retry_interval,
+                                      2**min(self.throttled, 16) / 16)
+                self._resume_at = max(self._resume_at, now + retry_after)
+            elif status_code is not None and status_code < 500:
+                self.concurrency_limit = min(
+                    self.max_concurrency,
+                    self.concurrency_limit + 1 / self.concurrency_limit)
+            if headers is not None:
+                reset = _get_rate_limit_reset(headers)
+                if reset is not None:
+                    self._resume_at = max(self._resume_at, now + reset)
+            self._condition.notify_all()
+            self._wake_waiters(
+                max(1,
+                    int(self.concurrency_limit) - self.in_flight))
+
+    def _wake_waiters(self, count: int) -> None:
+        """Wake the first `count` coroutines waiting for a release."""
+        for _ in range(min(count, len(self._waiters))):
+            loop, future = self._waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+    def _try_acquire(self) -> Optional[float]:
+        """Take a slot and return None, or return the time to wait."""
+        now = time.monotonic()
+        if now < self._resume_at:
+            return self._resume_at - now
+        if self.in_flight >= int(self.concurrency_limit):
+            return _UNTIL_RELEASE
+        if self.rate is not None:
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._tokens_updated) * self.rate)
+            self._tokens_updated = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+        self.in_flight += 1
+        return None
+
+    def __repr__(self) -> str:
+        return ('<RateLimiter concurrency_limit={0:.1f} in_flight={1} '
+                'throttled={2}>'.format(self.concurrency_limit,
+                                        self.in_flight, self.throttled))
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _get_rate_limit_reset(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the seconds until X-RateLimit-Reset if no requests remain.
+
+    The reset time is either a number of seconds or a Unix time.
+    """
+    if headers.get('X-RateLimit-Remaining') != '0':
+        return None
+    try:
+        reset = float(headers.get('X-RateLimit-Reset'))
+    except (TypeError, ValueError):
+        return None
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
@@ -0,0 +1,227 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Client-side cache of the responses of GET operations.
+
+A `ResponseCache` set on a service with `set_response_cache()` keeps the JSON
+results of GET requests, such as `list_voices` or `get_workspace`, for a time
+to live, and evicts the least recently used entries beyond `max_entries`:
+
+    from ibm_watson import ResponseCache
+
+    cache = ResponseCache(ttl=60, ttls={'list_voices': 3600})
+    text_to_speech.set_response_cache(cache)
+
+Expired entries with an ETag are revalidated with `If-None-Match`, so an
+unchanged resource costs a 304 response without a body. A request that
+modifies a resource, such as `update_workspace` or `delete_voice_model`,
+removes the entries of the resource and of its parent collection. Requests
+that only read, such as `message`, `query` or `recognize`, remove none.
+"""
+
+import collections
+import copy
+import threading
+import time
+from typing import Dict, Optional
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import get_operation_id
+
+# The operations that modify resources with a POST. Other POST operations,
+# such as `message`, `query` or `recognize`, only read.
+_MODIFYING_OPERATIONS = ('add_', 'create_', 'register_', 'reset_', 'train',
+                         'unregister_', 'update_', 'upgrade_')
+# Headers that vary between requests for the same resource.
+_UNKEYED_HEADERS = frozenset(['authorization', 'if-none-match'])
+
+
+class CacheEntry():
+    """
+    A cached response.
+
+    :attr str url: The URL of the request.
+    :attr str etag: The ETag of the response, or `None`.
+    :attr float expires_at: When the entry expires, in `time.monotonic()`
+          seconds.
+    """
+
+    __slots__ = ('url', 'etag', 'expires_at', '_result', '_headers',
+                 '_status_code')
+
+    def __init__(self, url: str, response: DetailedResponse,
+                 expires_at: float) -> None:
+        self.url = url
+        headers = response.get_headers()
+        self.etag = headers.get('ETag') if headers is not None else None
+        self.expires_at = expires_at
+        self._result = copy.deepcopy(response.get_result())
+        self._headers = headers
+        self._status_code = response.get_status_code()
+
+    def is_fresh(self) -> bool:
+        """Return whether the entry can be used without revalidation."""
+        return time.monotonic() < self.expires_at
+
+    def get_response(self) -> DetailedResponse:
+        """Return a copy of the cached response."""
+        return DetailedResponse(response=copy.deepcopy(self._result),
+                                headers=self._headers,
+                                status_code=self._status_code)
+
+
+class ResponseCache():
+    """
+    A thread-safe LRU cache of the JSON responses of GET operations.
+
+    A cache can be shared by services that use the same credentials.
+
+    :param int max_entries: (optional) The maximum number of cached responses.
+    :param float ttl: (optional) The time to live of a response, in seconds.
+    :param dict ttls: (optional) The time to live of the responses of
+           specific operations, keyed by operation name such as `list_voices`.
+           A time to live of 0 disables caching of the operation.
+
+    :attr int hits: The number of requests answered from the cache, including
+          revalidated entries.
+    :attr int misses: The number of requests sent without a usable entry.
+    """
+
+    def __init__(self,
+                 *,
+                 max_entries: int = 256,
+                 ttl: float = 60.0,
+                 ttls: Dict[str, float] = None) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, request: dict) -> Optional[CacheEntry]:
+        """
+        Return the entry of a prepared GET request, fresh or expired.
+
+        :param dict request: A request returned by `prepare_request`.
+        :return: The entry, or `None` if the response is not cached.
+        """
+        key = _get_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.is_fresh():
+                    self.hits += 1
+                    return entry
+            self.misses += 1
+            return entry
+
+    def store(self, request: dict, response: DetailedResponse) -> None:
+        """
+        Cache the response of a GET request, unless its result is not JSON.
+
+        :param dict request: The request returned by `prepare_request`.
+        :param DetailedResponse response: The response of the request.
+        """
+        ttl = self.get_ttl(request)
+        if not ttl or not isinstance(response.get_result(), (dict, list)):
+            return
+        entry = CacheEntry(request['url'], response, time.monotonic() + ttl)
+        key = _get_key(request)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, request: dict, entry: CacheEntry) -> None:
+        """Extend the life of an entry revalidated by a 304 response."""
+        with self._lock:
+            self.hits += 1
+            self.misses -= 1
+            entry.expires_at = time.monotonic() + self.get_ttl(request)
+
+    def invalidate(self, url: str = None) -> None:
+        """
+        Remove the entries of the resource at `url`, of the resources under
+        it, and of its parent collection.
+
+        For example, `/v1/workspaces/{id}` removes the entries of
+        `/v1/workspaces/{id}`, `/v1/workspaces/{id}/intents` and
+        `/v1/workspaces`, but not those of the other workspaces.
+
+        :param str url: (optional) The URL of a request that modifies a
+               resource. By default, all entries are removed.
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+            url = url.split('?', 1)[0].rstrip('/')
+            parent = url.rsplit('/', 1)[0]
+            for key in [
+                    key for key, entry in self._entries.items()
+                    if entry.url in (url, parent) or
+                    entry.url.startswith(url + '/')
+            ]:
+                del self._entries[key]
+
+    def invalidate_request(self, request: dict) -> None:
+        """
+        Remove the entries that a request modifies, if it is not a GET or HEAD
+        request, or a POST that only reads, such as `message`.
+
+        :param dict request: A request returned by `prepare_request`.
+        """
+        method = request['method']
+        if method in ('GET', 'HEAD'):
+            return
+        if method == 'POST':
+            operation_id = get_operation_id(request['headers'])
+            if operation_id is not None and \
+                    not operation_id.startswith(_MODIFYING_OPERATIONS):
+                return
+        self.invalidate(request['url'])
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.invalidate()
+
+    def get_ttl(self, request: dict) -> float:
+        """Return the time to live of the response of a request."""
+        return self.ttls.get(get_operation_id(request['headers']), self.ttl)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return '<ResponseCache entries={0} hits={1} misses={2}>'.format(
+            len(self), self.hits, self.misses)
+
+
+def _get_key(request: dict) -> tuple:
+    params = request.get('params') or {}
+    return (request['url'],
+            tuple(sorted((key, str(value)) for key, value in params.items())),
+            tuple(
+                sorted((name.lower(), value)
+                       for name, value in request['headers'].items()
+                       if name.lower() not in _UNKEYED_HEADERS)))
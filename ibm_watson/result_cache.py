@@ -0,0 +1,306 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Content-addressed cache of the results of deterministic operations.
+
+Operations such as `analyze`, `tone`, `translate` or `classify` return the
+same result for the same request. A `ResultCache` set on a service with
+`set_result_cache()` keys their results by a hash of the canonical request,
+so a duplicate document is answered without calling the service:
+
+    from ibm_watson import ResultCache
+    from ibm_watson.result_cache import SQLiteBackend
+
+    cache = ResultCache(SQLiteBackend('results.db'))
+    natural_language_understanding.set_result_cache(cache)
+
+Results are kept by a backend: `MemoryBackend`, an LRU cache in memory, the
+default; `SQLiteBackend` or `ShelveBackend` on disk; or any subclass of
+`ResultCacheBackend`.
+"""
+
+import collections
+import gzip
+import hashlib
+import json
+import shelve
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import get_operation_id
+
+# Operations whose result only depends on the request.
+DEFAULT_OPERATIONS = frozenset([
+    'analyze', 'tone', 'tone_chat', 'profile', 'translate', 'identify',
+    'classify', 'classify_collection'
+])
+
+# Headers that do not change the result of a request.
+_UNKEYED_HEADERS = frozenset([
+    'authorization', 'content-encoding', 'user-agent',
+    'x-ibmcloud-sdk-analytics'
+])
+
+
+class ResultCacheBackend():
+    """
+    Stores the cached results of a `ResultCache` as bytes under string keys.
+
+    Backends must be safe to use from several threads.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under `key`, or `None`."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store `value` under `key`."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all values."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources of the backend."""
+
+
+class MemoryBackend(ResultCacheBackend):
+    """
+    Keeps results in memory, evicting the least recently used beyond
+    `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.max_entries = max_entries
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class SQLiteBackend(ResultCacheBackend):
+    """
+    Keeps results in an SQLite database, which persists across processes.
+
+    :param str path: The path of the database file, created if needed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS results '
+                '(key TEXT PRIMARY KEY, value BLOB NOT NULL)')
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+        return bytes(row[0]) if row is not None else None
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)',
+                (key, value))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM results')
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ShelveBackend(ResultCacheBackend):
+    """
+    Keeps results in a `shelve` database.
+
+    :param str path: The path of the database, as for `shelve.open`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._shelf = shelve.open(path)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._shelf.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._shelf[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shelf.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._shelf.close()
+
+
+class ResultCache():
+    """
+    Answers repeated requests of deterministic operations from a backend.
+
+    Requests are keyed by the SHA-256 hash of their method, URL, query
+    parameters, headers and body, with JSON bodies in canonical form, so the
+    order of dictionary keys does not matter. The credentials are not part of
+    the key. Requests that upload files are always sent.
+
+    :param ResultCacheBackend backend: (optional) The backend, by default a
+           `MemoryBackend`.
+    :param Iterable[str] operations: (optional) The names of the operations
+           to cache. By default, the operations in `DEFAULT_OPERATIONS`.
+
+    :attr int hits: The number of requests answered from the cache.
+    :attr int misses: The number of cacheable requests that were sent.
+    """
+
+    def __init__(self,
+                 backend: ResultCacheBackend = None,
+                 *,
+                 operations: Iterable[str] = None) -> None:
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.operations = frozenset(
+            operations if operations is not None else DEFAULT_OPERATIONS)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_key(self, request: dict) -> Optional[str]:
+        """
+        Return the cache key of a prepared request.
+
+        :param dict request: A request returned by `prepare_request`.
+        :return: The key, or `None` if the request is not cacheable.
+        """
+        headers = request['headers']
+        if (get_operation_id(headers) not in self.operations or
+                request.get('files')):
+            return None
+        body = request.get('data')
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, bytes):
+            # A stream cannot be hashed without consuming it.
+            return None
+        header_items = sorted((name.lower(), str(value))
+                              for name, value in headers.items())
+        header_map = dict(header_items)
+        if header_map.get('content-encoding') == 'gzip':
+            # The gzip header holds the time of compression.
+            body = gzip.decompress(body)
+        if header_map.get('content-type', '').startswith('application/json'):
+            body = _canonical_json(body)
+        header_items = [(name, value)
+                        for name, value in header_items
+                        if name not in _UNKEYED_HEADERS]
+        params = request.get('params') or {}
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps([
+                request['method'], request['url'],
+                sorted((key, str(value)) for key, value in params.items()),
+                header_items
+            ]).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(body)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[DetailedResponse]:
+        """Return the cached response stored under `key`, or `None`."""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        entry = json.loads(value.decode('utf-8'))
+        return DetailedResponse(response=entry['result'],
+                                headers=entry['headers'],
+                                status_code=entry['status_code'])
+
+    def set(self, key: str, response: DetailedResponse) -> None:
+        """Store a response under `key`, unless its result is not JSON."""
+        result = response.get_result()
+        if not isinstance(result, (dict, list)):
+            return
+        self.backend.set(
+            key,
+            json.dumps({
+                'status_code': response.get_status_code(),
+                'headers': dict(response.get_headers() or {}),
+                'result': result
+            }).encode('utf-8'))
+
+    def get_hit_ratio(self) -> float:
+        """Return the share of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Remove all results from the backend and reset the counts."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def __repr__(self) -> str:
+        return '<ResultCache {0} hits={1} misses={2}>'.format(
+            type(self.backend).__name__, self.hits, self.misses)
+
+
+def _canonical_json(body: bytes) -> bytes:
+    try:
+        value = json.loads(body.decode('utf-8'))
+    except ValueError:
+        return body
+    return json.dumps(value,
+                      sort_keys=True,
+                      separators=(',', ':'),
+                      ensure_ascii=False).encode('utf-8')
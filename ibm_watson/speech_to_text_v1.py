@@ -46,22 +46,24 @@ See: https://cloud.ibm.com/docs/speech-to-text
 """
 
 from enum import Enum
-from typing import BinaryIO, Dict, List, TextIO, Union
-import json
+from typing import BinaryIO, List, TextIO, Union
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_list, convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class SpeechToTextV1(BaseService):
+class SpeechToTextV1(WatsonService):
     """The Speech to Text V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.speech-to-text.watson.cloud.ibm.com'
@@ -71,6 +73,7 @@ class SpeechToTextV1(BaseService):
         self,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Speech to Text service.
@@ -78,13 +81,19 @@ class SpeechToTextV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(SpeechToTextV1))
 
     #########################
     # Models
@@ -119,7 +128,7 @@ class SpeechToTextV1(BaseService):
         url = '/v1/models'
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SpeechModels, **kwargs)
         return response
 
     def get_model(self, model_id: str, **kwargs) -> DetailedResponse:
@@ -159,7 +168,7 @@ class SpeechToTextV1(BaseService):
         url = '/v1/models/{model_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SpeechModel, **kwargs)
         return response
 
     #########################
@@ -563,7 +572,9 @@ class SpeechToTextV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=SpeechRecognitionResults,
+                             **kwargs)
         return response
 
     #########################
@@ -644,7 +655,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=RegisterStatus, **kwargs)
         return response
 
     def unregister_callback(self, callback_url: str,
@@ -1167,7 +1178,7 @@ class SpeechToTextV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=RecognitionJob, **kwargs)
         return response
 
     def check_jobs(self, **kwargs) -> DetailedResponse:
@@ -1203,7 +1214,7 @@ class SpeechToTextV1(BaseService):
         url = '/v1/recognitions'
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=RecognitionJobs, **kwargs)
         return response
 
     def check_job(self, id: str, **kwargs) -> DetailedResponse:
@@ -1249,7 +1260,7 @@ class SpeechToTextV1(BaseService):
         url = '/v1/recognitions/{id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=RecognitionJob, **kwargs)
         return response
 
     def delete_job(self, id: str, **kwargs) -> DetailedResponse:
@@ -1374,7 +1385,7 @@ class SpeechToTextV1(BaseService):
             'description': description
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1387,7 +1398,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LanguageModel, **kwargs)
         return response
 
     def list_language_models(self,
@@ -1436,7 +1447,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LanguageModels, **kwargs)
         return response
 
     def get_language_model(self, customization_id: str,
@@ -1476,7 +1487,7 @@ class SpeechToTextV1(BaseService):
         url = '/v1/customizations/{customization_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=LanguageModel, **kwargs)
         return response
 
     def delete_language_model(self, customization_id: str,
@@ -1626,7 +1637,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingResponse, **kwargs)
         return response
 
     def reset_language_model(self, customization_id: str,
@@ -1774,7 +1785,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Corpora, **kwargs)
         return response
 
     def add_corpus(self,
@@ -1956,7 +1967,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Corpus, **kwargs)
         return response
 
     def delete_corpus(self, customization_id: str, corpus_name: str,
@@ -2089,7 +2100,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Words, **kwargs)
         return response
 
     def add_words(self, customization_id: str, words: List['CustomWord'],
@@ -2185,7 +2196,7 @@ class SpeechToTextV1(BaseService):
 
         data = {'words': words}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2319,7 +2330,7 @@ class SpeechToTextV1(BaseService):
             'display_as': display_as
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2384,7 +2395,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Word, **kwargs)
         return response
 
     def delete_word(self, customization_id: str, word_name: str,
@@ -2488,7 +2499,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Grammars, **kwargs)
         return response
 
     def add_grammar(self,
@@ -2668,7 +2679,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Grammar, **kwargs)
         return response
 
     def delete_grammar(self, customization_id: str, grammar_name: str,
@@ -2790,7 +2801,7 @@ class SpeechToTextV1(BaseService):
             'description': description
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2803,7 +2814,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AcousticModel, **kwargs)
         return response
 
     def list_acoustic_models(self,
@@ -2854,7 +2865,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AcousticModels, **kwargs)
         return response
 
     def get_acoustic_model(self, customization_id: str,
@@ -2897,7 +2908,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AcousticModel, **kwargs)
         return response
 
     def delete_acoustic_model(self, customization_id: str,
@@ -3051,7 +3062,7 @@ class SpeechToTextV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingResponse, **kwargs)
         return response
 
     def reset_acoustic_model(self, customization_id: str,
@@ -3238,7 +3249,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AudioResources, **kwargs)
         return response
 
     def add_audio(self,
@@ -3486,7 +3497,7 @@ class SpeechToTextV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AudioListing, **kwargs)
         return response
 
     def delete_audio(self, customization_id: str, audio_name: str,
@@ -4102,12 +4113,16 @@ class AddAudioEnums:
         AUDIO_WEBM_CODECS_VORBIS = 'audio/webm;codecs=vorbis'
 
 
+class AsyncSpeechToTextV1(AsyncWatsonService, SpeechToTextV1):
+    """The Speech to Text V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AcousticModel():
+class AcousticModel(Model):
     """
     Information about an existing custom acoustic model.
 
@@ -4155,6 +4170,25 @@ class AcousticModel():
           parameter.
     """
 
+    __slots__ = ('customization_id', 'created', 'updated', 'language',
+                 'versions', 'owner', 'name', 'description', 'base_model_name',
+                 'status', 'progress', 'warnings')
+
+    _fields = (
+        ModelField('customization_id', required=True),
+        ModelField('created'),
+        ModelField('updated'),
+        ModelField('language'),
+        ModelField('versions'),
+        ModelField('owner'),
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('base_model_name'),
+        ModelField('status'),
+        ModelField('progress'),
+        ModelField('warnings'),
+    )
+
     def __init__(self,
                  customization_id: str,
                  *,
@@ -4232,94 +4266,6 @@ class AcousticModel():
         self.progress = progress
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AcousticModel':
-        """Initialize a AcousticModel object from a json dictionary."""
-        args = {}
-        if 'customization_id' in _dict:
-            args['customization_id'] = _dict.get('customization_id')
-        else:
-            raise ValueError(
-                'Required property \'customization_id\' not present in AcousticModel JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = _dict.get('created')
-        if 'updated' in _dict:
-            args['updated'] = _dict.get('updated')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'versions' in _dict:
-            args['versions'] = _dict.get('versions')
-        if 'owner' in _dict:
-            args['owner'] = _dict.get('owner')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'base_model_name' in _dict:
-            args['base_model_name'] = _dict.get('base_model_name')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'progress' in _dict:
-            args['progress'] = _dict.get('progress')
-        if 'warnings' in _dict:
-            args['warnings'] = _dict.get('warnings')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AcousticModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'customization_id') and self.customization_id is not None:
-            _dict['customization_id'] = self.customization_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = self.created
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = self.updated
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'versions') and self.versions is not None:
-            _dict['versions'] = self.versions
-        if hasattr(self, 'owner') and self.owner is not None:
-            _dict['owner'] = self.owner
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self,
-                   'base_model_name') and self.base_model_name is not None:
-            _dict['base_model_name'] = self.base_model_name
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'progress') and self.progress is not None:
-            _dict['progress'] = self.progress
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = self.warnings
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AcousticModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AcousticModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AcousticModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the custom acoustic model:
@@ -4341,7 +4287,7 @@ class AcousticModel():
         FAILED = 'failed'
 
 
-class AcousticModels():
+class AcousticModels(Model):
     """
     Information about existing custom acoustic models.
 
@@ -4352,6 +4298,12 @@ class AcousticModels():
           language.
     """
 
+    __slots__ = ('customizations',)
+
+    _fields = (
+        ModelField('customizations', 'list', 'AcousticModel', required=True),
+    )
+
     def __init__(self, customizations: List['AcousticModel']) -> None:
         """
         Initialize a AcousticModels object.
@@ -4364,52 +4316,8 @@ class AcousticModels():
         """
         self.customizations = customizations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AcousticModels':
-        """Initialize a AcousticModels object from a json dictionary."""
-        args = {}
-        if 'customizations' in _dict:
-            args['customizations'] = [
-                AcousticModel.from_dict(x) for x in _dict.get('customizations')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'customizations\' not present in AcousticModels JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AcousticModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'customizations') and self.customizations is not None:
-            _dict['customizations'] = [x.to_dict() for x in self.customizations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AcousticModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AcousticModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AcousticModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AudioDetails():
+
+class AudioDetails(Model):
     """
     Information about an audio resource from a custom acoustic model.
 
@@ -4432,6 +4340,15 @@ class AudioDetails():
           Omitted for an audio-type resource.
     """
 
+    __slots__ = ('type', 'codec', 'frequency', 'compression')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('codec'),
+        ModelField('frequency'),
+        ModelField('compression'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -4464,56 +4381,6 @@ class AudioDetails():
         self.frequency = frequency
         self.compression = compression
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioDetails':
-        """Initialize a AudioDetails object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'codec' in _dict:
-            args['codec'] = _dict.get('codec')
-        if 'frequency' in _dict:
-            args['frequency'] = _dict.get('frequency')
-        if 'compression' in _dict:
-            args['compression'] = _dict.get('compression')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'codec') and self.codec is not None:
-            _dict['codec'] = self.codec
-        if hasattr(self, 'frequency') and self.frequency is not None:
-            _dict['frequency'] = self.frequency
-        if hasattr(self, 'compression') and self.compression is not None:
-            _dict['compression'] = self.compression
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The type of the audio resource:
@@ -4539,7 +4406,7 @@ class AudioDetails():
         GZIP = 'gzip'
 
 
-class AudioListing():
+class AudioListing(Model):
     """
     Information about an audio resource from a custom acoustic model.
 
@@ -4570,6 +4437,17 @@ class AudioListing():
           resource.
     """
 
+    __slots__ = ('duration', 'name', 'details', 'status', 'container', 'audio')
+
+    _fields = (
+        ModelField('duration'),
+        ModelField('name'),
+        ModelField('details', 'model', 'AudioDetails'),
+        ModelField('status'),
+        ModelField('container', 'model', 'AudioResource'),
+        ModelField('audio', 'list', 'AudioResource'),
+    )
+
     def __init__(self,
                  *,
                  duration: int = None,
@@ -4615,66 +4493,6 @@ class AudioListing():
         self.container = container
         self.audio = audio
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioListing':
-        """Initialize a AudioListing object from a json dictionary."""
-        args = {}
-        if 'duration' in _dict:
-            args['duration'] = _dict.get('duration')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'details' in _dict:
-            args['details'] = AudioDetails.from_dict(_dict.get('details'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'container' in _dict:
-            args['container'] = AudioResource.from_dict(_dict.get('container'))
-        if 'audio' in _dict:
-            args['audio'] = [
-                AudioResource.from_dict(x) for x in _dict.get('audio')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioListing object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'duration') and self.duration is not None:
-            _dict['duration'] = self.duration
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'details') and self.details is not None:
-            _dict['details'] = self.details.to_dict()
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'container') and self.container is not None:
-            _dict['container'] = self.container.to_dict()
-        if hasattr(self, 'audio') and self.audio is not None:
-            _dict['audio'] = [x.to_dict() for x in self.audio]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioListing object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioListing') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioListing') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         _For an audio-type resource_, the status of the resource:
@@ -4692,7 +4510,7 @@ class AudioListing():
         INVALID = 'invalid'
 
 
-class AudioMetrics():
+class AudioMetrics(Model):
     """
     If audio metrics are requested, information about the signal characteristics of the
     input audio.
@@ -4706,6 +4524,14 @@ class AudioMetrics():
           characteristics of the input audio.
     """
 
+    __slots__ = ('sampling_interval', 'accumulated')
+
+    _fields = (
+        ModelField('sampling_interval', required=True),
+        ModelField('accumulated', 'model', 'AudioMetricsDetails',
+                   required=True),
+    )
+
     def __init__(self, sampling_interval: float,
                  accumulated: 'AudioMetricsDetails') -> None:
         """
@@ -4722,60 +4548,8 @@ class AudioMetrics():
         self.sampling_interval = sampling_interval
         self.accumulated = accumulated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioMetrics':
-        """Initialize a AudioMetrics object from a json dictionary."""
-        args = {}
-        if 'sampling_interval' in _dict:
-            args['sampling_interval'] = _dict.get('sampling_interval')
-        else:
-            raise ValueError(
-                'Required property \'sampling_interval\' not present in AudioMetrics JSON'
-            )
-        if 'accumulated' in _dict:
-            args['accumulated'] = AudioMetricsDetails.from_dict(
-                _dict.get('accumulated'))
-        else:
-            raise ValueError(
-                'Required property \'accumulated\' not present in AudioMetrics JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioMetrics object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'sampling_interval') and self.sampling_interval is not None:
-            _dict['sampling_interval'] = self.sampling_interval
-        if hasattr(self, 'accumulated') and self.accumulated is not None:
-            _dict['accumulated'] = self.accumulated.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioMetrics object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioMetrics') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioMetrics') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AudioMetricsDetails():
+
+class AudioMetricsDetails(Model):
     """
     Detailed information about the signal characteristics of the input audio.
 
@@ -4822,6 +4596,26 @@ class AudioMetricsDetails():
           to the range 0.0 (minimum level) to 1.0 (maximum level).
     """
 
+    __slots__ = ('final', 'end_time', 'signal_to_noise_ratio', 'speech_ratio',
+                 'high_frequency_loss', 'direct_current_offset',
+                 'clipping_rate', 'speech_level', 'non_speech_level')
+
+    _fields = (
+        ModelField('final', required=True),
+        ModelField('end_time', required=True),
+        ModelField('signal_to_noise_ratio'),
+        ModelField('speech_ratio', required=True),
+        ModelField('high_frequency_loss', required=True),
+        ModelField('direct_current_offset', 'list', 'AudioMetricsHistogramBin',
+                   required=True),
+        ModelField('clipping_rate', 'list', 'AudioMetricsHistogramBin',
+                   required=True),
+        ModelField('speech_level', 'list', 'AudioMetricsHistogramBin',
+                   required=True),
+        ModelField('non_speech_level', 'list', 'AudioMetricsHistogramBin',
+                   required=True),
+    )
+
     def __init__(self,
                  final: bool,
                  end_time: float,
@@ -4889,131 +4683,8 @@ class AudioMetricsDetails():
         self.speech_level = speech_level
         self.non_speech_level = non_speech_level
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioMetricsDetails':
-        """Initialize a AudioMetricsDetails object from a json dictionary."""
-        args = {}
-        if 'final' in _dict:
-            args['final'] = _dict.get('final')
-        else:
-            raise ValueError(
-                'Required property \'final\' not present in AudioMetricsDetails JSON'
-            )
-        if 'end_time' in _dict:
-            args['end_time'] = _dict.get('end_time')
-        else:
-            raise ValueError(
-                'Required property \'end_time\' not present in AudioMetricsDetails JSON'
-            )
-        if 'signal_to_noise_ratio' in _dict:
-            args['signal_to_noise_ratio'] = _dict.get('signal_to_noise_ratio')
-        if 'speech_ratio' in _dict:
-            args['speech_ratio'] = _dict.get('speech_ratio')
-        else:
-            raise ValueError(
-                'Required property \'speech_ratio\' not present in AudioMetricsDetails JSON'
-            )
-        if 'high_frequency_loss' in _dict:
-            args['high_frequency_loss'] = _dict.get('high_frequency_loss')
-        else:
-            raise ValueError(
-                'Required property \'high_frequency_loss\' not present in AudioMetricsDetails JSON'
-            )
-        if 'direct_current_offset' in _dict:
-            args['direct_current_offset'] = [
-                AudioMetricsHistogramBin.from_dict(x)
-                for x in _dict.get('direct_current_offset')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'direct_current_offset\' not present in AudioMetricsDetails JSON'
-            )
-        if 'clipping_rate' in _dict:
-            args['clipping_rate'] = [
-                AudioMetricsHistogramBin.from_dict(x)
-                for x in _dict.get('clipping_rate')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'clipping_rate\' not present in AudioMetricsDetails JSON'
-            )
-        if 'speech_level' in _dict:
-            args['speech_level'] = [
-                AudioMetricsHistogramBin.from_dict(x)
-                for x in _dict.get('speech_level')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'speech_level\' not present in AudioMetricsDetails JSON'
-            )
-        if 'non_speech_level' in _dict:
-            args['non_speech_level'] = [
-                AudioMetricsHistogramBin.from_dict(x)
-                for x in _dict.get('non_speech_level')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'non_speech_level\' not present in AudioMetricsDetails JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioMetricsDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'final') and self.final is not None:
-            _dict['final'] = self.final
-        if hasattr(self, 'end_time') and self.end_time is not None:
-            _dict['end_time'] = self.end_time
-        if hasattr(self, 'signal_to_noise_ratio'
-                  ) and self.signal_to_noise_ratio is not None:
-            _dict['signal_to_noise_ratio'] = self.signal_to_noise_ratio
-        if hasattr(self, 'speech_ratio') and self.speech_ratio is not None:
-            _dict['speech_ratio'] = self.speech_ratio
-        if hasattr(
-                self,
-                'high_frequency_loss') and self.high_frequency_loss is not None:
-            _dict['high_frequency_loss'] = self.high_frequency_loss
-        if hasattr(self, 'direct_current_offset'
-                  ) and self.direct_current_offset is not None:
-            _dict['direct_current_offset'] = [
-                x.to_dict() for x in self.direct_current_offset
-            ]
-        if hasattr(self, 'clipping_rate') and self.clipping_rate is not None:
-            _dict['clipping_rate'] = [x.to_dict() for x in self.clipping_rate]
-        if hasattr(self, 'speech_level') and self.speech_level is not None:
-            _dict['speech_level'] = [x.to_dict() for x in self.speech_level]
-        if hasattr(self,
-                   'non_speech_level') and self.non_speech_level is not None:
-            _dict['non_speech_level'] = [
-                x.to_dict() for x in self.non_speech_level
-            ]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioMetricsDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioMetricsDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioMetricsDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AudioMetricsHistogramBin():
+
+class AudioMetricsHistogramBin(Model):
     """
     A bin with defined boundaries that indicates the number of values in a range of signal
     characteristics for a histogram. The first and last bins of a histogram are the
@@ -5025,6 +4696,14 @@ class AudioMetricsHistogramBin():
     :attr int count: The number of values in the bin of the histogram.
     """
 
+    __slots__ = ('begin', 'end', 'count')
+
+    _fields = (
+        ModelField('begin', required=True),
+        ModelField('end', required=True),
+        ModelField('count', required=True),
+    )
+
     def __init__(self, begin: float, end: float, count: int) -> None:
         """
         Initialize a AudioMetricsHistogramBin object.
@@ -5037,66 +4716,8 @@ class AudioMetricsHistogramBin():
         self.end = end
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioMetricsHistogramBin':
-        """Initialize a AudioMetricsHistogramBin object from a json dictionary."""
-        args = {}
-        if 'begin' in _dict:
-            args['begin'] = _dict.get('begin')
-        else:
-            raise ValueError(
-                'Required property \'begin\' not present in AudioMetricsHistogramBin JSON'
-            )
-        if 'end' in _dict:
-            args['end'] = _dict.get('end')
-        else:
-            raise ValueError(
-                'Required property \'end\' not present in AudioMetricsHistogramBin JSON'
-            )
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        else:
-            raise ValueError(
-                'Required property \'count\' not present in AudioMetricsHistogramBin JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioMetricsHistogramBin object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'begin') and self.begin is not None:
-            _dict['begin'] = self.begin
-        if hasattr(self, 'end') and self.end is not None:
-            _dict['end'] = self.end
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioMetricsHistogramBin object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioMetricsHistogramBin') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioMetricsHistogramBin') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class AudioResource():
+
+class AudioResource(Model):
     """
     Information about an audio resource from a custom acoustic model.
 
@@ -5121,6 +4742,15 @@ class AudioResource():
           invalid.
     """
 
+    __slots__ = ('duration', 'name', 'details', 'status')
+
+    _fields = (
+        ModelField('duration', required=True),
+        ModelField('name', required=True),
+        ModelField('details', 'model', 'AudioDetails', required=True),
+        ModelField('status', required=True),
+    )
+
     def __init__(self, duration: int, name: str, details: 'AudioDetails',
                  status: str) -> None:
         """
@@ -5151,71 +4781,6 @@ class AudioResource():
         self.details = details
         self.status = status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioResource':
-        """Initialize a AudioResource object from a json dictionary."""
-        args = {}
-        if 'duration' in _dict:
-            args['duration'] = _dict.get('duration')
-        else:
-            raise ValueError(
-                'Required property \'duration\' not present in AudioResource JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in AudioResource JSON')
-        if 'details' in _dict:
-            args['details'] = AudioDetails.from_dict(_dict.get('details'))
-        else:
-            raise ValueError(
-                'Required property \'details\' not present in AudioResource JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in AudioResource JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioResource object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'duration') and self.duration is not None:
-            _dict['duration'] = self.duration
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'details') and self.details is not None:
-            _dict['details'] = self.details.to_dict()
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioResource object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioResource') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioResource') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the audio resource:
@@ -5234,7 +4799,7 @@ class AudioResource():
         INVALID = 'invalid'
 
 
-class AudioResources():
+class AudioResources(Model):
     """
     Information about the audio resources from a custom acoustic model.
 
@@ -5247,6 +4812,13 @@ class AudioResources():
           array is empty if the custom model has no audio resources.
     """
 
+    __slots__ = ('total_minutes_of_audio', 'audio')
+
+    _fields = (
+        ModelField('total_minutes_of_audio', required=True),
+        ModelField('audio', 'list', 'AudioResource', required=True),
+    )
+
     def __init__(self, total_minutes_of_audio: float,
                  audio: List['AudioResource']) -> None:
         """
@@ -5263,61 +4835,8 @@ class AudioResources():
         self.total_minutes_of_audio = total_minutes_of_audio
         self.audio = audio
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AudioResources':
-        """Initialize a AudioResources object from a json dictionary."""
-        args = {}
-        if 'total_minutes_of_audio' in _dict:
-            args['total_minutes_of_audio'] = _dict.get('total_minutes_of_audio')
-        else:
-            raise ValueError(
-                'Required property \'total_minutes_of_audio\' not present in AudioResources JSON'
-            )
-        if 'audio' in _dict:
-            args['audio'] = [
-                AudioResource.from_dict(x) for x in _dict.get('audio')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'audio\' not present in AudioResources JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AudioResources object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'total_minutes_of_audio'
-                  ) and self.total_minutes_of_audio is not None:
-            _dict['total_minutes_of_audio'] = self.total_minutes_of_audio
-        if hasattr(self, 'audio') and self.audio is not None:
-            _dict['audio'] = [x.to_dict() for x in self.audio]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AudioResources object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AudioResources') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AudioResources') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Corpora():
+
+class Corpora(Model):
     """
     Information about the corpora from a custom language model.
 
@@ -5326,6 +4845,12 @@ class Corpora():
           custom model has no corpora.
     """
 
+    __slots__ = ('corpora',)
+
+    _fields = (
+        ModelField('corpora', 'list', 'Corpus', required=True),
+    )
+
     def __init__(self, corpora: List['Corpus']) -> None:
         """
         Initialize a Corpora object.
@@ -5336,51 +4861,8 @@ class Corpora():
         """
         self.corpora = corpora
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Corpora':
-        """Initialize a Corpora object from a json dictionary."""
-        args = {}
-        if 'corpora' in _dict:
-            args['corpora'] = [
-                Corpus.from_dict(x) for x in _dict.get('corpora')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'corpora\' not present in Corpora JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Corpora object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'corpora') and self.corpora is not None:
-            _dict['corpora'] = [x.to_dict() for x in self.corpora]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Corpora object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Corpora') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Corpora') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Corpus():
+
+class Corpus(Model):
     """
     Information about a corpus from a custom language model.
 
@@ -5404,6 +4886,17 @@ class Corpus():
           corpus again by setting the 'allow_overwrite' flag to 'true'`.
     """
 
+    __slots__ = ('name', 'total_words', 'out_of_vocabulary_words', 'status',
+                 'error')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('total_words', required=True),
+        ModelField('out_of_vocabulary_words', required=True),
+        ModelField('status', required=True),
+        ModelField('error'),
+    )
+
     def __init__(self,
                  name: str,
                  total_words: int,
@@ -5439,75 +4932,6 @@ class Corpus():
         self.status = status
         self.error = error
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Corpus':
-        """Initialize a Corpus object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Corpus JSON')
-        if 'total_words' in _dict:
-            args['total_words'] = _dict.get('total_words')
-        else:
-            raise ValueError(
-                'Required property \'total_words\' not present in Corpus JSON')
-        if 'out_of_vocabulary_words' in _dict:
-            args['out_of_vocabulary_words'] = _dict.get(
-                'out_of_vocabulary_words')
-        else:
-            raise ValueError(
-                'Required property \'out_of_vocabulary_words\' not present in Corpus JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in Corpus JSON')
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Corpus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'total_words') and self.total_words is not None:
-            _dict['total_words'] = self.total_words
-        if hasattr(self, 'out_of_vocabulary_words'
-                  ) and self.out_of_vocabulary_words is not None:
-            _dict['out_of_vocabulary_words'] = self.out_of_vocabulary_words
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Corpus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Corpus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Corpus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the corpus:
@@ -5523,7 +4947,7 @@ class Corpus():
         UNDETERMINED = 'undetermined'
 
 
-class CustomWord():
+class CustomWord(Model):
     """
     Information about a word that is to be added to a custom language model.
 
@@ -5554,6 +4978,14 @@ class CustomWord():
           spelling in corpora training data.
     """
 
+    __slots__ = ('word', 'sounds_like', 'display_as')
+
+    _fields = (
+        ModelField('word'),
+        ModelField('sounds_like'),
+        ModelField('display_as'),
+    )
+
     def __init__(self,
                  *,
                  word: str = None,
@@ -5592,54 +5024,8 @@ class CustomWord():
         self.sounds_like = sounds_like
         self.display_as = display_as
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CustomWord':
-        """Initialize a CustomWord object from a json dictionary."""
-        args = {}
-        if 'word' in _dict:
-            args['word'] = _dict.get('word')
-        if 'sounds_like' in _dict:
-            args['sounds_like'] = _dict.get('sounds_like')
-        if 'display_as' in _dict:
-            args['display_as'] = _dict.get('display_as')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CustomWord object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'word') and self.word is not None:
-            _dict['word'] = self.word
-        if hasattr(self, 'sounds_like') and self.sounds_like is not None:
-            _dict['sounds_like'] = self.sounds_like
-        if hasattr(self, 'display_as') and self.display_as is not None:
-            _dict['display_as'] = self.display_as
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CustomWord object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CustomWord') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CustomWord') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Grammar():
+
+class Grammar(Model):
     """
     Information about a grammar from a custom language model.
 
@@ -5659,6 +5045,15 @@ class Grammar():
           flag to 'true'.`.
     """
 
+    __slots__ = ('name', 'out_of_vocabulary_words', 'status', 'error')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('out_of_vocabulary_words', required=True),
+        ModelField('status', required=True),
+        ModelField('error'),
+    )
+
     def __init__(self,
                  name: str,
                  out_of_vocabulary_words: int,
@@ -5689,68 +5084,6 @@ class Grammar():
         self.status = status
         self.error = error
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Grammar':
-        """Initialize a Grammar object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Grammar JSON')
-        if 'out_of_vocabulary_words' in _dict:
-            args['out_of_vocabulary_words'] = _dict.get(
-                'out_of_vocabulary_words')
-        else:
-            raise ValueError(
-                'Required property \'out_of_vocabulary_words\' not present in Grammar JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in Grammar JSON')
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Grammar object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'out_of_vocabulary_words'
-                  ) and self.out_of_vocabulary_words is not None:
-            _dict['out_of_vocabulary_words'] = self.out_of_vocabulary_words
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Grammar object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Grammar') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Grammar') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The status of the grammar:
@@ -5766,7 +5099,7 @@ class Grammar():
         UNDETERMINED = 'undetermined'
 
 
-class Grammars():
+class Grammars(Model):
     """
     Information about the grammars from a custom language model.
 
@@ -5775,6 +5108,12 @@ class Grammars():
           custom model has no grammars.
     """
 
+    __slots__ = ('grammars',)
+
+    _fields = (
+        ModelField('grammars', 'list', 'Grammar', required=True),
+    )
+
     def __init__(self, grammars: List['Grammar']) -> None:
         """
         Initialize a Grammars object.
@@ -5785,51 +5124,8 @@ class Grammars():
         """
         self.grammars = grammars
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Grammars':
-        """Initialize a Grammars object from a json dictionary."""
-        args = {}
-        if 'grammars' in _dict:
-            args['grammars'] = [
-                Grammar.from_dict(x) for x in _dict.get('grammars')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'grammars\' not present in Grammars JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Grammars object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'grammars') and self.grammars is not None:
-            _dict['grammars'] = [x.to_dict() for x in self.grammars]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Grammars object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Grammars') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Grammars') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class KeywordResult():
+
+class KeywordResult(Model):
     """
     Information about a match for a keyword from speech recognition results.
 
@@ -5841,6 +5137,15 @@ class KeywordResult():
           0.0 to 1.0.
     """
 
+    __slots__ = ('normalized_text', 'start_time', 'end_time', 'confidence')
+
+    _fields = (
+        ModelField('normalized_text', required=True),
+        ModelField('start_time', required=True),
+        ModelField('end_time', required=True),
+        ModelField('confidence', required=True),
+    )
+
     def __init__(self, normalized_text: str, start_time: float, end_time: float,
                  confidence: float) -> None:
         """
@@ -5858,75 +5163,8 @@ class KeywordResult():
         self.end_time = end_time
         self.confidence = confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'KeywordResult':
-        """Initialize a KeywordResult object from a json dictionary."""
-        args = {}
-        if 'normalized_text' in _dict:
-            args['normalized_text'] = _dict.get('normalized_text')
-        else:
-            raise ValueError(
-                'Required property \'normalized_text\' not present in KeywordResult JSON'
-            )
-        if 'start_time' in _dict:
-            args['start_time'] = _dict.get('start_time')
-        else:
-            raise ValueError(
-                'Required property \'start_time\' not present in KeywordResult JSON'
-            )
-        if 'end_time' in _dict:
-            args['end_time'] = _dict.get('end_time')
-        else:
-            raise ValueError(
-                'Required property \'end_time\' not present in KeywordResult JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in KeywordResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a KeywordResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'normalized_text') and self.normalized_text is not None:
-            _dict['normalized_text'] = self.normalized_text
-        if hasattr(self, 'start_time') and self.start_time is not None:
-            _dict['start_time'] = self.start_time
-        if hasattr(self, 'end_time') and self.end_time is not None:
-            _dict['end_time'] = self.end_time
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this KeywordResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'KeywordResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'KeywordResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class LanguageModel():
+
+class LanguageModel(Model):
     """
     Information about an existing custom language model.
 
@@ -5992,6 +5230,27 @@ class LanguageModel():
           parameter.
     """
 
+    __slots__ = ('customization_id', 'created', 'updated', 'language',
+                 'dialect', 'versions', 'owner', 'name', 'description',
+                 'base_model_name', 'status', 'progress', 'error', 'warnings')
+
+    _fields = (
+        ModelField('customization_id', required=True),
+        ModelField('created'),
+        ModelField('updated'),
+        ModelField('language'),
+        ModelField('dialect'),
+        ModelField('versions'),
+        ModelField('owner'),
+        ModelField('name'),
+        ModelField('description'),
+        ModelField('base_model_name'),
+        ModelField('status'),
+        ModelField('progress'),
+        ModelField('error'),
+        ModelField('warnings'),
+    )
+
     def __init__(self,
                  customization_id: str,
                  *,
@@ -6093,102 +5352,6 @@ class LanguageModel():
         self.error = error
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LanguageModel':
-        """Initialize a LanguageModel object from a json dictionary."""
-        args = {}
-        if 'customization_id' in _dict:
-            args['customization_id'] = _dict.get('customization_id')
-        else:
-            raise ValueError(
-                'Required property \'customization_id\' not present in LanguageModel JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = _dict.get('created')
-        if 'updated' in _dict:
-            args['updated'] = _dict.get('updated')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'dialect' in _dict:
-            args['dialect'] = _dict.get('dialect')
-        if 'versions' in _dict:
-            args['versions'] = _dict.get('versions')
-        if 'owner' in _dict:
-            args['owner'] = _dict.get('owner')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'base_model_name' in _dict:
-            args['base_model_name'] = _dict.get('base_model_name')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'progress' in _dict:
-            args['progress'] = _dict.get('progress')
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        if 'warnings' in _dict:
-            args['warnings'] = _dict.get('warnings')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LanguageModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'customization_id') and self.customization_id is not None:
-            _dict['customization_id'] = self.customization_id
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = self.created
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = self.updated
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'dialect') and self.dialect is not None:
-            _dict['dialect'] = self.dialect
-        if hasattr(self, 'versions') and self.versions is not None:
-            _dict['versions'] = self.versions
-        if hasattr(self, 'owner') and self.owner is not None:
-            _dict['owner'] = self.owner
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self,
-                   'base_model_name') and self.base_model_name is not None:
-            _dict['base_model_name'] = self.base_model_name
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'progress') and self.progress is not None:
-            _dict['progress'] = self.progress
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = self.warnings
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LanguageModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LanguageModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LanguageModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the custom language model:
@@ -6210,7 +5373,7 @@ class LanguageModel():
         FAILED = 'failed'
 
 
-class LanguageModels():
+class LanguageModels(Model):
     """
     Information about existing custom language models.
 
@@ -6221,6 +5384,12 @@ class LanguageModels():
           language.
     """
 
+    __slots__ = ('customizations',)
+
+    _fields = (
+        ModelField('customizations', 'list', 'LanguageModel', required=True),
+    )
+
     def __init__(self, customizations: List['LanguageModel']) -> None:
         """
         Initialize a LanguageModels object.
@@ -6233,52 +5402,8 @@ class LanguageModels():
         """
         self.customizations = customizations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'LanguageModels':
-        """Initialize a LanguageModels object from a json dictionary."""
-        args = {}
-        if 'customizations' in _dict:
-            args['customizations'] = [
-                LanguageModel.from_dict(x) for x in _dict.get('customizations')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'customizations\' not present in LanguageModels JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a LanguageModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'customizations') and self.customizations is not None:
-            _dict['customizations'] = [x.to_dict() for x in self.customizations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this LanguageModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'LanguageModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'LanguageModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ProcessedAudio():
+
+class ProcessedAudio(Model):
     """
     Detailed timing information about the service's processing of the input audio.
 
@@ -6304,6 +5429,16 @@ class ProcessedAudio():
           fields have identical values when the service has finished processing all audio.
     """
 
+    __slots__ = ('received', 'seen_by_engine', 'transcription',
+                 'speaker_labels')
+
+    _fields = (
+        ModelField('received', required=True),
+        ModelField('seen_by_engine', required=True),
+        ModelField('transcription', required=True),
+        ModelField('speaker_labels'),
+    )
+
     def __init__(self,
                  received: float,
                  seen_by_engine: float,
@@ -6342,70 +5477,8 @@ class ProcessedAudio():
         self.transcription = transcription
         self.speaker_labels = speaker_labels
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ProcessedAudio':
-        """Initialize a ProcessedAudio object from a json dictionary."""
-        args = {}
-        if 'received' in _dict:
-            args['received'] = _dict.get('received')
-        else:
-            raise ValueError(
-                'Required property \'received\' not present in ProcessedAudio JSON'
-            )
-        if 'seen_by_engine' in _dict:
-            args['seen_by_engine'] = _dict.get('seen_by_engine')
-        else:
-            raise ValueError(
-                'Required property \'seen_by_engine\' not present in ProcessedAudio JSON'
-            )
-        if 'transcription' in _dict:
-            args['transcription'] = _dict.get('transcription')
-        else:
-            raise ValueError(
-                'Required property \'transcription\' not present in ProcessedAudio JSON'
-            )
-        if 'speaker_labels' in _dict:
-            args['speaker_labels'] = _dict.get('speaker_labels')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ProcessedAudio object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'received') and self.received is not None:
-            _dict['received'] = self.received
-        if hasattr(self, 'seen_by_engine') and self.seen_by_engine is not None:
-            _dict['seen_by_engine'] = self.seen_by_engine
-        if hasattr(self, 'transcription') and self.transcription is not None:
-            _dict['transcription'] = self.transcription
-        if hasattr(self, 'speaker_labels') and self.speaker_labels is not None:
-            _dict['speaker_labels'] = self.speaker_labels
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ProcessedAudio object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ProcessedAudio') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ProcessedAudio') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ProcessingMetrics():
+
+class ProcessingMetrics(Model):
     """
     If processing metrics are requested, information about the service's processing of the
     input audio. Processing metrics are not available with the synchronous [Recognize
@@ -6433,6 +5506,15 @@ class ProcessingMetrics():
           different results if necessary.
     """
 
+    __slots__ = ('processed_audio', 'wall_clock_since_first_byte_received',
+                 'periodic')
+
+    _fields = (
+        ModelField('processed_audio', 'model', 'ProcessedAudio', required=True),
+        ModelField('wall_clock_since_first_byte_received', required=True),
+        ModelField('periodic', required=True),
+    )
+
     def __init__(self, processed_audio: 'ProcessedAudio',
                  wall_clock_since_first_byte_received: float,
                  periodic: bool) -> None:
@@ -6464,71 +5546,8 @@ class ProcessingMetrics():
         self.wall_clock_since_first_byte_received = wall_clock_since_first_byte_received
         self.periodic = periodic
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ProcessingMetrics':
-        """Initialize a ProcessingMetrics object from a json dictionary."""
-        args = {}
-        if 'processed_audio' in _dict:
-            args['processed_audio'] = ProcessedAudio.from_dict(
-                _dict.get('processed_audio'))
-        else:
-            raise ValueError(
-                'Required property \'processed_audio\' not present in ProcessingMetrics JSON'
-            )
-        if 'wall_clock_since_first_byte_received' in _dict:
-            args['wall_clock_since_first_byte_received'] = _dict.get(
-                'wall_clock_since_first_byte_received')
-        else:
-            raise ValueError(
-                'Required property \'wall_clock_since_first_byte_received\' not present in ProcessingMetrics JSON'
-            )
-        if 'periodic' in _dict:
-            args['periodic'] = _dict.get('periodic')
-        else:
-            raise ValueError(
-                'Required property \'periodic\' not present in ProcessingMetrics JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ProcessingMetrics object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'processed_audio') and self.processed_audio is not None:
-            _dict['processed_audio'] = self.processed_audio.to_dict()
-        if hasattr(self, 'wall_clock_since_first_byte_received'
-                  ) and self.wall_clock_since_first_byte_received is not None:
-            _dict[
-                'wall_clock_since_first_byte_received'] = self.wall_clock_since_first_byte_received
-        if hasattr(self, 'periodic') and self.periodic is not None:
-            _dict['periodic'] = self.periodic
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ProcessingMetrics object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ProcessingMetrics') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ProcessingMetrics') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RecognitionJob():
+
+class RecognitionJob(Model):
     """
     Information about a current asynchronous speech recognition job.
 
@@ -6569,6 +5588,20 @@ class RecognitionJob():
           [Create a job](#createjob) method.
     """
 
+    __slots__ = ('id', 'status', 'created', 'updated', 'url', 'user_token',
+                 'results', 'warnings')
+
+    _fields = (
+        ModelField('id', required=True),
+        ModelField('status', required=True),
+        ModelField('created', required=True),
+        ModelField('updated'),
+        ModelField('url'),
+        ModelField('user_token'),
+        ModelField('results', 'list', 'SpeechRecognitionResults'),
+        ModelField('warnings'),
+    )
+
     def __init__(self,
                  id: str,
                  status: str,
@@ -6629,86 +5662,6 @@ class RecognitionJob():
         self.results = results
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RecognitionJob':
-        """Initialize a RecognitionJob object from a json dictionary."""
-        args = {}
-        if 'id' in _dict:
-            args['id'] = _dict.get('id')
-        else:
-            raise ValueError(
-                'Required property \'id\' not present in RecognitionJob JSON')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in RecognitionJob JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = _dict.get('created')
-        else:
-            raise ValueError(
-                'Required property \'created\' not present in RecognitionJob JSON'
-            )
-        if 'updated' in _dict:
-            args['updated'] = _dict.get('updated')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        if 'user_token' in _dict:
-            args['user_token'] = _dict.get('user_token')
-        if 'results' in _dict:
-            args['results'] = [
-                SpeechRecognitionResults.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        if 'warnings' in _dict:
-            args['warnings'] = _dict.get('warnings')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RecognitionJob object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'id') and self.id is not None:
-            _dict['id'] = self.id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = self.created
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = self.updated
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'user_token') and self.user_token is not None:
-            _dict['user_token'] = self.user_token
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = self.warnings
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RecognitionJob object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RecognitionJob') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RecognitionJob') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the job:
@@ -6729,7 +5682,7 @@ class RecognitionJob():
         FAILED = 'failed'
 
 
-class RecognitionJobs():
+class RecognitionJobs(Model):
     """
     Information about current asynchronous speech recognition jobs.
 
@@ -6738,6 +5691,12 @@ class RecognitionJobs():
           if the user has no current jobs.
     """
 
+    __slots__ = ('recognitions',)
+
+    _fields = (
+        ModelField('recognitions', 'list', 'RecognitionJob', required=True),
+    )
+
     def __init__(self, recognitions: List['RecognitionJob']) -> None:
         """
         Initialize a RecognitionJobs object.
@@ -6748,52 +5707,8 @@ class RecognitionJobs():
         """
         self.recognitions = recognitions
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RecognitionJobs':
-        """Initialize a RecognitionJobs object from a json dictionary."""
-        args = {}
-        if 'recognitions' in _dict:
-            args['recognitions'] = [
-                RecognitionJob.from_dict(x) for x in _dict.get('recognitions')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'recognitions\' not present in RecognitionJobs JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RecognitionJobs object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'recognitions') and self.recognitions is not None:
-            _dict['recognitions'] = [x.to_dict() for x in self.recognitions]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RecognitionJobs object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RecognitionJobs') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RecognitionJobs') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class RegisterStatus():
+
+class RegisterStatus(Model):
     """
     Information about a request to register a callback for asynchronous speech
     recognition.
@@ -6805,6 +5720,13 @@ class RegisterStatus():
     :attr str url: The callback URL that is successfully registered.
     """
 
+    __slots__ = ('status', 'url')
+
+    _fields = (
+        ModelField('status', required=True),
+        ModelField('url', required=True),
+    )
+
     def __init__(self, status: str, url: str) -> None:
         """
         Initialize a RegisterStatus object.
@@ -6818,55 +5740,6 @@ class RegisterStatus():
         self.status = status
         self.url = url
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'RegisterStatus':
-        """Initialize a RegisterStatus object from a json dictionary."""
-        args = {}
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in RegisterStatus JSON'
-            )
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in RegisterStatus JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a RegisterStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this RegisterStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'RegisterStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'RegisterStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         The current status of the job:
@@ -6878,7 +5751,7 @@ class RegisterStatus():
         ALREADY_CREATED = 'already created'
 
 
-class SpeakerLabelsResult():
+class SpeakerLabelsResult(Model):
     """
     Information about the speakers from speech recognition results.
 
@@ -6899,6 +5772,16 @@ class SpeakerLabelsResult():
           `false` means that the service might send further updates to the results.
     """
 
+    __slots__ = ('from_', 'to', 'speaker', 'confidence', 'final')
+
+    _fields = (
+        ModelField('from_', key='from', required=True),
+        ModelField('to', required=True),
+        ModelField('speaker', required=True),
+        ModelField('confidence', required=True),
+        ModelField('final', required=True),
+    )
+
     def __init__(self, from_: float, to: float, speaker: int, confidence: float,
                  final: bool) -> None:
         """
@@ -6927,82 +5810,8 @@ class SpeakerLabelsResult():
         self.confidence = confidence
         self.final = final
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeakerLabelsResult':
-        """Initialize a SpeakerLabelsResult object from a json dictionary."""
-        args = {}
-        if 'from' in _dict:
-            args['from_'] = _dict.get('from')
-        else:
-            raise ValueError(
-                'Required property \'from\' not present in SpeakerLabelsResult JSON'
-            )
-        if 'to' in _dict:
-            args['to'] = _dict.get('to')
-        else:
-            raise ValueError(
-                'Required property \'to\' not present in SpeakerLabelsResult JSON'
-            )
-        if 'speaker' in _dict:
-            args['speaker'] = _dict.get('speaker')
-        else:
-            raise ValueError(
-                'Required property \'speaker\' not present in SpeakerLabelsResult JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in SpeakerLabelsResult JSON'
-            )
-        if 'final' in _dict:
-            args['final'] = _dict.get('final')
-        else:
-            raise ValueError(
-                'Required property \'final\' not present in SpeakerLabelsResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeakerLabelsResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'from_') and self.from_ is not None:
-            _dict['from'] = self.from_
-        if hasattr(self, 'to') and self.to is not None:
-            _dict['to'] = self.to
-        if hasattr(self, 'speaker') and self.speaker is not None:
-            _dict['speaker'] = self.speaker
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'final') and self.final is not None:
-            _dict['final'] = self.final
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeakerLabelsResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeakerLabelsResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeakerLabelsResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeechModel():
+
+class SpeechModel(Model):
     """
     Information about an available language model.
 
@@ -7017,6 +5826,19 @@ class SpeechModel():
     :attr str description: A brief description of the model.
     """
 
+    __slots__ = ('name', 'language', 'rate', 'url', 'supported_features',
+                 'description')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('language', required=True),
+        ModelField('rate', required=True),
+        ModelField('url', required=True),
+        ModelField('supported_features', 'model', 'SupportedFeatures',
+                   required=True),
+        ModelField('description', required=True),
+    )
+
     def __init__(self, name: str, language: str, rate: int, url: str,
                  supported_features: 'SupportedFeatures',
                  description: str) -> None:
@@ -7041,90 +5863,8 @@ class SpeechModel():
         self.supported_features = supported_features
         self.description = description
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeechModel':
-        """Initialize a SpeechModel object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in SpeechModel JSON')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in SpeechModel JSON'
-            )
-        if 'rate' in _dict:
-            args['rate'] = _dict.get('rate')
-        else:
-            raise ValueError(
-                'Required property \'rate\' not present in SpeechModel JSON')
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in SpeechModel JSON')
-        if 'supported_features' in _dict:
-            args['supported_features'] = SupportedFeatures.from_dict(
-                _dict.get('supported_features'))
-        else:
-            raise ValueError(
-                'Required property \'supported_features\' not present in SpeechModel JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in SpeechModel JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeechModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'rate') and self.rate is not None:
-            _dict['rate'] = self.rate
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(
-                self,
-                'supported_features') and self.supported_features is not None:
-            _dict['supported_features'] = self.supported_features.to_dict()
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeechModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeechModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeechModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeechModels():
+
+class SpeechModels(Model):
     """
     Information about the available language models.
 
@@ -7132,6 +5872,12 @@ class SpeechModels():
           information about each available model.
     """
 
+    __slots__ = ('models',)
+
+    _fields = (
+        ModelField('models', 'list', 'SpeechModel', required=True),
+    )
+
     def __init__(self, models: List['SpeechModel']) -> None:
         """
         Initialize a SpeechModels object.
@@ -7141,51 +5887,8 @@ class SpeechModels():
         """
         self.models = models
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeechModels':
-        """Initialize a SpeechModels object from a json dictionary."""
-        args = {}
-        if 'models' in _dict:
-            args['models'] = [
-                SpeechModel.from_dict(x) for x in _dict.get('models')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'models\' not present in SpeechModels JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeechModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'models') and self.models is not None:
-            _dict['models'] = [x.to_dict() for x in self.models]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeechModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeechModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeechModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeechRecognitionAlternative():
+
+class SpeechRecognitionAlternative(Model):
     """
     An alternative transcript from speech recognition results.
 
@@ -7206,6 +5909,15 @@ class SpeechRecognitionAlternative():
           best alternative and only with results marked as final.
     """
 
+    __slots__ = ('transcript', 'confidence', 'timestamps', 'word_confidence')
+
+    _fields = (
+        ModelField('transcript', required=True),
+        ModelField('confidence'),
+        ModelField('timestamps'),
+        ModelField('word_confidence'),
+    )
+
     def __init__(self,
                  transcript: str,
                  *,
@@ -7236,63 +5948,8 @@ class SpeechRecognitionAlternative():
         self.timestamps = timestamps
         self.word_confidence = word_confidence
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeechRecognitionAlternative':
-        """Initialize a SpeechRecognitionAlternative object from a json dictionary."""
-        args = {}
-        if 'transcript' in _dict:
-            args['transcript'] = _dict.get('transcript')
-        else:
-            raise ValueError(
-                'Required property \'transcript\' not present in SpeechRecognitionAlternative JSON'
-            )
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        if 'timestamps' in _dict:
-            args['timestamps'] = _dict.get('timestamps')
-        if 'word_confidence' in _dict:
-            args['word_confidence'] = _dict.get('word_confidence')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeechRecognitionAlternative object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'transcript') and self.transcript is not None:
-            _dict['transcript'] = self.transcript
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'timestamps') and self.timestamps is not None:
-            _dict['timestamps'] = self.timestamps
-        if hasattr(self,
-                   'word_confidence') and self.word_confidence is not None:
-            _dict['word_confidence'] = self.word_confidence
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeechRecognitionAlternative object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeechRecognitionAlternative') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeechRecognitionAlternative') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeechRecognitionResult():
+
+class SpeechRecognitionResult(Model):
     """
     Component results for a speech recognition request.
 
@@ -7324,6 +5981,18 @@ class SpeechRecognitionResult():
           * `silence` - A pause or silence that is at least as long as the pause interval.
     """
 
+    __slots__ = ('final', 'alternatives', 'keywords_result',
+                 'word_alternatives', 'end_of_utterance')
+
+    _fields = (
+        ModelField('final', required=True),
+        ModelField('alternatives', 'list', 'SpeechRecognitionAlternative',
+                   required=True),
+        ModelField('keywords_result'),
+        ModelField('word_alternatives', 'list', 'WordAlternativeResults'),
+        ModelField('end_of_utterance'),
+    )
+
     def __init__(self,
                  final: bool,
                  alternatives: List['SpeechRecognitionAlternative'],
@@ -7370,79 +6039,6 @@ class SpeechRecognitionResult():
         self.word_alternatives = word_alternatives
         self.end_of_utterance = end_of_utterance
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeechRecognitionResult':
-        """Initialize a SpeechRecognitionResult object from a json dictionary."""
-        args = {}
-        if 'final' in _dict:
-            args['final'] = _dict.get('final')
-        else:
-            raise ValueError(
-                'Required property \'final\' not present in SpeechRecognitionResult JSON'
-            )
-        if 'alternatives' in _dict:
-            args['alternatives'] = [
-                SpeechRecognitionAlternative.from_dict(x)
-                for x in _dict.get('alternatives')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'alternatives\' not present in SpeechRecognitionResult JSON'
-            )
-        if 'keywords_result' in _dict:
-            args['keywords_result'] = _dict.get('keywords_result')
-        if 'word_alternatives' in _dict:
-            args['word_alternatives'] = [
-                WordAlternativeResults.from_dict(x)
-                for x in _dict.get('word_alternatives')
-            ]
-        if 'end_of_utterance' in _dict:
-            args['end_of_utterance'] = _dict.get('end_of_utterance')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeechRecognitionResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'final') and self.final is not None:
-            _dict['final'] = self.final
-        if hasattr(self, 'alternatives') and self.alternatives is not None:
-            _dict['alternatives'] = [x.to_dict() for x in self.alternatives]
-        if hasattr(self,
-                   'keywords_result') and self.keywords_result is not None:
-            _dict['keywords_result'] = self.keywords_result
-        if hasattr(self,
-                   'word_alternatives') and self.word_alternatives is not None:
-            _dict['word_alternatives'] = [
-                x.to_dict() for x in self.word_alternatives
-            ]
-        if hasattr(self,
-                   'end_of_utterance') and self.end_of_utterance is not None:
-            _dict['end_of_utterance'] = self.end_of_utterance
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeechRecognitionResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeechRecognitionResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeechRecognitionResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class EndOfUtteranceEnum(str, Enum):
         """
         If the `split_transcript_at_phrase_end` parameter is `true`, describes the reason
@@ -7462,7 +6058,7 @@ class SpeechRecognitionResult():
         SILENCE = 'silence'
 
 
-class SpeechRecognitionResults():
+class SpeechRecognitionResults(Model):
     """
     The complete results for a speech recognition request.
 
@@ -7504,6 +6100,18 @@ class SpeechRecognitionResults():
           In both cases, the request succeeds despite the warnings.
     """
 
+    __slots__ = ('results', 'result_index', 'speaker_labels',
+                 'processing_metrics', 'audio_metrics', 'warnings')
+
+    _fields = (
+        ModelField('results', 'list', 'SpeechRecognitionResult'),
+        ModelField('result_index'),
+        ModelField('speaker_labels', 'list', 'SpeakerLabelsResult'),
+        ModelField('processing_metrics', 'model', 'ProcessingMetrics'),
+        ModelField('audio_metrics', 'model', 'AudioMetrics'),
+        ModelField('warnings'),
+    )
+
     def __init__(self,
                  *,
                  results: List['SpeechRecognitionResult'] = None,
@@ -7561,76 +6169,8 @@ class SpeechRecognitionResults():
         self.audio_metrics = audio_metrics
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeechRecognitionResults':
-        """Initialize a SpeechRecognitionResults object from a json dictionary."""
-        args = {}
-        if 'results' in _dict:
-            args['results'] = [
-                SpeechRecognitionResult.from_dict(x)
-                for x in _dict.get('results')
-            ]
-        if 'result_index' in _dict:
-            args['result_index'] = _dict.get('result_index')
-        if 'speaker_labels' in _dict:
-            args['speaker_labels'] = [
-                SpeakerLabelsResult.from_dict(x)
-                for x in _dict.get('speaker_labels')
-            ]
-        if 'processing_metrics' in _dict:
-            args['processing_metrics'] = ProcessingMetrics.from_dict(
-                _dict.get('processing_metrics'))
-        if 'audio_metrics' in _dict:
-            args['audio_metrics'] = AudioMetrics.from_dict(
-                _dict.get('audio_metrics'))
-        if 'warnings' in _dict:
-            args['warnings'] = _dict.get('warnings')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeechRecognitionResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'results') and self.results is not None:
-            _dict['results'] = [x.to_dict() for x in self.results]
-        if hasattr(self, 'result_index') and self.result_index is not None:
-            _dict['result_index'] = self.result_index
-        if hasattr(self, 'speaker_labels') and self.speaker_labels is not None:
-            _dict['speaker_labels'] = [x.to_dict() for x in self.speaker_labels]
-        if hasattr(
-                self,
-                'processing_metrics') and self.processing_metrics is not None:
-            _dict['processing_metrics'] = self.processing_metrics.to_dict()
-        if hasattr(self, 'audio_metrics') and self.audio_metrics is not None:
-            _dict['audio_metrics'] = self.audio_metrics.to_dict()
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = self.warnings
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeechRecognitionResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeechRecognitionResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeechRecognitionResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SupportedFeatures():
+
+class SupportedFeatures(Model):
     """
     Additional service features that are supported with the model.
 
@@ -7652,6 +6192,14 @@ class SupportedFeatures():
           `low_latency` parameter.
     """
 
+    __slots__ = ('custom_language_model', 'speaker_labels', 'low_latency')
+
+    _fields = (
+        ModelField('custom_language_model', required=True),
+        ModelField('speaker_labels', required=True),
+        ModelField('low_latency'),
+    )
+
     def __init__(self,
                  custom_language_model: bool,
                  speaker_labels: bool,
@@ -7685,63 +6233,8 @@ class SupportedFeatures():
         self.speaker_labels = speaker_labels
         self.low_latency = low_latency
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SupportedFeatures':
-        """Initialize a SupportedFeatures object from a json dictionary."""
-        args = {}
-        if 'custom_language_model' in _dict:
-            args['custom_language_model'] = _dict.get('custom_language_model')
-        else:
-            raise ValueError(
-                'Required property \'custom_language_model\' not present in SupportedFeatures JSON'
-            )
-        if 'speaker_labels' in _dict:
-            args['speaker_labels'] = _dict.get('speaker_labels')
-        else:
-            raise ValueError(
-                'Required property \'speaker_labels\' not present in SupportedFeatures JSON'
-            )
-        if 'low_latency' in _dict:
-            args['low_latency'] = _dict.get('low_latency')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SupportedFeatures object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'custom_language_model'
-                  ) and self.custom_language_model is not None:
-            _dict['custom_language_model'] = self.custom_language_model
-        if hasattr(self, 'speaker_labels') and self.speaker_labels is not None:
-            _dict['speaker_labels'] = self.speaker_labels
-        if hasattr(self, 'low_latency') and self.low_latency is not None:
-            _dict['low_latency'] = self.low_latency
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SupportedFeatures object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SupportedFeatures') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SupportedFeatures') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingResponse():
+
+class TrainingResponse(Model):
     """
     The response from training of a custom language or custom acoustic model.
 
@@ -7752,6 +6245,12 @@ class TrainingResponse():
           to `false`.
     """
 
+    __slots__ = ('warnings',)
+
+    _fields = (
+        ModelField('warnings', 'list', 'TrainingWarning'),
+    )
+
     def __init__(self, *, warnings: List['TrainingWarning'] = None) -> None:
         """
         Initialize a TrainingResponse object.
@@ -7764,48 +6263,8 @@ class TrainingResponse():
         """
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingResponse':
-        """Initialize a TrainingResponse object from a json dictionary."""
-        args = {}
-        if 'warnings' in _dict:
-            args['warnings'] = [
-                TrainingWarning.from_dict(x) for x in _dict.get('warnings')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = [x.to_dict() for x in self.warnings]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingWarning():
+
+class TrainingWarning(Model):
     """
     A warning from training of a custom language or custom acoustic model.
 
@@ -7818,6 +6277,13 @@ class TrainingWarning():
           training.`.
     """
 
+    __slots__ = ('code', 'message')
+
+    _fields = (
+        ModelField('code', required=True),
+        ModelField('message', required=True),
+    )
+
     def __init__(self, code: str, message: str) -> None:
         """
         Initialize a TrainingWarning object.
@@ -7833,56 +6299,6 @@ class TrainingWarning():
         self.code = code
         self.message = message
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingWarning':
-        """Initialize a TrainingWarning object from a json dictionary."""
-        args = {}
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in TrainingWarning JSON'
-            )
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        else:
-            raise ValueError(
-                'Required property \'message\' not present in TrainingWarning JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingWarning object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingWarning object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingWarning') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingWarning') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CodeEnum(str, Enum):
         """
         An identifier for the type of invalid resources listed in the `description` field.
@@ -7893,7 +6309,7 @@ class TrainingWarning():
         INVALID_WORDS = 'invalid_words'
 
 
-class Word():
+class Word(Model):
     """
     Information about a word from a custom language model.
 
@@ -7937,6 +6353,18 @@ class Word():
           describes each of the errors.
     """
 
+    __slots__ = ('word', 'sounds_like', 'display_as', 'count', 'source',
+                 'error')
+
+    _fields = (
+        ModelField('word', required=True),
+        ModelField('sounds_like', required=True),
+        ModelField('display_as', required=True),
+        ModelField('count', required=True),
+        ModelField('source', required=True),
+        ModelField('error', 'list', 'WordError'),
+    )
+
     def __init__(self,
                  word: str,
                  sounds_like: List[str],
@@ -7995,81 +6423,8 @@ class Word():
         self.source = source
         self.error = error
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Word':
-        """Initialize a Word object from a json dictionary."""
-        args = {}
-        if 'word' in _dict:
-            args['word'] = _dict.get('word')
-        else:
-            raise ValueError(
-                'Required property \'word\' not present in Word JSON')
-        if 'sounds_like' in _dict:
-            args['sounds_like'] = _dict.get('sounds_like')
-        else:
-            raise ValueError(
-                'Required property \'sounds_like\' not present in Word JSON')
-        if 'display_as' in _dict:
-            args['display_as'] = _dict.get('display_as')
-        else:
-            raise ValueError(
-                'Required property \'display_as\' not present in Word JSON')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        else:
-            raise ValueError(
-                'Required property \'count\' not present in Word JSON')
-        if 'source' in _dict:
-            args['source'] = _dict.get('source')
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in Word JSON')
-        if 'error' in _dict:
-            args['error'] = [WordError.from_dict(x) for x in _dict.get('error')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Word object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'word') and self.word is not None:
-            _dict['word'] = self.word
-        if hasattr(self, 'sounds_like') and self.sounds_like is not None:
-            _dict['sounds_like'] = self.sounds_like
-        if hasattr(self, 'display_as') and self.display_as is not None:
-            _dict['display_as'] = self.display_as
-        if hasattr(self, 'count') and self.count is not None:
-            _dict['count'] = self.count
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = [x.to_dict() for x in self.error]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Word object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Word') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Word') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordAlternativeResult():
+
+class WordAlternativeResult(Model):
     """
     An alternative hypothesis for a word from speech recognition results.
 
@@ -8078,6 +6433,13 @@ class WordAlternativeResult():
     :attr str word: An alternative hypothesis for a word from the input audio.
     """
 
+    __slots__ = ('confidence', 'word')
+
+    _fields = (
+        ModelField('confidence', required=True),
+        ModelField('word', required=True),
+    )
+
     def __init__(self, confidence: float, word: str) -> None:
         """
         Initialize a WordAlternativeResult object.
@@ -8089,58 +6451,8 @@ class WordAlternativeResult():
         self.confidence = confidence
         self.word = word
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordAlternativeResult':
-        """Initialize a WordAlternativeResult object from a json dictionary."""
-        args = {}
-        if 'confidence' in _dict:
-            args['confidence'] = _dict.get('confidence')
-        else:
-            raise ValueError(
-                'Required property \'confidence\' not present in WordAlternativeResult JSON'
-            )
-        if 'word' in _dict:
-            args['word'] = _dict.get('word')
-        else:
-            raise ValueError(
-                'Required property \'word\' not present in WordAlternativeResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordAlternativeResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'confidence') and self.confidence is not None:
-            _dict['confidence'] = self.confidence
-        if hasattr(self, 'word') and self.word is not None:
-            _dict['word'] = self.word
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WordAlternativeResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordAlternativeResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WordAlternativeResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordAlternativeResults():
+
+class WordAlternativeResults(Model):
     """
     Information about alternative hypotheses for words from speech recognition results.
 
@@ -8152,6 +6464,15 @@ class WordAlternativeResults():
           hypotheses for a word from the input audio.
     """
 
+    __slots__ = ('start_time', 'end_time', 'alternatives')
+
+    _fields = (
+        ModelField('start_time', required=True),
+        ModelField('end_time', required=True),
+        ModelField('alternatives', 'list', 'WordAlternativeResult',
+                   required=True),
+    )
+
     def __init__(self, start_time: float, end_time: float,
                  alternatives: List['WordAlternativeResult']) -> None:
         """
@@ -8168,69 +6489,8 @@ class WordAlternativeResults():
         self.end_time = end_time
         self.alternatives = alternatives
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordAlternativeResults':
-        """Initialize a WordAlternativeResults object from a json dictionary."""
-        args = {}
-        if 'start_time' in _dict:
-            args['start_time'] = _dict.get('start_time')
-        else:
-            raise ValueError(
-                'Required property \'start_time\' not present in WordAlternativeResults JSON'
-            )
-        if 'end_time' in _dict:
-            args['end_time'] = _dict.get('end_time')
-        else:
-            raise ValueError(
-                'Required property \'end_time\' not present in WordAlternativeResults JSON'
-            )
-        if 'alternatives' in _dict:
-            args['alternatives'] = [
-                WordAlternativeResult.from_dict(x)
-                for x in _dict.get('alternatives')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'alternatives\' not present in WordAlternativeResults JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordAlternativeResults object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'start_time') and self.start_time is not None:
-            _dict['start_time'] = self.start_time
-        if hasattr(self, 'end_time') and self.end_time is not None:
-            _dict['end_time'] = self.end_time
-        if hasattr(self, 'alternatives') and self.alternatives is not None:
-            _dict['alternatives'] = [x.to_dict() for x in self.alternatives]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WordAlternativeResults object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordAlternativeResults') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WordAlternativeResults') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WordError():
+
+class WordError(Model):
     """
     An error associated with a word from a custom language model.
 
@@ -8243,6 +6503,12 @@ class WordError():
           '{suggested_string}'."`.
     """
 
+    __slots__ = ('element',)
+
+    _fields = (
+        ModelField('element', required=True),
+    )
+
     def __init__(self, element: str) -> None:
         """
         Initialize a WordError object.
@@ -8257,49 +6523,8 @@ class WordError():
         """
         self.element = element
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WordError':
-        """Initialize a WordError object from a json dictionary."""
-        args = {}
-        if 'element' in _dict:
-            args['element'] = _dict.get('element')
-        else:
-            raise ValueError(
-                'Required property \'element\' not present in WordError JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WordError object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'element') and self.element is not None:
-            _dict['element'] = self.element
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WordError object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WordError') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WordError') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Words():
+
+class Words(Model):
     """
     Information about the words from a custom language model.
 
@@ -8308,6 +6533,12 @@ class Words():
           custom model has no words.
     """
 
+    __slots__ = ('words',)
+
+    _fields = (
+        ModelField('words', 'list', 'Word', required=True),
+    )
+
     def __init__(self, words: List['Word']) -> None:
         """
         Initialize a Words object.
@@ -8317,44 +6548,3 @@ class Words():
                is empty if the custom model has no words.
         """
         self.words = words
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Words':
-        """Initialize a Words object from a json dictionary."""
-        args = {}
-        if 'words' in _dict:
-            args['words'] = [Word.from_dict(x) for x in _dict.get('words')]
-        else:
-            raise ValueError(
-                'Required property \'words\' not present in Words JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Words object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'words') and self.words is not None:
-            _dict['words'] = [x.to_dict() for x in self.words]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Words object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Words') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Words') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
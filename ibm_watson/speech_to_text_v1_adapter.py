@@ -14,9 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ibm_watson.websocket import RecognizeCallback, RecognizeListener, AudioSource
+from ibm_watson.websocket import (RecognizeCallback, RecognizeListener,
+                                  RecognizeStream, RecognitionSession,
+                                  AudioSource, AudioPacer)
+from ibm_watson.websocket.recognition_session import (IDLE_TIMEOUT,
+                                                      KEEP_ALIVE_INTERVAL)
+from ibm_watson.websocket.audio_pacer import BOUNDED, FAST
+from ibm_watson.websocket.websocket_pool import (DEFAULT_SIZE,
+                                                 HEALTH_CHECK_INTERVAL, MAX_AGE,
+                                                 PooledRecognizeStream,
+                                                 WebSocketPool)
 from .speech_to_text_v1 import SpeechToTextV1
-from urllib.parse import urlencode
+import functools
 
 BEARER = 'Bearer'
 
@@ -56,6 +65,8 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
                                   speech_detector_sensitivity=None,
                                   background_audio_suppression=None,
                                   low_latency=None,
+                                  pacing=None,
+                                  max_bytes_per_second=None,
                                   **kwargs):
         """
         Sends audio for speech recognition using web sockets.
@@ -287,6 +298,14 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
                for next-generation models.
                * For more information about the `low_latency` parameter, see [Low
                latency](https://cloud.ibm.com/docs/speech-to-text?topic=speech-to-text-interim#low-latency).
+        :param str pacing: (optional) The pace at which the audio is sent:
+               `fast`, as fast as the connection allows; `real_time`, at the
+               byte rate of `content_type`, which is known for `audio/l16`,
+               `audio/mulaw`, `audio/alaw`, `audio/basic` and `audio/wav`; or
+               `bounded`, at most `max_bytes_per_second`. Defaults to
+               `bounded` if `max_bytes_per_second` is set, else `fast`.
+        :param int max_bytes_per_second: (optional) The byte rate of `bounded`
+               pacing.
         :param dict headers: A `dict` containing the request headers
         :return: A `dict` containing the `SpeechRecognitionResults` response.
         :rtype: dict
@@ -305,19 +324,11 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
             raise Exception(
                 'Callback is not a derived class of RecognizeCallback')
 
-        request = {}
-
-        headers = {}
-        if self.default_headers is not None:
-            headers = self.default_headers.copy()
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        request['headers'] = headers
-
-        if self.authenticator:
-            self.authenticator.authenticate(request)
-
-        url = self.service_url.replace('https:', 'wss:')
+        if pacing is None:
+            pacing = BOUNDED if max_bytes_per_second else FAST
+        pacer = AudioPacer(pacing,
+                           content_type=content_type,
+                           max_bytes_per_second=max_bytes_per_second)
 
         params = {
             'model': model,
@@ -326,9 +337,8 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
             'base_model_version': base_model_version,
             'language_customization_id': language_customization_id
         }
-        params = {k: v for k, v in params.items() if v is not None}
-        url += '/v1/recognize?{0}'.format(urlencode(params))
-        request['url'] = url
+        request = self._websocket_request('/v1/recognize', params,
+                                          kwargs.get('headers'))
 
         options = {
             'customization_weight': customization_weight,
@@ -361,4 +371,180 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
         RecognizeListener(audio, request.get('options'), recognize_callback,
                           request.get('url'), request.get('headers'),
                           http_proxy_host, http_proxy_port,
-                          self.disable_ssl_verification)
+                          self.disable_ssl_verification, pacer)
+
+    def recognize_stream(self,
+                         content_type,
+                         *,
+                         model=None,
+                         language_customization_id=None,
+                         acoustic_customization_id=None,
+                         base_model_version=None,
+                         customization_id=None,
+                         headers=None,
+                         pool=None,
+                         **options):
+        """
+        Recognizes speech streamed over a websocket, on an asyncio event loop.
+
+        The stream is opened with `async with`. The audio is sent with
+        `await stream.send(chunk)` and ended with `await stream.stop()`, and
+        `async for message in stream` returns the messages of the service
+        until it has answered all the audio. Any number of streams share one
+        event loop, without a thread per stream:
+
+            async with speech_to_text.recognize_stream(
+                    'audio/l16;rate=16000', interim_results=True) as stream:
+                ...
+
+        The `http_proxy_host` and `http_proxy_port` of
+        `recognize_using_websocket` are not supported.
+
+        :param str content_type: The type of the input, as for
+               `recognize_using_websocket`.
+        :param str model: (optional) The identifier of the model that is to be
+               used for the recognition request.
+        :param str language_customization_id: (optional) The customization ID
+               (GUID) of a custom language model that is to be used with the
+               recognition request.
+        :param str acoustic_customization_id: (optional) The customization ID
+               (GUID) of a custom acoustic model that is to be used with the
+               recognition request.
+        :param str base_model_version: (optional) The version of the specified
+               base model that is to be used with the recognition request.
+        :param str customization_id: (optional) **Deprecated.** Use the
+               `language_customization_id` parameter.
+        :param dict headers: (optional) A `dict` containing the request
+               headers.
+        :param WebSocketPool pool: (optional) A pool of warm connections, from
+               `websocket_pool()`, that the recognition takes its connection
+               from and returns it to. The connections have the headers of
+               the pool.
+        :param options: (optional) The other parameters of
+               `recognize_using_websocket`, such as `interim_results`,
+               `inactivity_timeout` or `speaker_labels`.
+        :return: A `RecognizeStream`, opened by `async with`.
+        :rtype: RecognizeStream
+        """
+        if content_type is None:
+            raise ValueError('content_type must be provided')
+        params = {
+            'model': model,
+            'customization_id': customization_id,
+            'acoustic_customization_id': acoustic_customization_id,
+            'base_model_version': base_model_version,
+            'language_customization_id': language_customization_id
+        }
+        options['content_type'] = content_type
+        options = {k: v for k, v in options.items() if v is not None}
+        if pool is not None:
+            return PooledRecognizeStream(pool, params, options)
+        connect = functools.partial(self._open_websocket, '/v1/recognize',
+                                    params, headers)
+        return RecognizeStream(connect, options)
+
+    def recognition_session(self,
+                            *,
+                            model=None,
+                            language_customization_id=None,
+                            acoustic_customization_id=None,
+                            base_model_version=None,
+                            customization_id=None,
+                            headers=None,
+                            keep_alive_interval=KEEP_ALIVE_INTERVAL,
+                            idle_timeout=IDLE_TIMEOUT):
+        """
+        Recognizes speech over one websocket connection, for many recognitions
+        one after the other, on an asyncio event loop.
+
+        The session is opened with `async with`, which connects.
+        `session.recognize(content_type, **options)` returns a recognition,
+        used as the stream of `recognize_stream`; once the service has
+        answered its audio, the next recognition reuses the connection:
+
+            async with speech_to_text.recognition_session(
+                    model='en-US_Telephony') as session:
+                async with session.recognize('audio/mulaw;rate=8000') as stream:
+                    ...
+
+        The model and custom models apply to all the recognitions of the
+        session, and the other parameters to each recognition.
+
+        :param str model: (optional) The identifier of the model that is to be
+               used for the recognition requests.
+        :param str language_customization_id: (optional) The customization ID
+               (GUID) of a custom language model.
+        :param str acoustic_customization_id: (optional) The customization ID
+               (GUID) of a custom acoustic model.
+        :param str base_model_version: (optional) The version of the specified
+               base model.
+        :param str customization_id: (optional) **Deprecated.** Use the
+               `language_customization_id` parameter.
+        :param dict headers: (optional) A `dict` containing the request
+               headers.
+        :param float keep_alive_interval: (optional) The seconds between the
+               pings of an idle connection, or `None` for no pings.
+        :param float idle_timeout: (optional) The seconds after which an idle
+               connection is closed, or `None` to keep it open. The next
+               recognition opens a new connection.
+        :return: A `RecognitionSession`, opened by `async with`.
+        :rtype: RecognitionSession
+        """
+        params = {
+            'model': model,
+            'customization_id': customization_id,
+            'acoustic_customization_id': acoustic_customization_id,
+            'base_model_version': base_model_version,
+            'language_customization_id': language_customization_id
+        }
+
+        # Each connection is authenticated, so tokens are fresh.
+        connect = functools.partial(self._open_websocket, '/v1/recognize',
+                                    params, headers)
+        return RecognitionSession(connect,
+                                  keep_alive_interval=keep_alive_interval,
+                                  idle_timeout=idle_timeout)
+
+    def websocket_pool(self,
+                       *,
+                       size=DEFAULT_SIZE,
+                       headers=None,
+                       health_check_interval=HEALTH_CHECK_INTERVAL,
+                       max_age=MAX_AGE):
+        """
+        Returns a pool of warm websocket connections for `recognize_stream`,
+        on an asyncio event loop.
+
+        The pool keeps `size` connections open for each model and custom
+        models it has served, or warmed with `await pool.warm(model=...)`, so
+        a recognition with `pool=pool` starts without connecting:
+
+            async with speech_to_text.websocket_pool(size=4) as pool:
+                await pool.warm(model='en-US_Telephony')
+                async with speech_to_text.recognize_stream(
+                        'audio/mulaw;rate=8000', model='en-US_Telephony',
+                        pool=pool) as stream:
+                    ...
+
+        Once the service has answered all the audio of a recognition, its
+        connection returns to the pool. Closed connections are replaced in
+        the background, and so are connections older than `max_age`, before
+        their token expires.
+
+        :param int size: (optional) The idle connections kept for each model
+               and custom models.
+        :param dict headers: (optional) A `dict` containing the request
+               headers.
+        :param float health_check_interval: (optional) The seconds between the
+               checks of the idle connections.
+        :param float max_age: (optional) The seconds after which an idle
+               connection is replaced.
+        :return: A `WebSocketPool`, closed by `async with` or `close()`.
+        :rtype: WebSocketPool
+        """
+        connect = functools.partial(self._open_websocket, '/v1/recognize',
+                                    headers=headers)
+        return WebSocketPool(connect,
+                             size=size,
+                             health_check_interval=health_check_interval,
+                             max_age=max_age)
@@ -14,9 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ibm_watson.websocket import SynthesizeCallback, SynthesizeListener
+from ibm_watson.websocket import (SynthesizeCallback, SynthesizeListener,
+                                  SynthesizeStream, WebSocketPool)
+from ibm_watson.websocket.websocket_pool import (DEFAULT_SIZE,
+                                                 HEALTH_CHECK_INTERVAL, MAX_AGE,
+                                                 PooledSynthesizeStream)
 from .text_to_speech_v1 import TextToSpeechV1
-from urllib.parse import urlencode
+import functools
 
 BEARER = 'Bearer'
 
@@ -74,26 +78,12 @@ class TextToSpeechV1Adapter(TextToSpeechV1):
             raise Exception(
                 'Callback is not a derived class of SynthesizeCallback')
 
-        request = {}
-
-        headers = {}
-        if self.default_headers is not None:
-            headers = self.default_headers.copy()
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        request['headers'] = headers
-
-        if self.authenticator:
-            self.authenticator.authenticate(request)
-
-        url = self.service_url.replace('https:', 'wss:')
         params = {
             'voice': voice,
             'customization_id': customization_id,
         }
-        params = {k: v for k, v in params.items() if v is not None}
-        url += '/v1/synthesize?{0}'.format(urlencode(params))
-        request['url'] = url
+        request = self._websocket_request('/v1/synthesize', params,
+                                          kwargs.get('headers'))
 
         options = {'text': text, 'accept': accept, 'timings': timings}
         options = {k: v for k, v in options.items() if v is not None}
@@ -103,3 +93,86 @@ class TextToSpeechV1Adapter(TextToSpeechV1):
                            request.get('url'), request.get('headers'),
                            http_proxy_host, http_proxy_port,
                            self.disable_ssl_verification)
+
+    def synthesize_stream(self,
+                          text,
+                          *,
+                          accept=None,
+                          voice=None,
+                          timings=None,
+                          customization_id=None,
+                          headers=None,
+                          pool=None):
+        """
+        Synthesizes text to spoken audio over a websocket, on an asyncio event
+        loop.
+
+        The stream is opened with `async with`, and `async for audio in
+        stream` returns the chunks of audio as the service sends them. The
+        word timings and SSML marks are in `stream.messages`:
+
+            async with text_to_speech.synthesize_stream(
+                    'Hello', accept='audio/wav') as stream:
+                async for audio in stream:
+                    player.write(audio)
+
+        :param str text: The text to synthesize, plain or annotated with SSML.
+        :param str accept: (optional) The requested format (MIME type) of the
+               audio.
+        :param str voice: (optional) The voice to use for synthesis.
+        :param list[str] timings: (optional) `['words']` for the timing
+               information of the words of the text.
+        :param str customization_id: (optional) The customization ID (GUID)
+               of a custom voice model.
+        :param dict headers: (optional) A `dict` containing the request
+               headers.
+        :param WebSocketPool pool: (optional) A pool of warm connections, from
+               `websocket_pool()`, that the synthesis takes its connection
+               from. The connections have the headers of the pool.
+        :return: A `SynthesizeStream`, opened by `async with`.
+        :rtype: SynthesizeStream
+        """
+        if text is None:
+            raise ValueError('text must be provided')
+        params = {'voice': voice, 'customization_id': customization_id}
+        options = {'text': text, 'accept': accept, 'timings': timings}
+        options = {k: v for k, v in options.items() if v is not None}
+        if pool is not None:
+            return PooledSynthesizeStream(pool, params, options)
+        connect = functools.partial(self._open_websocket, '/v1/synthesize',
+                                    params, headers)
+        return SynthesizeStream(connect, options)
+
+    def websocket_pool(self,
+                       *,
+                       size=DEFAULT_SIZE,
+                       headers=None,
+                       health_check_interval=HEALTH_CHECK_INTERVAL,
+                       max_age=MAX_AGE):
+        """
+        Returns a pool of warm websocket connections for `synthesize_stream`,
+        on an asyncio event loop.
+
+        The pool keeps `size` connections open for each voice and custom
+        voice model it has served, or warmed with `await pool.warm(voice=...)`.
+        The service closes the connection of each synthesis, so the pool
+        opens another in the background.
+
+        :param int size: (optional) The idle connections kept for each voice
+               and custom voice model.
+        :param dict headers: (optional) A `dict` containing the request
+               headers.
+        :param float health_check_interval: (optional) The seconds between the
+               checks of the idle connections.
+        :param float max_age: (optional) The seconds after which an idle
+               connection is replaced, before its token expires.
+        :return: A `WebSocketPool`, closed by `async with` or `close()`.
+        :rtype: WebSocketPool
+        """
+        connect = functools.partial(self._open_websocket, '/v1/synthesize',
+                                    headers=headers)
+        return WebSocketPool(connect,
+                             size=size,
+                             health_check_interval=health_check_interval,
+                             max_age=max_age,
+                             reusable=False)
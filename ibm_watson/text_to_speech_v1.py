@@ -43,22 +43,25 @@ See: https://cloud.ibm.com/docs/text-to-speech
 """
 
 from enum import Enum
-from typing import BinaryIO, Dict, List
+from typing import BinaryIO, List
 import json
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class TextToSpeechV1(BaseService):
+class TextToSpeechV1(WatsonService):
     """The Text to Speech V1 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.text-to-speech.watson.cloud.ibm.com'
@@ -68,6 +71,7 @@ class TextToSpeechV1(BaseService):
         self,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Text to Speech service.
@@ -75,13 +79,19 @@ class TextToSpeechV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V1',
+                             get_operation_ids(TextToSpeechV1))
 
     #########################
     # Voices
@@ -117,7 +127,7 @@ class TextToSpeechV1(BaseService):
         url = '/v1/voices'
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Voices, **kwargs)
         return response
 
     def get_voice(self,
@@ -195,7 +205,7 @@ class TextToSpeechV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Voice, **kwargs)
         return response
 
     #########################
@@ -327,7 +337,7 @@ class TextToSpeechV1(BaseService):
 
         data = {'text': text}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -435,7 +445,7 @@ class TextToSpeechV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Pronunciation, **kwargs)
         return response
 
     #########################
@@ -505,7 +515,7 @@ class TextToSpeechV1(BaseService):
 
         data = {'name': name, 'language': language, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -518,7 +528,7 @@ class TextToSpeechV1(BaseService):
                                        headers=headers,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CustomModel, **kwargs)
         return response
 
     def list_custom_models(self,
@@ -563,7 +573,7 @@ class TextToSpeechV1(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CustomModels, **kwargs)
         return response
 
     def update_custom_model(self,
@@ -625,7 +635,7 @@ class TextToSpeechV1(BaseService):
 
         data = {'name': name, 'description': description, 'words': words}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -683,7 +693,7 @@ class TextToSpeechV1(BaseService):
         url = '/v1/customizations/{customization_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CustomModel, **kwargs)
         return response
 
     def delete_custom_model(self, customization_id: str,
@@ -787,7 +797,7 @@ class TextToSpeechV1(BaseService):
 
         data = {'words': words}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -844,7 +854,7 @@ class TextToSpeechV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Words, **kwargs)
         return response
 
     def add_word(self,
@@ -917,7 +927,7 @@ class TextToSpeechV1(BaseService):
 
         data = {'translation': translation, 'part_of_speech': part_of_speech}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -977,7 +987,7 @@ class TextToSpeechV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Translation, **kwargs)
         return response
 
     def delete_word(self, customization_id: str, word: str,
@@ -1072,7 +1082,7 @@ class TextToSpeechV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Prompts, **kwargs)
         return response
 
     def add_custom_prompt(self, customization_id: str, prompt_id: str,
@@ -1213,7 +1223,7 @@ class TextToSpeechV1(BaseService):
                                        headers=headers,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Prompt, **kwargs)
         return response
 
     def get_custom_prompt(self, customization_id: str, prompt_id: str,
@@ -1259,7 +1269,7 @@ class TextToSpeechV1(BaseService):
             **path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Prompt, **kwargs)
         return response
 
     def delete_custom_prompt(self, customization_id: str, prompt_id: str,
@@ -1346,7 +1356,7 @@ class TextToSpeechV1(BaseService):
         url = '/v1/speakers'
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Speakers, **kwargs)
         return response
 
     def create_speaker_model(self, speaker_name: str, audio: BinaryIO,
@@ -1441,7 +1451,7 @@ class TextToSpeechV1(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=SpeakerModel, **kwargs)
         return response
 
     def get_speaker_model(self, speaker_id: str, **kwargs) -> DetailedResponse:
@@ -1485,7 +1495,9 @@ class TextToSpeechV1(BaseService):
         url = '/v1/speakers/{speaker_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=SpeakerCustomModels,
+                             **kwargs)
         return response
 
     def delete_speaker_model(self, speaker_id: str,
@@ -1848,12 +1860,16 @@ class ListCustomModelsEnums:
         ZH_CN = 'zh-CN'
 
 
+class AsyncTextToSpeechV1(AsyncWatsonService, TextToSpeechV1):
+    """The Text to Speech V1 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class CustomModel():
+class CustomModel(Model):
     """
     Information about an existing custom model.
 
@@ -1885,6 +1901,21 @@ class CustomModel():
           field is returned only by the [Get a custom model](#getcustommodel) method.
     """
 
+    __slots__ = ('customization_id', 'name', 'language', 'owner', 'created',
+                 'last_modified', 'description', 'words', 'prompts')
+
+    _fields = (
+        ModelField('customization_id', required=True),
+        ModelField('name'),
+        ModelField('language'),
+        ModelField('owner'),
+        ModelField('created'),
+        ModelField('last_modified'),
+        ModelField('description'),
+        ModelField('words', 'list', 'Word'),
+        ModelField('prompts', 'list', 'Prompt'),
+    )
+
     def __init__(self,
                  customization_id: str,
                  *,
@@ -1938,85 +1969,8 @@ class CustomModel():
         self.words = words
         self.prompts = prompts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CustomModel':
-        """Initialize a CustomModel object from a json dictionary."""
-        args = {}
-        if 'customization_id' in _dict:
-            args['customization_id'] = _dict.get('customization_id')
-        else:
-            raise ValueError(
-                'Required property \'customization_id\' not present in CustomModel JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        if 'owner' in _dict:
-            args['owner'] = _dict.get('owner')
-        if 'created' in _dict:
-            args['created'] = _dict.get('created')
-        if 'last_modified' in _dict:
-            args['last_modified'] = _dict.get('last_modified')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        if 'words' in _dict:
-            args['words'] = [Word.from_dict(x) for x in _dict.get('words')]
-        if 'prompts' in _dict:
-            args['prompts'] = [
-                Prompt.from_dict(x) for x in _dict.get('prompts')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CustomModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'customization_id') and self.customization_id is not None:
-            _dict['customization_id'] = self.customization_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'owner') and self.owner is not None:
-            _dict['owner'] = self.owner
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = self.created
-        if hasattr(self, 'last_modified') and self.last_modified is not None:
-            _dict['last_modified'] = self.last_modified
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'words') and self.words is not None:
-            _dict['words'] = [x.to_dict() for x in self.words]
-        if hasattr(self, 'prompts') and self.prompts is not None:
-            _dict['prompts'] = [x.to_dict() for x in self.prompts]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CustomModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CustomModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CustomModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CustomModels():
+
+class CustomModels(Model):
     """
     Information about existing custom models.
 
@@ -2026,6 +1980,12 @@ class CustomModels():
           own no custom models for the specified language.
     """
 
+    __slots__ = ('customizations',)
+
+    _fields = (
+        ModelField('customizations', 'list', 'CustomModel', required=True),
+    )
+
     def __init__(self, customizations: List['CustomModel']) -> None:
         """
         Initialize a CustomModels object.
@@ -2037,52 +1997,8 @@ class CustomModels():
         """
         self.customizations = customizations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CustomModels':
-        """Initialize a CustomModels object from a json dictionary."""
-        args = {}
-        if 'customizations' in _dict:
-            args['customizations'] = [
-                CustomModel.from_dict(x) for x in _dict.get('customizations')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'customizations\' not present in CustomModels JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CustomModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'customizations') and self.customizations is not None:
-            _dict['customizations'] = [x.to_dict() for x in self.customizations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CustomModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CustomModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CustomModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Prompt():
+
+class Prompt(Model):
     """
     Information about a custom prompt.
 
@@ -2102,6 +2018,16 @@ class Prompt():
           the prompt was defined. The field is omitted if no speaker ID was specified.
     """
 
+    __slots__ = ('prompt', 'prompt_id', 'status', 'error', 'speaker_id')
+
+    _fields = (
+        ModelField('prompt', required=True),
+        ModelField('prompt_id', required=True),
+        ModelField('status', required=True),
+        ModelField('error'),
+        ModelField('speaker_id'),
+    )
+
     def __init__(self,
                  prompt: str,
                  prompt_id: str,
@@ -2135,71 +2061,8 @@ class Prompt():
         self.error = error
         self.speaker_id = speaker_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Prompt':
-        """Initialize a Prompt object from a json dictionary."""
-        args = {}
-        if 'prompt' in _dict:
-            args['prompt'] = _dict.get('prompt')
-        else:
-            raise ValueError(
-                'Required property \'prompt\' not present in Prompt JSON')
-        if 'prompt_id' in _dict:
-            args['prompt_id'] = _dict.get('prompt_id')
-        else:
-            raise ValueError(
-                'Required property \'prompt_id\' not present in Prompt JSON')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in Prompt JSON')
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        if 'speaker_id' in _dict:
-            args['speaker_id'] = _dict.get('speaker_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Prompt object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'prompt') and self.prompt is not None:
-            _dict['prompt'] = self.prompt
-        if hasattr(self, 'prompt_id') and self.prompt_id is not None:
-            _dict['prompt_id'] = self.prompt_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        if hasattr(self, 'speaker_id') and self.speaker_id is not None:
-            _dict['speaker_id'] = self.speaker_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Prompt object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Prompt') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Prompt') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class PromptMetadata():
+
+class PromptMetadata(Model):
     """
     Information about the prompt that is to be added to a custom model. The following
     example of a `PromptMetadata` object includes both the required prompt text and an
@@ -2217,6 +2080,13 @@ class PromptMetadata():
           defined speaker model that is to be associated with the prompt.
     """
 
+    __slots__ = ('prompt_text', 'speaker_id')
+
+    _fields = (
+        ModelField('prompt_text', required=True),
+        ModelField('speaker_id'),
+    )
+
     def __init__(self, prompt_text: str, *, speaker_id: str = None) -> None:
         """
         Initialize a PromptMetadata object.
@@ -2233,54 +2103,8 @@ class PromptMetadata():
         self.prompt_text = prompt_text
         self.speaker_id = speaker_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'PromptMetadata':
-        """Initialize a PromptMetadata object from a json dictionary."""
-        args = {}
-        if 'prompt_text' in _dict:
-            args['prompt_text'] = _dict.get('prompt_text')
-        else:
-            raise ValueError(
-                'Required property \'prompt_text\' not present in PromptMetadata JSON'
-            )
-        if 'speaker_id' in _dict:
-            args['speaker_id'] = _dict.get('speaker_id')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a PromptMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'prompt_text') and self.prompt_text is not None:
-            _dict['prompt_text'] = self.prompt_text
-        if hasattr(self, 'speaker_id') and self.speaker_id is not None:
-            _dict['speaker_id'] = self.speaker_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this PromptMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'PromptMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'PromptMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Prompts():
+
+class Prompts(Model):
     """
     Information about the custom prompts that are defined for a custom model.
 
@@ -2289,6 +2113,12 @@ class Prompts():
           The array is empty if no prompts are defined for the custom model.
     """
 
+    __slots__ = ('prompts',)
+
+    _fields = (
+        ModelField('prompts', 'list', 'Prompt', required=True),
+    )
+
     def __init__(self, prompts: List['Prompt']) -> None:
         """
         Initialize a Prompts object.
@@ -2299,51 +2129,8 @@ class Prompts():
         """
         self.prompts = prompts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Prompts':
-        """Initialize a Prompts object from a json dictionary."""
-        args = {}
-        if 'prompts' in _dict:
-            args['prompts'] = [
-                Prompt.from_dict(x) for x in _dict.get('prompts')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'prompts\' not present in Prompts JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Prompts object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'prompts') and self.prompts is not None:
-            _dict['prompts'] = [x.to_dict() for x in self.prompts]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Prompts object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Prompts') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Prompts') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Pronunciation():
+
+class Pronunciation(Model):
     """
     The pronunciation of the specified text.
 
@@ -2352,6 +2139,12 @@ class Pronunciation():
           also reflects that custom model.
     """
 
+    __slots__ = ('pronunciation',)
+
+    _fields = (
+        ModelField('pronunciation', required=True),
+    )
+
     def __init__(self, pronunciation: str) -> None:
         """
         Initialize a Pronunciation object.
@@ -2362,50 +2155,8 @@ class Pronunciation():
         """
         self.pronunciation = pronunciation
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Pronunciation':
-        """Initialize a Pronunciation object from a json dictionary."""
-        args = {}
-        if 'pronunciation' in _dict:
-            args['pronunciation'] = _dict.get('pronunciation')
-        else:
-            raise ValueError(
-                'Required property \'pronunciation\' not present in Pronunciation JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Pronunciation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'pronunciation') and self.pronunciation is not None:
-            _dict['pronunciation'] = self.pronunciation
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Pronunciation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Pronunciation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Pronunciation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Speaker():
+
+class Speaker(Model):
     """
     Information about a speaker model.
 
@@ -2413,6 +2164,13 @@ class Speaker():
     :attr str name: The user-defined name of the speaker.
     """
 
+    __slots__ = ('speaker_id', 'name')
+
+    _fields = (
+        ModelField('speaker_id', required=True),
+        ModelField('name', required=True),
+    )
+
     def __init__(self, speaker_id: str, name: str) -> None:
         """
         Initialize a Speaker object.
@@ -2423,56 +2181,8 @@ class Speaker():
         self.speaker_id = speaker_id
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Speaker':
-        """Initialize a Speaker object from a json dictionary."""
-        args = {}
-        if 'speaker_id' in _dict:
-            args['speaker_id'] = _dict.get('speaker_id')
-        else:
-            raise ValueError(
-                'Required property \'speaker_id\' not present in Speaker JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Speaker JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Speaker object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'speaker_id') and self.speaker_id is not None:
-            _dict['speaker_id'] = self.speaker_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Speaker object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Speaker') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Speaker') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeakerCustomModel():
+
+class SpeakerCustomModel(Model):
     """
     A custom models for which the speaker has defined prompts.
 
@@ -2483,6 +2193,13 @@ class SpeakerCustomModel():
           model.
     """
 
+    __slots__ = ('customization_id', 'prompts')
+
+    _fields = (
+        ModelField('customization_id', required=True),
+        ModelField('prompts', 'list', 'SpeakerPrompt', required=True),
+    )
+
     def __init__(self, customization_id: str,
                  prompts: List['SpeakerPrompt']) -> None:
         """
@@ -2497,61 +2214,8 @@ class SpeakerCustomModel():
         self.customization_id = customization_id
         self.prompts = prompts
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeakerCustomModel':
-        """Initialize a SpeakerCustomModel object from a json dictionary."""
-        args = {}
-        if 'customization_id' in _dict:
-            args['customization_id'] = _dict.get('customization_id')
-        else:
-            raise ValueError(
-                'Required property \'customization_id\' not present in SpeakerCustomModel JSON'
-            )
-        if 'prompts' in _dict:
-            args['prompts'] = [
-                SpeakerPrompt.from_dict(x) for x in _dict.get('prompts')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'prompts\' not present in SpeakerCustomModel JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeakerCustomModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'customization_id') and self.customization_id is not None:
-            _dict['customization_id'] = self.customization_id
-        if hasattr(self, 'prompts') and self.prompts is not None:
-            _dict['prompts'] = [x.to_dict() for x in self.prompts]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeakerCustomModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeakerCustomModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeakerCustomModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeakerCustomModels():
+
+class SpeakerCustomModels(Model):
     """
     Custom models for which the speaker has defined prompts.
 
@@ -2561,6 +2225,13 @@ class SpeakerCustomModels():
           instance. The array is empty if no prompts are defined for the speaker.
     """
 
+    __slots__ = ('customizations',)
+
+    _fields = (
+        ModelField('customizations', 'list', 'SpeakerCustomModel',
+                   required=True),
+    )
+
     def __init__(self, customizations: List['SpeakerCustomModel']) -> None:
         """
         Initialize a SpeakerCustomModels object.
@@ -2573,59 +2244,20 @@ class SpeakerCustomModels():
         """
         self.customizations = customizations
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeakerCustomModels':
-        """Initialize a SpeakerCustomModels object from a json dictionary."""
-        args = {}
-        if 'customizations' in _dict:
-            args['customizations'] = [
-                SpeakerCustomModel.from_dict(x)
-                for x in _dict.get('customizations')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'customizations\' not present in SpeakerCustomModels JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeakerCustomModels object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'customizations') and self.customizations is not None:
-            _dict['customizations'] = [x.to_dict() for x in self.customizations]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeakerCustomModels object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeakerCustomModels') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeakerCustomModels') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeakerModel():
+
+class SpeakerModel(Model):
     """
     The speaker ID of the speaker model.
 
     :attr str speaker_id: The speaker ID (GUID) of the speaker model.
     """
 
+    __slots__ = ('speaker_id',)
+
+    _fields = (
+        ModelField('speaker_id', required=True),
+    )
+
     def __init__(self, speaker_id: str) -> None:
         """
         Initialize a SpeakerModel object.
@@ -2634,50 +2266,8 @@ class SpeakerModel():
         """
         self.speaker_id = speaker_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeakerModel':
-        """Initialize a SpeakerModel object from a json dictionary."""
-        args = {}
-        if 'speaker_id' in _dict:
-            args['speaker_id'] = _dict.get('speaker_id')
-        else:
-            raise ValueError(
-                'Required property \'speaker_id\' not present in SpeakerModel JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeakerModel object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'speaker_id') and self.speaker_id is not None:
-            _dict['speaker_id'] = self.speaker_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeakerModel object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeakerModel') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeakerModel') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SpeakerPrompt():
+
+class SpeakerPrompt(Model):
     """
     A prompt that a speaker has defined for a custom model.
 
@@ -2695,6 +2285,15 @@ class SpeakerPrompt():
           error occurred.
     """
 
+    __slots__ = ('prompt', 'prompt_id', 'status', 'error')
+
+    _fields = (
+        ModelField('prompt', required=True),
+        ModelField('prompt_id', required=True),
+        ModelField('status', required=True),
+        ModelField('error'),
+    )
+
     def __init__(self,
                  prompt: str,
                  prompt_id: str,
@@ -2723,70 +2322,8 @@ class SpeakerPrompt():
         self.status = status
         self.error = error
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SpeakerPrompt':
-        """Initialize a SpeakerPrompt object from a json dictionary."""
-        args = {}
-        if 'prompt' in _dict:
-            args['prompt'] = _dict.get('prompt')
-        else:
-            raise ValueError(
-                'Required property \'prompt\' not present in SpeakerPrompt JSON'
-            )
-        if 'prompt_id' in _dict:
-            args['prompt_id'] = _dict.get('prompt_id')
-        else:
-            raise ValueError(
-                'Required property \'prompt_id\' not present in SpeakerPrompt JSON'
-            )
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        else:
-            raise ValueError(
-                'Required property \'status\' not present in SpeakerPrompt JSON'
-            )
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SpeakerPrompt object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'prompt') and self.prompt is not None:
-            _dict['prompt'] = self.prompt
-        if hasattr(self, 'prompt_id') and self.prompt_id is not None:
-            _dict['prompt_id'] = self.prompt_id
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SpeakerPrompt object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SpeakerPrompt') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SpeakerPrompt') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Speakers():
+
+class Speakers(Model):
     """
     Information about all speaker models for the service instance.
 
@@ -2795,6 +2332,12 @@ class Speakers():
           the service instance has no speakers.
     """
 
+    __slots__ = ('speakers',)
+
+    _fields = (
+        ModelField('speakers', 'list', 'Speaker', required=True),
+    )
+
     def __init__(self, speakers: List['Speaker']) -> None:
         """
         Initialize a Speakers object.
@@ -2805,51 +2348,8 @@ class Speakers():
         """
         self.speakers = speakers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Speakers':
-        """Initialize a Speakers object from a json dictionary."""
-        args = {}
-        if 'speakers' in _dict:
-            args['speakers'] = [
-                Speaker.from_dict(x) for x in _dict.get('speakers')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'speakers\' not present in Speakers JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Speakers object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'speakers') and self.speakers is not None:
-            _dict['speakers'] = [x.to_dict() for x in self.speakers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Speakers object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Speakers') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Speakers') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SupportedFeatures():
+
+class SupportedFeatures(Model):
     """
     Additional service features that are supported with the voice.
 
@@ -2861,6 +2361,13 @@ class SupportedFeatures():
           standard voices. You cannot use the feature with neural voices.
     """
 
+    __slots__ = ('custom_pronunciation', 'voice_transformation')
+
+    _fields = (
+        ModelField('custom_pronunciation', required=True),
+        ModelField('voice_transformation', required=True),
+    )
+
     def __init__(self, custom_pronunciation: bool,
                  voice_transformation: bool) -> None:
         """
@@ -2877,60 +2384,8 @@ class SupportedFeatures():
         self.custom_pronunciation = custom_pronunciation
         self.voice_transformation = voice_transformation
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SupportedFeatures':
-        """Initialize a SupportedFeatures object from a json dictionary."""
-        args = {}
-        if 'custom_pronunciation' in _dict:
-            args['custom_pronunciation'] = _dict.get('custom_pronunciation')
-        else:
-            raise ValueError(
-                'Required property \'custom_pronunciation\' not present in SupportedFeatures JSON'
-            )
-        if 'voice_transformation' in _dict:
-            args['voice_transformation'] = _dict.get('voice_transformation')
-        else:
-            raise ValueError(
-                'Required property \'voice_transformation\' not present in SupportedFeatures JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SupportedFeatures object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'custom_pronunciation'
-                  ) and self.custom_pronunciation is not None:
-            _dict['custom_pronunciation'] = self.custom_pronunciation
-        if hasattr(self, 'voice_transformation'
-                  ) and self.voice_transformation is not None:
-            _dict['voice_transformation'] = self.voice_transformation
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SupportedFeatures object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SupportedFeatures') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SupportedFeatures') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Translation():
+
+class Translation(Model):
     """
     Information about the translation for the specified text.
 
@@ -2948,6 +2403,13 @@ class Translation():
           entries](https://cloud.ibm.com/docs/text-to-speech?topic=text-to-speech-rules#jaNotes).
     """
 
+    __slots__ = ('translation', 'part_of_speech')
+
+    _fields = (
+        ModelField('translation', required=True),
+        ModelField('part_of_speech'),
+    )
+
     def __init__(self, translation: str, *, part_of_speech: str = None) -> None:
         """
         Initialize a Translation object.
@@ -2969,52 +2431,6 @@ class Translation():
         self.translation = translation
         self.part_of_speech = part_of_speech
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Translation':
-        """Initialize a Translation object from a json dictionary."""
-        args = {}
-        if 'translation' in _dict:
-            args['translation'] = _dict.get('translation')
-        else:
-            raise ValueError(
-                'Required property \'translation\' not present in Translation JSON'
-            )
-        if 'part_of_speech' in _dict:
-            args['part_of_speech'] = _dict.get('part_of_speech')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Translation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'translation') and self.translation is not None:
-            _dict['translation'] = self.translation
-        if hasattr(self, 'part_of_speech') and self.part_of_speech is not None:
-            _dict['part_of_speech'] = self.part_of_speech
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Translation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Translation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Translation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PartOfSpeechEnum(str, Enum):
         """
         **Japanese only.** The part of speech for the word. The service uses the value to
@@ -3043,7 +2459,7 @@ class Translation():
         SUJI = 'Suji'
 
 
-class Voice():
+class Voice(Model):
     """
     Information about an available voice.
 
@@ -3064,6 +2480,21 @@ class Voice():
           custom model.
     """
 
+    __slots__ = ('url', 'gender', 'name', 'language', 'description',
+                 'customizable', 'supported_features', 'customization')
+
+    _fields = (
+        ModelField('url', required=True),
+        ModelField('gender', required=True),
+        ModelField('name', required=True),
+        ModelField('language', required=True),
+        ModelField('description', required=True),
+        ModelField('customizable', required=True),
+        ModelField('supported_features', 'model', 'SupportedFeatures',
+                   required=True),
+        ModelField('customization', 'model', 'CustomModel'),
+    )
+
     def __init__(self,
                  url: str,
                  gender: str,
@@ -3103,106 +2534,20 @@ class Voice():
         self.supported_features = supported_features
         self.customization = customization
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Voice':
-        """Initialize a Voice object from a json dictionary."""
-        args = {}
-        if 'url' in _dict:
-            args['url'] = _dict.get('url')
-        else:
-            raise ValueError(
-                'Required property \'url\' not present in Voice JSON')
-        if 'gender' in _dict:
-            args['gender'] = _dict.get('gender')
-        else:
-            raise ValueError(
-                'Required property \'gender\' not present in Voice JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Voice JSON')
-        if 'language' in _dict:
-            args['language'] = _dict.get('language')
-        else:
-            raise ValueError(
-                'Required property \'language\' not present in Voice JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in Voice JSON')
-        if 'customizable' in _dict:
-            args['customizable'] = _dict.get('customizable')
-        else:
-            raise ValueError(
-                'Required property \'customizable\' not present in Voice JSON')
-        if 'supported_features' in _dict:
-            args['supported_features'] = SupportedFeatures.from_dict(
-                _dict.get('supported_features'))
-        else:
-            raise ValueError(
-                'Required property \'supported_features\' not present in Voice JSON'
-            )
-        if 'customization' in _dict:
-            args['customization'] = CustomModel.from_dict(
-                _dict.get('customization'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Voice object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'url') and self.url is not None:
-            _dict['url'] = self.url
-        if hasattr(self, 'gender') and self.gender is not None:
-            _dict['gender'] = self.gender
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'language') and self.language is not None:
-            _dict['language'] = self.language
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'customizable') and self.customizable is not None:
-            _dict['customizable'] = self.customizable
-        if hasattr(
-                self,
-                'supported_features') and self.supported_features is not None:
-            _dict['supported_features'] = self.supported_features.to_dict()
-        if hasattr(self, 'customization') and self.customization is not None:
-            _dict['customization'] = self.customization.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Voice object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Voice') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Voice') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Voices():
+
+class Voices(Model):
     """
     Information about all available voices.
 
     :attr List[Voice] voices: A list of available voices.
     """
 
+    __slots__ = ('voices',)
+
+    _fields = (
+        ModelField('voices', 'list', 'Voice', required=True),
+    )
+
     def __init__(self, voices: List['Voice']) -> None:
         """
         Initialize a Voices object.
@@ -3211,49 +2556,8 @@ class Voices():
         """
         self.voices = voices
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Voices':
-        """Initialize a Voices object from a json dictionary."""
-        args = {}
-        if 'voices' in _dict:
-            args['voices'] = [Voice.from_dict(x) for x in _dict.get('voices')]
-        else:
-            raise ValueError(
-                'Required property \'voices\' not present in Voices JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Voices object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'voices') and self.voices is not None:
-            _dict['voices'] = [x.to_dict() for x in self.voices]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Voices object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Voices') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Voices') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Word():
+
+class Word(Model):
     """
     Information about a word for the custom model.
 
@@ -3273,6 +2577,14 @@ class Word():
           entries](https://cloud.ibm.com/docs/text-to-speech?topic=text-to-speech-rules#jaNotes).
     """
 
+    __slots__ = ('word', 'translation', 'part_of_speech')
+
+    _fields = (
+        ModelField('word', required=True),
+        ModelField('translation', required=True),
+        ModelField('part_of_speech'),
+    )
+
     def __init__(self,
                  word: str,
                  translation: str,
@@ -3302,58 +2614,6 @@ class Word():
         self.translation = translation
         self.part_of_speech = part_of_speech
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Word':
-        """Initialize a Word object from a json dictionary."""
-        args = {}
-        if 'word' in _dict:
-            args['word'] = _dict.get('word')
-        else:
-            raise ValueError(
-                'Required property \'word\' not present in Word JSON')
-        if 'translation' in _dict:
-            args['translation'] = _dict.get('translation')
-        else:
-            raise ValueError(
-                'Required property \'translation\' not present in Word JSON')
-        if 'part_of_speech' in _dict:
-            args['part_of_speech'] = _dict.get('part_of_speech')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Word object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'word') and self.word is not None:
-            _dict['word'] = self.word
-        if hasattr(self, 'translation') and self.translation is not None:
-            _dict['translation'] = self.translation
-        if hasattr(self, 'part_of_speech') and self.part_of_speech is not None:
-            _dict['part_of_speech'] = self.part_of_speech
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Word object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Word') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Word') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class PartOfSpeechEnum(str, Enum):
         """
         **Japanese only.** The part of speech for the word. The service uses the value to
@@ -3382,7 +2642,7 @@ class Word():
         SUJI = 'Suji'
 
 
-class Words():
+class Words(Model):
     """
     For the [Add custom words](#addwords) method, one or more words that are to be added
     or updated for the custom model and the translation for each specified word.
@@ -3398,6 +2658,12 @@ class Words():
           letters. The array is empty if the custom model contains no words.
     """
 
+    __slots__ = ('words',)
+
+    _fields = (
+        ModelField('words', 'list', 'Word', required=True),
+    )
+
     def __init__(self, words: List['Word']) -> None:
         """
         Initialize a Words object.
@@ -3412,44 +2678,3 @@ class Words():
                contains no words.
         """
         self.words = words
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Words':
-        """Initialize a Words object from a json dictionary."""
-        args = {}
-        if 'words' in _dict:
-            args['words'] = [Word.from_dict(x) for x in _dict.get('words')]
-        else:
-            raise ValueError(
-                'Required property \'words\' not present in Words JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Words object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'words') and self.words is not None:
-            _dict['words'] = [x.to_dict() for x in self.words]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Words object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Words') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Words') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -31,22 +31,24 @@ See: https://cloud.ibm.com/docs/tone-analyzer
 """
 
 from enum import Enum
-from typing import Dict, List, TextIO, Union
-import json
+from typing import List, TextIO, Union
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_list, convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class ToneAnalyzerV3(BaseService):
+class ToneAnalyzerV3(WatsonService):
     """The Tone Analyzer V3 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.tone-analyzer.watson.cloud.ibm.com'
@@ -57,6 +59,7 @@ class ToneAnalyzerV3(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Tone Analyzer service.
@@ -67,17 +70,23 @@ class ToneAnalyzerV3(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         if version is None:
             raise ValueError('version must be provided')
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V3',
+                             get_operation_ids(ToneAnalyzerV3))
 
     #########################
     # Methods
@@ -170,7 +179,7 @@ class ToneAnalyzerV3(BaseService):
         }
 
         if isinstance(tone_input, dict):
-            data = json.dumps(tone_input)
+            data = self.get_json_codec().dumps(tone_input)
             if content_type is None:
                 headers['Content-Type'] = 'application/json'
         else:
@@ -187,7 +196,7 @@ class ToneAnalyzerV3(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ToneAnalysis, **kwargs)
         return response
 
     def tone_chat(self,
@@ -247,7 +256,7 @@ class ToneAnalyzerV3(BaseService):
 
         data = {'utterances': utterances}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -261,7 +270,7 @@ class ToneAnalyzerV3(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=UtteranceAnalyses, **kwargs)
         return response
 
 
@@ -363,12 +372,16 @@ class ToneChatEnums:
         ZH_TW = 'zh-tw'
 
 
+class AsyncToneAnalyzerV3(AsyncWatsonService, ToneAnalyzerV3):
+    """The Tone Analyzer V3 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class DocumentAnalysis():
+class DocumentAnalysis(Model):
     """
     The results of the analysis for the full input content.
 
@@ -388,6 +401,14 @@ class DocumentAnalysis():
           100 sentences for sentence-level analysis. **`2016-05-19`:** Not returned.
     """
 
+    __slots__ = ('tones', 'tone_categories', 'warning')
+
+    _fields = (
+        ModelField('tones', 'list', 'ToneScore'),
+        ModelField('tone_categories', 'list', 'ToneCategory'),
+        ModelField('warning'),
+    )
+
     def __init__(self,
                  *,
                  tones: List['ToneScore'] = None,
@@ -416,59 +437,8 @@ class DocumentAnalysis():
         self.tone_categories = tone_categories
         self.warning = warning
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DocumentAnalysis':
-        """Initialize a DocumentAnalysis object from a json dictionary."""
-        args = {}
-        if 'tones' in _dict:
-            args['tones'] = [ToneScore.from_dict(x) for x in _dict.get('tones')]
-        if 'tone_categories' in _dict:
-            args['tone_categories'] = [
-                ToneCategory.from_dict(x) for x in _dict.get('tone_categories')
-            ]
-        if 'warning' in _dict:
-            args['warning'] = _dict.get('warning')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DocumentAnalysis object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'tones') and self.tones is not None:
-            _dict['tones'] = [x.to_dict() for x in self.tones]
-        if hasattr(self,
-                   'tone_categories') and self.tone_categories is not None:
-            _dict['tone_categories'] = [
-                x.to_dict() for x in self.tone_categories
-            ]
-        if hasattr(self, 'warning') and self.warning is not None:
-            _dict['warning'] = self.warning
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DocumentAnalysis object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DocumentAnalysis') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DocumentAnalysis') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class SentenceAnalysis():
+
+class SentenceAnalysis(Model):
     """
     The results of the analysis for the individual sentences of the input content.
 
@@ -492,6 +462,18 @@ class SentenceAnalysis():
           The offset of the last character of the sentence in the overall input content.
     """
 
+    __slots__ = ('sentence_id', 'text', 'tones', 'tone_categories',
+                 'input_from', 'input_to')
+
+    _fields = (
+        ModelField('sentence_id', required=True),
+        ModelField('text', required=True),
+        ModelField('tones', 'list', 'ToneScore'),
+        ModelField('tone_categories', 'list', 'ToneCategory'),
+        ModelField('input_from'),
+        ModelField('input_to'),
+    )
+
     def __init__(self,
                  sentence_id: int,
                  text: str,
@@ -531,79 +513,8 @@ class SentenceAnalysis():
         self.input_from = input_from
         self.input_to = input_to
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'SentenceAnalysis':
-        """Initialize a SentenceAnalysis object from a json dictionary."""
-        args = {}
-        if 'sentence_id' in _dict:
-            args['sentence_id'] = _dict.get('sentence_id')
-        else:
-            raise ValueError(
-                'Required property \'sentence_id\' not present in SentenceAnalysis JSON'
-            )
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in SentenceAnalysis JSON'
-            )
-        if 'tones' in _dict:
-            args['tones'] = [ToneScore.from_dict(x) for x in _dict.get('tones')]
-        if 'tone_categories' in _dict:
-            args['tone_categories'] = [
-                ToneCategory.from_dict(x) for x in _dict.get('tone_categories')
-            ]
-        if 'input_from' in _dict:
-            args['input_from'] = _dict.get('input_from')
-        if 'input_to' in _dict:
-            args['input_to'] = _dict.get('input_to')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a SentenceAnalysis object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'sentence_id') and self.sentence_id is not None:
-            _dict['sentence_id'] = self.sentence_id
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'tones') and self.tones is not None:
-            _dict['tones'] = [x.to_dict() for x in self.tones]
-        if hasattr(self,
-                   'tone_categories') and self.tone_categories is not None:
-            _dict['tone_categories'] = [
-                x.to_dict() for x in self.tone_categories
-            ]
-        if hasattr(self, 'input_from') and self.input_from is not None:
-            _dict['input_from'] = self.input_from
-        if hasattr(self, 'input_to') and self.input_to is not None:
-            _dict['input_to'] = self.input_to
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this SentenceAnalysis object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'SentenceAnalysis') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'SentenceAnalysis') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ToneAnalysis():
+
+class ToneAnalysis(Model):
     """
     The tone analysis results for the input from the general-purpose endpoint.
 
@@ -616,6 +527,13 @@ class ToneAnalysis():
           parameter of the request is set to `false`.
     """
 
+    __slots__ = ('document_tone', 'sentences_tone')
+
+    _fields = (
+        ModelField('document_tone', 'model', 'DocumentAnalysis', required=True),
+        ModelField('sentences_tone', 'list', 'SentenceAnalysis'),
+    )
+
     def __init__(self,
                  document_tone: 'DocumentAnalysis',
                  *,
@@ -634,58 +552,8 @@ class ToneAnalysis():
         self.document_tone = document_tone
         self.sentences_tone = sentences_tone
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ToneAnalysis':
-        """Initialize a ToneAnalysis object from a json dictionary."""
-        args = {}
-        if 'document_tone' in _dict:
-            args['document_tone'] = DocumentAnalysis.from_dict(
-                _dict.get('document_tone'))
-        else:
-            raise ValueError(
-                'Required property \'document_tone\' not present in ToneAnalysis JSON'
-            )
-        if 'sentences_tone' in _dict:
-            args['sentences_tone'] = [
-                SentenceAnalysis.from_dict(x)
-                for x in _dict.get('sentences_tone')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ToneAnalysis object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'document_tone') and self.document_tone is not None:
-            _dict['document_tone'] = self.document_tone.to_dict()
-        if hasattr(self, 'sentences_tone') and self.sentences_tone is not None:
-            _dict['sentences_tone'] = [x.to_dict() for x in self.sentences_tone]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ToneAnalysis object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ToneAnalysis') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ToneAnalysis') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ToneCategory():
+
+class ToneCategory(Model):
     """
     The category for a tone from the input content.
 
@@ -697,6 +565,14 @@ class ToneCategory():
     :attr str category_name: The user-visible, localized name of the category.
     """
 
+    __slots__ = ('tones', 'category_id', 'category_name')
+
+    _fields = (
+        ModelField('tones', 'list', 'ToneScore', required=True),
+        ModelField('category_id', required=True),
+        ModelField('category_name', required=True),
+    )
+
     def __init__(self, tones: List['ToneScore'], category_id: str,
                  category_name: str) -> None:
         """
@@ -713,65 +589,8 @@ class ToneCategory():
         self.category_id = category_id
         self.category_name = category_name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ToneCategory':
-        """Initialize a ToneCategory object from a json dictionary."""
-        args = {}
-        if 'tones' in _dict:
-            args['tones'] = [ToneScore.from_dict(x) for x in _dict.get('tones')]
-        else:
-            raise ValueError(
-                'Required property \'tones\' not present in ToneCategory JSON')
-        if 'category_id' in _dict:
-            args['category_id'] = _dict.get('category_id')
-        else:
-            raise ValueError(
-                'Required property \'category_id\' not present in ToneCategory JSON'
-            )
-        if 'category_name' in _dict:
-            args['category_name'] = _dict.get('category_name')
-        else:
-            raise ValueError(
-                'Required property \'category_name\' not present in ToneCategory JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ToneCategory object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'tones') and self.tones is not None:
-            _dict['tones'] = [x.to_dict() for x in self.tones]
-        if hasattr(self, 'category_id') and self.category_id is not None:
-            _dict['category_id'] = self.category_id
-        if hasattr(self, 'category_name') and self.category_name is not None:
-            _dict['category_name'] = self.category_name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ToneCategory object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ToneCategory') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ToneCategory') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ToneChatScore():
+
+class ToneChatScore(Model):
     """
     The score for an utterance from the input content.
 
@@ -784,6 +603,14 @@ class ToneChatScore():
     :attr str tone_name: The user-visible, localized name of the tone.
     """
 
+    __slots__ = ('score', 'tone_id', 'tone_name')
+
+    _fields = (
+        ModelField('score', required=True),
+        ModelField('tone_id', required=True),
+        ModelField('tone_name', required=True),
+    )
+
     def __init__(self, score: float, tone_id: str, tone_name: str) -> None:
         """
         Initialize a ToneChatScore object.
@@ -800,63 +627,6 @@ class ToneChatScore():
         self.tone_id = tone_id
         self.tone_name = tone_name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ToneChatScore':
-        """Initialize a ToneChatScore object from a json dictionary."""
-        args = {}
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in ToneChatScore JSON')
-        if 'tone_id' in _dict:
-            args['tone_id'] = _dict.get('tone_id')
-        else:
-            raise ValueError(
-                'Required property \'tone_id\' not present in ToneChatScore JSON'
-            )
-        if 'tone_name' in _dict:
-            args['tone_name'] = _dict.get('tone_name')
-        else:
-            raise ValueError(
-                'Required property \'tone_name\' not present in ToneChatScore JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ToneChatScore object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'tone_id') and self.tone_id is not None:
-            _dict['tone_id'] = self.tone_id
-        if hasattr(self, 'tone_name') and self.tone_name is not None:
-            _dict['tone_name'] = self.tone_name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ToneChatScore object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ToneChatScore') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ToneChatScore') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class ToneIdEnum(str, Enum):
         """
         The unique, non-localized identifier of the tone for the results. The service
@@ -871,13 +641,19 @@ class ToneChatScore():
         SYMPATHETIC = 'sympathetic'
 
 
-class ToneInput():
+class ToneInput(Model):
     """
     Input for the general-purpose endpoint.
 
     :attr str text: The input content that the service is to analyze.
     """
 
+    __slots__ = ('text',)
+
+    _fields = (
+        ModelField('text', required=True),
+    )
+
     def __init__(self, text: str) -> None:
         """
         Initialize a ToneInput object.
@@ -886,49 +662,8 @@ class ToneInput():
         """
         self.text = text
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ToneInput':
-        """Initialize a ToneInput object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in ToneInput JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ToneInput object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ToneInput object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ToneInput') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ToneInput') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ToneScore():
+
+class ToneScore(Model):
     """
     The score for a tone from the input content.
 
@@ -955,6 +690,14 @@ class ToneScore():
     :attr str tone_name: The user-visible, localized name of the tone.
     """
 
+    __slots__ = ('score', 'tone_id', 'tone_name')
+
+    _fields = (
+        ModelField('score', required=True),
+        ModelField('tone_id', required=True),
+        ModelField('tone_name', required=True),
+    )
+
     def __init__(self, score: float, tone_id: str, tone_name: str) -> None:
         """
         Initialize a ToneScore object.
@@ -985,63 +728,8 @@ class ToneScore():
         self.tone_id = tone_id
         self.tone_name = tone_name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ToneScore':
-        """Initialize a ToneScore object from a json dictionary."""
-        args = {}
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in ToneScore JSON')
-        if 'tone_id' in _dict:
-            args['tone_id'] = _dict.get('tone_id')
-        else:
-            raise ValueError(
-                'Required property \'tone_id\' not present in ToneScore JSON')
-        if 'tone_name' in _dict:
-            args['tone_name'] = _dict.get('tone_name')
-        else:
-            raise ValueError(
-                'Required property \'tone_name\' not present in ToneScore JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ToneScore object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'tone_id') and self.tone_id is not None:
-            _dict['tone_id'] = self.tone_id
-        if hasattr(self, 'tone_name') and self.tone_name is not None:
-            _dict['tone_name'] = self.tone_name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ToneScore object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ToneScore') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ToneScore') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Utterance():
+
+class Utterance(Model):
     """
     An utterance for the input of the general-purpose endpoint.
 
@@ -1051,6 +739,13 @@ class Utterance():
           utterance specified by the `text` parameter.
     """
 
+    __slots__ = ('text', 'user')
+
+    _fields = (
+        ModelField('text', required=True),
+        ModelField('user'),
+    )
+
     def __init__(self, text: str, *, user: str = None) -> None:
         """
         Initialize a Utterance object.
@@ -1063,53 +758,8 @@ class Utterance():
         self.text = text
         self.user = user
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Utterance':
-        """Initialize a Utterance object from a json dictionary."""
-        args = {}
-        if 'text' in _dict:
-            args['text'] = _dict.get('text')
-        else:
-            raise ValueError(
-                'Required property \'text\' not present in Utterance JSON')
-        if 'user' in _dict:
-            args['user'] = _dict.get('user')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Utterance object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'text') and self.text is not None:
-            _dict['text'] = self.text
-        if hasattr(self, 'user') and self.user is not None:
-            _dict['user'] = self.user
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Utterance object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Utterance') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Utterance') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class UtteranceAnalyses():
+
+class UtteranceAnalyses(Model):
     """
     The results of the analysis for the utterances of the input content.
 
@@ -1120,6 +770,14 @@ class UtteranceAnalyses():
           utterances. **`2016-05-19`:** Not returned.
     """
 
+    __slots__ = ('utterances_tone', 'warning')
+
+    _fields = (
+        ModelField('utterances_tone', 'list', 'UtteranceAnalysis',
+                   required=True),
+        ModelField('warning'),
+    )
+
     def __init__(self,
                  utterances_tone: List['UtteranceAnalysis'],
                  *,
@@ -1137,60 +795,8 @@ class UtteranceAnalyses():
         self.utterances_tone = utterances_tone
         self.warning = warning
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UtteranceAnalyses':
-        """Initialize a UtteranceAnalyses object from a json dictionary."""
-        args = {}
-        if 'utterances_tone' in _dict:
-            args['utterances_tone'] = [
-                UtteranceAnalysis.from_dict(x)
-                for x in _dict.get('utterances_tone')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'utterances_tone\' not present in UtteranceAnalyses JSON'
-            )
-        if 'warning' in _dict:
-            args['warning'] = _dict.get('warning')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UtteranceAnalyses object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self,
-                   'utterances_tone') and self.utterances_tone is not None:
-            _dict['utterances_tone'] = [
-                x.to_dict() for x in self.utterances_tone
-            ]
-        if hasattr(self, 'warning') and self.warning is not None:
-            _dict['warning'] = self.warning
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UtteranceAnalyses object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UtteranceAnalyses') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UtteranceAnalyses') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class UtteranceAnalysis():
+
+class UtteranceAnalysis(Model):
     """
     The results of the analysis for an utterance of the input content.
 
@@ -1207,6 +813,15 @@ class UtteranceAnalysis():
           **`2016-05-19`:** Not returned.
     """
 
+    __slots__ = ('utterance_id', 'utterance_text', 'tones', 'error')
+
+    _fields = (
+        ModelField('utterance_id', required=True),
+        ModelField('utterance_text', required=True),
+        ModelField('tones', 'list', 'ToneChatScore', required=True),
+        ModelField('error'),
+    )
+
     def __init__(self,
                  utterance_id: int,
                  utterance_text: str,
@@ -1232,67 +847,3 @@ class UtteranceAnalysis():
         self.utterance_text = utterance_text
         self.tones = tones
         self.error = error
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UtteranceAnalysis':
-        """Initialize a UtteranceAnalysis object from a json dictionary."""
-        args = {}
-        if 'utterance_id' in _dict:
-            args['utterance_id'] = _dict.get('utterance_id')
-        else:
-            raise ValueError(
-                'Required property \'utterance_id\' not present in UtteranceAnalysis JSON'
-            )
-        if 'utterance_text' in _dict:
-            args['utterance_text'] = _dict.get('utterance_text')
-        else:
-            raise ValueError(
-                'Required property \'utterance_text\' not present in UtteranceAnalysis JSON'
-            )
-        if 'tones' in _dict:
-            args['tones'] = [
-                ToneChatScore.from_dict(x) for x in _dict.get('tones')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'tones\' not present in UtteranceAnalysis JSON'
-            )
-        if 'error' in _dict:
-            args['error'] = _dict.get('error')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UtteranceAnalysis object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'utterance_id') and self.utterance_id is not None:
-            _dict['utterance_id'] = self.utterance_id
-        if hasattr(self, 'utterance_text') and self.utterance_text is not None:
-            _dict['utterance_text'] = self.utterance_text
-        if hasattr(self, 'tones') and self.tones is not None:
-            _dict['tones'] = [x.to_dict() for x in self.tones]
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UtteranceAnalysis object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UtteranceAnalysis') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UtteranceAnalysis') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -32,21 +32,22 @@ from datetime import datetime
 from enum import Enum
 from os.path import basename
 from typing import BinaryIO, Dict, List
-import json
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import datetime_to_string, string_to_datetime
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class VisualRecognitionV3(BaseService):
+class VisualRecognitionV3(WatsonService):
     """The Visual Recognition V3 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.visual-recognition.watson.cloud.ibm.com'
@@ -57,6 +58,7 @@ class VisualRecognitionV3(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Visual Recognition service.
@@ -67,6 +69,9 @@ class VisualRecognitionV3(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         print(
             'warning: On 1 December 2021, Visual Recognition will no longer be available. For more information, see https://github.com/watson-developer-cloud/python-sdk/tree/master#visual-recognition-deprecation.'
@@ -76,11 +81,14 @@ class VisualRecognitionV3(BaseService):
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V3',
+                             get_operation_ids(VisualRecognitionV3))
 
     #########################
     # General
@@ -185,7 +193,7 @@ class VisualRecognitionV3(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ClassifiedImages, **kwargs)
         return response
 
     #########################
@@ -283,7 +291,7 @@ class VisualRecognitionV3(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifier, **kwargs)
         return response
 
     def list_classifiers(self,
@@ -318,7 +326,7 @@ class VisualRecognitionV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifiers, **kwargs)
         return response
 
     def get_classifier(self, classifier_id: str, **kwargs) -> DetailedResponse:
@@ -356,7 +364,7 @@ class VisualRecognitionV3(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifier, **kwargs)
         return response
 
     def update_classifier(self,
@@ -454,7 +462,7 @@ class VisualRecognitionV3(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Classifier, **kwargs)
         return response
 
     def delete_classifier(self, classifier_id: str,
@@ -607,18 +615,28 @@ class ClassifyEnums:
         ZH_TW = 'zh-tw'
 
 
+class AsyncVisualRecognitionV3(AsyncWatsonService, VisualRecognitionV3):
+    """The Visual Recognition V3 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class Class():
+class Class(Model):
     """
     A category within a classifier.
 
     :attr str class_: The name of the class.
     """
 
+    __slots__ = ('class_',)
+
+    _fields = (
+        ModelField('class_', key='class', required=True),
+    )
+
     def __init__(self, class_: str) -> None:
         """
         Initialize a Class object.
@@ -627,49 +645,8 @@ class Class():
         """
         self.class_ = class_
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Class':
-        """Initialize a Class object from a json dictionary."""
-        args = {}
-        if 'class' in _dict:
-            args['class_'] = _dict.get('class')
-        else:
-            raise ValueError(
-                'Required property \'class\' not present in Class JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Class object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'class_') and self.class_ is not None:
-            _dict['class'] = self.class_
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Class object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Class') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Class') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassResult():
+
+class ClassResult(Model):
     """
     Result of a class within a classifier.
 
@@ -687,6 +664,14 @@ class ClassResult():
           identified.
     """
 
+    __slots__ = ('class_', 'score', 'type_hierarchy')
+
+    _fields = (
+        ModelField('class_', key='class', required=True),
+        ModelField('score', required=True),
+        ModelField('type_hierarchy'),
+    )
+
     def __init__(self,
                  class_: str,
                  score: float,
@@ -714,60 +699,8 @@ class ClassResult():
         self.score = score
         self.type_hierarchy = type_hierarchy
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassResult':
-        """Initialize a ClassResult object from a json dictionary."""
-        args = {}
-        if 'class' in _dict:
-            args['class_'] = _dict.get('class')
-        else:
-            raise ValueError(
-                'Required property \'class\' not present in ClassResult JSON')
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in ClassResult JSON')
-        if 'type_hierarchy' in _dict:
-            args['type_hierarchy'] = _dict.get('type_hierarchy')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'class_') and self.class_ is not None:
-            _dict['class'] = self.class_
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        if hasattr(self, 'type_hierarchy') and self.type_hierarchy is not None:
-            _dict['type_hierarchy'] = self.type_hierarchy
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassifiedImage():
+
+class ClassifiedImage(Model):
     """
     Results for one image.
 
@@ -783,6 +716,16 @@ class ClassifiedImage():
     :attr List[ClassifierResult] classifiers: The classifiers.
     """
 
+    __slots__ = ('source_url', 'resolved_url', 'image', 'error', 'classifiers')
+
+    _fields = (
+        ModelField('source_url'),
+        ModelField('resolved_url'),
+        ModelField('image'),
+        ModelField('error', 'model', 'ErrorInfo'),
+        ModelField('classifiers', 'list', 'ClassifierResult', required=True),
+    )
+
     def __init__(self,
                  classifiers: List['ClassifierResult'],
                  *,
@@ -810,68 +753,8 @@ class ClassifiedImage():
         self.error = error
         self.classifiers = classifiers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifiedImage':
-        """Initialize a ClassifiedImage object from a json dictionary."""
-        args = {}
-        if 'source_url' in _dict:
-            args['source_url'] = _dict.get('source_url')
-        if 'resolved_url' in _dict:
-            args['resolved_url'] = _dict.get('resolved_url')
-        if 'image' in _dict:
-            args['image'] = _dict.get('image')
-        if 'error' in _dict:
-            args['error'] = ErrorInfo.from_dict(_dict.get('error'))
-        if 'classifiers' in _dict:
-            args['classifiers'] = [
-                ClassifierResult.from_dict(x) for x in _dict.get('classifiers')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'classifiers\' not present in ClassifiedImage JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifiedImage object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'source_url') and self.source_url is not None:
-            _dict['source_url'] = self.source_url
-        if hasattr(self, 'resolved_url') and self.resolved_url is not None:
-            _dict['resolved_url'] = self.resolved_url
-        if hasattr(self, 'image') and self.image is not None:
-            _dict['image'] = self.image
-        if hasattr(self, 'error') and self.error is not None:
-            _dict['error'] = self.error.to_dict()
-        if hasattr(self, 'classifiers') and self.classifiers is not None:
-            _dict['classifiers'] = [x.to_dict() for x in self.classifiers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifiedImage object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifiedImage') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifiedImage') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ClassifiedImages():
+
+class ClassifiedImages(Model):
     """
     Results for all images.
 
@@ -886,6 +769,15 @@ class ClassifiedImages():
           output. Not returned when there is no warning.
     """
 
+    __slots__ = ('custom_classes', 'images_processed', 'images', 'warnings')
+
+    _fields = (
+        ModelField('custom_classes'),
+        ModelField('images_processed'),
+        ModelField('images', 'list', 'ClassifiedImage', required=True),
+        ModelField('warnings', 'list', 'WarningInfo'),
+    )
+
     def __init__(self,
                  images: List['ClassifiedImage'],
                  *,
@@ -910,67 +802,8 @@ class ClassifiedImages():
         self.images = images
         self.warnings = warnings
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifiedImages':
-        """Initialize a ClassifiedImages object from a json dictionary."""
-        args = {}
-        if 'custom_classes' in _dict:
-            args['custom_classes'] = _dict.get('custom_classes')
-        if 'images_processed' in _dict:
-            args['images_processed'] = _dict.get('images_processed')
-        if 'images' in _dict:
-            args['images'] = [
-                ClassifiedImage.from_dict(x) for x in _dict.get('images')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'images\' not present in ClassifiedImages JSON'
-            )
-        if 'warnings' in _dict:
-            args['warnings'] = [
-                WarningInfo.from_dict(x) for x in _dict.get('warnings')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifiedImages object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'custom_classes') and self.custom_classes is not None:
-            _dict['custom_classes'] = self.custom_classes
-        if hasattr(self,
-                   'images_processed') and self.images_processed is not None:
-            _dict['images_processed'] = self.images_processed
-        if hasattr(self, 'images') and self.images is not None:
-            _dict['images'] = [x.to_dict() for x in self.images]
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = [x.to_dict() for x in self.warnings]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifiedImages object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifiedImages') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifiedImages') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Classifier():
+
+class Classifier(Model):
     """
     Information about a classifier.
 
@@ -994,6 +827,22 @@ class Classifier():
           `retrained` or `created`. Might not be returned by some requests.
     """
 
+    __slots__ = ('classifier_id', 'name', 'owner', 'status', 'core_ml_enabled',
+                 'explanation', 'created', 'classes', 'retrained', 'updated')
+
+    _fields = (
+        ModelField('classifier_id', required=True),
+        ModelField('name', required=True),
+        ModelField('owner'),
+        ModelField('status'),
+        ModelField('core_ml_enabled'),
+        ModelField('explanation'),
+        ModelField('created', 'datetime'),
+        ModelField('classes', 'list', 'Class'),
+        ModelField('retrained', 'datetime'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  classifier_id: str,
                  name: str,
@@ -1040,88 +889,6 @@ class Classifier():
         self.retrained = retrained
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Classifier':
-        """Initialize a Classifier object from a json dictionary."""
-        args = {}
-        if 'classifier_id' in _dict:
-            args['classifier_id'] = _dict.get('classifier_id')
-        else:
-            raise ValueError(
-                'Required property \'classifier_id\' not present in Classifier JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Classifier JSON')
-        if 'owner' in _dict:
-            args['owner'] = _dict.get('owner')
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'core_ml_enabled' in _dict:
-            args['core_ml_enabled'] = _dict.get('core_ml_enabled')
-        if 'explanation' in _dict:
-            args['explanation'] = _dict.get('explanation')
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'classes' in _dict:
-            args['classes'] = [Class.from_dict(x) for x in _dict.get('classes')]
-        if 'retrained' in _dict:
-            args['retrained'] = string_to_datetime(_dict.get('retrained'))
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Classifier object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'classifier_id') and self.classifier_id is not None:
-            _dict['classifier_id'] = self.classifier_id
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'owner') and self.owner is not None:
-            _dict['owner'] = self.owner
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self,
-                   'core_ml_enabled') and self.core_ml_enabled is not None:
-            _dict['core_ml_enabled'] = self.core_ml_enabled
-        if hasattr(self, 'explanation') and self.explanation is not None:
-            _dict['explanation'] = self.explanation
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'classes') and self.classes is not None:
-            _dict['classes'] = [x.to_dict() for x in self.classes]
-        if hasattr(self, 'retrained') and self.retrained is not None:
-            _dict['retrained'] = datetime_to_string(self.retrained)
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = datetime_to_string(self.updated)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Classifier object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Classifier') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Classifier') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class StatusEnum(str, Enum):
         """
         Training status of classifier.
@@ -1132,7 +899,7 @@ class Classifier():
         FAILED = 'failed'
 
 
-class ClassifierResult():
+class ClassifierResult(Model):
     """
     Classifier and score combination.
 
@@ -1141,6 +908,14 @@ class ClassifierResult():
     :attr List[ClassResult] classes: Classes within the classifier.
     """
 
+    __slots__ = ('name', 'classifier_id', 'classes')
+
+    _fields = (
+        ModelField('name', required=True),
+        ModelField('classifier_id', required=True),
+        ModelField('classes', 'list', 'ClassResult', required=True),
+    )
+
     def __init__(self, name: str, classifier_id: str,
                  classes: List['ClassResult']) -> None:
         """
@@ -1154,74 +929,20 @@ class ClassifierResult():
         self.classifier_id = classifier_id
         self.classes = classes
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ClassifierResult':
-        """Initialize a ClassifierResult object from a json dictionary."""
-        args = {}
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in ClassifierResult JSON'
-            )
-        if 'classifier_id' in _dict:
-            args['classifier_id'] = _dict.get('classifier_id')
-        else:
-            raise ValueError(
-                'Required property \'classifier_id\' not present in ClassifierResult JSON'
-            )
-        if 'classes' in _dict:
-            args['classes'] = [
-                ClassResult.from_dict(x) for x in _dict.get('classes')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'classes\' not present in ClassifierResult JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ClassifierResult object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'classifier_id') and self.classifier_id is not None:
-            _dict['classifier_id'] = self.classifier_id
-        if hasattr(self, 'classes') and self.classes is not None:
-            _dict['classes'] = [x.to_dict() for x in self.classes]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ClassifierResult object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ClassifierResult') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ClassifierResult') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Classifiers():
+
+class Classifiers(Model):
     """
     A container for the list of classifiers.
 
     :attr List[Classifier] classifiers: List of classifiers.
     """
 
+    __slots__ = ('classifiers',)
+
+    _fields = (
+        ModelField('classifiers', 'list', 'Classifier', required=True),
+    )
+
     def __init__(self, classifiers: List['Classifier']) -> None:
         """
         Initialize a Classifiers object.
@@ -1230,52 +951,8 @@ class Classifiers():
         """
         self.classifiers = classifiers
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Classifiers':
-        """Initialize a Classifiers object from a json dictionary."""
-        args = {}
-        if 'classifiers' in _dict:
-            args['classifiers'] = [
-                Classifier.from_dict(x) for x in _dict.get('classifiers')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'classifiers\' not present in Classifiers JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Classifiers object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'classifiers') and self.classifiers is not None:
-            _dict['classifiers'] = [x.to_dict() for x in self.classifiers]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Classifiers object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Classifiers') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Classifiers') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ErrorInfo():
+
+class ErrorInfo(Model):
     """
     Information about what might have caused a failure, such as an image that is too
     large. Not returned when there is no error.
@@ -1286,6 +963,14 @@ class ErrorInfo():
     :attr str error_id: Codified error string. For example, `limit_exceeded`.
     """
 
+    __slots__ = ('code', 'description', 'error_id')
+
+    _fields = (
+        ModelField('code', required=True),
+        ModelField('description', required=True),
+        ModelField('error_id', required=True),
+    )
+
     def __init__(self, code: int, description: str, error_id: str) -> None:
         """
         Initialize a ErrorInfo object.
@@ -1299,64 +984,8 @@ class ErrorInfo():
         self.description = description
         self.error_id = error_id
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ErrorInfo':
-        """Initialize a ErrorInfo object from a json dictionary."""
-        args = {}
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in ErrorInfo JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in ErrorInfo JSON'
-            )
-        if 'error_id' in _dict:
-            args['error_id'] = _dict.get('error_id')
-        else:
-            raise ValueError(
-                'Required property \'error_id\' not present in ErrorInfo JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ErrorInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'error_id') and self.error_id is not None:
-            _dict['error_id'] = self.error_id
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ErrorInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ErrorInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ErrorInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class WarningInfo():
+
+class WarningInfo(Model):
     """
     Information about something that went wrong.
 
@@ -1364,6 +993,13 @@ class WarningInfo():
     :attr str description: Information about the error.
     """
 
+    __slots__ = ('warning_id', 'description')
+
+    _fields = (
+        ModelField('warning_id', required=True),
+        ModelField('description', required=True),
+    )
+
     def __init__(self, warning_id: str, description: str) -> None:
         """
         Initialize a WarningInfo object.
@@ -1373,53 +1009,3 @@ class WarningInfo():
         """
         self.warning_id = warning_id
         self.description = description
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'WarningInfo':
-        """Initialize a WarningInfo object from a json dictionary."""
-        args = {}
-        if 'warning_id' in _dict:
-            args['warning_id'] = _dict.get('warning_id')
-        else:
-            raise ValueError(
-                'Required property \'warning_id\' not present in WarningInfo JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in WarningInfo JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a WarningInfo object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'warning_id') and self.warning_id is not None:
-            _dict['warning_id'] = self.warning_id
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this WarningInfo object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'WarningInfo') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'WarningInfo') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
@@ -30,22 +30,24 @@ See: https://cloud.ibm.com/docs/visual-recognition?topic=visual-recognition-obje
 from datetime import date
 from datetime import datetime
 from enum import Enum
-from typing import BinaryIO, Dict, List
-import json
+from typing import BinaryIO, List
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .common import get_operation_ids, get_sdk_headers, prebuild_sdk_headers
+from .connection_pool import ConnectionPoolConfig
+from .model import Model, ModelField
+from .watson_service import AsyncWatsonService, WatsonService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class VisualRecognitionV4(BaseService):
+class VisualRecognitionV4(WatsonService):
     """The Visual Recognition V4 service."""
 
     DEFAULT_SERVICE_URL = 'https://api.us-south.visual-recognition.watson.cloud.ibm.com'
@@ -56,6 +58,7 @@ class VisualRecognitionV4(BaseService):
         version: str,
         authenticator: Authenticator = None,
         service_name: str = DEFAULT_SERVICE_NAME,
+        connection_pool: ConnectionPoolConfig = None,
     ) -> None:
         """
         Construct a new client for the Visual Recognition service.
@@ -66,6 +69,9 @@ class VisualRecognitionV4(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
                about initializing the authenticator of your choice.
+
+        :param ConnectionPoolConfig connection_pool: (optional) The settings of
+               the HTTP connection pools of the service.
         """
         print(
             'warning: On 1 December 2021, Visual Recognition will no longer be available. For more information, see https://github.com/watson-developer-cloud/python-sdk/tree/master#visual-recognition-deprecation.'
@@ -75,11 +81,14 @@ class VisualRecognitionV4(BaseService):
 
         if not authenticator:
             authenticator = get_authenticator_from_environment(service_name)
-        BaseService.__init__(self,
-                             service_url=self.DEFAULT_SERVICE_URL,
-                             authenticator=authenticator)
+        WatsonService.__init__(self,
+                               service_url=self.DEFAULT_SERVICE_URL,
+                               authenticator=authenticator,
+                               connection_pool=connection_pool)
         self.version = version
         self.configure_service(service_name)
+        prebuild_sdk_headers(self.DEFAULT_SERVICE_NAME, 'V4',
+                             get_operation_ids(VisualRecognitionV4))
 
     #########################
     # Analysis
@@ -167,7 +176,7 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=AnalyzeResponse, **kwargs)
         return response
 
     #########################
@@ -216,7 +225,7 @@ class VisualRecognitionV4(BaseService):
             'training_status': training_status
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -230,7 +239,7 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def list_collections(self, **kwargs) -> DetailedResponse:
@@ -262,7 +271,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=CollectionsList, **kwargs)
         return response
 
     def get_collection(self, collection_id: str, **kwargs) -> DetailedResponse:
@@ -300,7 +309,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def update_collection(self,
@@ -347,7 +356,7 @@ class VisualRecognitionV4(BaseService):
             'training_status': training_status
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -364,7 +373,7 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def delete_collection(self, collection_id: str,
@@ -543,7 +552,7 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        files=form_data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ImageDetailsList, **kwargs)
         return response
 
     def list_images(self, collection_id: str, **kwargs) -> DetailedResponse:
@@ -581,7 +590,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ImageSummaryList, **kwargs)
         return response
 
     def get_image_details(self, collection_id: str, image_id: str,
@@ -624,7 +633,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ImageDetails, **kwargs)
         return response
 
     def delete_image(self, collection_id: str, image_id: str,
@@ -762,7 +771,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ObjectMetadataList, **kwargs)
         return response
 
     def update_object_metadata(self, collection_id: str, object: str,
@@ -799,7 +808,7 @@ class VisualRecognitionV4(BaseService):
 
         data = {'object': new_object}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -817,7 +826,9 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=UpdateObjectMetadata,
+                             **kwargs)
         return response
 
     def get_object_metadata(self, collection_id: str, object: str,
@@ -860,7 +871,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=ObjectMetadata, **kwargs)
         return response
 
     def delete_object(self, collection_id: str, object: str,
@@ -948,7 +959,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=Collection, **kwargs)
         return response
 
     def add_image_training_data(self,
@@ -993,7 +1004,7 @@ class VisualRecognitionV4(BaseService):
 
         data = {'objects': objects}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = self.get_json_codec().dumps(data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1011,7 +1022,9 @@ class VisualRecognitionV4(BaseService):
                                        params=params,
                                        data=data)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request,
+                             result_model=TrainingDataObjects,
+                             **kwargs)
         return response
 
     def get_training_usage(self,
@@ -1059,7 +1072,7 @@ class VisualRecognitionV4(BaseService):
                                        headers=headers,
                                        params=params)
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, result_model=TrainingEvents, **kwargs)
         return response
 
     #########################
@@ -1153,12 +1166,16 @@ class GetJpegImageEnums:
         THUMBNAIL = 'thumbnail'
 
 
+class AsyncVisualRecognitionV4(AsyncWatsonService, VisualRecognitionV4):
+    """The Visual Recognition V4 service, with operations that return awaitables."""
+
+
 ##############################################################################
 # Models
 ##############################################################################
 
 
-class AnalyzeResponse():
+class AnalyzeResponse(Model):
     """
     Results for all images.
 
@@ -1169,6 +1186,14 @@ class AnalyzeResponse():
           when an error or warning is returned.
     """
 
+    __slots__ = ('images', 'warnings', 'trace')
+
+    _fields = (
+        ModelField('images', 'list', 'Image', required=True),
+        ModelField('warnings', 'list', 'Warning'),
+        ModelField('trace'),
+    )
+
     def __init__(self,
                  images: List['Image'],
                  *,
@@ -1187,60 +1212,8 @@ class AnalyzeResponse():
         self.warnings = warnings
         self.trace = trace
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'AnalyzeResponse':
-        """Initialize a AnalyzeResponse object from a json dictionary."""
-        args = {}
-        if 'images' in _dict:
-            args['images'] = [Image.from_dict(x) for x in _dict.get('images')]
-        else:
-            raise ValueError(
-                'Required property \'images\' not present in AnalyzeResponse JSON'
-            )
-        if 'warnings' in _dict:
-            args['warnings'] = [
-                Warning.from_dict(x) for x in _dict.get('warnings')
-            ]
-        if 'trace' in _dict:
-            args['trace'] = _dict.get('trace')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a AnalyzeResponse object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'images') and self.images is not None:
-            _dict['images'] = [x.to_dict() for x in self.images]
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = [x.to_dict() for x in self.warnings]
-        if hasattr(self, 'trace') and self.trace is not None:
-            _dict['trace'] = self.trace
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this AnalyzeResponse object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'AnalyzeResponse') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'AnalyzeResponse') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Collection():
+
+class Collection(Model):
     """
     Details about a collection.
 
@@ -1256,6 +1229,20 @@ class Collection():
           the collection.
     """
 
+    __slots__ = ('collection_id', 'name', 'description', 'created', 'updated',
+                 'image_count', 'training_status')
+
+    _fields = (
+        ModelField('collection_id', required=True),
+        ModelField('name', required=True),
+        ModelField('description', required=True),
+        ModelField('created', 'datetime', required=True),
+        ModelField('updated', 'datetime', required=True),
+        ModelField('image_count', required=True),
+        ModelField('training_status', 'model', 'CollectionTrainingStatus',
+                   required=True),
+    )
+
     def __init__(self, collection_id: str, name: str, description: str,
                  created: datetime, updated: datetime, image_count: int,
                  training_status: 'CollectionTrainingStatus') -> None:
@@ -1281,99 +1268,8 @@ class Collection():
         self.image_count = image_count
         self.training_status = training_status
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Collection':
-        """Initialize a Collection object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in Collection JSON'
-            )
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in Collection JSON')
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in Collection JSON'
-            )
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        else:
-            raise ValueError(
-                'Required property \'created\' not present in Collection JSON')
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        else:
-            raise ValueError(
-                'Required property \'updated\' not present in Collection JSON')
-        if 'image_count' in _dict:
-            args['image_count'] = _dict.get('image_count')
-        else:
-            raise ValueError(
-                'Required property \'image_count\' not present in Collection JSON'
-            )
-        if 'training_status' in _dict:
-            args['training_status'] = CollectionTrainingStatus.from_dict(
-                _dict.get('training_status'))
-        else:
-            raise ValueError(
-                'Required property \'training_status\' not present in Collection JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Collection object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and getattr(
-                self, 'collection_id') is not None:
-            _dict['collection_id'] = getattr(self, 'collection_id')
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        if hasattr(self, 'created') and getattr(self, 'created') is not None:
-            _dict['created'] = datetime_to_string(getattr(self, 'created'))
-        if hasattr(self, 'updated') and getattr(self, 'updated') is not None:
-            _dict['updated'] = datetime_to_string(getattr(self, 'updated'))
-        if hasattr(self, 'image_count') and getattr(self,
-                                                    'image_count') is not None:
-            _dict['image_count'] = getattr(self, 'image_count')
-        if hasattr(self,
-                   'training_status') and self.training_status is not None:
-            _dict['training_status'] = self.training_status.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Collection object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Collection') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionObjects():
+
+class CollectionObjects(Model):
     """
     The objects in a collection that are detected in an image.
 
@@ -1381,6 +1277,13 @@ class CollectionObjects():
     :attr List[ObjectDetail] objects: The identified objects in a collection.
     """
 
+    __slots__ = ('collection_id', 'objects')
+
+    _fields = (
+        ModelField('collection_id', required=True),
+        ModelField('objects', 'list', 'ObjectDetail', required=True),
+    )
+
     def __init__(self, collection_id: str,
                  objects: List['ObjectDetail']) -> None:
         """
@@ -1392,60 +1295,8 @@ class CollectionObjects():
         self.collection_id = collection_id
         self.objects = objects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionObjects':
-        """Initialize a CollectionObjects object from a json dictionary."""
-        args = {}
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        else:
-            raise ValueError(
-                'Required property \'collection_id\' not present in CollectionObjects JSON'
-            )
-        if 'objects' in _dict:
-            args['objects'] = [
-                ObjectDetail.from_dict(x) for x in _dict.get('objects')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'objects\' not present in CollectionObjects JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionObjects object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = [x.to_dict() for x in self.objects]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionObjects object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionObjects') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionObjects') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionTrainingStatus():
+
+class CollectionTrainingStatus(Model):
     """
     Training status information for the collection.
 
@@ -1453,6 +1304,12 @@ class CollectionTrainingStatus():
           collection.
     """
 
+    __slots__ = ('objects',)
+
+    _fields = (
+        ModelField('objects', 'model', 'ObjectTrainingStatus', required=True),
+    )
+
     def __init__(self, objects: 'ObjectTrainingStatus') -> None:
         """
         Initialize a CollectionTrainingStatus object.
@@ -1462,57 +1319,20 @@ class CollectionTrainingStatus():
         """
         self.objects = objects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionTrainingStatus':
-        """Initialize a CollectionTrainingStatus object from a json dictionary."""
-        args = {}
-        if 'objects' in _dict:
-            args['objects'] = ObjectTrainingStatus.from_dict(
-                _dict.get('objects'))
-        else:
-            raise ValueError(
-                'Required property \'objects\' not present in CollectionTrainingStatus JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionTrainingStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = self.objects.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionTrainingStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionTrainingStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionTrainingStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class CollectionsList():
+
+class CollectionsList(Model):
     """
     A container for the list of collections.
 
     :attr List[Collection] collections: The collections in this service instance.
     """
 
+    __slots__ = ('collections',)
+
+    _fields = (
+        ModelField('collections', 'list', 'Collection', required=True),
+    )
+
     def __init__(self, collections: List['Collection']) -> None:
         """
         Initialize a CollectionsList object.
@@ -1522,52 +1342,8 @@ class CollectionsList():
         """
         self.collections = collections
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'CollectionsList':
-        """Initialize a CollectionsList object from a json dictionary."""
-        args = {}
-        if 'collections' in _dict:
-            args['collections'] = [
-                Collection.from_dict(x) for x in _dict.get('collections')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'collections\' not present in CollectionsList JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a CollectionsList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collections') and self.collections is not None:
-            _dict['collections'] = [x.to_dict() for x in self.collections]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this CollectionsList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'CollectionsList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'CollectionsList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class DetectedObjects():
+
+class DetectedObjects(Model):
     """
     Container for the list of collections that have objects detected in an image.
 
@@ -1575,6 +1351,12 @@ class DetectedObjects():
           identified objects.
     """
 
+    __slots__ = ('collections',)
+
+    _fields = (
+        ModelField('collections', 'list', 'CollectionObjects'),
+    )
+
     def __init__(self,
                  *,
                  collections: List['CollectionObjects'] = None) -> None:
@@ -1586,48 +1368,8 @@ class DetectedObjects():
         """
         self.collections = collections
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'DetectedObjects':
-        """Initialize a DetectedObjects object from a json dictionary."""
-        args = {}
-        if 'collections' in _dict:
-            args['collections'] = [
-                CollectionObjects.from_dict(x) for x in _dict.get('collections')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a DetectedObjects object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'collections') and self.collections is not None:
-            _dict['collections'] = [x.to_dict() for x in self.collections]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this DetectedObjects object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'DetectedObjects') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'DetectedObjects') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Error():
+
+class Error(Model):
     """
     Details about an error.
 
@@ -1638,6 +1380,15 @@ class Error():
           problem.
     """
 
+    __slots__ = ('code', 'message', 'more_info', 'target')
+
+    _fields = (
+        ModelField('code', required=True),
+        ModelField('message', required=True),
+        ModelField('more_info'),
+        ModelField('target', 'model', 'ErrorTarget'),
+    )
+
     def __init__(self,
                  code: str,
                  message: str,
@@ -1659,62 +1410,6 @@ class Error():
         self.more_info = more_info
         self.target = target
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Error':
-        """Initialize a Error object from a json dictionary."""
-        args = {}
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in Error JSON')
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        else:
-            raise ValueError(
-                'Required property \'message\' not present in Error JSON')
-        if 'more_info' in _dict:
-            args['more_info'] = _dict.get('more_info')
-        if 'target' in _dict:
-            args['target'] = ErrorTarget.from_dict(_dict.get('target'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Error object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        if hasattr(self, 'more_info') and self.more_info is not None:
-            _dict['more_info'] = self.more_info
-        if hasattr(self, 'target') and self.target is not None:
-            _dict['target'] = self.target.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Error object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Error') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Error') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CodeEnum(str, Enum):
         """
         Identifier of the problem.
@@ -1726,7 +1421,7 @@ class Error():
         SERVER_ERROR = 'server_error'
 
 
-class ErrorTarget():
+class ErrorTarget(Model):
     """
     Details about the specific area of the problem.
 
@@ -1734,6 +1429,13 @@ class ErrorTarget():
     :attr str name: The property that is identified with the problem.
     """
 
+    __slots__ = ('type', 'name')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('name', required=True),
+    )
+
     def __init__(self, type: str, name: str) -> None:
         """
         Initialize a ErrorTarget object.
@@ -1745,54 +1447,6 @@ class ErrorTarget():
         self.type = type
         self.name = name
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ErrorTarget':
-        """Initialize a ErrorTarget object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in ErrorTarget JSON')
-        if 'name' in _dict:
-            args['name'] = _dict.get('name')
-        else:
-            raise ValueError(
-                'Required property \'name\' not present in ErrorTarget JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ErrorTarget object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'name') and self.name is not None:
-            _dict['name'] = self.name
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ErrorTarget object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ErrorTarget') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ErrorTarget') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The parameter or property that is the focus of the problem.
@@ -1802,7 +1456,7 @@ class ErrorTarget():
         HEADER = 'header'
 
 
-class Image():
+class Image(Model):
     """
     Details about an image.
 
@@ -1814,6 +1468,15 @@ class Image():
           request.
     """
 
+    __slots__ = ('source', 'dimensions', 'objects', 'errors')
+
+    _fields = (
+        ModelField('source', 'model', 'ImageSource', required=True),
+        ModelField('dimensions', 'model', 'ImageDimensions', required=True),
+        ModelField('objects', 'model', 'DetectedObjects', required=True),
+        ModelField('errors', 'list', 'Error'),
+    )
+
     def __init__(self,
                  source: 'ImageSource',
                  dimensions: 'ImageDimensions',
@@ -1835,68 +1498,8 @@ class Image():
         self.objects = objects
         self.errors = errors
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Image':
-        """Initialize a Image object from a json dictionary."""
-        args = {}
-        if 'source' in _dict:
-            args['source'] = ImageSource.from_dict(_dict.get('source'))
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in Image JSON')
-        if 'dimensions' in _dict:
-            args['dimensions'] = ImageDimensions.from_dict(
-                _dict.get('dimensions'))
-        else:
-            raise ValueError(
-                'Required property \'dimensions\' not present in Image JSON')
-        if 'objects' in _dict:
-            args['objects'] = DetectedObjects.from_dict(_dict.get('objects'))
-        else:
-            raise ValueError(
-                'Required property \'objects\' not present in Image JSON')
-        if 'errors' in _dict:
-            args['errors'] = [Error.from_dict(x) for x in _dict.get('errors')]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Image object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source.to_dict()
-        if hasattr(self, 'dimensions') and self.dimensions is not None:
-            _dict['dimensions'] = self.dimensions.to_dict()
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = self.objects.to_dict()
-        if hasattr(self, 'errors') and self.errors is not None:
-            _dict['errors'] = [x.to_dict() for x in self.errors]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Image object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Image') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Image') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ImageDetails():
+
+class ImageDetails(Model):
     """
     Details about an image.
 
@@ -1912,6 +1515,19 @@ class ImageDetails():
           objects.
     """
 
+    __slots__ = ('image_id', 'updated', 'created', 'source', 'dimensions',
+                 'errors', 'training_data')
+
+    _fields = (
+        ModelField('image_id'),
+        ModelField('updated', 'datetime'),
+        ModelField('created', 'datetime'),
+        ModelField('source', 'model', 'ImageSource', required=True),
+        ModelField('dimensions', 'model', 'ImageDimensions'),
+        ModelField('errors', 'list', 'Error'),
+        ModelField('training_data', 'model', 'TrainingDataObjects'),
+    )
+
     def __init__(self,
                  source: 'ImageSource',
                  *,
@@ -1943,75 +1559,8 @@ class ImageDetails():
         self.errors = errors
         self.training_data = training_data
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageDetails':
-        """Initialize a ImageDetails object from a json dictionary."""
-        args = {}
-        if 'image_id' in _dict:
-            args['image_id'] = _dict.get('image_id')
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
-        if 'source' in _dict:
-            args['source'] = ImageSource.from_dict(_dict.get('source'))
-        else:
-            raise ValueError(
-                'Required property \'source\' not present in ImageDetails JSON')
-        if 'dimensions' in _dict:
-            args['dimensions'] = ImageDimensions.from_dict(
-                _dict.get('dimensions'))
-        if 'errors' in _dict:
-            args['errors'] = [Error.from_dict(x) for x in _dict.get('errors')]
-        if 'training_data' in _dict:
-            args['training_data'] = TrainingDataObjects.from_dict(
-                _dict.get('training_data'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageDetails object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'image_id') and self.image_id is not None:
-            _dict['image_id'] = self.image_id
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = datetime_to_string(self.updated)
-        if hasattr(self, 'created') and self.created is not None:
-            _dict['created'] = datetime_to_string(self.created)
-        if hasattr(self, 'source') and self.source is not None:
-            _dict['source'] = self.source.to_dict()
-        if hasattr(self, 'dimensions') and self.dimensions is not None:
-            _dict['dimensions'] = self.dimensions.to_dict()
-        if hasattr(self, 'errors') and self.errors is not None:
-            _dict['errors'] = [x.to_dict() for x in self.errors]
-        if hasattr(self, 'training_data') and self.training_data is not None:
-            _dict['training_data'] = self.training_data.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageDetails object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageDetails') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageDetails') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ImageDetailsList():
+
+class ImageDetailsList(Model):
     """
     List of information about the images.
 
@@ -2022,6 +1571,14 @@ class ImageDetailsList():
           when an error or warning is returned.
     """
 
+    __slots__ = ('images', 'warnings', 'trace')
+
+    _fields = (
+        ModelField('images', 'list', 'ImageDetails'),
+        ModelField('warnings', 'list', 'Warning'),
+        ModelField('trace'),
+    )
+
     def __init__(self,
                  *,
                  images: List['ImageDetails'] = None,
@@ -2040,58 +1597,8 @@ class ImageDetailsList():
         self.warnings = warnings
         self.trace = trace
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageDetailsList':
-        """Initialize a ImageDetailsList object from a json dictionary."""
-        args = {}
-        if 'images' in _dict:
-            args['images'] = [
-                ImageDetails.from_dict(x) for x in _dict.get('images')
-            ]
-        if 'warnings' in _dict:
-            args['warnings'] = [
-                Warning.from_dict(x) for x in _dict.get('warnings')
-            ]
-        if 'trace' in _dict:
-            args['trace'] = _dict.get('trace')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageDetailsList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'images') and self.images is not None:
-            _dict['images'] = [x.to_dict() for x in self.images]
-        if hasattr(self, 'warnings') and self.warnings is not None:
-            _dict['warnings'] = [x.to_dict() for x in self.warnings]
-        if hasattr(self, 'trace') and self.trace is not None:
-            _dict['trace'] = self.trace
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageDetailsList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageDetailsList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageDetailsList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ImageDimensions():
+
+class ImageDimensions(Model):
     """
     Height and width of an image.
 
@@ -2099,6 +1606,13 @@ class ImageDimensions():
     :attr int width: (optional) Width in pixels of the image.
     """
 
+    __slots__ = ('height', 'width')
+
+    _fields = (
+        ModelField('height'),
+        ModelField('width'),
+    )
+
     def __init__(self, *, height: int = None, width: int = None) -> None:
         """
         Initialize a ImageDimensions object.
@@ -2109,50 +1623,8 @@ class ImageDimensions():
         self.height = height
         self.width = width
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageDimensions':
-        """Initialize a ImageDimensions object from a json dictionary."""
-        args = {}
-        if 'height' in _dict:
-            args['height'] = _dict.get('height')
-        if 'width' in _dict:
-            args['width'] = _dict.get('width')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageDimensions object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'height') and self.height is not None:
-            _dict['height'] = self.height
-        if hasattr(self, 'width') and self.width is not None:
-            _dict['width'] = self.width
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageDimensions object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageDimensions') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageDimensions') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ImageSource():
+
+class ImageSource(Model):
     """
     The source type of the image.
 
@@ -2167,6 +1639,17 @@ class ImageSource():
           redirects are followed. Not returned when the image is uploaded.
     """
 
+    __slots__ = ('type', 'filename', 'archive_filename', 'source_url',
+                 'resolved_url')
+
+    _fields = (
+        ModelField('type', required=True),
+        ModelField('filename'),
+        ModelField('archive_filename'),
+        ModelField('source_url'),
+        ModelField('resolved_url'),
+    )
+
     def __init__(self,
                  type: str,
                  *,
@@ -2193,64 +1676,6 @@ class ImageSource():
         self.source_url = source_url
         self.resolved_url = resolved_url
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageSource':
-        """Initialize a ImageSource object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        else:
-            raise ValueError(
-                'Required property \'type\' not present in ImageSource JSON')
-        if 'filename' in _dict:
-            args['filename'] = _dict.get('filename')
-        if 'archive_filename' in _dict:
-            args['archive_filename'] = _dict.get('archive_filename')
-        if 'source_url' in _dict:
-            args['source_url'] = _dict.get('source_url')
-        if 'resolved_url' in _dict:
-            args['resolved_url'] = _dict.get('resolved_url')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageSource object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'filename') and self.filename is not None:
-            _dict['filename'] = self.filename
-        if hasattr(self,
-                   'archive_filename') and self.archive_filename is not None:
-            _dict['archive_filename'] = self.archive_filename
-        if hasattr(self, 'source_url') and self.source_url is not None:
-            _dict['source_url'] = self.source_url
-        if hasattr(self, 'resolved_url') and self.resolved_url is not None:
-            _dict['resolved_url'] = self.resolved_url
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageSource object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageSource') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageSource') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         The source type of the image.
@@ -2259,7 +1684,7 @@ class ImageSource():
         URL = 'url'
 
 
-class ImageSummary():
+class ImageSummary(Model):
     """
     Basic information about an image.
 
@@ -2268,6 +1693,13 @@ class ImageSummary():
           (UTC) that the image was most recently updated.
     """
 
+    __slots__ = ('image_id', 'updated')
+
+    _fields = (
+        ModelField('image_id'),
+        ModelField('updated', 'datetime'),
+    )
+
     def __init__(self,
                  *,
                  image_id: str = None,
@@ -2282,56 +1714,20 @@ class ImageSummary():
         self.image_id = image_id
         self.updated = updated
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageSummary':
-        """Initialize a ImageSummary object from a json dictionary."""
-        args = {}
-        if 'image_id' in _dict:
-            args['image_id'] = _dict.get('image_id')
-        if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageSummary object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'image_id') and self.image_id is not None:
-            _dict['image_id'] = self.image_id
-        if hasattr(self, 'updated') and self.updated is not None:
-            _dict['updated'] = datetime_to_string(self.updated)
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageSummary object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageSummary') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageSummary') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ImageSummaryList():
+
+class ImageSummaryList(Model):
     """
     List of images.
 
     :attr List[ImageSummary] images: The images in the collection.
     """
 
+    __slots__ = ('images',)
+
+    _fields = (
+        ModelField('images', 'list', 'ImageSummary', required=True),
+    )
+
     def __init__(self, images: List['ImageSummary']) -> None:
         """
         Initialize a ImageSummaryList object.
@@ -2340,52 +1736,8 @@ class ImageSummaryList():
         """
         self.images = images
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ImageSummaryList':
-        """Initialize a ImageSummaryList object from a json dictionary."""
-        args = {}
-        if 'images' in _dict:
-            args['images'] = [
-                ImageSummary.from_dict(x) for x in _dict.get('images')
-            ]
-        else:
-            raise ValueError(
-                'Required property \'images\' not present in ImageSummaryList JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ImageSummaryList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'images') and self.images is not None:
-            _dict['images'] = [x.to_dict() for x in self.images]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ImageSummaryList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ImageSummaryList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ImageSummaryList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Location():
+
+class Location(Model):
     """
     Defines the location of the bounding box around the object.
 
@@ -2395,6 +1747,15 @@ class Location():
     :attr int height: Height in pixels of the bounding box.
     """
 
+    __slots__ = ('top', 'left', 'width', 'height')
+
+    _fields = (
+        ModelField('top', required=True),
+        ModelField('left', required=True),
+        ModelField('width', required=True),
+        ModelField('height', required=True),
+    )
+
     def __init__(self, top: int, left: int, width: int, height: int) -> None:
         """
         Initialize a Location object.
@@ -2409,70 +1770,8 @@ class Location():
         self.width = width
         self.height = height
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Location':
-        """Initialize a Location object from a json dictionary."""
-        args = {}
-        if 'top' in _dict:
-            args['top'] = _dict.get('top')
-        else:
-            raise ValueError(
-                'Required property \'top\' not present in Location JSON')
-        if 'left' in _dict:
-            args['left'] = _dict.get('left')
-        else:
-            raise ValueError(
-                'Required property \'left\' not present in Location JSON')
-        if 'width' in _dict:
-            args['width'] = _dict.get('width')
-        else:
-            raise ValueError(
-                'Required property \'width\' not present in Location JSON')
-        if 'height' in _dict:
-            args['height'] = _dict.get('height')
-        else:
-            raise ValueError(
-                'Required property \'height\' not present in Location JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Location object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'top') and self.top is not None:
-            _dict['top'] = self.top
-        if hasattr(self, 'left') and self.left is not None:
-            _dict['left'] = self.left
-        if hasattr(self, 'width') and self.width is not None:
-            _dict['width'] = self.width
-        if hasattr(self, 'height') and self.height is not None:
-            _dict['height'] = self.height
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Location object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Location') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Location') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ObjectDetail():
+
+class ObjectDetail(Model):
     """
     Details about an object in the collection.
 
@@ -2484,6 +1783,14 @@ class ObjectDetail():
           location in the image.
     """
 
+    __slots__ = ('object', 'location', 'score')
+
+    _fields = (
+        ModelField('object', required=True),
+        ModelField('location', 'model', 'ObjectDetailLocation', required=True),
+        ModelField('score', required=True),
+    )
+
     def __init__(self, object: str, location: 'ObjectDetailLocation',
                  score: float) -> None:
         """
@@ -2500,65 +1807,8 @@ class ObjectDetail():
         self.location = location
         self.score = score
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ObjectDetail':
-        """Initialize a ObjectDetail object from a json dictionary."""
-        args = {}
-        if 'object' in _dict:
-            args['object'] = _dict.get('object')
-        else:
-            raise ValueError(
-                'Required property \'object\' not present in ObjectDetail JSON')
-        if 'location' in _dict:
-            args['location'] = ObjectDetailLocation.from_dict(
-                _dict.get('location'))
-        else:
-            raise ValueError(
-                'Required property \'location\' not present in ObjectDetail JSON'
-            )
-        if 'score' in _dict:
-            args['score'] = _dict.get('score')
-        else:
-            raise ValueError(
-                'Required property \'score\' not present in ObjectDetail JSON')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ObjectDetail object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'object') and self.object is not None:
-            _dict['object'] = self.object
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        if hasattr(self, 'score') and self.score is not None:
-            _dict['score'] = self.score
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ObjectDetail object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ObjectDetail') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ObjectDetail') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ObjectDetailLocation():
+
+class ObjectDetailLocation(Model):
     """
     Defines the location of the bounding box around the object.
 
@@ -2568,6 +1818,15 @@ class ObjectDetailLocation():
     :attr int height: Height in pixels of the bounding box.
     """
 
+    __slots__ = ('top', 'left', 'width', 'height')
+
+    _fields = (
+        ModelField('top', required=True),
+        ModelField('left', required=True),
+        ModelField('width', required=True),
+        ModelField('height', required=True),
+    )
+
     def __init__(self, top: int, left: int, width: int, height: int) -> None:
         """
         Initialize a ObjectDetailLocation object.
@@ -2582,74 +1841,8 @@ class ObjectDetailLocation():
         self.width = width
         self.height = height
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ObjectDetailLocation':
-        """Initialize a ObjectDetailLocation object from a json dictionary."""
-        args = {}
-        if 'top' in _dict:
-            args['top'] = _dict.get('top')
-        else:
-            raise ValueError(
-                'Required property \'top\' not present in ObjectDetailLocation JSON'
-            )
-        if 'left' in _dict:
-            args['left'] = _dict.get('left')
-        else:
-            raise ValueError(
-                'Required property \'left\' not present in ObjectDetailLocation JSON'
-            )
-        if 'width' in _dict:
-            args['width'] = _dict.get('width')
-        else:
-            raise ValueError(
-                'Required property \'width\' not present in ObjectDetailLocation JSON'
-            )
-        if 'height' in _dict:
-            args['height'] = _dict.get('height')
-        else:
-            raise ValueError(
-                'Required property \'height\' not present in ObjectDetailLocation JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ObjectDetailLocation object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'top') and self.top is not None:
-            _dict['top'] = self.top
-        if hasattr(self, 'left') and self.left is not None:
-            _dict['left'] = self.left
-        if hasattr(self, 'width') and self.width is not None:
-            _dict['width'] = self.width
-        if hasattr(self, 'height') and self.height is not None:
-            _dict['height'] = self.height
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ObjectDetailLocation object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ObjectDetailLocation') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ObjectDetailLocation') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ObjectMetadata():
+
+class ObjectMetadata(Model):
     """
     Basic information about an object.
 
@@ -2658,6 +1851,13 @@ class ObjectMetadata():
           the collection.
     """
 
+    __slots__ = ('object', 'count')
+
+    _fields = (
+        ModelField('object'),
+        ModelField('count'),
+    )
+
     def __init__(self, *, object: str = None, count: int = None) -> None:
         """
         Initialize a ObjectMetadata object.
@@ -2667,50 +1867,8 @@ class ObjectMetadata():
         self.object = object
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ObjectMetadata':
-        """Initialize a ObjectMetadata object from a json dictionary."""
-        args = {}
-        if 'object' in _dict:
-            args['object'] = _dict.get('object')
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ObjectMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'object') and self.object is not None:
-            _dict['object'] = self.object
-        if hasattr(self, 'count') and getattr(self, 'count') is not None:
-            _dict['count'] = getattr(self, 'count')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ObjectMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ObjectMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ObjectMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ObjectMetadataList():
+
+class ObjectMetadataList(Model):
     """
     List of objects.
 
@@ -2718,6 +1876,13 @@ class ObjectMetadataList():
     :attr List[ObjectMetadata] objects: (optional) The objects in the collection.
     """
 
+    __slots__ = ('object_count', 'objects')
+
+    _fields = (
+        ModelField('object_count', required=True),
+        ModelField('objects', 'list', 'ObjectMetadata'),
+    )
+
     def __init__(self,
                  object_count: int,
                  *,
@@ -2732,57 +1897,8 @@ class ObjectMetadataList():
         self.object_count = object_count
         self.objects = objects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ObjectMetadataList':
-        """Initialize a ObjectMetadataList object from a json dictionary."""
-        args = {}
-        if 'object_count' in _dict:
-            args['object_count'] = _dict.get('object_count')
-        else:
-            raise ValueError(
-                'Required property \'object_count\' not present in ObjectMetadataList JSON'
-            )
-        if 'objects' in _dict:
-            args['objects'] = [
-                ObjectMetadata.from_dict(x) for x in _dict.get('objects')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ObjectMetadataList object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'object_count') and getattr(
-                self, 'object_count') is not None:
-            _dict['object_count'] = getattr(self, 'object_count')
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = [x.to_dict() for x in self.objects]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ObjectMetadataList object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ObjectMetadataList') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ObjectMetadataList') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class ObjectTrainingStatus():
+
+class ObjectTrainingStatus(Model):
     """
     Training status for the objects in the collection.
 
@@ -2799,6 +1915,18 @@ class ObjectTrainingStatus():
           a success message or information about why training failed.
     """
 
+    __slots__ = ('ready', 'in_progress', 'data_changed', 'latest_failed',
+                 'rscnn_ready', 'description')
+
+    _fields = (
+        ModelField('ready', required=True),
+        ModelField('in_progress', required=True),
+        ModelField('data_changed', required=True),
+        ModelField('latest_failed', required=True),
+        ModelField('rscnn_ready', required=True),
+        ModelField('description', required=True),
+    )
+
     def __init__(self, ready: bool, in_progress: bool, data_changed: bool,
                  latest_failed: bool, rscnn_ready: bool,
                  description: str) -> None:
@@ -2825,90 +1953,8 @@ class ObjectTrainingStatus():
         self.rscnn_ready = rscnn_ready
         self.description = description
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'ObjectTrainingStatus':
-        """Initialize a ObjectTrainingStatus object from a json dictionary."""
-        args = {}
-        if 'ready' in _dict:
-            args['ready'] = _dict.get('ready')
-        else:
-            raise ValueError(
-                'Required property \'ready\' not present in ObjectTrainingStatus JSON'
-            )
-        if 'in_progress' in _dict:
-            args['in_progress'] = _dict.get('in_progress')
-        else:
-            raise ValueError(
-                'Required property \'in_progress\' not present in ObjectTrainingStatus JSON'
-            )
-        if 'data_changed' in _dict:
-            args['data_changed'] = _dict.get('data_changed')
-        else:
-            raise ValueError(
-                'Required property \'data_changed\' not present in ObjectTrainingStatus JSON'
-            )
-        if 'latest_failed' in _dict:
-            args['latest_failed'] = _dict.get('latest_failed')
-        else:
-            raise ValueError(
-                'Required property \'latest_failed\' not present in ObjectTrainingStatus JSON'
-            )
-        if 'rscnn_ready' in _dict:
-            args['rscnn_ready'] = _dict.get('rscnn_ready')
-        else:
-            raise ValueError(
-                'Required property \'rscnn_ready\' not present in ObjectTrainingStatus JSON'
-            )
-        if 'description' in _dict:
-            args['description'] = _dict.get('description')
-        else:
-            raise ValueError(
-                'Required property \'description\' not present in ObjectTrainingStatus JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a ObjectTrainingStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'ready') and self.ready is not None:
-            _dict['ready'] = self.ready
-        if hasattr(self, 'in_progress') and self.in_progress is not None:
-            _dict['in_progress'] = self.in_progress
-        if hasattr(self, 'data_changed') and self.data_changed is not None:
-            _dict['data_changed'] = self.data_changed
-        if hasattr(self, 'latest_failed') and self.latest_failed is not None:
-            _dict['latest_failed'] = self.latest_failed
-        if hasattr(self, 'rscnn_ready') and self.rscnn_ready is not None:
-            _dict['rscnn_ready'] = self.rscnn_ready
-        if hasattr(self, 'description') and self.description is not None:
-            _dict['description'] = self.description
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this ObjectTrainingStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'ObjectTrainingStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'ObjectTrainingStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingDataObject():
+
+class TrainingDataObject(Model):
     """
     Details about the training data.
 
@@ -2917,6 +1963,13 @@ class TrainingDataObject():
           around the object.
     """
 
+    __slots__ = ('object', 'location')
+
+    _fields = (
+        ModelField('object'),
+        ModelField('location', 'model', 'Location'),
+    )
+
     def __init__(self,
                  *,
                  object: str = None,
@@ -2931,50 +1984,8 @@ class TrainingDataObject():
         self.object = object
         self.location = location
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingDataObject':
-        """Initialize a TrainingDataObject object from a json dictionary."""
-        args = {}
-        if 'object' in _dict:
-            args['object'] = _dict.get('object')
-        if 'location' in _dict:
-            args['location'] = Location.from_dict(_dict.get('location'))
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingDataObject object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'object') and self.object is not None:
-            _dict['object'] = self.object
-        if hasattr(self, 'location') and self.location is not None:
-            _dict['location'] = self.location.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingDataObject object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingDataObject') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingDataObject') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingDataObjects():
+
+class TrainingDataObjects(Model):
     """
     Training data for all objects.
 
@@ -2982,6 +1993,12 @@ class TrainingDataObjects():
           objects.
     """
 
+    __slots__ = ('objects',)
+
+    _fields = (
+        ModelField('objects', 'list', 'TrainingDataObject'),
+    )
+
     def __init__(self, *, objects: List['TrainingDataObject'] = None) -> None:
         """
         Initialize a TrainingDataObjects object.
@@ -2991,48 +2008,8 @@ class TrainingDataObjects():
         """
         self.objects = objects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingDataObjects':
-        """Initialize a TrainingDataObjects object from a json dictionary."""
-        args = {}
-        if 'objects' in _dict:
-            args['objects'] = [
-                TrainingDataObject.from_dict(x) for x in _dict.get('objects')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingDataObjects object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = [x.to_dict() for x in self.objects]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingDataObjects object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingDataObjects') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingDataObjects') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingEvent():
+
+class TrainingEvent(Model):
     """
     Details about the training event.
 
@@ -3046,6 +2023,17 @@ class TrainingEvent():
           training for this training event.
     """
 
+    __slots__ = ('type', 'collection_id', 'completion_time', 'status',
+                 'image_count')
+
+    _fields = (
+        ModelField('type'),
+        ModelField('collection_id'),
+        ModelField('completion_time', 'datetime'),
+        ModelField('status'),
+        ModelField('image_count'),
+    )
+
     def __init__(self,
                  *,
                  type: str = None,
@@ -3071,62 +2059,6 @@ class TrainingEvent():
         self.status = status
         self.image_count = image_count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingEvent':
-        """Initialize a TrainingEvent object from a json dictionary."""
-        args = {}
-        if 'type' in _dict:
-            args['type'] = _dict.get('type')
-        if 'collection_id' in _dict:
-            args['collection_id'] = _dict.get('collection_id')
-        if 'completion_time' in _dict:
-            args['completion_time'] = string_to_datetime(
-                _dict.get('completion_time'))
-        if 'status' in _dict:
-            args['status'] = _dict.get('status')
-        if 'image_count' in _dict:
-            args['image_count'] = _dict.get('image_count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingEvent object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'type') and self.type is not None:
-            _dict['type'] = self.type
-        if hasattr(self, 'collection_id') and self.collection_id is not None:
-            _dict['collection_id'] = self.collection_id
-        if hasattr(self,
-                   'completion_time') and self.completion_time is not None:
-            _dict['completion_time'] = datetime_to_string(self.completion_time)
-        if hasattr(self, 'status') and self.status is not None:
-            _dict['status'] = self.status
-        if hasattr(self, 'image_count') and self.image_count is not None:
-            _dict['image_count'] = self.image_count
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingEvent object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingEvent') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingEvent') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class TypeEnum(str, Enum):
         """
         Trained object type. Only `objects` is currently supported.
@@ -3141,7 +2073,7 @@ class TrainingEvent():
         SUCCEEDED = 'succeeded'
 
 
-class TrainingEvents():
+class TrainingEvents(Model):
     """
     Details about the training events.
 
@@ -3159,6 +2091,17 @@ class TrainingEvents():
           the start and end time.
     """
 
+    __slots__ = ('start_time', 'end_time', 'completed_events', 'trained_images',
+                 'events')
+
+    _fields = (
+        ModelField('start_time', 'datetime'),
+        ModelField('end_time', 'datetime'),
+        ModelField('completed_events'),
+        ModelField('trained_images'),
+        ModelField('events', 'list', 'TrainingEvent'),
+    )
+
     def __init__(self,
                  *,
                  start_time: datetime = None,
@@ -3188,65 +2131,8 @@ class TrainingEvents():
         self.trained_images = trained_images
         self.events = events
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingEvents':
-        """Initialize a TrainingEvents object from a json dictionary."""
-        args = {}
-        if 'start_time' in _dict:
-            args['start_time'] = string_to_datetime(_dict.get('start_time'))
-        if 'end_time' in _dict:
-            args['end_time'] = string_to_datetime(_dict.get('end_time'))
-        if 'completed_events' in _dict:
-            args['completed_events'] = _dict.get('completed_events')
-        if 'trained_images' in _dict:
-            args['trained_images'] = _dict.get('trained_images')
-        if 'events' in _dict:
-            args['events'] = [
-                TrainingEvent.from_dict(x) for x in _dict.get('events')
-            ]
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingEvents object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'start_time') and self.start_time is not None:
-            _dict['start_time'] = datetime_to_string(self.start_time)
-        if hasattr(self, 'end_time') and self.end_time is not None:
-            _dict['end_time'] = datetime_to_string(self.end_time)
-        if hasattr(self,
-                   'completed_events') and self.completed_events is not None:
-            _dict['completed_events'] = self.completed_events
-        if hasattr(self, 'trained_images') and self.trained_images is not None:
-            _dict['trained_images'] = self.trained_images
-        if hasattr(self, 'events') and self.events is not None:
-            _dict['events'] = [x.to_dict() for x in self.events]
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingEvents object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingEvents') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingEvents') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class TrainingStatus():
+
+class TrainingStatus(Model):
     """
     Training status information for the collection.
 
@@ -3254,6 +2140,12 @@ class TrainingStatus():
           collection.
     """
 
+    __slots__ = ('objects',)
+
+    _fields = (
+        ModelField('objects', 'model', 'ObjectTrainingStatus', required=True),
+    )
+
     def __init__(self, objects: 'ObjectTrainingStatus') -> None:
         """
         Initialize a TrainingStatus object.
@@ -3263,51 +2155,8 @@ class TrainingStatus():
         """
         self.objects = objects
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'TrainingStatus':
-        """Initialize a TrainingStatus object from a json dictionary."""
-        args = {}
-        if 'objects' in _dict:
-            args['objects'] = ObjectTrainingStatus.from_dict(
-                _dict.get('objects'))
-        else:
-            raise ValueError(
-                'Required property \'objects\' not present in TrainingStatus JSON'
-            )
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a TrainingStatus object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'objects') and self.objects is not None:
-            _dict['objects'] = self.objects.to_dict()
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this TrainingStatus object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'TrainingStatus') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'TrainingStatus') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class UpdateObjectMetadata():
+
+class UpdateObjectMetadata(Model):
     """
     Basic information about an updated object.
 
@@ -3318,6 +2167,13 @@ class UpdateObjectMetadata():
           updated object name.
     """
 
+    __slots__ = ('object', 'count')
+
+    _fields = (
+        ModelField('object', required=True),
+        ModelField('count'),
+    )
+
     def __init__(self, object: str, *, count: int = None) -> None:
         """
         Initialize a UpdateObjectMetadata object.
@@ -3329,54 +2185,8 @@ class UpdateObjectMetadata():
         self.object = object
         self.count = count
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'UpdateObjectMetadata':
-        """Initialize a UpdateObjectMetadata object from a json dictionary."""
-        args = {}
-        if 'object' in _dict:
-            args['object'] = _dict.get('object')
-        else:
-            raise ValueError(
-                'Required property \'object\' not present in UpdateObjectMetadata JSON'
-            )
-        if 'count' in _dict:
-            args['count'] = _dict.get('count')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a UpdateObjectMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'object') and self.object is not None:
-            _dict['object'] = self.object
-        if hasattr(self, 'count') and getattr(self, 'count') is not None:
-            _dict['count'] = getattr(self, 'count')
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this UpdateObjectMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'UpdateObjectMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'UpdateObjectMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
-
-class Warning():
+
+class Warning(Model):
     """
     Details about a problem.
 
@@ -3385,6 +2195,14 @@ class Warning():
     :attr str more_info: (optional) A URL for more information about the solution.
     """
 
+    __slots__ = ('code', 'message', 'more_info')
+
+    _fields = (
+        ModelField('code', required=True),
+        ModelField('message', required=True),
+        ModelField('more_info'),
+    )
+
     def __init__(self,
                  code: str,
                  message: str,
@@ -3402,58 +2220,6 @@ class Warning():
         self.message = message
         self.more_info = more_info
 
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'Warning':
-        """Initialize a Warning object from a json dictionary."""
-        args = {}
-        if 'code' in _dict:
-            args['code'] = _dict.get('code')
-        else:
-            raise ValueError(
-                'Required property \'code\' not present in Warning JSON')
-        if 'message' in _dict:
-            args['message'] = _dict.get('message')
-        else:
-            raise ValueError(
-                'Required property \'message\' not present in Warning JSON')
-        if 'more_info' in _dict:
-            args['more_info'] = _dict.get('more_info')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a Warning object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'code') and self.code is not None:
-            _dict['code'] = self.code
-        if hasattr(self, 'message') and self.message is not None:
-            _dict['message'] = self.message
-        if hasattr(self, 'more_info') and self.more_info is not None:
-            _dict['more_info'] = self.more_info
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this Warning object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'Warning') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'Warning') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
-
     class CodeEnum(str, Enum):
         """
         Identifier of the problem.
@@ -3465,7 +2231,7 @@ class Warning():
         SERVER_ERROR = 'server_error'
 
 
-class FileWithMetadata():
+class FileWithMetadata(Model):
     """
     A file with its associated metadata.
 
@@ -3474,6 +2240,14 @@ class FileWithMetadata():
     :attr str content_type: (optional) The content type of the file.
     """
 
+    __slots__ = ('data', 'filename', 'content_type')
+
+    _fields = (
+        ModelField('data', required=True),
+        ModelField('filename'),
+        ModelField('content_type'),
+    )
+
     def __init__(self,
                  data: BinaryIO,
                  *,
@@ -3489,53 +2263,3 @@ class FileWithMetadata():
         self.data = data
         self.filename = filename
         self.content_type = content_type
-
-    @classmethod
-    def from_dict(cls, _dict: Dict) -> 'FileWithMetadata':
-        """Initialize a FileWithMetadata object from a json dictionary."""
-        args = {}
-        if 'data' in _dict:
-            args['data'] = _dict.get('data')
-        else:
-            raise ValueError(
-                'Required property \'data\' not present in FileWithMetadata JSON'
-            )
-        if 'filename' in _dict:
-            args['filename'] = _dict.get('filename')
-        if 'content_type' in _dict:
-            args['content_type'] = _dict.get('content_type')
-        return cls(**args)
-
-    @classmethod
-    def _from_dict(cls, _dict):
-        """Initialize a FileWithMetadata object from a json dictionary."""
-        return cls.from_dict(_dict)
-
-    def to_dict(self) -> Dict:
-        """Return a json dictionary representing this model."""
-        _dict = {}
-        if hasattr(self, 'data') and self.data is not None:
-            _dict['data'] = self.data
-        if hasattr(self, 'filename') and self.filename is not None:
-            _dict['filename'] = self.filename
-        if hasattr(self, 'content_type') and self.content_type is not None:
-            _dict['content_type'] = self.content_type
-        return _dict
-
-    def _to_dict(self):
-        """Return a json dictionary representing this model."""
-        return self.to_dict()
-
-    def __str__(self) -> str:
-        """Return a `str` version of this FileWithMetadata object."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    def __eq__(self, other: 'FileWithMetadata') -> bool:
-        """Return `true` when self and other are equal, false otherwise."""
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other: 'FileWithMetadata') -> bool:
-        """Return `true` when self and other are not equal, false otherwise."""
-        return not self == other
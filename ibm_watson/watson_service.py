@@ -0,0 +1,1131 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Behaviour shared by all of the generated Watson service classes.
+"""
+
+import asyncio
+import copy
+import gzip
+import os
+import re
+import socket
+import threading
+import time
+from typing import (TYPE_CHECKING, AsyncIterator, Awaitable, BinaryIO,
+                    Callable, Optional, Tuple, Union)
+from urllib.parse import urlencode
+
+import requests
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import Authenticator, NoAuthAuthenticator
+from ibm_cloud_sdk_core.utils import convert_model
+
+from .common import get_operation_ids, get_retry_after
+from .compression import (DEFAULT_LEVEL, DEFAULT_MIN_SIZE, GzipBody,
+                          should_compress)
+from .connection_pool import ConnectionPoolConfig, PooledHTTPAdapter
+from .download import CHUNK_SIZE, AsyncDownload, Download
+from .instrumentation import Instrumentation, RequestEvent
+from .json_codec import JsonCodec, get_default_json_codec, get_json_codec
+from .multipart import MultipartEncoder
+from .rate_limit import RateLimiter
+from .response_cache import CacheEntry, ResponseCache
+from .result_cache import ResultCache
+from .websocket.async_websocket import AsyncWebSocket
+
+if TYPE_CHECKING:
+    import httpx
+
+# application/json, and structured syntax suffixes such as application/ld+json
+_JSON_MIMETYPE = re.compile(r'^application/(\S+\+)?json\s*(;|$)', re.IGNORECASE)
+
+
+class WatsonService(BaseService):
+    """
+    Common base class of the Watson services.
+
+    Extends `ibm_cloud_sdk_core.BaseService` with features that apply to every
+    operation of every service.
+    """
+
+    def __init__(self,
+                 *,
+                 service_url: str = None,
+                 authenticator: Authenticator = None,
+                 disable_ssl_verification: bool = False,
+                 connection_pool: ConnectionPoolConfig = None) -> None:
+        self.connection_pool = None
+        BaseService.__init__(self,
+                             service_url=service_url,
+                             authenticator=authenticator,
+                             disable_ssl_verification=disable_ssl_verification)
+        self.json_codec = None
+        self.response_model = False
+        self.rate_limiter = None
+        self.response_cache = None
+        self.result_cache = None
+        self.instrumentations = ()
+        self.compression_min_size = None
+        self.compression_level = DEFAULT_LEVEL
+        if connection_pool is not None:
+            self.set_connection_pool(connection_pool)
+
+    def set_connection_pool(self, connection_pool: ConnectionPoolConfig) -> None:
+        """
+        Apply connection pool settings to the HTTP client of the service.
+
+        :param ConnectionPoolConfig connection_pool: The pool settings. With
+               `shared=True`, the service uses the same connections as the
+               other services whose pool settings are equal.
+        """
+        if not isinstance(connection_pool, ConnectionPoolConfig):
+            raise TypeError(
+                'connection_pool must be a ConnectionPoolConfig, not '
+                '{0}'.format(type(connection_pool).__name__))
+        self.connection_pool = connection_pool
+        self._mount_http_adapter()
+
+    def _mount_http_adapter(self) -> None:
+        # BaseService mounts a new default adapter whenever the retry or SSL
+        # settings change; replace it with one that keeps the pool settings.
+        if self.connection_pool is None:
+            return
+        kwargs = {}
+        if self.retry_config is not None:
+            kwargs['max_retries'] = self.retry_config
+        self.http_adapter = PooledHTTPAdapter(
+            self.connection_pool,
+            _disable_ssl_verification=self.disable_ssl_verification,
+            **kwargs)
+        self.http_client.mount('http://', self.http_adapter)
+        self.http_client.mount('https://', self.http_adapter)
+
+    def enable_retries(self, *args, **kwargs) -> None:
+        BaseService.enable_retries(self, *args, **kwargs)
+        self._mount_http_adapter()
+
+    def disable_retries(self) -> None:
+        BaseService.disable_retries(self)
+        self._mount_http_adapter()
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        BaseService.set_disable_ssl_verification(self, status)
+        self._mount_http_adapter()
+
+    def get_json_codec(self) -> JsonCodec:
+        """
+        Return the codec used for JSON request and response bodies.
+
+        This is the codec selected with `set_json_codec`, or the default codec
+        of `ibm_watson.json_codec` when none was selected.
+        """
+        return self.json_codec or get_default_json_codec()
+
+    def set_json_codec(self, codec: Union[str, JsonCodec, None]) -> None:
+        """
+        Select the codec used for JSON request and response bodies.
+
+        :param str|JsonCodec codec: A codec instance, `json`, `orjson`, `ujson`
+               or `auto` for the fastest installed codec. `None` restores the
+               default codec of `ibm_watson.json_codec`.
+        """
+        self.json_codec = None if codec is None else get_json_codec(codec)
+
+    def set_response_model(self, response_model: Union[bool, str]) -> None:
+        """
+        Select whether operations return models instead of dictionaries.
+
+        In model mode, the JSON result of each operation is converted to the
+        model class documented as its result, for example `MessageResponse`
+        for `message`, so `DetailedResponse.get_result()` returns a model.
+        Results that are not JSON objects, such as audio, are not changed.
+
+        :param bool|str response_model: `True` to convert results with
+               `from_dict`, `lazy` to convert them with `from_dict_lazy`, which
+               decodes each property when it is first read, or `False` to
+               return dictionaries, the default.
+        """
+        if response_model not in (True, False, 'lazy'):
+            raise ValueError(
+                'response_model must be True, False or \'lazy\', not '
+                '{0!r}'.format(response_model))
+        self.response_model = response_model
+
+    def set_request_compression(self,
+                                min_size: Optional[int] = DEFAULT_MIN_SIZE,
+                                *,
+                                level: int = DEFAULT_LEVEL) -> None:
+        """
+        Compress large JSON and text request bodies with gzip.
+
+        Bodies of at least `min_size` bytes whose Content-Type is text, JSON
+        or XML are sent with `Content-Encoding: gzip`. They are compressed in
+        chunks while they are sent, with chunked transfer encoding.
+
+        :param int min_size: (optional) The size, in bytes, from which bodies
+               are compressed, or `None` to send bodies uncompressed.
+        :param int level: (optional) The compression level, from 1 (fastest)
+               to 9 (smallest).
+        """
+        if not 1 <= level <= 9:
+            raise ValueError(
+                'level must be between 1 and 9, not {0!r}'.format(level))
+        self.compression_min_size = min_size
+        self.compression_level = level
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """
+        Set the rate limiter that the requests of the service wait for.
+
+        :param RateLimiter rate_limiter: The limiter, which can be shared with
+               other services, or `None` to send requests without limit.
+        """
+        if rate_limiter is not None and not isinstance(rate_limiter,
+                                                       RateLimiter):
+            raise TypeError('rate_limiter must be a RateLimiter, not '
+                            '{0}'.format(type(rate_limiter).__name__))
+        self.rate_limiter = rate_limiter
+
+    def set_response_cache(self,
+                           response_cache: Optional[ResponseCache]) -> None:
+        """
+        Set the cache of the responses of the GET operations of the service.
+
+        :param ResponseCache response_cache: The cache, which can be shared
+               with other services that use the same credentials, or `None`
+               to send every request.
+        """
+        if response_cache is not None and not isinstance(
+                response_cache, ResponseCache):
+            raise TypeError('response_cache must be a ResponseCache, not '
+                            '{0}'.format(type(response_cache).__name__))
+        self.response_cache = response_cache
+
+    def set_result_cache(self, result_cache: Optional[ResultCache]) -> None:
+        """
+        Set the cache of the results of the deterministic operations of the
+        service, such as `analyze` or `translate`.
+
+        :param ResultCache result_cache: The cache, or `None` to send every
+               request.
+        """
+        if result_cache is not None and not isinstance(result_cache,
+                                                       ResultCache):
+            raise TypeError('result_cache must be a ResultCache, not '
+                            '{0}'.format(type(result_cache).__name__))
+        self.result_cache = result_cache
+
+    def add_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """
+        Add hooks that observe the requests of the service.
+
+        :param Instrumentation instrumentation: The hooks, such as a
+               `MetricsCollector`. Hooks are called in the order they were
+               added.
+        """
+        if not isinstance(instrumentation, Instrumentation):
+            raise TypeError('instrumentation must be an Instrumentation, not '
+                            '{0}'.format(type(instrumentation).__name__))
+        self.instrumentations += (instrumentation,)
+
+    def remove_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """Remove hooks added with `add_instrumentation`."""
+        self.instrumentations = tuple(
+            hooks for hooks in self.instrumentations
+            if hooks is not instrumentation)
+
+    def prepare_request(self, method: str, url: str, **kwargs) -> dict:
+        if not self.instrumentations:
+            return BaseService.prepare_request(self, method, url, **kwargs)
+        start_time = time.perf_counter()
+        phases = {}
+        token_manager = getattr(self.authenticator, 'token_manager', None)
+        if token_manager is not None:
+            # Get, and refresh if needed, the token that prepare_request adds
+            # to the request, to time it separately.
+            token_manager.get_token()
+            phases['authenticate'] = time.perf_counter() - start_time
+        request = BaseService.prepare_request(self, method, url, **kwargs)
+        phases['prepare'] = (time.perf_counter() - start_time -
+                             phases.get('authenticate', 0.0))
+        # Operations send the request right after preparing it.
+        _prepared.value = (request, start_time, phases)
+        return request
+
+    def send(self,
+             request: requests.Request,
+             *,
+             result_model: type = None,
+             response_model: Union[bool, str] = None,
+             **kwargs) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse.
+
+        JSON response bodies are decoded with the codec of `get_json_codec`
+        directly from the response bytes. With a result or response cache,
+        requests are answered from the cache when possible. With a rate
+        limiter, the request waits until the limiter lets it through, and is
+        sent again when it is rejected with status 429.
+
+        :param type result_model: (optional) The model class of the result of
+               the operation. The operations pass it to convert results in
+               model mode.
+        :param bool|str response_model: (optional) Overrides the mode selected
+               with `set_response_model` for this request.
+        :raises ApiException: The exception from the API.
+        """
+        if response_model is None:
+            response_model = self.response_model
+        if not response_model:
+            result_model = None
+        instrumentations = self.instrumentations
+        if not instrumentations:
+            return self._send(request, result_model, response_model, None,
+                              **kwargs)
+
+        event = self._new_event(request)
+        for instrumentation in instrumentations:
+            instrumentation.before_request(event)
+        try:
+            response = self._send(request, result_model, response_model, event,
+                                  **kwargs)
+        except Exception as err:
+            _notify_error(instrumentations, event, err)
+            raise
+        _notify_response(instrumentations, event, response)
+        return response
+
+    def _new_event(self, request: dict) -> RequestEvent:
+        start_time, phases = _pop_prepared(request)
+        return RequestEvent(getattr(self, 'DEFAULT_SERVICE_NAME', None),
+                            request, start_time, phases)
+
+    def _send(self, request: requests.Request, result_model: type,
+              response_model: Union[bool, str], event: Optional[RequestEvent],
+              **kwargs) -> DetailedResponse:
+        if kwargs.get('stream') or 'stream' in self.http_config:
+            return self._send_limited(request, result_model, response_model,
+                                      event, **kwargs)
+        result_cache = self.result_cache
+        key = result_cache.get_key(request) if result_cache else None
+        if key is None:
+            response = self._send_cached(request, event, **kwargs)
+        else:
+            response = result_cache.get(key)
+            if response is None:
+                response = self._send_cached(request, event, **kwargs)
+                result_cache.set(key, response)
+            elif event is not None:
+                event.cached = True
+        return _convert_result(response, result_model, response_model, event)
+
+    def _send_cached(self, request: requests.Request,
+                     event: Optional[RequestEvent],
+                     **kwargs) -> DetailedResponse:
+        cache = self.response_cache
+        if cache is None:
+            return self._send_limited(request, None, False, event, **kwargs)
+        method = request['method']
+        if method != 'GET':
+            try:
+                return self._send_limited(request, None, False, event,
+                                          **kwargs)
+            finally:
+                cache.invalidate_request(request)
+
+        entry = cache.lookup(request)
+        if entry is not None and entry.is_fresh():
+            return _cached_response(entry, event)
+        try:
+            response = self._send_limited(_revalidation_request(request, entry),
+                                          None, False, event, **kwargs)
+        except ApiException as err:
+            if err.status_code != 304 or entry is None:
+                raise
+            cache.refresh(request, entry)
+            return _cached_response(entry, event)
+        cache.store(request, response)
+        return response
+
+    def _send_limited(self, request: requests.Request, result_model: type,
+                      response_model: Union[bool, str],
+                      event: Optional[RequestEvent],
+                      **kwargs) -> DetailedResponse:
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return self._send_request(request, result_model, response_model,
+                                      event, **kwargs)
+
+        attempts = 0
+        while True:
+            token = rate_limiter.acquire()
+            try:
+                response = self._send_request(request, result_model,
+                                              response_model, event, **kwargs)
+            except ApiException as err:
+                _release_error(rate_limiter, token, err)
+                if not _should_resend(rate_limiter, err, attempts, request):
+                    raise
+                attempts += 1
+                if event is not None:
+                    event.retries = attempts
+            except BaseException:
+                rate_limiter.release(token, None)
+                raise
+            else:
+                rate_limiter.release(token, response.get_status_code(),
+                                     response.get_headers())
+                return response
+
+    def _send_request(self, request: requests.Request, result_model: type,
+                      response_model: Union[bool, str],
+                      event: Optional[RequestEvent],
+                      **kwargs) -> DetailedResponse:
+        request = self._encode_body(request)
+        started = time.perf_counter() if event is not None else None
+        if 'stream' in self.http_config:
+            # http_config overrides the stream argument; leave the response
+            # handling to BaseService.
+            try:
+                response = BaseService.send(self, request, **kwargs)
+            finally:
+                _add_network_phase(event, started, request)
+            return _convert_result(response, result_model, response_model,
+                                   event)
+
+        stream = kwargs.get('stream') or False
+        kwargs['stream'] = True
+        try:
+            response = BaseService.send(self, request, **kwargs)
+        finally:
+            _add_network_phase(event, started, request)
+        result = response.get_result()
+        if stream:
+            return response
+        if not isinstance(result, requests.Response):
+            return _convert_result(response, result_model, response_model,
+                                   event)
+
+        # Read the whole body so that the connection is released to the pool,
+        # as it is for a response that is not streamed.
+        if event is not None:
+            started = time.perf_counter()
+            content = result.content
+            event.add_phase('read', time.perf_counter() - started)
+            event.bytes_received += len(content)
+        else:
+            content = result.content
+        if not content:
+            response.result = None
+        elif _JSON_MIMETYPE.match(result.headers.get('Content-Type') or ''):
+            response.result = self._decode(content, result, event)
+        return _convert_result(response, result_model, response_model, event)
+
+    def _encode_body(self, request: dict) -> dict:
+        """Return `request` with its form data or compressed body streamed."""
+        if request.get('files'):
+            return _multipart_request(request)
+        if not should_compress(request.get('data'), request['headers'],
+                               self.compression_min_size):
+            return request
+        headers = {
+            name: value
+            for name, value in request['headers'].items()
+            if name.lower() != 'content-length'
+        }
+        headers['Content-Encoding'] = 'gzip'
+        return dict(request,
+                    headers=headers,
+                    data=GzipBody(request['data'],
+                                  level=self.compression_level))
+
+    def _decode(self, content: bytes, http_response,
+                event: Optional[RequestEvent]):
+        """Return the JSON value of a response body."""
+        started = time.perf_counter() if event is not None else None
+        try:
+            return self.get_json_codec().loads(content)
+        except ValueError as err:
+            raise ApiException(
+                http_response.status_code,
+                http_response=http_response,
+                message='Error processing the HTTP response') from err
+        finally:
+            if event is not None:
+                event.add_phase('decode', time.perf_counter() - started)
+
+    def prepare_operation(self, operation_id: str, *args,
+                          **kwargs) -> 'PreparedOperation':
+        """
+        Prepare an operation for repeated calls with the same arguments.
+
+        The operation is built once with the given arguments: the URL, the
+        path parameters, the query parameters and the static headers are fixed
+        in the returned `PreparedOperation`. Calling it sends the request again
+        and only rebuilds the JSON body, which makes it suitable for sending
+        many messages to the same assistant session, for example:
+
+            message = assistant.prepare_operation('message', assistant_id,
+                                                  session_id)
+            response = message(input={'text': 'Hello'})
+
+        Authentication is applied on each call, so token refreshes still
+        happen. Operations that upload files (multipart/form-data) cannot be
+        prepared.
+
+        :param str operation_id: The name of the operation method, such as
+               `message`.
+        :param args: The positional arguments of the operation.
+        :param kwargs: The keyword arguments of the operation, including
+               `headers` and any arguments that are passed on to `send`.
+        :return: A callable that sends the prepared request.
+        :rtype: PreparedOperation
+        """
+        if not _has_operation(type(self), operation_id):
+            raise ValueError('{0} has no operation {1!r}'.format(
+                type(self).__name__, operation_id))
+
+        # Run the operation against a copy of the service that records the
+        # request instead of sending it, and that leaves authentication to the
+        # individual calls.
+        captured = {}
+
+        def capture(request, **send_kwargs):
+            captured['request'] = request
+            captured['send_kwargs'] = send_kwargs
+
+        probe = copy.copy(self)
+        probe.authenticator = NoAuthAuthenticator()
+        probe.enable_gzip_compression = False
+        probe.send = capture
+        getattr(probe, operation_id)(*args, **kwargs)
+
+        request = captured['request']
+        if request.get('files'):
+            raise ValueError(
+                'Operation {0!r} sends multipart/form-data and cannot be '
+                'prepared'.format(operation_id))
+        return PreparedOperation(self, operation_id, request,
+                                 captured['send_kwargs'])
+
+    def download(self,
+                 operation_id: str,
+                 *args,
+                 destination: Union[str, os.PathLike, BinaryIO] = None,
+                 chunk_size: int = CHUNK_SIZE,
+                 resume: bool = False,
+                 checksum: str = None,
+                 **kwargs) -> Download:
+        """
+        Download the binary result of an operation in chunks.
+
+        The operation, such as `synthesize` or `get_model_file`, is sent with
+        `stream=True`, and its body is read `chunk_size` bytes at a time, so
+        it is never held in memory as a whole. Without a destination, the
+        returned `Download` yields the chunks when it is iterated:
+
+            with text_to_speech.download('synthesize', 'Hello',
+                                         accept='audio/wav') as audio:
+                for chunk in audio:
+                    player.write(chunk)
+
+        :param str operation_id: The name of the operation method.
+        :param args: The positional arguments of the operation.
+        :param str|BinaryIO destination: (optional) A path, or a binary file,
+               that the body is written to before `download` returns.
+        :param int chunk_size: (optional) The number of bytes read at a time.
+        :param bool resume: (optional) Whether to continue a download to a
+               destination that holds the start of the body after it, and an
+               interrupted download where it stopped, with `Range` requests.
+        :param str checksum: (optional) The expected checksum of the body, as
+               `<algorithm>:<hex digest>`, for example `sha256:9f86d0...`. A
+               body with another checksum raises a `ValueError` when it has
+               been read.
+        :param kwargs: The keyword arguments of the operation, including
+               `headers`.
+        :return: The download, read if there is a destination.
+        :rtype: Download
+        :raises ApiException: The exception from the API.
+        """
+        download = Download(_download_sender(self, operation_id, args, kwargs,
+                                             resume),
+                            chunk_size=chunk_size,
+                            resume=resume,
+                            checksum=checksum)
+        if destination is None:
+            return download.open()
+        download.save(destination)
+        return download
+
+    def _websocket_request(self,
+                           path: str,
+                           params: dict,
+                           headers: Optional[dict] = None) -> dict:
+        """
+        Return the `ws` or `wss` URL of a websocket endpoint, with the query
+        `params`, and the authenticated headers of its handshake, in a `dict`.
+        """
+        request = {}
+        request_headers = {}
+        if self.default_headers is not None:
+            request_headers = self.default_headers.copy()
+        if headers:
+            request_headers.update(headers)
+        request['headers'] = request_headers
+
+        if self.authenticator:
+            self.authenticator.authenticate(request)
+
+        url = re.sub(r'^http(s?):', r'ws\1:', self.service_url)
+        params = {k: v for k, v in params.items() if v is not None}
+        request['url'] = url + '{0}?{1}'.format(path, urlencode(params))
+        return request
+
+    async def _open_websocket(self,
+                              path: str,
+                              params: dict,
+                              headers: Optional[dict] = None
+                             ) -> AsyncWebSocket:
+        """
+        Open an authenticated connection to a websocket endpoint. Tokens are
+        fetched on a thread of the default executor, off the event loop.
+        """
+        loop = asyncio.get_event_loop()
+        request = await loop.run_in_executor(None, self._websocket_request,
+                                             path, params, headers)
+        return await AsyncWebSocket.connect(
+            request['url'],
+            request['headers'],
+            disable_ssl_verification=self.disable_ssl_verification)
+
+
+def _has_operation(service_class: type, operation_id: str) -> bool:
+    # The adapters and the asynchronous clients inherit the operations of a
+    # generated service class.
+    return any(
+        operation_id in get_operation_ids(cls)
+        for cls in service_class.__mro__
+        if cls.__module__ != __name__ and not issubclass(WatsonService, cls))
+
+
+def _download_sender(service: WatsonService, operation_id: str, args: tuple,
+                     kwargs: dict, resume: bool) -> Callable:
+    """Return a function that sends an operation from a byte of its body."""
+    if not _has_operation(type(service), operation_id):
+        raise ValueError('{0} has no operation {1!r}'.format(
+            type(service).__name__, operation_id))
+    operation = getattr(service, operation_id)
+
+    def send(position: int):
+        headers = dict(kwargs.get('headers') or {})
+        if resume:
+            # Ranges are offsets in the body as it is sent.
+            headers['Accept-Encoding'] = 'identity'
+        if position:
+            headers['Range'] = 'bytes={0}-'.format(position)
+        return operation(*args, **dict(kwargs, headers=headers, stream=True))
+
+    return send
+
+
+def _add_network_phase(event: Optional[RequestEvent], started: float,
+                       request: dict) -> None:
+    if event is None:
+        return
+    event.add_phase('network', time.perf_counter() - started)
+    if isinstance(request['data'], GzipBody):
+        event.bytes_sent = request['data'].bytes_out
+
+
+def _release_error(rate_limiter: RateLimiter, token: float,
+                   err: ApiException) -> None:
+    http_response = err.http_response
+    if http_response is None:
+        rate_limiter.release(token, err.status_code)
+    else:
+        rate_limiter.release(token, err.status_code, http_response.headers,
+                             get_retry_after(http_response))
+
+
+def _should_resend(rate_limiter: RateLimiter, err: ApiException,
+                   attempts: int, request: dict) -> bool:
+    """Return whether a request rejected with `err` is sent again."""
+    if err.status_code != 429 or attempts >= rate_limiter.max_retries:
+        return False
+    # Streamed and multipart bodies may have been consumed.
+    data = request.get('data')
+    return not request.get('files') and (data is None or
+                                         isinstance(data, (bytes, str)))
+
+
+# The last request prepared on each thread, with the time it took.
+_prepared = threading.local()
+
+
+def _pop_prepared(request: dict) -> Tuple[Optional[float], dict]:
+    prepared = getattr(_prepared, 'value', None)
+    _prepared.value = None
+    if prepared is None or prepared[0] is not request:
+        return None, {}
+    return prepared[1], prepared[2]
+
+
+def _notify_response(instrumentations: tuple, event: RequestEvent,
+                     response: DetailedResponse) -> None:
+    event.finish(response=response)
+    for instrumentation in instrumentations:
+        instrumentation.after_response(event)
+
+
+def _notify_error(instrumentations: tuple, event: RequestEvent,
+                  err: Exception) -> None:
+    event.finish(error=err)
+    for instrumentation in instrumentations:
+        instrumentation.on_error(event)
+
+
+def _cached_response(entry: CacheEntry,
+                     event: Optional[RequestEvent]) -> DetailedResponse:
+    if event is not None:
+        event.cached = True
+    return entry.get_response()
+
+
+def _multipart_request(request: dict) -> dict:
+    """Return `request` with its form data as a streaming body."""
+    if request.get('data'):
+        # requests rejects this combination itself.
+        return request
+    encoder = MultipartEncoder(request['files'])
+    headers = {
+        name: value
+        for name, value in request['headers'].items()
+        if name.lower() not in ('content-type', 'content-length')
+    }
+    headers['Content-Type'] = encoder.content_type
+    if encoder.len is not None:
+        headers['Content-Length'] = str(encoder.len)
+    return dict(request, headers=headers, data=encoder, files=None)
+
+
+def _revalidation_request(request: dict, entry: Optional[CacheEntry]) -> dict:
+    """Return `request` conditional on the ETag of an expired entry."""
+    if entry is None or entry.etag is None:
+        return request
+    headers = dict(request['headers'])
+    headers['If-None-Match'] = entry.etag
+    return dict(request, headers=headers)
+
+
+def _convert_result(response: DetailedResponse,
+                    result_model: type,
+                    response_model: Union[bool, str],
+                    event: RequestEvent = None) -> DetailedResponse:
+    """Replace a dictionary result with an instance of `result_model`."""
+    if result_model is not None and isinstance(response.result, dict):
+        started = time.perf_counter() if event is not None else None
+        if response_model == 'lazy':
+            response.result = result_model.from_dict_lazy(response.result)
+        else:
+            response.result = result_model.from_dict(response.result)
+        if event is not None:
+            event.add_phase('model', time.perf_counter() - started)
+    return response
+
+
+class PreparedOperation():
+    """
+    A service operation whose request has been built ahead of time.
+
+    Instances are created by `WatsonService.prepare_operation` and are safe to
+    call from multiple threads.
+
+    :attr str operation_id: The name of the prepared operation.
+    :attr str method: The HTTP method of the request.
+    :attr str url: The full request URL, without the query string.
+    """
+
+    def __init__(self, service: WatsonService, operation_id: str,
+                 request: dict, send_kwargs: dict) -> None:
+        self.service = service
+        self.operation_id = operation_id
+        self.method = request['method']
+        self.url = request['url']
+        self._headers = request['headers']
+        self._params = request['params']
+        self._data = request['data']
+        self._send_kwargs = send_kwargs
+        self._body = None
+        content_type = self._headers.get('content-type') or ''
+        if self._data is not None and content_type.startswith(
+                'application/json'):
+            body = service.get_json_codec().loads(self._data)
+            if isinstance(body, dict):
+                self._body = body
+
+    def __call__(self, headers: dict = None, **body) -> DetailedResponse:
+        """
+        Send the prepared request.
+
+        :param dict headers: (optional) Additional request headers for this
+               call only.
+        :param body: (optional) Properties of the JSON request body for this
+               call, such as `input` and `context` for `message`. Models are
+               converted to dictionaries and `None` values are ignored. Values
+               given here replace the ones given to `prepare_operation`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP
+                 status code.
+        :rtype: DetailedResponse
+        """
+        data = self._data
+        if body:
+            if self._body is None:
+                raise ValueError(
+                    'Operation {0!r} does not send a JSON object body'.format(
+                        self.operation_id))
+            data = dict(self._body)
+            for key, value in body.items():
+                if isinstance(value, list):
+                    value = [convert_model(x) for x in value]
+                elif value is not None:
+                    value = convert_model(value)
+                if value is not None:
+                    data[key] = value
+            data = self.service.get_json_codec().dumps(data)
+
+        request = {
+            'method': self.method,
+            'url': self.url,
+            'headers': self._headers.copy(),
+            'params': self._params,
+            'data': data,
+            'files': []
+        }
+        if headers:
+            request['headers'].update(headers)
+        self.service.authenticator.authenticate(request)
+        if (getattr(self.service, 'enable_gzip_compression', False) and
+                data is not None and
+                'content-encoding' not in request['headers']):
+            request['headers']['content-encoding'] = 'gzip'
+            request['data'] = gzip.compress(data)
+        return self.service.send(request, **self._send_kwargs)
+
+
+class AsyncWatsonService(WatsonService):
+    """
+    Common base class of the asynchronous Watson service clients.
+
+    An asynchronous client has the operations of its service class, such as
+    `AsyncAssistantV2.message` for `AssistantV2.message`, and builds requests
+    with the same code, but its operations return awaitables:
+
+        async with AsyncAssistantV2(version, authenticator=authenticator) as assistant:
+            response = await assistant.message(assistant_id, session_id,
+                                               input={'text': 'Hello'})
+
+    Requests are sent with an `httpx.AsyncClient`, created on first use, so
+    the `httpx` package is required (`pip install "ibm-watson[async]"`). The
+    `ConnectionPoolConfig` of the service sizes its connection pool. Of the
+    `http_config` settings, only `timeout` applies; other settings such as
+    proxies are configured on a client given to `set_async_http_client`.
+
+    Requests are authenticated when they are built, so an authenticator that
+    has to request a new token blocks the event loop while it does so.
+    """
+
+    _async_http_client = None
+
+    def get_async_http_client(self) -> 'httpx.AsyncClient':
+        """Return the `httpx.AsyncClient` that sends the requests."""
+        if self._async_http_client is None:
+            self._async_http_client = self._new_async_http_client()
+        return self._async_http_client
+
+    def set_async_http_client(self, client: 'httpx.AsyncClient') -> None:
+        """
+        Set the `httpx.AsyncClient` that sends the requests.
+
+        A client can be shared by several services to share its connections.
+        """
+        self._async_http_client = client
+
+    def _new_async_http_client(self) -> 'httpx.AsyncClient':
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                '{0} requires the httpx package; install it with '
+                '`pip install "ibm-watson[async]"`'.format(
+                    type(self).__name__)) from None
+        verify = not self.disable_ssl_verification
+        config = self.connection_pool
+        if config is None:
+            return httpx.AsyncClient(verify=verify)
+        # httpx limits connections per client rather than per host.
+        limits = httpx.Limits(
+            max_connections=config.pool_maxsize if config.pool_block else None,
+            max_keepalive_connections=config.pool_maxsize,
+            keepalive_expiry=config.idle_timeout)
+        transport_kwargs = {}
+        if config.tcp_keepalive:
+            transport_kwargs['socket_options'] = [(socket.SOL_SOCKET,
+                                                   socket.SO_KEEPALIVE, 1)]
+        transport = httpx.AsyncHTTPTransport(verify=verify,
+                                             limits=limits,
+                                             **transport_kwargs)
+        return httpx.AsyncClient(transport=transport)
+
+    async def aclose(self) -> None:
+        """Close the connections of the client that sends the requests."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+
+    async def __aenter__(self) -> 'AsyncWatsonService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def send(self, request: dict, **kwargs) -> Awaitable[DetailedResponse]:
+        """
+        Return an awaitable that sends a request.
+
+        The awaitable returns a DetailedResponse, like `WatsonService.send`.
+        With `stream=True`, the result is the `httpx.Response`, whose body is
+        read with `aiter_bytes()` and which must be closed with `aclose()`.
+        """
+        # The event is created now, on the thread that prepared the request.
+        event = self._new_event(request) if self.instrumentations else None
+        return self._send_async(request, event, **kwargs)
+
+    async def download(self,
+                       operation_id: str,
+                       *args,
+                       destination: Union[str, os.PathLike, BinaryIO] = None,
+                       chunk_size: int = CHUNK_SIZE,
+                       resume: bool = False,
+                       checksum: str = None,
+                       **kwargs) -> AsyncDownload:
+        """
+        Download the binary result of an operation in chunks.
+
+        See `WatsonService.download`. The returned `AsyncDownload` is iterated
+        with `async for`.
+        """
+        download = AsyncDownload(_download_sender(self, operation_id, args,
+                                                  kwargs, resume),
+                                 chunk_size=chunk_size,
+                                 resume=resume,
+                                 checksum=checksum)
+        if destination is None:
+            return await download.open()
+        await download.save(destination)
+        return download
+
+    async def _send_async(self,
+                          request: dict,
+                          event: Optional[RequestEvent],
+                          *,
+                          result_model: type = None,
+                          response_model: Union[bool, str] = None,
+                          **kwargs) -> DetailedResponse:
+        if response_model is None:
+            response_model = self.response_model
+        if not response_model:
+            result_model = None
+        if event is None:
+            return await self._send_each_async(request, result_model,
+                                               response_model, None, **kwargs)
+
+        instrumentations = self.instrumentations
+        for instrumentation in instrumentations:
+            instrumentation.before_request(event)
+        try:
+            response = await self._send_each_async(request, result_model,
+                                                   response_model, event,
+                                                   **kwargs)
+        except Exception as err:
+            _notify_error(instrumentations, event, err)
+            raise
+        _notify_response(instrumentations, event, response)
+        return response
+
+    async def _send_each_async(self, request: dict, result_model: type,
+                               response_model: Union[bool, str],
+                               event: Optional[RequestEvent],
+                               **kwargs) -> DetailedResponse:
+        if kwargs.get('stream') or 'stream' in self.http_config:
+            return await self._send_limited_async(request, result_model,
+                                                  response_model, event,
+                                                  **kwargs)
+        result_cache = self.result_cache
+        key = result_cache.get_key(request) if result_cache else None
+        if key is None:
+            response = await self._send_cached_async(request, event, **kwargs)
+        else:
+            response = result_cache.get(key)
+            if response is None:
+                response = await self._send_cached_async(
+                    request, event, **kwargs)
+                result_cache.set(key, response)
+            elif event is not None:
+                event.cached = True
+        return _convert_result(response, result_model, response_model, event)
+
+    async def _send_cached_async(self, request: dict,
+                                 event: Optional[RequestEvent],
+                                 **kwargs) -> DetailedResponse:
+        cache = self.response_cache
+        if cache is None:
+            return await self._send_limited_async(request, None, False, event,
+                                                  **kwargs)
+        method = request['method']
+        if method != 'GET':
+            try:
+                return await self._send_limited_async(request, None, False,
+                                                      event, **kwargs)
+            finally:
+                cache.invalidate_request(request)
+
+        entry = cache.lookup(request)
+        if entry is not None and entry.is_fresh():
+            return _cached_response(entry, event)
+        try:
+            response = await self._send_limited_async(
+                _revalidation_request(request, entry), None, False, event,
+                **kwargs)
+        except ApiException as err:
+            if err.status_code != 304 or entry is None:
+                raise
+            cache.refresh(request, entry)
+            return _cached_response(entry, event)
+        cache.store(request, response)
+        return response
+
+    async def _send_limited_async(self, request: dict, result_model: type,
+                                  response_model: Union[bool, str],
+                                  event: Optional[RequestEvent],
+                                  **kwargs) -> DetailedResponse:
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return await self._send_request_async(request, result_model,
+                                                  response_model, event,
+                                                  **kwargs)
+
+        attempts = 0
+        while True:
+            token = await rate_limiter.acquire_async()
+            try:
+                response = await self._send_request_async(
+                    request, result_model, response_model, event, **kwargs)
+            except ApiException as err:
+                _release_error(rate_limiter, token, err)
+                if not _should_resend(rate_limiter, err, attempts, request):
+                    raise
+                attempts += 1
+                if event is not None:
+                    event.retries = attempts
+            except BaseException:
+                rate_limiter.release(token, None)
+                raise
+            else:
+                rate_limiter.release(token, response.get_status_code(),
+                                     response.get_headers())
+                return response
+
+    async def _send_request_async(self, request: dict, result_model: type,
+                                  response_model: Union[bool, str],
+                                  event: Optional[RequestEvent],
+                                  **kwargs) -> DetailedResponse:
+        request = self._encode_body(request)
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs.update(self.http_config)
+        stream = kwargs.get('stream') or False
+        timeout = kwargs['timeout']
+        if isinstance(timeout, tuple):
+            # (connect, read), as accepted by requests
+            import httpx
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        client = self.get_async_http_client()
+        data = request['data']
+        content = form = None
+        if isinstance(data, dict):
+            form = data or None
+        elif hasattr(data, 'read') or isinstance(data, GzipBody):
+            content = _aiter_body(data)
+        else:
+            content = data
+        http_request = client.build_request(request['method'],
+                                            request['url'],
+                                            headers=dict(request['headers']),
+                                            params=request['params'],
+                                            content=content,
+                                            data=form,
+                                            files=request.get('files') or None,
+                                            timeout=timeout)
+        started = time.perf_counter() if event is not None else None
+        try:
+            response = await client.send(
+                http_request,
+                stream=True,
+                follow_redirects=kwargs.get('allow_redirects', True))
+        finally:
+            _add_network_phase(event, started, request)
+
+        if not 200 <= response.status_code <= 299:
+            await response.aread()
+            raise ApiException(response.status_code, http_response=response)
+        if response.status_code == 204 or request['method'] == 'HEAD':
+            await response.aclose()
+            result = None
+        elif stream:
+            result = response
+        else:
+            if event is not None:
+                started = time.perf_counter()
+                body = await response.aread()
+                event.add_phase('read', time.perf_counter() - started)
+                event.bytes_received += len(body)
+            else:
+                body = await response.aread()
+            if not body:
+                result = None
+            elif _JSON_MIMETYPE.match(response.headers.get('Content-Type') or
+                                      ''):
+                result = self._decode(body, response, event)
+            else:
+                result = response
+        return _convert_result(
+            DetailedResponse(response=result,
+                             headers=response.headers,
+                             status_code=response.status_code), result_model,
+            response_model, event)
+
+
+async def _aiter_body(body, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Yield the content of a binary file object, or of an iterable."""
+    if not hasattr(body, 'read'):
+        for chunk in body:
+            yield chunk
+        return
+    while True:
+        chunk = body.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
@@ -16,6 +16,12 @@
 
 from .recognize_abstract_callback import RecognizeCallback
 from .recognize_listener import RecognizeListener
+from .recognize_stream import RecognizeStream
+from .recognition_session import RecognitionSession
+from .async_websocket import AsyncWebSocket
 from .audio_source import AudioSource
+from .audio_pacer import AudioPacer
 from .synthesize_callback import SynthesizeCallback
 from .synthesize_listener import SynthesizeListener
+from .synthesize_stream import SynthesizeStream
+from .websocket_pool import WebSocketPool
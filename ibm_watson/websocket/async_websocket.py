@@ -0,0 +1,324 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A websocket connection on an asyncio event loop.
+
+`AsyncWebSocket` speaks the part of RFC 6455 that the Watson services use:
+text and binary messages, fragmented or not, pings and the closing handshake.
+It needs no thread and no dependency beyond the standard library, so one event
+loop can hold as many connections as it has sockets.
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import ssl
+import struct
+from typing import Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from ibm_cloud_sdk_core import ApiException
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+# The status of a connection that was lost without a closing handshake.
+CLOSE_ABNORMAL = 1006
+CLOSE_TIMEOUT = 5.0
+
+_WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+_MAX_HANDSHAKE_SIZE = 64 * 1024
+
+
+class AsyncWebSocket():
+    """
+    A websocket connection, read and written with coroutines.
+
+    A connection is opened with `connect()`. One task at a time receives
+    messages, while any number of tasks send them.
+
+    :param asyncio.StreamReader reader: The stream the connection reads.
+    :param asyncio.StreamWriter writer: The stream the connection writes.
+    :param bool client: (optional) `True` for the client end of the
+           connection, which masks the frames it sends.
+
+    :attr int close_code: The status of the closing handshake, once the
+          connection is closed.
+    :attr str close_reason: The reason of the closing handshake.
+    """
+
+    def __init__(self,
+                 reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter,
+                 *,
+                 client: bool = True) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.client = client
+        self.close_code = None
+        self.close_reason = None
+        self._close_sent = False
+        self._write_lock = asyncio.Lock()
+        self._read_lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls,
+                      url: str,
+                      headers: Optional[Mapping[str, str]] = None,
+                      *,
+                      disable_ssl_verification: bool = False
+                     ) -> 'AsyncWebSocket':
+        """
+        Open a websocket connection.
+
+        :param str url: The `ws` or `wss` URL of the connection.
+        :param Mapping headers: (optional) The headers of the opening
+               handshake, such as `Authorization`.
+        :param bool disable_ssl_verification: (optional) Whether the
+               certificate of a `wss` server is left unverified.
+        :raises ApiException: The server refused the connection.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('ws', 'wss'):
+            raise ValueError('url must be a ws or wss URL')
+        secure = parts.scheme == 'wss'
+        context = None
+        if secure:
+            context = ssl.create_default_context()
+            if disable_ssl_verification:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+        host = parts.hostname
+        port = parts.port or (443 if secure else 80)
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=context, limit=_MAX_HANDSHAKE_SIZE)
+        try:
+            await cls._handshake(reader, writer, parts, headers or {})
+        except BaseException:
+            writer.close()
+            raise
+        return cls(reader, writer)
+
+    @staticmethod
+    async def _handshake(reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter, parts,
+                         headers: Mapping[str, str]) -> None:
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        lines = [
+            'GET {0} HTTP/1.1'.format(target),
+            'Host: {0}'.format(parts.netloc.rpartition('@')[2]),
+            'Upgrade: websocket',
+            'Connection: Upgrade',
+            'Sec-WebSocket-Key: {0}'.format(key),
+            'Sec-WebSocket-Version: 13',
+        ]
+        lines.extend('{0}: {1}'.format(name, value)
+                     for name, value in headers.items())
+        writer.write('\r\n'.join(lines).encode('utf-8') + b'\r\n\r\n')
+        await writer.drain()
+
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError as error:
+            raise ConnectionError(
+                'the server closed the connection during the handshake'
+            ) from error
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        response_headers = {}
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                response_headers[name.strip().lower()] = value.strip()
+        status = int(status_line.split()[1])
+        if status != 101:
+            body = b''
+            length = int(response_headers.get('content-length') or 0)
+            if length:
+                body = await reader.read(min(length, _MAX_HANDSHAKE_SIZE))
+            raise ApiException(status,
+                               message=body.decode('utf-8', 'replace') or
+                               status_line)
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WEBSOCKET_GUID).encode('ascii')).digest())
+        if response_headers.get('sec-websocket-accept') != accept.decode(
+                'ascii'):
+            raise ConnectionError('the server sent a wrong Sec-WebSocket-Accept')
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection is closed, or closing."""
+        return self.close_code is not None or self._close_sent
+
+    async def send(self, data: Union[str, bytes, bytearray,
+                                     memoryview]) -> None:
+        """
+        Send a message: a text message for `str`, else a binary message.
+
+        :raises ConnectionError: The connection is closed.
+        """
+        if isinstance(data, str):
+            await self._send_frame(OPCODE_TEXT, data.encode('utf-8'))
+        else:
+            await self._send_frame(OPCODE_BINARY, data)
+
+    async def ping(self, data: bytes = b'') -> None:
+        """Send a ping; the server answers with a pong."""
+        await self._send_frame(OPCODE_PING, data)
+
+    async def _send_frame(self, opcode: int, payload) -> None:
+        if self.closed:
+            raise ConnectionError('the websocket is closed')
+        length = len(payload)
+        mask_bit = 0x80 if self.client else 0
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, mask_bit | length)
+        elif length < 1 << 16:
+            header = struct.pack('!BBH', 0x80 | opcode, mask_bit | 126,
+                                 length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, mask_bit | 127,
+                                 length)
+        if self.client:
+            mask = os.urandom(4)
+            header += mask
+            payload = _mask(payload, mask)
+        async with self._write_lock:
+            self.writer.write(header)
+            self.writer.write(payload)
+            await self.writer.drain()
+
+    async def receive(self) -> Optional[Union[str, bytes]]:
+        """
+        Return the next message: `str` for a text message, `bytes` for a
+        binary message, or `None` once the connection is closed.
+
+        Pings are answered while the message is awaited.
+        """
+        async with self._read_lock:
+            opcode, parts = None, []
+            while self.close_code is None:
+                try:
+                    fin, frame_opcode, payload = await self._receive_frame()
+                except (asyncio.IncompleteReadError, ConnectionError,
+                        OSError):
+                    self._lost()
+                    return None
+                if frame_opcode == OPCODE_CLOSE:
+                    await self._closed_by_peer(payload)
+                    return None
+                if frame_opcode == OPCODE_PING:
+                    if not self.closed:
+                        await self._send_frame(OPCODE_PONG, payload)
+                    continue
+                if frame_opcode == OPCODE_PONG:
+                    continue
+                if frame_opcode != OPCODE_CONTINUATION:
+                    opcode = frame_opcode
+                parts.append(payload)
+                if fin:
+                    message = b''.join(parts)
+                    if opcode == OPCODE_TEXT:
+                        return message.decode('utf-8')
+                    return message
+            return None
+
+    async def _receive_frame(self) -> Tuple[bool, int, bytes]:
+        header = await self.reader.readexactly(2)
+        length = header[1] & 0x7F
+        if length == 126:
+            length, = struct.unpack('!H', await self.reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', await self.reader.readexactly(8))
+        mask = await self.reader.readexactly(4) if header[1] & 0x80 else None
+        payload = await self.reader.readexactly(length)
+        if mask:
+            payload = _mask(payload, mask)
+        return bool(header[0] & 0x80), header[0] & 0x0F, payload
+
+    async def _closed_by_peer(self, payload: bytes) -> None:
+        if not self._close_sent:
+            # Echo the status, as the closing handshake asks.
+            try:
+                await self._send_frame(OPCODE_CLOSE, payload[:2])
+            except (ConnectionError, OSError):
+                pass
+            self._close_sent = True
+        if len(payload) >= 2:
+            self.close_code, = struct.unpack('!H', payload[:2])
+            self.close_reason = payload[2:].decode('utf-8', 'replace')
+        else:
+            self.close_code = 1005
+            self.close_reason = ''
+        self.writer.close()
+
+    def _lost(self) -> None:
+        self.close_code = self.close_code or CLOSE_ABNORMAL
+        self.close_reason = self.close_reason or ''
+        self._close_sent = True
+        self.writer.close()
+
+    async def close(self,
+                    code: int = 1000,
+                    reason: str = '',
+                    *,
+                    timeout: float = CLOSE_TIMEOUT) -> None:
+        """
+        Close the connection with a closing handshake.
+
+        The messages that arrive before the server answers are discarded. If it
+        does not answer within `timeout` seconds, the connection is dropped.
+        """
+        if self.close_code is not None:
+            return
+        if not self._close_sent:
+            try:
+                await self._send_frame(
+                    OPCODE_CLOSE,
+                    struct.pack('!H', code) + reason.encode('utf-8'))
+            except (ConnectionError, OSError):
+                self._lost()
+                return
+            self._close_sent = True
+
+        async def discard():
+            while await self.receive() is not None:
+                pass
+
+        try:
+            await asyncio.wait_for(discard(), timeout)
+        except asyncio.TimeoutError:
+            self._lost()
+
+    async def __aenter__(self) -> 'AsyncWebSocket':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def _mask(payload, mask: bytes) -> bytes:
+    # XOR the payload with the mask repeated to its length, as one integer.
+    length = len(payload)
+    key = int.from_bytes((mask * (length // 4 + 1))[:length], 'big')
+    return (int.from_bytes(payload, 'big') ^ key).to_bytes(length, 'big')
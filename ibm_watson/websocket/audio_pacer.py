@@ -0,0 +1,165 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The pace at which audio is sent to Speech to Text.
+
+The service recognizes audio faster than real time, so by default audio is
+sent as fast as the connection allows, in large chunks. Real-time pacing sends
+audio at the byte rate of its `content_type`, as a live source would, and
+bounded pacing sends at most a given number of bytes per second.
+"""
+
+import struct
+import time
+from typing import Optional
+
+FAST = 'fast'
+REAL_TIME = 'real_time'
+BOUNDED = 'bounded'
+PACINGS = (FAST, REAL_TIME, BOUNDED)
+
+FAST_CHUNK_SIZE = 64 * 1024
+# Paced audio is sent in chunks of this duration.
+CHUNK_DURATION = 0.1
+MIN_CHUNK_SIZE = 1024
+# The first chunk of a WAV file of unknown byte rate holds the header.
+WAV_HEADER_CHUNK_SIZE = 4096
+
+# The bytes per sample of the raw formats.
+_SAMPLE_SIZES = {'audio/l16': 2, 'audio/mulaw': 1, 'audio/alaw': 1}
+
+
+def audio_byte_rate(content_type: Optional[str]) -> Optional[int]:
+    """
+    Return the bytes per second of audio of a type, or `None` if the type
+    does not say, as for compressed formats and WAV.
+
+    :param str content_type: The type of the audio, such as
+           `audio/l16;rate=16000;channels=2`.
+    """
+    if not content_type:
+        return None
+    media_type, *params = [
+        part.strip().lower() for part in content_type.split(';')
+    ]
+    if media_type == 'audio/basic':
+        return 8000
+    if media_type not in _SAMPLE_SIZES:
+        return None
+    values = dict(param.split('=', 1) for param in params if '=' in param)
+    if 'rate' not in values:
+        return None
+    return (int(values['rate']) * int(values.get('channels', 1)) *
+            _SAMPLE_SIZES[media_type])
+
+
+def wav_byte_rate(header: bytes) -> Optional[int]:
+    """
+    Return the bytes per second of WAV audio, from the `fmt` chunk of its
+    header, or `None` if the header has none.
+    """
+    if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+        return None
+    position = 12
+    while position + 8 <= len(header):
+        chunk_id = header[position:position + 4]
+        size, = struct.unpack('<I', header[position + 4:position + 8])
+        if chunk_id == b'fmt ':
+            if position + 20 > len(header):
+                return None
+            return struct.unpack('<I', header[position + 16:position + 20])[0]
+        position += 8 + size + (size & 1)
+    return None
+
+
+class AudioPacer():
+    """
+    The pace of the audio of a recognition.
+
+    :param str pacing: (optional) `fast` to send audio as fast as possible,
+           `real_time` to send it at the byte rate of `content_type`, or
+           `bounded` to send at most `max_bytes_per_second`.
+    :param str content_type: (optional) The type of the audio, for `real_time`
+           pacing. The byte rate of `audio/wav` is read from the header of the
+           audio.
+    :param int max_bytes_per_second: (optional) The byte rate of `bounded`
+           pacing.
+
+    :attr int byte_rate: The bytes sent per second, or `None` for `fast`
+          pacing.
+    :attr int bytes_sent: The bytes paced so far.
+    """
+
+    def __init__(self,
+                 pacing: str = FAST,
+                 *,
+                 content_type: Optional[str] = None,
+                 max_bytes_per_second: Optional[int] = None) -> None:
+        if pacing not in PACINGS:
+            raise ValueError('pacing must be one of {0}'.format(
+                ', '.join(PACINGS)))
+        self.pacing = pacing
+        self.byte_rate = None
+        if pacing == BOUNDED:
+            if not max_bytes_per_second or max_bytes_per_second <= 0:
+                raise ValueError(
+                    'max_bytes_per_second must be positive for bounded pacing')
+            self.byte_rate = max_bytes_per_second
+        elif pacing == REAL_TIME:
+            self.byte_rate = audio_byte_rate(content_type)
+            is_wav = (content_type or '').lower().startswith('audio/wav')
+            if self.byte_rate is None and not is_wav:
+                raise ValueError(
+                    'The byte rate of {0!r} is unknown; use bounded pacing '
+                    'with max_bytes_per_second'.format(content_type))
+        self.bytes_sent = 0
+        self._started = None
+
+    @property
+    def chunk_size(self) -> int:
+        """The number of bytes to read for the next chunk."""
+        if self.pacing == FAST:
+            return FAST_CHUNK_SIZE
+        if self.byte_rate is None:
+            return WAV_HEADER_CHUNK_SIZE
+        return max(MIN_CHUNK_SIZE, int(self.byte_rate * CHUNK_DURATION))
+
+    def delay(self, chunk: bytes) -> float:
+        """
+        Return the seconds to wait before sending a chunk, and count it as
+        sent.
+
+        The delays follow a schedule from the first chunk, so the time spent
+        sending does not slow the pace down.
+        """
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+            if self.pacing == REAL_TIME and self.byte_rate is None:
+                header = bytes(chunk[:WAV_HEADER_CHUNK_SIZE])
+                self.byte_rate = wav_byte_rate(header)
+                if not self.byte_rate:
+                    raise ValueError('The audio has no WAV header')
+        size = len(chunk)
+        self.bytes_sent += size
+        if self.byte_rate is None:
+            return 0.0
+        due = self._started + (self.bytes_sent - size) / self.byte_rate
+        return max(0.0, due - now)
+
+    def __repr__(self) -> str:
+        return '<AudioPacer pacing={0} byte_rate={1}>'.format(
+            self.pacing, self.byte_rate)
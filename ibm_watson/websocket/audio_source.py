@@ -14,14 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import mmap
+import queue
+
+# How long a buffer is waited on before checking whether the recording has
+# completed.
+QUEUE_TIMEOUT = 0.1
+# The formats of the buffers sent as they are: bytes and 16-bit integers,
+# such as a numpy int16 array of audio/l16.
+AUDIO_FORMATS = ('B', 'b', 'c', 'h')
+
 
 class AudioSource(object):
     """"Audio source for the speech to text recognize using websocket"""
 
     def __init__(self, input, is_recording=False, is_buffer=False):
         """
-        :param bytes/Queue input: The audio to transcribe in the format specified by the
-        `Content-Type` header.
+        :param input: The audio to transcribe in the format specified by the
+        `Content-Type` header: a file, a Queue or `asyncio.Queue` of chunks, a
+        bytes-like object such as `bytes`, `bytearray`, `memoryview`, `mmap`
+        or a numpy int16 array, or an iterable or asynchronous iterable of
+        chunks.
         :param bool is_recording: Used to represent if audio recording is in progress
         :param bool is_buffer: `True` if audio is a Queue
         """
@@ -29,8 +43,151 @@ class AudioSource(object):
         self.is_recording = is_recording
         self.is_buffer = is_buffer
 
+    @classmethod
+    def from_file(cls, path):
+        """
+        Returns the audio of a file, memory-mapped so that its chunks are sent
+        without being read into memory first. The file is closed once its
+        audio has been sent.
+
+        :param str path: The path of the audio file.
+        """
+        with open(path, 'rb') as file:
+            try:
+                return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            except ValueError:
+                # An empty file cannot be mapped.
+                return cls(b'')
+
     def completed_recording(self):
         """
         Sets the `is_recording` to False
         """
         self.is_recording = False
+
+    def iter_chunks(self, chunk_size):
+        """
+        Yields the chunks of the audio. A file is read `chunk_size` bytes at a
+        time, then closed; a Queue is read until it is empty and the recording
+        has completed.
+
+        Bytes-like audio, and the bytes-like chunks of an iterable, are yielded
+        as `memoryview` slices of at most `chunk_size` bytes, without copies.
+        A slice is released once the next chunk is requested.
+
+        :param int chunk_size: The bytes read from a file at a time.
+        """
+        if hasattr(self.input, '__aiter__') or isinstance(
+                self.input, asyncio.Queue):
+            raise TypeError('an asynchronous iterable or asyncio.Queue of '
+                            'audio can only be sent on an event loop, with '
+                            'recognize_stream')
+        if self.is_buffer:
+            while self.is_recording or not self.input.empty():
+                try:
+                    yield self.input.get(timeout=QUEUE_TIMEOUT)
+                except queue.Empty:
+                    pass
+            return
+        if _is_bytes_like(self.input):
+            slices = _slices(self.input, chunk_size)
+            try:
+                for chunk in slices:
+                    yield chunk
+            finally:
+                # The slices are released before the mapping is closed.
+                slices.close()
+                if isinstance(self.input, mmap.mmap):
+                    self.input.close()
+            return
+        if hasattr(self.input, 'read'):
+            try:
+                while True:
+                    chunk = self.input.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                self.input.close()
+            return
+        if isinstance(self.input, str):
+            raise TypeError('audio must be bytes, not str')
+        for chunk in self.input:
+            for piece in _slices(chunk, chunk_size):
+                yield piece
+
+    async def aiter_chunks(self, chunk_size):
+        """
+        Yields the chunks of the audio on an event loop, as `iter_chunks()`
+        does. An asynchronous iterable or an `asyncio.Queue` is read as its
+        chunks arrive; a file is read, and a Queue waited on, in the default
+        executor, without blocking the loop.
+
+        :param int chunk_size: The bytes read from a file at a time.
+        """
+        loop = asyncio.get_event_loop()
+        if hasattr(self.input, '__aiter__'):
+            async for chunk in self.input:
+                for piece in _slices(chunk, chunk_size):
+                    yield piece
+        elif isinstance(self.input, asyncio.Queue):
+            while self.is_recording or not self.input.empty():
+                try:
+                    yield await asyncio.wait_for(self.input.get(),
+                                                 QUEUE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+        elif self.is_buffer:
+            while self.is_recording or not self.input.empty():
+                try:
+                    yield await loop.run_in_executor(None, self.input.get,
+                                                     True, QUEUE_TIMEOUT)
+                except queue.Empty:
+                    pass
+        elif hasattr(self.input, 'read') and not _is_bytes_like(self.input):
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, self.input.read,
+                                                       chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                self.input.close()
+        else:
+            chunks = self.iter_chunks(chunk_size)
+            try:
+                for chunk in chunks:
+                    yield chunk
+            finally:
+                chunks.close()
+
+
+def _is_bytes_like(data):
+    try:
+        memoryview(data).release()
+    except TypeError:
+        return False
+    return True
+
+
+def _slices(data, chunk_size):
+    """
+    Yields `memoryview` slices of the bytes of `data`, releasing each one once
+    the next is requested.
+    """
+    with memoryview(data) as view:
+        if view.format.lstrip('@=<>!') not in AUDIO_FORMATS:
+            raise ValueError('audio must be bytes or 16-bit integers, not '
+                             'the format {0!r}'.format(view.format))
+        if not view.c_contiguous:
+            raise ValueError('audio must be a contiguous buffer')
+        try:
+            data_bytes = view.cast('B')
+        except TypeError:
+            # Only native formats can be cast, such as 'h' but not '>h'.
+            data_bytes = memoryview(view.tobytes())
+        with data_bytes:
+            for start in range(0, len(data_bytes), chunk_size):
+                with data_bytes[start:start + chunk_size] as chunk:
+                    yield chunk
@@ -0,0 +1,227 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from .async_websocket import AsyncWebSocket
+from .recognize_stream import RecognizeStream
+
+KEEP_ALIVE_INTERVAL = 20.0
+IDLE_TIMEOUT = 300.0
+
+
+class RecognitionSession():
+    """
+    Speech to Text recognitions, one after the other, over one websocket
+    connection.
+
+    The service listens again once it has answered the audio of a
+    recognition, so the next recognition reuses the connection and skips the
+    DNS lookup, TLS handshake, authentication and websocket upgrade:
+
+        async with speech_to_text.recognition_session(
+                model='en-US_Telephony') as session:
+            async for utterance in utterances:
+                async with session.recognize('audio/mulaw;rate=8000') as stream:
+                    ...
+
+    Between recognitions, the connection is kept alive with pings, and closed
+    once it has been idle for `idle_timeout` seconds. A recognition that finds
+    the connection closed, by the session or the service, opens a new one.
+
+    :param connect: A coroutine function that opens an authenticated
+           connection to `/v1/recognize`.
+    :param float keep_alive_interval: (optional) The seconds between the pings
+           of an idle connection, or `None` for no pings.
+    :param float idle_timeout: (optional) The seconds after which an idle
+           connection is closed, or `None` to keep it open.
+
+    :attr AsyncWebSocket websocket: The connection, while it is open.
+    :attr int connections: The number of connections opened so far.
+    :attr int recognitions: The number of recognitions started so far.
+    """
+
+    def __init__(self,
+                 connect: Callable[[], Awaitable[AsyncWebSocket]],
+                 *,
+                 keep_alive_interval: Optional[float] = KEEP_ALIVE_INTERVAL,
+                 idle_timeout: Optional[float] = IDLE_TIMEOUT) -> None:
+        self.connect = connect
+        self.keep_alive_interval = keep_alive_interval
+        self.idle_timeout = idle_timeout
+        self.websocket = None
+        self.connections = 0
+        self.recognitions = 0
+        self.closed = False
+        # Created on the event loop of the session.
+        self._lock = None
+        self._keep_alive = None
+        self._last_used = None
+
+    async def open(self) -> 'RecognitionSession':
+        """Connect ahead of the first recognition."""
+        if self.closed:
+            raise ValueError('the session is closed')
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await self._connect()
+        if self._keep_alive is None and (self.keep_alive_interval or
+                                         self.idle_timeout):
+            self._keep_alive = asyncio.ensure_future(self._keep_alive_loop())
+        return self
+
+    def recognize(self, content_type: str, **options) -> RecognizeStream:
+        """
+        Return a recognition on the connection of the session, opened with
+        `async with`. Recognitions of a session run one at a time.
+
+        :param str content_type: The type of the audio.
+        :param options: (optional) The other parameters of the `start`
+               message, such as `interim_results`.
+        """
+        if content_type is None:
+            raise ValueError('content_type must be provided')
+        options['content_type'] = content_type
+        options = {k: v for k, v in options.items() if v is not None}
+        return _SessionStream(self, options)
+
+    async def _connect(self) -> AsyncWebSocket:
+        if self.websocket is None or self.websocket.closed:
+            self.websocket = await self.connect()
+            self.connections += 1
+            self._last_used = _now()
+        return self.websocket
+
+    async def _acquire(self) -> AsyncWebSocket:
+        if self._lock is None:
+            await self.open()
+        await self._lock.acquire()
+        try:
+            if self.closed:
+                raise ValueError('the session is closed')
+            websocket = await self._connect()
+        except BaseException:
+            self._lock.release()
+            raise
+        self.recognitions += 1
+        return websocket
+
+    async def _release(self, stream: RecognizeStream) -> None:
+        try:
+            if not stream.finished and stream.websocket is self.websocket:
+                # The service has not answered all the audio of the
+                # recognition, so the connection cannot start another one.
+                await self._drop()
+        finally:
+            self._last_used = _now()
+            self._lock.release()
+
+    async def _drop(self) -> None:
+        websocket, self.websocket = self.websocket, None
+        if websocket is not None:
+            await websocket.close()
+
+    async def _keep_alive_loop(self) -> None:
+        last_ping = _now()
+        while not self.closed:
+            delays = [
+                delay
+                for delay in (self.keep_alive_interval, self.idle_timeout)
+                if delay
+            ]
+            if (self.idle_timeout and self.websocket is not None and
+                    not self._lock.locked()):
+                delays.append(self._last_used + self.idle_timeout - _now())
+            await asyncio.sleep(max(0.0, min(delays)))
+            if self.websocket is None or self._lock.locked():
+                continue
+            if self.websocket.closed:
+                await self._drop()
+            elif (self.idle_timeout and
+                  _now() - self._last_used >= self.idle_timeout):
+                async with self._lock:
+                    await self._drop()
+            elif (self.keep_alive_interval and
+                  _now() - last_ping >= self.keep_alive_interval):
+                last_ping = _now()
+                try:
+                    await self.websocket.ping()
+                except (ConnectionError, OSError):
+                    await self._drop()
+
+    async def close(self) -> None:
+        """Close the connection; the session cannot be used afterwards."""
+        self.closed = True
+        if self._keep_alive is not None:
+            self._keep_alive.cancel()
+            try:
+                await self._keep_alive
+            except asyncio.CancelledError:
+                pass
+        await self._drop()
+
+    async def __aenter__(self) -> 'RecognitionSession':
+        return await self.open()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return ('<RecognitionSession connections={0} recognitions={1} '
+                'closed={2}>'.format(self.connections, self.recognitions,
+                                     self.closed))
+
+
+class _SessionStream(RecognizeStream):
+    """A recognition on the connection of a `RecognitionSession`."""
+
+    def __init__(self, session: RecognitionSession, options: dict) -> None:
+        RecognizeStream.__init__(self, None, options)
+        self.session = session
+        self._released = True
+
+    async def open(self) -> '_SessionStream':
+        connections = self.session.connections
+        self.websocket = await self._connect()
+        try:
+            await self._start()
+        except (ConnectionError, OSError):
+            await self.close()
+            if self.session.connections != connections:
+                raise
+            # The idle connection was closed by the service: open another.
+            return await self.open()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def _connect(self) -> AsyncWebSocket:
+        websocket = await self.session._acquire()
+        self._released = False
+        return websocket
+
+    async def close(self) -> None:
+        """End the recognition; the connection stays open for the next."""
+        if not self._released:
+            self._released = True
+            await self.session._release(self)
+
+
+def _now() -> float:
+    return asyncio.get_event_loop().time()
@@ -23,9 +23,9 @@ try:
 except ImportError:
     import _thread as thread
 
-ONE_KB = 1024
+from .audio_pacer import AudioPacer
+
 TIMEOUT_PREFIX = "No speech detected for"
-TEN_MILLISECONDS = 0.01
 STATE = "state"
 ACTION = "action"
 START = "start"
@@ -42,7 +42,8 @@ class RecognizeListener(object):
                  headers,
                  http_proxy_host=None,
                  http_proxy_port=None,
-                 verify=None):
+                 verify=None,
+                 pacer=None):
         self.audio_source = audio_source
         self.options = options
         self.callback = callback
@@ -52,6 +53,7 @@ class RecognizeListener(object):
         self.http_proxy_port = http_proxy_port
         self.isListening = False
         self.verify = verify
+        self.pacer = pacer if pacer is not None else AudioPacer()
 
         websocket.enableTrace(True)
 
@@ -101,42 +103,20 @@ class RecognizeListener(object):
 
     def send_audio(self, ws):
         """
-        Stream audio to server
+        Stream audio to server, at the pace of `self.pacer`
 
         :param ws: Websocket client
         """
 
         def run(*args):
             """Background process to stream the data"""
-            if not self.audio_source.is_buffer:
-                while True:
-                    chunk = self.audio_source.input.read(ONE_KB)
-                    if not chunk:
-                        break
-                    self.ws_client.send(chunk, websocket.ABNF.OPCODE_BINARY)
-                    time.sleep(TEN_MILLISECONDS)
-
-                self.audio_source.input.close()
-            else:
-                while True:
-                    try:
-                        if not self.audio_source.input.empty():
-                            chunk = self.audio_source.input.get()
-                            self.ws_client.send(chunk,
-                                                websocket.ABNF.OPCODE_BINARY)
-                            time.sleep(TEN_MILLISECONDS)
-                        if self.audio_source.input.empty():
-                            if self.audio_source.is_recording:
-                                time.sleep(TEN_MILLISECONDS)
-                            else:
-                                break
-                    except Exception:
-                        if self.audio_source.is_recording:
-                            time.sleep(TEN_MILLISECONDS)
-                        else:
-                            break
-
-            time.sleep(TEN_MILLISECONDS)
+            chunks = self.audio_source.iter_chunks(self.pacer.chunk_size)
+            for chunk in chunks:
+                delay = self.pacer.delay(chunk)
+                if delay:
+                    time.sleep(delay)
+                self.ws_client.send(chunk, websocket.ABNF.OPCODE_BINARY)
+
             self.ws_client.send(self.build_closing_message(),
                                 websocket.ABNF.OPCODE_TEXT)
 
@@ -229,10 +209,12 @@ class RecognizeListener(object):
         """
         self.callback.on_error(error)
 
-    def on_close(self, ws):
+    def on_close(self, ws, *args):
         """
         Callback executed when websocket connection is closed
 
         :param ws: Websocket client
+        :param args: The close status code and reason, from websocket-client
+               1.0 on
         """
         self.callback.on_close()
@@ -0,0 +1,176 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+from typing import Awaitable, Callable, Optional
+
+from ibm_cloud_sdk_core import ApiException
+
+from .async_websocket import AsyncWebSocket
+from .audio_pacer import AudioPacer
+from .audio_source import AudioSource
+
+# The status of the service errors sent over the websocket, which are errors
+# of the request, as they would be over HTTP.
+ERROR_STATUS = 400
+
+
+class RecognizeStream():
+    """
+    A Speech to Text recognition over a websocket, on an asyncio event loop.
+
+    A stream is opened with `async with`, which connects and waits until the
+    service is listening. The audio is sent with `send()` and ended with
+    `stop()`; iterating the stream returns the messages of the service, such as
+    the `results`, until the service has answered all the audio:
+
+        async with speech_to_text.recognize_stream('audio/wav') as stream:
+            async for chunk in audio:
+                await stream.send(chunk)
+            await stream.stop()
+            async for message in stream:
+                print(message['results'])
+
+    With `interim_results`, the messages are read while the audio is sent,
+    from another task. A stream needs no thread of its own.
+
+    :param connect: A coroutine function that opens an authenticated
+           connection to `/v1/recognize`, with the query of the recognition.
+    :param dict options: The parameters of the `start` message, such as
+           `content_type` and `interim_results`.
+
+    :attr AsyncWebSocket websocket: The connection, once the stream is open.
+    """
+
+    def __init__(self,
+                 connect: Callable[[], Awaitable[AsyncWebSocket]],
+                 options: dict) -> None:
+        self.connect = connect
+        self.options = options
+        self.websocket = None
+        self.stopped = False
+        self.finished = False
+
+    async def open(self) -> 'RecognizeStream':
+        """
+        Connect and send the `start` message; return once the service is
+        listening.
+
+        :raises ApiException: The service refused the connection or the
+                parameters of the recognition.
+        """
+        self.websocket = await self._connect()
+        try:
+            await self._start()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def _connect(self) -> AsyncWebSocket:
+        return await self.connect()
+
+    async def _start(self) -> None:
+        start = dict(self.options, action='start')
+        await self.websocket.send(json.dumps(start))
+        message = await self._receive()
+        if message is None:
+            raise ConnectionError(
+                'the service closed the connection before listening')
+
+    async def send(self, audio) -> None:
+        """
+        Send a chunk of audio.
+
+        :param audio: The audio, as `bytes`, `bytearray` or `memoryview`.
+        """
+        if isinstance(audio, str):
+            raise TypeError('audio must be bytes, not str')
+        if self.stopped:
+            raise ValueError('the audio of the stream was stopped')
+        await self.websocket.send(audio)
+
+    async def send_audio(self,
+                         audio_source: AudioSource,
+                         pacer: Optional[AudioPacer] = None) -> None:
+        """
+        Send the audio of an `AudioSource`, at the pace of `pacer`, then
+        `stop()`. Bytes-like audio is sent in `memoryview` slices, without
+        copies, and an asynchronous iterable as its chunks arrive.
+
+        :param AudioSource audio_source: The audio.
+        :param AudioPacer pacer: (optional) The pace of the audio; as fast as
+               possible by default.
+        """
+        if pacer is None:
+            pacer = AudioPacer()
+        chunks = audio_source.aiter_chunks(pacer.chunk_size)
+        try:
+            async for chunk in chunks:
+                delay = pacer.delay(chunk)
+                if delay:
+                    await asyncio.sleep(delay)
+                await self.send(chunk)
+        finally:
+            # Closes the file of the audio, even if it was not all sent.
+            await chunks.aclose()
+        await self.stop()
+
+    async def stop(self) -> None:
+        """Tell the service that the audio has ended."""
+        if not self.stopped:
+            self.stopped = True
+            await self.websocket.send(json.dumps({'action': 'stop'}))
+
+    def __aiter__(self) -> 'RecognizeStream':
+        return self
+
+    async def __anext__(self) -> dict:
+        if self.finished:
+            raise StopAsyncIteration
+        message = await self._receive()
+        if message is None or 'state' in message:
+            # The service is listening again: it has answered all the audio.
+            self.finished = True
+            raise StopAsyncIteration
+        return message
+
+    async def _receive(self) -> Optional[dict]:
+        message = await self.websocket.receive()
+        if message is None:
+            return None
+        message = json.loads(message)
+        if 'error' in message:
+            # Inactivity timeouts are errors too: "No speech detected for 30s".
+            self.finished = True
+            raise ApiException(ERROR_STATUS, message=message['error'])
+        return message
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self.websocket is not None:
+            await self.websocket.close()
+
+    async def __aenter__(self) -> 'RecognizeStream':
+        return await self.open()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return '<RecognizeStream stopped={0} finished={1}>'.format(
+            self.stopped, self.finished)
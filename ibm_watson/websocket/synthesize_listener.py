@@ -122,10 +122,12 @@ class SynthesizeListener(object):
         """
         self.callback.on_error(error)
 
-    def on_close(self, ws, **kwargs):
+    def on_close(self, ws, *args):
         """
         Callback executed when websocket connection is closed
 
         :param ws: Websocket client
+        :param args: The close status code and reason, from websocket-client
+               1.0 on
         """
         self.callback.on_close()
@@ -0,0 +1,132 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import Awaitable, Callable
+
+from ibm_cloud_sdk_core import ApiException
+
+from .async_websocket import AsyncWebSocket
+from .recognize_stream import ERROR_STATUS
+
+
+class SynthesizeStream():
+    """
+    A Text to Speech synthesis over a websocket, on an asyncio event loop.
+
+    A stream is opened with `async with`, which connects, sends the text and
+    waits for the content type of the audio. Iterating the stream returns the
+    chunks of audio, as `bytes`, until the service closes the connection:
+
+        async with text_to_speech.synthesize_stream(
+                'Hello', accept='audio/wav') as stream:
+            async for audio in stream:
+                player.write(audio)
+
+    :param connect: A coroutine function that opens an authenticated
+           connection to `/v1/synthesize`, with the query of the synthesis.
+    :param dict options: The parameters of the text message: `text`, and
+           `accept` and `timings`.
+
+    :attr AsyncWebSocket websocket: The connection, once the stream is open.
+    :attr str content_type: The format of the audio.
+    :attr list messages: The other messages of the service, such as the word
+          timings and SSML marks, in the order they arrived.
+    """
+
+    def __init__(self,
+                 connect: Callable[[], Awaitable[AsyncWebSocket]],
+                 options: dict) -> None:
+        self.connect = connect
+        self.options = options
+        self.websocket = None
+        self.content_type = None
+        self.messages = []
+        self.finished = False
+
+    async def open(self) -> 'SynthesizeStream':
+        """
+        Connect and send the text; return once the service has sent the
+        content type of the audio.
+
+        :raises ApiException: The service refused the connection or the
+                parameters of the synthesis.
+        """
+        self.websocket = await self._connect()
+        try:
+            await self._start()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def _connect(self) -> AsyncWebSocket:
+        return await self.connect()
+
+    async def _start(self) -> None:
+        await self.websocket.send(json.dumps(self.options))
+        while self.content_type is None:
+            message = await self._receive()
+            if message is None:
+                raise ConnectionError(
+                    'the service closed the connection before synthesizing')
+
+    def __aiter__(self) -> 'SynthesizeStream':
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.finished:
+            raise StopAsyncIteration
+        while True:
+            message = await self._receive()
+            if message is None:
+                self.finished = True
+                raise StopAsyncIteration
+            if isinstance(message, bytes):
+                return message
+
+    async def _receive(self):
+        message = await self.websocket.receive()
+        if message is None or isinstance(message, bytes):
+            return message
+        message = json.loads(message)
+        if 'error' in message:
+            self.finished = True
+            raise ApiException(ERROR_STATUS, message=message['error'])
+        if 'binary_streams' in message:
+            self.content_type = message['binary_streams'][0]['content_type']
+        else:
+            self.messages.append(message)
+        return message
+
+    async def read(self) -> bytes:
+        """Return the whole audio."""
+        return b''.join([audio async for audio in self])
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self.websocket is not None:
+            await self.websocket.close()
+
+    async def __aenter__(self) -> 'SynthesizeStream':
+        return await self.open()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return '<SynthesizeStream content_type={0!r}>'.format(
+            self.content_type)
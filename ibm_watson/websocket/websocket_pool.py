@@ -0,0 +1,347 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Warm websocket connections for Speech to Text and Text to Speech.
+
+Opening a websocket costs a DNS lookup, a TLS handshake, authentication and
+an upgrade, before the first byte of audio. A `WebSocketPool` opens its
+connections ahead of the recognitions or syntheses that use them, so they
+start at once.
+"""
+
+import asyncio
+import collections
+from typing import Awaitable, Callable, Optional
+
+from .async_websocket import AsyncWebSocket
+from .recognize_stream import RecognizeStream
+from .synthesize_stream import SynthesizeStream
+
+DEFAULT_SIZE = 2
+HEALTH_CHECK_INTERVAL = 10.0
+# IAM tokens expire after an hour: connections are replaced well before.
+MAX_AGE = 1800.0
+
+
+class WebSocketPool():
+    """
+    Warm connections to a websocket endpoint, kept per query, such as the
+    model and custom models of a recognition or the voice of a synthesis.
+
+    A pool keeps `size` connections for each query it has served, or warmed
+    with `warm()`, and opens them in the background, on the event loop. The
+    connections of a reusable pool return to it once used; a pool that is not
+    reusable keeps `size` idle connections besides those in use.
+    It checks its idle connections every `health_check_interval` seconds:
+    closed connections, and connections older than `max_age` seconds, whose
+    token may be about to expire, are replaced, and the others are pinged.
+
+    :param connect: A coroutine function that opens an authenticated
+           connection for a `dict` of query parameters.
+    :param int size: (optional) The idle connections kept for each query.
+    :param float health_check_interval: (optional) The seconds between the
+           checks of the idle connections.
+    :param float max_age: (optional) The seconds after which an idle
+           connection is replaced.
+    :param bool reusable: (optional) Whether a connection returns to the pool
+           after it is used. Text to Speech closes the connection of each
+           synthesis.
+
+    :attr int hits: The connections handed out warm.
+    :attr int misses: The connections opened on demand, with none warm.
+    :attr Exception last_error: The error of the last connection that could
+          not be opened in the background.
+    """
+
+    def __init__(self,
+                 connect: Callable[[dict], Awaitable[AsyncWebSocket]],
+                 *,
+                 size: int = DEFAULT_SIZE,
+                 health_check_interval: float = HEALTH_CHECK_INTERVAL,
+                 max_age: Optional[float] = MAX_AGE,
+                 reusable: bool = True) -> None:
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        self.connect = connect
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.max_age = max_age
+        self.reusable = reusable
+        self.hits = 0
+        self.misses = 0
+        self.last_error = None
+        self.closed = False
+        # The idle connections of each query, oldest first.
+        self._idle = {}
+        self._opening = collections.Counter()
+        self._in_use = collections.Counter()
+        self._opened_at = {}
+        self._tasks = set()
+        # Created on the event loop of the pool.
+        self._wakeup = None
+        self._maintainer = None
+
+    async def warm(self, **params) -> None:
+        """
+        Open the idle connections of a query, if they are not open, and
+        return once they are.
+        """
+        key = self._start(params)
+        missing = self._missing(key)
+        await asyncio.gather(*[self._open(key) for _ in range(missing)])
+
+    def idle(self, **params) -> int:
+        """Return the number of idle connections of a query."""
+        return len(self._idle.get(_key(params), ()))
+
+    async def acquire(self, params: dict, *,
+                      fresh: bool = False) -> AsyncWebSocket:
+        """
+        Return a connection for a query: an idle one, or a new one if none is
+        idle or `fresh` is set.
+        """
+        key = self._start(params)
+        idle = self._idle[key]
+        self._wakeup.set()
+        while idle and not fresh:
+            websocket = idle.popleft()
+            if self._healthy(websocket):
+                self.hits += 1
+                self._in_use[key] += 1
+                return websocket
+            self._discard(websocket)
+        self.misses += 1
+        websocket = await self._connect(key)
+        self._in_use[key] += 1
+        return websocket
+
+    async def release(self, params: dict, websocket: AsyncWebSocket,
+                      reusable: bool) -> None:
+        """
+        Return a connection to the pool, if it is `reusable` and the pool has
+        room for it, else close it.
+        """
+        key = _key(params)
+        self._in_use[key] -= 1
+        idle = self._idle.get(key)
+        if (self.closed or not self.reusable or not reusable or
+                idle is None or len(idle) >= self.size or
+                not self._healthy(websocket)):
+            self._opened_at.pop(websocket, None)
+            await websocket.close()
+        else:
+            idle.append(websocket)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _start(self, params: dict) -> tuple:
+        if self.closed:
+            raise ValueError('the pool is closed')
+        if self._maintainer is None:
+            self._wakeup = asyncio.Event()
+            self._maintainer = asyncio.ensure_future(self._maintain())
+        key = _key(params)
+        self._idle.setdefault(key, collections.deque())
+        return key
+
+    async def _connect(self, key: tuple) -> AsyncWebSocket:
+        websocket = await self.connect(dict(key))
+        self._opened_at[websocket] = _now()
+        return websocket
+
+    async def _open(self, key: tuple) -> None:
+        self._opening[key] += 1
+        try:
+            websocket = await self._connect(key)
+        except Exception as error:  # pylint: disable=broad-except
+            # Tried again at the next health check.
+            self.last_error = error
+            return
+        finally:
+            self._opening[key] -= 1
+        if self.closed:
+            await websocket.close()
+        else:
+            self._idle[key].append(websocket)
+
+    def _healthy(self, websocket: AsyncWebSocket) -> bool:
+        if websocket.closed or websocket.reader.at_eof():
+            return False
+        opened_at = self._opened_at.get(websocket, _now())
+        return self.max_age is None or _now() - opened_at < self.max_age
+
+    def _discard(self, websocket: AsyncWebSocket) -> None:
+        self._opened_at.pop(websocket, None)
+        self._spawn(websocket.close())
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _maintain(self) -> None:
+        next_check = _now() + self.health_check_interval
+        while not self.closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(),
+                                       max(next_check - _now(), 0))
+            except asyncio.TimeoutError:
+                pass
+            if self.closed:
+                # wait_for() may return, rather than raise, once cancelled.
+                return
+            self._wakeup.clear()
+            # A busy pool is woken before each check is due: the checks keep
+            # their schedule all the same.
+            check = _now() >= next_check
+            if check:
+                next_check = _now() + self.health_check_interval
+            for key, idle in list(self._idle.items()):
+                if check:
+                    await self._check(idle)
+                missing = self._missing(key)
+                for _ in range(missing):
+                    self._spawn(self._open(key))
+
+    def _missing(self, key: tuple) -> int:
+        missing = self.size - len(self._idle[key]) - self._opening[key]
+        if self.reusable:
+            missing -= self._in_use[key]
+        return missing
+
+    async def _check(self, idle: collections.deque) -> None:
+        for websocket in list(idle):
+            if not self._healthy(websocket):
+                idle.remove(websocket)
+                self._discard(websocket)
+                continue
+            try:
+                await websocket.ping()
+            except (ConnectionError, OSError):
+                if websocket in idle:
+                    idle.remove(websocket)
+                self._discard(websocket)
+
+    async def close(self) -> None:
+        """Close the idle connections; the pool cannot be used afterwards."""
+        self.closed = True
+        tasks = list(self._tasks)
+        if self._maintainer is not None:
+            tasks.append(self._maintainer)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        idle = [
+            websocket for queue in self._idle.values() for websocket in queue
+        ]
+        self._idle.clear()
+        self._opened_at.clear()
+        await asyncio.gather(*[websocket.close() for websocket in idle],
+                             return_exceptions=True)
+
+    async def __aenter__(self) -> 'WebSocketPool':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return '<WebSocketPool size={0} idle={1} hits={2} misses={3}>'.format(
+            self.size, sum(len(queue) for queue in self._idle.values()),
+            self.hits, self.misses)
+
+
+class _PooledStream():
+    """
+    The connection of a stream, from a `WebSocketPool`. A stream that finds
+    its warm connection closed tries once more, on a new connection.
+    """
+
+    def __init__(self, pool: WebSocketPool, params: dict) -> None:
+        self.pool = pool
+        self.params = params
+        self._fresh = False
+        self._failed = False
+
+    async def open(self):
+        self.websocket = await self._connect()
+        try:
+            await self._start()
+        except (ConnectionError, OSError):
+            await self.close()
+            if self._fresh:
+                raise
+            self._fresh = True
+            self.websocket = None
+            return await self.open()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def _connect(self) -> AsyncWebSocket:
+        return await self.pool.acquire(self.params, fresh=self._fresh)
+
+    async def close(self) -> None:
+        """Return the connection to the pool, or close it."""
+        websocket, self.websocket = self.websocket, None
+        if websocket is not None:
+            await self.pool.release(self.params, websocket, self.finished and
+                                    not self._failed)
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        # The connection of a stream that failed is not used again.
+        self._failed = exc_type is not None
+        await self.close()
+
+
+class PooledRecognizeStream(_PooledStream, RecognizeStream):
+    """
+    A `RecognizeStream` on a connection of a `WebSocketPool`. Once the
+    service has answered all its audio, the connection returns to the pool.
+
+    :param WebSocketPool pool: The pool of `/v1/recognize` connections.
+    :param dict params: The query of the recognition.
+    :param dict options: The parameters of the `start` message.
+    """
+
+    def __init__(self, pool: WebSocketPool, params: dict,
+                 options: dict) -> None:
+        RecognizeStream.__init__(self, None, options)
+        _PooledStream.__init__(self, pool, params)
+
+
+class PooledSynthesizeStream(_PooledStream, SynthesizeStream):
+    """
+    A `SynthesizeStream` on a connection of a `WebSocketPool`.
+
+    :param WebSocketPool pool: The pool of `/v1/synthesize` connections.
+    :param dict params: The query of the synthesis.
+    :param dict options: The parameters of the text message.
+    """
+
+    def __init__(self, pool: WebSocketPool, params: dict,
+                 options: dict) -> None:
+        SynthesizeStream.__init__(self, None, options)
+        _PooledStream.__init__(self, pool, params)
+
+
+def _key(params: dict) -> tuple:
+    return tuple(sorted((k, v) for k, v in params.items() if v is not None))
+
+
+def _now() -> float:
+    return asyncio.get_event_loop().time()
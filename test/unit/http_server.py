@@ -0,0 +1,53 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A local HTTP server for the unit tests that need real sockets.
+"""
+
+import contextlib
+import socketserver
+import threading
+from http.server import HTTPServer
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """
+    An HTTP server with a thread per connection, as the one of `http.server`,
+    which Python 3.6 lacks.
+    """
+
+    daemon_threads = True
+
+
+@contextlib.contextmanager
+def serve(handler, **attributes):
+    """
+    Serve requests with `handler` on a background thread, and yield the
+    server, with `attributes` set and its `url`.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    for name, value in attributes.items():
+        setattr(server, name, value)
+    server.url = 'http://127.0.0.1:{0}'.format(server.server_port)
+    thread = threading.Thread(target=server.serve_forever,
+                              args=(0.05,),
+                              daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
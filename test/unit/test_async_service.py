@@ -0,0 +1,270 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the asynchronous service clients
+"""
+
+import asyncio
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import ibm_watson
+from ibm_watson import ConnectionPoolConfig
+from ibm_watson.assistant_v2 import AssistantV2, AsyncAssistantV2, MessageResponse
+from ibm_watson.natural_language_classifier_v1 import \
+    AsyncNaturalLanguageClassifierV1
+from ibm_watson.speech_to_text_v1 import AsyncSpeechToTextV1
+from ibm_watson.watson_service import AsyncWatsonService
+
+from .event_loop import run_until_complete
+from .http_server import serve
+
+httpx = pytest.importorskip('httpx')
+
+_base_url = 'https://api.us-south.assistant.watson.cloud.ibm.com'
+_message_url = _base_url + '/v2/assistants/my_assistant/sessions/my_session/message'
+
+
+def _client(service_class, handler, **kwargs):
+    service = service_class(authenticator=BearerTokenAuthenticator('token'),
+                            **kwargs)
+    service.set_service_url(_base_url)
+    service.set_async_http_client(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return service
+
+
+def _assistant(handler):
+    return _client(AsyncAssistantV2, handler, version='2021-06-14')
+
+
+class TestAsyncClient():
+
+    def test_classes(self):
+        assert ibm_watson.AsyncAssistantV2 is AsyncAssistantV2
+        assert issubclass(AsyncAssistantV2, AssistantV2)
+        for name in ibm_watson.__all__:
+            if name.startswith('Async'):
+                assert issubclass(getattr(ibm_watson, name),
+                                  AsyncWatsonService)
+
+    def test_message(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200,
+                                  json={
+                                      'output': {},
+                                      'user_id': 'user'
+                                  })
+
+        async def main():
+            async with _assistant(handler) as assistant:
+                response = await assistant.message('my_assistant',
+                                                   'my_session',
+                                                   input={'text': 'Hello'})
+                assert response.get_status_code() == 200
+                assert response.get_result() == {
+                    'output': {},
+                    'user_id': 'user'
+                }
+                assistant.set_response_model(True)
+                response = await assistant.message('my_assistant',
+                                                   'my_session')
+                assert isinstance(response.get_result(), MessageResponse)
+            assert assistant.get_async_http_client().is_closed
+
+        run_until_complete(main())
+        request = requests[0]
+        assert request.method == 'POST'
+        assert str(request.url).startswith(_message_url + '?')
+        assert request.url.params['version'] == '2021-06-14'
+        assert request.headers['Authorization'] == 'Bearer token'
+        assert 'watson-apis-python-sdk' in request.headers['User-Agent']
+        assert json.loads(request.content) == {'input': {'text': 'Hello'}}
+
+    def test_concurrent_calls(self):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(201, json={'session_id': 's'})
+
+        async def main():
+            assistant = _assistant(handler)
+            started = time.monotonic()
+            responses = await asyncio.gather(
+                *[assistant.create_session('a') for _ in range(50)])
+            return responses, time.monotonic() - started
+
+        responses, elapsed = run_until_complete(main())
+        assert [r.get_result() for r in responses] == [{'session_id': 's'}] * 50
+        assert elapsed < 1
+
+    def test_error(self):
+        def handler(request):
+            return httpx.Response(404,
+                                  json={'error': 'Not found'},
+                                  headers={'X-Global-Transaction-ID': 'tx'})
+
+        with pytest.raises(ApiException) as exc_info:
+            run_until_complete(_assistant(handler).create_session('a'))
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.message == 'Not found'
+        assert exc_info.value.global_transaction_id == 'tx'
+
+    def test_invalid_json(self):
+        def handler(request):
+            return httpx.Response(200,
+                                  content=b'{"output": ',
+                                  headers={'Content-Type': 'application/json'})
+
+        with pytest.raises(ApiException):
+            run_until_complete(_assistant(handler).create_session('a'))
+
+    def test_binary_and_streamed_results(self):
+        def handler(request):
+            return httpx.Response(200,
+                                  content=b'RIFF',
+                                  headers={'Content-Type': 'audio/wav'})
+
+        async def main():
+            assistant = _assistant(handler)
+            response = await assistant.create_session('a')
+            assert response.get_result().content == b'RIFF'
+            response = await assistant.create_session('a', stream=True)
+            result = response.get_result()
+            chunks = [chunk async for chunk in result.aiter_bytes()]
+            await result.aclose()
+            assert b''.join(chunks) == b'RIFF'
+
+        run_until_complete(main())
+
+    def test_no_content(self):
+        def handler(request):
+            return httpx.Response(204)
+
+        response = run_until_complete(_assistant(handler).delete_session('a', 's'))
+        assert response.get_result() is None
+        assert response.get_status_code() == 204
+
+    def test_file_body(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append((request.headers['Content-Type'], request.read()))
+            return httpx.Response(200, json={'results': []})
+
+        audio = io.BytesIO(b'\0' * 200000)
+        speech_to_text = _client(AsyncSpeechToTextV1, handler)
+        response = run_until_complete(
+            speech_to_text.recognize(audio, content_type='audio/l16;rate=16000'))
+        assert response.get_result() == {'results': []}
+        assert bodies == [('audio/l16;rate=16000', b'\0' * 200000)]
+
+    def test_multipart(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append((request.headers['Content-Type'], request.read()))
+            return httpx.Response(200, json={'classifier_id': 'c'})
+
+        classifier = _client(AsyncNaturalLanguageClassifierV1, handler)
+        run_until_complete(
+            classifier.create_classifier(io.BytesIO(b'{"language": "en"}'),
+                                         io.BytesIO(b'text,class')))
+        content_type, body = bodies[0]
+        assert content_type.startswith('multipart/form-data; boundary=')
+        assert b'name="training_metadata"' in body
+        assert b'{"language": "en"}' in body
+        assert b'name="training_data"' in body
+        assert b'text,class' in body
+
+    def test_prepare_operation(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={'output': {}})
+
+        message = _assistant(handler).prepare_operation('message',
+                                                        'my_assistant',
+                                                        'my_session')
+        response = run_until_complete(message(input={'text': 'Hi'}))
+        assert response.get_result() == {'output': {}}
+        assert bodies == [{'input': {'text': 'Hi'}}]
+
+    def test_http_client(self, monkeypatch):
+        assistant = AsyncAssistantV2(
+            version='2021-06-14',
+            authenticator=BearerTokenAuthenticator('token'),
+            connection_pool=ConnectionPoolConfig(pool_maxsize=5,
+                                                 idle_timeout=30))
+        client = assistant.get_async_http_client()
+        assert isinstance(client, httpx.AsyncClient)
+        assert assistant.get_async_http_client() is client
+        run_until_complete(assistant.aclose())
+
+        monkeypatch.setitem(sys.modules, 'httpx', None)
+        with pytest.raises(ImportError, match='ibm-watson\\[async\\]'):
+            AsyncAssistantV2(
+                version='2021-06-14',
+                authenticator=BearerTokenAuthenticator(
+                    'token')).get_async_http_client()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        time.sleep(0.02)
+        with self.server.lock:
+            self.server.clients.add(self.client_address)
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool():
+
+    def test_pool_maxsize(self):
+
+        async def main(server):
+            async with AsyncAssistantV2(
+                    version='2021-06-14',
+                    authenticator=BearerTokenAuthenticator('token'),
+                    connection_pool=ConnectionPoolConfig(
+                        pool_maxsize=4, pool_block=True)) as assistant:
+                assistant.set_service_url(server.url)
+                for _ in range(2):
+                    await asyncio.gather(
+                        *[assistant.create_session('a') for _ in range(20)])
+
+        with serve(_Handler, clients=set(),
+                   lock=threading.Lock()) as server:
+            run_until_complete(main(server))
+        assert len(server.clients) == 4
@@ -0,0 +1,284 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the pacing and chunking of audio sent to Speech to Text
+"""
+
+import array
+import asyncio
+import io
+import mmap
+import queue
+import struct
+import threading
+import time
+
+import pytest
+from ibm_watson.websocket import AudioPacer, AudioSource
+from ibm_watson.websocket import audio_pacer
+from ibm_watson.websocket.audio_pacer import audio_byte_rate, wav_byte_rate
+
+
+def _wav_header(sample_rate, channels, extra_chunk=b''):
+    byte_rate = sample_rate * channels * 2
+    return (b'RIFF' + struct.pack('<I', 0) + b'WAVE' + extra_chunk + b'fmt ' +
+            struct.pack('<IHHIIHH', 16, 1, channels, sample_rate, byte_rate,
+                        channels * 2, 16) + b'data' + struct.pack('<I', 0))
+
+
+class _Clock():
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAudioPacer():
+
+    def test_byte_rates(self):
+        assert audio_byte_rate('audio/l16;rate=16000') == 32000
+        assert audio_byte_rate('audio/L16; rate=8000; channels=2') == 32000
+        assert audio_byte_rate('audio/mulaw;rate=8000') == 8000
+        assert audio_byte_rate('audio/alaw;rate=8000') == 8000
+        assert audio_byte_rate('audio/basic') == 8000
+        for content_type in ('audio/l16', 'audio/wav', 'audio/flac',
+                             'audio/ogg;codecs=opus', None):
+            assert audio_byte_rate(content_type) is None
+
+        assert wav_byte_rate(_wav_header(16000, 1)) == 32000
+        assert wav_byte_rate(_wav_header(44100, 2)) == 176400
+        list_chunk = b'LIST' + struct.pack('<I', 5) + b'INFO!\x00'
+        assert wav_byte_rate(_wav_header(8000, 1, list_chunk)) == 16000
+        assert wav_byte_rate(b'RIFF\x00\x00\x00\x00WAVEfmt ') is None
+        assert wav_byte_rate(b'OggS' + bytes(100)) is None
+
+    def test_pacing(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr(audio_pacer.time, 'monotonic', clock)
+
+        fast = AudioPacer()
+        assert fast.chunk_size == audio_pacer.FAST_CHUNK_SIZE
+        assert [fast.delay(bytes(65536)) for _ in range(3)] == [0, 0, 0]
+        assert fast.bytes_sent == 3 * 65536
+
+        bounded = AudioPacer('bounded', max_bytes_per_second=10000)
+        assert bounded.chunk_size == 1024
+        assert bounded.delay(bytes(5000)) == 0
+        clock.now += 0.1
+        assert bounded.delay(bytes(5000)) == pytest.approx(0.4)
+        # Time spent sending is not added to the delays.
+        clock.now += 0.9
+        assert bounded.delay(bytes(5000)) == pytest.approx(0)
+        assert bounded.delay(bytes(5000)) == pytest.approx(0.5)
+
+        real_time = AudioPacer('real_time',
+                               content_type='audio/l16;rate=16000')
+        assert real_time.byte_rate == 32000
+        assert real_time.chunk_size == 3200
+        wav = AudioPacer('real_time', content_type='audio/wav')
+        assert wav.byte_rate is None
+        assert wav.delay(_wav_header(8000, 1) + bytes(4000)) == 0
+        assert wav.byte_rate == 16000
+        assert wav.delay(bytes(100)) == pytest.approx(4044 / 16000)
+
+        with pytest.raises(ValueError):
+            AudioPacer('real_time', content_type='audio/wav').delay(bytes(44))
+        with pytest.raises(ValueError):
+            AudioPacer('real_time', content_type='audio/mp3')
+        with pytest.raises(ValueError):
+            AudioPacer('bounded')
+        with pytest.raises(ValueError):
+            AudioPacer('slow')
+
+
+class TestAudioSource():
+
+    def test_file_chunks(self):
+        audio = io.BytesIO(bytes(range(256)) * 10)
+        chunks = list(AudioSource(audio).iter_chunks(1000))
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+        assert b''.join(chunks) == bytes(range(256)) * 10
+        assert audio.closed
+
+    def test_buffer_chunks(self):
+        buffer = queue.Queue()
+        source = AudioSource(buffer, is_recording=True, is_buffer=True)
+
+        def record():
+            for i in range(5):
+                time.sleep(0.01)
+                buffer.put(bytes([i]) * 10)
+            source.completed_recording()
+
+        recorder = threading.Thread(target=record)
+        recorder.start()
+        assert list(source.iter_chunks(1024)) == [
+            bytes([i]) * 10 for i in range(5)
+        ]
+        recorder.join()
+
+        buffer.put(b'recorded')
+        assert list(
+            AudioSource(buffer, is_buffer=True).iter_chunks(1024)) == [
+                b'recorded'
+            ]
+
+    def test_memory_chunks(self, tmp_path):
+        audio = bytes(range(256)) * 10
+        for memory in (audio, bytearray(audio), memoryview(audio)):
+            owner = memory.obj if isinstance(memory, memoryview) else memory
+            chunks, lengths = [], []
+            for chunk in AudioSource(memory).iter_chunks(1000):
+                # A slice of the audio, not a copy.
+                assert isinstance(chunk, memoryview) and chunk.obj is owner
+                chunks.append(chunk)
+                lengths.append(len(chunk))
+            assert lengths == [1000, 1000, 560]
+            # Each chunk is released once the next is requested.
+            with pytest.raises(ValueError):
+                bytes(chunks[0])
+
+        samples = array.array('h', range(-100, 100))
+        assert b''.join(
+            bytes(chunk) for chunk in AudioSource(samples).iter_chunks(64)
+        ) == samples.tobytes()
+        with pytest.raises(ValueError):
+            list(AudioSource(array.array('f', [0.5])).iter_chunks(64))
+        with pytest.raises(TypeError):
+            list(AudioSource('audio').iter_chunks(64))
+
+        path = tmp_path / 'audio.raw'
+        path.write_bytes(audio)
+        source = AudioSource.from_file(str(path))
+        assert isinstance(source.input, mmap.mmap)
+        assert b''.join(bytes(chunk)
+                        for chunk in source.iter_chunks(1000)) == audio
+        assert source.input.closed
+        (tmp_path / 'empty.raw').write_bytes(b'')
+        assert list(
+            AudioSource.from_file(str(tmp_path / 'empty.raw')).iter_chunks(
+                1000)) == []
+
+    def test_numpy_chunks(self):
+        numpy = pytest.importorskip('numpy')
+        samples = numpy.arange(-1000, 1000, dtype=numpy.int16)
+        assert b''.join(
+            bytes(chunk) for chunk in AudioSource(samples).iter_chunks(1024)
+        ) == samples.tobytes()
+        with pytest.raises(ValueError):
+            list(AudioSource(samples.astype(numpy.float32)).iter_chunks(1024))
+
+    def test_iterable_chunks(self):
+
+        def generate():
+            yield b'a' * 1500
+            yield bytearray(b'b' * 10)
+
+        chunks = [
+            bytes(chunk) for chunk in AudioSource(generate()).iter_chunks(1000)
+        ]
+        assert chunks == [b'a' * 1000, b'a' * 500, b'b' * 10]
+
+        async def agenerate():
+            for chunk in generate():
+                await asyncio.sleep(0)
+                yield chunk
+
+        with pytest.raises(TypeError):
+            list(AudioSource(agenerate()).iter_chunks(1000))
+
+        async def read(source):
+            return [bytes(chunk) async for chunk in source.aiter_chunks(1000)]
+
+        loop = asyncio.new_event_loop()
+        try:
+            for audio in (agenerate(), generate()):
+                assert loop.run_until_complete(read(AudioSource(audio))) == chunks
+            buffer = queue.Queue()
+            source = AudioSource(buffer, is_recording=True, is_buffer=True)
+
+            async def record():
+                for i in range(3):
+                    await asyncio.sleep(0.01)
+                    buffer.put(bytes([i]))
+                source.completed_recording()
+
+            async def main():
+                return await asyncio.gather(read(source), record())
+
+            recorded, _ = loop.run_until_complete(main())
+            assert recorded == [b'\x00', b'\x01', b'\x02']
+        finally:
+            loop.close()
+
+    def test_async_chunks(self, tmp_path):
+        threads = []
+
+        class _File(io.BytesIO):
+
+            def read(self, size=-1):
+                threads.append(threading.current_thread())
+                return io.BytesIO.read(self, size)
+
+        async def read(source):
+            return [bytes(chunk) async for chunk in source.aiter_chunks(1000)]
+
+        loop = asyncio.new_event_loop()
+        try:
+            # A file is read off the thread of the event loop.
+            audio = _File(bytes(2500))
+            assert loop.run_until_complete(read(AudioSource(audio))) == [
+                bytes(1000), bytes(1000), bytes(500)
+            ]
+            assert audio.closed
+            assert threading.current_thread() not in threads
+
+            async def record(source):
+                for i in range(3):
+                    await asyncio.sleep(0.01)
+                    await source.input.put(bytes([i]))
+                source.completed_recording()
+
+            async def main():
+                source = AudioSource(asyncio.Queue(), is_recording=True)
+                recorded, _ = await asyncio.gather(read(source), record(source))
+                return recorded
+
+            assert loop.run_until_complete(main()) == [
+                b'\x00', b'\x01', b'\x02'
+            ]
+            with pytest.raises(TypeError):
+                list(AudioSource(asyncio.Queue()).iter_chunks(1000))
+
+            # The file is closed when the audio is not all consumed.
+            path = tmp_path / 'audio.raw'
+            path.write_bytes(bytes(2500))
+            source = AudioSource.from_file(str(path))
+            chunks = source.iter_chunks(1000)
+            next(chunks)
+            chunks.close()
+            assert source.input.closed
+
+            for source in (AudioSource.from_file(str(path)),
+                           AudioSource(_File(bytes(2500)))):
+                chunks = source.aiter_chunks(1000)
+                loop.run_until_complete(chunks.__anext__())
+                loop.run_until_complete(chunks.aclose())
+                assert source.input.closed
+        finally:
+            loop.close()
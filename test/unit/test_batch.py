@@ -0,0 +1,176 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for BatchExecutor
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import BatchExecutor
+from ibm_watson.language_translator_v3 import LanguageTranslatorV3
+
+from .event_loop import run_until_complete
+
+
+def _echo(delay=0, value=None, error=None):
+    time.sleep(delay)
+    if error is not None:
+        raise error
+    return DetailedResponse(response={'value': value}, status_code=200)
+
+
+def _too_many_requests(retry_after=None):
+    response = requests.Response()
+    response.status_code = 429
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return ApiException(429, http_response=response)
+
+
+class TestBatchExecutor():
+
+    def test_ordered(self):
+        items = [{'delay': 0.05 * (5 - i), 'value': i} for i in range(5)]
+        results = list(BatchExecutor(_echo, max_workers=5).map(items))
+        assert [result.index for result in results] == list(range(5))
+        assert [result.get_result()['value'] for result in results] == list(
+            range(5))
+
+    def test_as_completed(self):
+        items = [{'delay': 0.05 * (5 - i), 'value': i} for i in range(5)]
+        executor = BatchExecutor(_echo, max_workers=5, ordered=False)
+        results = list(executor.map(items))
+        assert [result.index for result in results] == [4, 3, 2, 1, 0]
+
+    def test_errors(self):
+        items = [{'value': 0}, {'error': ValueError('bad')}, {'value': 2}]
+        results = list(BatchExecutor(_echo).map(items))
+        assert [result.error is None for result in results] == [
+            True, False, True
+        ]
+        assert results[1].response is None
+        with pytest.raises(ValueError):
+            results[1].get_result()
+        assert 'ValueError' in repr(results[1])
+
+    def test_bounded_input(self):
+        consumed = []
+
+        def items():
+            for i in range(1000):
+                consumed.append(i)
+                yield {'value': i}
+
+        results = BatchExecutor(_echo, max_workers=4).map(items())
+        next(results)
+        assert len(consumed) <= 9
+        results.close()
+
+    def test_concurrency(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def operation(value):
+            with lock:
+                active.append(value)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(value)
+            return DetailedResponse(response=value, status_code=200)
+
+        results = list(
+            BatchExecutor(operation, max_workers=3).map(
+                {'value': i} for i in range(30)))
+        assert len(results) == 30
+        assert max(peak) == 3
+
+    def test_retry_after(self):
+        calls = []
+
+        def operation(value):
+            calls.append((value, time.monotonic()))
+            if len(calls) == 1:
+                raise _too_many_requests('0.2')
+            time.sleep(0.05)
+            return DetailedResponse(response=value, status_code=200)
+
+        started = time.monotonic()
+        results = list(
+            BatchExecutor(operation, max_workers=2).map(
+                [{'value': 0}, {'value': 1}, {'value': 2}]))
+        assert [result.get_result() for result in results] == [0, 1, 2]
+        assert [result.attempts for result in results] == [2, 1, 1]
+        # The retry, and the call started by the other worker after the 429,
+        # waited for the Retry-After delay.
+        called = dict(calls[1:])
+        assert called[0] - started >= 0.2
+        assert called[2] - started >= 0.2
+
+    def test_max_retries(self):
+        def operation():
+            raise _too_many_requests('0')
+
+        result, = BatchExecutor(operation, max_retries=2).map([{}])
+        assert result.attempts == 3
+        assert result.error.status_code == 429
+
+    @responses.activate
+    def test_service_operation(self):
+        url = 'https://api.us-south.language-translator.watson.cloud.ibm.com/v3/translate'
+        responses.add(responses.POST,
+                      url,
+                      status=429,
+                      headers={'Retry-After': '0'},
+                      json={'error': 'Too Many Requests'})
+        responses.add(responses.POST,
+                      url,
+                      json={'translations': [{
+                          'translation': 'Hallo'
+                      }]})
+        translator = LanguageTranslatorV3(version='2018-05-01',
+                                          authenticator=NoAuthAuthenticator())
+        executor = BatchExecutor(translator.translate, max_workers=1)
+        result, = executor.map([{'text': ['Hello'], 'model_id': 'en-de'}])
+        assert result.attempts == 2
+        assert result.get_result()['translations'][0]['translation'] == 'Hallo'
+
+    def test_amap(self):
+        async def operation(delay, value):
+            await asyncio.sleep(delay)
+            if value == 2:
+                raise ValueError('bad')
+            return DetailedResponse(response=value, status_code=200)
+
+        async def collect(executor):
+            items = ({'delay': 0.01 * (5 - i), 'value': i} for i in range(5))
+            return [result async for result in executor.amap(items)]
+
+        results = run_until_complete(collect(BatchExecutor(operation, max_workers=2)))
+        assert [result.index for result in results] == list(range(5))
+        assert isinstance(results[2].error, ValueError)
+        assert results[4].get_result() == 4
+        results = run_until_complete(
+            collect(BatchExecutor(operation, max_workers=5, ordered=False)))
+        assert [result.index for result in results] == [4, 3, 2, 1, 0]
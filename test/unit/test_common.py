@@ -15,6 +15,11 @@
 # limitations under the License.
 
 from ibm_watson import get_sdk_headers
+from ibm_watson.common import (get_operation_ids, get_retry_after,
+                               prebuild_sdk_headers)
+import email.utils
+import requests
+import time
 import unittest
 
 
@@ -30,3 +35,34 @@ class TestCommon(unittest.TestCase):
             headers.get('X-IBMCloud-SDK-Analytics'),
             'service_name=my_service;service_version=v1;operation_id=my_operation'
         )
+
+    def test_get_sdk_headers_cached(self):
+        headers = get_sdk_headers('my_service', 'v1', 'my_operation')
+        self.assertIs(headers,
+                      get_sdk_headers('my_service', 'v1', 'my_operation'))
+        self.assertIsNot(headers,
+                         get_sdk_headers('my_service', 'v1', 'other_operation'))
+        with self.assertRaises(TypeError):
+            headers['User-Agent'] = 'changed'
+
+    def test_prebuild_sdk_headers(self):
+        from ibm_watson.assistant_v2 import AssistantV2
+        from ibm_watson.common import _sdk_headers_cache
+        operation_ids = get_operation_ids(AssistantV2)
+        self.assertIn('message', operation_ids)
+        self.assertNotIn('send', operation_ids)
+        prebuild_sdk_headers('prebuilt', 'V2', operation_ids)
+        for operation_id in operation_ids:
+            self.assertIn(('prebuilt', 'V2', operation_id), _sdk_headers_cache)
+
+    def test_get_retry_after(self):
+        response = requests.Response()
+        self.assertIsNone(get_retry_after(None))
+        self.assertIsNone(get_retry_after(response))
+        response.headers['Retry-After'] = '3'
+        self.assertEqual(get_retry_after(response), 3)
+        response.headers['Retry-After'] = email.utils.formatdate(
+            time.time() + 60, usegmt=True)
+        self.assertTrue(55 < get_retry_after(response) <= 60)
+        response.headers['Retry-After'] = 'soon'
+        self.assertIsNone(get_retry_after(response))
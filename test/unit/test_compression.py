@@ -0,0 +1,173 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for request body compression
+"""
+
+import gzip
+import io
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import MetricsCollector
+from ibm_watson.assistant_v1 import AssistantV1, AsyncAssistantV1
+from ibm_watson.compression import GzipBody, should_compress
+
+from .event_loop import run_until_complete
+from .http_server import serve
+
+_INTENTS = [{
+    'intent': 'intent_{0}'.format(i),
+    'examples': [{
+        'text': 'example {0} of intent {1}'.format(j, i)
+    } for j in range(20)]
+} for i in range(50)]
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                chunk = self.rfile.read(size)
+                self.rfile.readline()
+                if not size:
+                    break
+                body += chunk
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append((dict(self.headers), body))
+        response = b'{"name": "workspace"}'
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with serve(_EchoHandler, received=[]) as server:
+        yield server
+
+
+def _assistant(server):
+    assistant = AssistantV1(version='2021-06-14',
+                            authenticator=NoAuthAuthenticator())
+    assistant.set_service_url(server.url)
+    return assistant
+
+
+class TestCompression():
+
+    def test_gzip_body(self):
+        data = json.dumps(_INTENTS).encode('utf-8')
+        body = GzipBody(data, chunk_size=1000)
+        compressed = b''.join(body)
+        assert gzip.decompress(compressed) == data
+        assert body.bytes_in == len(data)
+        assert body.bytes_out == len(compressed) < len(data) / 5
+        # The gzip header holds no time, so bodies are reproducible.
+        assert b''.join(GzipBody(data)) == b''.join(GzipBody(data))
+
+        for source in (data.decode('utf-8'), io.BytesIO(data),
+                       io.StringIO(data.decode('utf-8')),
+                       (data[i:i + 100] for i in range(0, len(data), 100))):
+            assert gzip.decompress(b''.join(GzipBody(source))) == data
+        assert gzip.decompress(b''.join(GzipBody(b''))) == b''
+
+    def test_should_compress(self):
+        json_headers = {'content-type': 'application/json'}
+        assert should_compress(b'x' * 100, json_headers, 100)
+        assert not should_compress(b'x' * 99, json_headers, 100)
+        assert not should_compress(b'x' * 100, json_headers, None)
+        assert not should_compress(None, json_headers, 0)
+        assert not should_compress({'a': 'b'}, json_headers, 0)
+        for content_type in ('text/plain;charset=utf-8', 'text/html',
+                             'application/vnd.ibm+json', 'application/xml'):
+            assert should_compress(b'x', {'Content-Type': content_type}, 0)
+        for content_type in ('audio/wav', 'application/octet-stream', None):
+            assert not should_compress(b'x', {'Content-Type': content_type},
+                                       0)
+        assert not should_compress(b'x', {
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip'
+        }, 0)
+        assert should_compress(io.BytesIO(b'x' * 100), json_headers, 100)
+        assert not should_compress(io.BytesIO(b'x' * 99), json_headers, 100)
+        assert should_compress(iter([b'x']), json_headers, 100)
+
+    def test_service(self, server):
+        assistant = _assistant(server)
+        metrics = MetricsCollector()
+        assistant.add_instrumentation(metrics)
+        assistant.create_workspace(name='small')
+        assistant.set_request_compression(1024, level=9)
+        assistant.create_workspace(name='small')
+        response = assistant.create_workspace(name='large', intents=_INTENTS)
+        assert response.get_result() == {'name': 'workspace'}
+
+        (headers, body), (small_headers, _), (large_headers, large) = \
+            server.received
+        for uncompressed in (headers, small_headers):
+            assert 'Content-Encoding' not in uncompressed
+        assert large_headers['Content-Encoding'] == 'gzip'
+        assert large_headers['Transfer-Encoding'] == 'chunked'
+        assert json.loads(gzip.decompress(large)) == {
+            'name': 'large',
+            'intents': _INTENTS
+        }
+        assert json.loads(body) == {'name': 'small'}
+        create_workspace = metrics.get_metrics()[('assistant',
+                                                  'create_workspace')]
+        assert create_workspace.bytes_sent == 2 * len(body) + len(large)
+
+        assistant.set_request_compression(None)
+        assistant.create_workspace(name='large', intents=_INTENTS)
+        assert 'Content-Encoding' not in server.received[-1][0]
+        with pytest.raises(ValueError):
+            assistant.set_request_compression(level=10)
+
+    def test_async(self):
+        httpx = pytest.importorskip('httpx')
+        received = []
+
+        def handler(request):
+            received.append((request.headers, request.read()))
+            return httpx.Response(201, json={'name': 'workspace'})
+
+        async def main():
+            assistant = AsyncAssistantV1(version='2021-06-14',
+                                         authenticator=NoAuthAuthenticator())
+            assistant.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            assistant.set_request_compression()
+            async with assistant:
+                await assistant.create_workspace(name='large',
+                                                 intents=_INTENTS)
+
+        run_until_complete(main())
+        headers, body = received[0]
+        assert headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(body))['intents'] == _INTENTS
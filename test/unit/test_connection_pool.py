@@ -0,0 +1,143 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the connection pool settings of the services
+"""
+
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import AssistantV2, ConnectionPoolConfig, DiscoveryV2
+from ibm_watson.connection_pool import PooledHTTPAdapter, close_shared_pools
+
+from .http_server import serve
+
+
+def _assistant(connection_pool=None):
+    return AssistantV2(version='2021-06-14',
+                       authenticator=NoAuthAuthenticator(),
+                       connection_pool=connection_pool)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.clients.add(self.client_address)
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with serve(_Handler, clients=set()) as server:
+        yield server
+
+
+class TestConnectionPoolConfig():
+
+    def test_equality(self):
+        config = ConnectionPoolConfig(pool_maxsize=32, shared=True)
+        assert config == ConnectionPoolConfig(pool_maxsize=32, shared=True)
+        assert hash(config) == hash(
+            ConnectionPoolConfig(pool_maxsize=32, shared=True))
+        assert config != ConnectionPoolConfig(pool_maxsize=16, shared=True)
+        assert 'pool_maxsize=32' in repr(config)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ConnectionPoolConfig(pool_maxsize=0)
+        with pytest.raises(ValueError):
+            ConnectionPoolConfig(idle_timeout=0)
+        with pytest.raises(TypeError):
+            _assistant().set_connection_pool({'pool_maxsize': 4})
+
+
+class TestServiceConnectionPool():
+
+    def test_default(self):
+        service = _assistant()
+        assert service.connection_pool is None
+        assert not isinstance(service.http_adapter, PooledHTTPAdapter)
+
+    def test_pool_size(self):
+        config = ConnectionPoolConfig(pool_connections=2,
+                                      pool_maxsize=32,
+                                      pool_block=True)
+        service = _assistant(config)
+        adapter = service.http_client.get_adapter('https://example.com')
+        assert adapter is service.http_adapter
+        assert isinstance(adapter, PooledHTTPAdapter)
+        pool = adapter.poolmanager.connection_from_url('https://example.com')
+        assert pool.pool.maxsize == 32
+        assert pool.block
+        assert adapter.poolmanager.pools._maxsize == 2
+
+    def test_shared(self):
+        config = ConnectionPoolConfig(pool_maxsize=8, shared=True)
+        assistant = _assistant(config)
+        discovery = DiscoveryV2(version='2019-11-22',
+                                authenticator=NoAuthAuthenticator(),
+                                connection_pool=config)
+        unshared = _assistant(ConnectionPoolConfig(pool_maxsize=8))
+        assert (assistant.http_adapter.poolmanager is
+                discovery.http_adapter.poolmanager)
+        assert (assistant.http_adapter.poolmanager is
+                not unshared.http_adapter.poolmanager)
+
+        # Retries are set per service on top of the shared pools.
+        discovery.enable_retries(max_retries=2)
+        assert isinstance(discovery.http_adapter, PooledHTTPAdapter)
+        assert discovery.http_adapter.max_retries.total == 2
+        assert assistant.http_adapter.max_retries.total == 0
+        assert (assistant.http_adapter.poolmanager is
+                discovery.http_adapter.poolmanager)
+
+        # Verification settings are part of the pool.
+        discovery.set_disable_ssl_verification(True)
+        assert (assistant.http_adapter.poolmanager is
+                not discovery.http_adapter.poolmanager)
+
+    def test_shared_connections(self, server):
+        config = ConnectionPoolConfig(pool_maxsize=1, shared=True)
+        url = server.url
+        for _ in range(3):
+            service = _assistant(config)
+            service.set_service_url(url)
+            assert service.create_session('a').get_status_code() == 201
+        assert len(server.clients) == 1
+        close_shared_pools()
+        service.create_session('a')
+        assert len(server.clients) == 2
+
+    def test_idle_timeout(self, server):
+        service = _assistant(ConnectionPoolConfig(idle_timeout=0.1))
+        service.set_service_url(server.url)
+        service.create_session('a')
+        service.create_session('a')
+        assert len(server.clients) == 1
+        time.sleep(0.2)
+        service.create_session('a')
+        assert len(server.clients) == 2
@@ -0,0 +1,263 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for streaming downloads
+"""
+
+import hashlib
+import io
+import os
+import re
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson.text_to_speech_v1 import AsyncTextToSpeechV1, TextToSpeechV1
+from ibm_watson.visual_recognition_v4 import VisualRecognitionV4
+
+from .event_loop import run_until_complete
+from .http_server import serve
+
+_BODY = os.urandom(1024 * 1024)
+_SHA256 = 'sha256:' + hashlib.sha256(_BODY).hexdigest()
+
+
+class _DownloadHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._send_body()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._send_body()
+
+    def _send_body(self):
+        server = self.server
+        server.requests.append((self.command, self.path, dict(self.headers)))
+        if 'voice=missing' in self.path:
+            error = b'{"error": "Model not found", "code": 404}'
+            self.send_response(404)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(error)))
+            self.end_headers()
+            self.wfile.write(error)
+            return
+        body = _BODY
+        match = re.match(r'^bytes=(\d+)-$', self.headers.get('Range') or '')
+        start = int(match.group(1)) if match and server.ranges else 0
+        if start >= len(body):
+            self.send_response(416)
+            self.send_header('Content-Range', 'bytes */{0}'.format(len(body)))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(206 if start else 200)
+        self.send_header('Content-Type', 'audio/wav')
+        self.send_header('Content-Length', str(len(body) - start))
+        if start:
+            self.send_header(
+                'Content-Range',
+                'bytes {0}-{1}/{2}'.format(start,
+                                           len(body) - 1, len(body)))
+        self.end_headers()
+        if server.interrupt:
+            # Drop the connection part way through the body.
+            sent, server.interrupt = server.interrupt, 0
+            self.wfile.write(body[start:start + sent])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with serve(_DownloadHandler, ranges=True, interrupt=0,
+               requests=[]) as server:
+        yield server
+
+
+def _service(server, service_class=TextToSpeechV1, **kwargs):
+    service = service_class(authenticator=NoAuthAuthenticator(), **kwargs)
+    service.set_service_url(server.url)
+    return service
+
+
+class TestDownload():
+
+    def test_iterate(self, server):
+        text_to_speech = _service(server)
+        with text_to_speech.download('synthesize',
+                                     'Hello',
+                                     accept='audio/wav',
+                                     chunk_size=10000) as audio:
+            assert audio.response.get_status_code() == 200
+            assert audio.size == len(_BODY)
+            chunks = list(audio)
+        assert max(len(chunk) for chunk in chunks) <= 10000
+        assert b''.join(chunks) == _BODY
+        assert audio.position == len(_BODY)
+        method, path, headers = server.requests[0]
+        assert (method, path) == ('POST', '/v1/synthesize')
+        assert headers['Accept'] == 'audio/wav'
+        assert 'Range' not in headers
+
+        with pytest.raises(ValueError):
+            text_to_speech.download('synthesize_using_websocket', 'Hello')
+
+    def test_save(self, server, tmpdir):
+        path = os.path.join(str(tmpdir), 'model.rscnn')
+        visual_recognition = _service(server,
+                                      VisualRecognitionV4,
+                                      version='2019-02-11')
+        download = visual_recognition.download('get_model_file',
+                                               'collection',
+                                               'objects',
+                                               'rscnn',
+                                               destination=path,
+                                               checksum=_SHA256.upper()[:7] +
+                                               _SHA256[7:])
+        assert download.position == len(_BODY)
+        with open(path, 'rb') as saved:
+            assert saved.read() == _BODY
+        assert server.requests[0][:2] == (
+            'GET',
+            '/v4/collections/collection/model?version=2019-02-11'
+            '&feature=objects&model_format=rscnn')
+
+        destination = io.BytesIO()
+        with pytest.raises(ValueError, match='checksum'):
+            visual_recognition.download('get_model_file',
+                                        'collection',
+                                        'objects',
+                                        'rscnn',
+                                        destination=destination,
+                                        checksum='md5:' + '0' * 32)
+        assert destination.getvalue() == _BODY
+
+    def test_resume_file(self, server, tmpdir):
+        path = os.path.join(str(tmpdir), 'audio.wav')
+        with open(path, 'wb') as partial:
+            partial.write(_BODY[:300000])
+        download = _service(server).download('synthesize',
+                                             'Hello',
+                                             destination=path,
+                                             resume=True,
+                                             checksum=_SHA256)
+        assert download.response.get_status_code() == 206
+        headers = server.requests[0][2]
+        assert headers['Range'] == 'bytes=300000-'
+        assert headers['Accept-Encoding'] == 'identity'
+        with open(path, 'rb') as saved:
+            assert saved.read() == _BODY
+
+        # The file is complete: the server has nothing left to send.
+        download = _service(server).download('synthesize',
+                                             'Hello',
+                                             destination=path,
+                                             resume=True,
+                                             checksum=_SHA256)
+        assert download.size == download.position == len(_BODY)
+        with open(path, 'rb') as saved:
+            assert saved.read() == _BODY
+
+        # A server that ignores the range sends the whole body.
+        server.ranges = False
+        with open(path, 'r+b') as partial:
+            partial.truncate(500000)
+            _service(server).download('synthesize',
+                                      'Hello',
+                                      destination=partial,
+                                      resume=True,
+                                      checksum=_SHA256)
+        with open(path, 'rb') as saved:
+            assert saved.read() == _BODY
+
+    def test_resume_interrupted(self, server):
+        server.interrupt = 200000
+        with _service(server).download('synthesize',
+                                       'Hello',
+                                       resume=True,
+                                       checksum=_SHA256) as audio:
+            assert b''.join(audio) == _BODY
+        assert audio.resumes == 1
+        first, second = [request[2].get('Range') for request in server.requests]
+        # The partial chunk read when the connection dropped is read again.
+        assert first is None and 0 < int(second[6:-1]) <= 200000
+
+        server.interrupt = 200000
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            b''.join(_service(server).download('synthesize', 'Hello'))
+
+    def test_error(self, server):
+        with pytest.raises(ApiException) as err:
+            _service(server).download('synthesize', 'Hello', voice='missing')
+        assert err.value.status_code == 404
+        assert err.value.message == 'Model not found'
+
+    def test_async(self, tmpdir):
+        httpx = pytest.importorskip('httpx')
+        requests_received = []
+
+        def handler(request):
+            requests_received.append(request)
+            start = 0
+            if 'Range' in request.headers:
+                start = int(request.headers['Range'][6:-1])
+            headers = {'Content-Type': 'audio/wav'}
+            if start:
+                headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(
+                    start,
+                    len(_BODY) - 1, len(_BODY))
+            return httpx.Response(206 if start else 200,
+                                  content=_BODY[start:],
+                                  headers=headers)
+
+        path = os.path.join(str(tmpdir), 'audio.wav')
+        with open(path, 'wb') as partial:
+            partial.write(_BODY[:1000])
+
+        async def main():
+            text_to_speech = AsyncTextToSpeechV1(
+                authenticator=NoAuthAuthenticator())
+            text_to_speech.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            async with text_to_speech:
+                chunks = []
+                async with await text_to_speech.download(
+                        'synthesize', 'Hello', chunk_size=1000) as audio:
+                    async for chunk in audio:
+                        chunks.append(chunk)
+                saved = await text_to_speech.download('synthesize',
+                                                      'Hello',
+                                                      destination=path,
+                                                      resume=True,
+                                                      checksum=_SHA256)
+                return chunks, saved
+
+        chunks, saved = run_until_complete(main())
+        assert max(len(chunk) for chunk in chunks) <= 1000
+        assert b''.join(chunks) == _BODY
+        assert saved.position == len(_BODY)
+        assert requests_received[1].headers['Range'] == 'bytes=1000-'
+        with open(path, 'rb') as audio:
+            assert audio.read() == _BODY
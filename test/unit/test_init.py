@@ -0,0 +1,51 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+import ibm_watson
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_load_services(self):
+        code = ('import sys, ibm_watson\n'
+                'print(",".join(m for m in sys.modules if m.startswith("ibm_watson.")))')
+        loaded = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(
+            sorted(loaded.decode('utf-8').strip().split(',')),
+            ['ibm_watson.common', 'ibm_watson.version'])
+
+    def test_service_classes(self):
+        from ibm_watson.assistant_v2 import AssistantV2
+        from ibm_watson.speech_to_text_v1_adapter import SpeechToTextV1Adapter
+        from ibm_watson.text_to_speech_adapter_v1 import TextToSpeechV1Adapter
+        self.assertIs(ibm_watson.AssistantV2, AssistantV2)
+        self.assertIs(ibm_watson.SpeechToTextV1, SpeechToTextV1Adapter)
+        self.assertIs(ibm_watson.TextToSpeechV1, TextToSpeechV1Adapter)
+        for name in ibm_watson.__all__:
+            self.assertIsNotNone(getattr(ibm_watson, name))
+            self.assertIn(name, dir(ibm_watson))
+
+    def test_submodules(self):
+        self.assertEqual(ibm_watson.discovery_v1.__name__,
+                         'ibm_watson.discovery_v1')
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(ibm_watson, 'AssistantV9')
@@ -0,0 +1,277 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the instrumentation hooks
+"""
+
+import asyncio
+import json
+import time
+
+import jwt
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import (IAMAuthenticator,
+                                               NoAuthAuthenticator)
+from ibm_watson import MetricsCollector, RateLimiter, ResultCache
+from ibm_watson.instrumentation import (Histogram, Instrumentation,
+                                        OpenTelemetryInstrumentation)
+from ibm_watson.language_translator_v3 import (AsyncLanguageTranslatorV3,
+                                               LanguageTranslatorV3)
+
+from .event_loop import run_until_complete
+
+_translate_url = 'https://api.us-south.language-translator.watson.cloud.ibm.com/v3/translate'
+_translation = {
+    'word_count': 1,
+    'character_count': 5,
+    'translations': [{
+        'translation': 'Hallo'
+    }]
+}
+
+
+def _translator(*instrumentations, authenticator=None):
+    translator = LanguageTranslatorV3(
+        version='2018-05-01',
+        authenticator=authenticator or NoAuthAuthenticator())
+    for instrumentation in instrumentations:
+        translator.add_instrumentation(instrumentation)
+    return translator
+
+
+class _Recorder(Instrumentation):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def before_request(self, event):
+        assert event.duration is None
+        self.calls.append((self.name, 'before_request', event))
+
+    def after_response(self, event):
+        self.calls.append((self.name, 'after_response', event))
+
+    def on_error(self, event):
+        self.calls.append((self.name, 'on_error', event))
+
+
+class TestInstrumentation():
+
+    @responses.activate
+    def test_hooks(self):
+        responses.add(responses.POST, _translate_url, json=_translation)
+        calls = []
+        first, second = _Recorder('first', calls), _Recorder('second', calls)
+        translator = _translator(first, second)
+        translator.set_response_model('lazy')
+        response = translator.translate(text=['Hello'], model_id='en-de')
+        assert [call[:2] for call in calls] == [
+            ('first', 'before_request'), ('second', 'before_request'),
+            ('first', 'after_response'), ('second', 'after_response')
+        ]
+        event = calls[-1][2]
+        assert event.service_name == 'language_translator'
+        assert event.operation_id == 'translate'
+        assert event.method == 'POST'
+        assert event.url == _translate_url
+        assert event.status_code == 200
+        assert event.response is response
+        assert event.error is None
+        assert event.bytes_sent == len(responses.calls[0].request.body)
+        assert event.bytes_received == len(json.dumps(_translation))
+        assert set(event.phases) == {
+            'prepare', 'network', 'read', 'decode', 'model'
+        }
+        assert event.duration >= sum(event.phases.values())
+        assert event.retries == 0 and not event.cached
+
+        translator.remove_instrumentation(first)
+        translator.translate(text=['Hello'], model_id='en-de')
+        assert [call[0] for call in calls[4:]] == ['second', 'second']
+        with pytest.raises(TypeError):
+            translator.add_instrumentation(object())
+
+    @responses.activate
+    def test_error(self):
+        responses.add(responses.POST,
+                      _translate_url,
+                      status=404,
+                      json={'error': 'Model not found'})
+        calls = []
+        with pytest.raises(ApiException):
+            _translator(_Recorder('hooks', calls)).translate(text=['Hello'],
+                                                             model_id='xx')
+        assert [call[1] for call in calls] == ['before_request', 'on_error']
+        event = calls[-1][2]
+        assert event.status_code == 404
+        assert isinstance(event.error, ApiException)
+        assert event.response is None
+
+    @responses.activate
+    def test_authenticate_phase(self):
+        token = jwt.encode({
+            'iat': int(time.time()),
+            'exp': int(time.time()) + 3600
+        }, 'secret' * 8, algorithm='HS256')
+        responses.add(responses.POST,
+                      'https://iam.cloud.ibm.com/identity/token',
+                      json={
+                          'access_token': token,
+                          'refresh_token': 'refresh',
+                          'token_type': 'Bearer',
+                          'expires_in': 3600,
+                          'expiration': int(time.time()) + 3600
+                      })
+        responses.add(responses.POST, _translate_url, json=_translation)
+        calls = []
+        translator = _translator(_Recorder('hooks', calls),
+                                 authenticator=IAMAuthenticator('apikey'))
+        translator.translate(text=['Hello'], model_id='en-de')
+        assert 'authenticate' in calls[-1][2].phases
+        # The token is requested once, before the request is built.
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers[
+            'Authorization'] == 'Bearer ' + token
+
+    @responses.activate
+    def test_metrics(self):
+        responses.add(responses.POST,
+                      _translate_url,
+                      status=429,
+                      headers={'Retry-After': '0'},
+                      json={'error': 'Too Many Requests'})
+        responses.add(responses.POST, _translate_url, json=_translation)
+        responses.add(responses.POST,
+                      _translate_url.replace('translate', 'identify'),
+                      status=400,
+                      json={'error': 'Bad Request'})
+        metrics = MetricsCollector(buckets=(0.001, 10))
+        translator = _translator(metrics)
+        translator.set_rate_limiter(RateLimiter())
+        translator.set_result_cache(ResultCache())
+        for _ in range(3):
+            translator.translate(text=['Hello'], model_id='en-de')
+        with pytest.raises(ApiException):
+            translator.identify('x' * 10)
+
+        results = metrics.get_metrics()
+        translate = results[('language_translator', 'translate')]
+        assert translate.count == 3
+        assert translate.errors == 0
+        assert translate.retries == 1
+        assert translate.cache_hits == 2
+        assert translate.bytes_received == len(json.dumps(_translation))
+        assert translate.latency.count == 3
+        assert sum(translate.latency.counts) == 3
+        assert translate.latency.get_percentile(1.0) <= 10
+        assert translate.phases['network'] > 0
+        identify = results[('language_translator', 'identify')]
+        assert (identify.count, identify.errors) == (1, 1)
+        assert identify.bytes_sent == 10
+
+        # Snapshots do not change.
+        translator.translate(text=['Hello'], model_id='en-de')
+        assert translate.count == 3
+        metrics.reset()
+        assert metrics.get_metrics() == {}
+
+    def test_histogram(self):
+        histogram = Histogram((0.1, 1.0))
+        assert histogram.get_percentile(0.5) is None
+        for value in (0.05, 0.05, 0.5, 5):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.get_percentile(0.5) == 0.1
+        assert histogram.get_percentile(0.75) == 1.0
+        assert histogram.get_percentile(0.99) == float('inf')
+        assert histogram.sum == 5.6
+
+    @responses.activate
+    def test_opentelemetry(self):
+        pytest.importorskip('opentelemetry.sdk')
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import \
+            InMemorySpanExporter
+        from opentelemetry.trace import SpanKind, StatusCode
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        responses.add(responses.POST, _translate_url, json=_translation)
+        responses.add(responses.POST,
+                      _translate_url.replace('translate', 'identify'),
+                      status=500,
+                      json={'error': 'Internal Server Error'})
+        translator = _translator(
+            OpenTelemetryInstrumentation(provider.get_tracer('test')))
+        translator.translate(text=['Hello'], model_id='en-de')
+        with pytest.raises(ApiException):
+            translator.identify('Hello')
+
+        ok, failed = exporter.get_finished_spans()
+        assert ok.name == 'language_translator.translate'
+        assert ok.kind == SpanKind.CLIENT
+        assert ok.attributes['http.method'] == 'POST'
+        assert ok.attributes['http.url'] == _translate_url
+        assert ok.attributes['http.status_code'] == 200
+        assert ok.attributes['watson.phase.network'] > 0
+        assert ok.status.status_code != StatusCode.ERROR
+        assert ok.end_time > ok.start_time
+        assert failed.name == 'language_translator.identify'
+        assert failed.attributes['http.status_code'] == 500
+        assert failed.status.status_code == StatusCode.ERROR
+        assert failed.events[0].name == 'exception'
+
+    def test_async(self):
+        httpx = pytest.importorskip('httpx')
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=json.dumps(_translation).encode('utf-8'),
+                headers={'Content-Type': 'application/json'})
+
+        calls = []
+
+        async def main():
+            translator = AsyncLanguageTranslatorV3(
+                version='2018-05-01', authenticator=NoAuthAuthenticator())
+            translator.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            translator.add_instrumentation(_Recorder('hooks', calls))
+            async with translator:
+                await asyncio.gather(*[
+                    translator.translate(text=[text], model_id='en-de')
+                    for text in ('a', 'b')
+                ])
+
+        run_until_complete(main())
+        assert sorted(call[1] for call in calls) == [
+            'after_response', 'after_response', 'before_request',
+            'before_request'
+        ]
+        events = [call[2] for call in calls if call[1] == 'after_response']
+        assert {event.request['data'] for event in events} == {
+            b'{"text": ["a"], "model_id": "en-de"}',
+            b'{"text": ["b"], "model_id": "en-de"}'
+        }
+        for event in events:
+            assert {'prepare', 'network', 'read', 'decode'} <= set(event.phases)
+            assert event.bytes_received == len(json.dumps(_translation))
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the JSON codecs
+"""
+
+import json
+import pytest
+from ibm_watson import json_codec
+from ibm_watson.json_codec import (JsonCodec, StdlibJsonCodec, get_json_codec,
+                                   get_default_json_codec,
+                                   set_default_json_codec)
+
+_document = {
+    'text': 'Grüße, 世界 / "quoted"',
+    'count': 3,
+    'score': 0.25,
+    'flags': [True, False, None],
+    'nested': {
+        'empty': {}
+    }
+}
+
+
+def _available_codecs():
+    codecs = []
+    for name in json_codec.AUTO_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize('codec', _available_codecs(), ids=repr)
+def test_round_trip(codec):
+    encoded = codec.dumps(_document)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode('utf-8')) == _document
+    assert codec.loads(encoded) == _document
+    assert codec.loads(encoded.decode('utf-8')) == _document
+    # Control characters in strings are tolerated, as by the core SDK.
+    assert codec.loads(b'{"text": "line\nbreak"}') == {'text': 'line\nbreak'}
+    with pytest.raises(ValueError):
+        codec.loads(b'{"text": ')
+
+
+def test_get_json_codec():
+    codec = get_json_codec('json')
+    assert isinstance(codec, StdlibJsonCodec)
+    assert get_json_codec('json') is codec
+    assert get_json_codec(codec) is codec
+    assert get_json_codec('auto').name == _available_codecs()[0].name
+    with pytest.raises(ValueError):
+        get_json_codec('simplejson')
+
+
+def test_default_json_codec():
+    previous = get_default_json_codec()
+    assert previous.name == 'json'
+
+    class UpperCodec(JsonCodec):
+        name = 'upper'
+
+    try:
+        set_default_json_codec(UpperCodec())
+        assert get_default_json_codec().name == 'upper'
+    finally:
+        set_default_json_codec(previous)
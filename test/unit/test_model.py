@@ -0,0 +1,273 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the model base class
+"""
+
+import copy
+import datetime
+import pickle
+import pytest
+from ibm_watson import natural_language_understanding_v1
+from ibm_watson.assistant_v1 import Context, Counterexample
+from ibm_watson.assistant_v2 import RuntimeResponseGeneric
+from ibm_watson.assistant_v2 import \
+    RuntimeResponseGenericRuntimeResponseTypeText as RuntimeResponseText
+from ibm_watson.discovery_v1 import (Calculation, QueryAggregation,
+                                     QueryResponse, QueryResult, Term)
+from ibm_watson.model import (ModelField, get_discriminated_class,
+                              get_discriminated_classes, get_fields)
+from ibm_watson.speech_to_text_v1 import RecognitionJob, RecognitionJobs
+
+_query_response_json = {
+    'matching_results': 2,
+    'results': [{
+        'id': 'first',
+        'score': 0.5
+    }, {
+        'id': 'second',
+        'score': 0.25
+    }],
+    'aggregations': [{
+        'type': 'term',
+        'field': 'enriched_text.entities.type',
+        'count': 10,
+        'results': [{
+            'key': 'Company',
+            'matching_results': 2
+        }]
+    }]
+}
+
+_recognition_jobs_json = {
+    'recognitions': [{
+        'id': 'job1',
+        'status': 'completed',
+        'created': '2019-01-01T12:00:00Z'
+    }]
+}
+
+
+class TestModelFields():
+
+    def test_get_fields(self):
+        fields = get_fields(QueryResponse)
+        assert [field.name for field in fields] == [
+            'matching_results', 'results', 'aggregations', 'passages',
+            'duplicates_removed', 'session_token', 'retrieval_details',
+            'suggested_query'
+        ]
+        results = fields[1]
+        assert results.kind == 'list'
+        assert results.model_class is QueryResult
+        assert get_fields(QueryResponse) is fields
+
+    def test_key(self):
+        field = ModelField('class_', key='class', required=True)
+        assert field.key == 'class'
+        assert ModelField('text').key == 'text'
+        assert repr(field) == ("ModelField('class_', 'value', None, "
+                               "key='class', required=True)")
+
+
+class TestModelCodec():
+
+    def test_round_trip(self):
+        response = QueryResponse.from_dict(_query_response_json)
+        assert isinstance(response.results[0], QueryResult)
+        assert isinstance(response.aggregations[0], Term)
+        assert response.to_dict() == _query_response_json
+        assert response.passages is None
+
+    def test_required_property(self):
+        with pytest.raises(ValueError,
+                           match='\'recognitions\' not present in '
+                           'RecognitionJobs JSON'):
+            RecognitionJobs.from_dict({})
+
+    def test_datetime(self):
+        document = {'text': 'no', 'created': '2019-01-01T12:00:00Z'}
+        counterexample = Counterexample.from_dict(document)
+        assert counterexample.created == datetime.datetime(
+            2019, 1, 1, 12, tzinfo=counterexample.created.tzinfo)
+        assert counterexample.to_dict() == {
+            'text': 'no',
+            'created': '2019-01-01T12:00:00Z'
+        }
+
+    def test_unset_attribute(self):
+        counterexample = Counterexample('no')
+        del counterexample.created
+        assert counterexample.to_dict() == {'text': 'no'}
+
+    def test_dynamic_properties(self):
+        document = {'conversation_id': 'c', 'x': 1}
+        context = Context.from_dict(document)
+        assert context.get_properties() == {'x': 1}
+        assert context.to_dict() == document
+
+    def test_discriminator(self):
+        document = {'response_type': 'text', 'text': 'Hello'}
+        generic = RuntimeResponseGeneric.from_dict(document)
+        assert isinstance(generic, RuntimeResponseText)
+        assert RuntimeResponseText.from_dict(document) == generic
+
+    def test_discriminator_errors(self):
+        with pytest.raises(ValueError,
+                           match='\'response_type\' not found in '
+                           'RuntimeResponseGeneric JSON'):
+            RuntimeResponseGeneric.from_dict({})
+        with pytest.raises(Exception,
+                           match='base class \'RuntimeResponseGeneric\''):
+            RuntimeResponseGeneric.from_dict({'response_type': 'unknown'})
+
+    def test_discriminator_fallback(self):
+        # QueryAggregation is not abstract, so unknown types decode as the
+        # base class, and type names are not looked up as class names.
+        for value in ('unknown', 'Term', 'QueryResponse'):
+            aggregation = QueryAggregation.from_dict({'type': value})
+            assert type(aggregation) is QueryAggregation
+
+    def test_str(self):
+        assert str(Counterexample('no')) == '{\n  "text": "no"\n}'
+
+    def test_model_named_model(self):
+        nlu = natural_language_understanding_v1
+        assert not issubclass(nlu.Notice, nlu.Model)
+        assert nlu.Model.from_dict({'model_id': 'm'}).model_id == 'm'
+
+
+class TestDiscriminator():
+
+    def test_get_discriminated_classes(self):
+        classes = get_discriminated_classes(QueryAggregation)
+        assert classes['term'] is Term
+        assert classes['max'] is Calculation
+        assert classes['min'] is Calculation
+        assert get_discriminated_classes(QueryAggregation) is classes
+
+    def test_get_discriminated_class(self):
+        assert get_discriminated_class(QueryAggregation,
+                                       {'type': 'term'}) is Term
+        assert get_discriminated_class(
+            QueryAggregation, {'type': 'unknown'}) is QueryAggregation
+        assert get_discriminated_class(Term, {}) is Term
+        with pytest.raises(ValueError):
+            get_discriminated_class(QueryAggregation, {})
+
+
+class TestFromDictLazy():
+
+    def test_matches_from_dict(self):
+        eager = QueryResponse.from_dict(_query_response_json)
+        lazy = QueryResponse.from_dict_lazy(_query_response_json)
+        assert isinstance(lazy, QueryResponse)
+        assert lazy == eager
+        assert eager == lazy
+        assert lazy.to_dict() == eager.to_dict()
+        assert lazy.__dict__ == eager.__dict__
+        assert str(lazy) == str(eager)
+
+    def test_decodes_on_access(self):
+        # from_dict fails on the job without an id; the lazy view only fails
+        # when the job is read.
+        document = {'recognitions': [{'status': 'completed'}]}
+        with pytest.raises(ValueError):
+            RecognitionJobs.from_dict(document)
+        jobs = RecognitionJobs.from_dict_lazy(document)
+        with pytest.raises(ValueError, match='\'id\' not present'):
+            jobs.recognitions
+
+    def test_caches_values(self):
+        jobs = RecognitionJobs.from_dict_lazy(_recognition_jobs_json)
+        assert jobs.recognitions is jobs.recognitions
+        job = jobs.recognitions[0]
+        assert isinstance(job, RecognitionJob)
+        assert job.id == 'job1'
+
+    def test_datetime(self):
+        document = {'text': 'no', 'created': '2019-01-01T12:00:00Z'}
+        counterexample = Counterexample.from_dict_lazy(document)
+        assert isinstance(counterexample.created, datetime.datetime)
+        assert counterexample.created == Counterexample.from_dict(
+            document).created
+        assert counterexample.created is counterexample.created
+
+    def test_required_property(self):
+        with pytest.raises(ValueError,
+                           match='\'recognitions\' not present in '
+                           'RecognitionJobs JSON'):
+            RecognitionJobs.from_dict_lazy({})
+
+    def test_missing_property(self):
+        response = QueryResponse.from_dict_lazy({})
+        assert response.results is None
+        assert response.to_dict() == {}
+
+    def test_set_and_delete(self):
+        response = QueryResponse.from_dict_lazy(_query_response_json)
+        response.matching_results = 5
+        assert response.matching_results == 5
+        del response.results
+        assert response.results is None
+        assert 'results' not in response.to_dict()
+        assert _query_response_json['matching_results'] == 2
+
+    def test_discriminator(self):
+        aggregation = QueryAggregation.from_dict_lazy(
+            _query_response_json['aggregations'][0])
+        assert isinstance(aggregation, Term)
+        assert aggregation.field == 'enriched_text.entities.type'
+        response = QueryResponse.from_dict_lazy(_query_response_json)
+        assert isinstance(response.aggregations[0], Term)
+        aggregation = QueryAggregation.from_dict_lazy({'type': 'unknown'})
+        assert isinstance(aggregation, QueryAggregation)
+        assert aggregation.type == 'unknown'
+        generic = RuntimeResponseGeneric.from_dict_lazy({
+            'response_type': 'text',
+            'text': 'Hello'
+        })
+        assert isinstance(generic, RuntimeResponseText)
+        assert generic.text == 'Hello'
+        with pytest.raises(Exception, match='base class'):
+            RuntimeResponseGeneric.from_dict_lazy({'response_type': 'unknown'})
+
+    def test_dynamic_properties(self):
+        document = {
+            'conversation_id': 'c',
+            'metadata': {
+                'user_id': 'u'
+            },
+            'x': 1
+        }
+        context = Context.from_dict_lazy(document)
+        assert isinstance(context, Context)
+        assert context.get_properties() == {'x': 1}
+        assert context.metadata.user_id == 'u'
+        assert context == Context.from_dict(document)
+        context = Context.from_dict_lazy(document)
+        context.y = 2
+        assert context.get_properties() == {'x': 1, 'y': 2}
+        assert context.conversation_id == 'c'
+        with pytest.raises(AttributeError):
+            context.z
+
+    def test_copy_and_pickle(self):
+        lazy = QueryResponse.from_dict_lazy(_query_response_json)
+        for other in (copy.copy(lazy), copy.deepcopy(lazy),
+                      pickle.loads(pickle.dumps(lazy))):
+            assert type(other) is QueryResponse
+            assert other == lazy
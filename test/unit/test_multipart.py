@@ -0,0 +1,233 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the streaming multipart encoder
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+import urllib3.filepost
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson.multipart import MultipartEncoder
+from ibm_watson.natural_language_classifier_v1 import (
+    AsyncNaturalLanguageClassifierV1, NaturalLanguageClassifierV1)
+
+from .event_loop import run_until_complete
+from .http_server import serve
+
+_MB = 1024 * 1024
+
+
+def _fields(path):
+    return [
+        ('training_metadata', (None, '{"language": "en"}', 'application/json')),
+        ('training_data', (None, open(path, 'rb'), 'text/csv')),
+        ('text', (None, 'café')),
+        ('named', open(path, 'rb')),
+        ('headers', ('a.txt', b'data', 'text/plain', {'X-Part': '1'})),
+        ('missing', (None, None, 'text/plain')),
+        ('number', (None, 7)),
+    ]
+
+
+def _rss():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        size = 0
+        head = bytearray()
+        tail = b''
+        for chunk in self._read_body():
+            size += len(chunk)
+            if len(head) < 1024:
+                head += chunk[:1024 - len(head)]
+            tail = (tail + chunk)[-1024:]
+        self.server.uploads.append((dict(self.headers), size, bytes(head),
+                                    tail))
+        body = b'{"classifier_id": "c"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                if not size:
+                    self.rfile.readline()
+                    return
+                yield self.rfile.read(size)
+                self.rfile.readline()
+        remaining = int(self.headers['Content-Length'])
+        while remaining:
+            chunk = self.rfile.read(min(remaining, _MB))
+            remaining -= len(chunk)
+            yield chunk
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with serve(_UploadHandler, uploads=[]) as server:
+        yield server
+
+
+def _classifier(server):
+    classifier = NaturalLanguageClassifierV1(
+        authenticator=NoAuthAuthenticator())
+    classifier.set_service_url(server.url)
+    return classifier
+
+
+class TestMultipartEncoder():
+
+    def test_matches_requests(self, monkeypatch, tmpdir):
+        path = os.path.join(str(tmpdir), 'train.csv')
+        with open(path, 'wb') as training_data:
+            training_data.write(b'How hot is it?,temperature\n' * 1000)
+        monkeypatch.setattr(urllib3.filepost, 'choose_boundary',
+                            lambda: 'boundary')
+        expected, content_type = \
+            requests.models.RequestEncodingMixin._encode_files(
+                _fields(path), None)
+        encoder = MultipartEncoder(_fields(path),
+                                   boundary='boundary',
+                                   chunk_size=1000)
+        assert encoder.content_type == content_type
+        assert encoder.len == len(expected)
+        assert b''.join(encoder) == expected
+
+        encoder = MultipartEncoder(_fields(path), boundary='boundary')
+        chunks = [encoder.read(100), encoder.read(5000)]
+        chunks.append(encoder.read())
+        assert [len(chunk) for chunk in chunks[:2]] == [100, 5000]
+        assert b''.join(chunks) == expected
+        assert encoder.read() == b''
+
+    def test_length(self):
+        data = io.BytesIO(b'0123456789')
+        data.read(4)
+        encoder = MultipartEncoder([('data', (None, data))], boundary='b')
+        assert encoder.len == len(b''.join(encoder))
+        assert b'\r\n\r\n456789\r\n' in b''.join(
+            MultipartEncoder([('data', (None, io.BytesIO(b'456789')))]))
+
+        for unknown in ((chunk for chunk in [b'a', b'b']),
+                        io.StringIO('text')):
+            encoder = MultipartEncoder([('data', (None, unknown))])
+            assert encoder.len is None
+        body = b''.join(
+            MultipartEncoder([('data', (None, iter([b'a', 'bé'])))],
+                             boundary='b'))
+        assert body.endswith(b'\r\n\r\nab\xc3\xa9\r\n--b--\r\n')
+
+    def test_generator_upload(self, server):
+        def training_data():
+            for i in range(100):
+                yield 'text {0},class\n'.format(i).encode('utf-8')
+
+        response = _classifier(server).create_classifier(
+            io.BytesIO(b'{"language": "en"}'), training_data())
+        assert response.get_result() == {'classifier_id': 'c'}
+        headers, size, head, tail = server.uploads[0]
+        assert headers['Transfer-Encoding'] == 'chunked'
+        assert 'Content-Length' not in headers
+        assert headers['Content-Type'].startswith(
+            'multipart/form-data; boundary=')
+        assert b'name="training_metadata"' in head
+        assert b'text 99,class\n\r\n--' in tail
+
+    def test_async(self):
+        httpx = pytest.importorskip('httpx')
+        received = []
+
+        def handler(request):
+            received.append((request.headers, request.read()))
+            return httpx.Response(200, json={'classifier_id': 'c'})
+
+        async def main():
+            classifier = AsyncNaturalLanguageClassifierV1(
+                authenticator=NoAuthAuthenticator())
+            classifier.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            async with classifier:
+                return await classifier.create_classifier(
+                    io.BytesIO(b'{"language": "en"}'),
+                    io.BytesIO(b'How hot is it?,temperature\n'))
+
+        response = run_until_complete(main())
+        assert response.get_result() == {'classifier_id': 'c'}
+        headers, body = received[0]
+        boundary = headers['Content-Type'].split('boundary=')[1]
+        assert body.startswith('--{0}\r\n'.format(boundary).encode('utf-8'))
+        assert b'\r\n\r\nHow hot is it?,temperature\n\r\n' in body
+        assert body.endswith('--{0}--\r\n'.format(boundary).encode('utf-8'))
+
+    def test_large_upload(self, server, tmpdir):
+        if not os.path.exists('/proc/self/statm'):
+            pytest.skip('RSS is read from /proc')
+        size = 500 * _MB
+        path = os.path.join(str(tmpdir), 'large.csv')
+        with open(path, 'wb') as large:
+            # A sparse file, read back as zeros.
+            large.truncate(size)
+
+        samples = []
+        done = threading.Event()
+
+        def sample():
+            while not done.is_set():
+                samples.append(_rss())
+                time.sleep(0.01)
+
+        classifier = _classifier(server)
+        baseline = _rss()
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            with open(path, 'rb') as training_data:
+                response = classifier.create_classifier(
+                    io.BytesIO(json.dumps({
+                        'language': 'en'
+                    }).encode('utf-8')), training_data)
+        finally:
+            done.set()
+            sampler.join()
+        assert response.get_status_code() == 200
+
+        headers, received, head, tail = server.uploads[0]
+        assert int(headers['Content-Length']) == received
+        assert size < received < size + 1024
+        assert b'{"language": "en"}' in head
+        assert tail.endswith(b'--\r\n')
+        # The file is streamed: memory grows by far less than its size.
+        assert max(samples) - baseline < 50 * _MB
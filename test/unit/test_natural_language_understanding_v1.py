@@ -30,6 +30,7 @@ import responses
 import tempfile
 import urllib
 from ibm_watson.natural_language_understanding_v1 import *
+from ibm_watson.model import Model as BaseModel
 
 version = 'testString'
 
@@ -3373,6 +3374,12 @@ class TestModel_Notice():
         notice_model_json2 = notice_model.to_dict()
         assert notice_model_json2 == notice_model_json
 
+    def test_notice_base_class(self):
+        """
+        Test that Notice derives from the common base class, not the Model model
+        """
+        assert Notice.__bases__ == (BaseModel,)
+
 class TestModel_RelationArgument():
     """
     Test Class for RelationArgument
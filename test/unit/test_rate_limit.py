@@ -0,0 +1,259 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for RateLimiter
+"""
+
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import RateLimiter
+from ibm_watson.language_translator_v3 import (AsyncLanguageTranslatorV3,
+                                               LanguageTranslatorV3)
+from ibm_watson.speech_to_text_v1 import SpeechToTextV1
+
+from .event_loop import run_until_complete
+
+_translate_url = 'https://api.us-south.language-translator.watson.cloud.ibm.com/v3/translate'
+_recognize_url = 'https://api.us-south.speech-to-text.watson.cloud.ibm.com/v1/recognize'
+
+
+def _translator(limiter):
+    translator = LanguageTranslatorV3(version='2018-05-01',
+                                      authenticator=NoAuthAuthenticator())
+    translator.set_rate_limiter(limiter)
+    return translator
+
+
+class TestRateLimiter():
+
+    def test_aimd(self):
+        limiter = RateLimiter(max_concurrency=8)
+        tokens = [limiter.acquire() for _ in range(4)]
+        assert limiter.in_flight == 4
+        for token in tokens:
+            limiter.release(token, 429, retry_after=0)
+        # Requests sent before the first 429 decrease the limit only once.
+        assert limiter.concurrency_limit == 4
+        assert limiter.throttled == 4
+        assert limiter.in_flight == 0
+        for _ in range(8):
+            limiter.release(limiter.acquire(), 200)
+        assert 5 < limiter.concurrency_limit < 6
+        for _ in range(200):
+            limiter.release(limiter.acquire(), 200)
+        assert limiter.concurrency_limit == 8
+        # A server error is not a signal of the limit.
+        limiter.release(limiter.acquire(), 503)
+        assert limiter.concurrency_limit == 8
+        with pytest.raises(ValueError):
+            RateLimiter(min_concurrency=0)
+        with pytest.raises(ValueError):
+            RateLimiter(decrease=1)
+
+    def test_retry_after(self):
+        limiter = RateLimiter()
+        limiter.release(limiter.acquire(), 429, retry_after=0.2)
+        started = time.monotonic()
+        limiter.release(limiter.acquire(), 200)
+        assert time.monotonic() - started >= 0.19
+
+    def test_rate_limit_reset(self):
+        limiter = RateLimiter()
+        limiter.release(limiter.acquire(), 200, {
+            'X-RateLimit-Remaining': '5',
+            'X-RateLimit-Reset': '60'
+        })
+        limiter.release(limiter.acquire(), 200, {
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': '0.2'
+        })
+        started = time.monotonic()
+        limiter.release(limiter.acquire(), 200)
+        assert 0.19 <= time.monotonic() - started < 1
+
+    def test_rate(self):
+        limiter = RateLimiter(rate=50, burst=5)
+        started = time.monotonic()
+        for _ in range(15):
+            limiter.release(limiter.acquire(), 200)
+        # The burst goes out at once, the others at the rate.
+        assert time.monotonic() - started >= 0.19
+
+    def test_concurrency(self):
+        limiter = RateLimiter(max_concurrency=3)
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            token = limiter.acquire()
+            with lock:
+                peak.append(limiter.in_flight)
+            time.sleep(0.01)
+            limiter.release(token, 200)
+
+        threads = [threading.Thread(target=request) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 3
+        assert limiter.in_flight == 0
+
+    def test_concurrency_async(self):
+        limiter = RateLimiter(max_concurrency=1)
+        order = []
+
+        async def request(name):
+            token = await limiter.acquire_async()
+            order.append(name)
+            return token
+
+        async def main():
+            token = limiter.acquire()
+            tasks = [asyncio.ensure_future(request(name)) for name in 'abc']
+            await asyncio.sleep(0.05)
+            # The coroutines wait for a release rather than polling.
+            assert order == []
+            assert [future.done() for _, future in limiter._waiters
+                   ] == [False] * 3
+            cancelled = asyncio.ensure_future(request('x'))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            for name in 'abc':
+                limiter.release(token, 200)
+                token = await tasks['abc'.index(name)]
+                assert order[-1] == name
+            limiter.release(token, 200)
+            assert not limiter._waiters
+
+        run_until_complete(main())
+        assert order == ['a', 'b', 'c']
+        assert limiter.in_flight == 0
+
+    def test_retry_after_async(self):
+        limiter = RateLimiter(max_concurrency=1)
+        order = []
+
+        async def request(name, status_code=200):
+            token = await limiter.acquire_async()
+            order.append(name)
+            await asyncio.sleep(0.01)
+            limiter.release(token, status_code, retry_after=0.1)
+
+        async def throttled():
+            # A 429, then the request is sent again.
+            await request('a', 429)
+            await request('a')
+
+        async def main():
+            tasks = [asyncio.ensure_future(throttled())]
+            await asyncio.sleep(0)
+            tasks += [asyncio.ensure_future(request(name)) for name in 'bc']
+            started = time.monotonic()
+            await asyncio.wait_for(asyncio.gather(*tasks), 5)
+            return time.monotonic() - started
+
+        assert run_until_complete(main()) >= 0.1
+        assert order == ['a', 'b', 'c', 'a']
+        assert limiter.in_flight == 0
+        assert not limiter._waiters
+
+    @responses.activate
+    def test_service(self):
+        responses.add(responses.POST,
+                      _translate_url,
+                      status=429,
+                      headers={'Retry-After': '0'},
+                      json={'error': 'Too Many Requests'})
+        responses.add(responses.POST,
+                      _translate_url,
+                      json={'translations': [{
+                          'translation': 'Hallo'
+                      }]})
+        limiter = RateLimiter(initial_concurrency=4)
+        response = _translator(limiter).translate(text=['Hello'],
+                                                  model_id='en-de')
+        assert response.get_result()['translations'][0]['translation'] == 'Hallo'
+        assert len(responses.calls) == 2
+        assert responses.calls[0].request.body == responses.calls[1].request.body
+        assert limiter.concurrency_limit == 2.5
+        assert limiter.in_flight == 0
+
+    @responses.activate
+    def test_max_retries(self):
+        responses.add(responses.POST,
+                      _translate_url,
+                      status=429,
+                      headers={'Retry-After': '0'},
+                      json={'error': 'Too Many Requests'})
+        limiter = RateLimiter(max_retries=2)
+        with pytest.raises(ApiException) as exc_info:
+            _translator(limiter).translate(text=['Hello'], model_id='en-de')
+        assert exc_info.value.status_code == 429
+        assert len(responses.calls) == 3
+        assert limiter.in_flight == 0
+
+    @responses.activate
+    def test_file_body_not_resent(self):
+        responses.add(responses.POST,
+                      _recognize_url,
+                      status=429,
+                      headers={'Retry-After': '0'},
+                      json={'error': 'Too Many Requests'})
+        speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+        speech_to_text.set_rate_limiter(RateLimiter())
+        with pytest.raises(ApiException):
+            speech_to_text.recognize(io.BytesIO(b'\0' * 100),
+                                     content_type='audio/l16;rate=16000')
+        assert len(responses.calls) == 1
+        with pytest.raises(TypeError):
+            speech_to_text.set_rate_limiter(object())
+
+    def test_async_service(self):
+        httpx = pytest.importorskip('httpx')
+        statuses = [429, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            return httpx.Response(status,
+                                  headers={'Retry-After': '0.1'},
+                                  json={'translations': []})
+
+        async def main():
+            translator = AsyncLanguageTranslatorV3(
+                version='2018-05-01', authenticator=NoAuthAuthenticator())
+            translator.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            translator.set_rate_limiter(limiter)
+            async with translator:
+                return await translator.translate(text=['Hello'],
+                                                  model_id='en-de')
+
+        limiter = RateLimiter()
+        started = time.monotonic()
+        response = run_until_complete(main())
+        assert response.get_result() == {'translations': []}
+        assert time.monotonic() - started >= 0.09
+        assert statuses == []
+        assert limiter.throttled == 1
+        assert limiter.in_flight == 0
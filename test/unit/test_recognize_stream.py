@@ -0,0 +1,350 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for the asyncio websocket and RecognizeStream
+"""
+
+import asyncio
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import (BearerTokenAuthenticator,
+                                               NoAuthAuthenticator)
+from ibm_watson import SpeechToTextV1
+from ibm_watson.websocket import AsyncWebSocket, AudioPacer, AudioSource
+from ibm_watson.websocket.async_websocket import OPCODE_PING, OPCODE_TEXT
+
+from .event_loop import run_until_complete
+from .websocket_server import results, run
+
+
+def _run(test):
+    """Run `test(server, speech_to_text)` on a new event loop."""
+
+    async def main(server):
+        speech_to_text = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+        speech_to_text.set_service_url(server.url)
+        return await test(server, speech_to_text)
+
+    return run(main)
+
+
+class TestRecognizeStream():
+
+    def test_recognize(self):
+
+        async def test(server, speech_to_text):
+            stream = speech_to_text.recognize_stream('audio/l16;rate=16000',
+                                                     max_alternatives=None)
+            async with stream:
+                for _ in range(10):
+                    await stream.send(b'\x00' * 3200)
+                await stream.send(memoryview(bytearray(100000)))
+                await stream.stop()
+                messages = [message async for message in stream]
+                assert stream.finished
+                assert [message async for message in stream] == []
+                with pytest.raises(ValueError):
+                    await stream.send(b'\x00')
+            assert stream.websocket.close_code == 1000
+            assert server.starts[0]['content_type'] == 'audio/l16;rate=16000'
+            assert 'max_alternatives' not in server.starts[0]
+            return messages
+
+        messages = _run(test)
+        assert messages == [results(132000)]
+
+    def test_handshake(self):
+
+        threads = []
+
+        class _Authenticator(BearerTokenAuthenticator):
+
+            def authenticate(self, req):
+                threads.append(threading.current_thread())
+                BearerTokenAuthenticator.authenticate(self, req)
+
+        async def test(server, speech_to_text):
+            speech_to_text.authenticator = _Authenticator('expired')
+            stream = speech_to_text.recognize_stream(
+                'audio/wav',
+                model='en-US_Telephony',
+                timestamps=True,
+                headers={'X-Watson-Learning-Opt-Out': 'true'})
+            # The stream is authenticated when it connects.
+            speech_to_text.authenticator.bearer_token = 'token'
+            async with stream:
+                await stream.stop()
+                assert [m async for m in stream] == [results(0)]
+            return server
+
+        server = _run(test)
+        # Off the thread of the event loop.
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+        (target, headers), = server.requests
+        parts = urlsplit(target)
+        assert parts.path == '/v1/recognize'
+        assert parse_qs(parts.query) == {'model': ['en-US_Telephony']}
+        assert headers['Authorization'] == 'Bearer token'
+        assert headers['X-Watson-Learning-Opt-Out'] == 'true'
+        assert headers['Upgrade'] == 'websocket'
+        assert server.starts == [{
+            'action': 'start',
+            'content_type': 'audio/wav',
+            'timestamps': True
+        }]
+
+    def test_send_audio(self, tmp_path):
+        path = tmp_path / 'audio.raw'
+        path.write_bytes(bytes(150000))
+
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0)
+                yield bytearray(5000)
+
+        async def test(server, speech_to_text):
+            recording = AudioSource.from_file(str(path))
+            messages = []
+            for source, pacer in ((recording, None),
+                                  (AudioSource(chunks()),
+                                   AudioPacer('bounded',
+                                              max_bytes_per_second=1e6))):
+                async with speech_to_text.recognize_stream(
+                        'audio/l16;rate=16000') as stream:
+                    await stream.send_audio(source, pacer)
+                    assert stream.stopped
+                    messages += [message async for message in stream]
+            assert recording.input.closed
+            return messages
+
+        assert _run(test) == [results(150000), results(15000)]
+
+    def test_interimresults(self):
+
+        async def test(server, speech_to_text):
+            async with speech_to_text.recognize_stream(
+                    'audio/wav', interim_results=True) as stream:
+
+                async def send():
+                    for _ in range(5):
+                        await stream.send(b'\x00' * 1000)
+                    await stream.stop()
+
+                sender = asyncio.ensure_future(send())
+                messages = [message async for message in stream]
+                await sender
+            return messages
+
+        messages = _run(test)
+        assert messages == [
+            results(1000 * i, final=False) for i in range(1, 6)
+        ] + [results(5000)]
+
+    def test_concurrent_streams(self):
+        threads = []
+
+        async def recognize(speech_to_text, size):
+            async with speech_to_text.recognize_stream('audio/wav') as stream:
+                for start in range(0, size, 4096):
+                    await stream.send(b'\x00' * min(4096, size - start))
+                threads.append(threading.active_count())
+                await stream.stop()
+                message, = [message async for message in stream]
+            return message['results'][0]['alternatives'][0]['transcript']
+
+        async def test(server, speech_to_text):
+            asyncio.get_event_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=1))
+            return await asyncio.gather(*[
+                recognize(speech_to_text, 10000 + i) for i in range(200)
+            ])
+
+        active_count = threading.active_count()
+        transcripts = _run(test)
+        assert transcripts == [
+            '{0} bytes'.format(10000 + i) for i in range(200)
+        ]
+        # The streams share the thread of the event loop, and authenticate on
+        # the one thread of the executor.
+        assert set(threads) == {active_count + 1}
+
+    def test_errors(self):
+
+        async def test(server, speech_to_text):
+            with pytest.raises(ApiException) as error:
+                await speech_to_text.recognize_stream(
+                    'audio/wav', customization_weight=2).open()
+            assert error.value.status_code == 400
+            assert error.value.message == \
+                'customization_weight must be at most 1'
+
+            speech_to_text.set_service_url(
+                speech_to_text.service_url + '/v1/unauthorized')
+            with pytest.raises(ApiException) as error:
+                async with speech_to_text.recognize_stream('audio/wav'):
+                    pass
+            assert error.value.status_code == 401
+            assert 'Unauthorized' in error.value.message
+
+        _run(test)
+        with pytest.raises(ValueError):
+            SpeechToTextV1(authenticator=NoAuthAuthenticator()).recognize_stream(
+                None)
+
+
+async def _recognize(session, size):
+    async with session.recognize('audio/wav') as stream:
+        await stream.send(bytes(size))
+        await stream.stop()
+        message, = [message async for message in stream]
+    return message['results'][0]['alternatives'][0]['transcript']
+
+
+class TestRecognitionSession():
+
+    def test_reuse(self):
+
+        async def test(server, speech_to_text):
+            speech_to_text.authenticator = BearerTokenAuthenticator('token')
+            async with speech_to_text.recognition_session(
+                    model='en-US_Telephony') as session:
+                assert session.connections == 1
+                transcripts = [
+                    await _recognize(session, size) for size in (10, 20, 30)
+                ]
+                # Recognitions run one at a time.
+                transcripts += await asyncio.gather(
+                    _recognize(session, 40), _recognize(session, 50))
+                assert session.connections == 1
+                assert session.recognitions == 5
+                websocket = session.websocket
+            assert websocket.close_code == 1000
+            assert session.websocket is None
+            with pytest.raises(ValueError):
+                await _recognize(session, 10)
+            return transcripts, server
+
+        transcripts, server = _run(test)
+        assert transcripts == [
+            '{0} bytes'.format(size) for size in (10, 20, 30, 40, 50)
+        ]
+        (target, headers), = server.requests
+        assert target == '/v1/recognize?model=en-US_Telephony'
+        assert headers['Authorization'] == 'Bearer token'
+        assert len(server.starts) == 5
+
+    def test_reconnect(self):
+
+        async def test(server, speech_to_text):
+            session = speech_to_text.recognition_session()
+            async with session:
+                # A recognition left before the service answered all its
+                # audio leaves the connection unusable.
+                async with session.recognize('audio/wav') as stream:
+                    await stream.send(bytes(10))
+                assert session.websocket is None
+                assert await _recognize(session, 20) == '20 bytes'
+                assert session.connections == 2
+
+                # The service closes the connection after a recognition.
+                server.close_after_recognition = True
+                assert await _recognize(session, 30) == '30 bytes'
+                assert await _recognize(session, 40) == '40 bytes'
+                assert session.connections == 3
+            return len(server.requests)
+
+        assert _run(test) == 3
+
+    def test_keep_alive(self):
+
+        async def test(server, speech_to_text):
+            async with speech_to_text.recognition_session(
+                    keep_alive_interval=0.02, idle_timeout=0.15) as session:
+                await asyncio.sleep(0.1)
+                assert server.pings >= 3
+                assert session.websocket is not None
+                await asyncio.sleep(0.15)
+                assert session.websocket is None
+                assert await _recognize(session, 10) == '10 bytes'
+                assert session.connections == 2
+            return server
+
+        _run(test)
+
+
+class TestAsyncWebSocket():
+
+    def test_messages(self):
+        received = []
+
+        async def echo(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(b'HTTP/1.1 101 Switching Protocols\r\n'
+                         b'Sec-WebSocket-Accept: wrong\r\n\r\n')
+            websocket = AsyncWebSocket(reader, writer, client=False)
+            # A text message in three frames, with a ping between them.
+            for fin, opcode, payload in ((0, OPCODE_TEXT, b'he'),
+                                         (0, 0, b'll'), (1, 0, b'o')):
+                writer.write(
+                    struct.pack('!BB', fin << 7 | opcode, len(payload)) +
+                    payload)
+                if opcode == 0:
+                    writer.write(struct.pack('!BB', 0x80 | OPCODE_PING, 1) +
+                                 b'!')
+            while True:
+                message = await websocket.receive()
+                if message is None:
+                    break
+                received.append(message)
+                await websocket.send(message)
+
+        async def main():
+            server = await asyncio.start_server(echo, '127.0.0.1', 0)
+            url = 'ws://127.0.0.1:{0}/'.format(
+                server.sockets[0].getsockname()[1])
+            with pytest.raises(ConnectionError):
+                await AsyncWebSocket.connect(url)
+            with pytest.raises(ValueError):
+                await AsyncWebSocket.connect('http://127.0.0.1/')
+
+            reader, writer = await asyncio.open_connection(
+                '127.0.0.1', server.sockets[0].getsockname()[1])
+            writer.write(b'GET / HTTP/1.1\r\n\r\n')
+            await reader.readuntil(b'\r\n\r\n')
+            async with AsyncWebSocket(reader, writer) as websocket:
+                assert await websocket.receive() == 'hello'
+                large = bytes(range(256)) * 1000
+                await websocket.send(large)
+                assert await websocket.receive() == large
+                await websocket.send('été')
+                assert await websocket.receive() == 'été'
+                await websocket.close(4000, 'done')
+                assert websocket.closed
+                with pytest.raises(ConnectionError):
+                    await websocket.send(b'')
+            assert websocket.close_code == 4000
+            assert await websocket.receive() is None
+            server.close()
+            await server.wait_closed()
+
+        run_until_complete(main())
+        assert received == [bytes(range(256)) * 1000, 'été']
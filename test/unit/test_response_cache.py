@@ -0,0 +1,232 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for ResponseCache
+"""
+
+import asyncio
+import time
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import ResponseCache
+from ibm_watson.assistant_v1 import AssistantV1
+from ibm_watson.text_to_speech_v1 import (AsyncTextToSpeechV1, TextToSpeechV1,
+                                          Voices)
+
+from .event_loop import run_until_complete
+
+_base_url = 'https://api.us-south.text-to-speech.watson.cloud.ibm.com'
+_voices_url = _base_url + '/v1/voices'
+_voices = {'voices': [{'name': 'en-US_AllisonV3Voice'}]}
+
+
+def _text_to_speech(cache):
+    text_to_speech = TextToSpeechV1(authenticator=NoAuthAuthenticator())
+    text_to_speech.set_response_cache(cache)
+    return text_to_speech
+
+
+class TestResponseCache():
+
+    @responses.activate
+    def test_hit(self):
+        responses.add(responses.GET, _voices_url, json=_voices)
+        cache = ResponseCache()
+        text_to_speech = _text_to_speech(cache)
+        result = text_to_speech.list_voices().get_result()
+        assert result == _voices
+        # Results are copies, so changing one does not change the cache.
+        result['voices'].clear()
+        response = text_to_speech.list_voices()
+        assert response.get_result() == _voices
+        assert response.get_status_code() == 200
+        assert len(responses.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        text_to_speech.set_response_model('lazy')
+        assert isinstance(text_to_speech.list_voices().get_result(), Voices)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_key(self):
+        responses.add(responses.GET, _voices_url + '/en-US_AllisonV3Voice',
+                      json={'name': 'en-US_AllisonV3Voice'})
+        text_to_speech = _text_to_speech(ResponseCache())
+        text_to_speech.get_voice('en-US_AllisonV3Voice')
+        text_to_speech.get_voice('en-US_AllisonV3Voice', customization_id='c')
+        text_to_speech.get_voice('en-US_AllisonV3Voice',
+                                 headers={'X-Watson-Learning-Opt-Out': 'true'})
+        text_to_speech.get_voice('en-US_AllisonV3Voice', customization_id='c')
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_ttl(self):
+        responses.add(responses.GET, _voices_url, json=_voices)
+        responses.add(responses.GET,
+                      _base_url + '/v1/customizations',
+                      json={'customizations': []})
+        text_to_speech = _text_to_speech(
+            ResponseCache(ttl=0.1, ttls={'list_custom_models': 0}))
+        text_to_speech.list_voices()
+        text_to_speech.list_voices()
+        assert len(responses.calls) == 1
+        time.sleep(0.15)
+        text_to_speech.list_voices()
+        assert len(responses.calls) == 2
+        text_to_speech.list_custom_models()
+        text_to_speech.list_custom_models()
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_lru(self):
+        for name in 'abc':
+            responses.add(responses.GET, _voices_url + '/' + name, json={})
+        cache = ResponseCache(max_entries=2)
+        text_to_speech = _text_to_speech(cache)
+        for name in 'abab':
+            text_to_speech.get_voice(name)
+        text_to_speech.get_voice('c')
+        assert len(cache) == 2
+        text_to_speech.get_voice('b')
+        assert len(responses.calls) == 3
+        text_to_speech.get_voice('a')
+        assert len(responses.calls) == 4
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+    @responses.activate
+    def test_etag(self):
+        responses.add(responses.GET,
+                      _voices_url,
+                      json=_voices,
+                      headers={'ETag': '"v1"'})
+        responses.add(responses.GET, _voices_url, status=304)
+        cache = ResponseCache(ttl=0.05)
+        text_to_speech = _text_to_speech(cache)
+        text_to_speech.list_voices()
+        time.sleep(0.1)
+        response = text_to_speech.list_voices()
+        assert response.get_result() == _voices
+        assert response.get_status_code() == 200
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert (cache.hits, cache.misses) == (1, 1)
+        # The revalidated entry is fresh again.
+        text_to_speech.list_voices()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_invalidation(self):
+        url = 'https://api.us-south.assistant.watson.cloud.ibm.com/v1/workspaces'
+        responses.add(responses.GET, url, json={'workspaces': []})
+        responses.add(responses.GET, url + '/w', json={'name': 'a'})
+        responses.add(responses.POST, url + '/w', json={'name': 'b'})
+        responses.add(responses.GET,
+                      'https://api.us-south.assistant.watson.cloud.ibm.com/v1/logs',
+                      json={'logs': []})
+        assistant = AssistantV1(version='2021-06-14',
+                                authenticator=NoAuthAuthenticator())
+        cache = ResponseCache()
+        assistant.set_response_cache(cache)
+        assistant.list_workspaces()
+        assistant.get_workspace('w')
+        assistant.list_all_logs('language::en')
+        assert len(cache) == 3
+        assistant.update_workspace('w', name='b')
+        assert len(cache) == 1
+        assistant.get_workspace('w')
+        assert len(responses.calls) == 5
+        cache.clear()
+        assert len(cache) == 0
+
+    @responses.activate
+    def test_invalidation_scope(self):
+        url = 'https://api.us-south.assistant.watson.cloud.ibm.com/v1/workspaces'
+        responses.add(responses.GET, url, json={'workspaces': []})
+        for workspace in ('w', 'v'):
+            responses.add(responses.GET,
+                          url + '/' + workspace,
+                          json={'name': workspace})
+            responses.add(responses.GET,
+                          url + '/' + workspace + '/intents',
+                          json={'intents': []})
+        responses.add(responses.POST, url + '/w/message', json={})
+        responses.add(responses.POST, url + '/w/intents', json={})
+        assistant = AssistantV1(version='2021-06-14',
+                                authenticator=NoAuthAuthenticator())
+        cache = ResponseCache()
+        assistant.set_response_cache(cache)
+
+        def get_all():
+            assistant.list_workspaces()
+            for workspace in ('w', 'v'):
+                assistant.get_workspace(workspace)
+                assistant.list_intents(workspace)
+
+        get_all()
+        assert len(cache) == 5
+        # A message only reads the workspace.
+        assistant.message('w', input={'text': 'hello'})
+        assert len(cache) == 5
+        get_all()
+        assert len(responses.calls) == 6
+        # A new intent changes its collection and the workspace, not the
+        # other workspaces.
+        assistant.create_intent('w', 'greeting')
+        assert len(cache) == 3
+        assert assistant.list_workspaces()
+        assert len(responses.calls) == 7
+
+    @responses.activate
+    def test_errors_not_cached(self):
+        responses.add(responses.GET, _voices_url, status=500, json={})
+        text_to_speech = _text_to_speech(ResponseCache())
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                text_to_speech.list_voices()
+        assert len(responses.calls) == 2
+        with pytest.raises(TypeError):
+            text_to_speech.set_response_cache({})
+
+    def test_async(self):
+        httpx = pytest.importorskip('httpx')
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if 'If-None-Match' in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, json=_voices, headers={'ETag': 'v1'})
+
+        async def main():
+            text_to_speech = AsyncTextToSpeechV1(
+                authenticator=NoAuthAuthenticator())
+            text_to_speech.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            text_to_speech.set_response_cache(ResponseCache(ttl=0.05))
+            async with text_to_speech:
+                results = [(await text_to_speech.list_voices()).get_result()]
+                results.append((await text_to_speech.list_voices()).get_result())
+                await asyncio.sleep(0.1)
+                results.append((await text_to_speech.list_voices()).get_result())
+            return results
+
+        assert run_until_complete(main()) == [_voices] * 3
+        assert len(requests) == 2
+        assert requests[1].headers['If-None-Match'] == 'v1'
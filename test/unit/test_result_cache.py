@@ -0,0 +1,211 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for ResultCache
+"""
+
+import os
+
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_watson import ResultCache
+from ibm_watson.language_translator_v3 import (AsyncLanguageTranslatorV3,
+                                               LanguageTranslatorV3)
+from ibm_watson.natural_language_understanding_v1 import (
+    Features, KeywordsOptions, NaturalLanguageUnderstandingV1)
+from ibm_watson.result_cache import (MemoryBackend, ResultCacheBackend,
+                                     ShelveBackend, SQLiteBackend)
+
+from .event_loop import run_until_complete
+
+_analyze_url = 'https://api.us-south.natural-language-understanding.watson.cloud.ibm.com/v1/analyze'
+_translate_url = 'https://api.us-south.language-translator.watson.cloud.ibm.com/v3/translate'
+_analysis = {'language': 'en', 'keywords': [{'text': 'cache'}]}
+
+
+def _nlu(cache):
+    nlu = NaturalLanguageUnderstandingV1(version='2021-08-01',
+                                         authenticator=NoAuthAuthenticator())
+    nlu.set_result_cache(cache)
+    return nlu
+
+
+class _DictBackend(ResultCacheBackend):
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def clear(self):
+        self.values.clear()
+
+
+class TestResultCache():
+
+    @responses.activate
+    def test_duplicate_requests(self):
+        responses.add(responses.POST, _analyze_url, json=_analysis)
+        cache = ResultCache()
+        nlu = _nlu(cache)
+        features = Features(keywords=KeywordsOptions(limit=5))
+        result = nlu.analyze(features, text='A cache').get_result()
+        assert result == _analysis
+        result['keywords'].clear()
+        response = nlu.analyze(features, text='A cache')
+        assert response.get_result() == _analysis
+        assert response.get_status_code() == 200
+        nlu.analyze(features, text='Another text')
+        nlu.analyze(Features(keywords=KeywordsOptions(limit=6)),
+                    text='A cache')
+        assert len(responses.calls) == 3
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert cache.get_hit_ratio() == 0.25
+        cache.clear()
+        assert (cache.hits, cache.misses) == (0, 0)
+        nlu.analyze(features, text='A cache')
+        assert len(responses.calls) == 4
+
+    def test_key(self):
+        cache = ResultCache()
+        nlu = _nlu(cache)
+
+        def request(data, **headers):
+            return nlu.prepare_request(
+                'POST',
+                '/v1/analyze',
+                headers=dict(
+                    {
+                        'X-IBMCloud-SDK-Analytics': 'operation_id=analyze',
+                        'Content-Type': 'application/json'
+                    }, **headers),
+                params={'version': '2021-08-01'},
+                data=data)
+
+        key = cache.get_key(request({'text': 'a', 'features': {'x': 1}}))
+        assert key == cache.get_key(
+            request({
+                'features': {
+                    'x': 1
+                },
+                'text': 'a'
+            }, Authorization='Bearer other'))
+        assert key != cache.get_key(request({'text': 'b', 'features': {}}))
+        assert key != cache.get_key(
+            request({
+                'text': 'a',
+                'features': {
+                    'x': 1
+                }
+            }, **{'Accept-Language': 'fr'}))
+        nlu.set_enable_gzip_compression(True)
+        assert key == cache.get_key(request({'text': 'a', 'features': {'x': 1}}))
+        nlu.set_enable_gzip_compression(False)
+        # Other operations, and streamed bodies, are not cached.
+        assert cache.get_key(
+            nlu.prepare_request(
+                'GET',
+                '/v1/models',
+                headers={'X-IBMCloud-SDK-Analytics':
+                         'operation_id=list_models'})) is None
+        streamed = request({})
+        streamed['data'] = open(__file__, 'rb')
+        with streamed['data']:
+            assert cache.get_key(streamed) is None
+
+    @pytest.mark.parametrize('backend_class',
+                             [SQLiteBackend, ShelveBackend, _DictBackend])
+    @responses.activate
+    def test_backends(self, backend_class, tmpdir):
+        responses.add(responses.POST, _analyze_url, json=_analysis)
+        path = os.path.join(str(tmpdir), 'results')
+        backend = (backend_class(path)
+                   if backend_class is not _DictBackend else backend_class())
+        features = Features(keywords=KeywordsOptions())
+        _nlu(ResultCache(backend)).analyze(features, text='A cache')
+        if backend_class is not _DictBackend:
+            # Another process reuses the results.
+            backend.close()
+            backend = backend_class(path)
+        response = _nlu(ResultCache(backend)).analyze(features, text='A cache')
+        assert response.get_result() == _analysis
+        assert len(responses.calls) == 1
+        backend.clear()
+        assert backend.get('missing') is None
+        backend.close()
+
+    def test_memory_backend(self):
+        backend = MemoryBackend(max_entries=2)
+        backend.set('a', b'1')
+        backend.set('b', b'2')
+        backend.get('a')
+        backend.set('c', b'3')
+        assert backend.get('b') is None
+        assert backend.get('a') == b'1'
+        assert len(backend) == 2
+        with pytest.raises(ValueError):
+            MemoryBackend(max_entries=0)
+
+    @responses.activate
+    def test_operations(self):
+        responses.add(responses.POST,
+                      _translate_url,
+                      json={'translations': [{
+                          'translation': 'Hallo'
+                      }]})
+        translator = LanguageTranslatorV3(version='2018-05-01',
+                                          authenticator=NoAuthAuthenticator())
+        translator.set_result_cache(ResultCache(operations=['identify']))
+        translator.translate(text=['Hello'], model_id='en-de')
+        translator.translate(text=['Hello'], model_id='en-de')
+        assert len(responses.calls) == 2
+        translator.set_result_cache(ResultCache())
+        translator.translate(text=['Hello'], model_id='en-de')
+        translator.translate(text=['Hello'], model_id='en-de')
+        assert len(responses.calls) == 3
+        with pytest.raises(TypeError):
+            translator.set_result_cache(MemoryBackend())
+
+    def test_async(self):
+        httpx = pytest.importorskip('httpx')
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'translations': []})
+
+        async def main():
+            translator = AsyncLanguageTranslatorV3(
+                version='2018-05-01', authenticator=NoAuthAuthenticator())
+            translator.set_async_http_client(
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            cache = ResultCache()
+            translator.set_result_cache(cache)
+            async with translator:
+                for _ in range(3):
+                    response = await translator.translate(text=['Hi'],
+                                                          model_id='en-de')
+            return cache, response
+
+        cache, response = run_until_complete(main())
+        assert response.get_result() == {'translations': []}
+        assert len(requests) == 1
+        assert cache.hits == 2
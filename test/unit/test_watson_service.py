@@ -0,0 +1,308 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for WatsonService
+"""
+
+import json
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_watson.assistant_v2 import (AssistantV2, MessageInput,
+                                     MessageResponse, SessionResponse)
+from ibm_watson.natural_language_classifier_v1 import NaturalLanguageClassifierV1
+from ibm_watson import SpeechToTextV1
+from ibm_watson.json_codec import StdlibJsonCodec
+from ibm_watson.watson_service import PreparedOperation
+
+_base_url = 'https://api.us-south.assistant.watson.cloud.ibm.com'
+_message_url = _base_url + '/v2/assistants/my%2Fassistant/sessions/my_session/message'
+
+
+def _assistant():
+    service = AssistantV2(version='2021-06-14',
+                          authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestPrepareOperation():
+    """
+    Test Class for prepare_operation
+    """
+
+    @responses.activate
+    def test_prepare_message(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body='{"output": {}}',
+                      content_type='application/json',
+                      status=200)
+        service = _assistant()
+        message = service.prepare_operation('message',
+                                            'my/assistant',
+                                            'my_session',
+                                            user_id='user',
+                                            headers={'X-Test': 'static'})
+        assert isinstance(message, PreparedOperation)
+        assert message.method == 'POST'
+        assert message.url == _message_url
+        # Nothing is sent while preparing.
+        assert len(responses.calls) == 0
+
+        response = message(input=MessageInput(text='first'))
+        assert response.get_result() == {'output': {}}
+        service.authenticator.set_bearer_token('refreshed')
+        message(input={'text': 'second'}, context=None,
+                headers={'X-Call': 'dynamic'})
+
+        assert len(responses.calls) == 2
+        first, second = (call.request for call in responses.calls)
+        assert 'version=2021-06-14' in first.url
+        assert json.loads(first.body) == {
+            'input': {'text': 'first'},
+            'user_id': 'user'
+        }
+        assert json.loads(second.body) == {
+            'input': {'text': 'second'},
+            'user_id': 'user'
+        }
+        assert first.headers['Authorization'] == 'Bearer token'
+        assert second.headers['Authorization'] == 'Bearer refreshed'
+        assert first.headers['X-Test'] == 'static'
+        assert 'X-Call' not in first.headers
+        assert second.headers['X-Call'] == 'dynamic'
+        assert 'operation_id=message' in first.headers[
+            'X-IBMCloud-SDK-Analytics']
+
+    @responses.activate
+    def test_prepare_without_body(self):
+        responses.add(responses.POST,
+                      _base_url + '/v2/assistants/my_assistant/sessions',
+                      body='{"session_id": "id"}',
+                      content_type='application/json',
+                      status=201)
+        create_session = _assistant().prepare_operation(
+            'create_session', assistant_id='my_assistant')
+        assert create_session().get_result() == {'session_id': 'id'}
+        with pytest.raises(ValueError):
+            create_session(input={'text': 'hello'})
+
+    def test_prepare_invalid(self):
+        service = _assistant()
+        with pytest.raises(ValueError):
+            service.prepare_operation('prepare_operation')
+        with pytest.raises(ValueError):
+            service.prepare_operation('message', None, 'my_session')
+        classifier = NaturalLanguageClassifierV1(
+            authenticator=BearerTokenAuthenticator('token'))
+        with pytest.raises(ValueError):
+            classifier.prepare_operation('create_classifier',
+                                         training_metadata=b'{}',
+                                         training_data=b'text,class')
+
+    @responses.activate
+    def test_prepare_adapter(self):
+        # SpeechToTextV1 is an adapter subclass of the generated service.
+        responses.add(responses.POST,
+                      'https://stt.example.com/v1/recognize',
+                      body='{"results": []}',
+                      content_type='application/json',
+                      status=200)
+        speech_to_text = SpeechToTextV1(
+            authenticator=BearerTokenAuthenticator('token'))
+        speech_to_text.set_service_url('https://stt.example.com')
+        recognize = speech_to_text.prepare_operation('recognize',
+                                                     b'audio',
+                                                     content_type='audio/wav')
+        assert recognize().get_result() == {'results': []}
+        assert responses.calls[0].request.body == b'audio'
+
+
+class _RecordingCodec(StdlibJsonCodec):
+    name = 'recording'
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super().loads(data)
+
+
+class TestJsonCodec():
+    """
+    Test Class for the JSON codec of a service
+    """
+
+    def test_get_json_codec(self):
+        service = _assistant()
+        assert service.get_json_codec().name == 'json'
+        codec = _RecordingCodec()
+        service.set_json_codec(codec)
+        assert service.get_json_codec() is codec
+        service.set_json_codec(None)
+        assert service.get_json_codec().name == 'json'
+        with pytest.raises(ValueError):
+            service.set_json_codec('unknown')
+
+    @responses.activate
+    def test_request_and_response_bodies(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body='{"output": {"generic": []}}',
+                      content_type='application/json; charset=utf-8',
+                      status=200)
+        service = _assistant()
+        codec = _RecordingCodec()
+        service.set_json_codec(codec)
+        response = service.message('my/assistant',
+                                   'my_session',
+                                   input=MessageInput(text='Grüße'))
+        assert response.get_result() == {'output': {'generic': []}}
+        assert codec.calls == ['dumps', 'loads']
+        assert isinstance(responses.calls[0].request.body, bytes)
+        assert json.loads(responses.calls[0].request.body) == {
+            'input': {'text': 'Grüße'}
+        }
+
+    @responses.activate
+    def test_response_bodies(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body='{"output": ',
+                      content_type='application/json',
+                      status=200)
+        responses.add(responses.POST,
+                      _message_url,
+                      body='',
+                      content_type='application/json',
+                      status=200)
+        responses.add(responses.POST,
+                      _message_url,
+                      body='plain text',
+                      content_type='text/plain',
+                      status=200)
+        service = _assistant()
+        with pytest.raises(ApiException):
+            service.message('my/assistant', 'my_session')
+        assert service.message('my/assistant', 'my_session').get_result() is None
+        result = service.message('my/assistant', 'my_session').get_result()
+        assert result.text == 'plain text'
+        streamed = service.message('my/assistant', 'my_session',
+                                   stream=True).get_result()
+        assert streamed.raw.read() == b'plain text'
+
+
+_message_response = {
+    'output': {
+        'generic': [{
+            'response_type': 'text',
+            'text': 'Hello'
+        }]
+    },
+    'user_id': 'user'
+}
+
+
+class TestResponseModel():
+    """
+    Test Class for returning models as results
+    """
+
+    @responses.activate
+    def test_response_model(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body=json.dumps(_message_response),
+                      content_type='application/json',
+                      status=200)
+        service = _assistant()
+        result = service.message('my/assistant', 'my_session').get_result()
+        assert result == _message_response
+
+        service.set_response_model(True)
+        result = service.message('my/assistant', 'my_session').get_result()
+        assert type(result) is MessageResponse
+        assert result.output.generic[0].text == 'Hello'
+        assert result.to_dict() == _message_response
+
+        service.set_response_model('lazy')
+        result = service.message('my/assistant', 'my_session').get_result()
+        assert isinstance(result, MessageResponse)
+        assert result == MessageResponse.from_dict(_message_response)
+
+        result = service.message('my/assistant',
+                                 'my_session',
+                                 response_model=False).get_result()
+        assert result == _message_response
+
+    @responses.activate
+    def test_response_model_per_call(self):
+        responses.add(responses.POST,
+                      _base_url + '/v2/assistants/my_assistant/sessions',
+                      body='{"session_id": "my_session"}',
+                      content_type='application/json',
+                      status=201)
+        service = _assistant()
+        result = service.create_session('my_assistant',
+                                        response_model=True).get_result()
+        assert type(result) is SessionResponse
+        assert result.session_id == 'my_session'
+
+    @responses.activate
+    def test_prepared_operation(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body=json.dumps(_message_response),
+                      content_type='application/json',
+                      status=200)
+        service = _assistant()
+        service.set_response_model(True)
+        message = service.prepare_operation('message', 'my/assistant',
+                                            'my_session')
+        result = message(input={'text': 'Hi'}).get_result()
+        assert type(result) is MessageResponse
+
+    @responses.activate
+    def test_results_without_model(self):
+        responses.add(responses.POST,
+                      _message_url,
+                      body='plain text',
+                      content_type='text/plain',
+                      status=200)
+        responses.add(responses.DELETE,
+                      _base_url + '/v2/assistants/my_assistant/sessions/s',
+                      body='{}',
+                      content_type='application/json',
+                      status=200)
+        service = _assistant()
+        service.set_response_model(True)
+        result = service.message('my/assistant', 'my_session').get_result()
+        assert result.text == 'plain text'
+        result = service.delete_session('my_assistant', 's').get_result()
+        assert result == {}
+
+    def test_set_response_model(self):
+        service = _assistant()
+        assert service.response_model is False
+        with pytest.raises(ValueError):
+            service.set_response_model('eager')
@@ -0,0 +1,202 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for WebSocketPool and SynthesizeStream
+"""
+
+import asyncio
+
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_watson import SpeechToTextV1, TextToSpeechV1
+
+from .websocket_server import AUDIO, run
+
+
+async def _recognize(speech_to_text, pool, size, **params):
+    async with speech_to_text.recognize_stream('audio/wav', pool=pool,
+                                               **params) as stream:
+        await stream.send(bytes(size))
+        await stream.stop()
+        message, = [message async for message in stream]
+    return message['results'][0]['alternatives'][0]['transcript']
+
+
+async def _until(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('timed out')
+
+
+class TestWebSocketPool():
+
+    def test_recognize(self):
+
+        async def test(server):
+            authenticator = BearerTokenAuthenticator('first')
+            speech_to_text = SpeechToTextV1(authenticator=authenticator)
+            speech_to_text.set_service_url(server.url)
+            async with speech_to_text.websocket_pool(size=2) as pool:
+                await pool.warm(model='en-US_Telephony')
+                assert pool.idle(model='en-US_Telephony') == 2
+                assert len(server.requests) == 2
+
+                transcripts = [
+                    await _recognize(speech_to_text,
+                                     pool,
+                                     size,
+                                     model='en-US_Telephony')
+                    for size in (10, 20, 30)
+                ]
+                transcripts += await asyncio.gather(*[
+                    _recognize(
+                        speech_to_text, pool, size, model='en-US_Telephony')
+                    for size in (40, 50)
+                ])
+                assert transcripts == [
+                    '{0} bytes'.format(size) for size in (10, 20, 30, 40, 50)
+                ]
+                # The connections returned to the pool.
+                assert len(server.requests) == 2
+                assert (pool.hits, pool.misses) == (5, 0)
+
+                # A new query is served cold, then kept warm.
+                authenticator.bearer_token = 'second'
+                assert await _recognize(speech_to_text, pool, 60) == '60 bytes'
+                assert pool.misses == 1
+                await _until(lambda: pool.idle() == 2)
+                idle = pool._idle[()]
+            assert all(websocket.closed for websocket in idle)
+            with pytest.raises(ValueError):
+                await pool.acquire({})
+            return server
+
+        server = run(test)
+        targets = [target for target, _ in server.requests]
+        assert targets[:2] == ['/v1/recognize?model=en-US_Telephony'] * 2
+        assert targets[2:] == ['/v1/recognize'] * 3
+        # Each connection is authenticated when it is opened.
+        assert [headers['Authorization'] for _, headers in server.requests
+               ] == ['Bearer first'] * 2 + ['Bearer second'] * 3
+
+    def test_synthesize(self):
+
+        async def test(server):
+            text_to_speech = TextToSpeechV1(
+                authenticator=BearerTokenAuthenticator('token'))
+            text_to_speech.set_service_url(server.url)
+            async with text_to_speech.synthesize_stream(
+                    'Hello', accept='audio/wav',
+                    voice='en-US_AllisonV3Voice') as stream:
+                assert stream.content_type == 'audio/wav'
+                assert await stream.read() == AUDIO
+                assert stream.messages == [{'words': [['Hello', 0.0, 0.5]]}]
+
+            async with text_to_speech.websocket_pool(size=2) as pool:
+                await pool.warm(voice='en-US_AllisonV3Voice')
+                for _ in range(3):
+                    async with text_to_speech.synthesize_stream(
+                            'Hello',
+                            accept='audio/ogg',
+                            voice='en-US_AllisonV3Voice',
+                            pool=pool) as stream:
+                        audio = [chunk async for chunk in stream]
+                    assert b''.join(audio) == AUDIO
+                    assert stream.content_type == 'audio/ogg'
+                    # The service closes each connection: another replaces it.
+                    await _until(
+                        lambda: pool.idle(voice='en-US_AllisonV3Voice') == 2)
+                assert (pool.hits, pool.misses) == (3, 0)
+
+                with pytest.raises(ApiException) as error:
+                    async with text_to_speech.synthesize_stream(
+                            '', voice='en-US_AllisonV3Voice', pool=pool):
+                        pass
+                assert error.value.message == 'text is empty'
+                await _until(
+                    lambda: pool.idle(voice='en-US_AllisonV3Voice') == 2)
+            return server
+
+        server = run(test)
+        assert len(server.requests) == 1 + 2 + 3 + 1
+        assert {target for target, _ in server.requests
+               } == {'/v1/synthesize?voice=en-US_AllisonV3Voice'}
+
+    def test_health_check(self):
+
+        async def test(server):
+            speech_to_text = SpeechToTextV1(
+                authenticator=BearerTokenAuthenticator('token'))
+            speech_to_text.set_service_url(server.url)
+            pool = speech_to_text.websocket_pool(size=2,
+                                                 health_check_interval=0.02,
+                                                 max_age=None)
+            async with pool:
+                await pool.warm()
+                # The service drops the idle connections.
+                for websocket in list(server.websockets):
+                    websocket.writer.close()
+                await _until(lambda: len(server.requests) == 4)
+                await _until(lambda: pool.idle() == 2)
+                assert await _recognize(speech_to_text, pool, 10) == '10 bytes'
+
+                # The service closes a connection: the recognition retries on
+                # a new one.
+                asyncio.ensure_future(server.websockets[-1].close())
+                assert await _recognize(speech_to_text, pool, 20) == '20 bytes'
+                assert pool.misses <= 1
+
+                # Connections are replaced as they grow old.
+                pool.max_age = 0.05
+                count = len(server.requests)
+                await _until(lambda: len(server.requests) >= count + 2)
+                await _until(lambda: pool.idle() == 2)
+                assert await _recognize(speech_to_text, pool, 30) == '30 bytes'
+
+        run(test)
+
+    def test_health_check_busy(self):
+
+        async def test(server):
+            speech_to_text = SpeechToTextV1(
+                authenticator=BearerTokenAuthenticator('token'))
+            speech_to_text.set_service_url(server.url)
+            pool = speech_to_text.websocket_pool(size=2,
+                                                 health_check_interval=0.05)
+
+            stopped = asyncio.Event()
+
+            async def busy():
+                while not stopped.is_set():
+                    websocket = await pool.acquire({})
+                    await asyncio.sleep(0.005)
+                    await pool.release({}, websocket, True)
+
+            async with pool:
+                await pool.warm(model='en-US_Telephony')
+                task = asyncio.ensure_future(busy())
+                try:
+                    # The pool is woken more often than it is checked.
+                    await _until(lambda: server.pings >= 4)
+                finally:
+                    stopped.set()
+                    await task
+                assert pool.idle(model='en-US_Telephony') == 2
+
+        run(test)
@@ -0,0 +1,185 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+An asyncio server of the Speech to Text and Text to Speech websocket
+protocols, for the unit tests.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+
+from ibm_watson.websocket import AsyncWebSocket
+from ibm_watson.websocket.async_websocket import OPCODE_PING
+
+from .event_loop import run_until_complete
+
+GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+# The audio of each synthesis.
+AUDIO = bytes(range(256)) * 100
+
+
+class WebSocketServer():
+    """
+    A server of `/v1/recognize` and `/v1/synthesize`, on the test's loop.
+    Handshakes to `/v1/unauthorized` are refused with a 401.
+
+    :attr str url: The service URL of the server, once started.
+    :attr list requests: The target and the headers of each handshake.
+    :attr list websockets: The connections of the server.
+    :attr list starts: The `start` messages of the recognitions.
+    :attr int pings: The number of pings received.
+    :attr bool close_after_recognition: Whether a connection is closed once
+          a recognition has been answered.
+    """
+
+    def __init__(self):
+        self.url = None
+        self.requests = []
+        self.websockets = []
+        self.starts = []
+        self.pings = 0
+        self.close_after_recognition = False
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle,
+                                                 '127.0.0.1',
+                                                 0,
+                                                 backlog=512)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = 'http://127.0.0.1:{0}'.format(port)
+        return self.url
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+        request_line, *lines = head.strip().split('\r\n')
+        headers = dict(line.split(': ', 1) for line in lines)
+        target = request_line.split()[1]
+        self.requests.append((target, headers))
+        if target.startswith('/v1/unauthorized'):
+            body = b'{"error": "Unauthorized", "code": 401}'
+            writer.write(b'HTTP/1.1 401 Unauthorized\r\n'
+                         b'Content-Length: %d\r\n\r\n%s' % (len(body), body))
+            writer.close()
+            return
+        accept = base64.b64encode(
+            hashlib.sha1((headers['Sec-WebSocket-Key'] +
+                          GUID).encode('ascii')).digest())
+        writer.write(b'HTTP/1.1 101 Switching Protocols\r\n'
+                     b'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                     b'Sec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        websocket = _CountingWebSocket(self, reader, writer, client=False)
+        self.websockets.append(websocket)
+        if target.startswith('/v1/synthesize'):
+            await self.synthesize(websocket)
+        else:
+            await self.recognize(websocket)
+
+    async def recognize(self, websocket):
+        audio_bytes, options = 0, {}
+        while True:
+            message = await websocket.receive()
+            if message is None:
+                return
+            if isinstance(message, bytes):
+                audio_bytes += len(message)
+                if options.get('interim_results'):
+                    await websocket.send(
+                        json.dumps(results(audio_bytes, final=False)))
+                continue
+            message = json.loads(message)
+            if message['action'] == 'start':
+                options = message
+                self.starts.append(message)
+                if options.get('customization_weight') == 2:
+                    await websocket.send(json.dumps(
+                        {'error': 'customization_weight must be at most 1'}))
+                    await websocket.close(1011)
+                    return
+                await websocket.send(json.dumps({'state': 'listening'}))
+            elif message['action'] == 'stop':
+                await websocket.send(json.dumps(results(audio_bytes)))
+                await websocket.send(json.dumps({'state': 'listening'}))
+                audio_bytes = 0
+                if self.close_after_recognition:
+                    await websocket.close()
+                    return
+
+    async def synthesize(self, websocket):
+        message = await websocket.receive()
+        if message is None:
+            return
+        options = json.loads(message)
+        if options['text'] == '':
+            await websocket.send(json.dumps({'error': 'text is empty'}))
+            await websocket.close(1011)
+            return
+        await websocket.send(
+            json.dumps({'binary_streams': [{
+                'content_type': options['accept']
+            }]}))
+        await websocket.send(json.dumps({'words': [['Hello', 0.0, 0.5]]}))
+        for start in range(0, len(AUDIO), 8192):
+            await websocket.send(AUDIO[start:start + 8192])
+        await websocket.close()
+
+
+class _CountingWebSocket(AsyncWebSocket):
+    """A server connection that counts the pings it receives."""
+
+    def __init__(self, server, *args, **kwargs):
+        AsyncWebSocket.__init__(self, *args, **kwargs)
+        self.server = server
+
+    async def _receive_frame(self):
+        frame = await AsyncWebSocket._receive_frame(self)
+        if frame[1] == OPCODE_PING:
+            self.server.pings += 1
+        return frame
+
+
+def results(audio_bytes, final=True):
+    """Return the results message of a recognition of `audio_bytes`."""
+    return {
+        'results': [{
+            'final': final,
+            'alternatives': [{
+                'transcript': '{0} bytes'.format(audio_bytes)
+            }]
+        }],
+        'result_index': 0
+    }
+
+
+def run(test):
+    """Run `test(server)` on a new event loop, with a started server."""
+
+    async def main():
+        server = WebSocketServer()
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.stop()
+
+    return run_until_complete(main())